@@ -3,18 +3,32 @@ RQ backtest worker entrypoint.
 
 Validates environment, verifies Redis connectivity, registers the retry handler,
 and starts the RQ worker processing the three priority queues.
+
+Set ``BACKTEST_WORKER_PRELOAD`` (``1`` or a comma-separated dataset list) to run
+in warm mode: snapshot datasets are preloaded into shared memory before jobs are
+forked, and reloaded when their manifest changes.
 """
 
 from __future__ import annotations
 
 import os
 import sys
+from pathlib import Path
 
 import redis
 import structlog  # type: ignore[import-not-found]
 from redis import Redis
 from rq import Worker
 
+from libs.data.data_providers.snapshot_memory_store import (
+    SnapshotMemoryStore,
+    set_snapshot_store,
+)
+from libs.trading.backtest.warm_worker import (
+    PreloadingWorker,
+    SnapshotPreloader,
+    parse_preload_datasets,
+)
 from libs.trading.backtest.worker import record_retry
 
 logger = structlog.get_logger(__name__)
@@ -50,13 +64,37 @@ def main() -> None:
         queues = [q.strip() for q in rq_queues_env.split(",") if q.strip()]
     else:
         queues = ["backtest_high", "backtest_normal", "backtest_low"]
-    worker = Worker(queues, connection=redis_client)
+
+    try:
+        preload_datasets = parse_preload_datasets(os.getenv("BACKTEST_WORKER_PRELOAD"))
+    except ValueError as exc:
+        logger.error("worker_startup_failed", reason=str(exc))
+        sys.exit(1)
+
+    store: SnapshotMemoryStore | None = None
+    worker: Worker
+    if preload_datasets:
+        # Warm mode: load once in the parent; forked job children inherit the mapping
+        store = SnapshotMemoryStore()
+        set_snapshot_store(store)
+        preloader = SnapshotPreloader(
+            Path(os.getenv("DATA_ROOT", "data")).resolve(), preload_datasets, store
+        )
+        preloader.refresh()
+        worker = PreloadingWorker(queues, connection=redis_client, preloader=preloader)
+    else:
+        worker = Worker(queues, connection=redis_client)
 
     # Register retry handler to track automated retries in DB
     worker.push_exc_handler(record_retry)  # type: ignore[no-untyped-call]
 
-    logger.info("worker_starting", queues=queues, pid=os.getpid())
-    worker.work(with_scheduler=False)
+    logger.info("worker_starting", queues=queues, pid=os.getpid(), preload=list(preload_datasets))
+    try:
+        worker.work(with_scheduler=False)
+    finally:
+        if store is not None:
+            set_snapshot_store(None)
+            store.close()
 
 
 if __name__ == "__main__":
@@ -4,12 +4,12 @@ Export audit routes for Execution Gateway (P6T8).
 Provides endpoints for export audit tracking with compliance logging:
 - POST /api/v1/export/audit - Create export audit record (returns audit_id)
 - PATCH /api/v1/export/audit/{audit_id} - Complete export with actual row count
-- GET /api/v1/export/excel/{audit_id} - Download Excel file (single-use token)
+- GET /api/v1/export/excel/{audit_id} - Stream XLSX/CSV/Parquet file (single-use token)
 
 Security features:
 - Export permission required (EXPORT_DATA)
 - IP address and session tracking
-- Single-use Excel download links
+- Single-use, streamed file download links
 
 Design Pattern:
     - Router defined at module level
@@ -20,15 +20,18 @@ Design Pattern:
 from __future__ import annotations
 
 import asyncio
-import io
 import json
 import logging
-from collections.abc import Callable
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Generator
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from psycopg import sql
 from psycopg.rows import dict_row
@@ -37,8 +40,15 @@ from pydantic import BaseModel, Field
 from apps.execution_gateway.api.dependencies import build_gateway_authenticator
 from apps.execution_gateway.api.utils import get_client_ip, get_user_agent
 from apps.execution_gateway.app_context import AppContext
+from apps.execution_gateway.database import DB_POOL_MAX_SIZE
 from apps.execution_gateway.dependencies import get_context
 from apps.execution_gateway.services.auth_helpers import build_user_context
+from apps.execution_gateway.services.export_writers import (
+    EXPORT_MEDIA_TYPES,
+    XLSX_MAX_DATA_ROWS,
+    ExportFormat,
+    open_export_writer,
+)
 from libs.core.common.api_auth_dependency import APIAuthConfig, AuthContext, api_auth
 from libs.data.sql.strategy_mapping_sql import SYMBOL_STRATEGY_CTE
 from libs.platform.security import sanitize_for_export
@@ -553,27 +563,34 @@ async def complete_export_audit(
     tags=["Export"],
     responses={
         200: {
-            "content": {
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": {}
-            },
-            "description": "Excel file download",
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "Streamed export file download (XLSX, CSV or Parquet)",
         },
         404: {"description": "Audit record not found or expired"},
         403: {"description": "Not authorized to download this export"},
+        503: {"description": "Too many exports running; retry shortly"},
     },
 )
 async def download_excel_export(
     audit_id: UUID,
+    export_format: ExportFormat = Query(
+        default="xlsx",
+        alias="format",
+        description="File format; use csv or parquet for grids beyond the XLSX row limit",
+    ),
     ctx: AppContext = Depends(get_context),
     user: dict[str, Any] = Depends(build_user_context),
     _auth_context: AuthContext = Depends(export_auth),
 ) -> StreamingResponse:
     """
-    Download Excel export file (single-use link).
+    Download a server-generated export file (single-use link).
 
-    This endpoint generates and returns an Excel file based on the
-    audit record's grid_name and filter parameters. The link is single-use:
-    after successful download, the audit status changes to 'expired'.
+    This endpoint streams the grid named by the audit record, with its
+    filter parameters, as XLSX (default), CSV or Parquet.  Rows are read
+    through a server-side cursor and written incrementally, so gateway
+    memory stays bounded regardless of export size.  The link is
+    single-use: after the download finishes, the audit status changes to
+    'expired'.
 
     Security:
     - Validates user ownership of audit record
@@ -582,17 +599,19 @@ async def download_excel_export(
 
     Args:
         audit_id: The audit record ID
+        export_format: Output format (``format`` query parameter)
         ctx: Application context
         user: Authenticated user context
         _auth_context: Auth context for export permission
 
     Returns:
-        StreamingResponse with Excel file
+        StreamingResponse with the export file
 
     Raises:
         HTTPException 404: Audit not found, wrong type, or already used
         HTTPException 403: Not owner of audit record
         HTTPException 501: Grid export not implemented
+        HTTPException 503: All export slots are busy (link is not consumed)
     """
     user_id = user.get("user_id", "unknown")
 
@@ -626,32 +645,61 @@ async def download_excel_export(
             detail="Export link has already been used or expired",
         )
 
+    # Each export holds a pooled connection for its whole stream, so cap
+    # them before claiming; a busy gateway rejects without consuming the link.
+    if not _EXPORT_SLOTS.acquire(blocking=False):
+        logger.warning(
+            "Export rejected: all export slots busy",
+            extra={"audit_id": str(audit_id), "max_concurrent": _EXPORT_MAX_CONCURRENT},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many exports in progress; retry shortly",
+            headers={"Retry-After": "30"},
+        )
+    pump: _ExportChunkPump | None = None
+
     # Atomically claim the audit record to prevent concurrent downloads
     # This prevents race conditions where two requests pass the status check
-    claim_result = await _claim_export_audit(ctx, audit_id)
+    try:
+        claim_result = await _claim_export_audit(ctx, audit_id)
+    except BaseException:
+        _EXPORT_SLOTS.release()
+        raise
     if not claim_result:
+        _EXPORT_SLOTS.release()
         raise HTTPException(
             status_code=status.HTTP_410_GONE,
             detail="Export link has already been used (concurrent request)",
         )
 
-    # Generate Excel file based on grid_name
     grid_name = audit_record["grid_name"]
-    strategy_ids = audit_record["strategy_ids"] or []
-    filter_params = audit_record["filter_params"]
-    visible_columns = audit_record["visible_columns"]
-    sort_model = audit_record["sort_model"]
 
-    # Generate Excel content with error handling
+    # Plan the export and produce the first chunk before responding, so
+    # unsupported grids and query errors still map to HTTP status codes.
+    # The first chunk runs the query and writes the first row batch.
     try:
-        excel_content, row_count = await _generate_excel_content(
-            ctx=ctx,
-            grid_name=grid_name,
-            strategy_ids=strategy_ids,
-            filter_params=filter_params,
-            visible_columns=visible_columns,
-            sort_model=sort_model,
-        )
+        try:
+            plan = _plan_grid_export(
+                grid_name=grid_name,
+                strategy_ids=audit_record["strategy_ids"] or [],
+                filter_params=audit_record["filter_params"],
+                visible_columns=audit_record["visible_columns"],
+                sort_model=audit_record["sort_model"],
+                export_format=export_format,
+            )
+            progress = _ExportProgress()
+            pump = _ExportChunkPump(
+                _iter_export_chunks(ctx, plan, progress), release=_EXPORT_SLOTS.release
+            )
+            first_chunk = await asyncio.to_thread(pump.next_chunk)
+        except BaseException:
+            # Once created, the pump owns the export slot
+            if pump is None:
+                _EXPORT_SLOTS.release()
+            else:
+                pump.close()
+            raise
     except NotImplementedError as e:
         # Mark as failed before raising
         await _fail_export_audit(ctx, audit_id, str(e))
@@ -664,38 +712,21 @@ async def download_excel_export(
         error_msg = f"{type(e).__name__}: {e}"
         await _fail_export_audit(ctx, audit_id, error_msg)
         logger.exception(
-            "Excel export generation failed",
+            "Export generation failed",
             extra={"audit_id": str(audit_id), "error": error_msg},
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Excel generation failed",
+            detail="Export generation failed",
         ) from e
 
-    # Complete the audit (server-reported for Excel) and mark as expired
-    await _complete_and_expire_export_audit(
-        ctx=ctx,
-        audit_id=audit_id,
-        actual_row_count=row_count,
-    )
-
     # Generate filename
     timestamp = datetime.now(UTC).strftime("%Y-%m-%d_%H-%M")
-    filename = f"{grid_name}_{timestamp}.xlsx"
-
-    logger.info(
-        "Excel export downloaded",
-        extra={
-            "audit_id": str(audit_id),
-            "user_id": user_id,
-            "grid_name": grid_name,
-            "row_count": row_count,
-        },
-    )
+    filename = f"{grid_name}_{timestamp}.{export_format}"
 
     return StreamingResponse(
-        io.BytesIO(excel_content),
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        _stream_export(ctx, audit_id, user_id, plan, pump, first_chunk, progress),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
@@ -774,8 +805,29 @@ _GRID_COLUMNS: dict[str, list[str]] = {
     ],
 }
 
-# Maximum rows per export to prevent excessive memory / query time
-_EXPORT_ROW_LIMIT = 10_000
+# Maximum rows per export.  Rows are streamed through a server-side cursor,
+# so memory no longer depends on these limits; they bound query time and
+# file size.  XLSX is capped by the worksheet row limit, which is why large
+# grids (fills, audit) should be exported as CSV or Parquet.
+_EXPORT_ROW_LIMITS: dict[str, int] = {
+    "xlsx": XLSX_MAX_DATA_ROWS,
+    "csv": 5_000_000,
+    "parquet": 5_000_000,
+}
+
+# Rows fetched from the server-side cursor (and written) per batch
+_EXPORT_BATCH_SIZE = 5_000
+
+# Each running export holds a pooled connection (transaction + named cursor)
+# for its whole stream, so exports get at most a quarter of the gateway pool
+# and are rejected with 503 rather than queued when the slots are taken.
+_EXPORT_MAX_CONCURRENT = max(1, DB_POOL_MAX_SIZE // 4)
+_EXPORT_SLOTS = threading.BoundedSemaphore(_EXPORT_MAX_CONCURRENT)
+
+# A stream whose client has not taken a chunk for the idle limit, or that
+# has run past the total limit, is cut off and its connection released.
+_EXPORT_IDLE_TIMEOUT_SECONDS = 60.0
+_EXPORT_MAX_DURATION_SECONDS = 15 * 60.0
 
 
 # ---------------------------------------------------------------------------
@@ -866,8 +918,8 @@ def _qualify_sort_model(
     Columns whose ``colId`` appears in *allowed_columns* are prefixed
     with *prefix* (e.g. ``"p."``, ``"t."``).  Unrecognised columns
     are kept as-is so that ``_build_order_clause`` can silently drop
-    them.  This helper is shared by ``_fetch_positions_data`` and
-    ``_fetch_fills_data`` to avoid duplicating the qualification loop.
+    them.  This helper is shared by ``_build_positions_query`` and
+    ``_build_fills_query`` to avoid duplicating the qualification loop.
     """
     if not sort_model:
         return None
@@ -1231,19 +1283,19 @@ def _build_filter_clause(
 
 
 # ---------------------------------------------------------------------------
-# Per-grid data fetchers
+# Per-grid export queries
 # ---------------------------------------------------------------------------
 
 
-def _fetch_positions_data(
-    ctx: AppContext,
+def _build_positions_query(
     strategy_ids: list[str],
     columns: list[str],
     sort_model: list[dict[str, Any]] | None,
     filter_clause: str = "",
     filter_params_list: list[Any] | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch positions data scoped to authorized strategies.
+    row_limit: int = _EXPORT_ROW_LIMITS["xlsx"],
+) -> tuple[sql.Composed, list[Any]]:
+    """Build the positions export query scoped to authorized strategies.
 
     The ``positions`` table is symbol-scoped (no ``strategy_id`` column),
     so ownership is inferred via the shared fail-closed mapping from
@@ -1274,38 +1326,35 @@ def _fetch_positions_data(
     query_params: list[Any] = [strategy_ids]
     if filter_params_list:
         query_params.extend(filter_params_list)
-    query_params.append(_EXPORT_ROW_LIMIT)
-    with ctx.db.transaction() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            query = sql.SQL(
-                "WITH {cte} "
-                "SELECT {cols} FROM positions p "
-                "JOIN symbol_strategy ss ON p.symbol = ss.symbol "
-                "WHERE p.qty != 0 AND ss.strategy = ANY(%s) "
-                "{filter_clause}"
-                "ORDER BY {order_clause} "
-                "LIMIT %s"
-            ).format(
-                cte=sql.SQL(SYMBOL_STRATEGY_CTE),
-                cols=select_cols,
-                filter_clause=sql.SQL(filter_clause),
-                order_clause=sql.SQL(order_clause),
-            )
-            cur.execute(query, query_params)
-            return list(cur.fetchall())
+    query_params.append(row_limit)
+    query = sql.SQL(
+        "WITH {cte} "
+        "SELECT {cols} FROM positions p "
+        "JOIN symbol_strategy ss ON p.symbol = ss.symbol "
+        "WHERE p.qty != 0 AND ss.strategy = ANY(%s) "
+        "{filter_clause}"
+        "ORDER BY {order_clause} "
+        "LIMIT %s"
+    ).format(
+        cte=sql.SQL(SYMBOL_STRATEGY_CTE),
+        cols=select_cols,
+        filter_clause=sql.SQL(filter_clause),
+        order_clause=sql.SQL(order_clause),
+    )
+    return query, query_params
 
 
-def _fetch_orders_data(
-    ctx: AppContext,
+def _build_orders_query(
     strategy_ids: list[str],
     columns: list[str],
     sort_model: list[dict[str, Any]] | None,
     filter_clause: str = "",
     filter_params_list: list[Any] | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch orders scoped to authorized strategies.
+    row_limit: int = _EXPORT_ROW_LIMITS["xlsx"],
+) -> tuple[sql.Composed, list[Any]]:
+    """Build the orders export query scoped to authorized strategies.
 
-    This fetcher returns ALL orders matching strategy scope and the
+    This query returns ALL orders matching strategy scope and the
     caller-provided ``filter_clause``.  It intentionally does NOT
     inject implicit status predicates because the server cannot know
     which UI tab originated the export request.
@@ -1319,10 +1368,10 @@ def _fetch_orders_data(
     2. The injected filter is merged into the AG Grid ``filterModel``
        before the export audit record is created (line 179 of
        ``grid_export_toolbar.py``).
-    3. ``_generate_excel_content`` resolves aliases and builds the
-       ``filter_clause`` from the full grid allowlist (lines 1554-1571
-       below), which includes the status predicate.
-    4. This fetcher receives the ``filter_clause`` already containing
+    3. ``_plan_grid_export`` resolves aliases and builds the
+       ``filter_clause`` from the full grid allowlist, which includes
+       the status predicate.
+    4. This builder receives the ``filter_clause`` already containing
        ``AND "status" = ANY(%s)`` with working-status values.
 
     If the frontend omits the status filter, the export will correctly
@@ -1337,33 +1386,30 @@ def _fetch_orders_data(
     query_params: list[Any] = [strategy_ids]
     if filter_params_list:
         query_params.extend(filter_params_list)
-    query_params.append(_EXPORT_ROW_LIMIT)
-    with ctx.db.transaction() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            query = sql.SQL(
-                "SELECT {cols} FROM orders "
-                "WHERE strategy_id = ANY(%s) "
-                "{filter_clause}"
-                "ORDER BY {order_clause} "
-                "LIMIT %s"
-            ).format(
-                cols=select_cols,
-                filter_clause=sql.SQL(filter_clause),
-                order_clause=sql.SQL(order_clause),
-            )
-            cur.execute(query, query_params)
-            return list(cur.fetchall())
+    query_params.append(row_limit)
+    query = sql.SQL(
+        "SELECT {cols} FROM orders "
+        "WHERE strategy_id = ANY(%s) "
+        "{filter_clause}"
+        "ORDER BY {order_clause} "
+        "LIMIT %s"
+    ).format(
+        cols=select_cols,
+        filter_clause=sql.SQL(filter_clause),
+        order_clause=sql.SQL(order_clause),
+    )
+    return query, query_params
 
 
-def _fetch_fills_data(
-    ctx: AppContext,
+def _build_fills_query(
     strategy_ids: list[str],
     columns: list[str],
     sort_model: list[dict[str, Any]] | None,
     filter_clause: str = "",
     filter_params_list: list[Any] | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch fills (trades) scoped to authorized strategies."""
+    row_limit: int = _EXPORT_ROW_LIMITS["xlsx"],
+) -> tuple[sql.Composed, list[Any]]:
+    """Build the fills (trades) export query scoped to authorized strategies."""
     # Use full grid allowlist for sort qualification so that sorts
     # on hidden columns are preserved in the exported row order.
     full_allowed = _GRID_COLUMNS["fills"]
@@ -1380,34 +1426,31 @@ def _fetch_fills_data(
     query_params: list[Any] = [strategy_ids]
     if filter_params_list:
         query_params.extend(filter_params_list)
-    query_params.append(_EXPORT_ROW_LIMIT)
-    with ctx.db.transaction() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            query = sql.SQL(
-                "SELECT {cols} FROM trades t "
-                "WHERE COALESCE(t.superseded, FALSE) = FALSE "
-                "AND t.strategy_id = ANY(%s) "
-                "{filter_clause}"
-                "ORDER BY {order_clause} "
-                "LIMIT %s"
-            ).format(
-                cols=select_cols,
-                filter_clause=sql.SQL(filter_clause),
-                order_clause=sql.SQL(order_clause),
-            )
-            cur.execute(query, query_params)
-            return list(cur.fetchall())
+    query_params.append(row_limit)
+    query = sql.SQL(
+        "SELECT {cols} FROM trades t "
+        "WHERE COALESCE(t.superseded, FALSE) = FALSE "
+        "AND t.strategy_id = ANY(%s) "
+        "{filter_clause}"
+        "ORDER BY {order_clause} "
+        "LIMIT %s"
+    ).format(
+        cols=select_cols,
+        filter_clause=sql.SQL(filter_clause),
+        order_clause=sql.SQL(order_clause),
+    )
+    return query, query_params
 
 
-def _fetch_audit_data(
-    ctx: AppContext,
+def _build_audit_query(
     strategy_ids: list[str],
     columns: list[str],
     sort_model: list[dict[str, Any]] | None,
     filter_clause: str = "",
     filter_params_list: list[Any] | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch audit log entries scoped to authorized strategies.
+    row_limit: int = _EXPORT_ROW_LIMITS["xlsx"],
+) -> tuple[sql.Composed, list[Any]]:
+    """Build the audit log export query scoped to authorized strategies.
 
     Audit entries are scoped by matching the ``strategy_id`` key inside
     the ``details`` JSONB column against the authorized *strategy_ids*.
@@ -1441,22 +1484,19 @@ def _fetch_audit_data(
     query_params: list[Any] = [strategy_ids]
     if filter_params_list:
         query_params.extend(filter_params_list)
-    query_params.append(_EXPORT_ROW_LIMIT)
-    with ctx.db.transaction() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            query = sql.SQL(
-                "SELECT {cols} FROM audit_log "
-                "WHERE details->>'strategy_id' = ANY(%s) "
-                "{filter_clause}"
-                "ORDER BY {order_clause} "
-                "LIMIT %s"
-            ).format(
-                cols=select_cols,
-                filter_clause=sql.SQL(filter_clause),
-                order_clause=sql.SQL(order_clause),
-            )
-            cur.execute(query, query_params)
-            return list(cur.fetchall())
+    query_params.append(row_limit)
+    query = sql.SQL(
+        "SELECT {cols} FROM audit_log "
+        "WHERE details->>'strategy_id' = ANY(%s) "
+        "{filter_clause}"
+        "ORDER BY {order_clause} "
+        "LIMIT %s"
+    ).format(
+        cols=select_cols,
+        filter_clause=sql.SQL(filter_clause),
+        order_clause=sql.SQL(order_clause),
+    )
+    return query, query_params
 
 
 # Map TCA column names to their qualified table references.
@@ -1464,7 +1504,7 @@ def _fetch_audit_data(
 # that SELECT / ORDER BY / filter references are unambiguous across
 # the trades (t) and orders (o) tables.  Columns missing from this
 # map are silently skipped to prevent incorrect table attribution.
-# Defined at module level so both _fetch_tca_data and
+# Defined at module level so both _build_tca_query and
 # _generate_excel_content can use it for filter qualification.
 _TCA_COL_MAP: dict[str, str] = {
     "trade_id": "t.trade_id",
@@ -1481,15 +1521,15 @@ _TCA_COL_MAP: dict[str, str] = {
 }
 
 
-def _fetch_tca_data(
-    ctx: AppContext,
+def _build_tca_query(
     strategy_ids: list[str],
     columns: list[str],
     sort_model: list[dict[str, Any]] | None,
     filter_clause: str = "",
     filter_params_list: list[Any] | None = None,
-) -> list[dict[str, Any]]:
-    """Fetch TCA trade data with order context, scoped to authorized strategies."""
+    row_limit: int = _EXPORT_ROW_LIMITS["xlsx"],
+) -> tuple[sql.Composed, list[Any]]:
+    """Build the TCA trade/order export query scoped to authorized strategies."""
     # Only include columns that have an explicit mapping to prevent
     # incorrect table attribution for unmapped columns.
     mapped_columns = [c for c in columns if c in _TCA_COL_MAP]
@@ -1523,46 +1563,43 @@ def _fetch_tca_data(
     query_params: list[Any] = [strategy_ids]
     if filter_params_list:
         query_params.extend(filter_params_list)
-    query_params.append(_EXPORT_ROW_LIMIT)
-    with ctx.db.transaction() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            query = sql.SQL(
-                "SELECT {cols} "
-                "FROM trades t "
-                "LEFT JOIN orders o ON t.client_order_id = o.client_order_id "
-                "WHERE COALESCE(t.superseded, FALSE) = FALSE "
-                "AND t.strategy_id = ANY(%s) "
-                "{filter_clause}"
-                "ORDER BY {order_clause} "
-                "LIMIT %s"
-            ).format(
-                cols=select_cols,
-                filter_clause=sql.SQL(filter_clause),
-                order_clause=sql.SQL(order_clause),
-            )
-            cur.execute(query, query_params)
-            return list(cur.fetchall())
+    query_params.append(row_limit)
+    query = sql.SQL(
+        "SELECT {cols} "
+        "FROM trades t "
+        "LEFT JOIN orders o ON t.client_order_id = o.client_order_id "
+        "WHERE COALESCE(t.superseded, FALSE) = FALSE "
+        "AND t.strategy_id = ANY(%s) "
+        "{filter_clause}"
+        "ORDER BY {order_clause} "
+        "LIMIT %s"
+    ).format(
+        cols=select_cols,
+        filter_clause=sql.SQL(filter_clause),
+        order_clause=sql.SQL(order_clause),
+    )
+    return query, query_params
 
 
-# Dispatch table for grid data fetchers
-_GRID_FETCHERS = {
-    "positions": _fetch_positions_data,
-    "orders": _fetch_orders_data,
-    "fills": _fetch_fills_data,
-    "audit": _fetch_audit_data,
-    "tca": _fetch_tca_data,
+# Dispatch table for grid export query builders
+_GRID_QUERY_BUILDERS: dict[str, Callable[..., tuple[sql.Composed, list[Any]]]] = {
+    "positions": _build_positions_query,
+    "orders": _build_orders_query,
+    "fills": _build_fills_query,
+    "audit": _build_audit_query,
+    "tca": _build_tca_query,
 }
 
 
 def _sanitize_cell_value(raw_value: Any) -> Any:
-    """Sanitise a single cell value for Excel export.
+    """Sanitise a single cell value for file export.
 
-    Strings are sanitised against formula injection.  Temporal types
-    are normalised to UTC and stripped of timezone info (openpyxl
-    does not support tz-aware datetimes).  JSONB dicts/lists are
-    serialised to JSON strings.
+    Strings are sanitised against formula injection (CSV files end up in
+    spreadsheet apps too).  Temporal types are normalised to UTC and
+    stripped of timezone info (XLSX has no tz-aware datetimes).
+    JSONB dicts/lists are serialised to JSON strings.
 
-    Returns the sanitised value ready for ``ws.append()``.
+    Returns the sanitised value ready for an export writer.
     """
     if isinstance(raw_value, dict | list):
         raw_value = json.dumps(raw_value, default=str)
@@ -1571,88 +1608,47 @@ def _sanitize_cell_value(raw_value: Any) -> Any:
     if raw_value is None:
         return None
     if isinstance(raw_value, datetime):
-        # openpyxl does not support timezone-aware datetimes.
         # Normalize all datetimes to UTC before stripping tzinfo.
         if raw_value.tzinfo is None:
             raw_value = raw_value.replace(tzinfo=UTC)
         return raw_value.astimezone(UTC).replace(tzinfo=None)
     if isinstance(raw_value, date):
         # PostgreSQL DATE columns are returned as datetime.date
-        # objects by psycopg.  openpyxl handles date natively.
+        # objects by psycopg.  All writers handle date natively.
         return raw_value
     return raw_value
 
 
-def _build_workbook(
-    grid_name: str,
-    columns: list[str],
-    rows: list[dict[str, Any]],
-) -> bytes:
-    """Build an Excel workbook from grid data using streaming mode.
+@dataclass(frozen=True)
+class _GridExportPlan:
+    """Validated column projection and query for one grid export."""
 
-    Uses ``write_only=True`` to stream rows to disk without building
-    the full XML tree in memory, keeping peak usage low even for the
-    maximum ``_EXPORT_ROW_LIMIT`` (10 000 rows).
+    grid_name: str
+    export_format: ExportFormat
+    columns: list[str]
+    query: sql.Composed
+    params: list[Any]
 
-    Every cell value is sanitised via ``_sanitize_cell_value`` to
-    prevent formula-injection attacks.
 
-    Args:
-        grid_name: Name of the grid (used as worksheet title).
-        columns: Ordered list of column names to include.
-        rows: Row data dicts keyed by column name.
+@dataclass
+class _ExportProgress:
+    """Rows written so far by a running export stream."""
 
-    Returns:
-        Raw bytes of the ``.xlsx`` file.
+    row_count: int = 0
 
-    Note:
-        The final bytes object is materialized in memory.  With the
-        ``_EXPORT_ROW_LIMIT`` (10 000 rows) this is typically a few MB.
-        If concurrent export volume grows, consider streaming the
-        response directly via ``StreamingResponse`` instead.
 
-    Raises:
-        NotImplementedError: If openpyxl is not installed.
-    """
-    try:
-        from openpyxl import Workbook
-    except ImportError as exc:
-        raise NotImplementedError(
-            "Excel export requires openpyxl: pip install openpyxl"
-        ) from exc
-    wb = Workbook(write_only=True)
-    ws = wb.create_sheet(grid_name.title())
-
-    # Header row -- sanitize headers
-    ws.append([sanitize_for_export(h) for h in columns])
-
-    # Data rows -- sanitize values to prevent formula injection
-    # while preserving native Excel types (numbers, dates).
-    for row_data in rows:
-        ws.append([
-            _sanitize_cell_value(row_data.get(col_name))
-            for col_name in columns
-        ])
-
-    buf = io.BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return buf.getvalue()
-
-
-async def _generate_excel_content(
-    ctx: AppContext,
+def _plan_grid_export(
     grid_name: str,
     strategy_ids: list[str],
     filter_params: dict[str, Any] | None,
     visible_columns: list[str] | None,
     sort_model: list[dict[str, Any]] | None,
-) -> tuple[bytes, int]:
-    """Generate Excel file content for a grid.
+    export_format: ExportFormat = "xlsx",
+) -> _GridExportPlan:
+    """Validate an export request and build its scoped query.
 
-    Fetches real data from the database for the requested grid, applies
-    column validation against a server-side allowlist, and sanitises every
-    cell value to prevent formula-injection attacks.
+    Applies column validation against a server-side allowlist and builds
+    the filter and sort clauses for the requested grid.
 
     **Important:** This function uses ``filter_params`` (the AG Grid filter
     model) as the single source of truth for row filtering.  If the
@@ -1663,7 +1659,6 @@ async def _generate_excel_content(
     in the current grid view.
 
     Args:
-        ctx: Application context with database access
         grid_name: Name of grid to export
         strategy_ids: Authorized strategy IDs for filtering
         filter_params: AG Grid filter model applied to export query.
@@ -1671,14 +1666,15 @@ async def _generate_excel_content(
             (e.g. working-order status when exporting from "Working" tab).
         visible_columns: Columns to include (validated against allowlist)
         sort_model: AG Grid sort model
+        export_format: Output format; selects the row limit
 
     Returns:
-        Tuple of (excel_bytes, row_count)
+        Export plan with the validated columns and parameterised query
 
     Raises:
-        NotImplementedError: If grid type not supported or openpyxl missing
+        NotImplementedError: If grid type not supported
     """
-    if grid_name not in _GRID_FETCHERS:
+    if grid_name not in _GRID_QUERY_BUILDERS:
         raise NotImplementedError(f"Excel export not implemented for grid: {grid_name}")
 
     # Validate requested columns against server allowlist
@@ -1719,19 +1715,202 @@ async def _generate_excel_content(
         col_prefix_map=tca_filter_map,
     )
 
-    # Offload synchronous DB fetch to a worker thread to avoid blocking
-    # the FastAPI event loop.
-    fetcher = _GRID_FETCHERS[grid_name]
-    rows = await asyncio.to_thread(
-        fetcher, ctx, strategy_ids, columns, resolved_sort,
-        filter_clause, filter_params_list,
+    build_query = _GRID_QUERY_BUILDERS[grid_name]
+    query, query_params = build_query(
+        strategy_ids, columns, resolved_sort, filter_clause, filter_params_list,
+        _EXPORT_ROW_LIMITS[export_format],
+    )
+    return _GridExportPlan(
+        grid_name=grid_name,
+        export_format=export_format,
+        columns=columns,
+        query=query,
+        params=query_params,
+    )
+
+
+def _iter_export_chunks(
+    ctx: AppContext,
+    plan: _GridExportPlan,
+    progress: _ExportProgress,
+) -> Generator[bytes, None, None]:
+    """Stream an export plan into encoded file chunks.
+
+    Rows are read ``_EXPORT_BATCH_SIZE`` at a time from a named
+    (server-side) cursor and written immediately, so memory stays flat
+    regardless of export size.  Every cell value is sanitised via
+    ``_sanitize_cell_value`` to prevent formula-injection attacks.
+
+    Note:
+        Named cursors only live inside a transaction, so the pooled
+        connection is held until the generator is exhausted or closed.
+
+    Raises:
+        NotImplementedError: If the format's optional dependency is missing
+    """
+    writer = open_export_writer(plan.export_format, plan.grid_name, plan.columns)
+    columns = plan.columns
+    with ctx.db.transaction() as conn:
+        with conn.cursor(name=f"{plan.grid_name}_export", row_factory=dict_row) as cur:
+            cur.itersize = _EXPORT_BATCH_SIZE
+            cur.execute(plan.query, plan.params)
+            while batch := cur.fetchmany(_EXPORT_BATCH_SIZE):
+                progress.row_count += len(batch)
+                chunk = writer.write_rows(
+                    [[_sanitize_cell_value(row.get(col)) for col in columns] for row in batch]
+                )
+                if chunk:
+                    yield chunk
+    yield writer.close()
+
+
+class _ExportChunkPump:
+    """Blocking chunk generator driven one step at a time from worker threads.
+
+    The lock makes ``close`` (which rolls back the export transaction)
+    wait for an in-flight batch instead of racing it.  ``release`` (the
+    export slot) runs exactly once: when the file is complete, when the
+    pump is closed or expired, or when the pump is garbage collected
+    without either (e.g. the response was never streamed).
+    """
+
+    def __init__(
+        self,
+        chunks: Generator[bytes, None, None],
+        release: Callable[[], None] | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self._lock = threading.Lock()
+        self._expired: str | None = None
+        self._release = weakref.finalize(self, release or _noop)
+
+    def next_chunk(self) -> bytes | None:
+        """Produce the next chunk, or None when the file is complete.
+
+        Raises:
+            TimeoutError: If the export was expired by the stream watchdog
+        """
+        with self._lock:
+            if self._expired is not None:
+                raise TimeoutError(self._expired)
+            chunk = next(self._chunks, None)
+        if chunk is None:
+            self._release()
+        return chunk
+
+    def close(self) -> None:
+        """Abandon the export and release its cursor and connection."""
+        with self._lock:
+            self._chunks.close()
+        self._release()
+
+    def expire(self, reason: str) -> None:
+        """Close the export so the next ``next_chunk`` raises TimeoutError."""
+        with self._lock:
+            self._expired = reason
+            self._chunks.close()
+        self._release()
+
+
+def _noop() -> None:
+    return None
+
+
+async def _expire_when_stalled(
+    pump: _ExportChunkPump,
+    started_at: float,
+    last_progress: Callable[[], float],
+) -> None:
+    """Expire ``pump`` once the stream goes idle or exceeds its total limit."""
+    while True:
+        now = time.monotonic()
+        idle_deadline = last_progress() + _EXPORT_IDLE_TIMEOUT_SECONDS
+        total_deadline = started_at + _EXPORT_MAX_DURATION_SECONDS
+        if now >= total_deadline:
+            reason = f"Export exceeded {_EXPORT_MAX_DURATION_SECONDS:.0f}s time limit"
+            break
+        if now >= idle_deadline:
+            reason = f"Export idle for more than {_EXPORT_IDLE_TIMEOUT_SECONDS:.0f}s"
+            break
+        await asyncio.sleep(min(idle_deadline, total_deadline) - now)
+    logger.warning("Export stream expired", extra={"reason": reason})
+    await asyncio.to_thread(pump.expire, reason)
+
+
+async def _stream_export(
+    ctx: AppContext,
+    audit_id: UUID,
+    user_id: str,
+    plan: _GridExportPlan,
+    pump: _ExportChunkPump,
+    first_chunk: bytes | None,
+    progress: _ExportProgress,
+) -> AsyncIterator[bytes]:
+    """Forward export chunks to the client and finalise the audit record.
+
+    The next batch is only read from the database after the previous chunk
+    has been handed to the ASGI server, so a slow client throttles the
+    cursor instead of letting chunks pile up in gateway memory.  Each batch
+    is produced in a worker thread, keeping the event loop free for order
+    routes.
+
+    A watchdog expires the export (rolling back its cursor and freeing the
+    pooled connection) when the client stops taking chunks for
+    ``_EXPORT_IDLE_TIMEOUT_SECONDS`` or the stream runs longer than
+    ``_EXPORT_MAX_DURATION_SECONDS``.
+
+    The audit is completed with the server-counted row total once the last
+    chunk is sent, or marked failed if the stream errors, times out or the
+    client disconnects (the single-use link is consumed either way).
+    """
+    started_at = last_progress = time.monotonic()
+    watchdog = asyncio.create_task(
+        _expire_when_stalled(pump, started_at, lambda: last_progress)
     )
+    try:
+        chunk = first_chunk
+        while chunk is not None:
+            yield chunk
+            last_progress = time.monotonic()
+            chunk = await asyncio.to_thread(pump.next_chunk)
+            last_progress = time.monotonic()
+    except BaseException as e:
+        watchdog.cancel()
+        # Cancellation may interrupt an in-flight batch; close from a worker
+        # thread so the event loop never waits on the export lock.
+        asyncio.get_running_loop().run_in_executor(None, pump.close)
+        if isinstance(e, Exception):
+            error_msg = f"{type(e).__name__}: {e}"
+            logger.exception(
+                "Export stream failed",
+                extra={"audit_id": str(audit_id), "error": error_msg},
+            )
+        else:
+            error_msg = "Download interrupted before completion"
+            logger.warning(
+                "Export stream interrupted",
+                extra={"audit_id": str(audit_id), "rows_sent": progress.row_count},
+            )
+        await _fail_export_audit(ctx, audit_id, error_msg)
+        raise
+    watchdog.cancel()
 
-    excel_bytes = await asyncio.to_thread(
-        _build_workbook, grid_name, columns, rows,
+    # Complete the audit (server-reported) and mark as expired
+    await _complete_and_expire_export_audit(
+        ctx=ctx,
+        audit_id=audit_id,
+        actual_row_count=progress.row_count,
+    )
+    logger.info(
+        "Export downloaded",
+        extra={
+            "audit_id": str(audit_id),
+            "user_id": user_id,
+            "grid_name": plan.grid_name,
+            "format": plan.export_format,
+            "row_count": progress.row_count,
+        },
     )
-    row_count = len(rows)
-    return excel_bytes, row_count
 
 
 @router.get(
@@ -549,6 +549,27 @@ def _analyze_order_with_taq(
         return None
 
 
+def _prefetch_taq_bars(
+    analyzer: ExecutionQualityAnalyzer,
+    fill_batches: list[FillBatch],
+) -> None:
+    """Load minute bars for all orders in one TAQ query.
+
+    Best effort: on failure each order falls back to its own queries.
+    """
+    try:
+        analyzer.prefetch_minute_bars(fill_batches)
+    except Exception as e:
+        logger.warning(
+            "TAQ bar prefetch failed - falling back to per-order queries",
+            extra={
+                "order_count": len(fill_batches),
+                "error": str(e),
+                "error_type": type(e).__name__,
+            },
+        )
+
+
 def _compute_simple_tca(fill_batch: FillBatch) -> TCAOrderDetail | None:
     """Compute simplified TCA metrics without TAQ data.
 
@@ -759,6 +780,8 @@ def _analyze_trades_for_tca(
         # Create analyzer once per request for efficiency (reused across all orders)
         analyzer = ExecutionQualityAnalyzer(taq_provider=taq_provider)
 
+    # First pass: validate orders so TAQ benchmarks can be fetched in one batch
+    eligible: list[tuple[str, str, FillBatch]] = []
     for client_order_id, order_trades in grouped.items():
         # Build FillBatch
         fill_batch = _build_fill_batch(client_order_id, order_trades)
@@ -791,7 +814,13 @@ def _analyze_trades_for_tca(
             skipped_unauthorized += 1
             continue  # Skip unauthorized strategies
 
-        # Try TAQ analysis first, fall back to simple TCA
+        eligible.append((client_order_id, strategy_id, fill_batch))
+
+    if analyzer is not None and eligible:
+        _prefetch_taq_bars(analyzer, [fill_batch for _, _, fill_batch in eligible])
+
+    # Second pass: TAQ analysis (served from the prefetched bars), simple TCA fallback
+    for client_order_id, strategy_id, fill_batch in eligible:
         order_detail: TCAOrderDetail | None = None
         if analyzer is not None:
             result = _analyze_order_with_taq(fill_batch, analyzer)
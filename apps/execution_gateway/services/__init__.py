@@ -9,6 +9,7 @@ Modules:
     performance_cache: Caching logic for performance dashboard
     order_helpers: Idempotency and fat-finger validation helpers
     auth_helpers: Authentication context building
+    export_writers: Incremental XLSX/CSV/Parquet writers for streamed grid exports
 
 See REFACTOR_EXECUTION_GATEWAY_TASK.md Phase 1 for design decisions.
 """
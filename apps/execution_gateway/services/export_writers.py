@@ -0,0 +1,450 @@
+"""Incremental file writers for streamed grid exports.
+
+Grid exports are written batch by batch while rows are still being read
+from a server-side cursor. Each writer accepts sanitised row batches and
+returns only the bytes produced since the previous call, so the caller can
+forward them to the client immediately and never holds the whole file.
+
+The XLSX writer emits the OOXML package directly through a streaming zip
+(data descriptors, no seeking) instead of going through openpyxl, whose
+``write_only`` mode still assembles the final archive in one piece on
+``save()``. Strings are written inline (no shared-string table), which keeps
+memory constant regardless of row count.
+
+Usage:
+    from apps.execution_gateway.services.export_writers import open_export_writer
+
+    writer = open_export_writer("xlsx", "fills", columns)
+    for batch in batches:
+        yield writer.write_rows(batch)
+    yield writer.close()
+
+This module provides:
+- ExportFormat: Supported streamed export formats (xlsx, csv, parquet)
+- XlsxStreamWriter: Single-sheet XLSX written as a streaming zip archive
+- CsvStreamWriter: UTF-8 CSV with a header row
+- ParquetStreamWriter: Parquet with one row group per batch
+- open_export_writer: Construct the writer for a format
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+import re
+import zipfile
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+from typing import Any, Literal, Protocol
+from xml.sax.saxutils import escape
+
+ExportFormat = Literal["xlsx", "csv", "parquet"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Excel worksheets hold at most 1,048,576 rows; one is used by the header.
+XLSX_MAX_DATA_ROWS = 1_048_575
+
+
+class ExportWriter(Protocol):
+    """Incremental writer interface shared by all export formats."""
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Append rows and return the bytes produced so far."""
+        ...
+
+    def close(self) -> bytes:
+        """Finish the file and return the remaining bytes."""
+        ...
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable byte sink drained by the caller.
+
+    ``zipfile`` and ``pyarrow`` write into this sink; the writer drains it
+    after every batch so only the bytes of the current batch are buffered.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+# ---------------------------------------------------------------------------
+# XLSX
+# ---------------------------------------------------------------------------
+
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+# Characters that are invalid in XML 1.0 (openpyxl rejects them as well)
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Excel caps sheet titles at 31 characters and forbids these characters
+_ILLEGAL_SHEET_TITLE_CHARS = re.compile(r"[\\/*?:\[\]]")
+
+# cellXfs indices in _STYLES_XML
+_STYLE_DATETIME = 1
+_STYLE_DATE = 2
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+# Built-in number formats 22 (m/d/yy h:mm) and 14 (mm-dd-yy) mark
+# datetime and date cells so spreadsheet apps render serials as dates.
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+_SHEET_HEADER_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_SHEET_FOOTER_XML = "</sheetData></worksheet>"
+
+
+def _column_letter(index: int) -> str:
+    """Return the spreadsheet column letter for a zero-based index."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _sheet_title(title: str) -> str:
+    cleaned = _ILLEGAL_SHEET_TITLE_CHARS.sub("_", title).strip()[:31]
+    return cleaned or "Sheet1"
+
+
+def _inline_string(ref: str, value: str) -> str:
+    text = escape(_ILLEGAL_XML_CHARS.sub("", value))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _cell_xml(ref: str, value: Any) -> str:
+    """Render one ``<c>`` element; None produces no cell."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int | Decimal):
+        if isinstance(value, Decimal) and not value.is_finite():
+            return _inline_string(ref, str(value))
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return _inline_string(ref, str(value))
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        serial = (value - _EXCEL_EPOCH).total_seconds() / 86400
+        return f'<c r="{ref}" s="{_STYLE_DATETIME}"><v>{serial!r}</v></c>'
+    if isinstance(value, date):
+        serial = (value - _EXCEL_EPOCH.date()).days
+        return f'<c r="{ref}" s="{_STYLE_DATE}"><v>{serial}</v></c>'
+    return _inline_string(ref, str(value))
+
+
+class XlsxStreamWriter:
+    """Single-sheet XLSX written incrementally as a streaming zip archive.
+
+    Memory use is bounded by one batch of rows plus the deflate window; the
+    archive's central directory is only emitted by :meth:`close`.
+
+    Example:
+        writer = XlsxStreamWriter("Fills", ["symbol", "qty"])
+        data = writer.write_rows([["AAPL", 10]]) + writer.close()
+    """
+
+    def __init__(self, sheet_title: str, columns: Sequence[str]) -> None:
+        """Start the archive and write the header row.
+
+        Args:
+            sheet_title: Worksheet title (sanitised to Excel's rules).
+            columns: Header labels, one per column.
+        """
+        self._letters = [_column_letter(i) for i in range(len(columns))]
+        self._row_index = 0
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS_XML)
+        self._zip.writestr(
+            "xl/workbook.xml",
+            _WORKBOOK_XML.format(title=escape(_sheet_title(sheet_title), {'"': "&quot;"})),
+        )
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+        self._zip.writestr("xl/styles.xml", _STYLES_XML)
+        # Sheet size is unknown up front, so always allow zip64 sizes
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True)
+        self._sheet.write(_SHEET_HEADER_XML.encode())
+        self._write_xml_rows([list(columns)])
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Append data rows and return the archive bytes produced so far.
+
+        Raises:
+            ValueError: If the worksheet row limit would be exceeded.
+        """
+        if self._row_index + len(rows) > XLSX_MAX_DATA_ROWS + 1:
+            raise ValueError(f"XLSX export exceeds {XLSX_MAX_DATA_ROWS} rows")
+        self._write_xml_rows(rows)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finish the worksheet and archive; return the remaining bytes."""
+        self._sheet.write(_SHEET_FOOTER_XML.encode())
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.drain()
+
+    def _write_xml_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        parts: list[str] = []
+        letters = self._letters
+        for row in rows:
+            self._row_index += 1
+            number = self._row_index
+            cells = "".join(
+                _cell_xml(f"{letter}{number}", value)
+                for letter, value in zip(letters, row, strict=False)
+            )
+            parts.append(f'<row r="{number}">{cells}</row>')
+        self._sheet.write("".join(parts).encode())
+
+
+# ---------------------------------------------------------------------------
+# CSV
+# ---------------------------------------------------------------------------
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    return value
+
+
+class CsvStreamWriter:
+    """UTF-8 CSV written batch by batch with a header row."""
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        """Buffer the header row; it is emitted with the first batch."""
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\r\n")
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Append rows and return their encoded bytes."""
+        self._writer.writerows([_csv_value(v) for v in row] for row in rows)
+        return self._drain()
+
+    def close(self) -> bytes:
+        """Return any remaining bytes (the header for an empty export)."""
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+# ---------------------------------------------------------------------------
+# Parquet
+# ---------------------------------------------------------------------------
+
+
+class ParquetStreamWriter:
+    """Parquet file written with one row group per batch.
+
+    Column types are inferred from the first non-null value seen in the
+    first batch; columns that are entirely null there are written as
+    strings. Later values are coerced to the inferred type.
+    """
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        """Prepare the writer; the file header is written with the first batch.
+
+        Raises:
+            NotImplementedError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow  # type: ignore[import-untyped]  # noqa: F401
+        except ImportError as exc:
+            raise NotImplementedError(
+                "Parquet export requires pyarrow: pip install pyarrow"
+            ) from exc
+        self._columns = list(columns)
+        self._sink = _ChunkSink()
+        self._writer: Any = None
+        self._schema: Any = None
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Write ``rows`` as a row group and return the bytes produced."""
+        if not rows:
+            return b""
+        import pyarrow as pa
+        import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+        if self._writer is None:
+            self._schema = pa.schema(
+                [
+                    pa.field(name, _arrow_type([row[i] for row in rows]))
+                    for i, name in enumerate(self._columns)
+                ]
+            )
+            self._writer = pq.ParquetWriter(self._sink, self._schema)
+        arrays = [
+            pa.array([_arrow_value(row[i], field.type) for row in rows], type=field.type)
+            for i, field in enumerate(self._schema)
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Write the footer (or an empty file) and return the remaining bytes."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._schema = pa.schema([pa.field(name, pa.string()) for name in self._columns])
+            self._writer = pq.ParquetWriter(self._sink, self._schema)
+        self._writer.close()
+        return self._sink.drain()
+
+
+def _arrow_type(values: Sequence[Any]) -> Any:
+    import pyarrow as pa
+
+    sample = next((v for v in values if v is not None), None)
+    if isinstance(sample, bool):
+        return pa.bool_()
+    if isinstance(sample, int):
+        return pa.int64()
+    if isinstance(sample, float | Decimal):
+        return pa.float64()
+    if isinstance(sample, datetime):
+        return pa.timestamp("us")
+    if isinstance(sample, date):
+        return pa.date32()
+    return pa.string()
+
+
+def _arrow_value(value: Any, arrow_type: Any) -> Any:
+    import pyarrow as pa
+
+    if value is None:
+        return None
+    if pa.types.is_string(arrow_type):
+        return value if isinstance(value, str) else str(value)
+    if pa.types.is_floating(arrow_type):
+        return float(value)
+    return value
+
+
+def open_export_writer(
+    export_format: ExportFormat, grid_name: str, columns: Sequence[str]
+) -> ExportWriter:
+    """Return an incremental writer for ``export_format``.
+
+    Args:
+        export_format: ``"xlsx"``, ``"csv"`` or ``"parquet"``.
+        grid_name: Grid being exported (XLSX sheet title).
+        columns: Ordered column names (header row).
+
+    Raises:
+        ValueError: If the format is unknown.
+        NotImplementedError: If the format's optional dependency is missing.
+    """
+    if export_format == "xlsx":
+        return XlsxStreamWriter(grid_name.title(), columns)
+    if export_format == "csv":
+        return CsvStreamWriter(columns)
+    if export_format == "parquet":
+        return ParquetStreamWriter(columns)
+    raise ValueError(f"Unsupported export format: {export_format!r}")
+
+
+__all__ = [
+    "EXPORT_MEDIA_TYPES",
+    "XLSX_MAX_DATA_ROWS",
+    "CsvStreamWriter",
+    "ExportFormat",
+    "ExportWriter",
+    "ParquetStreamWriter",
+    "XlsxStreamWriter",
+    "open_export_writer",
+]
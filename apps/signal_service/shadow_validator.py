@@ -19,6 +19,7 @@ import numpy as np
 import numpy.typing as npt
 import pandas as pd
 
+from libs.data.data_pipeline.adjusted_store import AdjustedStore
 from strategies.alpha_baseline.features import get_alpha158_features
 
 FeatureProvider = Callable[..., pd.DataFrame]
@@ -147,11 +148,19 @@ class ShadowModeValidator:
 
 
 def _list_data_dates(data_dir: Path) -> list[date]:
-    """Return sorted list of available YYYY-MM-DD partitions under data_dir."""
+    """Return sorted list of available data dates under data_dir.
+
+    Uses the consolidated AdjustedStore manifest when present, otherwise the
+    YYYY-MM-DD partition directory names.
+    """
     dates: list[date] = []
     if not data_dir.exists():
         return dates
 
+    store = AdjustedStore(data_dir)
+    if store.exists:
+        return store.available_dates()
+
     for entry in data_dir.iterdir():
         if not entry.is_dir():
             continue
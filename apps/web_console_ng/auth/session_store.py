@@ -1,15 +1,27 @@
-"""Server-side session store backed by Redis with encryption and signing."""
+"""Server-side session store backed by Redis with encryption and signing.
+
+Successful validations are cached in-process for a few seconds, keyed by the
+signed cookie value, and concurrent validations of the same cookie share one
+Redis round-trip. Revocations (invalidate, force-logout, role change,
+rotation) are broadcast on a Redis pub/sub channel so every pod drops its
+cached copy; while a pod is not subscribed its cache is bypassed entirely.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import copy
 import hashlib
 import hmac
 import ipaddress
 import json
 import logging
 import secrets
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, cast
 
@@ -69,6 +81,21 @@ return old_data
 """
 
 
+SESSION_INVALIDATION_CHANNEL = "ng_session_invalidations"
+_VALIDATION_CACHE_MAX_ENTRIES = 10_000
+_INVALIDATION_RECONNECT_DELAY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class _ValidatedSession:
+    """Session payload that passed full validation, with its cache expiry."""
+
+    session: dict[str, Any]
+    session_id: str
+    user_id: str | None
+    expires_at: float
+
+
 class SessionCreationError(Exception):
     """Raised when session creation fails (Redis unavailable, etc.)."""
 
@@ -113,6 +140,16 @@ class ServerSessionStore:
         self.idle_timeout = config.SESSION_IDLE_TIMEOUT_MINUTES * 60
         self.absolute_timeout = config.SESSION_ABSOLUTE_TIMEOUT_HOURS * 3600
         self.audit_logger = audit_logger
+        self.validation_cache_ttl = config.SESSION_VALIDATION_CACHE_TTL_SECONDS
+        # Keyed by signed cookie value; only trusted while the invalidation
+        # listener is subscribed (see _cached_session).
+        self._validated_sessions: OrderedDict[str, _ValidatedSession] = OrderedDict()
+        self._validation_cache_generation = 0
+        self._inflight_validations: dict[
+            tuple[str, str, str], asyncio.Future[dict[str, Any] | None]
+        ] = {}
+        self._invalidation_listener: asyncio.Task[None] | None = None
+        self._invalidation_listener_ready = False
 
     async def create_session(
         self,
@@ -210,8 +247,52 @@ class ServerSessionStore:
         """Validate session and return data if valid.
 
         Cookie value format: {session_id}.{key_id}:{signature}
+
+        A cookie validated within the last ``validation_cache_ttl`` seconds is
+        answered from the in-process cache without Redis round-trips (including
+        the validate rate limit). Device binding is still checked on every hit;
+        a mismatch falls through to full validation, which revokes the session.
         """
         user_agent = user_agent or ""
+        cached = self._cached_session(cookie_value, client_ip, user_agent)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent validations of the same cookie from the same client
+        flight_key = (cookie_value, client_ip, user_agent)
+        flight = self._inflight_validations.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._validate_and_cache(cookie_value, client_ip, user_agent)
+            )
+            self._inflight_validations[flight_key] = flight
+
+            def _clear_flight(done: asyncio.Future[dict[str, Any] | None]) -> None:
+                if self._inflight_validations.get(flight_key) is done:
+                    del self._inflight_validations[flight_key]
+
+            flight.add_done_callback(_clear_flight)
+        session = await asyncio.shield(flight)
+        return copy.deepcopy(session) if session is not None else None
+
+    async def _validate_and_cache(
+        self,
+        cookie_value: str,
+        client_ip: str,
+        user_agent: str,
+    ) -> dict[str, Any] | None:
+        generation = self._validation_cache_generation
+        session = await self._validate_session_uncached(cookie_value, client_ip, user_agent)
+        if session is not None:
+            self._cache_validated_session(cookie_value, session, generation)
+        return session
+
+    async def _validate_session_uncached(
+        self,
+        cookie_value: str,
+        client_ip: str,
+        user_agent: str,
+    ) -> dict[str, Any] | None:
         try:
             if not await self._check_rate_limit(client_ip, "validate", 100):
                 if self.audit_logger:
@@ -480,6 +561,7 @@ class ServerSessionStore:
                     if new_ttl > 0:
                         await self.redis.expire(index_key, new_ttl)
 
+            await self._broadcast_invalidation(session_id=old_session_id)
             cookie_value = self._build_cookie_value(new_session_id)
             if self.audit_logger:
                 self.audit_logger.log_event(
@@ -548,6 +630,7 @@ class ServerSessionStore:
                 "reverse_index_cleanup_failed", extra={"session_id": session_id, "error": str(exc)}
             )
         await self.redis.delete(f"{self.session_prefix}{session_id}")
+        await self._broadcast_invalidation(session_id=session_id)
 
     async def invalidate_redis_sessions_for_user(self, user_id: str) -> int:
         """Invalidate ALL Redis sessions for a given user_id.
@@ -609,6 +692,7 @@ class ServerSessionStore:
                 results = await pipe.execute()
             count = sum(1 for r in results[:-1] if r)
 
+        await self._broadcast_invalidation(user_id=user_id)
         logger.info(
             "user_sessions_invalidated",
             extra={"user_id": user_id, "sessions_removed": count},
@@ -673,6 +757,7 @@ class ServerSessionStore:
 
                 if not results or not results[0]:
                     return False
+                await self._broadcast_invalidation(session_id=session_id)
                 return True
 
             except redis.WatchError:
@@ -689,6 +774,171 @@ class ServerSessionStore:
                 return False
         return False  # Exhausted retries without WatchError
 
+    def _cached_session(
+        self,
+        cookie_value: str,
+        client_ip: str,
+        user_agent: str,
+    ) -> dict[str, Any] | None:
+        """Return a copy of a still-fresh validated session, if one is cached."""
+        if self.validation_cache_ttl <= 0:
+            return None
+        self._ensure_invalidation_listener()
+        if not self._invalidation_listener_ready:
+            return None
+        entry = self._validated_sessions.get(cookie_value)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            del self._validated_sessions[cookie_value]
+            return None
+        if config.DEVICE_BINDING_ENABLED:
+            expected = entry.session.get("device") or {}
+            current = self._build_device_info(client_ip, {"user_agent": user_agent})
+            if expected.get("ip_subnet") != current.get("ip_subnet") or expected.get(
+                "ua_hash"
+            ) != current.get("ua_hash"):
+                return None
+        self._validated_sessions.move_to_end(cookie_value)
+        return copy.deepcopy(entry.session)
+
+    def _cache_validated_session(
+        self,
+        cookie_value: str,
+        session: dict[str, Any],
+        generation: int,
+    ) -> None:
+        # A revocation or listener outage since validation started makes the
+        # result untrustworthy for caching, even though it is still returned.
+        if (
+            self.validation_cache_ttl <= 0
+            or not self._invalidation_listener_ready
+            or generation != self._validation_cache_generation
+        ):
+            return
+        try:
+            created_at = datetime.fromisoformat(session["created_at"]).replace(tzinfo=UTC)
+        except (KeyError, ValueError, TypeError):
+            return
+        remaining = self.absolute_timeout - (datetime.now(UTC) - created_at).total_seconds()
+        ttl = min(self.validation_cache_ttl, remaining)
+        if ttl <= 0:
+            return
+        self._validated_sessions[cookie_value] = _ValidatedSession(
+            session=copy.deepcopy(session),
+            session_id=str(session.get("session_id", "")),
+            user_id=_get_user_id(session),
+            expires_at=time.monotonic() + ttl,
+        )
+        self._validated_sessions.move_to_end(cookie_value)
+        while len(self._validated_sessions) > _VALIDATION_CACHE_MAX_ENTRIES:
+            self._validated_sessions.popitem(last=False)
+
+    def _drop_validated_sessions(
+        self,
+        *,
+        session_id: str | None = None,
+        user_id: str | None = None,
+    ) -> None:
+        """Evict cached sessions by id or user; with neither, evict everything."""
+        self._validation_cache_generation += 1
+        if session_id is None and user_id is None:
+            self._validated_sessions.clear()
+            return
+        stale = [
+            cookie
+            for cookie, entry in self._validated_sessions.items()
+            if (session_id is not None and entry.session_id == session_id)
+            or (user_id is not None and entry.user_id == user_id)
+        ]
+        for cookie in stale:
+            del self._validated_sessions[cookie]
+
+    async def _broadcast_invalidation(
+        self,
+        *,
+        session_id: str | None = None,
+        user_id: str | None = None,
+    ) -> None:
+        """Drop cached copies locally and tell other pods to do the same."""
+        self._drop_validated_sessions(session_id=session_id, user_id=user_id)
+        if self.validation_cache_ttl <= 0:
+            return
+        target = {"session_id": session_id} if session_id is not None else {"user_id": user_id}
+        try:
+            await self.redis.publish(SESSION_INVALIDATION_CHANNEL, json.dumps(target))
+        except (redis.RedisError, OSError) as exc:
+            # Other pods fall back to their cache TTL for this revocation
+            logger.warning(
+                "session_invalidation_publish_failed",
+                extra={"error": str(exc), "error_type": type(exc).__name__},
+            )
+
+    def _ensure_invalidation_listener(self) -> None:
+        task = self._invalidation_listener
+        if task is not None and not task.done():
+            return
+        try:
+            self._invalidation_listener = asyncio.get_running_loop().create_task(
+                self._listen_for_invalidations()
+            )
+        except RuntimeError:
+            self._invalidation_listener = None
+
+    def _set_invalidation_listener_ready(self, ready: bool) -> None:
+        if not ready:
+            # Revocations may be missed while unsubscribed: stop trusting the cache
+            self._drop_validated_sessions()
+        self._invalidation_listener_ready = ready
+
+    async def _listen_for_invalidations(self) -> None:
+        """Apply revocations published by any pod to this pod's cache."""
+        while True:
+            pubsub: Any | None = None
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(SESSION_INVALIDATION_CHANNEL)
+                self._set_invalidation_listener_ready(True)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_invalidation_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except (redis.RedisError, OSError, ValueError, TypeError, AttributeError) as exc:
+                logger.warning(
+                    "session_invalidation_listener_error",
+                    extra={"error": str(exc), "error_type": type(exc).__name__},
+                )
+            finally:
+                self._set_invalidation_listener_ready(False)
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except (redis.RedisError, OSError) as exc:
+                        logger.debug(
+                            "session_invalidation_pubsub_close_failed", extra={"error": str(exc)}
+                        )
+            await asyncio.sleep(_INVALIDATION_RECONNECT_DELAY_SECONDS)
+
+    def _apply_invalidation_message(self, raw: Any) -> None:
+        try:
+            target = json.loads(raw)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            target = None
+        if not isinstance(target, dict):
+            logger.warning("session_invalidation_message_invalid")
+            self._drop_validated_sessions()
+            return
+        session_id = target.get("session_id")
+        user_id = target.get("user_id")
+        if not isinstance(session_id, str) and not isinstance(user_id, str):
+            self._drop_validated_sessions()
+            return
+        self._drop_validated_sessions(
+            session_id=session_id if isinstance(session_id, str) else None,
+            user_id=user_id if isinstance(user_id, str) else None,
+        )
+
     async def _check_rate_limit(self, client_ip: str, action: str, limit: int) -> bool:
         key = f"{self.rate_limit_prefix}{action}:{client_ip}"
         ttl_seconds = 60
@@ -879,6 +1129,7 @@ def extract_session_id(signed_cookie: str) -> str:
 
 
 __all__ = [
+    "SESSION_INVALIDATION_CHANNEL",
     "ServerSessionStore",
     "SessionCreationError",
     "SessionValidationError",
@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING
 
 from nicegui import ui
 
+from apps.web_console_ng.core.admission import ROUTE_CLASS_SAFETY, admission_slot
 from apps.web_console_ng.utils.orders import (
     DEFAULT_CONCURRENT_CANCELS,
     is_cancellable_order_id,
@@ -174,8 +175,10 @@ class CancelAllDialog:
                     )
                     return False
 
-        # Execute all cancels with bounded concurrency
-        results = await asyncio.gather(*[cancel_one(o) for o in orders])
+        # One safety slot covers the whole batch; per-order concurrency is
+        # bounded by the local semaphore above
+        async with admission_slot(ROUTE_CLASS_SAFETY):
+            results = await asyncio.gather(*[cancel_one(o) for o in orders])
         success_count = sum(1 for r in results if r)
         failure_count = len(results) - success_count
 
@@ -13,6 +13,7 @@ from nicegui import ui
 
 from apps.web_console_ng.components.hierarchical_orders import transform_to_hierarchy
 from apps.web_console_ng.core.client import AsyncTradingClient
+from apps.web_console_ng.core.grid_delta import get_row_sync
 from apps.web_console_ng.core.grid_performance import GridPerformanceMonitor, get_monitor
 from apps.web_console_ng.core.synthetic_id import (
     FALLBACK_ID_PREFIX,
@@ -364,7 +365,7 @@ async def update_orders_table(
 
     Uses getRowId (configured as 'data => data.client_order_id') for efficient updates:
     - Adds newly created orders
-    - Updates existing orders (status changes, partial fills)
+    - Updates existing orders whose row changed (status changes, partial fills)
     - Removes filled/cancelled orders no longer in snapshot
     - Preserves scroll position and row selection
     - Cleans up stale entries from synthetic_id_map (prevents memory leak)
@@ -397,31 +398,25 @@ async def update_orders_table(
         client_id=client_id,
     )
 
+    row_sync = get_row_sync(grid, "client_order_id")
     if getattr(grid, "_ready_event", None) is not None and not grid._ready_event.is_set():  # type: ignore[attr-defined]
         grid.options["rowData"] = valid_orders
         grid.update()
+        row_sync.reset(valid_orders)
         return current_ids
 
     if previous_order_ids is None:
         # Fire-and-forget to avoid UI timeouts when the browser is busy.
         grid.run_grid_method("setGridOption", "rowData", valid_orders, timeout=5)
+        row_sync.reset(valid_orders)
         return current_ids
 
-    added_orders = [o for o in valid_orders if o["client_order_id"] not in previous_order_ids]
-    updated_orders = [o for o in valid_orders if o["client_order_id"] in previous_order_ids]
-    removed_orders = [{"client_order_id": oid} for oid in (previous_order_ids - current_ids)]
+    # Only rows that differ from what this client was last sent are pushed
+    delta = row_sync.push(valid_orders, previous_order_ids)
 
     monitor = get_monitor(grid)
-    if monitor:
-        delta_size = len(added_orders) + len(updated_orders) + len(removed_orders)
-        monitor.metrics.record_update(delta_size)
-
-    # Fire-and-forget to avoid UI timeouts when the browser is busy.
-    grid.run_grid_method(
-        "applyTransactionAsync",
-        {"add": added_orders, "update": updated_orders, "remove": removed_orders},
-        timeout=5,
-    )
+    if monitor and delta.size:
+        monitor.metrics.record_update(delta.size)
 
     # Cleanup synthetic_id_map to prevent unbounded growth in long-running sessions
     # Use miss counts to avoid churn from transient snapshot gaps (delete after 3 misses)
@@ -515,29 +510,24 @@ async def update_hierarchical_orders_table(
         if row.get("is_parent") and row.get("client_order_id")
     }
 
+    row_sync = get_row_sync(grid, "client_order_id")
     if getattr(grid, "_ready_event", None) is not None and not grid._ready_event.is_set():  # type: ignore[attr-defined]
         grid.options["rowData"] = hierarchy_rows
         grid.update()
+        row_sync.reset(hierarchy_rows)
         return current_ids, current_parent_ids
 
     if previous_order_ids is None:
         grid.run_grid_method("setGridOption", "rowData", hierarchy_rows, timeout=5)
+        row_sync.reset(hierarchy_rows)
         return current_ids, current_parent_ids
 
-    added_orders = [o for o in hierarchy_rows if o["client_order_id"] not in previous_order_ids]
-    updated_orders = [o for o in hierarchy_rows if o["client_order_id"] in previous_order_ids]
-    removed_orders = [{"client_order_id": oid} for oid in (previous_order_ids - current_ids)]
+    # Only rows that differ from what this client was last sent are pushed
+    delta = row_sync.push(hierarchy_rows, previous_order_ids)
 
     monitor = get_monitor(grid)
-    if monitor:
-        delta_size = len(added_orders) + len(updated_orders) + len(removed_orders)
-        monitor.metrics.record_update(delta_size)
-
-    grid.run_grid_method(
-        "applyTransactionAsync",
-        {"add": added_orders, "update": updated_orders, "remove": removed_orders},
-        timeout=5,
-    )
+    if monitor and delta.size:
+        monitor.metrics.record_update(delta.size)
 
     if synthetic_id_map is not None:
         miss_threshold = 3
@@ -12,6 +12,7 @@ import httpx
 from nicegui import ui
 
 from apps.web_console_ng.core.client import AsyncTradingClient
+from apps.web_console_ng.core.grid_delta import get_row_sync
 from apps.web_console_ng.core.grid_performance import GridPerformanceMonitor, get_monitor
 from apps.web_console_ng.ui.trading_layout import (
     apply_compact_grid_classes,
@@ -150,7 +151,7 @@ async def update_positions_grid(
     - No full re-render
     - Preserves scroll position
     - Preserves row selection
-    - Only updates changed rows
+    - Only sends rows that changed since the last update (see core.grid_delta)
     - ADDS new positions (symbols not in previous snapshot)
     - REMOVES closed positions (symbols no longer in snapshot)
 
@@ -208,32 +209,26 @@ async def update_positions_grid(
         pos["unrealized_plpc"] = unrealized_pl / (avg_entry * abs(qty))
 
     current_symbols = {p["symbol"] for p in valid_positions}
+    row_sync = get_row_sync(grid, "symbol")
 
     if getattr(grid, "_ready_event", None) is not None and not grid._ready_event.is_set():  # type: ignore[attr-defined]
         grid.options["rowData"] = valid_positions
         grid.update()
+        row_sync.reset(valid_positions)
         return current_symbols
 
     if previous_symbols is None:
         # Fire-and-forget to avoid UI timeouts when the browser is busy.
         grid.run_grid_method("setGridOption", "rowData", valid_positions, timeout=5)
+        row_sync.reset(valid_positions)
         return current_symbols
 
-    added_positions = [p for p in valid_positions if p["symbol"] not in previous_symbols]
-    updated_positions = [p for p in valid_positions if p["symbol"] in previous_symbols]
-    removed_symbols = [{"symbol": s} for s in (previous_symbols - current_symbols)]
+    # Only rows that differ from what this client was last sent are pushed
+    delta = row_sync.push(valid_positions, previous_symbols)
 
     monitor = get_monitor(grid)
-    if monitor:
-        delta_size = len(added_positions) + len(updated_positions) + len(removed_symbols)
-        monitor.metrics.record_update(delta_size)
-
-    # Fire-and-forget to avoid UI timeouts when the browser is busy.
-    grid.run_grid_method(
-        "applyTransactionAsync",
-        {"add": added_positions, "update": updated_positions, "remove": removed_symbols},
-        timeout=5,
-    )
+    if monitor and delta.size:
+        monitor.metrics.record_update(delta.size)
 
     return current_symbols
 
@@ -76,6 +76,16 @@ WS_SESSION_CONN_TTL = int(os.getenv("WS_SESSION_CONN_TTL", "3600"))
 # Timeout for session validation during WebSocket admission (seconds)
 WS_SESSION_VALIDATION_TIMEOUT = float(os.getenv("WS_SESSION_VALIDATION_TIMEOUT", "2.0"))
 
+# Route-class work budgets (see core/admission.py). Safety actions (flatten,
+# cancel-all) get a reserved lane and are never rejected; the kill switch
+# bypasses admission. Heavy analytics are capped per user.
+ADMISSION_SAFETY_MAX_CONCURRENT = int(os.getenv("ADMISSION_SAFETY_MAX_CONCURRENT", "16"))
+ADMISSION_INTERACTIVE_MAX_CONCURRENT = int(os.getenv("ADMISSION_INTERACTIVE_MAX_CONCURRENT", "64"))
+ADMISSION_INTERACTIVE_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_INTERACTIVE_QUEUE_TIMEOUT", "2.0"))
+ADMISSION_HEAVY_MAX_CONCURRENT = int(os.getenv("ADMISSION_HEAVY_MAX_CONCURRENT", "4"))
+ADMISSION_HEAVY_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_HEAVY_QUEUE_TIMEOUT", "15.0"))
+ADMISSION_HEAVY_MAX_PER_USER = int(os.getenv("ADMISSION_HEAVY_MAX_PER_USER", "2"))
+
 # =============================================================================
 # Backend endpoints
 # =============================================================================
@@ -141,6 +151,10 @@ REDIS_SSL_CERT_REQS = os.getenv("REDIS_SSL_CERT_REQS", "required").lower()
 
 SESSION_IDLE_TIMEOUT_MINUTES = int(os.getenv("SESSION_IDLE_TIMEOUT_MINUTES", "15"))
 SESSION_ABSOLUTE_TIMEOUT_HOURS = int(os.getenv("SESSION_ABSOLUTE_TIMEOUT_HOURS", "4"))
+# In-process cache of validated sessions. Revocations are broadcast over Redis
+# pub/sub and the cache is bypassed while that channel is down, so the TTL only
+# bounds staleness if a broadcast is lost. Set to 0 to disable.
+SESSION_VALIDATION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_VALIDATION_CACHE_TTL_SECONDS", "5"))
 
 SESSION_COOKIE_SECURE = os.getenv(
     "SESSION_COOKIE_SECURE",
@@ -1,13 +1,34 @@
-"""WebSocket admission control middleware for NiceGUI."""
+"""Admission control for the NiceGUI web console.
+
+WebSocket connections are capped per pod and per session. Units of work are
+admitted through route classes, each with its own concurrency budget, queue
+timeout and priority:
+
+- safety: flatten and cancel-all actions. Its slots are reserved and never
+  used by other classes, and it is never queued or rejected: when every slot
+  is taken the action is admitted over budget. The kill switch bypasses
+  admission entirely.
+- interactive: ordinary API calls.
+- heavy: SQL explorer, research/backtest and comparison pages. Capped per
+  user so one research user cannot take every slot.
+
+A class may borrow an idle slot from a lower-priority class, never from a
+higher one. Queue waits are exported per class as a Prometheus histogram.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
 from redis.exceptions import RedisError
 from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from apps.web_console_ng import config
@@ -72,13 +93,241 @@ def _increment_rejection(reason: str) -> None:
         return
 
 
+ROUTE_CLASS_SAFETY = "safety"
+ROUTE_CLASS_INTERACTIVE = "interactive"
+ROUTE_CLASS_HEAVY = "heavy"
+
+
+@dataclass(frozen=True)
+class RouteClass:
+    """Concurrency budget for one class of work.
+
+    Attributes:
+        name: Route class label (also used as the metrics label).
+        priority: Lower values are more important. A class may borrow idle
+            slots from classes with a higher value, never the reverse.
+        max_concurrent: Slots reserved for this class.
+        queue_timeout_seconds: Max time to wait for a slot before rejecting.
+        per_user_limit: Max slots one user may hold at once (None = unlimited).
+        admit_over_budget: Admit immediately, over budget, when no slot is
+            idle instead of queueing (for work that must never be rejected).
+    """
+
+    name: str
+    priority: int
+    max_concurrent: int
+    queue_timeout_seconds: float
+    per_user_limit: int | None = None
+    admit_over_budget: bool = False
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a unit of work cannot be admitted to its route class."""
+
+    def __init__(
+        self,
+        route_class: str,
+        reason: str,
+        status_code: int,
+        retry_after: int | None = None,
+    ) -> None:
+        super().__init__(f"Admission rejected for {route_class}: {reason}")
+        self.route_class = route_class
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _record_admission(
+    route_class: str, *, wait_seconds: float | None = None, delta: int = 0
+) -> None:
+    try:
+        from apps.web_console_ng import metrics
+
+        if wait_seconds is not None:
+            metrics.admission_queue_wait_seconds.labels(
+                pod=POD_NAME, route_class=route_class
+            ).observe(wait_seconds)
+        if delta:
+            metrics.admission_in_flight.labels(pod=POD_NAME, route_class=route_class).inc(delta)
+    except (ImportError, ModuleNotFoundError, AttributeError) as exc:
+        logger.debug(
+            "metrics_admission_record_failed",
+            extra={"route_class": route_class, "error": str(exc), "type": type(exc).__name__},
+        )
+
+
+def _record_admission_rejection(route_class: str, reason: str) -> None:
+    try:
+        from apps.web_console_ng import metrics
+
+        metrics.admission_rejected_total.labels(
+            pod=POD_NAME, route_class=route_class, reason=reason
+        ).inc()
+    except (ImportError, ModuleNotFoundError, AttributeError) as exc:
+        logger.debug(
+            "metrics_increment_failed",
+            extra={"reason": reason, "error": str(exc), "type": type(exc).__name__},
+        )
+
+
+class RouteBudgets:
+    """Per-route-class semaphores with borrowing and per-user fairness."""
+
+    def __init__(self, route_classes: Iterable[RouteClass]) -> None:
+        ordered = sorted(route_classes, key=lambda rc: rc.priority)
+        self._classes = {rc.name: rc for rc in ordered}
+        self._semaphores = {rc.name: asyncio.Semaphore(rc.max_concurrent) for rc in ordered}
+        self._user_slots: dict[tuple[str, str], int] = {}
+
+    def has_user_limit(self, route_class: str) -> bool:
+        """Return True if ``route_class`` caps the slots one user may hold."""
+        return bool(self._classes[route_class].per_user_limit)
+
+    @asynccontextmanager
+    async def slot(self, route_class: str, user_key: str | None = None) -> AsyncIterator[None]:
+        """Hold a slot of ``route_class`` for the duration of the block.
+
+        Raises:
+            KeyError: If ``route_class`` is not configured.
+            AdmissionRejectedError: If the per-user limit is reached (429) or
+                no slot frees up within the class queue timeout (503). Never
+                raised for classes that admit over budget.
+        """
+        rc = self._classes[route_class]
+        user_slot = (rc.name, user_key) if rc.per_user_limit and user_key else None
+        if user_slot is not None:
+            held = self._user_slots.get(user_slot, 0)
+            if held >= (rc.per_user_limit or 0):
+                _record_admission_rejection(rc.name, "user_limit")
+                raise AdmissionRejectedError(rc.name, "user_limit", 429)
+            # Reserve before waiting so concurrent requests see the count
+            self._user_slots[user_slot] = held + 1
+
+        lane: str | None = None
+        try:
+            start = time.perf_counter()
+            lane = await self._acquire(rc)
+            _record_admission(rc.name, wait_seconds=time.perf_counter() - start, delta=1)
+            try:
+                yield
+            finally:
+                _record_admission(rc.name, delta=-1)
+        finally:
+            if lane is not None:
+                self._semaphores[lane].release()
+            if user_slot is not None:
+                remaining = self._user_slots.get(user_slot, 1) - 1
+                if remaining > 0:
+                    self._user_slots[user_slot] = remaining
+                else:
+                    self._user_slots.pop(user_slot, None)
+
+    async def _acquire(self, rc: RouteClass) -> str | None:
+        """Take an idle slot (own class first, then lower priority) or queue.
+
+        Returns:
+            The lane whose semaphore was acquired, or None when the work was
+            admitted over budget.
+        """
+        for name, candidate in self._classes.items():
+            if candidate.priority < rc.priority:
+                continue
+            semaphore = self._semaphores[name]
+            # locked() also accounts for queued waiters, so borrowing never
+            # jumps ahead of work already waiting in that class.
+            if not semaphore.locked():
+                await semaphore.acquire()  # completes without suspending
+                return name
+
+        if rc.admit_over_budget:
+            logger.warning(
+                "admission_over_budget",
+                extra={"pod": POD_NAME, "route_class": rc.name},
+            )
+            return None
+
+        try:
+            await asyncio.wait_for(
+                self._semaphores[rc.name].acquire(), timeout=rc.queue_timeout_seconds
+            )
+        except TimeoutError:
+            _record_admission_rejection(rc.name, "queue_timeout")
+            raise AdmissionRejectedError(rc.name, "queue_timeout", 503, retry_after=5) from None
+        return rc.name
+
+
+DEFAULT_ROUTE_CLASSES = (
+    RouteClass(
+        ROUTE_CLASS_SAFETY,
+        priority=0,
+        max_concurrent=config.ADMISSION_SAFETY_MAX_CONCURRENT,
+        queue_timeout_seconds=0.0,
+        admit_over_budget=True,
+    ),
+    RouteClass(
+        ROUTE_CLASS_INTERACTIVE,
+        priority=1,
+        max_concurrent=config.ADMISSION_INTERACTIVE_MAX_CONCURRENT,
+        queue_timeout_seconds=config.ADMISSION_INTERACTIVE_QUEUE_TIMEOUT,
+    ),
+    RouteClass(
+        ROUTE_CLASS_HEAVY,
+        priority=2,
+        max_concurrent=config.ADMISSION_HEAVY_MAX_CONCURRENT,
+        queue_timeout_seconds=config.ADMISSION_HEAVY_QUEUE_TIMEOUT,
+        per_user_limit=config.ADMISSION_HEAVY_MAX_PER_USER,
+    ),
+)
+
+_route_budgets = RouteBudgets(DEFAULT_ROUTE_CLASSES)
+
+# HTTP path prefixes admitted through a route class; unmatched paths (static
+# assets, health probes, metrics, NiceGUI internals) bypass route budgets.
+HTTP_ROUTE_CLASS_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("/data/sql-explorer", ROUTE_CLASS_HEAVY),
+    ("/sql-explorer", ROUTE_CLASS_HEAVY),
+    ("/research", ROUTE_CLASS_HEAVY),
+    ("/compare", ROUTE_CLASS_HEAVY),
+    ("/api/", ROUTE_CLASS_INTERACTIVE),
+)
+
+
+def classify_http_path(path: str) -> str | None:
+    """Return the route class for an HTTP path, or None if not budgeted."""
+    for prefix, route_class in HTTP_ROUTE_CLASS_PREFIXES:
+        if path == prefix.rstrip("/") or path.startswith(prefix):
+            return route_class
+    return None
+
+
+def admission_slot(
+    route_class: str, user_key: str | None = None
+) -> AbstractAsyncContextManager[None]:
+    """Admit a unit of work (e.g. a UI event handler) through a route class.
+
+    Usage:
+        async with admission_slot(ROUTE_CLASS_SAFETY):
+            await client.flatten_all_positions(...)
+    """
+    return _route_budgets.slot(route_class, user_key)
+
+
 class AdmissionControlMiddleware:
-    """ASGI middleware for connection admission control (WebSocket only)."""
+    """ASGI middleware for connection admission control.
+
+    WebSocket handshakes are admitted against the global connection and
+    per-session limits; HTTP requests run inside the route-class budget of
+    their path (see ``classify_http_path``).
+    """
 
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            await self._admit_http(scope, receive, send)
+            return
         if scope["type"] != "websocket":
             await self.app(scope, receive, send)
             return
@@ -252,6 +501,79 @@ class AdmissionControlMiddleware:
             # Always release semaphore for non-session path - see comment above
             _connection_semaphore.release()
 
+    async def _admit_http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run an HTTP request inside its route-class budget (if any)."""
+        route_class = classify_http_path(str(scope.get("path", "")))
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Only classes with a per-user cap need the (Redis-backed) user key
+        user_key = (
+            await self._http_user_key(HTTPConnection(scope))
+            if _route_budgets.has_user_limit(route_class)
+            else None
+        )
+
+        try:
+            async with admission_slot(route_class, user_key):
+                await self.app(scope, receive, send)
+        except AdmissionRejectedError as exc:
+            logger.info(
+                "admission_http_rejected",
+                extra={
+                    "pod": POD_NAME,
+                    "route_class": exc.route_class,
+                    "reason": exc.reason,
+                    "path": scope.get("path"),
+                },
+            )
+            headers = {"retry-after": str(exc.retry_after)} if exc.retry_after else None
+            response = JSONResponse(
+                {"error": "Server busy", "route_class": exc.route_class, "reason": exc.reason},
+                status_code=exc.status_code,
+                headers=headers,
+            )
+            await response(scope, receive, send)
+
+    async def _http_user_key(self, conn: HTTPConnection) -> str:
+        """Return the per-user budget key for an HTTP request.
+
+        The session cookie is client-controlled, so it is only trusted once
+        validated; budgets are then keyed on the session's user id, the same
+        key UI handlers pass to ``admission_slot``. Requests without a valid
+        session fall back to the trusted client address, so rotating or
+        forging cookies cannot mint fresh per-user budgets.
+        """
+        client_ip = extract_trusted_client_ip(conn, config.TRUSTED_PROXY_IPS)
+        session_cookie = conn.cookies.get(SESSION_COOKIE_NAME)
+        if session_cookie:
+            try:
+                session = await asyncio.wait_for(
+                    get_session_store().validate_session(
+                        session_cookie, client_ip, conn.headers.get("user-agent", "")
+                    ),
+                    timeout=SESSION_VALIDATION_TIMEOUT,
+                )
+            except (
+                TimeoutError,
+                SessionValidationError,
+                ValueError,
+                OSError,
+                ConnectionError,
+                RedisError,
+            ) as exc:
+                logger.debug(
+                    "admission_http_session_unresolved",
+                    extra={"pod": POD_NAME, "error": str(exc), "type": type(exc).__name__},
+                )
+                session = None
+            user = (session or {}).get("user")
+            user_id = user.get("user_id") if isinstance(user, dict) else None
+            if user_id:
+                return str(user_id)
+        return f"ip:{client_ip}"
+
     async def _send_http_error(
         self, send: Send, status: int, message: str, retry_after: int | None = None
     ) -> None:
@@ -0,0 +1,224 @@
+"""Server-side row diffing for AG Grid transaction updates.
+
+Each grid instance belongs to exactly one client, so a snapshot attached to
+the grid is the last row set that client was sent. Refreshes are diffed
+against that snapshot by row id and only rows that were added, removed, or
+actually changed go over the websocket, so payload size and browser work
+scale with the number of changed rows instead of the total row count.
+
+Deltas produced within one animation frame of the previous send are merged
+and flushed together as a single ``applyTransactionAsync`` call.
+
+This module provides:
+- RowDelta: add/update/remove rows keyed by row id, mergeable across frames
+- GridRowSync: last-sent snapshot plus frame-coalesced transaction sender
+- get_row_sync: per-grid GridRowSync registry lookup
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from nicegui import ui
+
+logger = logging.getLogger(__name__)
+
+# One browser animation frame at 60 Hz
+FRAME_INTERVAL_SECONDS = 1 / 60
+
+_MISSING = object()
+
+
+@dataclass
+class RowDelta:
+    """Row changes for one grid, keyed by row id in arrival order."""
+
+    row_id_field: str
+    add: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    update: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    remove: dict[Any, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Number of rows touched by this delta."""
+        return len(self.add) + len(self.update) + len(self.remove)
+
+    def merge(self, newer: RowDelta) -> None:
+        """Fold a later delta into this one so both apply as one transaction."""
+        for row_id, row in newer.add.items():
+            # Removed earlier in the same frame: the browser still has the row
+            if self.remove.pop(row_id, None) is not None:
+                self.update[row_id] = row
+            else:
+                self.add[row_id] = row
+        for row_id, row in newer.update.items():
+            if row_id in self.add:
+                self.add[row_id] = row
+            else:
+                self.update[row_id] = row
+        for row_id, stub in newer.remove.items():
+            # Added earlier in the same frame: the browser never saw the row
+            if self.add.pop(row_id, None) is None:
+                self.update.pop(row_id, None)
+                self.remove[row_id] = stub
+
+    def to_transaction(self) -> dict[str, list[dict[str, Any]]]:
+        """Payload for AG Grid's ``applyTransactionAsync``."""
+        return {
+            "add": list(self.add.values()),
+            "update": list(self.update.values()),
+            "remove": list(self.remove.values()),
+        }
+
+
+class GridRowSync:
+    """Track the rows last sent to one grid and push only the differences.
+
+    The grid is held weakly so the per-grid registry does not keep grids of
+    disconnected clients alive.
+    """
+
+    def __init__(
+        self,
+        grid: ui.aggrid,
+        row_id_field: str,
+        *,
+        frame_interval_seconds: float = FRAME_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._grid_ref = weakref.ref(grid)
+        self.row_id_field = row_id_field
+        self._frame_interval = frame_interval_seconds
+        self._clock = clock
+        # None until the grid has been sent a full row set
+        self._rows: dict[Any, dict[str, Any] | None] | None = None
+        self._pending: RowDelta | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._last_flush = float("-inf")
+
+    def reset(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Record a full row set sent outside of transactions (initial load)."""
+        self._cancel_pending()
+        self._rows = {
+            row[self.row_id_field]: dict(row) for row in rows if row.get(self.row_id_field)
+        }
+
+    def push(
+        self,
+        rows: list[dict[str, Any]],
+        known_ids: set[Any] | None = None,
+    ) -> RowDelta:
+        """Diff ``rows`` against the last-sent snapshot and queue the changes.
+
+        Args:
+            rows: Complete current row set for the grid.
+            known_ids: Row ids the caller believes the grid already shows. Only
+                used when no snapshot exists yet; those rows are resent once.
+
+        Returns:
+            The delta computed for this refresh (may be empty).
+        """
+        previous = self._rows if self._rows is not None else dict.fromkeys(known_ids or ())
+        delta = self._diff(previous, rows)
+        if delta.size:
+            self._enqueue(delta)
+        return delta
+
+    def flush(self) -> None:
+        """Send any coalesced delta immediately."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._send(pending)
+
+    def _diff(
+        self,
+        previous: dict[Any, dict[str, Any] | None],
+        rows: list[dict[str, Any]],
+    ) -> RowDelta:
+        delta = RowDelta(self.row_id_field)
+        current: dict[Any, dict[str, Any] | None] = {}
+        for row in rows:
+            row_id = row.get(self.row_id_field)
+            if not row_id:
+                # Rows without an id cannot be addressed by getRowId
+                continue
+            current[row_id] = dict(row)
+            last = previous.get(row_id, _MISSING)
+            if last is _MISSING:
+                delta.add[row_id] = row
+            elif last != row:
+                delta.update[row_id] = row
+        for row_id in previous:
+            if row_id not in current:
+                delta.remove[row_id] = {self.row_id_field: row_id}
+        self._rows = current
+        return delta
+
+    def _enqueue(self, delta: RowDelta) -> None:
+        if self._pending is not None:
+            self._pending.merge(delta)
+            return
+        wait = self._last_flush + self._frame_interval - self._clock()
+        if wait <= 0:
+            self._send(delta)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._send(delta)
+            return
+        self._pending = delta
+        self._flush_handle = loop.call_later(wait, self.flush)
+
+    def _send(self, delta: RowDelta) -> None:
+        grid = self._grid_ref()
+        if grid is None:
+            return
+        self._last_flush = self._clock()
+        # Fire-and-forget to avoid UI timeouts when the browser is busy.
+        grid.run_grid_method("applyTransactionAsync", delta.to_transaction(), timeout=5)
+        logger.debug(
+            "grid_delta_sent",
+            extra={
+                "row_id_field": self.row_id_field,
+                "added": len(delta.add),
+                "updated": len(delta.update),
+                "removed": len(delta.remove),
+            },
+        )
+
+    def _cancel_pending(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = None
+
+
+# Grid instances are per client, so this is a per-client, per-grid registry.
+# WeakKeyDictionary drops entries when the grid is garbage collected.
+_grid_to_row_sync: WeakKeyDictionary[ui.aggrid, GridRowSync] = WeakKeyDictionary()
+
+
+def get_row_sync(grid: ui.aggrid, row_id_field: str) -> GridRowSync:
+    """Return the grid's row sync state, creating it on first use."""
+    sync = _grid_to_row_sync.get(grid)
+    if sync is None or sync.row_id_field != row_id_field:
+        sync = GridRowSync(grid, row_id_field)
+        _grid_to_row_sync[grid] = sync
+    return sync
+
+
+__all__ = [
+    "FRAME_INTERVAL_SECONDS",
+    "GridRowSync",
+    "RowDelta",
+    "get_row_sync",
+]
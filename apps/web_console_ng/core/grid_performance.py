@@ -2,6 +2,7 @@
 
 Note: This module MONITORS update rates and triggers degradation mode.
 Actual batching is handled by AG Grid's asyncTransactionWaitMillis config.
+Row diffing and per-frame coalescing of transactions live in grid_delta.
 
 Architecture Note: The module-level registries (_monitor_registry, _monitor_by_grid_and_session,
 _grid_to_monitor) store state in-memory. This implementation assumes a single-process deployment.
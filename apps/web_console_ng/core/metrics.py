@@ -45,6 +45,25 @@ connections_rejected_total = Counter(
     ["pod", "reason"],
 )
 
+admission_queue_wait_seconds = Histogram(
+    "nicegui_admission_queue_wait_seconds",
+    "Time spent waiting for a route-class admission slot",
+    ["pod", "route_class"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0],
+)
+
+admission_in_flight = Gauge(
+    "nicegui_admission_in_flight",
+    "Admitted units of work currently running per route class",
+    ["pod", "route_class"],
+)
+
+admission_rejected_total = Counter(
+    "nicegui_admission_rejected_total",
+    "Work rejected by route-class admission control",
+    ["pod", "route_class", "reason"],
+)
+
 auth_failures_total = Counter(
     "nicegui_auth_failures_total",
     "Authentication failures",
@@ -186,6 +205,9 @@ __all__ = [
     "ws_connects_total",
     "ws_disconnects_total",
     "connections_rejected_total",
+    "admission_queue_wait_seconds",
+    "admission_in_flight",
+    "admission_rejected_total",
     "auth_failures_total",
     "sessions_created_total",
     "api_latency_seconds",
@@ -1,10 +1,21 @@
-"""Sparkline data service for position P&L history."""
+"""Sparkline data service for position P&L history.
+
+Mark prices are kept in one shared ring buffer per symbol rather than one
+P&L series per user and symbol. Each buffer is a fixed-size Redis string of
+binary-packed ``(bucket, price)`` slots, written once per sample interval
+no matter how many dashboards display the symbol. A user's P&L history is
+derived at read time by scaling the shared marks with that user's position
+(``qty * (price - avg_entry_price)``), so Redis memory and refresh cost grow
+with the number of symbols, not users.
+
+The service needs a binary Redis client (``decode_responses=False``).
+"""
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import math
+import struct
 import time
 from typing import Any
 
@@ -13,9 +24,38 @@ from redis.exceptions import RedisError
 
 logger = logging.getLogger(__name__)
 
+# One ring slot: sample bucket (epoch seconds) and mark price, little-endian
+_SLOT = struct.Struct("<qd")
+
+# Last sampled bucket per symbol, shared by all dashboards in this process so
+# each bucket is written once rather than once per connected user.
+_LAST_SAMPLED: dict[str, int] = {}
+
+
+def _coerce_finite(value: Any) -> float | None:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
+
+
+def _mark_price(position: dict[str, Any]) -> float | None:
+    """Mark price of a position, derived from its P&L if not reported."""
+    price = _coerce_finite(position.get("current_price"))
+    if price is not None and price > 0:
+        return price
+    qty = _coerce_finite(position.get("qty"))
+    avg_entry = _coerce_finite(position.get("avg_entry_price"))
+    pnl = _coerce_finite(position.get("unrealized_pl"))
+    if not qty or avg_entry is None or pnl is None:
+        return None
+    derived = avg_entry + pnl / qty
+    return derived if math.isfinite(derived) and derived > 0 else None
+
 
 class SparklineDataService:
-    """Maintain per-position P&L history for inline sparklines."""
+    """Maintain shared per-symbol mark history for inline P&L sparklines."""
 
     def __init__(
         self,
@@ -26,26 +66,30 @@ class SparklineDataService:
         ttl_seconds: int = 7200,
         time_fn: Any = None,
         max_cache_entries: int = 10000,
+        last_sampled: dict[str, int] | None = None,
     ) -> None:
         self._redis = redis
         self._max_points = max_points
         self._sample_interval = sample_interval_seconds
         self._ttl_seconds = ttl_seconds
         self._time_fn = time_fn or time.time
-        self._last_sampled: dict[tuple[str, str], int] = {}
+        self._last_sampled = _LAST_SAMPLED if last_sampled is None else last_sampled
         self._last_prune_bucket: int = 0
         # Prune every 10 sample intervals to avoid unbounded growth
         self._prune_interval_buckets = 10
         # Hard limit on cache size to prevent unbounded memory growth
         self._max_cache_entries = max_cache_entries
 
-    def _key(self, user_id: str, symbol: str) -> str:
-        return f"pnl_history:{user_id}:{symbol}"
+    def _key(self, symbol: str) -> str:
+        return f"sparkline:mark:{symbol}"
 
     def _current_bucket(self) -> int:
         now = int(self._time_fn())
         return now - (now % self._sample_interval)
 
+    def _slot_offset(self, bucket: int) -> int:
+        return ((bucket // self._sample_interval) % self._max_points) * _SLOT.size
+
     def _maybe_prune_rate_limit_cache(self, current_bucket: int) -> None:
         """Prune stale entries from rate-limit cache to prevent unbounded growth."""
         # Force prune if cache exceeds hard limit
@@ -70,111 +114,105 @@ class SparklineDataService:
             for key, _ in sorted_entries[:excess]:
                 del self._last_sampled[key]
 
-    async def record_positions(self, user_id: str, positions: list[dict[str, Any]]) -> None:
-        """Record P&L snapshots for all positions (rate-limited per symbol)."""
-        if not user_id:
-            return
+    async def record_positions(self, positions: list[dict[str, Any]]) -> None:
+        """Record mark prices for all positions (once per symbol and interval)."""
         for position in positions:
             symbol = str(position.get("symbol", "")).strip()
             if not symbol:
                 continue
-            pnl_raw = position.get("unrealized_pl")
-            if pnl_raw is None:
-                continue
-            try:
-                pnl_value = float(pnl_raw)
-            except (TypeError, ValueError):
+            price = _mark_price(position)
+            if price is None:
                 continue
-            await self.record_point(user_id, symbol, pnl_value)
+            await self.record_price(symbol, price)
 
-    async def record_point(self, user_id: str, symbol: str, pnl_value: float) -> None:
-        """Record a single P&L data point if rate limit allows."""
-        # Reject NaN/inf to prevent invalid ZSET entries and SVG rendering issues
-        if not math.isfinite(pnl_value):
+    async def record_price(self, symbol: str, price: float) -> None:
+        """Write a mark price into the symbol's ring if this bucket is unsampled."""
+        # Reject NaN/inf and non-positive marks; a zero price marks an empty slot
+        if not math.isfinite(price) or price <= 0:
             logger.debug(
-                "sparkline_invalid_pnl_skipped",
-                extra={"user_id": user_id, "symbol": symbol, "value": str(pnl_value)},
+                "sparkline_invalid_price_skipped",
+                extra={"symbol": symbol, "value": str(price)},
             )
             return
 
         bucket = self._current_bucket()
-        sample_key = (user_id, symbol)
-        if self._last_sampled.get(sample_key) == bucket:
+        if self._last_sampled.get(symbol) == bucket:
             return
 
         # Prune BEFORE inserting to prevent brief spikes above max_cache_entries
         self._maybe_prune_rate_limit_cache(bucket)
-        self._last_sampled[sample_key] = bucket
+        self._last_sampled[symbol] = bucket
 
-        key = self._key(user_id, symbol)
-        member = f"{bucket}:{pnl_value}"
+        key = self._key(symbol)
         try:
-            await self._redis.zadd(key, {member: bucket})
-            size = await self._redis.zcard(key)
-            if size > self._max_points:
-                await self._redis.zremrangebyrank(key, 0, -(self._max_points + 1))
-            await self._redis.expire(key, self._ttl_seconds)
+            # Slot position is derived from the bucket, so concurrent writers
+            # for the same interval overwrite the same slot (idempotent).
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.setrange(key, self._slot_offset(bucket), _SLOT.pack(bucket, price))
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
         except RedisError as exc:
             logger.warning(
                 "sparkline_record_failed",
-                extra={"user_id": user_id, "symbol": symbol, "error": type(exc).__name__},
+                extra={"symbol": symbol, "error": type(exc).__name__},
             )
 
-    async def get_sparkline_data(self, user_id: str, symbol: str) -> list[float]:
-        """Fetch sparkline data for a symbol (chronological)."""
-        key = self._key(user_id, symbol)
+    async def get_price_history(self, symbols: list[str]) -> dict[str, list[float]]:
+        """Fetch chronological mark prices for many symbols in one round trip."""
+        valid_symbols = list(dict.fromkeys(s for s in symbols if s))
+        if not valid_symbols:
+            return {}
         try:
-            members = await self._redis.zrange(key, 0, -1)
+            raw_rings = await self._redis.mget([self._key(s) for s in valid_symbols])
         except RedisError as exc:
             logger.warning(
                 "sparkline_fetch_failed",
-                extra={"user_id": user_id, "symbol": symbol, "error": type(exc).__name__},
+                extra={"symbols": len(valid_symbols), "error": type(exc).__name__},
             )
-            return []
-        return self._parse_members(members)
+            return {symbol: [] for symbol in valid_symbols}
 
-    async def get_sparkline_map(self, user_id: str, symbols: list[str]) -> dict[str, list[float]]:
-        """Fetch sparkline data for multiple symbols in parallel."""
-        valid_symbols = [s for s in symbols if s]
-        if not valid_symbols:
-            return {}
+        oldest = self._current_bucket() - self._max_points * self._sample_interval
+        return {
+            symbol: self._unpack_ring(raw, oldest)
+            for symbol, raw in zip(valid_symbols, raw_rings, strict=True)
+        }
+
+    async def get_sparkline_map(self, positions: list[dict[str, Any]]) -> dict[str, list[float]]:
+        """Return each position's P&L history, scaled from the shared marks.
 
-        # Fetch all symbols in parallel to avoid N sequential Redis round-trips
-        tasks = [self.get_sparkline_data(user_id, symbol) for symbol in valid_symbols]
-        data_list = await asyncio.gather(*tasks, return_exceptions=True)
+        The history reflects the position's current size and entry price
+        applied to recent marks (what the position would have shown over
+        the window).
+        """
+        symbols = [str(p.get("symbol", "")).strip() for p in positions]
+        prices = await self.get_price_history(symbols)
 
         results: dict[str, list[float]] = {}
-        for symbol, data in zip(valid_symbols, data_list, strict=True):
-            if isinstance(data, BaseException):
-                logger.warning(
-                    "sparkline_parallel_fetch_failed",
-                    extra={"user_id": user_id, "symbol": symbol, "error": type(data).__name__},
-                )
+        for symbol, position in zip(symbols, positions, strict=True):
+            if not symbol:
+                continue
+            qty = _coerce_finite(position.get("qty"))
+            avg_entry = _coerce_finite(position.get("avg_entry_price"))
+            if qty is None or avg_entry is None:
                 results[symbol] = []
-            else:
-                results[symbol] = data
+                continue
+            results[symbol] = [qty * (price - avg_entry) for price in prices.get(symbol, [])]
         return results
 
     @staticmethod
-    def _parse_members(members: list[Any]) -> list[float]:
-        data: list[float] = []
-        for member in members:
-            if isinstance(member, bytes):
-                member_str = member.decode("utf-8", errors="ignore")
-            else:
-                member_str = str(member)
-            if ":" in member_str:
-                _, value_str = member_str.split(":", 1)
-            else:
-                value_str = member_str
-            try:
-                val = float(value_str)
-                # Filter out NaN/inf that might be stored in Redis
-                if math.isfinite(val):
-                    data.append(val)
-            except ValueError:
-                continue
-        return data
+    def _unpack_ring(raw: bytes | str | None, oldest_bucket: int) -> list[float]:
+        """Decode a ring into chronological prices newer than ``oldest_bucket``."""
+        if not raw or not isinstance(raw, bytes):
+            return []
+        usable = len(raw) - len(raw) % _SLOT.size
+        samples = [
+            (bucket, price)
+            for bucket, price in _SLOT.iter_unpack(raw[:usable])
+            # Zero-filled slots were never written
+            if bucket > oldest_bucket and price > 0 and math.isfinite(price)
+        ]
+        samples.sort()
+        return [price for _, price in samples]
 
 
 __all__ = ["SparklineDataService"]
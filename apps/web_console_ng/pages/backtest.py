@@ -18,9 +18,11 @@ import math
 import os
 import re
 import time
+from collections.abc import Awaitable, Callable
 from datetime import date, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal, cast
 from weakref import WeakKeyDictionary
 
 import plotly.graph_objects as go
@@ -55,6 +57,11 @@ from apps.web_console_ng.components.config_editor import (
     form_state_to_json,
     render_config_editor,
 )
+from apps.web_console_ng.core.admission import (
+    ROUTE_CLASS_HEAVY,
+    AdmissionRejectedError,
+    admission_slot,
+)
 from apps.web_console_ng.core.client_lifecycle import ClientLifecycleManager
 from apps.web_console_ng.core.dependencies import get_sync_db_pool
 from apps.web_console_ng.core.redis_ha import get_redis_store
@@ -71,6 +78,7 @@ if TYPE_CHECKING:
     from redis import Redis
 
     from libs.trading.backtest.job_queue import BacktestJobQueue
+    from libs.web_console_services.backtest_analytics_service import BacktestAnalyticsService
 
 logger = logging.getLogger(__name__)
 _LEGACY_SCHEMA_WARNING_EMITTED = False
@@ -84,6 +92,13 @@ class _SchemaProbeUnavailableError(Exception):
 
 # Constants
 BACKTEST_JOB_QUERY_LIMIT = 50
+# Result charts are downsampled server-side to the client width (clamped)
+RESULT_CHART_DEFAULT_WIDTH_PX = 1200
+RESULT_CHART_MIN_WIDTH_PX = 320
+RESULT_CHART_MAX_WIDTH_PX = 3840
+RESULT_TAB_PERFORMANCE = "Performance"
+RESULT_TAB_IC = "IC"
+RESULT_TAB_SIGNALS = "Signals & Trades"
 MAX_COMPARISON_SELECTIONS = 5
 DEFAULT_END_DATE_OFFSET_DAYS = 1
 DEFAULT_BACKTEST_PERIOD_DAYS = 730  # ~2 years
@@ -1521,17 +1536,24 @@ async def _render_backtest_results(
                                 )
                                 storage = BacktestResultStorage(db_pool)
                                 service = BacktestAnalyticsService(data_access, storage)
-                                result = await service.get_backtest_result(job_id)
-                                _render_backtest_result(result, user)
+                                # Result decodes count against the per-user heavy budget
+                                async with admission_slot(ROUTE_CLASS_HEAVY, _get_user_id(user)):
+                                    overview = await service.get_result_overview(job_id)
+                                await _render_lazy_backtest_result(service, job_id, overview, user)
                                 # Live vs Backtest Overlay (T12.3)
                                 await _render_live_overlay_section(
-                                    result,
+                                    overview,
                                     job_id,
                                     user,
                                     db_pool,
                                 )
                             except PermissionError:
                                 ui.notify("Result not found or access denied", type="negative")
+                            except AdmissionRejectedError:
+                                ui.notify(
+                                    "Server is busy with other heavy work. Try again shortly.",
+                                    type="warning",
+                                )
                             except (JobNotFound, ResultPathMissing):
                                 ui.notify(
                                     "Result artifacts missing for this job. Rerun the backtest.",
@@ -1972,17 +1994,22 @@ def _render_export_buttons(
     cost_summary: dict[str, Any] | None,
     cost_config: dict[str, Any] | None,
     capacity_analysis: dict[str, Any] | None,
+    returns_loader: (
+        Callable[[], Awaitable[tuple[pl.DataFrame | None, pl.DataFrame | None]]] | None
+    ) = None,
 ) -> None:
     """Render export buttons for backtest results.
 
     Extracts export functionality into a focused helper for better modularity.
 
     Args:
-        result: Backtest result object
+        result: Backtest result object (or overview when ``returns_loader`` is set)
         user: Current user info
         cost_summary: Cost summary dict if available
         cost_config: Cost config dict if available
         capacity_analysis: Capacity analysis dict if available
+        returns_loader: Loads ``(net, gross)`` portfolio returns on click
+            instead of reading them from ``result``
     """
     if not has_permission(user, Permission.EXPORT_DATA):
         ui.label("Export requires EXPORT_DATA permission (Operator or Admin role)").classes(
@@ -2006,8 +2033,9 @@ def _render_export_buttons(
         "n_days": result.n_days,
         "n_symbols_avg": result.n_symbols_avg,
     }
-    if result.turnover_result:
-        metrics_dict["average_turnover"] = result.turnover_result.average_turnover
+    average_turnover = _average_turnover(result)
+    if average_turnover is not None:
+        metrics_dict["average_turnover"] = average_turnover
 
     # Add cost data to metrics if available (T9.4)
     if cost_summary:
@@ -2025,19 +2053,25 @@ def _render_export_buttons(
             filename=f"metrics_{result.backtest_id}.json",
         )
 
+    async def load_returns() -> tuple[pl.DataFrame | None, pl.DataFrame | None]:
+        if returns_loader is not None:
+            return await returns_loader()
+        return (
+            getattr(result, "net_portfolio_returns", None),
+            getattr(result, "daily_portfolio_returns", None),
+        )
+
     # Daily returns CSV export (T9.4)
-    def download_returns_csv() -> None:
+    async def download_returns_csv() -> None:
         """Export daily portfolio returns as CSV."""
-        df_to_export = None
-        if hasattr(result, "net_portfolio_returns") and result.net_portfolio_returns is not None:
-            # Prefer net returns DataFrame as it contains gross, cost, and net.
-            df_to_export = result.net_portfolio_returns
-        elif (
-            hasattr(result, "daily_portfolio_returns")
-            and result.daily_portfolio_returns is not None
-        ):
-            # Fallback to gross returns if net is not available.
-            df_to_export = result.daily_portfolio_returns
+        try:
+            net_returns, gross_returns = await load_returns()
+        except AdmissionRejectedError:
+            ui.notify("Server is busy with other heavy work. Try again shortly.", type="warning")
+            return
+        # Prefer net returns DataFrame as it contains gross, cost, and net;
+        # fall back to gross returns if net is not available.
+        df_to_export = net_returns if net_returns is not None else gross_returns
 
         if df_to_export is None:
             ui.notify("No daily returns data available", type="warning")
@@ -2074,8 +2108,8 @@ def _render_export_buttons(
             "snapshot_id": result.snapshot_id,
         }
 
-        if result.turnover_result:
-            summary_dict["results"]["average_turnover"] = result.turnover_result.average_turnover
+        if average_turnover is not None:
+            summary_dict["results"]["average_turnover"] = average_turnover
 
         # Add cost analysis data if available (T9.4)
         if cost_config:
@@ -2105,16 +2139,21 @@ def _render_export_buttons(
         )
 
     # Net returns Parquet export (T9.4)
-    def download_net_returns_parquet() -> None:
+    async def download_net_returns_parquet() -> None:
         """Export net portfolio returns as Parquet file."""
-        if not hasattr(result, "net_portfolio_returns") or result.net_portfolio_returns is None:
+        try:
+            net_returns, _ = await load_returns()
+        except AdmissionRejectedError:
+            ui.notify("Server is busy with other heavy work. Try again shortly.", type="warning")
+            return
+        if net_returns is None:
             ui.notify("No net returns data available (cost model not applied)", type="warning")
             return
 
         import io
 
         buffer = io.BytesIO()
-        result.net_portfolio_returns.write_parquet(buffer)
+        net_returns.write_parquet(buffer)
         buffer.seek(0)
         ui.download(
             buffer.getvalue(),
@@ -2126,7 +2165,9 @@ def _render_export_buttons(
         ui.button("Download Returns CSV", on_click=download_returns_csv)
         ui.button("Download Full Summary", on_click=download_full_summary)
         # Only show Parquet button if net returns available
-        if hasattr(result, "net_portfolio_returns") and result.net_portfolio_returns is not None:
+        if getattr(result, "net_portfolio_returns", None) is not None or getattr(
+            result, "has_net_returns", False
+        ):
             ui.button("Download Net Returns Parquet", on_click=download_net_returns_parquet)
 
 
@@ -2229,8 +2270,155 @@ def _backtest_provenance_lines(result: Any) -> list[str]:
     return lines
 
 
+def _average_turnover(result: Any) -> float | None:
+    """Average turnover from a full BacktestResult or a result overview."""
+    turnover_result = getattr(result, "turnover_result", None)
+    if turnover_result is not None:
+        return cast(float | None, turnover_result.average_turnover)
+    return cast(float | None, getattr(result, "average_turnover", None))
+
+
 def _render_backtest_result(result: Any, user: dict[str, Any]) -> None:
     """Render complete backtest result with metrics and charts."""
+    _render_backtest_summary(result, user)
+
+    cost_summary = getattr(result, "cost_summary", None)
+    cost_config = getattr(result, "cost_config", None)
+    capacity_analysis = getattr(result, "capacity_analysis", None)
+
+    # Render Yahoo Finance-specific details (universe, signals, charts, trades)
+    _render_yahoo_backtest_details(result, user)
+
+    # Export buttons (delegated to helper for modularity)
+    _render_export_buttons(result, user, cost_summary, cost_config, capacity_analysis)
+
+
+async def _chart_width_px() -> int:
+    """Return the client viewport width used to downsample result charts."""
+    try:
+        width = await ui.run_javascript("document.documentElement.clientWidth", timeout=2.0)
+        return max(RESULT_CHART_MIN_WIDTH_PX, min(int(width), RESULT_CHART_MAX_WIDTH_PX))
+    except (TimeoutError, RuntimeError, TypeError, ValueError):
+        return RESULT_CHART_DEFAULT_WIDTH_PX
+
+
+def _render_result_series_chart(
+    series: pl.DataFrame | None, column: str, title: str, *, percent: bool
+) -> None:
+    """Render a pre-downsampled ``{date, column}`` series as a line chart."""
+    if series is None or series.is_empty() or column not in series.columns:
+        ui.label(f"No data available for {title.lower()}.").classes("text-gray-500")
+        return
+    values = series[column] * 100 if percent else series[column]
+    fig = go.Figure(
+        go.Scatter(x=series["date"].to_list(), y=values.to_list(), mode="lines", name=title)
+    )
+    fig.update_layout(
+        title=title,
+        yaxis_title="%" if percent else None,
+        margin={"l": 20, "r": 20, "t": 40, "b": 20},
+        height=320,
+    )
+    ui.plotly(fig).classes("w-full")
+
+
+async def _render_lazy_backtest_result(
+    service: BacktestAnalyticsService,
+    job_id: str,
+    overview: Any,
+    user: dict[str, Any],
+) -> None:
+    """Render a result whose artifacts are decoded only for the tab in view.
+
+    The header comes from the artifact-free overview. Chart tabs fetch series
+    already downsampled to the client width; the signals tab and the exports
+    load just the artifacts they need, on first use. Every load runs inside
+    the user's heavy admission slot.
+    """
+    _render_backtest_summary(overview, user)
+    user_key = _get_user_id(user)
+
+    width_px = await _chart_width_px()
+    basis: Literal["net", "gross"] = "net" if overview.has_net_returns else "gross"
+    tab_names = (RESULT_TAB_PERFORMANCE, RESULT_TAB_IC, RESULT_TAB_SIGNALS)
+    containers: dict[str, Any] = {}
+    loaded: set[str] = set()
+
+    ui.separator().classes("my-4")
+    with ui.tabs().classes("w-full") as tabs:
+        for name in tab_names:
+            ui.tab(name)
+    with ui.tab_panels(tabs, value=RESULT_TAB_PERFORMANCE).classes("w-full"):
+        for name in tab_names:
+            with ui.tab_panel(name):
+                containers[name] = ui.column().classes("w-full")
+
+    async def load_tab(name: str) -> None:
+        if name in loaded or name not in containers:
+            return
+        loaded.add(name)
+        try:
+            if name == RESULT_TAB_PERFORMANCE:
+                async with admission_slot(ROUTE_CLASS_HEAVY, user_key):
+                    equity = await service.get_chart_series(job_id, "equity", width_px, basis)
+                    drawdown = await service.get_chart_series(
+                        job_id, "drawdown", width_px, basis
+                    )
+                with containers[name]:
+                    _render_result_series_chart(
+                        equity, "cumulative_return", "Cumulative Return", percent=True
+                    )
+                    _render_result_series_chart(drawdown, "drawdown", "Drawdown", percent=True)
+            elif name == RESULT_TAB_IC:
+                async with admission_slot(ROUTE_CLASS_HEAVY, user_key):
+                    ic = await service.get_chart_series(job_id, "ic", width_px)
+                column = "rank_ic" if ic is not None and "rank_ic" in ic.columns else "ic"
+                with containers[name]:
+                    _render_result_series_chart(ic, column, "Daily IC", percent=False)
+            else:
+                frames: dict[str, pl.DataFrame | None] = {}
+                async with admission_slot(ROUTE_CLASS_HEAVY, user_key):
+                    for tab in ("signals", "holdings", "prices"):
+                        frames.update(await service.get_result_tab(job_id, tab))
+                with containers[name]:
+                    _render_yahoo_backtest_details(
+                        SimpleNamespace(backtest_id=overview.backtest_id, **frames), user
+                    )
+        except AdmissionRejectedError:
+            loaded.discard(name)
+            ui.notify("Server is busy with other heavy work. Try again shortly.", type="warning")
+        except (ValueError, KeyError, OSError) as e:
+            loaded.discard(name)
+            logger.error(
+                "result_tab_load_failed",
+                extra={"job_id": job_id, "tab": name, "error": str(e)},
+                exc_info=True,
+            )
+            ui.notify(f"Failed to load {name} data", type="negative")
+
+    async def on_tab_change(e: Any) -> None:
+        await load_tab(str(e.value))
+
+    tabs.on_value_change(on_tab_change)
+    await load_tab(RESULT_TAB_PERFORMANCE)
+
+    async def load_returns() -> tuple[pl.DataFrame | None, pl.DataFrame | None]:
+        async with admission_slot(ROUTE_CLASS_HEAVY, user_key):
+            frames = await service.get_result_tab(job_id, "performance")
+        return frames.get("net_portfolio_returns"), frames.get("daily_portfolio_returns")
+
+    _render_export_buttons(
+        overview,
+        user,
+        overview.cost_summary,
+        overview.cost_config,
+        overview.capacity_analysis,
+        returns_loader=load_returns,
+    )
+
+
+def _render_backtest_summary(result: Any, user: dict[str, Any]) -> None:
+    """Render the result header, metric cards and cost analysis."""
 
     # Header
     ui.label(f"Backtest: {result.alpha_name}").classes("text-xl font-bold")
@@ -2273,7 +2461,7 @@ def _render_backtest_result(result: Any, user: dict[str, Any]) -> None:
             ui.label("Coverage").classes("text-sm text-gray-500")
             ui.label(_fmt_pct(result.coverage, "{:.1f}%")).classes("text-lg font-bold")
         with ui.card().classes("flex-1 p-3 text-center"):
-            turnover = result.turnover_result.average_turnover if result.turnover_result else None
+            turnover = _average_turnover(result)
             ui.label("Avg Turnover").classes("text-sm text-gray-500")
             ui.label(_fmt_pct(turnover, "{:.2f}%")).classes("text-lg font-bold")
 
@@ -2390,12 +2578,6 @@ def _render_backtest_result(result: Any, user: dict[str, Any]) -> None:
             ui.label("Cost Analysis").classes("text-lg font-bold")
             ui.label("Cost data unavailable for this backtest.").classes("text-sm text-amber-500")
 
-    # Render Yahoo Finance-specific details (universe, signals, charts, trades)
-    _render_yahoo_backtest_details(result, user)
-
-    # Export buttons (delegated to helper for modularity)
-    _render_export_buttons(result, user, cost_summary, cost_config, capacity_analysis)
-
 
 def _render_comparison_table(results: list[Any]) -> None:
     """Render side-by-side comparison of multiple backtests."""
@@ -257,6 +257,7 @@ async def _fetch_comparison_data(
     """Fetch comparison data using ComparisonService."""
     from libs.web_console_data.strategy_scoped_queries import StrategyScopedDataAccess
     from libs.web_console_services.comparison_service import ComparisonService
+    from libs.web_console_services.returns_cube import get_returns_cube
 
     # Create scoped access
     scoped_access = StrategyScopedDataAccess(
@@ -265,7 +266,8 @@ async def _fetch_comparison_data(
         user=dict(user),
     )
 
-    comparison_service = ComparisonService(scoped_access)
+    # Shared cube: re-running a comparison only fetches P&L the cube lacks
+    comparison_service = ComparisonService(scoped_access, cube=get_returns_cube())
 
     # Fetch data (this is async)
     data = await comparison_service.get_comparison_data(strategy_ids, date_from, date_to)
@@ -71,6 +71,10 @@ from apps.web_console_ng.components.tabbed_panel import (
     filter_items_by_symbol,
     filter_working_orders,
 )
+from apps.web_console_ng.core.admission import (
+    ROUTE_CLASS_SAFETY,
+    admission_slot,
+)
 from apps.web_console_ng.core.audit import audit_log
 from apps.web_console_ng.core.client import AsyncTradingClient
 from apps.web_console_ng.core.client_lifecycle import ClientLifecycleManager
@@ -800,7 +804,10 @@ async def dashboard(client: Client) -> None:
     # Create dependencies for OrderEntryContext
     redis_store = get_redis_store()
     redis_client = await redis_store.get_master()
-    sparkline_service = SparklineDataService(redis_client)
+    # Sparkline rings are binary-packed, so they need a non-decoding client
+    sparkline_service = SparklineDataService(
+        redis_store.get_master_client(decode_responses=False)
+    )
     async_pool = get_db_pool()
     state_manager = UserStateManager(
         user_id=user_id,
@@ -1577,8 +1584,7 @@ async def dashboard(client: Client) -> None:
     ) -> list[dict[str, Any]]:
         if not positions:
             return []
-        symbols = [str(item.get("symbol", "")).strip() for item in positions if item.get("symbol")]
-        sparkline_map = await sparkline_service.get_sparkline_map(user_id, symbols)
+        sparkline_map = await sparkline_service.get_sparkline_map(positions)
         enriched: list[dict[str, Any]] = []
         for position in positions:
             position_copy = dict(position)
@@ -1766,7 +1772,7 @@ async def dashboard(client: Client) -> None:
         positions_snapshot = list(positions.get("positions", []))
         positions_card.update(len(positions_snapshot))
         orders_snapshot = list(orders.get("orders", []))
-        await sparkline_service.record_positions(user_id, positions_snapshot)
+        await sparkline_service.record_positions(positions_snapshot)
 
         fills_snapshot = []
         if isinstance(recent_trades, list):
@@ -2029,15 +2035,16 @@ async def dashboard(client: Client) -> None:
                     reason = build_cancel_all_orders_reason(symbol)
 
                     try:
-                        result = await trading_client.cancel_all_orders(
-                            symbol=symbol,
-                            reason=reason,
-                            requested_by=user_id,
-                            requested_at=requested_at,
-                            user_id=user_id,
-                            role=user_role,
-                            strategies=user_strategies,
-                        )
+                        async with admission_slot(ROUTE_CLASS_SAFETY):
+                            result = await trading_client.cancel_all_orders(
+                                symbol=symbol,
+                                reason=reason,
+                                requested_by=user_id,
+                                requested_at=requested_at,
+                                user_id=user_id,
+                                role=user_role,
+                                strategies=user_strategies,
+                            )
                         cancelled_count = max(0, _coerce_int(result.get("cancelled_count"), 0))
                         ui.notify(
                             f"Cancelled {cancelled_count} order(s) for {symbol}",
@@ -2207,15 +2214,16 @@ async def dashboard(client: Client) -> None:
                     )
 
                     try:
-                        result = await trading_client.flatten_all_positions(
-                            reason=reason,
-                            requested_by=user_id,
-                            requested_at=requested_at,
-                            id_token=str(id_token),
-                            user_id=user_id,
-                            role=user_role,
-                            strategies=user_strategies,
-                        )
+                        async with admission_slot(ROUTE_CLASS_SAFETY):
+                            result = await trading_client.flatten_all_positions(
+                                reason=reason,
+                                requested_by=user_id,
+                                requested_at=requested_at,
+                                id_token=str(id_token),
+                                user_id=user_id,
+                                role=user_role,
+                                strategies=user_strategies,
+                            )
                         positions_closed = max(0, _coerce_int(result.get("positions_closed"), 0))
                         ui.notify(
                             f"Flattened {positions_closed} position(s)",
@@ -2316,7 +2324,7 @@ async def dashboard(client: Client) -> None:
         if "positions" in data:
             positions_snapshot = list(data["positions"])
             positions_card.update(len(positions_snapshot))
-            await sparkline_service.record_positions(user_id, positions_snapshot)
+            await sparkline_service.record_positions(positions_snapshot)
             _update_filter_options()
             if tabbed_panel is not None:
                 tabbed_panel.set_badge_count(TAB_POSITIONS, len(positions_snapshot))
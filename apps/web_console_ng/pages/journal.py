@@ -27,6 +27,11 @@ from nicegui import run, ui
 
 from apps.web_console_ng.auth.middleware import get_current_user, requires_auth
 from apps.web_console_ng.config import FEATURE_TRADE_JOURNAL
+from apps.web_console_ng.core.admission import (
+    ROUTE_CLASS_HEAVY,
+    AdmissionRejectedError,
+    admission_slot,
+)
 from apps.web_console_ng.core.database import get_db_pool
 from apps.web_console_ng.ui.layout import main_layout
 from libs.platform.web_console_auth.permissions import (
@@ -114,6 +119,9 @@ async def _render_trade_journal(
     # State with explicit typing
     state: dict[str, Any] = {
         "page": 0,
+        # Keyset cursor for each visited page (page 0 starts from the newest trade)
+        "cursors": [None],
+        "next_cursor": None,
         "page_size": DEFAULT_PAGE_SIZE,
         "date_preset": "30 Days",
         "start_date": date.today() - timedelta(days=30),
@@ -241,10 +249,12 @@ async def _render_trade_journal(
         side_choice = side_select.value
         side_filter = None if side_choice == "All" else side_choice
         page_size = min(int(page_size_select.value), MAX_PAGE_SIZE)
-        offset = state["page"] * page_size
 
         # Import data access
-        from libs.web_console_data.strategy_scoped_queries import StrategyScopedDataAccess
+        from libs.web_console_data.strategy_scoped_queries import (
+            StrategyScopedDataAccess,
+            next_page_cursor,
+        )
 
         data_access = StrategyScopedDataAccess(db_pool, None, user)
 
@@ -315,12 +325,13 @@ async def _render_trade_journal(
         try:
             trades = await data_access.get_trades(
                 limit=page_size,
-                offset=offset,
                 date_from=start_date,
                 date_to=end_date + timedelta(days=1),
+                cursor=state["cursors"][state["page"]],
                 symbol=symbol_filter,
                 side=side_filter,
             )
+            state["next_cursor"] = next_page_cursor("trades", trades, page_size)
 
             trades_container.clear()
             with trades_container:
@@ -340,7 +351,7 @@ async def _render_trade_journal(
                     "Next",
                     icon="chevron_right",
                     on_click=lambda: next_page(),
-                ).props(f"{'disable' if len(trades) < page_size else ''}")
+                ).props(f"{'disable' if state['next_cursor'] is None else ''}")
 
         except PermissionError as exc:
             logger.warning(
@@ -395,11 +406,16 @@ async def _render_trade_journal(
             await load_data()
 
     async def next_page() -> None:
+        if state["next_cursor"] is None:
+            return
+        state["cursors"] = [*state["cursors"][: state["page"] + 1], state["next_cursor"]]
         state["page"] += 1
         await load_data()
 
     def reset_pagination() -> None:
         state["page"] = 0
+        state["cursors"] = [None]
+        state["next_cursor"] = None
 
     # Connect search button
     async def on_search() -> None:
@@ -553,12 +569,16 @@ async def _do_export(
     try:
         ui.notify(f"Exporting to {export_type.upper()}...", type="info")
 
-        if export_type == "csv":
-            content, row_count = await _export_csv(data_access, start_date, end_date, filters)
-            filename = f"trades_{start_date}_{end_date}.csv"
-        else:
-            content, row_count = await _export_excel(data_access, start_date, end_date, filters)
-            filename = f"trades_{start_date}_{end_date}.xlsx"
+        # Streaming the full trade history is heavy work, capped per user
+        async with admission_slot(ROUTE_CLASS_HEAVY, str(user_id)):
+            if export_type == "csv":
+                content, row_count = await _export_csv(data_access, start_date, end_date, filters)
+                filename = f"trades_{start_date}_{end_date}.csv"
+            else:
+                content, row_count = await _export_excel(
+                    data_access, start_date, end_date, filters
+                )
+                filename = f"trades_{start_date}_{end_date}.xlsx"
 
         # Audit log
         try:
@@ -605,6 +625,8 @@ async def _do_export(
         ui.download(content, filename)
         ui.notify(f"Exported {row_count} trades to {export_type.upper()}", type="positive")
 
+    except AdmissionRejectedError:
+        ui.notify("Server is busy with other exports. Try again shortly.", type="warning")
     except (ConnectionError, OSError) as exc:
         logger.error(
             "trade_export_db_connection_failed",
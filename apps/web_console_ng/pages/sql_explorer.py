@@ -11,6 +11,11 @@ import polars as pl
 from nicegui import ui
 
 from apps.web_console_ng.auth.middleware import get_current_user, requires_auth
+from apps.web_console_ng.core.admission import (
+    ROUTE_CLASS_HEAVY,
+    AdmissionRejectedError,
+    admission_slot,
+)
 from apps.web_console_ng.core.redis_ha import get_redis_store
 from apps.web_console_ng.core.request_query import get_request_query_param
 from apps.web_console_ng.ui.layout import main_layout
@@ -369,14 +374,16 @@ async def sql_explorer_page() -> None:
         status_label.text = "Running..."
 
         try:
-            result = await service.execute_query(
-                user=user,
-                dataset=dataset,
-                query=query,
-                timeout_seconds=timeout,
-                max_rows=max_rows,
-                available_tables=available_tables,
-            )
+            # Pod-wide heavy-analytics budget, capped per user
+            async with admission_slot(ROUTE_CLASS_HEAVY, str(user.get("user_id") or "")):
+                result = await service.execute_query(
+                    user=user,
+                    dataset=dataset,
+                    query=query,
+                    timeout_seconds=timeout,
+                    max_rows=max_rows,
+                    available_tables=available_tables,
+                )
 
             cell_count = len(result.df) * len(result.df.columns)
             if cell_count > _LARGE_RESULT_THRESHOLD:
@@ -422,6 +429,10 @@ async def sql_explorer_page() -> None:
             ui.notify(str(exc), type="warning")
             status_label.text = "Too many concurrent queries"
             _add_history("<concurrency_limited>", dataset, "concurrency_limited", 0)
+        except AdmissionRejectedError:
+            ui.notify("Server is busy with other heavy queries. Try again shortly.", type="warning")
+            status_label.text = "Server busy"
+            _add_history("<concurrency_limited>", dataset, "concurrency_limited", 0)
         except RuntimeError as exc:
             logger.warning("sql_query_runtime_error", extra={"dataset": dataset, "error": str(exc)})
             ui.notify("Query could not be executed. Please try again later.", type="warning")
@@ -720,6 +720,7 @@ def main_layout(page_func: AsyncPage) -> AsyncPage:
             for button in kill_switch_action_buttons:
                 button.disable()
             try:
+                # Never admission-controlled: the kill switch must not be rejected
                 if action == "ENGAGE":
                     await client.engage_kill_switch(
                         user_id,
@@ -0,0 +1,8 @@
+-- Support keyset (seek) pagination in the web console trade journal and order views.
+-- Index sort order matches the query ORDER BY (sort key DESC, unique tiebreaker DESC)
+-- so each page is a bounded index range scan regardless of depth.
+CREATE INDEX IF NOT EXISTS idx_trades_executed_trade
+  ON trades(executed_at DESC, trade_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_orders_created_client_order
+  ON orders(created_at DESC, client_order_id DESC);
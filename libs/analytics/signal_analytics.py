@@ -0,0 +1,389 @@
+"""Fused multi-horizon signal analytics kernel.
+
+Shared by:
+- ``AlphaMetricsAdapter.compute_decay_curve`` (alpha research decay curves)
+- ``QuantileAnalyzer.analyze`` (quantile tear sheets)
+- ``FactorAnalytics.compute_ic`` / ``analyze_decay`` (factor evaluation)
+
+The kernel works on long frames:
+
+- signals: ``[date, id, signal]`` (one row per date and security)
+- returns panel: ``[date, id, ret]`` (daily simple returns)
+
+Forward returns for every horizon are derived in a single windowed pass over
+the returns panel (cumulative log-return differences per security), and all
+per-date metrics - Pearson IC, rank IC, hit rate, quantile returns and the
+long/short spread - are produced for every ``(date, horizon)`` cell by one
+grouped aggregation. Signal and return ranks are computed once per cell and
+reused for both rank IC and quantile assignment.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import polars as pl
+
+# Returns are clamped here before taking log(1 + r) so that a -100% return
+# stays finite (log(0.0001) ~= -9.2) instead of poisoning the cumulative sum.
+RETURN_CLAMP_LOWER = -0.9999
+
+HORIZON_COL = "horizon"
+FORWARD_RETURN_COL = "forward_return"
+
+
+@dataclass
+class SignalAnalyticsResult:
+    """Result of :func:`analyze_signal`.
+
+    Attributes:
+        daily: Per-(group, date, horizon) metrics from
+            :func:`compute_signal_metrics`.
+        summary: Per-(group, horizon) aggregates from
+            :func:`summarize_signal_metrics`, sorted by horizon (the decay curve).
+    """
+
+    daily: pl.DataFrame
+    summary: pl.DataFrame
+
+
+def quantile_return_col(quantile: int) -> str:
+    """Column name holding the mean forward return of a quantile bucket."""
+    return f"q{quantile}_return"
+
+
+def quantile_count_col(quantile: int) -> str:
+    """Column name holding the observation count of a quantile bucket."""
+    return f"q{quantile}_count"
+
+
+def compute_forward_returns(
+    returns: pl.DataFrame,
+    horizons: Sequence[int],
+    *,
+    date_col: str = "date",
+    id_col: str = "permno",
+    return_col: str = "ret",
+    require_contiguous: bool = False,
+) -> pl.DataFrame:
+    """Compute forward compounded returns for all horizons in one pass.
+
+    For each row ``t`` of a security, the ``h``-day forward return is
+    ``prod(1 + r[t+1..t+h]) - 1`` over that security's next ``h`` rows. It is
+    evaluated as a difference of cumulative ``log(1 + r)`` sums, so every
+    horizon is a pair of shifts over the same window instead of a separate
+    rolling computation.
+
+    Windows containing a null/NaN return, or running past the end of the
+    security's history, produce no row (PIT-correct: only data strictly after
+    the signal date is used).
+
+    Args:
+        returns: Panel with ``date_col``, ``id_col`` and ``return_col``.
+        horizons: Forward horizons in rows (trading days), each > 0.
+        date_col: Date column name.
+        id_col: Security identifier column name.
+        return_col: Daily simple return column name.
+        require_contiguous: If True, a window is only valid when it spans
+            exactly ``h`` consecutive dates of the panel-wide calendar, i.e.
+            the security has no missing days inside the window.
+
+    Returns:
+        Long DataFrame ``[date_col, id_col, horizon, forward_return]``.
+
+    Raises:
+        ValueError: If any horizon is not positive.
+    """
+    horizon_list = sorted({int(h) for h in horizons})
+    if any(h <= 0 for h in horizon_list):
+        raise ValueError(f"horizons must be > 0, got {list(horizons)}")
+
+    schema = {
+        date_col: returns.schema[date_col] if date_col in returns.columns else pl.Date,
+        id_col: returns.schema[id_col] if id_col in returns.columns else pl.Int64,
+        HORIZON_COL: pl.Int64,
+        FORWARD_RETURN_COL: pl.Float64,
+    }
+    if not horizon_list or returns.height == 0:
+        return pl.DataFrame(schema=schema)
+
+    ret = pl.col(return_col).cast(pl.Float64)
+    is_valid = ret.is_not_null() & ret.is_not_nan()
+    log_ret = pl.when(is_valid).then((ret.clip(lower_bound=RETURN_CLAMP_LOWER) + 1.0).log())
+
+    lf = (
+        returns.lazy()
+        .select(date_col, id_col, return_col)
+        .sort([id_col, date_col])
+        .with_columns(
+            log_ret.fill_null(0.0).cum_sum().over(id_col).alias("_cum_log"),
+            is_valid.cast(pl.Int64).cum_sum().over(id_col).alias("_cum_valid"),
+        )
+    )
+
+    if require_contiguous:
+        calendar = (
+            returns.lazy()
+            .select(pl.col(date_col).unique().sort())
+            .with_row_index("_date_idx")
+            .with_columns(pl.col("_date_idx").cast(pl.Int64))
+        )
+        # The shifts below are positional within each security, so restore the
+        # (id, date) order explicitly rather than relying on the join keeping it.
+        lf = lf.join(calendar, on=date_col, how="left").sort([id_col, date_col])
+
+    forward_exprs = []
+    for h in horizon_list:
+        valid = (pl.col("_cum_valid").shift(-h).over(id_col) - pl.col("_cum_valid")) == h
+        if require_contiguous:
+            valid = valid & (
+                (pl.col("_date_idx").shift(-h).over(id_col) - pl.col("_date_idx")) == h
+            )
+        forward = (pl.col("_cum_log").shift(-h).over(id_col) - pl.col("_cum_log")).exp() - 1.0
+        forward_exprs.append(pl.when(valid).then(forward).alias(str(h)))
+
+    return (
+        lf.select(date_col, id_col, *forward_exprs)
+        .unpivot(
+            index=[date_col, id_col],
+            variable_name=HORIZON_COL,
+            value_name=FORWARD_RETURN_COL,
+        )
+        .drop_nulls(FORWARD_RETURN_COL)
+        .with_columns(pl.col(HORIZON_COL).cast(pl.Int64))
+        .select(list(schema))
+        .collect()
+    )
+
+
+def compute_signal_metrics(
+    signals: pl.DataFrame,
+    forward_returns: pl.DataFrame,
+    *,
+    n_quantiles: int = 5,
+    by: Sequence[str] = (),
+    date_col: str = "date",
+    id_col: str = "permno",
+    signal_col: str = "signal",
+    return_col: str = FORWARD_RETURN_COL,
+    drop_non_finite: bool = False,
+) -> pl.DataFrame:
+    """Compute per-date IC, hit rate and quantile metrics for every horizon.
+
+    Signals are inner-joined to the long forward-return frame, ranks are
+    computed once per ``(by..., date, horizon)`` cell with average tie-breaking,
+    and a single ``group_by`` produces every metric.
+
+    Quantiles follow ``ceil(rank / n * n_quantiles)`` clipped to
+    ``[1, n_quantiles]`` (1 = lowest signal).
+
+    Args:
+        signals: Frame with ``date_col``, ``id_col``, ``signal_col`` and any
+            ``by`` columns.
+        forward_returns: Long frame with ``date_col``, ``id_col``, ``horizon``
+            and ``return_col`` (see :func:`compute_forward_returns`).
+        n_quantiles: Number of quantile buckets (>= 2).
+        by: Extra grouping columns present on ``signals`` (e.g. factor_name).
+        date_col: Date column name.
+        id_col: Security identifier column name.
+        signal_col: Signal column name.
+        return_col: Forward return column name in ``forward_returns``.
+        drop_non_finite: If True, drop NaN/inf signal or return values before
+            ranking; otherwise only nulls are dropped and NaN propagates into
+            that cell's correlations.
+
+    Returns:
+        DataFrame with one row per ``(by..., date, horizon)`` and columns
+        ``n_obs``, ``pearson_ic``, ``rank_ic``, ``hit_rate``,
+        ``q{k}_return``/``q{k}_count`` for each quantile and
+        ``long_short_spread``.
+
+    Raises:
+        ValueError: If ``n_quantiles`` < 2.
+    """
+    if n_quantiles < 2:
+        raise ValueError(f"n_quantiles must be >= 2, got {n_quantiles}")
+
+    by_cols = list(by)
+    keys = [*by_cols, date_col, HORIZON_COL]
+
+    joined = (
+        signals.lazy()
+        .select(*by_cols, date_col, id_col, pl.col(signal_col).cast(pl.Float64).alias("_signal"))
+        .join(
+            forward_returns.lazy().select(
+                date_col,
+                id_col,
+                HORIZON_COL,
+                pl.col(return_col).cast(pl.Float64).alias("_return"),
+            ),
+            on=[date_col, id_col],
+            how="inner",
+        )
+        .drop_nulls(["_signal", "_return"])
+    )
+    if drop_non_finite:
+        joined = joined.filter(pl.col("_signal").is_finite() & pl.col("_return").is_finite())
+
+    n_obs = pl.len().over(keys)
+    ranked = joined.with_columns(
+        pl.col("_signal").rank(method="average").over(keys).alias("_signal_rank"),
+        pl.col("_return").rank(method="average").over(keys).alias("_return_rank"),
+    ).with_columns(
+        (pl.col("_signal_rank") / n_obs * n_quantiles)
+        .ceil()
+        .clip(1, n_quantiles)
+        .cast(pl.Int64)
+        .alias("_quantile"),
+    )
+
+    signal = pl.col("_signal")
+    ret = pl.col("_return")
+    non_zero = (signal != 0) & (ret != 0)
+    same_sign = ((signal > 0) & (ret > 0)) | ((signal < 0) & (ret < 0))
+    quantile = pl.col("_quantile")
+
+    quantile_aggs = []
+    for q in range(1, n_quantiles + 1):
+        quantile_aggs.append(ret.filter(quantile == q).mean().alias(quantile_return_col(q)))
+        quantile_aggs.append((quantile == q).sum().cast(pl.Int64).alias(quantile_count_col(q)))
+
+    return (
+        ranked.group_by(keys)
+        .agg(
+            pl.len().cast(pl.Int64).alias("n_obs"),
+            pl.corr("_signal", "_return").alias("pearson_ic"),
+            pl.corr("_signal_rank", "_return_rank").alias("rank_ic"),
+            (same_sign & non_zero).sum().alias("_hits"),
+            non_zero.sum().alias("_non_zero"),
+            *quantile_aggs,
+        )
+        .with_columns(
+            pl.when(pl.col("_non_zero") > 0)
+            .then(pl.col("_hits") / pl.col("_non_zero"))
+            .alias("hit_rate"),
+            (pl.col(quantile_return_col(n_quantiles)) - pl.col(quantile_return_col(1))).alias(
+                "long_short_spread"
+            ),
+        )
+        .drop("_hits", "_non_zero")
+        .sort(keys)
+        .collect()
+    )
+
+
+def summarize_signal_metrics(
+    daily: pl.DataFrame,
+    *,
+    by: Sequence[str] = (),
+    min_observations: int = 1,
+) -> pl.DataFrame:
+    """Aggregate per-date metrics into per-horizon statistics (the decay curve).
+
+    Dates with fewer than ``min_observations`` securities are excluded. NaN
+    per-date correlations (e.g. constant signals) are excluded from means.
+
+    Args:
+        daily: Output of :func:`compute_signal_metrics`.
+        by: Extra grouping columns used when computing ``daily``.
+        min_observations: Minimum securities per date for the date to count.
+
+    Returns:
+        DataFrame with one row per ``(by..., horizon)`` sorted by horizon:
+        ``n_periods``, ``ic_mean``, ``rank_ic_mean``, ``rank_ic_std``,
+        ``rank_ic_t_stat``, ``rank_ic_positive_pct``, ``hit_rate`` and
+        ``long_short_spread``.
+    """
+    keys = [*by, HORIZON_COL]
+    rank_ic = pl.col("rank_ic").filter(pl.col("rank_ic").is_not_nan())
+    pearson_ic = pl.col("pearson_ic").filter(pl.col("pearson_ic").is_not_nan())
+
+    return (
+        daily.lazy()
+        .filter(pl.col("n_obs") >= min_observations)
+        .group_by(keys)
+        .agg(
+            rank_ic.len().cast(pl.Int64).alias("n_periods"),
+            pearson_ic.mean().alias("ic_mean"),
+            rank_ic.mean().alias("rank_ic_mean"),
+            rank_ic.std(ddof=1).alias("rank_ic_std"),
+            ((rank_ic > 0).mean() * 100.0).alias("rank_ic_positive_pct"),
+            pl.col("hit_rate").drop_nans().mean().alias("hit_rate"),
+            pl.col("long_short_spread").drop_nans().mean().alias("long_short_spread"),
+        )
+        .with_columns(
+            pl.when(pl.col("rank_ic_std") > 0)
+            .then(pl.col("rank_ic_mean") / (pl.col("rank_ic_std") / pl.col("n_periods").sqrt()))
+            .otherwise(0.0)
+            .alias("rank_ic_t_stat")
+        )
+        .sort(keys)
+        .collect()
+    )
+
+
+def analyze_signal(
+    signals: pl.DataFrame,
+    returns: pl.DataFrame,
+    horizons: Sequence[int],
+    *,
+    n_quantiles: int = 5,
+    by: Sequence[str] = (),
+    min_observations: int = 1,
+    date_col: str = "date",
+    id_col: str = "permno",
+    signal_col: str = "signal",
+    return_col: str = "ret",
+    require_contiguous: bool = False,
+) -> SignalAnalyticsResult:
+    """Run the full kernel: forward returns, per-date metrics and decay summary.
+
+    Args:
+        signals: Long ``[date, id, signal]`` frame (plus ``by`` columns).
+        returns: Daily returns panel ``[date, id, ret]``.
+        horizons: Forward horizons in trading days.
+        n_quantiles: Number of quantile buckets.
+        by: Extra grouping columns present on ``signals``.
+        min_observations: Minimum securities per date in the summary.
+        date_col: Date column name.
+        id_col: Security identifier column name.
+        signal_col: Signal column name.
+        return_col: Daily return column name in ``returns``.
+        require_contiguous: See :func:`compute_forward_returns`.
+
+    Returns:
+        SignalAnalyticsResult with per-date metrics and the per-horizon summary.
+    """
+    forward_returns = compute_forward_returns(
+        returns,
+        horizons,
+        date_col=date_col,
+        id_col=id_col,
+        return_col=return_col,
+        require_contiguous=require_contiguous,
+    )
+    daily = compute_signal_metrics(
+        signals,
+        forward_returns,
+        n_quantiles=n_quantiles,
+        by=by,
+        date_col=date_col,
+        id_col=id_col,
+        signal_col=signal_col,
+    )
+    summary = summarize_signal_metrics(daily, by=by, min_observations=min_observations)
+    return SignalAnalyticsResult(daily=daily, summary=summary)
+
+
+__all__ = [
+    "FORWARD_RETURN_COL",
+    "HORIZON_COL",
+    "SignalAnalyticsResult",
+    "analyze_signal",
+    "compute_forward_returns",
+    "compute_signal_metrics",
+    "quantile_count_col",
+    "quantile_return_col",
+    "summarize_signal_metrics",
+]
@@ -0,0 +1,276 @@
+"""
+Consolidated columnar store for adjusted daily market data.
+
+The ETL pipeline writes one file per symbol per run date
+(``data/adjusted/YYYY-MM-DD/{SYMBOL}.parquet``). Signal-time readers that
+need a lookback window for many symbols would otherwise walk the whole
+tree and open thousands of tiny files. This module keeps the same rows in
+a handful of year partitions sorted by (symbol, date), with row-group
+statistics so a symbol/date filter is pushed down to a single scan.
+
+Layout:
+    {adjusted_dir}/_store/manifest.json         # partitions + available dates
+    {adjusted_dir}/_store/partitions/{year}.parquet
+
+The store lives inside the adjusted directory but below the ``*/*.parquet``
+depth and outside any ``YYYY-MM-DD`` directory, so existing per-date
+consumers never see its files.
+
+This module provides:
+- AdjustedStore: Incremental upsert + predicate-pushed scans
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = "_store"
+STORE_FORMAT_VERSION = 1
+
+# ~64k rows per row group keeps min/max symbol statistics selective
+ROW_GROUP_SIZE = 65_536
+
+_KEY_COLUMNS = ["symbol", "date"]
+
+
+class AdjustedStore:
+    """Year-partitioned, (symbol, date)-sorted Parquet store for adjusted data.
+
+    A single writer (the ETL run) upserts rows; later writes win for the
+    same (symbol, date). Partition files and the manifest are replaced
+    atomically, so concurrent readers see either the old or the new file.
+
+    Example:
+        store = AdjustedStore(Path("data/adjusted"))
+        store.upsert(adjusted_df)
+        window = store.scan(["AAPL", "MSFT"], date(2024, 1, 1), date(2024, 3, 31))
+    """
+
+    def __init__(self, adjusted_dir: Path | str) -> None:
+        """Initialize store rooted under an adjusted data directory.
+
+        Args:
+            adjusted_dir: Directory holding ``YYYY-MM-DD`` partitions
+                (e.g. ``data/adjusted``).
+        """
+        self.adjusted_dir = Path(adjusted_dir)
+        self.root = self.adjusted_dir / STORE_DIRNAME
+        self.partitions_dir = self.root / "partitions"
+        self.manifest_path = self.root / "manifest.json"
+
+    @property
+    def exists(self) -> bool:
+        """True once at least one upsert has published a manifest."""
+        return self.manifest_path.exists()
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def load_manifest(self) -> dict[str, Any]:
+        """Return the manifest (empty skeleton if the store does not exist)."""
+        if not self.exists:
+            return {"format_version": STORE_FORMAT_VERSION, "partitions": {}, "dates": []}
+        with open(self.manifest_path) as f:
+            manifest: dict[str, Any] = json.load(f)
+        return manifest
+
+    def available_dates(self) -> list[date]:
+        """Return sorted trading dates present in the store."""
+        return [date.fromisoformat(d) for d in self.load_manifest()["dates"]]
+
+    def scan(
+        self,
+        symbols: Sequence[str] | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> pl.LazyFrame | None:
+        """Lazily scan the store with symbol/date predicates pushed down.
+
+        Only year partitions overlapping the date range are opened; within
+        them Parquet row-group statistics skip non-matching symbols/dates.
+
+        Args:
+            symbols: Symbols to include (default: all).
+            start_date: Inclusive lower date bound (default: unbounded).
+            end_date: Inclusive upper date bound (default: unbounded).
+
+        Returns:
+            LazyFrame sorted by (symbol, date), or None if no partition
+            overlaps the range.
+        """
+        partitions = self.load_manifest()["partitions"]
+        paths = [
+            self.partitions_dir / entry["file"]
+            for year, entry in sorted(partitions.items())
+            if (start_date is None or int(year) >= start_date.year)
+            and (end_date is None or int(year) <= end_date.year)
+        ]
+        if not paths:
+            return None
+
+        lf = pl.scan_parquet(paths)
+        if symbols is not None:
+            lf = lf.filter(pl.col("symbol").is_in(list(symbols)))
+        if start_date is not None:
+            lf = lf.filter(pl.col("date") >= start_date)
+        if end_date is not None:
+            lf = lf.filter(pl.col("date") <= end_date)
+        return lf
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def upsert(self, df: pl.DataFrame) -> int:
+        """Merge rows into the store, replacing existing (symbol, date) rows.
+
+        Only the year partitions touched by ``df`` are rewritten.
+
+        Args:
+            df: Adjusted rows with at least ``symbol`` and ``date`` columns.
+
+        Returns:
+            Number of rows upserted.
+
+        Raises:
+            ValueError: If ``symbol`` or ``date`` columns are missing.
+        """
+        missing = [c for c in _KEY_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"Adjusted data missing key columns: {missing}")
+        if df.is_empty():
+            return 0
+
+        new_rows = df.unique(subset=_KEY_COLUMNS, keep="last", maintain_order=True)
+        manifest = self.load_manifest()
+
+        for (year,), year_rows in new_rows.group_by(pl.col("date").dt.year()):
+            path = self.partitions_dir / f"{year}.parquet"
+            if path.exists():
+                existing = pl.scan_parquet(path).join(
+                    year_rows.lazy().select(_KEY_COLUMNS), on=_KEY_COLUMNS, how="anti"
+                )
+                merged = pl.concat([existing, year_rows.lazy()], how="diagonal_relaxed").collect()
+            else:
+                merged = year_rows
+            manifest["partitions"][str(year)] = self._write_partition(merged, path)
+
+        dates = set(manifest["dates"]) | {d.isoformat() for d in new_rows["date"].unique()}
+        manifest["dates"] = sorted(dates)
+        self._save_manifest(manifest)
+
+        logger.info(
+            "Adjusted store upserted",
+            extra={
+                "event": "adjusted_store.upsert",
+                "rows": new_rows.height,
+                "symbols": new_rows["symbol"].n_unique(),
+            },
+        )
+        return new_rows.height
+
+    def rebuild_from_partitions(self) -> int:
+        """Rebuild the store from the per-date ``YYYY-MM-DD/{SYMBOL}.parquet`` files.
+
+        Run dates are applied in order, so the most recent run wins for
+        each (symbol, date) exactly as incremental upserts would.
+
+        Returns:
+            Row count of the rebuilt store.
+        """
+        run_dirs = []
+        if self.adjusted_dir.exists():
+            for entry in sorted(self.adjusted_dir.iterdir()):
+                try:
+                    date.fromisoformat(entry.name)
+                except ValueError:
+                    continue
+                if entry.is_dir() and any(entry.glob("*.parquet")):
+                    run_dirs.append(entry)
+
+        if not run_dirs:
+            return 0
+
+        combined = (
+            pl.concat(
+                [
+                    pl.scan_parquet(run_dir / "*.parquet").with_columns(
+                        pl.lit(run_ordinal).alias("_run")
+                    )
+                    for run_ordinal, run_dir in enumerate(run_dirs)
+                ],
+                how="diagonal_relaxed",
+            )
+            .sort([*_KEY_COLUMNS, "_run"])
+            .unique(subset=_KEY_COLUMNS, keep="last", maintain_order=True)
+            .drop("_run")
+            .collect()
+        )
+
+        manifest: dict[str, Any] = {"partitions": {}, "dates": []}
+        for (year,), year_rows in combined.group_by(pl.col("date").dt.year()):
+            path = self.partitions_dir / f"{year}.parquet"
+            manifest["partitions"][str(year)] = self._write_partition(year_rows, path)
+        # Drop partitions for years no longer present
+        for stale in self.partitions_dir.glob("*.parquet"):
+            if stale.stem not in manifest["partitions"]:
+                stale.unlink()
+        manifest["dates"] = sorted(d.isoformat() for d in combined["date"].unique())
+        self._save_manifest(manifest)
+
+        logger.info(
+            "Adjusted store rebuilt",
+            extra={
+                "event": "adjusted_store.rebuild",
+                "run_dates": len(run_dirs),
+                "rows": combined.height,
+            },
+        )
+        return combined.height
+
+    def _write_partition(self, df: pl.DataFrame, path: Path) -> dict[str, Any]:
+        """Sort and atomically write one year partition, returning its manifest entry."""
+        df = df.sort(_KEY_COLUMNS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".parquet.tmp")
+        try:
+            df.write_parquet(
+                temp_path,
+                compression="snappy",
+                statistics=True,
+                row_group_size=ROW_GROUP_SIZE,
+            )
+            temp_path.replace(path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        return {
+            "file": path.name,
+            "row_count": df.height,
+            "min_date": df["date"].min().isoformat(),  # type: ignore[union-attr]
+            "max_date": df["date"].max().isoformat(),  # type: ignore[union-attr]
+            "symbol_count": df["symbol"].n_unique(),
+        }
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        """Atomically publish the manifest."""
+        manifest["format_version"] = STORE_FORMAT_VERSION
+        manifest["updated_at"] = datetime.now(UTC).isoformat()
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(self.manifest_path)
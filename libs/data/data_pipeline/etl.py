@@ -22,6 +22,7 @@ import polars as pl
 from redis.exceptions import RedisError
 
 from libs.core.common.exceptions import DataQualityError
+from libs.data.data_pipeline.adjusted_store import STORE_DIRNAME, AdjustedStore
 from libs.data.data_pipeline.corporate_actions import adjust_prices
 from libs.data.data_pipeline.freshness import check_freshness
 from libs.data.data_pipeline.quality_gate import detect_outliers
@@ -222,6 +223,7 @@ def _save_results(
     File Structure:
         data/
         ├── adjusted/YYYY-MM-DD/{SYMBOL}.parquet
+        ├── adjusted/_store/                  (consolidated AdjustedStore)
         └── quarantine/YYYY-MM-DD/{SYMBOL}.parquet
 
     Args:
@@ -235,6 +237,8 @@ def _save_results(
         - Overwrites existing files (idempotent)
         - Uses Snappy compression for balance of speed/size
         - Each symbol gets its own Parquet file for efficient queries
+        - Adjusted rows are also upserted into the consolidated store read
+          by signal-time feature generation
     """
     # Create date partition directories
     adjusted_dir = output_dir / "adjusted" / run_date.isoformat()
@@ -253,6 +257,7 @@ def _save_results(
                 compression="snappy",
                 use_pyarrow=False,  # Use Polars native writer
             )
+        AdjustedStore(output_dir / "adjusted").upsert(good_data)
 
     # Save quarantined data (one file per symbol)
     if not quarantine_data.is_empty():
@@ -307,8 +312,10 @@ def load_adjusted_data(
     if not data_dir.exists():
         return pl.DataFrame()
 
-    # Find all Parquet files
-    parquet_files = list(data_dir.rglob("*.parquet"))
+    # Find all per-date Parquet files (the consolidated store holds copies)
+    parquet_files = [
+        f for f in data_dir.rglob("*.parquet") if STORE_DIRNAME not in f.relative_to(data_dir).parts
+    ]
 
     if not parquet_files:
         return pl.DataFrame()
@@ -4,6 +4,8 @@ This module provides:
 - HistoricalETL: Orchestrates historical data fetching via UnifiedDataFetcher
 - ETLProgressManifest: Tracks ETL progress for resume capability
 - Year-partitioned Parquet storage with atomic writes
+- Optional streaming full runs: symbol batches staged per year, then sunk
+  into the partition, bounding memory to a few batches
 - DuckDB catalog for SQL queries
 
 Example:
@@ -17,6 +19,9 @@ Example:
         end_date=date(2024, 12, 31),
     )
 
+    # Memory-bounded full rebuild of a large universe
+    result = etl.run_full_etl(symbols, date(2000, 1, 1), date(2024, 12, 31), batch_size=250)
+
 See Also:
     docs/CONCEPTS/historical-etl-pipeline.md
     docs/ADRs/ADR-017-historical-etl-pipeline.md
@@ -31,6 +36,9 @@ import logging
 import os
 import shutil
 import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -38,7 +46,7 @@ from typing import TYPE_CHECKING, Literal
 
 import duckdb
 import polars as pl
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
 
 if TYPE_CHECKING:
     from libs.data.data_providers.unified_fetcher import UnifiedDataFetcher
@@ -102,6 +110,10 @@ class ETLProgressManifest(BaseModel):
         years_completed: List of years fully processed.
         years_remaining: List of years still to process.
         status: Current ETL status.
+        batch_size: Symbol batch size of a streaming run (None = not streaming).
+        batch_symbols_checksum: SHA-256 of the streamed symbol list.
+        year_batches_completed: Per-year count of symbol batches already
+            staged, so a resumed streaming run skips them.
     """
 
     dataset: str
@@ -110,6 +122,9 @@ class ETLProgressManifest(BaseModel):
     years_completed: list[int]
     years_remaining: list[int]
     status: Literal["running", "paused", "completed", "failed"]
+    batch_size: int | None = None
+    batch_symbols_checksum: str | None = None
+    year_batches_completed: dict[int, int] = Field(default_factory=dict)
 
 
 @dataclass
@@ -149,6 +164,7 @@ class HistoricalETL:
     Storage Layout:
         data/historical/daily/{year}.parquet  - Year-partitioned data
         data/manifests/historical_daily.json  - SyncManifest
+        data/historical/_staging/{year}/batch_NNNNN.parquet - Streaming run batches
         data/sync_progress/historical_daily_progress.json - ETL progress
         data/duckdb/historical_catalog.duckdb - DuckDB catalog
 
@@ -161,6 +177,7 @@ class HistoricalETL:
     PRIMARY_KEYS = ["date", "symbol"]
     DEFAULT_START_DATE = date(2000, 1, 1)
     PROGRESS_DIR = Path("data/sync_progress")
+    DEFAULT_FETCH_WORKERS = 2
 
     def __init__(
         self,
@@ -201,22 +218,40 @@ class HistoricalETL:
         start_date: date,
         end_date: date,
         resume: bool = True,
+        batch_size: int | None = None,
+        max_workers: int = DEFAULT_FETCH_WORKERS,
     ) -> ETLResult:
         """Run full ETL with lock + manifest coupling.
 
+        By default each year is fetched for all symbols at once. With
+        ``batch_size`` set, each year is streamed instead: symbols are fetched
+        in batches on a small thread pool (fetches for upcoming batches
+        overlap validation and writes of the current one), each validated
+        batch is staged to disk and checkpointed, and the staged batches are
+        sunk into the year partition. Peak memory is bounded by roughly
+        ``max_workers + 1`` batches rather than a whole year of the universe.
+
         Args:
             symbols: List of ticker symbols to fetch.
             start_date: Start of date range (inclusive).
             end_date: End of date range (inclusive).
             resume: Whether to resume from previous progress.
+            batch_size: Symbols per streamed batch (None = no streaming).
+            max_workers: Concurrent batch fetches in streaming mode.
 
         Returns:
             ETLResult with operation details.
 
         Raises:
+            ValueError: If ``batch_size`` or ``max_workers`` is < 1.
             ETLError: If ETL operation fails.
             LockNotHeldError: If lock cannot be acquired.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
         start_time = time.monotonic()
         # CRITICAL: Clamp end_date to today to prevent future cursor advancement
         today = datetime.now(UTC).date()
@@ -249,6 +284,21 @@ class HistoricalETL:
                     status="running",
                 )
 
+            # Staged batches are only reusable by a resumed run with the same
+            # batch layout; anything else starts the staging area over
+            symbols_checksum = hashlib.sha256(
+                "\n".join(dict.fromkeys(symbols)).encode()
+            ).hexdigest()
+            if (
+                etl_progress.batch_size != batch_size
+                or etl_progress.batch_symbols_checksum != symbols_checksum
+                or not etl_progress.year_batches_completed
+            ):
+                shutil.rmtree(self._staging_root(), ignore_errors=True)
+                etl_progress.year_batches_completed = {}
+            etl_progress.batch_size = batch_size
+            etl_progress.batch_symbols_checksum = symbols_checksum
+
             # Disk space check
             estimated_bytes = self._estimate_total_size(symbols, start_date, end_date)
             self.manifest_manager.check_disk_space(int(estimated_bytes * 2))
@@ -272,42 +322,47 @@ class HistoricalETL:
                     },
                 )
 
-                df = self.fetcher.get_daily_prices(
-                    symbols=symbols,
-                    start_date=year_start,
-                    end_date=year_end,
-                )
-
-                # CRITICAL: Filter out future dates (provider may return T+1 or beyond)
-                df = df.filter(pl.col("date") <= today)
+                partition_path = self.storage_path / "daily" / f"{year}.parquet"
+                if batch_size is None:
+                    rows = self._write_year_partition(
+                        symbols, year_start, year_end, today, partition_path
+                    )
+                else:
+                    rows = self._stream_year_partition(
+                        year,
+                        symbols,
+                        year_start,
+                        year_end,
+                        today,
+                        partition_path,
+                        etl_progress,
+                        batch_size,
+                        max_workers,
+                    )
 
-                if df.is_empty():
+                if rows == 0:
                     logger.info("No data for year %d, skipping", year)
                     etl_progress.years_remaining.remove(year)
                     etl_progress.years_completed.append(year)
                     continue
 
-                # Sort for deterministic output
-                df = df.sort(self.PRIMARY_KEYS)
-
-                # Validate + atomic write
-                partition_path = self.storage_path / "daily" / f"{year}.parquet"
-                self._atomic_write_with_quarantine(df, partition_path)
                 written_paths.append(partition_path)
-                total_rows += df.height
+                total_rows += rows
 
                 # Update progress checkpoint
                 etl_progress.years_completed.append(year)
                 etl_progress.years_remaining.remove(year)
+                etl_progress.year_batches_completed.pop(year, None)
                 etl_progress.last_updated = datetime.now(UTC)
                 self._save_etl_progress(etl_progress)
+                shutil.rmtree(self._staging_root() / str(year), ignore_errors=True)
 
                 logger.info(
                     "Completed partition",
                     extra={
                         "event": "etl.partition.complete",
                         "year": year,
-                        "rows": df.height,
+                        "rows": rows,
                     },
                 )
 
@@ -367,6 +422,172 @@ class HistoricalETL:
                 manifest_checksum=manifest.checksum,
             )
 
+    def _write_year_partition(
+        self,
+        symbols: list[str],
+        year_start: date,
+        year_end: date,
+        today: date,
+        partition_path: Path,
+    ) -> int:
+        """Fetch one year for all symbols and write its partition.
+
+        Returns:
+            Rows written (0 if the provider returned no data).
+        """
+        df = self.fetcher.get_daily_prices(
+            symbols=symbols,
+            start_date=year_start,
+            end_date=year_end,
+        )
+
+        # CRITICAL: Filter out future dates (provider may return T+1 or beyond)
+        df = df.filter(pl.col("date") <= today)
+        if df.is_empty():
+            return 0
+
+        # Sort for deterministic output, then validate + atomic write
+        df = df.sort(self.PRIMARY_KEYS)
+        self._atomic_write_with_quarantine(df, partition_path)
+        return df.height
+
+    def _stream_year_partition(
+        self,
+        year: int,
+        symbols: list[str],
+        year_start: date,
+        year_end: date,
+        today: date,
+        partition_path: Path,
+        progress: ETLProgressManifest,
+        batch_size: int,
+        max_workers: int,
+    ) -> int:
+        """Build one year partition from symbol batches without holding the year in memory.
+
+        Batches are fetched up to ``max_workers`` ahead on a thread pool and
+        consumed in order: filtered, sorted, validated, staged under
+        ``_staging/{year}/`` and checkpointed in ``progress``. Batches already
+        checkpointed by an interrupted run are skipped. The staged files are
+        then sorted and sunk into the partition by the Polars streaming engine.
+
+        Returns:
+            Rows written (0 if no batch returned data).
+
+        Raises:
+            DataQualityError: If a batch or the assembled partition fails validation.
+        """
+        staging_dir = self._staging_root() / str(year)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+
+        # Symbols are deduplicated so batches are disjoint on the primary key
+        unique_symbols = list(dict.fromkeys(symbols))
+        batches = [
+            unique_symbols[i : i + batch_size] for i in range(0, len(unique_symbols), batch_size)
+        ]
+        first_batch = progress.year_batches_completed.get(year, 0)
+        if first_batch > len(batches):
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            staging_dir.mkdir(parents=True)
+            first_batch = 0
+
+        def fetch(batch: list[str]) -> pl.DataFrame:
+            df = self.fetcher.get_daily_prices(
+                symbols=batch,
+                start_date=year_start,
+                end_date=year_end,
+            )
+            # CRITICAL: Filter out future dates (provider may return T+1 or beyond)
+            return df.filter(pl.col("date") <= today).sort(self.PRIMARY_KEYS)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="etl-fetch") as pool:
+            pending: deque[Future[pl.DataFrame]] = deque()
+            next_batch = first_batch
+            try:
+                for batch_idx in range(first_batch, len(batches)):
+                    while next_batch < len(batches) and len(pending) < max_workers:
+                        pending.append(pool.submit(fetch, batches[next_batch]))
+                        next_batch += 1
+                    df = pending.popleft().result()
+
+                    if not df.is_empty():
+                        validation_errors = self._validate_partition(df, year)
+                        if validation_errors:
+                            logger.error(
+                                "Batch validation failed",
+                                extra={
+                                    "event": "etl.validation.failed",
+                                    "year": year,
+                                    "batch": batch_idx,
+                                    "errors": validation_errors,
+                                },
+                            )
+                            raise DataQualityError(f"Validation failed: {validation_errors}")
+                        self._write_staged_batch(df, staging_dir / f"batch_{batch_idx:05d}.parquet")
+
+                    progress.year_batches_completed[year] = batch_idx + 1
+                    progress.last_updated = datetime.now(UTC)
+                    self._save_etl_progress(progress)
+
+                    logger.debug(
+                        "Staged symbol batch",
+                        extra={
+                            "event": "etl.batch.staged",
+                            "year": year,
+                            "batch": batch_idx + 1,
+                            "batches": len(batches),
+                            "rows": df.height,
+                        },
+                    )
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        staged = sorted(staging_dir.glob("batch_*.parquet"))
+        if not staged:
+            return 0
+
+        # Batches are validated individually; re-check the primary key across
+        # them in case a provider returned rows for unrequested symbols
+        staged_lf = pl.scan_parquet(staged)
+        counts = (
+            staged_lf.group_by(self.PRIMARY_KEYS)
+            .agg(pl.len().alias("n"))
+            .select(pl.len().alias("keys"), (pl.col("n") - 1).sum().alias("dups"))
+            .collect()
+        )
+        dup_count = int(counts["dups"][0] or 0)
+        if dup_count > 0:
+            raise DataQualityError(
+                f"Validation failed: ['Duplicate primary keys across batches: {dup_count} rows']"
+            )
+
+        estimated_size = sum(path.stat().st_size for path in staged)
+        self._atomic_publish(
+            partition_path,
+            estimated_size,
+            lambda temp_path: staged_lf.sort(self.PRIMARY_KEYS).sink_parquet(temp_path),
+        )
+        return int(counts["keys"][0])
+
+    def _write_staged_batch(self, df: pl.DataFrame, path: Path) -> None:
+        """Durably write one staged batch (temp + fsync + rename)."""
+        temp_path = path.with_suffix(".parquet.tmp")
+        try:
+            df.write_parquet(temp_path)
+            with open(temp_path, "rb") as f:
+                os.fsync(f.fileno())
+            temp_path.replace(path)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            if e.errno == errno.ENOSPC:
+                raise DiskSpaceError(f"Disk full while staging batch: {e}") from e
+            raise ETLError(f"I/O error while staging batch: {e}") from e
+
+    def _staging_root(self) -> Path:
+        """Directory for streaming-run batches (outside the ``daily/*.parquet`` glob)."""
+        return self.storage_path / "_staging"
+
     # =========================================================================
     # Incremental ETL
     # =========================================================================
@@ -868,35 +1089,56 @@ class HistoricalETL:
             df: DataFrame to write.
             target_path: Target Parquet file path.
 
+        Returns:
+            Checksum of written file.
+        """
+        year = int(target_path.stem)
+
+        # 1. Validate BEFORE writing - no file created yet, nothing to quarantine
+        validation_errors = self._validate_partition(df, year)
+        if validation_errors:
+            logger.error(
+                "Partition validation failed",
+                extra={
+                    "event": "etl.validation.failed",
+                    "year": year,
+                    "errors": validation_errors,
+                },
+            )
+            # CRITICAL: Do NOT quarantine existing target_path here!
+            # The existing partition is valid; only the new data failed validation.
+            raise DataQualityError(f"Validation failed: {validation_errors}")
+
+        return self._atomic_publish(target_path, self._estimate_parquet_size(df), df.write_parquet)
+
+    def _atomic_publish(
+        self,
+        target_path: Path,
+        estimated_size: int,
+        write_temp: Callable[[Path], object],
+    ) -> str:
+        """Write via ``write_temp`` to a temp file and atomically replace ``target_path``.
+
+        Shared by in-memory writes and streaming sinks. Data must already be
+        validated.
+
+        Args:
+            target_path: Target Parquet file path.
+            estimated_size: Estimated output size for the disk space check.
+            write_temp: Writes the Parquet file to the given temp path.
+
         Returns:
             Checksum of written file.
         """
         temp_path = target_path.with_suffix(".parquet.tmp")
         backup_path = target_path.with_suffix(".parquet.bak")
-        year = int(target_path.stem)
 
         try:
-            # 1. Validate BEFORE writing - no file created yet, nothing to quarantine
-            validation_errors = self._validate_partition(df, year)
-            if validation_errors:
-                logger.error(
-                    "Partition validation failed",
-                    extra={
-                        "event": "etl.validation.failed",
-                        "year": year,
-                        "errors": validation_errors,
-                    },
-                )
-                # CRITICAL: Do NOT quarantine existing target_path here!
-                # The existing partition is valid; only the new data failed validation.
-                raise DataQualityError(f"Validation failed: {validation_errors}")
-
             # 2. Disk space check on DATA volume
-            estimated_size = self._estimate_parquet_size(df)
             self._check_disk_space_on_path(target_path.parent, estimated_size * 2)
 
             # 3. Write to temp
-            df.write_parquet(temp_path)
+            write_temp(temp_path)
 
             # 4. Compute checksum
             checksum = self.validator.compute_checksum(temp_path)
@@ -2,11 +2,19 @@
 
 The engine derives adjusted preview/result columns from immutable raw inputs.
 It does not rewrite canonical parquet storage.
+
+Split factors are a step function per symbol that only changes on split
+dates, so they are kept as a ``SplitFactorTable``: one row per split with the
+cumulative factor of that split and every later one. Callers that read the
+same corporate-action snapshot repeatedly build the table once (keyed by the
+snapshot's manifest identity) and pass it instead of raw actions; adjusting a
+price window is then a single forward as-of join plus a multiply.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date
 from typing import Literal
 
 import polars as pl
@@ -23,6 +31,7 @@ _PRICE_REQUIRED_COLUMNS = frozenset({"symbol", "date", "open", "high", "low", "c
 _PRICE_COLUMNS = ("open", "high", "low", "close")
 _CORP_ACTION_REQUIRED_COLUMNS = frozenset({"symbol", "ca_type", "old_rate", "new_rate"})
 _CORP_ACTION_DATE_COLUMNS = ("ex_date", "process_date")
+_SPLIT_FACTOR_TABLE_COLUMNS = frozenset({"symbol", "date", "valid_through", "cumulative_factor"})
 _SUPPORTED_SPLIT_CA_TYPES = (
     "forward_split",
     "forward_splits",
@@ -48,23 +57,129 @@ class ReadTimeAdjustmentResult:
     skipped_action_count: int
 
 
+@dataclass(frozen=True)
+class SplitFactorTable:
+    """Precomputed cumulative split factors for a corporate-action snapshot.
+
+    ``factors`` has one row per (symbol, split date) with the product of that
+    split's ratio and all later ratios for the symbol. Rows are keyed by
+    ``valid_through`` (the day before the split), so a forward as-of join
+    yields, for any price date, the factor of all splits strictly after it.
+    ``invalid_actions`` keeps the (symbol, date) of malformed split rows so
+    skip counts can be scoped to a price window.
+    """
+
+    factors: pl.DataFrame
+    invalid_actions: pl.DataFrame
+
+    @property
+    def split_action_count(self) -> int:
+        """Number of distinct valid (symbol, split date) actions."""
+        return len(self.factors)
+
+    @property
+    def skipped_action_count(self) -> int:
+        """Number of split actions skipped for invalid dates or rates."""
+        return len(self.invalid_actions)
+
+    def to_frame(self) -> pl.DataFrame:
+        """Return a single persistable frame (invalid rows have null factors)."""
+        return pl.concat([self.factors, self.invalid_actions], how="diagonal_relaxed")
+
+    @classmethod
+    def from_frame(cls, frame: pl.DataFrame) -> SplitFactorTable:
+        """Rebuild a table from ``to_frame`` output."""
+        _require_columns(frame, _SPLIT_FACTOR_TABLE_COLUMNS, label="split factor table")
+        valid = pl.col("cumulative_factor").is_not_null()
+        return cls(
+            factors=frame.filter(valid)
+            .select(["symbol", "date", "valid_through", "cumulative_factor"])
+            .sort(["symbol", "valid_through"]),
+            invalid_actions=frame.filter(~valid).select(["symbol", "date"]),
+        )
+
+    def factors_for(self, prices: pl.DataFrame) -> pl.DataFrame:
+        """Return ``prices`` with a ``__split_factor`` column (1.0 when no later split)."""
+        return (
+            prices.sort("date")
+            .join_asof(
+                self.factors.select(["symbol", "valid_through", "cumulative_factor"]),
+                left_on="date",
+                right_on="valid_through",
+                by="symbol",
+                strategy="forward",
+                check_sortedness=False,
+            )
+            .with_columns(pl.col("cumulative_factor").fill_null(1.0).alias("__split_factor"))
+            .drop(["valid_through", "cumulative_factor"])
+        )
+
+    def scoped_action_counts(self, symbols: list[str], start_date: date) -> tuple[int, int]:
+        """Count valid and skipped actions for ``symbols`` dated on/after ``start_date``.
+
+        This matches the counts of the frame-based path when the caller
+        queries corporate actions for the same symbols and window start.
+        """
+        in_scope = pl.col("symbol").is_in(symbols) & (pl.col("date") >= start_date)
+        return (
+            self.factors.filter(in_scope).height,
+            self.invalid_actions.filter(in_scope).height,
+        )
+
+
+def build_split_factor_table(corporate_actions: pl.DataFrame) -> SplitFactorTable:
+    """Build cumulative split factors from raw corporate-action rows.
+
+    Args:
+        corporate_actions: Raw SIP corporate actions with ``symbol``,
+            ``ca_type``, ``old_rate``, ``new_rate`` and ``ex_date`` and/or
+            ``process_date``.
+
+    Returns:
+        SplitFactorTable covering every symbol in ``corporate_actions``.
+
+    Raises:
+        ValueError: If required columns are missing.
+    """
+    _require_corporate_action_columns(corporate_actions)
+    split_actions, invalid_actions = _split_actions(corporate_actions)
+    factors = (
+        split_actions.sort(["symbol", "date"])
+        .with_columns(
+            [
+                (pl.col("date") - pl.duration(days=1)).alias("valid_through"),
+                pl.col("split_ratio")
+                .reverse()
+                .cum_prod()
+                .reverse()
+                .over("symbol")
+                .alias("cumulative_factor"),
+            ]
+        )
+        .select(["symbol", "date", "valid_through", "cumulative_factor"])
+    )
+    return SplitFactorTable(factors=factors, invalid_actions=invalid_actions)
+
+
 def derive_split_adjusted_prices(
     prices: pl.DataFrame,
-    corporate_actions: pl.DataFrame,
+    corporate_actions: pl.DataFrame | SplitFactorTable,
 ) -> ReadTimeAdjustmentResult:
     """Derive split-adjusted OHLCV and return columns from raw SIP inputs.
 
     The returned frame preserves raw ``open/high/low/close/volume`` columns,
     adds ``adj_open/adj_high/adj_low/adj_close/adj_volume`` plus ``ret``, and
     records that the output was derived at read time.
+
+    ``corporate_actions`` may be raw action rows (already filtered by the
+    caller) or a cached ``SplitFactorTable``; for a table, action counts are
+    scoped to the price symbols and window start.
     """
     _require_columns(prices, _PRICE_REQUIRED_COLUMNS, label="prices")
-    _require_columns(corporate_actions, _CORP_ACTION_REQUIRED_COLUMNS, label="corporate_actions")
-    if not any(column in corporate_actions.columns for column in _CORP_ACTION_DATE_COLUMNS):
-        raise ValueError(
-            "corporate_actions missing required action date column: "
-            "one of ex_date or process_date"
-        )
+    if isinstance(corporate_actions, SplitFactorTable):
+        factor_table = corporate_actions
+    else:
+        factor_table = build_split_factor_table(corporate_actions)
 
     if prices.is_empty():
         return ReadTimeAdjustmentResult(
@@ -77,11 +192,21 @@ def derive_split_adjusted_prices(
 
     normalized_prices = _normalize_prices(prices)
     _ensure_unique_price_keys(normalized_prices)
-    split_actions, skipped_action_count = _split_actions(corporate_actions)
-    split_factor = _split_factor_frame(normalized_prices, split_actions)
+    if isinstance(corporate_actions, SplitFactorTable):
+        start_date = normalized_prices["date"].min()
+        split_action_count, skipped_action_count = (
+            factor_table.scoped_action_counts(
+                normalized_prices["symbol"].drop_nulls().unique().to_list(), start_date
+            )
+            if isinstance(start_date, date)
+            else (0, 0)
+        )
+    else:
+        split_action_count = factor_table.split_action_count
+        skipped_action_count = factor_table.skipped_action_count
+
     adjusted = (
-        normalized_prices.join(split_factor, on=["symbol", "date"], how="left")
-        .with_columns(pl.col("__split_factor").fill_null(1.0))
+        factor_table.factors_for(normalized_prices)
         .with_columns(
             [
                 pl.col("__split_factor").alias("split_adjustment_factor"),
@@ -107,7 +232,7 @@ def derive_split_adjusted_prices(
     )
 
     reason_codes: set[str] = {READ_TIME_ADJUSTMENT_AVAILABLE_REASON}
-    if split_actions.is_empty():
+    if split_action_count == 0:
         reason_codes.add(READ_TIME_NO_SPLIT_ACTIONS_REASON)
     if skipped_action_count:
         reason_codes.add(READ_TIME_INVALID_SPLIT_ACTIONS_SKIPPED_REASON)
@@ -116,7 +241,7 @@ def derive_split_adjusted_prices(
         frame=adjusted,
         mode=READ_TIME_ADJUSTMENT_MODE_SPLIT_ADJUSTED,
         reason_codes=tuple(sorted(reason_codes)),
-        split_action_count=len(split_actions),
+        split_action_count=split_action_count,
         skipped_action_count=skipped_action_count,
     )
 
@@ -134,9 +259,18 @@ def _normalize_prices(prices: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def _split_actions(corporate_actions: pl.DataFrame) -> tuple[pl.DataFrame, int]:
+def _require_corporate_action_columns(corporate_actions: pl.DataFrame) -> None:
+    _require_columns(corporate_actions, _CORP_ACTION_REQUIRED_COLUMNS, label="corporate_actions")
+    if not any(column in corporate_actions.columns for column in _CORP_ACTION_DATE_COLUMNS):
+        raise ValueError(
+            "corporate_actions missing required action date column: "
+            "one of ex_date or process_date"
+        )
+
+
+def _split_actions(corporate_actions: pl.DataFrame) -> tuple[pl.DataFrame, pl.DataFrame]:
     if corporate_actions.is_empty():
-        return _empty_split_actions(), 0
+        return _empty_split_actions(), _empty_invalid_actions()
 
     date_exprs = [
         pl.col(column).cast(pl.Date, strict=False)
@@ -157,7 +291,7 @@ def _split_actions(corporate_actions: pl.DataFrame) -> tuple[pl.DataFrame, int]:
         ]
     )
     splits = normalized.filter(pl.col("ca_type").is_in(_SUPPORTED_SPLIT_CA_TYPES))
-    valid_splits = splits.filter(
+    valid_mask = (
         pl.col("date").is_not_null()
         & pl.col("old_rate").is_not_null()
         & pl.col("new_rate").is_not_null()
@@ -165,10 +299,11 @@ def _split_actions(corporate_actions: pl.DataFrame) -> tuple[pl.DataFrame, int]:
         & pl.col("new_rate").is_finite()
         & (pl.col("old_rate") > 0)
         & (pl.col("new_rate") > 0)
-    )
-    skipped_action_count = len(splits) - len(valid_splits)
+    ).fill_null(False)
+    valid_splits = splits.filter(valid_mask)
+    invalid_actions = splits.filter(~valid_mask).select(["symbol", "date"])
     if valid_splits.is_empty():
-        return _empty_split_actions(), skipped_action_count
+        return _empty_split_actions(), invalid_actions
 
     split_actions = (
         valid_splits.select(
@@ -182,38 +317,7 @@ def _split_actions(corporate_actions: pl.DataFrame) -> tuple[pl.DataFrame, int]:
         .agg(pl.col("split_ratio").product())
         .sort(["symbol", "date"])
     )
-    return split_actions, skipped_action_count
-
-
-def _split_factor_frame(prices: pl.DataFrame, split_actions: pl.DataFrame) -> pl.DataFrame:
-    price_rows = prices.select(["symbol", "date"]).with_columns(
-        [
-            pl.lit(1.0).alias("split_ratio"),
-            pl.lit(True).alias("__is_price_row"),
-        ]
-    )
-    action_rows = split_actions.with_columns(pl.lit(False).alias("__is_price_row"))
-    timeline = (
-        pl.concat([price_rows, action_rows], how="vertical")
-        .group_by(["symbol", "date"])
-        .agg(
-            [
-                pl.col("split_ratio").product(),
-                pl.col("__is_price_row").max(),
-            ]
-        )
-        .sort(["symbol", "date"])
-        .with_columns(
-            pl.col("split_ratio")
-            .reverse()
-            .cum_prod()
-            .shift(1, fill_value=1.0)
-            .reverse()
-            .over("symbol")
-            .alias("__split_factor")
-        )
-    )
-    return timeline.filter(pl.col("__is_price_row")).select(["symbol", "date", "__split_factor"])
+    return split_actions, invalid_actions
 
 
 def _empty_adjusted_frame(prices: pl.DataFrame) -> pl.DataFrame:
@@ -246,6 +350,10 @@ def _empty_split_actions() -> pl.DataFrame:
     )
 
 
+def _empty_invalid_actions() -> pl.DataFrame:
+    return pl.DataFrame(schema={"symbol": pl.Utf8, "date": pl.Date})
+
+
 def _ensure_unique_price_keys(prices: pl.DataFrame) -> None:
     duplicates = (
         prices.group_by(["symbol", "date"])
@@ -275,5 +383,7 @@ __all__ = [
     "READ_TIME_INVALID_SPLIT_ACTIONS_SKIPPED_REASON",
     "READ_TIME_NO_SPLIT_ACTIONS_REASON",
     "ReadTimeAdjustmentResult",
+    "SplitFactorTable",
+    "build_split_factor_table",
     "derive_split_adjusted_prices",
 ]
@@ -20,11 +20,22 @@ from typing import Any, Literal, cast
 import duckdb
 import polars as pl
 
+from libs.data.data_pipeline.read_time_adjustment import (
+    SplitFactorTable,
+    build_split_factor_table,
+)
 from libs.data.data_providers.alpaca_corp_actions_sync import (
     ALPACA_CORP_ACTIONS_SCHEMA,
 )
 from libs.data.data_providers.alpaca_sip_paths import resolve_alpaca_sip_manifest_path
-from libs.data.data_quality.exceptions import DataCoverageError, DataNotFoundError
+from libs.data.data_providers.duckdb_catalog import ManifestKey, manifest_key
+from libs.data.data_providers.snapshot_memory_store import preloaded_table
+from libs.data.data_providers.sync_file_utils import atomic_write_parquet
+from libs.data.data_quality.exceptions import (
+    DataCoverageError,
+    DataNotFoundError,
+    DiskSpaceError,
+)
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 
 logger = logging.getLogger(__name__)
@@ -63,6 +74,10 @@ ALPACA_SIP_SCHEMA: dict[str, type[pl.DataType]] = {
 }
 
 VALID_COLUMNS = set(ALPACA_SIP_COLUMNS)
+# Cached split factor tables, stored beside (not inside) the snapshot partitions
+SPLIT_FACTORS_DIRNAME = "_split_factors"
+# Per-query registration name for preloaded snapshot partitions
+PRELOADED_TABLE_NAME = "alpaca_sip_daily__mem"
 _DUCKDB_MEMORY_LIMIT_RE = re.compile(
     r"^[1-9][0-9]*(?:\.[0-9]+)?\s*(?:B|KB|MB|GB|TB|KIB|MIB|GIB|TIB)$",
     re.IGNORECASE,
@@ -143,6 +158,8 @@ class AlpacaSIPLocalProvider:
         self._connection_lock = threading.RLock()
         self._connections: weakref.WeakSet[duckdb.DuckDBPyConnection] = weakref.WeakSet()
         self._connection_generation = 0
+        self._split_factor_lock = threading.Lock()
+        self._split_factor_cache: tuple[ManifestKey, SplitFactorTable] | None = None
 
     def get_daily_prices(
         self,
@@ -183,6 +200,7 @@ class AlpacaSIPLocalProvider:
             return self._empty_result(columns)
 
         result = self._execute_query(
+            manifest=manifest,
             partition_paths=partition_paths,
             start_date=start_date,
             end_date=end_date,
@@ -221,6 +239,101 @@ class AlpacaSIPLocalProvider:
         ``DataNotFoundError``.
         """
         required_end_date = coverage_end_date if coverage_end_date is not None else end_date
+        manifest = self._get_trusted_corp_actions_manifest(start_date, required_end_date)
+
+        partition_paths = self._get_corp_action_paths_from_manifest(manifest)
+        if not partition_paths:
+            return pl.DataFrame(schema=ALPACA_CORP_ACTIONS_SCHEMA)
+
+        return self._execute_corp_actions_query(
+            partition_paths=partition_paths,
+            start_date=start_date,
+            end_date=end_date,
+            manifest_end_date=manifest.end_date,
+            date_basis=date_basis,
+            symbols=symbols,
+        )
+
+    def get_split_factor_table(
+        self,
+        *,
+        start_date: date,
+        coverage_end_date: date | None = None,
+    ) -> SplitFactorTable:
+        """Get cumulative split factors for the trusted corporate-action snapshot.
+
+        The table is built once per corp-action manifest identity (version +
+        checksum) from every effective-date split in the manifest, persisted
+        next to the corp-action partitions and cached in memory, so repeated
+        adjusted reads skip both the action scan and factor construction.
+        Coverage checks match ``get_corporate_actions``.
+        """
+        manifest = self._get_trusted_corp_actions_manifest(start_date, coverage_end_date)
+        key = manifest_key(manifest)
+        with self._split_factor_lock:
+            cached = self._split_factor_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            cache_path = self._split_factor_cache_path(manifest)
+            table = self._read_split_factor_table(cache_path)
+            if table is None:
+                partition_paths = self._get_corp_action_paths_from_manifest(manifest)
+                corporate_actions = (
+                    self._execute_corp_actions_query(
+                        partition_paths=partition_paths,
+                        start_date=manifest.start_date,
+                        end_date=None,
+                        manifest_end_date=manifest.end_date,
+                        date_basis="effective_date",
+                        symbols=None,
+                    )
+                    if partition_paths
+                    else pl.DataFrame(schema=ALPACA_CORP_ACTIONS_SCHEMA)
+                )
+                table = build_split_factor_table(corporate_actions)
+                try:
+                    atomic_write_parquet(table.to_frame(), cache_path)
+                except (OSError, DiskSpaceError) as exc:
+                    logger.warning(
+                        "Failed to persist split factor table",
+                        extra={
+                            "event": "alpaca_sip.split_factors_persist_failed",
+                            "path": str(cache_path),
+                            "error": str(exc),
+                        },
+                    )
+            self._split_factor_cache = (key, table)
+            return table
+
+    def get_manifest_paths(
+        self,
+        manifest: SyncManifest,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> list[Path]:
+        """Get the daily bar partition paths queries over a range would read.
+
+        Args:
+            manifest: Manifest to resolve (e.g. one pinned by the caller).
+            start_date: Range start (default: manifest start_date).
+            end_date: Range end (default: manifest end_date).
+
+        Returns:
+            Resolved parquet paths inside storage_path.
+        """
+        return self._get_partition_paths_from_manifest(
+            manifest,
+            start_date or manifest.start_date,
+            end_date or manifest.end_date,
+        )
+
+    def _get_trusted_corp_actions_manifest(
+        self,
+        start_date: date,
+        required_end_date: date | None,
+    ) -> SyncManifest:
+        """Load the companion corp-action manifest, failing closed on gaps."""
         if self._pinned_manifest is not None:
             raise DataNotFoundError(
                 "Corporate-action reads are disabled for pinned Alpaca SIP daily "
@@ -251,20 +364,32 @@ class AlpacaSIPLocalProvider:
                 f"{manifest.end_date.isoformat()}, before requested price end "
                 f"{required_end_date.isoformat()}."
             )
+        return manifest
 
-        partition_paths = self._get_corp_action_paths_from_manifest(manifest)
-        if not partition_paths:
-            return pl.DataFrame(schema=ALPACA_CORP_ACTIONS_SCHEMA)
-
-        return self._execute_corp_actions_query(
-            partition_paths=partition_paths,
-            start_date=start_date,
-            end_date=end_date,
-            manifest_end_date=manifest.end_date,
-            date_basis=date_basis,
-            symbols=symbols,
+    def _split_factor_cache_path(self, manifest: SyncManifest) -> Path:
+        return (
+            self.corp_actions_storage_path
+            / SPLIT_FACTORS_DIRNAME
+            / f"v{manifest.manifest_version}-{manifest.checksum[:16]}.parquet"
         )
 
+    @staticmethod
+    def _read_split_factor_table(path: Path) -> SplitFactorTable | None:
+        if not path.exists():
+            return None
+        try:
+            return SplitFactorTable.from_frame(pl.read_parquet(path))
+        except (OSError, ValueError, pl.exceptions.PolarsError) as exc:
+            logger.warning(
+                "Ignoring unreadable split factor table",
+                extra={
+                    "event": "alpaca_sip.split_factors_unreadable",
+                    "path": str(path),
+                    "error": str(exc),
+                },
+            )
+            return None
+
     def _get_manifest(self) -> SyncManifest:
         """Load the Alpaca SIP daily manifest."""
         if self._pinned_manifest is not None:
@@ -337,13 +462,18 @@ class AlpacaSIPLocalProvider:
 
     def _execute_query(
         self,
+        manifest: SyncManifest,
         partition_paths: list[Path],
         start_date: date,
         end_date: date,
         symbols: list[str] | None,
         columns: list[str] | None,
     ) -> pl.DataFrame:
-        """Execute a parameterized DuckDB query over selected partitions."""
+        """Execute a parameterized DuckDB query over selected partitions.
+
+        Scans the warm worker's preloaded snapshot tables when the pinned
+        manifest's partitions are preloaded, and the Parquet files otherwise.
+        """
         col_expr = (
             "*"
             if columns is None
@@ -351,7 +481,6 @@ class AlpacaSIPLocalProvider:
         )
 
         params: dict[str, Any] = {
-            "paths": [str(p) for p in partition_paths],
             "start_date": start_date,
             "end_date": end_date,
         }
@@ -363,16 +492,29 @@ class AlpacaSIPLocalProvider:
             )
             where_clauses.append('"symbol" = ANY($symbols)')
 
+        preloaded = preloaded_table(self.DATASET_NAME, manifest, partition_paths)
+        if preloaded is None:
+            params["paths"] = [str(p) for p in partition_paths]
+            source = "read_parquet($paths)"
+        else:
+            source = PRELOADED_TABLE_NAME
+
         query = f"""
             SELECT {col_expr}
-            FROM read_parquet($paths)
+            FROM {source}
             WHERE {" AND ".join(where_clauses)}
             ORDER BY "date", "symbol"
         """
 
         with self._connection_lock:
             conn = self._connection_for_current_thread()
-            return conn.execute(query, params).pl()
+            if preloaded is None:
+                return conn.execute(query, params).pl()
+            conn.register(PRELOADED_TABLE_NAME, preloaded)
+            try:
+                return conn.execute(query, params).pl()
+            finally:
+                conn.unregister(PRELOADED_TABLE_NAME)
 
     def _execute_corp_actions_query(
         self,
@@ -4,6 +4,12 @@ This module writes normalized Alpaca SIP historical bars to local yearly
 Parquet partitions and signs the resulting snapshot with the existing
 ``SyncManifest`` format. Reads remain local-only through
 ``AlpacaSIPLocalProvider``.
+
+Fetching is pipelined per year: symbol chunks are paged by up to
+``max_concurrent_requests`` workers, every request start is metered by a
+shared token bucket (``requests_per_minute``), and each page is converted
+straight into a columnar Polars frame so no per-bar row dictionaries are
+ever accumulated.
 """
 
 from __future__ import annotations
@@ -12,8 +18,10 @@ import datetime
 import hashlib
 import logging
 import os
+import threading
 import time
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol, cast
@@ -35,6 +43,7 @@ from libs.data.data_providers.sync_file_utils import (
     atomic_write_parquet,
     compute_combined_checksum_for_paths,
 )
+from libs.data.data_quality.checksums import FileHasher
 from libs.data.data_quality.exceptions import DiskSpaceError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 
@@ -81,6 +90,47 @@ class AlpacaSIPSyncEstimate:
         }
 
 
+# Columns populated from API bars; adj_close/ret are derived later and stay null.
+_BAR_COLUMNS = (
+    "date",
+    "symbol",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "trade_count",
+    "vwap",
+)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket metering request starts to a per-minute budget."""
+
+    def __init__(self, requests_per_minute: float, burst: int = 1) -> None:
+        self.rate_per_second = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one request may start."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate_per_second,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait_seconds = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(wait_seconds)
+
+
 class AlpacaStockBarsClient(Protocol):
     """Minimal client interface needed by ``AlpacaSIPSyncManager``."""
 
@@ -168,6 +218,9 @@ class AlpacaSIPSyncManager:
         request_page_limit: int = DEFAULT_LIMIT,
         feed: str = "sip",
         adjustment: str = "raw",
+        max_concurrent_requests: int = 1,
+        requests_per_minute: int | None = None,
+        file_hasher: FileHasher | None = None,
     ) -> None:
         """Initialize the sync manager.
 
@@ -182,6 +235,13 @@ class AlpacaSIPSyncManager:
             feed: Alpaca data feed. Phase 2 defaults to ``sip``.
             adjustment: Alpaca adjustment policy. Canonical SIP syncs currently
                 require ``raw`` so the stored OHLC columns remain unadjusted.
+            max_concurrent_requests: Symbol chunks paged concurrently. Pages
+                within one chunk stay sequential (each needs the previous
+                page token). The client must be thread-safe when > 1.
+            requests_per_minute: Optional account request budget enforced
+                across all workers with a token bucket.
+            file_hasher: Hashing service for manifest checksums; pass one
+                with a cache so verification skips unchanged partitions.
         """
         if request_chunk_size < 1:
             raise ValueError("request_chunk_size must be >= 1")
@@ -189,6 +249,10 @@ class AlpacaSIPSyncManager:
             raise ValueError("request_interval_seconds must be >= 0")
         if request_page_limit < 1:
             raise ValueError("request_page_limit must be >= 1")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be >= 1")
+        if requests_per_minute is not None and requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be >= 1")
 
         self.client = client
         self.storage_path = Path(storage_path).resolve()
@@ -197,6 +261,14 @@ class AlpacaSIPSyncManager:
         self.request_chunk_size = request_chunk_size
         self.request_interval_seconds = request_interval_seconds
         self.request_page_limit = request_page_limit
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self._rate_limiter = (
+            _TokenBucket(requests_per_minute, burst=max_concurrent_requests)
+            if requests_per_minute is not None
+            else None
+        )
+        self.file_hasher = file_hasher or FileHasher()
         self.feed = feed.lower().strip()
         self.adjustment = adjustment.lower().strip()
         if self.adjustment != "raw":
@@ -242,6 +314,8 @@ class AlpacaSIPSyncManager:
         feed: str | None = None,
         adjustment: str = "raw",
         base_url: str | None = None,
+        max_concurrent_requests: int = 1,
+        requests_per_minute: int | None = None,
     ) -> AlpacaSIPSyncManager:
         """Build a manager from standard Alpaca environment variables."""
         api_key = os.getenv("ALPACA_API_KEY_ID") or os.getenv("ALPACA_API_KEY")
@@ -275,6 +349,8 @@ class AlpacaSIPSyncManager:
             request_page_limit=request_page_limit,
             feed=resolved_feed,
             adjustment=adjustment,
+            max_concurrent_requests=max_concurrent_requests,
+            requests_per_minute=requests_per_minute,
         )
 
     def full_sync(
@@ -426,26 +502,48 @@ class AlpacaSIPSyncManager:
         """Fetch and normalize one yearly daily-bar partition without writing files."""
         normalized_symbols = self._normalize_symbols(symbols)
         self._validate_year_range(year, year)
-        rows: list[dict[str, Any]] = []
-        for chunk in self._chunks(normalized_symbols, self.request_chunk_size):
-            page_token: str | None = None
-            page_count = 0
-            while True:
-                page_count += 1
-                if page_count > self.MAX_PAGES_PER_REQUEST:
-                    raise RuntimeError(
-                        "Alpaca SIP bars pagination exceeded "
-                        f"{self.MAX_PAGES_PER_REQUEST} pages for year={year}"
-                    )
-                response = self._fetch_bars(chunk, year, page_token=page_token)
-                rows.extend(self._rows_from_response(response))
-                page_token = self._next_page_token_from_response(response)
-                if page_token is None:
-                    break
-            if self.request_interval_seconds > 0:
-                time.sleep(self.request_interval_seconds)
-
-        return self._rows_to_frame(rows, year)
+        chunks = self._chunks(normalized_symbols, self.request_chunk_size)
+        workers = min(self.max_concurrent_requests, len(chunks))
+
+        if workers <= 1:
+            chunk_pages = [self._fetch_chunk_pages(chunk, year) for chunk in chunks]
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alpaca-sip")
+            try:
+                futures = [
+                    executor.submit(self._fetch_chunk_pages, chunk, year) for chunk in chunks
+                ]
+                # Collect in chunk order so keep="last" dedup sees pages in API order
+                chunk_pages = [future.result() for future in futures]
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return self._pages_to_frame([page for pages in chunk_pages for page in pages])
+
+    def _fetch_chunk_pages(self, chunk: Sequence[str], year: int) -> list[pl.DataFrame]:
+        """Page through one symbol chunk, converting each page to a columnar frame."""
+        pages: list[pl.DataFrame] = []
+        page_token: str | None = None
+        page_count = 0
+        while True:
+            page_count += 1
+            if page_count > self.MAX_PAGES_PER_REQUEST:
+                raise RuntimeError(
+                    "Alpaca SIP bars pagination exceeded "
+                    f"{self.MAX_PAGES_PER_REQUEST} pages for year={year}"
+                )
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            response = self._fetch_bars(chunk, year, page_token=page_token)
+            page = self._page_to_frame(response, year)
+            if page.height > 0:
+                pages.append(page)
+            page_token = self._next_page_token_from_response(response)
+            if page_token is None:
+                break
+        if self.request_interval_seconds > 0:
+            time.sleep(self.request_interval_seconds)
+        return pages
 
     def _write_year_partition(
         self,
@@ -508,7 +606,7 @@ class AlpacaSIPSyncManager:
         if errors:
             return errors
 
-        computed_checksum = compute_combined_checksum_for_paths(partition_paths)
+        computed_checksum = compute_combined_checksum_for_paths(partition_paths, self.file_hasher)
         if computed_checksum != manifest.checksum:
             errors.append(
                 "Checksum mismatch: "
@@ -558,8 +656,12 @@ class AlpacaSIPSyncManager:
         token_text = str(token).strip()
         return token_text or None
 
-    def _rows_from_response(self, response: Any) -> list[dict[str, Any]]:
-        """Normalize REST and compatible SDK response shapes into row dictionaries."""
+    def _page_to_frame(self, response: Any, year: int) -> pl.DataFrame:
+        """Normalize one REST or SDK response page into canonical columns.
+
+        Bars outside ``year`` are dropped here so only in-partition data is
+        retained between pages.
+        """
         data = getattr(response, "data", None)
         if data is None and isinstance(response, Mapping):
             bars_payload = response.get("bars")
@@ -567,47 +669,47 @@ class AlpacaSIPSyncManager:
         if not isinstance(data, Mapping):
             raise ValueError(f"Unexpected Alpaca bars response type: {type(response).__name__}")
 
-        rows: list[dict[str, Any]] = []
+        columns: dict[str, list[Any]] = {name: [] for name in _BAR_COLUMNS}
         for symbol, bars in data.items():
             if str(symbol) in {"next_page_token", "next_token"}:
                 continue
             if bars is None:
                 continue
             for bar in bars:
-                rows.append(self._row_from_bar(str(symbol), bar))
-        return rows
+                self._append_bar(columns, str(symbol), bar)
 
-    def _row_from_bar(self, fallback_symbol: str, bar: Any) -> dict[str, Any]:
-        """Normalize one Alpaca bar object or raw dictionary."""
+        return (
+            pl.DataFrame(columns, schema={name: ALPACA_SIP_SCHEMA[name] for name in _BAR_COLUMNS})
+            .filter(pl.col("date").dt.year() == year)
+            .with_columns(
+                pl.lit(None, dtype=pl.Float64).alias("adj_close"),
+                pl.lit(None, dtype=pl.Float64).alias("ret"),
+            )
+        )
+
+    def _append_bar(self, columns: dict[str, list[Any]], fallback_symbol: str, bar: Any) -> None:
+        """Normalize one Alpaca bar object or raw dictionary into column buffers."""
         symbol = self._get_bar_field(bar, "symbol", "S") or fallback_symbol
         timestamp = self._normalize_timestamp(self._get_bar_field(bar, "timestamp", "t"))
-        close = self._required_float(bar, "close", "c")
 
-        return {
-            "date": timestamp.date(),
-            "symbol": str(symbol).upper().strip(),
-            "open": self._required_float(bar, "open", "o"),
-            "high": self._required_float(bar, "high", "h"),
-            "low": self._required_float(bar, "low", "l"),
-            "close": close,
-            "volume": self._required_float(bar, "volume", "v"),
-            "trade_count": self._optional_float(bar, "trade_count", "n"),
-            "vwap": self._optional_float(bar, "vwap", "vw"),
-            "adj_close": None,
-            "ret": None,
-        }
+        columns["date"].append(timestamp.date())
+        columns["symbol"].append(str(symbol).upper().strip())
+        columns["open"].append(self._required_float(bar, "open", "o"))
+        columns["high"].append(self._required_float(bar, "high", "h"))
+        columns["low"].append(self._required_float(bar, "low", "l"))
+        columns["close"].append(self._required_float(bar, "close", "c"))
+        columns["volume"].append(self._required_float(bar, "volume", "v"))
+        columns["trade_count"].append(self._optional_float(bar, "trade_count", "n"))
+        columns["vwap"].append(self._optional_float(bar, "vwap", "vw"))
 
-    def _rows_to_frame(self, rows: list[dict[str, Any]], year: int) -> pl.DataFrame:
-        """Convert normalized rows into the canonical local SIP schema."""
-        if not rows:
+    @staticmethod
+    def _pages_to_frame(pages: Sequence[pl.DataFrame]) -> pl.DataFrame:
+        """Combine page frames into the canonical, deduplicated yearly partition."""
+        if not pages:
             return pl.DataFrame(schema=ALPACA_SIP_SCHEMA)
 
-        df = pl.DataFrame(rows, schema=ALPACA_SIP_SCHEMA)
-        start = datetime.date(year, 1, 1)
-        end = datetime.date(year, 12, 31)
         return (
-            df.filter((pl.col("date") >= start) & (pl.col("date") <= end))
-            .with_columns(pl.col("symbol").str.to_uppercase())
+            pl.concat(pages, rechunk=False)
             .unique(subset=["date", "symbol"], keep="last", maintain_order=True)
             .sort(["date", "symbol"])
             .select(list(ALPACA_SIP_COLUMNS))
@@ -723,7 +825,8 @@ class AlpacaSIPSyncManager:
 
     def _compute_combined_checksum(self, file_paths: Sequence[str]) -> str:
         return compute_combined_checksum_for_paths(
-            [self._resolve_manifest_path(Path(path)) for path in file_paths]
+            [self._resolve_manifest_path(Path(path)) for path in file_paths],
+            self.file_hasher,
         )
 
     def _manifest_paths_for_verify(self, manifest: SyncManifest) -> tuple[list[Path], list[str]]:
@@ -29,6 +29,8 @@ from typing import TYPE_CHECKING, Any, Literal
 import duckdb
 import polars as pl
 
+from libs.data.data_providers.duckdb_catalog import ManifestCatalog
+from libs.data.data_providers.sync_file_utils import partition_year
 from libs.data.data_quality.exceptions import DataNotFoundError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 
@@ -127,6 +129,11 @@ class CompustatLocalProvider:
     Implements reader snapshot consistency by pinning manifest version.
     Supports both annual (funda) and quarterly (fundq) datasets.
 
+    Each connection keeps a ManifestCatalog with one view per dataset (plus
+    per-year views) and a ``{dataset}_security_metadata`` table, rebuilt only
+    when that dataset's manifest changes. Universe queries semi-join against
+    the metadata table instead of binding GVKEY lists.
+
     Storage Layout (per P4T1_TASK.md):
         data/wrds/compustat_annual/
         ├── 2020.parquet
@@ -354,6 +361,8 @@ class CompustatLocalProvider:
 
         # Build and execute query with parameterization
         result = self._execute_fundamentals_query(
+            manifest=manifest,
+            dataset=dataset,
             partition_paths=partition_paths,
             start_date=start_date,
             end_date=end_date,
@@ -418,23 +427,20 @@ class CompustatLocalProvider:
         manifest = self._get_manifest(dataset_name)
         pinned_version = manifest.manifest_version
 
-        # Get all paths to search for most recent available record
-        paths = self._get_validated_paths_from_manifest(manifest)
-
-        if not paths:
+        # Views cover all paths to search for most recent available record
+        conn, catalog = self._catalog_connection(manifest, dataset_name)
+        if not catalog.has_data(dataset_name):
             raise DataNotFoundError(f"No {dataset} data available")
 
-        conn = self._ensure_connection()
-
         # Compute the latest datadate that would be available as of as_of_date
         # PIT rule: datadate + filing_lag <= as_of_date
         # So: datadate <= as_of_date - filing_lag
         latest_available_datadate = as_of_date - timedelta(days=filing_lag)
 
         # Query for most recent available record for this GVKEY
-        query = """
+        query = f"""
             SELECT tic
-            FROM read_parquet($paths)
+            FROM {catalog.relation(dataset_name)}
             WHERE gvkey = $gvkey AND datadate <= $latest_datadate
             ORDER BY datadate DESC
             LIMIT 1
@@ -442,7 +448,6 @@ class CompustatLocalProvider:
         result = conn.execute(
             query,
             {
-                "paths": [str(p) for p in paths],
                 "gvkey": gvkey,
                 "latest_datadate": latest_available_datadate,
             },
@@ -510,26 +515,23 @@ class CompustatLocalProvider:
         manifest = self._get_manifest(dataset_name)
         pinned_version = manifest.manifest_version
 
-        paths = self._get_validated_paths_from_manifest(manifest)
-
-        if not paths:
+        conn, catalog = self._catalog_connection(manifest, dataset_name)
+        if not catalog.has_data(dataset_name):
             raise DataNotFoundError(f"No {dataset} data available")
 
-        conn = self._ensure_connection()
-
         # Compute the latest datadate that would be available
         latest_available_datadate = as_of_date - timedelta(days=filing_lag)
 
         # Find all GVKEYs with this ticker in AVAILABLE records
         # Get the most recent available record per GVKEY, then filter by ticker
-        query = """
+        query = f"""
             WITH ranked AS (
                 SELECT
                     gvkey,
                     tic,
                     datadate,
                     ROW_NUMBER() OVER (PARTITION BY gvkey ORDER BY datadate DESC) as rn
-                FROM read_parquet($paths)
+                FROM {catalog.relation(dataset_name)}
                 WHERE datadate <= $latest_datadate
             )
             SELECT DISTINCT gvkey
@@ -539,7 +541,6 @@ class CompustatLocalProvider:
         result = conn.execute(
             query,
             {
-                "paths": [str(p) for p in paths],
                 "ticker": ticker.upper(),
                 "latest_datadate": latest_available_datadate,
             },
@@ -634,11 +635,15 @@ class CompustatLocalProvider:
         # Filter: GVKEY must have first_available <= as_of_date
         # (i.e., at least one filing became public by as_of_date)
         filtered = metadata.filter(pl.col("first_available") <= as_of_date)
+        # Same rule on raw datadates for the SQL semi-join:
+        # datadate + lag <= as_of_date  <=>  datadate <= as_of_date - lag
+        universe_clauses = ["first_datadate <= $latest_datadate"]
 
         if not include_inactive:
             # Also require: last_available >= as_of_date
             # (i.e., most recent filing is still "recent" as of as_of_date)
             filtered = filtered.filter(pl.col("last_available") >= as_of_date)
+            universe_clauses.append("last_datadate >= $latest_datadate")
 
         if filtered.is_empty():
             # Verify manifest and return empty result
@@ -660,9 +665,9 @@ class CompustatLocalProvider:
 
         # Get point-in-time ticker/conm for the filtered GVKEYs
         # Query data for most recent AVAILABLE record per GVKEY
-        all_paths = self._get_validated_paths_from_manifest(manifest)
+        conn, catalog = self._pit_connection(manifest, dataset_name)
 
-        if not all_paths:
+        if not catalog.has_data(dataset_name):
             # Verify manifest and return filtered result without PIT ticker
             current_manifest = self._get_manifest(dataset_name)
             if current_manifest.manifest_version != pinned_version:
@@ -672,14 +677,14 @@ class CompustatLocalProvider:
                 )
             return filtered.select(["gvkey", "tic", "conm", "first_available", "last_available"])
 
-        conn = self._ensure_connection()
-        filtered_gvkeys = filtered["gvkey"].to_list()
+        metadata_table = self._metadata_table(dataset_name)
 
         # Compute the latest datadate that would be available
         latest_available_datadate = as_of_date - timedelta(days=filing_lag)
 
-        # Get the ticker/conm from most recent available record per GVKEY
-        query = """
+        # Get the ticker/conm from most recent available record per GVKEY,
+        # semi-joining the universe against the catalog's metadata table
+        query = f"""
             WITH ranked AS (
                 SELECT
                     gvkey,
@@ -687,21 +692,18 @@ class CompustatLocalProvider:
                     conm,
                     datadate,
                     ROW_NUMBER() OVER (PARTITION BY gvkey ORDER BY datadate DESC) as rn
-                FROM read_parquet($paths)
-                WHERE gvkey = ANY($gvkeys) AND datadate <= $latest_datadate
+                FROM {catalog.relation(dataset_name)}
+                WHERE datadate <= $latest_datadate
+                    AND gvkey IN (
+                        SELECT gvkey FROM {metadata_table}
+                        WHERE {" AND ".join(universe_clauses)}
+                    )
             )
             SELECT gvkey, tic, conm
             FROM ranked
             WHERE rn = 1
         """
-        pit_data = conn.execute(
-            query,
-            {
-                "paths": [str(p) for p in all_paths],
-                "gvkeys": filtered_gvkeys,
-                "latest_datadate": latest_available_datadate,
-            },
-        ).pl()
+        pit_data = conn.execute(query, {"latest_datadate": latest_available_datadate}).pl()
 
         # Join point-in-time ticker/conm with availability dates
         result = filtered.select(["gvkey", "first_available", "last_available"]).join(
@@ -742,7 +744,8 @@ class CompustatLocalProvider:
         """Get partition paths from manifest for date range.
 
         Uses manifest file_paths (not filesystem) for consistency.
-        Only returns paths for years overlapping with date range.
+        Only returns paths for years overlapping with date range, including
+        any incremental delta partitions registered for those years.
 
         Args:
             manifest: Current manifest.
@@ -757,22 +760,19 @@ class CompustatLocalProvider:
 
         for path_str in manifest.file_paths:
             path = Path(path_str)
-            # Extract year from filename (e.g., "2024.parquet" -> 2024)
-            try:
-                year = int(path.stem)
-                if year in needed_years:
-                    # Verify path is within data_root (security)
-                    resolved = path.resolve()
-                    if resolved.is_relative_to(self.data_root):
-                        paths.append(path)
-                    else:
-                        logger.warning(
-                            "Skipping path outside data_root: %s",
-                            path,
-                        )
-            except ValueError:
-                # Filename doesn't match year pattern
+            # Year from base ("2024.parquet") or incremental delta partitions
+            year = partition_year(path)
+            if year is None or year not in needed_years:
                 continue
+            # Verify path is within data_root (security)
+            resolved = path.resolve()
+            if resolved.is_relative_to(self.data_root):
+                paths.append(path)
+            else:
+                logger.warning(
+                    "Skipping path outside data_root: %s",
+                    path,
+                )
 
         return paths
 
@@ -809,6 +809,8 @@ class CompustatLocalProvider:
 
     def _execute_fundamentals_query(
         self,
+        manifest: SyncManifest,
+        dataset: str,
         partition_paths: list[Path],
         start_date: date,
         end_date: date,
@@ -818,11 +820,13 @@ class CompustatLocalProvider:
         columns: list[str] | None,
         column_order: tuple[str, ...],
     ) -> pl.DataFrame:
-        """Execute parameterized DuckDB query for fundamentals.
+        """Execute parameterized DuckDB query for fundamentals against the catalog views.
 
         All filtering uses parameterized queries to prevent SQL injection.
+        Only the year views covering ``partition_paths`` are scanned.
         """
-        conn = self._ensure_connection()
+        conn, catalog = self._catalog_connection(manifest, dataset)
+        years = {year for p in partition_paths if (year := partition_year(p)) is not None}
 
         # Build column list with quoted identifiers to handle reserved keywords (e.g., 'at' in DuckDB 1.x)
         if columns is None:
@@ -832,7 +836,6 @@ class CompustatLocalProvider:
 
         # Build WHERE clause with parameters
         params: dict[str, Any] = {
-            "paths": [str(p) for p in partition_paths],
             "start_date": start_date,
             "end_date": end_date,
         }
@@ -865,7 +868,7 @@ class CompustatLocalProvider:
 
         query = f"""
             SELECT {col_expr}
-            FROM read_parquet($paths)
+            FROM {catalog.relation(dataset, years)}
             WHERE {where_sql}
             ORDER BY datadate, gvkey
         """
@@ -926,20 +929,20 @@ class CompustatLocalProvider:
                 self._quarterly_metadata_version = manifest.manifest_version
             return empty_result
 
-        conn = self._ensure_connection()
+        conn, catalog = self._catalog_connection(manifest, dataset)
 
         # Compute first/last dates per GVKEY, get latest ticker/conm
-        query = """
+        query = f"""
             SELECT
                 gvkey,
                 LAST(tic ORDER BY datadate) AS tic,
                 LAST(conm ORDER BY datadate) AS conm,
                 MIN(datadate) AS first_datadate,
                 MAX(datadate) AS last_datadate
-            FROM read_parquet($paths)
+            FROM {catalog.relation(dataset)}
             GROUP BY gvkey
         """
-        result = conn.execute(query, {"paths": [str(p) for p in paths]}).pl()
+        result = conn.execute(query).pl()
 
         # Update cache
         if dataset == self.DATASET_ANNUAL:
@@ -951,6 +954,34 @@ class CompustatLocalProvider:
 
         return result
 
+    @staticmethod
+    def _metadata_table(dataset: str) -> str:
+        """Catalog table name for a dataset's security metadata."""
+        return f"{dataset}_security_metadata"
+
+    def _catalog_connection(
+        self, manifest: SyncManifest, dataset: str
+    ) -> tuple[duckdb.DuckDBPyConnection, ManifestCatalog]:
+        """Get the thread's connection with ``dataset`` views registered for ``manifest``.
+
+        Views are rebuilt only when the dataset's manifest identity changes;
+        manifest paths are validated only for a rebuild.
+        """
+        conn = self._ensure_connection()
+        catalog: ManifestCatalog = self._thread_local.catalog
+        if not catalog.is_current(dataset, manifest):
+            catalog.sync_views(dataset, manifest, self._get_validated_paths_from_manifest(manifest))
+        return conn, catalog
+
+    def _pit_connection(
+        self, manifest: SyncManifest, dataset: str
+    ) -> tuple[duckdb.DuckDBPyConnection, ManifestCatalog]:
+        """Like _catalog_connection, plus the dataset's security metadata table."""
+        metadata = self._get_security_metadata(manifest, dataset)
+        conn, catalog = self._catalog_connection(manifest, dataset)
+        catalog.sync_table(self._metadata_table(dataset), metadata)
+        return conn, catalog
+
     def _ensure_connection(self) -> duckdb.DuckDBPyConnection:
         """Get or create thread-local DuckDB in-memory connection.
 
@@ -978,6 +1009,7 @@ class CompustatLocalProvider:
             # Limit threads for reader
             conn.execute("PRAGMA threads=4")
             self._thread_local.conn = conn
+            self._thread_local.catalog = ManifestCatalog(conn)
 
         return conn
 
@@ -1018,6 +1050,7 @@ class CompustatLocalProvider:
         if conn is not None:
             conn.close()
             self._thread_local.conn = None
+            self._thread_local.catalog = None
             logger.debug("DuckDB connection closed for current thread")
 
     def __enter__(self) -> CompustatLocalProvider:
@@ -20,6 +20,8 @@ from typing import TYPE_CHECKING, Any
 import duckdb
 import polars as pl
 
+from libs.data.data_providers.duckdb_catalog import ManifestCatalog
+from libs.data.data_providers.sync_file_utils import partition_year
 from libs.data.data_quality.exceptions import DataNotFoundError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 
@@ -83,6 +85,11 @@ class CRSPLocalProvider:
     Uses DuckDB to query Parquet files with manifest-aware partition pruning.
     Implements reader snapshot consistency by pinning manifest version.
 
+    Each connection keeps a ManifestCatalog: a ``crsp_daily`` view (plus one
+    view per partition year) and the materialized ``crsp_security_metadata``
+    table, rebuilt only when the manifest changes. Point-in-time filters
+    semi-join against the metadata table instead of binding PERMNO lists.
+
     Storage Layout (per P4T1_TASK.md):
         data/wrds/crsp/daily/
         ├── 2020.parquet
@@ -118,6 +125,7 @@ class CRSPLocalProvider:
     """
 
     DATASET_NAME = "crsp_daily"
+    METADATA_TABLE = "crsp_security_metadata"
     DATA_ROOT = Path("data")  # Permitted root for security validation
 
     def __init__(
@@ -204,6 +212,7 @@ class CRSPLocalProvider:
 
         # Build and execute query with parameterization
         result = self._execute_query(
+            manifest=manifest,
             partition_paths=partition_paths,
             start_date=start_date,
             end_date=end_date,
@@ -265,26 +274,25 @@ class CRSPLocalProvider:
 
         # Filter: security must have IPO'd by as_of_date
         filtered = metadata.filter(pl.col("first_date") <= as_of_date)
+        universe_clauses = ["first_date <= $as_of_date"]
 
         if not include_delisted:
             # Also require: security still trading on as_of_date
             filtered = filtered.filter(pl.col("last_date") >= as_of_date)
+            universe_clauses.append("last_date >= $as_of_date")
 
         if filtered.is_empty():
             return filtered
 
         # Get point-in-time ticker/cusip for the filtered securities
         # Query daily data for the most recent date <= as_of_date for each permno
-        all_paths = self._get_validated_paths_from_manifest(manifest)
-
-        if not all_paths:
+        conn, catalog = self._pit_connection(manifest)
+        if not catalog.has_data(self.DATASET_NAME):
             return filtered
 
-        conn = self._ensure_connection()
-        filtered_permnos = filtered["permno"].to_list()
-
-        # Get the ticker/cusip as of as_of_date (most recent row <= as_of_date)
-        query = """
+        # Get the ticker/cusip as of as_of_date (most recent row <= as_of_date),
+        # semi-joining the universe against the catalog's metadata table
+        query = f"""
             WITH latest_rows AS (
                 SELECT
                     permno,
@@ -292,21 +300,18 @@ class CRSPLocalProvider:
                     cusip,
                     date,
                     ROW_NUMBER() OVER (PARTITION BY permno ORDER BY date DESC) as rn
-                FROM read_parquet($paths)
-                WHERE permno = ANY($permnos) AND date <= $as_of_date
+                FROM {catalog.relation(self.DATASET_NAME)}
+                WHERE date <= $as_of_date
+                    AND permno IN (
+                        SELECT permno FROM {self.METADATA_TABLE}
+                        WHERE {" AND ".join(universe_clauses)}
+                    )
             )
             SELECT permno, ticker, cusip
             FROM latest_rows
             WHERE rn = 1
         """
-        pit_data = conn.execute(
-            query,
-            {
-                "paths": [str(p) for p in all_paths],
-                "permnos": filtered_permnos,
-                "as_of_date": as_of_date,
-            },
-        ).pl()
+        pit_data = conn.execute(query, {"as_of_date": as_of_date}).pl()
 
         # Join point-in-time ticker/cusip with first_date/last_date
         result = filtered.select(["permno", "first_date", "last_date"]).join(
@@ -360,18 +365,18 @@ class CRSPLocalProvider:
         if not paths:
             raise DataNotFoundError(f"No data available for {as_of_date}")
 
-        conn = self._ensure_connection()
+        conn, catalog = self._catalog_connection(manifest)
+        relation = catalog.relation(self.DATASET_NAME, [as_of_date.year])
 
         # Use parameterized query to find PERMNOs with this ticker on as_of_date
-        query = """
+        query = f"""
             SELECT DISTINCT permno
-            FROM read_parquet($paths)
+            FROM {relation}
             WHERE ticker = $ticker AND date = $as_of_date
         """
         result = conn.execute(
             query,
             {
-                "paths": [str(p) for p in paths],
                 "ticker": ticker.upper(),
                 "as_of_date": as_of_date,
             },
@@ -425,18 +430,18 @@ class CRSPLocalProvider:
         if not paths:
             raise DataNotFoundError(f"No data available for {as_of_date}")
 
-        conn = self._ensure_connection()
+        conn, catalog = self._catalog_connection(manifest)
+        relation = catalog.relation(self.DATASET_NAME, [as_of_date.year])
 
         # Use parameterized query
-        query = """
+        query = f"""
             SELECT DISTINCT ticker
-            FROM read_parquet($paths)
+            FROM {relation}
             WHERE permno = $permno AND date = $as_of_date
         """
         result = conn.execute(
             query,
             {
-                "paths": [str(p) for p in paths],
                 "permno": permno,
                 "as_of_date": as_of_date,
             },
@@ -480,21 +485,18 @@ class CRSPLocalProvider:
         manifest = self._get_manifest()
         pinned_version = manifest.manifest_version
 
-        # Security: Use validated paths to prevent path traversal
-        paths = self._get_validated_paths_from_manifest(manifest)
-
-        if not paths:
+        # Security: views only cover manifest paths validated against data_root
+        conn, catalog = self._catalog_connection(manifest)
+        if not catalog.has_data(self.DATASET_NAME):
             raise DataNotFoundError("No CRSP data available")
 
-        conn = self._ensure_connection()
-
-        query = """
+        query = f"""
             SELECT date, ticker, prc, ret, vol
-            FROM read_parquet($paths)
+            FROM {catalog.relation(self.DATASET_NAME)}
             WHERE permno = $permno
             ORDER BY date
         """
-        result = conn.execute(query, {"paths": [str(p) for p in paths], "permno": permno}).pl()
+        result = conn.execute(query, {"permno": permno}).pl()
 
         # Verify manifest version unchanged (snapshot consistency)
         current_manifest = self._get_manifest()
@@ -509,6 +511,20 @@ class CRSPLocalProvider:
 
         return result
 
+    def get_manifest_paths(self, manifest: SyncManifest) -> list[Path]:
+        """Get every partition path of a manifest that queries would read.
+
+        Includes incremental delta partitions; paths outside data_root are
+        skipped, exactly as for queries.
+
+        Args:
+            manifest: Manifest to resolve (e.g. one pinned by the caller).
+
+        Returns:
+            List of parquet file paths.
+        """
+        return self._get_validated_paths_from_manifest(manifest)
+
     def _get_manifest(self) -> SyncManifest:
         """Load manifest for CRSP daily data.
 
@@ -531,7 +547,8 @@ class CRSPLocalProvider:
         """Get partition paths from manifest for date range.
 
         Uses manifest file_paths (not filesystem) for consistency.
-        Only returns paths for years overlapping with date range.
+        Only returns paths for years overlapping with date range, including
+        any incremental delta partitions registered for those years.
 
         Args:
             manifest: Current manifest.
@@ -546,22 +563,19 @@ class CRSPLocalProvider:
 
         for path_str in manifest.file_paths:
             path = Path(path_str)
-            # Extract year from filename (e.g., "2024.parquet" -> 2024)
-            try:
-                year = int(path.stem)
-                if year in needed_years:
-                    # Verify path is within data_root (security)
-                    resolved = path.resolve()
-                    if resolved.is_relative_to(self.data_root):
-                        paths.append(path)
-                    else:
-                        logger.warning(
-                            "Skipping path outside data_root: %s",
-                            path,
-                        )
-            except ValueError:
-                # Filename doesn't match year pattern
+            # Year from base ("2024.parquet") or incremental delta partitions
+            year = partition_year(path)
+            if year is None or year not in needed_years:
                 continue
+            # Verify path is within data_root (security)
+            resolved = path.resolve()
+            if resolved.is_relative_to(self.data_root):
+                paths.append(path)
+            else:
+                logger.warning(
+                    "Skipping path outside data_root: %s",
+                    path,
+                )
 
         return paths
 
@@ -598,6 +612,7 @@ class CRSPLocalProvider:
 
     def _execute_query(
         self,
+        manifest: SyncManifest,
         partition_paths: list[Path],
         start_date: date,
         end_date: date,
@@ -607,11 +622,17 @@ class CRSPLocalProvider:
         columns: list[str] | None,
         adjust_prices: bool,
     ) -> pl.DataFrame:
-        """Execute parameterized DuckDB query.
+        """Execute parameterized DuckDB query against the catalog views.
 
         All filtering uses parameterized queries to prevent SQL injection.
+        Only the year views covering ``partition_paths`` are scanned.
         """
-        conn = self._ensure_connection()
+        conn, catalog = (
+            self._pit_connection(manifest)
+            if as_of_date is not None
+            else self._catalog_connection(manifest)
+        )
+        years = {year for p in partition_paths if (year := partition_year(p)) is not None}
 
         # Build column list
         # When adjust_prices=True, we must use explicit columns (not *)
@@ -633,7 +654,6 @@ class CRSPLocalProvider:
 
         # Build WHERE clause with parameters
         params: dict[str, Any] = {
-            "paths": [str(p) for p in partition_paths],
             "start_date": start_date,
             "end_date": end_date,
         }
@@ -650,18 +670,19 @@ class CRSPLocalProvider:
             where_clauses.append("permno = ANY($permnos)")
 
         if as_of_date is not None:
-            # Point-in-time: exclude securities that IPO'd after as_of_date
-            # This requires knowing each security's first trade date
-            metadata = self._get_security_metadata()
-            valid_permnos = metadata.filter(pl.col("first_date") <= as_of_date)["permno"].to_list()
-            params["valid_permnos"] = valid_permnos
-            where_clauses.append("permno = ANY($valid_permnos)")
+            # Point-in-time: exclude securities that IPO'd after as_of_date.
+            # Semi-join against the materialized first trade dates.
+            params["as_of_date"] = as_of_date
+            where_clauses.append(
+                f"permno IN (SELECT permno FROM {self.METADATA_TABLE} "
+                "WHERE first_date <= $as_of_date)"
+            )
 
         where_sql = " AND ".join(where_clauses)
 
         query = f"""
             SELECT {col_expr}
-            FROM read_parquet($paths)
+            FROM {catalog.relation(self.DATASET_NAME, years)}
             WHERE {where_sql}
             ORDER BY date, permno
         """
@@ -719,24 +740,49 @@ class CRSPLocalProvider:
             self._security_metadata_version = manifest.manifest_version
             return self._security_metadata
 
-        conn = self._ensure_connection()
+        conn, catalog = self._catalog_connection(manifest)
 
         # Compute first/last dates per PERMNO, get latest ticker/cusip
-        query = """
+        query = f"""
             SELECT
                 permno,
                 LAST(ticker ORDER BY date) AS ticker,
                 LAST(cusip ORDER BY date) AS cusip,
                 MIN(date) AS first_date,
                 MAX(date) AS last_date
-            FROM read_parquet($paths)
+            FROM {catalog.relation(self.DATASET_NAME)}
             GROUP BY permno
         """
-        self._security_metadata = conn.execute(query, {"paths": [str(p) for p in paths]}).pl()
+        self._security_metadata = conn.execute(query).pl()
         self._security_metadata_version = manifest.manifest_version
 
         return self._security_metadata
 
+    def _catalog_connection(
+        self, manifest: SyncManifest
+    ) -> tuple[duckdb.DuckDBPyConnection, ManifestCatalog]:
+        """Get the thread's connection with views registered for ``manifest``.
+
+        Views are rebuilt only when the manifest identity changes; manifest
+        paths are validated only for a rebuild.
+        """
+        conn = self._ensure_connection()
+        catalog: ManifestCatalog = self._thread_local.catalog
+        if not catalog.is_current(self.DATASET_NAME, manifest):
+            catalog.sync_views(
+                self.DATASET_NAME, manifest, self._get_validated_paths_from_manifest(manifest)
+            )
+        return conn, catalog
+
+    def _pit_connection(
+        self, manifest: SyncManifest
+    ) -> tuple[duckdb.DuckDBPyConnection, ManifestCatalog]:
+        """Like _catalog_connection, plus the security metadata table for PIT joins."""
+        metadata = self._get_security_metadata(manifest)
+        conn, catalog = self._catalog_connection(manifest)
+        catalog.sync_table(self.METADATA_TABLE, metadata)
+        return conn, catalog
+
     def _ensure_connection(self) -> duckdb.DuckDBPyConnection:
         """Get or create thread-local DuckDB in-memory connection.
 
@@ -764,6 +810,7 @@ class CRSPLocalProvider:
             # Limit threads for reader
             conn.execute("PRAGMA threads=4")
             self._thread_local.conn = conn
+            self._thread_local.catalog = ManifestCatalog(conn)
 
         return conn
 
@@ -799,6 +846,7 @@ class CRSPLocalProvider:
         if conn is not None:
             conn.close()
             self._thread_local.conn = None
+            self._thread_local.catalog = None
             logger.debug("DuckDB connection closed for current thread")
 
     def __enter__(self) -> CRSPLocalProvider:
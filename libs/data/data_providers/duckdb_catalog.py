@@ -0,0 +1,244 @@
+"""Manifest-versioned DuckDB view catalog for local Parquet providers.
+
+Local providers (CRSP, Compustat) previously passed the manifest's file list
+to ``read_parquet($paths)`` on every query and pushed PIT security lists in
+as ``ANY($list)`` parameters. This module keeps the catalog on the
+provider's (thread-local) connection instead:
+
+- One view per dataset over all manifest partitions, plus one view per
+  partition year (base + delta files) so date-ranged queries only open the
+  years they need.
+- Registered in-memory tables (e.g. security metadata) that queries can
+  semi-join against.
+
+Views are tagged with the manifest identity (version + checksum) they were
+built from and are only recreated when it changes, so steady-state
+queries pay no per-call catalog or path-list cost. Keying on the checksum as
+well as the version keeps rollbacks (which lower the version) safe.
+
+When a warm worker has preloaded the same manifest into the process-wide
+SnapshotMemoryStore, views scan the memory-mapped Arrow tables instead of
+the Parquet files.
+
+This module provides:
+- ManifestCatalog: Per-connection view/table registry keyed by manifest
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import duckdb
+import polars as pl
+import pyarrow as pa  # type: ignore[import-untyped]
+
+from libs.data.data_providers.snapshot_memory_store import preloaded_table
+from libs.data.data_providers.sync_file_utils import partition_year
+from libs.data.data_quality.manifest import SyncManifest
+
+logger = logging.getLogger(__name__)
+
+ManifestKey = tuple[int, str]
+
+
+def manifest_key(manifest: SyncManifest) -> ManifestKey:
+    """Return the identity a catalog entry is valid for."""
+    return (manifest.manifest_version, manifest.checksum)
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _parquet_source(paths: Sequence[Path]) -> str:
+    """Render a ``read_parquet([...])`` call with SQL-escaped path literals.
+
+    View definitions cannot take bound parameters, so paths are embedded
+    as string literals. Callers only pass manifest paths already validated
+    against the provider's data root.
+    """
+    literals = ", ".join("'" + str(p).replace("'", "''") + "'" for p in paths)
+    return f"read_parquet([{literals}])"
+
+
+class ManifestCatalog:
+    """Views and tables on one DuckDB connection, rebuilt per manifest identity.
+
+    Not thread-safe: like the connection it wraps, each thread owns its own
+    catalog.
+
+    Example:
+        catalog = ManifestCatalog(conn)
+        catalog.sync_views("crsp_daily", manifest, paths)
+        conn.execute(f"SELECT * FROM {catalog.relation('crsp_daily', [2024])}")
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Initialize an empty catalog.
+
+        Args:
+            conn: Connection the views and tables are registered on.
+        """
+        self.conn = conn
+        self._view_keys: dict[str, ManifestKey] = {}
+        self._view_years: dict[str, frozenset[int]] = {}
+        self._populated: set[str] = set()
+        self._tables: dict[str, pl.DataFrame] = {}
+        self._preloaded: dict[str, list[str]] = {}
+
+    def is_current(self, name: str, manifest: SyncManifest) -> bool:
+        """Return True if the views for ``name`` were built for ``manifest``.
+
+        Lets callers skip resolving and validating manifest paths when
+        ``sync_views`` would be a no-op.
+        """
+        return self._view_keys.get(name) == manifest_key(manifest)
+
+    def has_data(self, name: str) -> bool:
+        """Return True if the views for ``name`` cover at least one file."""
+        return name in self._populated
+
+    def sync_views(self, name: str, manifest: SyncManifest, paths: Sequence[Path]) -> bool:
+        """Ensure the views for ``name`` reflect ``manifest``.
+
+        Creates ``name`` over all paths and ``name__y{year}`` per partition
+        year. No-op when the views were already built for this manifest.
+        Views read preloaded snapshot tables when every path is preloaded
+        for this manifest, and the Parquet files otherwise.
+
+        Args:
+            name: Dataset view name (e.g. ``crsp_daily``).
+            manifest: Manifest the paths were resolved from.
+            paths: Validated Parquet paths from the manifest.
+
+        Returns:
+            True if the views were (re)built.
+        """
+        if self.is_current(name, manifest):
+            return False
+
+        self._drop_views(name)
+
+        by_year: dict[int, list[Path]] = defaultdict(list)
+        for path in paths:
+            year = partition_year(path)
+            if year is not None:
+                by_year[year].append(path)
+
+        sources = self._preloaded_sources(name, manifest, paths, by_year)
+        if paths:
+            self.conn.execute(
+                f"CREATE OR REPLACE VIEW {_quote_identifier(name)} AS "
+                f"SELECT * FROM {sources.get(name) or _parquet_source(paths)}"
+            )
+        for year, year_paths in by_year.items():
+            view = self._year_view(name, year)
+            self.conn.execute(
+                f"CREATE OR REPLACE VIEW {_quote_identifier(view)} AS "
+                f"SELECT * FROM {sources.get(view) or _parquet_source(year_paths)}"
+            )
+
+        self._view_keys[name] = manifest_key(manifest)
+        self._view_years[name] = frozenset(by_year)
+        if paths:
+            self._populated.add(name)
+        else:
+            self._populated.discard(name)
+        logger.debug(
+            "Rebuilt DuckDB catalog views",
+            extra={
+                "event": "duckdb_catalog.views_rebuilt",
+                "dataset": name,
+                "manifest_version": manifest.manifest_version,
+                "files": len(paths),
+                "years": len(by_year),
+                "preloaded": bool(sources),
+            },
+        )
+        return True
+
+    def relation(self, name: str, years: Iterable[int] | None = None) -> str:
+        """Return a FROM-clause expression for a dataset.
+
+        Args:
+            name: Dataset view name registered via ``sync_views``.
+            years: Restrict to these partition years (default: all years).
+
+        Returns:
+            A view name, or a parenthesised ``UNION ALL`` of year views.
+
+        Raises:
+            KeyError: If the views are not registered or no requested year
+                has data (callers check ``has_data`` first).
+        """
+        if name not in self._view_keys:
+            raise KeyError(f"Views for '{name}' are not registered")
+        if years is None:
+            if name not in self._populated:
+                raise KeyError(f"No partitions registered for '{name}'")
+            return _quote_identifier(name)
+
+        selected = sorted(set(years) & self._view_years[name])
+        if not selected:
+            raise KeyError(f"No partitions registered for '{name}' in years {sorted(years)}")
+        views = [_quote_identifier(self._year_view(name, year)) for year in selected]
+        if len(views) == 1:
+            return views[0]
+        return "(" + " UNION ALL ".join(f"SELECT * FROM {v}" for v in views) + ")"
+
+    def sync_table(self, name: str, df: pl.DataFrame) -> None:
+        """Register ``df`` as an in-memory table, replacing any previous frame.
+
+        Providers cache one materialized frame per manifest version and pass
+        the same object on every call, so re-registration only happens when
+        that cache is rebuilt.
+
+        Args:
+            name: Table name.
+            df: Materialized data (registered zero-copy via Arrow).
+        """
+        if self._tables.get(name) is df:
+            return
+        self.conn.register(name, df)
+        self._tables[name] = df
+
+    def _preloaded_sources(
+        self,
+        name: str,
+        manifest: SyncManifest,
+        paths: Sequence[Path],
+        by_year: dict[int, list[Path]],
+    ) -> dict[str, str]:
+        """Register preloaded tables for each view; empty if any is missing."""
+        wanted: dict[str, Sequence[Path]] = {name: paths} if paths else {}
+        wanted.update({self._year_view(name, year): p for year, p in by_year.items()})
+        tables: dict[str, pa.Table] = {}
+        for view, view_paths in wanted.items():
+            table = preloaded_table(name, manifest, view_paths)
+            if table is None:
+                return {}
+            tables[view] = table
+
+        registered = []
+        for view, table in tables.items():
+            table_name = f"{view}__mem"
+            self.conn.register(table_name, table)
+            registered.append(table_name)
+        self._preloaded[name] = registered
+        return {view: _quote_identifier(f"{view}__mem") for view in tables}
+
+    def _drop_views(self, name: str) -> None:
+        for year in self._view_years.get(name, frozenset()):
+            self.conn.execute(
+                f"DROP VIEW IF EXISTS {_quote_identifier(self._year_view(name, year))}"
+            )
+        self.conn.execute(f"DROP VIEW IF EXISTS {_quote_identifier(name)}")
+        for table_name in self._preloaded.pop(name, []):
+            self.conn.unregister(table_name)
+
+    @staticmethod
+    def _year_view(name: str, year: int) -> str:
+        return f"{name}__y{year}"
@@ -33,7 +33,6 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 import polars as pl
 
-from libs.data.data_pipeline.helpers import normalized_symbols_from_frame
 from libs.data.data_pipeline.read_time_adjustment import derive_split_adjusted_prices
 from libs.data.data_providers.registry import ProviderCapabilities, ProviderType, get_provider_spec
 from libs.data.data_quality.exceptions import DataCoverageError, DataNotFoundError
@@ -585,7 +584,7 @@ class AlpacaSIPDataProviderAdapter:
         return df.select(UNIFIED_COLUMNS)
 
     def _derive_read_time_adjusted_prices(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Derive adjusted SIP returns when a paired corp-actions manifest exists."""
+        """Derive adjusted SIP returns from cached corp-action manifest split factors."""
         if df.is_empty() or "date" not in df.columns or "symbol" not in df.columns:
             return df
         if "adj_close" in df.columns and df["adj_close"].null_count() == 0:
@@ -601,13 +600,10 @@ class AlpacaSIPDataProviderAdapter:
         end_date = date_bounds["end_date"]
         if not isinstance(start_date, date) or not isinstance(end_date, date):
             return df
-        symbols = normalized_symbols_from_frame(df)
         try:
-            corporate_actions = self._provider.get_corporate_actions(
+            split_factors = self._provider.get_split_factor_table(
                 start_date=start_date,
                 coverage_end_date=end_date,
-                date_basis="effective_date",
-                symbols=symbols,
             )
         except DataCoverageError as exc:
             raise DataProviderError(
@@ -619,7 +615,7 @@ class AlpacaSIPDataProviderAdapter:
             raise DataProviderError(f"Alpaca SIP corporate-action query failed: {exc}") from exc
 
         try:
-            return derive_split_adjusted_prices(df, corporate_actions).frame
+            return derive_split_adjusted_prices(df, split_factors).frame
         except Exception as exc:
             raise DataProviderError(f"Alpaca SIP read-time adjustment failed: {exc}") from exc
 
@@ -0,0 +1,281 @@
+"""Preloaded, memory-mapped snapshot partitions shared with forked workers.
+
+Every backtest job used to re-open and decode the same manifest Parquet
+partitions (CRSP daily, Alpaca SIP daily) before it could compute anything.
+A long-lived worker parent can instead decode the active snapshot once into
+Arrow IPC files on tmpfs (``/dev/shm``) and memory-map them. Jobs run in
+forked children that inherit the mapped tables copy-on-write; the pages are
+read-only, so every child shares the parent's single physical copy.
+
+Local providers consult the process-wide store (when one is installed) and
+scan the mapped Arrow tables zero-copy through DuckDB instead of
+``read_parquet``. Entries are keyed by manifest identity (version + checksum)
+and only served when the caller's manifest and paths match, so a manifest
+change simply falls back to Parquet until the owner reloads the dataset.
+
+Layout:
+    {root}/worker-{pid}/{dataset}-v{version}-{checksum[:16]}-{index}.arrow
+
+This module provides:
+- SnapshotMemoryStore: Manifest-keyed Arrow IPC partitions memory-mapped from tmpfs
+- get_snapshot_store / set_snapshot_store: Process-wide store used by local providers
+- preloaded_table: Preloaded table for a manifest's paths, if available
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from libs.data.data_quality.manifest import SyncManifest
+
+logger = logging.getLogger(__name__)
+
+TMPFS_ROOT = Path("/dev/shm")
+STORE_DIRNAME = "trading_platform_snapshots"
+
+
+def default_store_root() -> Path:
+    """Return the tmpfs-backed store root, falling back to the temp directory."""
+    base = TMPFS_ROOT if TMPFS_ROOT.is_dir() else Path(tempfile.gettempdir())
+    return base / STORE_DIRNAME
+
+
+# Same identity as duckdb_catalog.manifest_key (not imported: the catalog imports this module)
+ManifestKey = tuple[int, str]
+
+
+def _manifest_key(manifest: SyncManifest) -> ManifestKey:
+    return (manifest.manifest_version, manifest.checksum)
+
+
+def _path_key(path: Path | str) -> str:
+    """Canonical key for a partition path (manifest paths may be relative)."""
+    return os.path.realpath(path)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    key: ManifestKey
+    tables: dict[str, pa.Table]
+    files: tuple[Path, ...]
+
+
+class SnapshotMemoryStore:
+    """Manifest-versioned Arrow partitions memory-mapped from tmpfs.
+
+    Only the owning process (the one that created the store) loads and
+    evicts datasets; forked children read the inherited mappings. Files are
+    unlinked on eviction, but tables already mapped by running children stay
+    valid until those children exit.
+
+    Example:
+        store = SnapshotMemoryStore()
+        store.load("crsp_daily", manifest, paths)
+        set_snapshot_store(store)
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        """Initialize an empty store.
+
+        Args:
+            root: Directory for the Arrow IPC files (default: tmpfs).
+        """
+        self._owner_pid = os.getpid()
+        self.root = (root or default_store_root()) / f"worker-{self._owner_pid}"
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def datasets(self) -> dict[str, ManifestKey]:
+        """Manifest identity currently loaded per dataset."""
+        return {name: entry.key for name, entry in self._entries.items()}
+
+    @property
+    def nbytes(self) -> int:
+        """Total mapped size of all loaded partitions."""
+        return sum(
+            table.nbytes for entry in self._entries.values() for table in entry.tables.values()
+        )
+
+    def load(self, dataset: str, manifest: SyncManifest, paths: Sequence[Path]) -> bool:
+        """Preload ``paths`` for ``dataset`` unless already loaded for ``manifest``.
+
+        The previous entry for the dataset (if any) is evicted once the new
+        partitions are mapped.
+
+        Args:
+            dataset: Dataset name (e.g. ``crsp_daily``).
+            manifest: Manifest the paths were resolved from.
+            paths: Validated Parquet partition paths.
+
+        Returns:
+            True if the dataset was (re)loaded.
+
+        Raises:
+            RuntimeError: If called from a process other than the owner.
+        """
+        self._check_owner()
+        key = _manifest_key(manifest)
+        current = self._entries.get(dataset)
+        if current is not None and current.key == key:
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        prefix = f"{dataset}-v{manifest.manifest_version}-{manifest.checksum[:16]}"
+        tables: dict[str, pa.Table] = {}
+        files: list[Path] = []
+        try:
+            for index, path in enumerate(paths):
+                target = self.root / f"{prefix}-{index:04d}.arrow"
+                tables[_path_key(path)] = self._materialize(Path(path), target)
+                files.append(target)
+        except Exception:
+            self._unlink(files)
+            raise
+
+        with self._lock:
+            previous = self._entries.get(dataset)
+            self._entries[dataset] = _Entry(key=key, tables=tables, files=tuple(files))
+        if previous is not None:
+            self._unlink(previous.files)
+
+        logger.info(
+            "Preloaded snapshot dataset",
+            extra={
+                "event": "snapshot_store.loaded",
+                "dataset": dataset,
+                "manifest_version": manifest.manifest_version,
+                "files": len(files),
+                "bytes": sum(t.nbytes for t in tables.values()),
+            },
+        )
+        return True
+
+    def tables(
+        self, dataset: str, manifest: SyncManifest, paths: Sequence[Path]
+    ) -> list[pa.Table] | None:
+        """Return mapped tables for ``paths``, or None if any is not preloaded.
+
+        Args:
+            dataset: Dataset name.
+            manifest: Manifest the caller pinned; must match the loaded entry.
+            paths: Partition paths the caller would otherwise read.
+
+        Returns:
+            Tables in ``paths`` order, or None to fall back to Parquet.
+        """
+        entry = self._entries.get(dataset)
+        if entry is None or entry.key != _manifest_key(manifest):
+            return None
+        selected = [entry.tables.get(_path_key(path)) for path in paths]
+        if any(table is None for table in selected):
+            return None
+        return [table for table in selected if table is not None]
+
+    def evict(self, dataset: str) -> bool:
+        """Drop ``dataset`` and unlink its files.
+
+        Returns:
+            True if the dataset was loaded.
+        """
+        self._check_owner()
+        with self._lock:
+            entry = self._entries.pop(dataset, None)
+        if entry is None:
+            return False
+        self._unlink(entry.files)
+        logger.info(
+            "Evicted snapshot dataset",
+            extra={"event": "snapshot_store.evicted", "dataset": dataset},
+        )
+        return True
+
+    def close(self) -> None:
+        """Evict everything and remove the store directory (owner only)."""
+        if os.getpid() != self._owner_pid:
+            return
+        with self._lock:
+            self._entries.clear()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    @staticmethod
+    def _materialize(source: Path, target: Path) -> pa.Table:
+        """Decode ``source`` into an Arrow IPC file and map it read-only."""
+        table = pq.read_table(source)
+        temp_path = target.with_suffix(".arrow.tmp")
+        try:
+            with pa.OSFile(str(temp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            temp_path.replace(target)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        del table
+        with pa.memory_map(str(target), "r") as mapped:
+            return pa.ipc.open_file(mapped).read_all()
+
+    @staticmethod
+    def _unlink(files: Sequence[Path]) -> None:
+        for path in files:
+            path.unlink(missing_ok=True)
+
+    def _check_owner(self) -> None:
+        if os.getpid() != self._owner_pid:
+            raise RuntimeError("SnapshotMemoryStore can only be modified by its owning process")
+
+
+_STORE: SnapshotMemoryStore | None = None
+
+
+def get_snapshot_store() -> SnapshotMemoryStore | None:
+    """Return the process-wide store, or None when preloading is disabled."""
+    return _STORE
+
+
+def set_snapshot_store(store: SnapshotMemoryStore | None) -> None:
+    """Install (or clear) the process-wide store consulted by local providers."""
+    global _STORE
+    _STORE = store
+
+
+def preloaded_table(dataset: str, manifest: SyncManifest, paths: Sequence[Path]) -> pa.Table | None:
+    """Return the preloaded partitions for ``paths`` as one table, if available.
+
+    Concatenation only stitches chunk references together; the data stays
+    in the shared mapping.
+
+    Args:
+        dataset: Dataset name.
+        manifest: Manifest the caller pinned.
+        paths: Partition paths the caller would otherwise read.
+
+    Returns:
+        Arrow table, or None when no store is installed, the manifest or a
+        path does not match, or the partition schemas cannot be unified.
+    """
+    store = _STORE
+    if store is None or not paths:
+        return None
+    tables = store.tables(dataset, manifest, paths)
+    if tables is None:
+        return None
+    if len(tables) == 1:
+        return tables[0]
+    try:
+        return pa.concat_tables(tables, promote_options="default")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        logger.warning(
+            "Preloaded partitions have incompatible schemas; reading Parquet",
+            extra={"event": "snapshot_store.schema_mismatch", "dataset": dataset},
+        )
+        return None
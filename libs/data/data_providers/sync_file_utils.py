@@ -2,18 +2,68 @@
 
 from __future__ import annotations
 
+import datetime
 import hashlib
 import logging
 import os
+import re
+import secrets
 from collections.abc import Sequence
 from pathlib import Path
 
 import polars as pl
 
+from libs.data.data_quality.checksums import FileHasher, sha256_file
 from libs.data.data_quality.exceptions import DiskSpaceError
 
 logger = logging.getLogger(__name__)
 
+# Incremental delta partitions:
+# ``{year}-delta-{YYYYMMDDTHHMMSSffffff}-{token}.parquet``, and compacted base
+# partitions: ``{year}-base-{YYYYMMDDTHHMMSSffffff}-{token}.parquet``. Neither
+# stem is an integer, so year-only parsers never mistake them for a legacy
+# ``{year}.parquet`` base. The second-resolution delta form written by earlier
+# versions is still recognised.
+_DELTA_STEM_RE = re.compile(r"^(\d{4})-delta-\d{8}T\d{6}(?:\d{6}-[0-9a-f]{8})?$")
+_BASE_STEM_RE = re.compile(r"^(\d{4})-base-\d{8}T\d{12}-[0-9a-f]{8}$")
+
+
+def _partition_suffix(created_at: datetime.datetime) -> str:
+    """Return a sortable, collision-free suffix for a partition file name."""
+    return f"{created_at.strftime('%Y%m%dT%H%M%S%f')}-{secrets.token_hex(4)}"
+
+
+def delta_partition_name(year: int, created_at: datetime.datetime) -> str:
+    """Return a unique file name for a delta partition of ``year``.
+
+    Names sort in creation order, which is the order deltas are applied in.
+    """
+    return f"{year}-delta-{_partition_suffix(created_at)}.parquet"
+
+
+def base_partition_name(year: int, created_at: datetime.datetime) -> str:
+    """Return a unique file name for a compacted base partition of ``year``.
+
+    Compaction never rewrites a base in place: it writes a new versioned file
+    that only the next manifest references, so readers of the previous
+    manifest keep a consistent base + delta set until the swap.
+    """
+    return f"{year}-base-{_partition_suffix(created_at)}.parquet"
+
+
+def is_delta_partition(path: Path) -> bool:
+    """Return True if ``path`` names a delta (not base) yearly partition."""
+    return _DELTA_STEM_RE.match(path.stem) is not None
+
+
+def partition_year(path: Path) -> int | None:
+    """Return the year of a base (legacy or versioned) or delta partition path."""
+    stem = path.stem
+    if stem.isdigit():
+        return int(stem)
+    match = _DELTA_STEM_RE.match(stem) or _BASE_STEM_RE.match(stem)
+    return int(match.group(1)) if match else None
+
 
 def atomic_write_parquet(df: pl.DataFrame, target_path: Path) -> str:
     """Write a Parquet file atomically and return the fsynced file checksum."""
@@ -35,11 +85,7 @@ def atomic_write_parquet(df: pl.DataFrame, target_path: Path) -> str:
 
 def compute_checksum(path: Path) -> str:
     """Return a SHA-256 checksum for a file."""
-    hasher = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    return sha256_file(path)
 
 
 def compute_checksum_and_fsync(path: Path) -> str:
@@ -52,12 +98,19 @@ def compute_checksum_and_fsync(path: Path) -> str:
     return hasher.hexdigest()
 
 
-def compute_combined_checksum_for_paths(paths: Sequence[Path]) -> str:
-    """Return a stable checksum over the checksums of existing paths."""
+def compute_combined_checksum_for_paths(
+    paths: Sequence[Path], file_hasher: FileHasher | None = None
+) -> str:
+    """Return a stable checksum over the checksums of existing paths.
+
+    Files are hashed concurrently; pass a cached ``file_hasher`` to skip
+    re-hashing files that have not changed since the last check.
+    """
+    existing = [path for path in sorted(paths, key=str) if path.exists()]
+    checksums = (file_hasher or FileHasher()).checksums(existing)
     hasher = hashlib.sha256()
-    for path in sorted(paths, key=str):
-        if path.exists():
-            hasher.update(compute_checksum(path).encode())
+    for path in existing:
+        hasher.update(checksums[path].encode())
     return hasher.hexdigest()
 
 
@@ -10,7 +10,14 @@ Features:
 - Progress checkpointing for crash recovery
 - Disk space monitoring
 - Schema drift detection
+- Delta partitions for incremental sync with deterministic compaction
 - Structured logging for alerting
+
+Incremental syncs append small per-year delta files under
+``{storage}/{dataset}/deltas/`` and register them in the manifest next to
+the yearly base partition, so a nightly run writes only the new rows.
+``compact_deltas`` folds deltas back into the base (the ``compact`` command
+of scripts/data/wrds_sync.py, run off the sync path).
 """
 
 from __future__ import annotations
@@ -27,6 +34,12 @@ import polars as pl
 from pydantic import BaseModel
 
 from libs.data.data_providers.locking import AtomicFileLock
+from libs.data.data_providers.sync_file_utils import (
+    base_partition_name,
+    delta_partition_name,
+    is_delta_partition,
+    partition_year,
+)
 from libs.data.data_providers.wrds_client import WRDSClient
 from libs.data.data_quality.exceptions import (
     DiskSpaceError,
@@ -94,6 +107,9 @@ class SyncManager:
     QUARANTINE_DIR = Path("data/quarantine")
     TMP_DIR = Path("data/tmp")
 
+    # Subdirectory of storage_path/{dataset} holding incremental delta partitions
+    DELTA_DIR = "deltas"
+
     # Disk space watermarks
     DISK_WARNING_PCT = 0.80
     DISK_CRITICAL_PCT = 0.90
@@ -396,8 +412,17 @@ class SyncManager:
                 end_date=datetime.date(end_year, 12, 31),
             )
 
-            # Save manifest
+            # Save manifest, then drop partitions it no longer references
+            # (old deltas and versioned bases) so glob readers never see them
+            previous_manifest = self.manifest_manager.load_manifest(dataset)
             self.manifest_manager.save_manifest(manifest, lock_token)
+            self._remove_partitions(
+                self._unreferenced_partitions(
+                    dataset,
+                    previous_manifest.file_paths if previous_manifest else [],
+                    file_paths,
+                )
+            )
 
             logger.info(
                 "Full sync completed",
@@ -416,6 +441,13 @@ class SyncManager:
     def incremental_sync(self, dataset: str) -> SyncManifest:
         """Execute incremental sync for new data since last sync.
 
+        For datasets with primary keys, new rows for a year that already has a
+        base partition are written as a small delta partition and registered
+        in the manifest; the base is left untouched. Rows that replace
+        existing keys (late corrections) or carry new columns are folded into
+        a new versioned base instead. Run compact_deltas to merge accumulated
+        deltas.
+
         Args:
             dataset: Dataset name.
 
@@ -460,6 +492,8 @@ class SyncManager:
         lock = AtomicFileLock(self.lock_dir, dataset)
         lock_token = lock.acquire(timeout_seconds=60.0)
         last_refresh = datetime.datetime.now(datetime.UTC)
+        # Partitions written by this run that no saved manifest references yet
+        pending: list[Path] = []
 
         try:
             # Determine years to update
@@ -475,38 +509,62 @@ class SyncManager:
 
             # Sync new data
             file_paths = list(current_manifest.file_paths)
-
-            # Start with zero - we'll recompute from actual files
-            total_rows = 0
-
-            # Track rows for years NOT being updated (use Path.name for cross-platform)
-            for file_path_str in file_paths:
-                file_path = Path(file_path_str)
-                if file_path.exists():
-                    # Check if this year is being updated using Path.name
-                    is_updated_year = any(
-                        file_path.name == f"{year}.parquet" for year in years_to_sync
-                    )
-                    if not is_updated_year:
-                        # Not being updated - count its rows
-                        df = pl.scan_parquet(file_path).select(pl.len()).collect()
-                        total_rows += df.item()
+            primary_keys = self.DATASET_PRIMARY_KEYS.get(dataset, [])
+            # Bases and deltas replaced by a compacted base are deleted only
+            # once the new manifest (which no longer references them) is saved
+            superseded: list[Path] = []
 
             for year in sorted(years_to_sync):
-                path, rows = self._sync_year_partition(
+                new_df = self._fetch_partition_data(
                     dataset,
                     year,
-                    lock_token,
                     incremental=True,
                     last_date=last_date if year == last_date.year else None,
                 )
-                # Update or add file path using Path.name for cross-platform
-                year_filename = f"{year}.parquet"
-                # Remove old path for this year if exists
-                file_paths = [p for p in file_paths if Path(p).name != year_filename]
-                file_paths.append(str(path))
-                # Add new partition rows
-                total_rows += rows
+                base_path = self._year_base_path(file_paths, year)
+                year_deltas = self._year_delta_paths(file_paths, year)
+
+                if not primary_keys or base_path is None or not base_path.exists():
+                    # No keys to fold deltas on (or no base yet): merge in place
+                    path, _ = self._sync_year_partition(
+                        dataset,
+                        year,
+                        lock_token,
+                        incremental=True,
+                        last_date=last_date if year == last_date.year else None,
+                        new_df=new_df,
+                    )
+                    # The rewritten {year}.parquet replaces every entry for
+                    # the year, including a stale versioned base and deltas
+                    stale = [p for p in file_paths if partition_year(Path(p)) == year]
+                    superseded.extend(Path(p) for p in stale if Path(p) != path)
+                    file_paths = [p for p in file_paths if p not in stale]
+                    file_paths.append(str(path))
+                elif new_df.is_empty():
+                    logger.debug(
+                        "No new data for partition, keeping existing",
+                        extra={"dataset": dataset, "year": year},
+                    )
+                else:
+                    new_df = new_df.unique(subset=primary_keys, keep="last", maintain_order=True)
+                    delta_df = self._align_to_base(new_df, base_path)
+                    if delta_df is not None and not self._keys_overlap(
+                        delta_df, [base_path, *year_deltas], primary_keys
+                    ):
+                        delta_path = self._write_year_delta(dataset, year, delta_df, sync_start)
+                        pending.append(delta_path)
+                        file_paths.append(str(delta_path))
+                    else:
+                        # Corrections or schema additions: write a new base with
+                        # existing deltas and new rows folded in
+                        new_base = self._compact_year(
+                            dataset, year, base_path, year_deltas, sync_start, new_df
+                        )
+                        pending.append(new_base)
+                        superseded.extend([base_path, *year_deltas])
+                        replaced = {str(p) for p in [base_path, *year_deltas]}
+                        file_paths = [p for p in file_paths if p not in replaced]
+                        file_paths.append(str(new_base))
 
                 # Refresh lock if needed
                 now = datetime.datetime.now(datetime.UTC)
@@ -521,6 +579,9 @@ class SyncManager:
                         },
                     )
 
+            # Recompute from actual files (bases + deltas)
+            total_rows = self._count_rows(file_paths)
+
             # Check SLO
             sync_duration = datetime.datetime.now(datetime.UTC) - sync_start
             if sync_duration.total_seconds() > self.INCREMENTAL_SYNC_SLO_MINUTES * 60:
@@ -544,6 +605,8 @@ class SyncManager:
             )
 
             self.manifest_manager.save_manifest(manifest, lock_token)
+            pending.clear()
+            self._remove_partitions(superseded)
 
             logger.info(
                 "Incremental sync completed",
@@ -555,6 +618,10 @@ class SyncManager:
             )
 
             return manifest
+        except BaseException:
+            # Nothing references partitions written by a failed run
+            self._remove_partitions(pending)
+            raise
         finally:
             lock.release(lock_token)
 
@@ -712,6 +779,101 @@ class SyncManager:
 
         return errors
 
+    def compact_deltas(self, dataset: str) -> SyncManifest:
+        """Fold incremental delta partitions into their yearly base partitions.
+
+        Each year is written to a new versioned base as base + deltas (applied
+        in creation order, later rows winning on primary key) sorted by primary
+        key, so the result is identical to merging every delta in place. The
+        previous base and the folded deltas are deleted only after the new
+        manifest has been saved; until then the old manifest stays consistent.
+
+        Args:
+            dataset: Dataset name.
+
+        Returns:
+            Updated SyncManifest (unchanged if there were no deltas).
+
+        Raises:
+            ValueError: If dataset name is invalid or no manifest exists.
+        """
+        # SECURITY: Validate dataset name to prevent path traversal
+        dataset = self._validate_dataset_name(dataset)
+
+        lock = AtomicFileLock(self.lock_dir, dataset)
+        lock_token = lock.acquire(timeout_seconds=60.0)
+        last_refresh = datetime.datetime.now(datetime.UTC)
+        # Compacted bases that no saved manifest references yet
+        pending: list[Path] = []
+
+        try:
+            # Load under the lock so a concurrent incremental sync cannot race us
+            current_manifest = self.manifest_manager.load_manifest(dataset)
+            if not current_manifest:
+                raise ValueError(f"No existing manifest for {dataset}. Run full_sync first.")
+
+            file_paths = list(current_manifest.file_paths)
+            delta_years = sorted(
+                {year for p in self._delta_paths(file_paths) if (year := partition_year(p))}
+            )
+            if not delta_years:
+                logger.info(
+                    "No delta partitions to compact",
+                    extra={"event": "sync.compact.noop", "dataset": dataset},
+                )
+                return current_manifest
+
+            compacted_at = datetime.datetime.now(datetime.UTC)
+            superseded: list[Path] = []
+            folded_deltas = 0
+            for year in delta_years:
+                year_deltas = self._year_delta_paths(file_paths, year)
+                base_path = self._year_base_path(file_paths, year)
+                new_base = self._compact_year(dataset, year, base_path, year_deltas, compacted_at)
+                pending.append(new_base)
+                folded_deltas += len(year_deltas)
+
+                replaced = [*year_deltas] if base_path is None else [base_path, *year_deltas]
+                superseded.extend(replaced)
+                replaced_strs = {str(p) for p in replaced}
+                file_paths = [p for p in file_paths if p not in replaced_strs]
+                file_paths.append(str(new_base))
+
+                # Refresh lock if needed
+                now = datetime.datetime.now(datetime.UTC)
+                if (now - last_refresh).total_seconds() >= lock.REFRESH_INTERVAL_SECONDS:
+                    lock_token = lock.refresh(lock_token)
+                    last_refresh = now
+
+            manifest = self._create_manifest(
+                dataset=dataset,
+                file_paths=file_paths,
+                row_count=self._count_rows(file_paths),
+                start_date=current_manifest.start_date,
+                end_date=current_manifest.end_date,
+            )
+            self.manifest_manager.save_manifest(manifest, lock_token)
+            pending.clear()
+            self._remove_partitions(superseded)
+
+            logger.info(
+                "Delta compaction completed",
+                extra={
+                    "event": "sync.compact.complete",
+                    "dataset": dataset,
+                    "years": delta_years,
+                    "deltas_folded": folded_deltas,
+                },
+            )
+
+            return manifest
+        except BaseException:
+            # Nothing references bases compacted by a failed run
+            self._remove_partitions(pending)
+            raise
+        finally:
+            lock.release(lock_token)
+
     # Primary key columns for deduplication during incremental sync
     DATASET_PRIMARY_KEYS: dict[str, list[str]] = {
         "crsp_daily": ["date", "permno"],
@@ -727,6 +889,7 @@ class SyncManager:
         lock_token: LockToken,
         incremental: bool = False,
         last_date: datetime.date | None = None,
+        new_df: pl.DataFrame | None = None,
     ) -> tuple[Path, int]:
         """Sync a single year partition.
 
@@ -736,57 +899,13 @@ class SyncManager:
             lock_token: Exclusive lock token.
             incremental: If True, merge new data with existing.
             last_date: For incremental sync, fetch data after this date.
+            new_df: Already fetched (and drift-checked) data; queried if None.
 
         Returns:
             Tuple of (file_path, row_count).
         """
-        # Build parameterized query
-        query, params = self._build_query(dataset, year, incremental, last_date)
-
-        logger.debug(
-            "Syncing year partition",
-            extra={
-                "dataset": dataset,
-                "year": year,
-                "incremental": incremental,
-            },
-        )
-
-        # Execute query with params (prevents SQL injection)
-        new_df = self.wrds_client.execute_query(query, params)
-
-        if new_df.is_empty() and not incremental:
-            logger.warning(
-                "No data for year",
-                extra={"dataset": dataset, "year": year},
-            )
-
-        # Validate schema
-        current_schema = {col: str(new_df.schema[col]) for col in new_df.columns}
-        drift = self.schema_registry.detect_drift(dataset, current_schema)
-
-        if drift.is_breaking:
-            logger.error(
-                "Breaking schema drift",
-                extra={
-                    "event": "sync.schema.breaking",
-                    "dataset": dataset,
-                    "removed": drift.removed_columns,
-                    "changed": drift.changed_columns,
-                },
-            )
-            raise SchemaError(drift, f"Breaking schema drift for {dataset}")
-
-        if drift.has_additions:
-            logger.warning(
-                "New columns detected",
-                extra={
-                    "event": "sync.schema.additions",
-                    "dataset": dataset,
-                    "new_columns": drift.added_columns,
-                },
-            )
-            self.schema_registry.apply_drift_policy(dataset, drift, current_schema)
+        if new_df is None:
+            new_df = self._fetch_partition_data(dataset, year, incremental, last_date)
 
         # Prepare output path
         output_dir = self.storage_path / dataset
@@ -874,6 +993,298 @@ class SyncManager:
 
         return output_path, df.height
 
+    def _fetch_partition_data(
+        self,
+        dataset: str,
+        year: int,
+        incremental: bool = False,
+        last_date: datetime.date | None = None,
+    ) -> pl.DataFrame:
+        """Query one year partition from WRDS and check it for schema drift.
+
+        Args:
+            dataset: Dataset name.
+            year: Year to fetch.
+            incremental: If True, only fetch data after last_date.
+            last_date: For incremental sync, fetch data after this date.
+
+        Returns:
+            Fetched DataFrame (may be empty).
+
+        Raises:
+            SchemaError: If the fetched data has breaking schema drift.
+        """
+        # Build parameterized query
+        query, params = self._build_query(dataset, year, incremental, last_date)
+
+        logger.debug(
+            "Syncing year partition",
+            extra={
+                "dataset": dataset,
+                "year": year,
+                "incremental": incremental,
+            },
+        )
+
+        # Execute query with params (prevents SQL injection)
+        new_df = self.wrds_client.execute_query(query, params)
+
+        if new_df.is_empty() and not incremental:
+            logger.warning(
+                "No data for year",
+                extra={"dataset": dataset, "year": year},
+            )
+
+        # Validate schema
+        current_schema = {col: str(new_df.schema[col]) for col in new_df.columns}
+        drift = self.schema_registry.detect_drift(dataset, current_schema)
+
+        if drift.is_breaking:
+            logger.error(
+                "Breaking schema drift",
+                extra={
+                    "event": "sync.schema.breaking",
+                    "dataset": dataset,
+                    "removed": drift.removed_columns,
+                    "changed": drift.changed_columns,
+                },
+            )
+            raise SchemaError(drift, f"Breaking schema drift for {dataset}")
+
+        if drift.has_additions:
+            logger.warning(
+                "New columns detected",
+                extra={
+                    "event": "sync.schema.additions",
+                    "dataset": dataset,
+                    "new_columns": drift.added_columns,
+                },
+            )
+            self.schema_registry.apply_drift_policy(dataset, drift, current_schema)
+
+        return new_df
+
+    # =========================================================================
+    # Delta partitions
+    # =========================================================================
+
+    @staticmethod
+    def _delta_paths(file_paths: list[str]) -> list[Path]:
+        """Return manifest entries that are delta partitions."""
+        return [Path(p) for p in file_paths if is_delta_partition(Path(p))]
+
+    @staticmethod
+    def _year_base_path(file_paths: list[str], year: int) -> Path | None:
+        """Return the manifest's base partition (legacy or versioned) for ``year``."""
+        for file_path in file_paths:
+            path = Path(file_path)
+            if not is_delta_partition(path) and partition_year(path) == year:
+                return path
+        return None
+
+    def _year_delta_paths(self, file_paths: list[str], year: int) -> list[Path]:
+        """Return the delta partitions of ``year`` in application order."""
+        return sorted(
+            (p for p in self._delta_paths(file_paths) if partition_year(p) == year),
+            key=lambda p: p.name,
+        )
+
+    @staticmethod
+    def _count_rows(file_paths: list[str]) -> int:
+        """Count rows across existing partition files (footer reads only)."""
+        total = 0
+        for file_path_str in file_paths:
+            file_path = Path(file_path_str)
+            if file_path.exists():
+                total += pl.scan_parquet(file_path).select(pl.len()).collect().item()
+        return total
+
+    @staticmethod
+    def _align_to_base(df: pl.DataFrame, base_path: Path) -> pl.DataFrame | None:
+        """Cast ``df`` to the base partition's column order and dtypes.
+
+        Readers union partitions positionally, so a delta must match its base
+        exactly. Returns None if the columns differ (e.g. after a schema
+        addition) or a value cannot be cast; such rows are merged into the
+        base instead.
+        """
+        base_schema = pl.scan_parquet(base_path).collect_schema()
+        if set(base_schema.names()) != set(df.columns):
+            return None
+        try:
+            return df.select([pl.col(name).cast(dtype) for name, dtype in base_schema.items()])
+        except pl.exceptions.PolarsError:
+            return None
+
+    @staticmethod
+    def _keys_overlap(df: pl.DataFrame, paths: list[Path], primary_keys: list[str]) -> bool:
+        """Return True if any primary key of ``df`` already exists in ``paths``.
+
+        Incremental queries start after the manifest end date, so overlap only
+        happens for late corrections. The scan is bounded to the new rows'
+        leading-key range, letting Parquet statistics skip most row groups.
+        """
+        lead = primary_keys[0]
+        lo, hi = df[lead].min(), df[lead].max()
+        existing = pl.concat(
+            [
+                pl.scan_parquet(p)
+                .select(primary_keys)
+                .filter(pl.col(lead).is_between(pl.lit(lo), pl.lit(hi)))
+                for p in paths
+            ]
+        )
+        overlap = existing.join(df.lazy().select(primary_keys), on=primary_keys, how="semi")
+        return overlap.limit(1).collect().height > 0
+
+    def _write_year_delta(
+        self,
+        dataset: str,
+        year: int,
+        df: pl.DataFrame,
+        created_at: datetime.datetime,
+    ) -> Path:
+        """Validate and atomically write a delta partition for ``year``.
+
+        Args:
+            dataset: Dataset name.
+            year: Year the rows belong to.
+            df: New rows, already aligned to the base partition schema.
+            created_at: Sync start time (orders deltas within a year).
+
+        Returns:
+            Path of the written delta partition.
+        """
+        delta_dir = self.storage_path / dataset / self.DELTA_DIR
+        delta_dir.mkdir(parents=True, exist_ok=True)
+        delta_path = delta_dir / delta_partition_name(year, created_at)
+
+        df = df.sort(self.DATASET_PRIMARY_KEYS[dataset])
+        self._validate_partition(df, dataset, year)
+        checksum = self._atomic_write_parquet(df, delta_path)
+
+        logger.info(
+            "Delta partition written",
+            extra={
+                "event": "sync.delta.written",
+                "dataset": dataset,
+                "year": year,
+                "rows": df.height,
+                "path": str(delta_path),
+                "checksum": checksum[:16],
+            },
+        )
+        return delta_path
+
+    def _compact_year(
+        self,
+        dataset: str,
+        year: int,
+        base_path: Path | None,
+        deltas: list[Path],
+        created_at: datetime.datetime,
+        new_df: pl.DataFrame | None = None,
+    ) -> Path:
+        """Write a new versioned base partition with deltas (and new rows) folded in.
+
+        Sources are applied in order base, deltas, new_df; the last row for
+        each primary key wins and the output is sorted by primary key, which
+        matches the in-place merge of _sync_year_partition. The current base
+        is left untouched; the caller swaps the manifest entry and deletes the
+        superseded files once the new manifest is saved.
+
+        Args:
+            dataset: Dataset name.
+            year: Partition year.
+            base_path: Current yearly base partition, if any.
+            deltas: Delta partitions in application order.
+            created_at: Timestamp embedded in the new base file name.
+            new_df: Optional freshly fetched rows applied last.
+
+        Returns:
+            Path of the newly written base partition.
+        """
+        primary_keys = self.DATASET_PRIMARY_KEYS[dataset]
+        current = [*deltas] if base_path is None else [base_path, *deltas]
+        sources = [pl.scan_parquet(p) for p in current if p.exists()]
+        if new_df is not None:
+            sources.append(new_df.lazy())
+
+        df = (
+            pl.concat(sources, how="diagonal_relaxed")
+            .unique(subset=primary_keys, keep="last", maintain_order=True)
+            .sort(primary_keys)
+            .collect()
+        )
+
+        self._validate_partition(df, dataset, year)
+        new_base = self.storage_path / dataset / base_partition_name(year, created_at)
+        checksum = self._atomic_write_parquet(df, new_base)
+
+        logger.info(
+            "Year partition compacted",
+            extra={
+                "event": "sync.compact.year",
+                "dataset": dataset,
+                "year": year,
+                "deltas": len(deltas),
+                "new_rows": new_df.height if new_df is not None else 0,
+                "rows": df.height,
+                "path": str(new_base),
+                "checksum": checksum[:16],
+            },
+        )
+        return new_base
+
+    def _unreferenced_partitions(
+        self,
+        dataset: str,
+        previous_paths: list[str],
+        current_paths: list[str],
+    ) -> list[Path]:
+        """Return partition files of ``dataset`` the current manifest does not reference.
+
+        Covers every entry of the previous manifest plus any versioned base or
+        delta left on disk (e.g. by an interrupted run). Legacy ``{year}.parquet``
+        files are only removed when a previous manifest referenced them.
+        """
+        keep = {Path(p).resolve() for p in current_paths}
+        dataset_dir = self.storage_path / dataset
+        candidates = [Path(p) for p in previous_paths]
+        candidates.extend(
+            path
+            for path in dataset_dir.glob("*.parquet")
+            if partition_year(path) is not None and not path.stem.isdigit()
+        )
+        candidates.extend(
+            path
+            for path in (dataset_dir / self.DELTA_DIR).glob("*.parquet")
+            if is_delta_partition(path)
+        )
+        unreferenced: dict[Path, Path] = {}
+        for path in candidates:
+            resolved = path.resolve()
+            if resolved not in keep and resolved.is_relative_to(dataset_dir.resolve()):
+                unreferenced.setdefault(resolved, path)
+        return list(unreferenced.values())
+
+    def _remove_partitions(self, paths: list[Path]) -> None:
+        """Delete partition files no manifest references (best effort)."""
+        for path in paths:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning(
+                    "Failed to remove unreferenced partition",
+                    extra={
+                        "event": "sync.partition.remove_failed",
+                        "path": str(path),
+                        "error": str(exc),
+                    },
+                )
+        for parent in {path.parent for path in paths}:
+            self._fsync_directory(parent)
+
     def _validate_partition(self, df: pl.DataFrame, dataset: str, year: int) -> None:
         """Validate data quality before persisting.
 
@@ -1009,11 +1420,7 @@ class SyncManager:
         Returns:
             Hex digest of SHA-256 hash.
         """
-        hasher = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        return self.validator.compute_checksum(path)
 
     def _compute_checksum_and_fsync(self, path: Path) -> str:
         """Compute SHA-256 checksum and fsync in single file operation.
@@ -1250,12 +1657,13 @@ class SyncManager:
         Returns:
             Combined SHA-256 hex digest.
         """
+        existing = [Path(p) for p in sorted(file_paths) if Path(p).exists()]
+        # Files are hashed concurrently (and served from the validator's
+        # checksum cache when unchanged); digest order stays sorted
+        checksums = self.validator.compute_checksums(existing)
         hasher = hashlib.sha256()
-        for path_str in sorted(file_paths):
-            path = Path(path_str)
-            if path.exists():
-                file_checksum = self._compute_checksum(path)
-                hasher.update(file_checksum.encode())
+        for path in existing:
+            hasher.update(checksums[path].encode())
         return hasher.hexdigest()
 
     # Supported datasets and their date column names
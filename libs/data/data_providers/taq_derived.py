@@ -0,0 +1,472 @@
+"""
+Derived TAQ microstructure components.
+
+Tick samples and 1-minute bars are large relative to what the microstructure
+analytics actually consume. This module reduces them to compact per-symbol
+components that are written next to the raw data at sync time:
+
+- vpin_buckets: BVC-classified volume buckets (one row per volume bucket)
+- spread_depth: time-weighted L1 depth and quote-quality flags (one row)
+- intraday_5m: 5-minute sums/counts of 1-minute bar statistics plus the
+  sampled close used for realized volatility (one row per 5-minute slot)
+
+Storage Layout:
+    data/taq/derived/
+        vpin_buckets/YYYY-MM-DD/<SYMBOL>.parquet
+        spread_depth/YYYY-MM-DD/<SYMBOL>.parquet
+        intraday_5m/YYYYMM.parquet          # mirrors aggregates/1min_bars
+
+Volume buckets depend only on ``volume_per_bucket`` and ``sigma_lookback``;
+the VPIN rolling window is applied at read time, so one stored partition
+serves every ``window_buckets`` setting.
+
+The bucketing here is the closed-form equivalent of the sequential
+bucket-filling loop: bucket boundaries are multiples of the bucket volume on
+the cumulative-volume axis, and buy/sell volume at each boundary is obtained
+by linear interpolation of cumulative buy/sell volume (a trade that straddles
+a boundary is split proportionally, exactly as the loop does).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import polars as pl
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import NDArray
+from scipy.stats import norm  # type: ignore[import-untyped]
+
+DERIVED_DIR = "derived"
+DERIVED_VPIN_BUCKETS = "vpin_buckets"
+DERIVED_SPREAD_DEPTH = "spread_depth"
+DERIVED_INTRADAY_5M = "intraday_5m"
+
+# Parameters used when deriving at sync time (match analyzer defaults)
+DEFAULT_VOLUME_PER_BUCKET = 10_000
+DEFAULT_SIGMA_LOOKBACK = 20
+DEFAULT_STALE_THRESHOLD_SECONDS = 60
+INTRADAY_SLOT_MINUTES = 5
+
+# Zero-volume share above which the analyzer warns
+ZERO_VOLUME_WARN_PCT = 0.05
+
+VPIN_BUCKETS_SCHEMA: dict[str, Any] = {
+    "bucket_id": pl.Int64,
+    "timestamp": pl.Datetime,
+    "cumulative_volume": pl.Float64,
+    "v_buy": pl.Float64,
+    "v_sell": pl.Float64,
+    "sigma_zero": pl.Boolean,
+    "is_partial": pl.Boolean,
+}
+
+
+# =========================================================================
+# BVC volume buckets
+# =========================================================================
+
+
+def rolling_sigma(log_returns: NDArray[np.floating[Any]], lookback: int) -> NDArray[np.float64]:
+    """Rolling sample standard deviation of log returns.
+
+    Entry ``i`` is the std of ``log_returns[i - lookback + 1 : i + 1]``;
+    entries before the first full window (or all entries when
+    ``lookback < 2``) are zero.
+    """
+    n = len(log_returns)
+    sigma_arr = np.zeros(n, dtype=np.float64)
+
+    if n < lookback or lookback < 2:
+        return sigma_arr
+
+    # Two-pass approach using sliding windows to avoid catastrophic cancellation
+    windows = sliding_window_view(np.asarray(log_returns, dtype=np.float64), lookback)
+    window_variances = windows.var(axis=1, ddof=1)
+
+    sigma_arr[lookback - 1 :] = np.sqrt(np.maximum(window_variances, 0.0))
+
+    return sigma_arr
+
+
+def bvc_volumes(
+    log_returns: NDArray[np.floating[Any]],
+    sizes: NDArray[np.floating[Any]],
+    sigma_lookback: int,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.bool_]]:
+    """Split trade volume into buy/sell volume using Bulk Volume Classification.
+
+    Args:
+        log_returns: Per-trade log returns.
+        sizes: Trade sizes aligned with ``log_returns``.
+        sigma_lookback: Number of trades for rolling sigma.
+
+    Returns:
+        Tuple of (v_buy, v_sell, sigma_zero_mask). Trades with zero sigma are
+        split 50/50 and flagged in the mask.
+    """
+    sigma_arr = rolling_sigma(log_returns, sigma_lookback)
+    sigma_zero_mask = sigma_arr <= 0
+
+    # Safe division: replace zero sigma with 1 to avoid division by zero, then fix
+    safe_sigma = np.where(sigma_zero_mask, 1.0, sigma_arr)
+    z_scores = log_returns / safe_sigma
+    z_scores[sigma_zero_mask] = 0.0
+
+    v_buy_ratios = norm.cdf(z_scores)
+    v_buy_ratios[sigma_zero_mask] = 0.5
+
+    sizes_f = np.asarray(sizes, dtype=np.float64)
+    v_buy = sizes_f * v_buy_ratios
+    return v_buy, sizes_f - v_buy, sigma_zero_mask
+
+
+def bucketize_volume(
+    v_buy: NDArray[np.floating[Any]],
+    v_sell: NDArray[np.floating[Any]],
+    sizes: NDArray[np.floating[Any]],
+    sigma_zero_mask: NDArray[np.bool_],
+    timestamps: pl.Series,
+    volume_per_bucket: float,
+    start: int = 0,
+) -> pl.DataFrame:
+    """Group trades into fixed-volume buckets without a per-trade loop.
+
+    Trades before ``start`` (the sigma warmup) are excluded from buckets but
+    still count towards ``cumulative_volume``. Buckets close on the first
+    trade whose volume reaches past the bucket boundary; a trailing bucket
+    holding the remaining volume is emitted with ``is_partial=True``.
+
+    Args:
+        v_buy: Per-trade buy volume.
+        v_sell: Per-trade sell volume.
+        sizes: Per-trade total volume (strictly positive).
+        sigma_zero_mask: Per-trade sigma=0 flags.
+        timestamps: Per-trade timestamps.
+        volume_per_bucket: Volume per bucket.
+        start: Index of the first bucketed trade.
+
+    Returns:
+        DataFrame with VPIN_BUCKETS_SCHEMA columns (empty if no volume).
+    """
+    sizes_f = np.asarray(sizes, dtype=np.float64)
+    cumulative_volume = np.cumsum(sizes_f)
+
+    sz = sizes_f[start:]
+    n = sz.size
+    if n == 0 or volume_per_bucket <= 0 or sz.sum() <= 0:
+        return pl.DataFrame(schema=VPIN_BUCKETS_SCHEMA).with_columns(
+            pl.col("timestamp").cast(timestamps.dtype)
+        )
+
+    zero = np.concatenate(([0], np.cumsum(np.asarray(sigma_zero_mask[start:], dtype=np.int64))))
+    cum_vol = np.concatenate(([0.0], np.cumsum(sz)))
+    cum_buy = np.concatenate(([0.0], np.cumsum(np.asarray(v_buy[start:], dtype=np.float64))))
+    cum_sell = np.concatenate(([0.0], np.cumsum(np.asarray(v_sell[start:], dtype=np.float64))))
+    total = cum_vol[-1]
+
+    # Closed buckets are those whose boundary lies strictly inside total volume
+    boundaries = volume_per_bucket * np.arange(1, int(np.ceil(total / volume_per_bucket)))
+    boundaries = boundaries[boundaries < total]
+
+    # A bucket closes on the first trade that carries volume past its boundary;
+    # its timestamp is the last trade that contributed volume to it.
+    close_idx = np.searchsorted(cum_vol[1:], boundaries, side="right")
+    ts_idx = np.searchsorted(cum_vol[1:], boundaries, side="left")
+    close_idx = np.append(close_idx, n - 1)
+    ts_idx = np.append(ts_idx, n - 1)
+
+    edges = np.concatenate(([0.0], boundaries, [total]))
+    bucket_buy = np.diff(np.interp(edges, cum_vol, cum_buy))
+    bucket_sell = np.diff(np.interp(edges, cum_vol, cum_sell))
+
+    # Trades that joined a bucket up to (and including) its closing trade
+    prev_close = np.concatenate(([-1], close_idx[:-1]))
+    sigma_zero = (zero[close_idx + 1] - zero[prev_close + 1]) > 0
+
+    n_buckets = close_idx.size
+    return pl.DataFrame(
+        {
+            "bucket_id": np.arange(n_buckets, dtype=np.int64),
+            "timestamp": timestamps[start:].gather(ts_idx),
+            "cumulative_volume": cumulative_volume[start:][close_idx],
+            "v_buy": bucket_buy,
+            "v_sell": bucket_sell,
+            "sigma_zero": sigma_zero,
+            "is_partial": np.arange(n_buckets) == n_buckets - 1,
+        }
+    )
+
+
+def vpin_from_buckets(buckets: pl.DataFrame, window_buckets: int) -> pl.DataFrame:
+    """Apply the rolling VPIN window to volume buckets.
+
+    VPIN is NaN during warmup (fewer than ``window_buckets`` buckets) and for
+    buckets that contain sigma=0 trades.
+
+    Args:
+        buckets: Output of :func:`bucketize_volume`.
+        window_buckets: Rolling window of buckets.
+
+    Returns:
+        DataFrame with bucket_id, vpin, cumulative_volume, imbalance,
+        timestamp, is_partial, is_warmup.
+    """
+    v_buy = buckets["v_buy"].to_numpy()
+    v_sell = buckets["v_sell"].to_numpy()
+    n = v_buy.size
+
+    vpin = np.full(n, np.nan, dtype=np.float64)
+    if window_buckets >= 1 and n >= window_buckets:
+        window_buy = sliding_window_view(v_buy, window_buckets).sum(axis=1)
+        window_sell = sliding_window_view(v_sell, window_buckets).sum(axis=1)
+        window_total = window_buy + window_sell
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(
+                window_total > 0, np.abs(window_buy - window_sell) / window_total, np.nan
+            )
+        vpin[window_buckets - 1 :] = values
+    vpin[buckets["sigma_zero"].to_numpy()] = np.nan
+
+    return buckets.select(
+        pl.col("bucket_id"),
+        pl.Series("vpin", vpin, dtype=pl.Float64),
+        pl.col("cumulative_volume"),
+        (pl.col("v_buy") - pl.col("v_sell")).abs().alias("imbalance"),
+        pl.col("timestamp"),
+        pl.col("is_partial"),
+        (pl.col("bucket_id") < window_buckets - 1).alias("is_warmup"),
+    )
+
+
+def build_vpin_buckets(
+    ticks: pl.DataFrame,
+    volume_per_bucket: int = DEFAULT_VOLUME_PER_BUCKET,
+    sigma_lookback: int = DEFAULT_SIGMA_LOOKBACK,
+) -> pl.DataFrame:
+    """Derive BVC volume buckets for one symbol-day of ticks.
+
+    Day-level quality stats (zero-volume share, sigma=0 presence) and the
+    derivation parameters are stored as constant columns so readers can
+    reproduce the analyzer's warnings and reject mismatched parameters.
+
+    Args:
+        ticks: Tick rows for a single symbol and date.
+        volume_per_bucket: Volume per bucket.
+        sigma_lookback: Number of trades for rolling sigma.
+
+    Returns:
+        Bucket DataFrame; empty when the day has too few trades to bucket.
+    """
+    if ticks.is_empty():
+        return pl.DataFrame(schema=VPIN_BUCKETS_SCHEMA)
+
+    ticks = ticks.sort("ts")
+    total_trades = ticks.height
+    zero_volume_pct = float((ticks["trade_size"] == 0).sum()) / total_trades
+
+    trade_rows = ticks.filter(pl.col("trade_size") > 0)
+    if trade_rows.height < sigma_lookback + 1:
+        return pl.DataFrame(schema=VPIN_BUCKETS_SCHEMA)
+
+    prices = trade_rows["trade_px"].to_numpy()
+    sizes = trade_rows["trade_size"].to_numpy()[1:]
+    log_returns = np.log(prices[1:] / prices[:-1])
+
+    v_buy, v_sell, sigma_zero_mask = bvc_volumes(log_returns, sizes, sigma_lookback)
+    buckets = bucketize_volume(
+        v_buy,
+        v_sell,
+        sizes,
+        sigma_zero_mask,
+        trade_rows["ts"][1:],
+        volume_per_bucket,
+        start=sigma_lookback,
+    )
+
+    return buckets.with_columns(
+        pl.lit(bool(sigma_zero_mask.any())).alias("has_sigma_zero"),
+        pl.lit(zero_volume_pct, dtype=pl.Float64).alias("zero_volume_pct"),
+        pl.lit(volume_per_bucket, dtype=pl.Int64).alias("volume_per_bucket"),
+        pl.lit(sigma_lookback, dtype=pl.Int64).alias("sigma_lookback"),
+    )
+
+
+# =========================================================================
+# Spread / depth summary
+# =========================================================================
+
+
+def filter_quotes(ticks: pl.DataFrame) -> pl.DataFrame:
+    """Filter tick data to quote-only rows using hierarchical logic."""
+    if "record_type" in ticks.columns:
+        return ticks.filter(pl.col("record_type") == "quote")
+
+    return ticks.filter((pl.col("bid_size") > 0) & (pl.col("ask_size") > 0))
+
+
+def time_weighted_depth(quotes: pl.DataFrame) -> tuple[float, float]:
+    """Compute time-weighted L1 bid/ask depth from quote rows.
+
+    Returns NaN depths when no quote has a positive duration.
+    """
+    quotes = quotes.filter(
+        (pl.col("bid") > 0) & (pl.col("ask") > 0) & (pl.col("bid") <= pl.col("ask"))
+    )
+
+    if quotes.is_empty():
+        return float("nan"), float("nan")
+
+    quotes = quotes.sort("ts").with_columns(
+        pl.col("ts").shift(-1).alias("next_ts"),
+    )
+    quotes = quotes.with_columns(
+        (pl.col("next_ts") - pl.col("ts")).alias("raw_duration"),
+    )
+
+    # All quotes at the same timestamp: no time weighting possible
+    non_null_durations = quotes.filter(pl.col("raw_duration").is_not_null())
+    if non_null_durations.height > 0:
+        if (non_null_durations["raw_duration"].dt.total_seconds() == 0).all():
+            return float("nan"), float("nan")
+
+    # 1-second fallback for the last quote of the day
+    quotes = quotes.with_columns(
+        pl.when(pl.col("next_ts").is_null())
+        .then(pl.duration(seconds=1))
+        .otherwise(pl.col("raw_duration"))
+        .dt.total_seconds()
+        .alias("duration_seconds"),
+    ).filter(pl.col("duration_seconds") > 0)
+
+    if quotes.is_empty():
+        return float("nan"), float("nan")
+
+    total_duration = quotes["duration_seconds"].sum()
+    avg_bid = (quotes["bid_size"] * quotes["duration_seconds"]).sum() / total_duration
+    avg_ask = (quotes["ask_size"] * quotes["duration_seconds"]).sum() / total_duration
+
+    return float(avg_bid), float(avg_ask)
+
+
+def locked_market_stats(quotes: pl.DataFrame) -> tuple[bool, float]:
+    """Detect locked markets (bid == ask); returns (any_locked, share)."""
+    locked = quotes.filter(pl.col("bid") == pl.col("ask")).height
+    return locked > 0, locked / quotes.height if quotes.height > 0 else 0.0
+
+
+def crossed_market_stats(quotes: pl.DataFrame) -> tuple[bool, float]:
+    """Detect crossed markets (bid > ask); returns (any_crossed, share)."""
+    crossed = quotes.filter(pl.col("bid") > pl.col("ask")).height
+    return crossed > 0, crossed / quotes.height if quotes.height > 0 else 0.0
+
+
+def stale_quote_pct(quotes: pl.DataFrame, threshold_seconds: int) -> float:
+    """Share of quotes unchanged from the previous quote for > threshold."""
+    if quotes.height < 2:
+        return 0.0
+
+    quotes = quotes.sort("ts").with_columns(
+        pl.col("bid").shift(1).alias("prev_bid"),
+        pl.col("ask").shift(1).alias("prev_ask"),
+        pl.col("bid_size").shift(1).alias("prev_bid_size"),
+        pl.col("ask_size").shift(1).alias("prev_ask_size"),
+        pl.col("ts").shift(1).alias("prev_ts"),
+    )
+    quotes = quotes.filter(pl.col("prev_ts").is_not_null()).with_columns(
+        (pl.col("ts") - pl.col("prev_ts")).dt.total_seconds().alias("time_diff"),
+    )
+
+    stale = quotes.filter(
+        (pl.col("bid") == pl.col("prev_bid"))
+        & (pl.col("ask") == pl.col("prev_ask"))
+        & (pl.col("bid_size") == pl.col("prev_bid_size"))
+        & (pl.col("ask_size") == pl.col("prev_ask_size"))
+        & (pl.col("time_diff") > threshold_seconds)
+    )
+
+    return stale.height / quotes.height if quotes.height > 0 else 0.0
+
+
+def build_spread_depth_summary(
+    ticks: pl.DataFrame,
+    stale_threshold_seconds: int = DEFAULT_STALE_THRESHOLD_SECONDS,
+) -> pl.DataFrame:
+    """Summarize depth and quote quality for one symbol-day of ticks.
+
+    Args:
+        ticks: Tick rows for a single symbol and date.
+        stale_threshold_seconds: Threshold for stale quote detection.
+
+    Returns:
+        Single-row DataFrame. ``n_quotes == 0`` means depth is unavailable.
+    """
+    quotes = filter_quotes(ticks) if not ticks.is_empty() else ticks
+
+    avg_bid_depth = avg_ask_depth = float("nan")
+    has_locked = has_crossed = False
+    locked_pct = crossed_pct = stale_pct = 0.0
+    if not quotes.is_empty():
+        avg_bid_depth, avg_ask_depth = time_weighted_depth(quotes)
+        has_locked, locked_pct = locked_market_stats(quotes)
+        has_crossed, crossed_pct = crossed_market_stats(quotes)
+        stale_pct = stale_quote_pct(quotes, stale_threshold_seconds)
+
+    return pl.DataFrame(
+        {
+            "n_quotes": [quotes.height],
+            "avg_bid_depth": [avg_bid_depth],
+            "avg_ask_depth": [avg_ask_depth],
+            "has_locked": [has_locked],
+            "locked_pct": [locked_pct],
+            "has_crossed": [has_crossed],
+            "crossed_pct": [crossed_pct],
+            "stale_quote_pct": [stale_pct],
+            "stale_threshold_seconds": [stale_threshold_seconds],
+        },
+        schema_overrides={"n_quotes": pl.Int64, "stale_threshold_seconds": pl.Int64},
+    )
+
+
+# =========================================================================
+# Intraday 5-minute components
+# =========================================================================
+
+
+def build_intraday_components(bars: pl.DataFrame) -> pl.DataFrame:
+    """Reduce 1-minute bars to per-symbol-day 5-minute slot components.
+
+    Sums and non-null counts are stored (not means) so that any bucket size
+    that is a multiple of 5 minutes can be re-aggregated exactly. The close
+    of the bar on the slot boundary is kept for realized-volatility sampling.
+
+    Args:
+        bars: 1-minute bars (ts, symbol, date, open, high, low, close, volume).
+
+    Returns:
+        DataFrame keyed by (symbol, date, slot_minute).
+    """
+    slot = INTRADAY_SLOT_MINUTES
+    minute_of_day = pl.col("ts").dt.hour().cast(pl.Int32) * 60 + pl.col("ts").dt.minute().cast(
+        pl.Int32
+    )
+    intrabar_vol = (pl.col("high") - pl.col("low")) / pl.col("open")
+    half_range = (pl.col("high") - pl.col("low")) / 2
+    on_boundary = pl.col("ts").dt.minute() % slot == 0
+
+    return (
+        bars.sort("ts")
+        .with_columns(((minute_of_day // slot) * slot).cast(pl.Int32).alias("slot_minute"))
+        .group_by(["symbol", "date", "slot_minute"])
+        .agg(
+            pl.len().cast(pl.Int64).alias("bar_count"),
+            intrabar_vol.sum().alias("intrabar_vol_sum"),
+            intrabar_vol.count().cast(pl.Int64).alias("intrabar_vol_n"),
+            half_range.sum().alias("half_range_sum"),
+            half_range.count().cast(pl.Int64).alias("half_range_n"),
+            pl.col("volume").cast(pl.Float64).sum().alias("volume_sum"),
+            pl.col("volume").count().cast(pl.Int64).alias("volume_n"),
+            pl.col("close").filter(on_boundary).first().alias("sample_close"),
+        )
+        .sort(["symbol", "date", "slot_minute"])
+    )
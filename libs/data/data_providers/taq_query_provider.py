@@ -12,6 +12,7 @@ Storage layout (produced by TAQStorageManager):
         aggregates/daily_rv/YYYYMM.parquet
         aggregates/spread_stats/YYYYMM.parquet
         samples/YYYY-MM-DD/<SYMBOL>.parquet
+        derived/...                  # compact components (see taq_derived.py)
 
 Datasets and schemas (see taq_storage.py):
     - taq_1min_bars: ts, symbol, open, high, low, close, volume, vwap, date
@@ -25,7 +26,8 @@ from __future__ import annotations
 
 import logging
 import threading
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 from typing import Any, Literal
@@ -33,11 +35,18 @@ from typing import Any, Literal
 import duckdb
 import polars as pl
 
+from libs.data.data_providers.taq_derived import (
+    DERIVED_DIR,
+    DERIVED_INTRADAY_5M,
+    DERIVED_SPREAD_DEPTH,
+    DERIVED_VPIN_BUCKETS,
+)
 from libs.data.data_providers.taq_storage import (
     TAQ_1MIN_BARS_SCHEMA,
     TAQ_DAILY_RV_SCHEMA,
     TAQ_SPREAD_STATS_SCHEMA,
     TAQ_TICKS_SCHEMA,
+    TAQStorageManager,
 )
 from libs.data.data_quality.exceptions import (
     DataNotFoundError,
@@ -51,6 +60,23 @@ from libs.data.data_quality.versioning import DatasetVersionManager
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class TAQBarsRequest:
+    """One (symbol, date window) request for ``fetch_minute_bars_batch``.
+
+    Attributes:
+        key: Caller-chosen identifier echoed in the ``request_key`` column.
+        symbol: Ticker symbol (case-insensitive).
+        start_date: Inclusive start date.
+        end_date: Inclusive end date.
+    """
+
+    key: str
+    symbol: str
+    start_date: date
+    end_date: date
+
+
 class TAQLocalProvider:
     """Query TAQ aggregates and samples from local Parquet files.
 
@@ -307,6 +333,172 @@ class TAQLocalProvider:
             order_by=["ts", "symbol"],
         )
 
+    def fetch_minute_bars_batch(
+        self,
+        requests: Sequence[TAQBarsRequest],
+        as_of: date | None = None,
+    ) -> pl.DataFrame:
+        """Fetch 1-minute bars for many (symbol, date window) requests at once.
+
+        Partitions are pruned per request (only the months each request
+        touches are read) and all requests are answered by a single scan
+        joined against the request table, so N requests cost one I/O pass
+        instead of N.
+
+        Args:
+            requests: Requests to answer. Keys need not be unique; rows are
+                emitted once per matching request.
+            as_of: Optional PIT date (see ``fetch_minute_bars``).
+
+        Returns:
+            DataFrame with a leading ``request_key`` column followed by the
+            1-minute bar columns, sorted by request_key, date, symbol, ts.
+            Requests with no data (or inverted windows) contribute no rows.
+        """
+
+        if not requests:
+            raise ValueError("requests cannot be empty")
+
+        valid = [r for r in requests if r.start_date <= r.end_date]
+        if not valid:
+            return self._empty_batch_result()
+
+        needed_months: set[str] = set()
+        for request in valid:
+            needed_months |= self._months_between(request.start_date, request.end_date)
+
+        paths = self._resolve_month_paths(self.DATASET_1MIN, needed_months, as_of)
+        if not paths:
+            return self._empty_batch_result()
+
+        reqs = pl.DataFrame(
+            {
+                "request_key": [r.key for r in valid],
+                "req_symbol": [r.symbol.upper() for r in valid],
+                "req_start": [r.start_date for r in valid],
+                "req_end": [r.end_date for r in valid],
+            },
+            schema={
+                "request_key": pl.Utf8,
+                "req_symbol": pl.Utf8,
+                "req_start": pl.Date,
+                "req_end": pl.Date,
+            },
+        )
+
+        if self.engine == "duckdb":
+            result = self._execute_duckdb_batch(paths, reqs)
+        else:
+            result = self._execute_polars_batch(paths, reqs)
+
+        if result.is_empty():
+            return self._empty_batch_result()
+        return result
+
+    # ------------------------------------------------------------------
+    # Derived components (latest data only; PIT reads use raw datasets)
+    # ------------------------------------------------------------------
+    def fetch_vpin_buckets(self, sample_date: date, symbol: str) -> pl.DataFrame:
+        """Fetch pre-computed BVC volume buckets for one symbol-day.
+
+        Args:
+            sample_date: Trading date of the tick sample.
+            symbol: Ticker symbol.
+
+        Returns:
+            Bucket DataFrame (see ``taq_derived.build_vpin_buckets``). Empty
+            when no derived partition exists.
+
+        Raises:
+            DataNotFoundError: If the tick sample has not been synced.
+        """
+        return self._read_derived_symbol_day(DERIVED_VPIN_BUCKETS, sample_date, symbol)
+
+    def fetch_spread_depth_summary(self, sample_date: date, symbol: str) -> pl.DataFrame:
+        """Fetch the pre-computed depth / quote-quality summary for one symbol-day.
+
+        Args:
+            sample_date: Trading date of the tick sample.
+            symbol: Ticker symbol.
+
+        Returns:
+            Single-row DataFrame, or empty when no derived partition exists.
+
+        Raises:
+            DataNotFoundError: If the tick sample has not been synced.
+        """
+        return self._read_derived_symbol_day(DERIVED_SPREAD_DEPTH, sample_date, symbol)
+
+    def fetch_intraday_components(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> pl.DataFrame | None:
+        """Fetch 5-minute intraday components derived from 1-minute bars.
+
+        Args:
+            symbols: List of ticker symbols (case-insensitive).
+            start_date: Inclusive start date.
+            end_date: Inclusive end date.
+
+        Returns:
+            DataFrame sorted by date, symbol, slot_minute, or None when any
+            synced 1-minute partition in range has no derived counterpart
+            (callers should then read the 1-minute bars).
+        """
+        self._validate_symbols(symbols)
+        if start_date > end_date:
+            return None
+
+        bar_paths = self._resolve_partition_paths(
+            dataset=self.DATASET_1MIN,
+            start_date=start_date,
+            end_date=end_date,
+            as_of=None,
+        )
+
+        derived_dir = self.storage_path / DERIVED_DIR / DERIVED_INTRADAY_5M
+        paths: list[Path] = []
+        for bar_path in bar_paths:
+            derived_path = derived_dir / bar_path.name
+            if not derived_path.is_file():
+                return None
+            paths.append(derived_path)
+
+        if not paths:
+            return None
+
+        return (
+            pl.scan_parquet([str(p) for p in paths])
+            .filter(
+                (pl.col("date") >= pl.lit(start_date))
+                & (pl.col("date") <= pl.lit(end_date))
+                & pl.col("symbol").is_in([s.upper() for s in symbols])
+            )
+            .sort(["date", "symbol", "slot_minute"])
+            .collect()
+        )
+
+    def _read_derived_symbol_day(
+        self, derived_dataset: str, sample_date: date, symbol: str
+    ) -> pl.DataFrame:
+        """Read a date/symbol-partitioned derived file if it exists."""
+        date_key = sample_date.strftime("%Y-%m-%d")
+        # Derived files accompany a synced sample; missing manifest means no data
+        self._get_manifest(f"{self.DATASET_SAMPLES_PREFIX}_{sample_date.strftime('%Y%m%d')}")
+
+        symbol_u = symbol.upper()
+        if not TAQStorageManager.SYMBOL_PATTERN.match(symbol_u):
+            return pl.DataFrame()
+
+        expected_root = (self.storage_path / DERIVED_DIR / derived_dataset / date_key).resolve()
+        path = (expected_root / f"{symbol_u}.parquet").resolve()
+        if not path.is_relative_to(expected_root) or not path.is_file():
+            return pl.DataFrame()
+
+        return pl.read_parquet(path)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -396,6 +588,75 @@ class TAQLocalProvider:
 
         return lf.sort(order_by).collect()
 
+    def _execute_duckdb_batch(self, paths: list[Path], reqs: pl.DataFrame) -> pl.DataFrame:
+        """Answer all bar requests with one scan joined to the request table.
+
+        The request table is passed as parallel lists and unnested inside
+        the query, so nothing is registered on the (thread-local)
+        connection. The outer symbol/date bounds let DuckDB push filters
+        into the Parquet scan before the join.
+        """
+
+        conn = self._ensure_connection()
+        params: dict[str, Any] = {
+            "paths": [str(p) for p in paths],
+            "keys": reqs["request_key"].to_list(),
+            "req_symbols": reqs["req_symbol"].to_list(),
+            "req_starts": reqs["req_start"].to_list(),
+            "req_ends": reqs["req_end"].to_list(),
+            "symbols": reqs["req_symbol"].unique().to_list(),
+            "start_date": reqs["req_start"].min(),
+            "end_date": reqs["req_end"].max(),
+        }
+
+        query = """
+            WITH reqs AS (
+                SELECT
+                    UNNEST($keys) AS request_key,
+                    UNNEST($req_symbols) AS req_symbol,
+                    UNNEST($req_starts)::DATE AS req_start,
+                    UNNEST($req_ends)::DATE AS req_end
+            ),
+            bars AS (
+                SELECT *
+                FROM read_parquet($paths)
+                WHERE symbol = ANY($symbols)
+                  AND date >= $start_date
+                  AND date <= $end_date
+            )
+            SELECT reqs.request_key, bars.*
+            FROM bars
+            JOIN reqs
+              ON bars.symbol = reqs.req_symbol
+             AND bars.date BETWEEN reqs.req_start AND reqs.req_end
+            ORDER BY reqs.request_key, bars.date, bars.symbol, bars.ts
+        """
+
+        return conn.execute(query, params).pl()
+
+    def _execute_polars_batch(self, paths: list[Path], reqs: pl.DataFrame) -> pl.DataFrame:
+        start_date = reqs["req_start"].min()
+        end_date = reqs["req_end"].max()
+        bars = pl.scan_parquet([str(p) for p in paths]).filter(
+            pl.col("symbol").is_in(reqs["req_symbol"].unique().to_list())
+            & (pl.col("date") >= pl.lit(start_date))
+            & (pl.col("date") <= pl.lit(end_date))
+        )
+        bar_columns = bars.collect_schema().names()
+
+        return (
+            bars.join(reqs.lazy(), left_on="symbol", right_on="req_symbol", how="inner")
+            .filter((pl.col("date") >= pl.col("req_start")) & (pl.col("date") <= pl.col("req_end")))
+            .select(["request_key", *bar_columns])
+            .sort(["request_key", "date", "symbol", "ts"])
+            .collect()
+        )
+
+    def _empty_batch_result(self) -> pl.DataFrame:
+        return self._empty_result(self.DATASET_1MIN).select(
+            pl.lit(None, dtype=pl.Utf8).alias("request_key"), pl.all()
+        )
+
     def _resolve_partition_paths(
         self,
         dataset: str,
@@ -403,8 +664,14 @@ class TAQLocalProvider:
         end_date: date,
         as_of: date | None,
     ) -> list[Path]:
-        needed_months = self._months_between(start_date, end_date)
+        return self._resolve_month_paths(dataset, self._months_between(start_date, end_date), as_of)
 
+    def _resolve_month_paths(
+        self,
+        dataset: str,
+        needed_months: set[str],
+        as_of: date | None,
+    ) -> list[Path]:
         if as_of is not None:
             if self.version_manager is None:
                 raise ValueError("version_manager is required for PIT queries")
@@ -13,6 +13,10 @@ Storage Layout:
             daily_rv/YYYYMM.parquet
             spread_stats/YYYYMM.parquet
         samples/YYYY-MM-DD/<SYMBOL>.parquet
+        derived/                     # compact components (see taq_derived)
+            vpin_buckets/YYYY-MM-DD/<SYMBOL>.parquet
+            spread_depth/YYYY-MM-DD/<SYMBOL>.parquet
+            intraday_5m/YYYYMM.parquet
         tmp/                         # staging for atomic writes
         quarantine/                  # failed writes
 
@@ -37,6 +41,14 @@ from typing import TYPE_CHECKING, Any, Literal
 import polars as pl
 from pydantic import BaseModel
 
+from libs.data.data_providers.taq_derived import (
+    DERIVED_INTRADAY_5M,
+    DERIVED_SPREAD_DEPTH,
+    DERIVED_VPIN_BUCKETS,
+    build_intraday_components,
+    build_spread_depth_summary,
+    build_vpin_buckets,
+)
 from libs.data.data_quality.exceptions import DiskSpaceError, SchemaError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 from libs.data.data_quality.schema import SchemaRegistry
@@ -194,6 +206,7 @@ class TAQStorageManager:
     # Storage layout paths
     AGGREGATES_DIR = "aggregates"
     SAMPLES_DIR = "samples"
+    DERIVED_DIR = "derived"
     TMP_DIR = "tmp"
     QUARANTINE_DIR = "quarantine"
 
@@ -560,6 +573,21 @@ class TAQStorageManager:
                     except ValueError:
                         continue
 
+        # Clean up derived tick components (same date-based layout as samples)
+        for derived_dataset in (DERIVED_VPIN_BUCKETS, DERIVED_SPREAD_DEPTH):
+            derived_dir = self.storage_path / self.DERIVED_DIR / derived_dataset
+            if not derived_dir.exists():
+                continue
+            for date_dir in derived_dir.iterdir():
+                if date_dir.is_dir():
+                    try:
+                        dir_date = datetime.datetime.strptime(date_dir.name, "%Y-%m-%d").date()
+                        if dir_date < cutoff:
+                            shutil.rmtree(date_dir)
+                            deleted_count += 1
+                    except ValueError:
+                        continue
+
         # Clean up quarantine
         quarantine_dir = self.storage_path / self.QUARANTINE_DIR
         if quarantine_dir.exists():
@@ -578,6 +606,61 @@ class TAQStorageManager:
 
         return deleted_count
 
+    def rebuild_derived(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+    ) -> int:
+        """Backfill derived components from local TAQ files.
+
+        Rebuilds intraday components for every local 1-minute bar partition
+        overlapping the range, and VPIN bucket / spread-depth components for
+        every local tick sample in the range. Existing derived files are
+        overwritten.
+
+        Args:
+            start_date: Start of date range.
+            end_date: End of date range.
+
+        Returns:
+            Number of source files processed.
+        """
+        processed = 0
+
+        bars_dir = self.storage_path / self.AGGREGATES_DIR / "1min_bars"
+        for partition in self._build_month_partitions(start_date, end_date):
+            bars_path = bars_dir / f"{partition}.parquet"
+            if bars_path.exists():
+                self._write_derived_intraday(partition, pl.read_parquet(bars_path))
+                processed += 1
+
+        samples_dir = self.storage_path / self.SAMPLES_DIR
+        day = start_date
+        while day <= end_date:
+            date_dir = samples_dir / day.strftime("%Y-%m-%d")
+            if date_dir.is_dir():
+                for tick_path in sorted(date_dir.glob("*.parquet")):
+                    try:
+                        symbol = self._sanitize_symbol(tick_path.stem)
+                    except ValueError:
+                        logger.warning("Skipping unexpected sample file: %s", tick_path)
+                        continue
+                    self._write_derived_samples(day, symbol, pl.read_parquet(tick_path))
+                    processed += 1
+            day += datetime.timedelta(days=1)
+
+        logger.info(
+            "Rebuilt derived TAQ components",
+            extra={
+                "component": "taq_sync",
+                "event": "derived.rebuild.complete",
+                "start_date": str(start_date),
+                "end_date": str(end_date),
+                "files_processed": processed,
+            },
+        )
+        return processed
+
     # =========================================================================
     # Private Methods
     # =========================================================================
@@ -643,6 +726,9 @@ class TAQStorageManager:
         # Write atomically
         checksum = self._atomic_write_parquet(df, output_path)
 
+        if dataset == "1min_bars":
+            self._write_derived_intraday(partition, df)
+
         logger.info(
             "Synced aggregate partition",
             extra={
@@ -714,6 +800,7 @@ class TAQStorageManager:
 
         # Write atomically
         self._atomic_write_parquet(df, output_path)
+        self._write_derived_samples(sample_date, symbol, df)
 
         logger.debug(
             "Synced sample symbol",
@@ -726,6 +813,57 @@ class TAQStorageManager:
 
         return output_path, df.height
 
+    def _write_derived_samples(
+        self,
+        sample_date: datetime.date,
+        symbol: str,
+        ticks_df: pl.DataFrame,
+    ) -> None:
+        """Write VPIN bucket and spread/depth components for one symbol-day.
+
+        Derived data is an acceleration layer: failures are logged and the
+        analyzer falls back to raw ticks. A stale bucket file is removed when
+        the new ticks cannot be bucketed, so readers never see outdated data.
+        """
+        date_key = sample_date.strftime("%Y-%m-%d")
+        derived_root = self.storage_path / self.DERIVED_DIR
+        buckets_path = derived_root / DERIVED_VPIN_BUCKETS / date_key / f"{symbol}.parquet"
+        depth_path = derived_root / DERIVED_SPREAD_DEPTH / date_key / f"{symbol}.parquet"
+
+        try:
+            buckets = build_vpin_buckets(ticks_df)
+            if buckets.is_empty():
+                buckets_path.unlink(missing_ok=True)
+            else:
+                self._atomic_write_parquet(buckets, buckets_path)
+
+            self._atomic_write_parquet(build_spread_depth_summary(ticks_df), depth_path)
+        except (pl.exceptions.PolarsError, OSError, ValueError) as e:
+            logger.warning(
+                "Failed to write derived tick components",
+                extra={"symbol": symbol, "date": date_key, "error": str(e)},
+            )
+            buckets_path.unlink(missing_ok=True)
+            depth_path.unlink(missing_ok=True)
+
+    def _write_derived_intraday(self, partition: str, bars_df: pl.DataFrame) -> None:
+        """Write 5-minute intraday components for a 1-minute bar partition.
+
+        Failures are logged and the stale partition is removed so readers
+        fall back to the 1-minute bars.
+        """
+        output_path = (
+            self.storage_path / self.DERIVED_DIR / DERIVED_INTRADAY_5M / f"{partition}.parquet"
+        )
+        try:
+            self._atomic_write_parquet(build_intraday_components(bars_df), output_path)
+        except (pl.exceptions.PolarsError, OSError, ValueError) as e:
+            logger.warning(
+                "Failed to write derived intraday components",
+                extra={"partition": partition, "error": str(e)},
+            )
+            output_path.unlink(missing_ok=True)
+
     def _build_aggregates_query(
         self,
         dataset: str,
@@ -845,9 +983,7 @@ class TAQStorageManager:
             WHERE sym_root = :symbol
             AND DATE(datetime) = :date
             ORDER BY datetime
-        """.format(
-            sample_date.strftime("%Y%m%d")
-        )
+        """.format(sample_date.strftime("%Y%m%d"))
 
         return query, params
 
@@ -1152,12 +1288,11 @@ class TAQStorageManager:
 
     def _compute_combined_checksum(self, file_paths: list[str]) -> str:
         """Compute combined checksum for multiple files."""
+        existing = [Path(p) for p in sorted(file_paths) if Path(p).exists()]
+        checksums = self.validator.compute_checksums(existing)
         hasher = hashlib.sha256()
-        for path_str in sorted(file_paths):
-            path = Path(path_str)
-            if path.exists():
-                file_checksum = self.validator.compute_checksum(path)
-                hasher.update(file_checksum.encode())
+        for path in existing:
+            hasher.update(checksums[path].encode())
         return hasher.hexdigest()
 
     def _create_empty_df(self, schema_name: str) -> pl.DataFrame:
@@ -12,8 +12,9 @@ This module provides:
 - ProductionGateError: Raised when yfinance blocked in production
 
 Features:
-- Rate-limited downloads with retries and jitter
-- Local Parquet caching with atomic writes
+- Concurrent downloads behind a shared request-rate limiter, with retries and jitter
+- Optional multi-ticker batch downloads and a reusable HTTP session
+- Local Parquet caching with atomic writes and one manifest update per refresh
 - Production gating (blocks yfinance when CRSP available in prod)
 - Drift detection against baseline data
 - Quarantine for failed/corrupted files
@@ -27,7 +28,10 @@ import logging
 import os
 import random
 import re
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -92,7 +96,9 @@ class YFinanceProvider:
     NOT suitable for production backtests - use CRSP instead.
 
     Features:
-    - Rate-limited downloads with retries
+    - Concurrent downloads with retries; request starts are spaced by a
+      provider-wide rate limiter, so refresh time scales with the rate limit
+      rather than per-request latency
     - Local Parquet caching with atomic writes
     - Production gating (blocks yfinance when CRSP available in prod)
     - Drift detection against baseline data
@@ -134,9 +140,15 @@ class YFinanceProvider:
     # Rate limiting
     MAX_RETRIES = 3
     RETRY_DELAY_SECONDS = 2.0
-    REQUEST_DELAY_SECONDS = 0.5  # Between symbols
+    REQUEST_DELAY_SECONDS = 0.5  # Between request starts, across all workers
     JITTER_MAX_SECONDS = 0.5  # Random jitter for rate limiting
 
+    # Concurrency
+    DEFAULT_MAX_WORKERS = 4
+    # yfinance.download collects results in module-global state
+    # (yfinance.shared._DFS/_ERRORS), so multi-ticker calls never overlap
+    _MULTI_DOWNLOAD_LOCK = threading.Lock()
+
     # Drift tolerance
     DEFAULT_DRIFT_TOLERANCE = 0.01  # 1%
 
@@ -151,6 +163,9 @@ class YFinanceProvider:
         environment: str = "development",
         use_yfinance_in_prod: bool = False,
         crsp_available: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        batch_size: int = 1,
+        session: Any | None = None,
     ) -> None:
         """Initialize provider with production gating.
 
@@ -161,10 +176,22 @@ class YFinanceProvider:
             environment: Current environment (development/test/staging/production).
             use_yfinance_in_prod: Override to allow yfinance in production (NOT recommended).
             crsp_available: Whether CRSP data is available (blocks yfinance in prod if True).
+            max_workers: Concurrent download workers. Request starts are still
+                spaced by REQUEST_DELAY_SECONDS across all workers.
+            batch_size: Symbols per ``yfinance.download`` call. 1 (default)
+                downloads each symbol via ``Ticker.history``; symbols missing
+                from a batch response are retried individually.
+            session: Optional HTTP session passed to yfinance so all workers
+                reuse one connection pool.
 
         Raises:
-            ValueError: If storage_path contains path traversal.
+            ValueError: If storage_path contains path traversal, or
+                max_workers/batch_size is less than 1.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
         self._storage_path = self._validate_storage_path(storage_path)
         self._baseline_path = baseline_path.resolve() if baseline_path else None
         self._lock_dir = lock_dir or (storage_path / "locks")
@@ -173,6 +200,13 @@ class YFinanceProvider:
         self._environment = environment.lower()
         self._use_yfinance_in_prod = use_yfinance_in_prod
         self._crsp_available = crsp_available
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        self._session = session
+
+        # Shared request pacing for all download workers
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
 
         # Create directories
         self._daily_dir = self._storage_path / "daily"
@@ -475,29 +509,15 @@ class YFinanceProvider:
             )
             raise YFinanceError(f"Failed to acquire cache lock: {e}") from e
 
+        staged: dict[str, tuple[Path, Path, dict[str, Any]]] = {}
         try:
-            manifest_entries: dict[str, dict[str, Any]] = {}
             failed_symbols: list[str] = []
             drift_warnings: dict[str, float] = {}
+            drift_blocked: list[str] = []
 
-            for idx, symbol in enumerate(symbols):
-                # Rate limiting: sleep BEFORE each request (except first)
-                # This ensures rate limiting runs even when errors/continues occur
-                if idx > 0:
-                    delay = self.REQUEST_DELAY_SECONDS + random.uniform(0, self.JITTER_MAX_SECONDS)
-                    time.sleep(delay)
-
-                logger.info(
-                    "Fetching symbol",
-                    extra={
-                        "symbol": symbol,
-                        "start_date": str(start_date),
-                        "end_date": str(end_date),
-                    },
-                )
-
-                df = self._download_with_retry(symbol, start_date, end_date)
-
+            # Downloads run concurrently; each completed symbol is validated and
+            # staged next to its cache file, then everything is published at once
+            for symbol, df in self._download_symbols(symbols, start_date, end_date):
                 if df is None or df.is_empty():
                     logger.warning("Download failed or empty", extra={"symbol": symbol})
                     failed_symbols.append(symbol)
@@ -523,62 +543,39 @@ class YFinanceProvider:
                                 ),
                             },
                         )
-                        # Invalidate any existing stale cache for this symbol
-                        existing_cache = self._safe_cache_path(symbol)
-                        if existing_cache.exists():
-                            self._quarantine_file(existing_cache, "drift_detected")
-                            # Remove from manifest to prevent serving stale data
-                            existing_manifest = self.get_manifest()
-                            if existing_manifest:
-                                files = existing_manifest.get("files", {})
-                                files.pop(f"{symbol}.parquet", None)
-                                existing_manifest["files"] = files
-                                self._atomic_write_manifest(existing_manifest)
+                        drift_blocked.append(symbol)
                         failed_symbols.append(symbol)
                         continue
 
-                # Atomic write to cache (using safe path)
                 target_path = self._safe_cache_path(symbol)
-                checksum = self._atomic_write_parquet(df, target_path)
+                temp_path, checksum = self._stage_parquet(df, target_path)
 
                 # Get date range
                 date_col = df.get_column("date")
                 min_date = date_col.min()
                 max_date = date_col.max()
 
-                file_entry = {
-                    "symbol": symbol,
-                    "checksum": checksum,
-                    "row_count": df.height,
-                    "start_date": str(min_date) if min_date else None,
-                    "end_date": str(max_date) if max_date else None,
-                    "last_updated": datetime.now(UTC).isoformat(),
-                }
-                manifest_entries[f"{symbol}.parquet"] = file_entry
-
-                # Update manifest IMMEDIATELY after each file write to prevent
-                # race condition where concurrent readers see file but not manifest
-                existing_manifest = self.get_manifest() or {}
-                existing_files = existing_manifest.get("files", {})
-                existing_files[f"{symbol}.parquet"] = file_entry
-
-                manifest_data: dict[str, Any] = {
-                    "dataset": self.DATASET_NAME,
-                    "sync_timestamp": datetime.now(UTC).isoformat(),
-                    "schema_version": "v1.0.0",
-                    "files": existing_files,
-                }
-                self._atomic_write_manifest(manifest_data)
-
-                logger.info(
-                    "Symbol cached",
-                    extra={
+                staged[symbol] = (
+                    temp_path,
+                    target_path,
+                    {
                         "symbol": symbol,
-                        "rows": df.height,
-                        "checksum": checksum[:16] + "...",
+                        "checksum": checksum,
+                        "row_count": df.height,
+                        "start_date": str(min_date) if min_date else None,
+                        "end_date": str(max_date) if max_date else None,
+                        "last_updated": datetime.now(UTC).isoformat(),
                     },
                 )
 
+            order = {symbol: idx for idx, symbol in enumerate(symbols)}
+            failed_symbols.sort(key=order.__getitem__)
+            manifest_entries = self._publish_cache_files(
+                {symbol: staged[symbol] for symbol in sorted(staged, key=order.__getitem__)},
+                sorted(drift_blocked, key=order.__getitem__),
+            )
+            staged.clear()
+
             result: dict[str, Any] = {
                 "files": manifest_entries,
                 "failed_symbols": failed_symbols,
@@ -600,8 +597,214 @@ class YFinanceProvider:
             return result
 
         finally:
+            for temp_path, _target_path, _entry in staged.values():
+                temp_path.unlink(missing_ok=True)
             lock.release(lock_token)
 
+    def _publish_cache_files(
+        self,
+        staged: dict[str, tuple[Path, Path, dict[str, Any]]],
+        drift_blocked: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Move staged cache files into place and write the manifest once.
+
+        Cache files and their manifest entries become visible together, so
+        readers never verify a fresh file against a stale checksum for longer
+        than the rename loop.
+
+        Args:
+            staged: Symbol -> (temp path, target path, manifest entry).
+            drift_blocked: Symbols whose existing cache must be quarantined.
+
+        Returns:
+            Manifest entries for the published files.
+        """
+        existing_manifest = self.get_manifest()
+        existing_files: dict[str, Any] = (existing_manifest or {}).get("files", {})
+        removed = False
+
+        # Invalidate stale cache for drift-blocked symbols to prevent serving it
+        for symbol in drift_blocked:
+            existing_cache = self._safe_cache_path(symbol)
+            if existing_cache.exists():
+                self._quarantine_file(existing_cache, "drift_detected")
+                if existing_files.pop(f"{symbol}.parquet", None) is not None:
+                    removed = True
+
+        manifest_entries: dict[str, dict[str, Any]] = {}
+        try:
+            for symbol, (temp_path, target_path, entry) in staged.items():
+                self._publish_staged_parquet(temp_path, target_path)
+                manifest_entries[f"{symbol}.parquet"] = entry
+                logger.info(
+                    "Symbol cached",
+                    extra={
+                        "symbol": symbol,
+                        "rows": entry["row_count"],
+                        "checksum": entry["checksum"][:16] + "...",
+                    },
+                )
+        finally:
+            # Record whatever was renamed, even if a later rename failed
+            if manifest_entries:
+                self._fsync_directory(self._daily_dir)
+                existing_files.update(manifest_entries)
+                self._atomic_write_manifest(
+                    {
+                        "dataset": self.DATASET_NAME,
+                        "sync_timestamp": datetime.now(UTC).isoformat(),
+                        "schema_version": "v1.0.0",
+                        "files": existing_files,
+                    }
+                )
+            elif removed and existing_manifest is not None:
+                existing_manifest["files"] = existing_files
+                self._atomic_write_manifest(existing_manifest)
+
+        return manifest_entries
+
+    def _throttle(self) -> None:
+        """Block until this thread may start a request.
+
+        Request starts are spaced by REQUEST_DELAY_SECONDS plus jitter across
+        all workers, so concurrency overlaps latency without raising the
+        request rate.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = (
+                start_at + self.REQUEST_DELAY_SECONDS + random.uniform(0, self.JITTER_MAX_SECONDS)
+            )
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _download_symbols(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> Iterator[tuple[str, pl.DataFrame | None]]:
+        """Download symbols concurrently, yielding results as they complete.
+
+        Args:
+            symbols: Validated symbols to download.
+            start_date: Start of date range.
+            end_date: End of date range.
+
+        Yields:
+            (symbol, DataFrame or None on failure) in completion order.
+        """
+        batches = [
+            symbols[idx : idx + self._batch_size]
+            for idx in range(0, len(symbols), self._batch_size)
+        ]
+        if not batches:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(batches)),
+            thread_name_prefix="yfinance-download",
+        )
+        try:
+            futures = [
+                executor.submit(self._download_batch, batch, start_date, end_date)
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                yield from future.result().items()
+        finally:
+            # Consumer errors (e.g. a failed cache write) must not wait on the queue
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _download_batch(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, pl.DataFrame | None]:
+        """Download a batch with one multi-ticker request, falling back per symbol.
+
+        Args:
+            symbols: Symbols in this batch.
+            start_date: Start of date range.
+            end_date: End of date range.
+
+        Returns:
+            Mapping of symbol to DataFrame (None if the download failed).
+        """
+        results: dict[str, pl.DataFrame | None] = {}
+        if len(symbols) > 1:
+            results = self._download_multi(symbols, start_date, end_date)
+
+        for symbol in symbols:
+            if results.get(symbol) is None:
+                logger.info(
+                    "Fetching symbol",
+                    extra={
+                        "symbol": symbol,
+                        "start_date": str(start_date),
+                        "end_date": str(end_date),
+                    },
+                )
+                results[symbol] = self._download_with_retry(symbol, start_date, end_date)
+        return results
+
+    def _download_multi(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, pl.DataFrame | None]:
+        """Download several symbols in one ``yfinance.download`` call.
+
+        Failures are not retried here; the caller retries missing symbols
+        individually. Calls are serialized across workers because
+        ``yfinance.download`` is not thread-safe.
+        """
+        try:
+            import yfinance as yf
+        except ImportError as e:
+            raise YFinanceError("yfinance not installed. Run: pip install yfinance") from e
+
+        try:
+            with self._MULTI_DOWNLOAD_LOCK:
+                self._throttle()
+                pdf = yf.download(
+                    tickers=symbols,
+                    start=start_date.isoformat(),
+                    end=(end_date + timedelta(days=1)).isoformat(),
+                    group_by="ticker",
+                    auto_adjust=False,
+                    threads=False,
+                    progress=False,
+                    session=self._session,
+                )
+        except Exception as e:
+            logger.warning(
+                "Batch download failed - falling back to per-symbol downloads",
+                extra={"symbols": symbols, "error": str(e)},
+            )
+            return {}
+
+        results: dict[str, pl.DataFrame | None] = {}
+        if pdf is None or pdf.empty:
+            return results
+        tickers = set(pdf.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol not in tickers:
+                continue
+            try:
+                symbol_pdf = pdf[symbol].dropna(how="all")
+                if not symbol_pdf.empty:
+                    results[symbol] = self._history_to_polars(symbol_pdf, symbol)
+            except Exception as e:
+                logger.warning(
+                    "Batch result unusable for symbol",
+                    extra={"symbol": symbol, "error": str(e)},
+                )
+        return results
+
     def _download_with_retry(
         self,
         symbol: str,
@@ -625,9 +828,14 @@ class YFinanceProvider:
             raise YFinanceError("yfinance not installed. Run: pip install yfinance") from e
 
         for attempt in range(self.MAX_RETRIES):
+            self._throttle()
             try:
                 # Download using yfinance
-                ticker = yf.Ticker(symbol)
+                ticker = (
+                    yf.Ticker(symbol)
+                    if self._session is None
+                    else yf.Ticker(symbol, session=self._session)
+                )
                 pdf = ticker.history(
                     start=start_date.isoformat(),
                     end=(end_date + timedelta(days=1)).isoformat(),
@@ -646,35 +854,7 @@ class YFinanceProvider:
                         continue
                     return None
 
-                # Convert to polars
-                pdf = pdf.reset_index()
-
-                # Normalize column names
-                pdf.columns = [c.lower().replace(" ", "_") for c in pdf.columns]
-
-                # Rename columns to match schema
-                rename_map = {
-                    "adj_close": "adj_close",
-                    "adj close": "adj_close",
-                }
-                for old, new in rename_map.items():
-                    if old in pdf.columns and old != new:
-                        pdf = pdf.rename(columns={old: new})
-
-                df = pl.from_pandas(pdf)
-
-                # Ensure date column is date type
-                if "date" in df.columns:
-                    df = df.with_columns(pl.col("date").cast(pl.Date))
-
-                # Add symbol column
-                df = df.with_columns(pl.lit(symbol).alias("symbol"))
-
-                # Select and order columns
-                available_cols = [c for c in YFINANCE_COLUMNS if c in df.columns]
-                result: pl.DataFrame = df.select(available_cols)
-
-                return result
+                return self._history_to_polars(pdf, symbol)
 
             except Exception as e:
                 logger.warning(
@@ -699,13 +879,45 @@ class YFinanceProvider:
 
         return None
 
+    @staticmethod
+    def _history_to_polars(pdf: Any, symbol: str) -> pl.DataFrame:
+        """Convert a single-ticker yfinance history frame to the cache schema."""
+        # Convert to polars
+        pdf = pdf.reset_index()
+
+        # Normalize column names
+        pdf.columns = [c.lower().replace(" ", "_") for c in pdf.columns]
+
+        # Rename columns to match schema
+        rename_map = {
+            "adj_close": "adj_close",
+            "adj close": "adj_close",
+        }
+        for old, new in rename_map.items():
+            if old in pdf.columns and old != new:
+                pdf = pdf.rename(columns={old: new})
+
+        df = pl.from_pandas(pdf)
+
+        # Ensure date column is date type
+        if "date" in df.columns:
+            df = df.with_columns(pl.col("date").cast(pl.Date))
+
+        # Add symbol column
+        df = df.with_columns(pl.lit(symbol).alias("symbol"))
+
+        # Select and order columns
+        available_cols = [c for c in YFINANCE_COLUMNS if c in df.columns]
+        result: pl.DataFrame = df.select(available_cols)
+        return result
+
     def _fetch_symbols(
         self,
         symbols: list[str],
         start_date: date,
         end_date: date,
     ) -> list[pl.DataFrame]:
-        """Fetch multiple symbols with rate limiting.
+        """Fetch multiple symbols concurrently with rate limiting.
 
         Args:
             symbols: List of symbols to fetch.
@@ -713,25 +925,18 @@ class YFinanceProvider:
             end_date: End of date range.
 
         Returns:
-            List of DataFrames (one per symbol that succeeded).
+            List of DataFrames (one per symbol that succeeded), in input order.
         """
-        results: list[pl.DataFrame] = []
-
-        for idx, symbol in enumerate(symbols):
-            # Rate limiting: sleep BEFORE each request (except first)
-            if idx > 0:
-                delay = self.REQUEST_DELAY_SECONDS + random.uniform(0, self.JITTER_MAX_SECONDS)
-                time.sleep(delay)
-
-            df = self._download_with_retry(symbol, start_date, end_date)
-            if df is not None and not df.is_empty():
-                results.append(df)
-                # Note: We do NOT cache here to avoid:
-                # 1. Manifest inconsistency (M1 review feedback)
-                # 2. Lock bypass race condition (M2 review feedback)
-                # Use fetch_and_cache() for writes with proper locking and manifest updates.
-
-        return results
+        fetched = dict(self._download_symbols(symbols, start_date, end_date))
+        # Note: We do NOT cache here to avoid:
+        # 1. Manifest inconsistency (M1 review feedback)
+        # 2. Lock bypass race condition (M2 review feedback)
+        # Use fetch_and_cache() for writes with proper locking and manifest updates.
+        return [
+            df
+            for symbol in symbols
+            if (df := fetched.get(symbol)) is not None and not df.is_empty()
+        ]
 
     def _verify_cache_integrity(self, symbol: str, cache_path: Path) -> bool:
         """Verify cache file integrity against manifest checksum.
@@ -1312,14 +1517,10 @@ class YFinanceProvider:
         """Write Parquet atomically using temp file + rename + quarantine.
 
         Pattern (per repo standards):
-        1. Check disk space
-        2. Write to temp path: target.parquet.tmp
-        3. Compute checksum of temp file
-        4. Validate: row count > 0
-        5. On validation failure: move to quarantine
-        6. Atomic rename: temp -> target
-        7. fsync directory for crash safety
-        8. Return checksum
+        1. Stage: check disk space, write + fsync temp file, checksum, validate
+        2. Atomic rename: temp -> target
+        3. fsync directory for crash safety
+        4. Return checksum
 
         Args:
             df: DataFrame to write.
@@ -1332,6 +1533,29 @@ class YFinanceProvider:
             ValueError: If DataFrame is empty.
             OSError: If disk space insufficient.
         """
+        temp_path, checksum = self._stage_parquet(df, target_path)
+        self._publish_staged_parquet(temp_path, target_path)
+        self._fsync_directory(target_path.parent)
+        return checksum
+
+    def _stage_parquet(
+        self,
+        df: pl.DataFrame,
+        target_path: Path,
+    ) -> tuple[Path, str]:
+        """Write and fsync ``df`` to ``target.parquet.tmp`` without publishing it.
+
+        Args:
+            df: DataFrame to write.
+            target_path: Final file path.
+
+        Returns:
+            (temp path, SHA-256 checksum of the temp file).
+
+        Raises:
+            ValueError: If DataFrame is empty (temp file is quarantined).
+            OSError: If disk space insufficient or the write fails.
+        """
         # Check disk space before write
         self._check_disk_space(target_path.parent)
 
@@ -1352,25 +1576,10 @@ class YFinanceProvider:
                 self._quarantine_file(temp_path, "empty_dataframe")
                 raise ValueError("Empty DataFrame, file quarantined")
 
-            # Atomic rename (readers never see .tmp)
-            temp_path.rename(target_path)
-
-            # fsync directory for crash safety
-            self._fsync_directory(target_path.parent)
-
-            return actual_checksum
+            return temp_path, actual_checksum
 
         except OSError as e:
-            logger.error(
-                "Atomic write failed - filesystem error",
-                extra={
-                    "provider": "yfinance",
-                    "target": str(target_path),
-                    "error": str(e),
-                    "errno": e.errno,
-                },
-                exc_info=True,
-            )
+            self._log_write_failure(target_path, e)
             # Clean up temp file on any error
             if temp_path.exists():
                 temp_path.unlink(missing_ok=True)
@@ -1386,6 +1595,27 @@ class YFinanceProvider:
                 temp_path.unlink(missing_ok=True)
             raise
 
+    def _publish_staged_parquet(self, temp_path: Path, target_path: Path) -> None:
+        """Atomically rename a staged file into place (readers never see .tmp)."""
+        try:
+            temp_path.rename(target_path)
+        except OSError as e:
+            self._log_write_failure(target_path, e)
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _log_write_failure(self, target_path: Path, error: OSError) -> None:
+        logger.error(
+            "Atomic write failed - filesystem error",
+            extra={
+                "provider": "yfinance",
+                "target": str(target_path),
+                "error": str(error),
+                "errno": error.errno,
+            },
+            exc_info=True,
+        )
+
     def _quarantine_file(self, file_path: Path, reason: str) -> Path:
         """Move failed file to quarantine directory.
 
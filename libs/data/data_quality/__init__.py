@@ -5,11 +5,13 @@ This module provides:
 - SyncManifest: Pydantic model tracking data sync state
 - ManifestManager: Atomic manifest operations with locking
 - DataValidator: Data validation (row counts, nulls, schema, dates)
+- FileHasher: Concurrent file hashing with a persistent checksum cache
 - SchemaRegistry: Schema versioning and drift detection
 - DatasetVersionManager: Dataset versioning for reproducibility (T1.6)
 - Various exceptions for error handling
 """
 
+from libs.data.data_quality.checksums import ChecksumCache, FileHasher
 from libs.data.data_quality.exceptions import (
     ChecksumMismatchError,
     DataCoverageError,
@@ -45,6 +47,7 @@ from libs.data.data_quality.versioning import (
     FileStorageInfo,
     SnapshotDiff,
     SnapshotManifest,
+    SnapshotProgress,
 )
 
 __all__ = [
@@ -55,6 +58,9 @@ __all__ = [
     "DataValidator",
     "ValidationError",
     "AnomalyAlert",
+    # Checksums
+    "FileHasher",
+    "ChecksumCache",
     # Schema
     "SchemaRegistry",
     "DatasetSchema",
@@ -62,6 +68,7 @@ __all__ = [
     # Versioning (T1.6)
     "DatasetVersionManager",
     "SnapshotManifest",
+    "SnapshotProgress",
     "DatasetSnapshot",
     "FileStorageInfo",
     "BacktestLinkage",
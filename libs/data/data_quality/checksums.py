@@ -0,0 +1,223 @@
+"""
+Shared file hashing service for checksums and integrity verification.
+
+This module provides:
+- sha256_file: Large-buffer SHA-256 of a single file
+- ChecksumCache: Persistent (path, size, mtime_ns, inode) -> sha256 cache
+- FileHasher: Concurrent hashing of many files backed by an optional cache
+
+hashlib releases the GIL while digesting large buffers, so a thread pool
+hashes several files at disk/CPU speed. The cache lives in a small SQLite
+file (WAL mode, safe for concurrent processes); a file is re-hashed only
+when its size, mtime or inode changes. Atomic writes (temp + rename)
+always produce a new inode, so rewritten partitions are never served a
+stale digest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 1 MiB reads keep syscall overhead negligible and let hashlib drop the GIL
+CHECKSUM_BUFFER_SIZE = 1 << 20
+
+# Files modified this recently are hashed but not cached: a same-size rewrite
+# within the filesystem's timestamp granularity would otherwise go unnoticed
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def sha256_file(path: Path, buffer_size: int = CHECKSUM_BUFFER_SIZE) -> str:
+    """Compute the SHA-256 of a file using a reusable large read buffer.
+
+    Args:
+        path: File path.
+        buffer_size: Read buffer size in bytes.
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    hasher = hashlib.sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+class ChecksumCache:
+    """Persistent SHA-256 cache keyed by file identity.
+
+    Entries are keyed by absolute path and are valid only while the file's
+    size, mtime_ns and inode are unchanged. Errors talking to the database
+    are logged and treated as cache misses: the cache is an optimization,
+    never a source of truth.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS file_checksums (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            sha256 TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite file for the cache.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+            self._conn.execute(self._SCHEMA)
+
+    def get(self, path: Path, stat: os.stat_result) -> str | None:
+        """Return the cached digest if the file is unchanged since it was hashed."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, inode, sha256 FROM file_checksums WHERE path = ?",
+                    (str(path),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Checksum cache read failed",
+                extra={"event": "checksum.cache.error", "path": str(path), "error": str(e)},
+            )
+            return None
+        if row is None or tuple(row[:3]) != (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+            return None
+        return str(row[3])
+
+    def put(self, path: Path, stat: os.stat_result, sha256: str) -> None:
+        """Record the digest of a file for its current identity."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO file_checksums VALUES (?, ?, ?, ?, ?)",
+                    (str(path), stat.st_size, stat.st_mtime_ns, stat.st_ino, sha256),
+                )
+        except sqlite3.Error as e:
+            logger.warning(
+                "Checksum cache write failed",
+                extra={"event": "checksum.cache.error", "path": str(path), "error": str(e)},
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class FileHasher:
+    """Hashes files concurrently, reusing cached digests for unchanged files.
+
+    Example:
+        hasher = FileHasher(cache_path=Path("data/cache/file_checksums.sqlite"))
+        digests = hasher.checksums(manifest_paths)
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | None = None,
+        max_workers: int | None = None,
+        buffer_size: int = CHECKSUM_BUFFER_SIZE,
+    ) -> None:
+        """Initialize hasher.
+
+        Args:
+            cache_path: SQLite file for the persistent cache (no cache if None).
+            max_workers: Threads used by checksums() (default: min(8, cpu_count)).
+            buffer_size: Read buffer size in bytes.
+
+        Raises:
+            ValueError: If max_workers or buffer_size is not positive.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive")
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.buffer_size = buffer_size
+        self.cache = ChecksumCache(cache_path) if cache_path is not None else None
+
+    def checksum(self, path: Path, *, use_cache: bool = True) -> str:
+        """Return the SHA-256 of a file, served from the cache when unchanged.
+
+        Args:
+            path: File path.
+            use_cache: If False, always read the file and leave the cache
+                untouched (integrity checks must not trust stored digests).
+
+        Returns:
+            Hex-encoded SHA-256 digest.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        if self.cache is None or not use_cache:
+            return sha256_file(path, self.buffer_size)
+
+        key = Path(os.path.abspath(path))
+        before = os.stat(key)
+        cached = self.cache.get(key, before)
+        if cached is not None:
+            return cached
+
+        digest = sha256_file(key, self.buffer_size)
+        after = os.stat(key)
+        unchanged = (before.st_size, before.st_mtime_ns, before.st_ino) == (
+            after.st_size,
+            after.st_mtime_ns,
+            after.st_ino,
+        )
+        if unchanged and time.time_ns() - after.st_mtime_ns > _RACY_WINDOW_NS:
+            self.cache.put(key, after, digest)
+        return digest
+
+    def checksums(self, paths: Iterable[Path], *, use_cache: bool = True) -> dict[Path, str]:
+        """Return SHA-256 digests for many files, hashing them concurrently.
+
+        Args:
+            paths: File paths (duplicates are hashed once).
+            use_cache: If False, re-read every file (see checksum()).
+
+        Returns:
+            Mapping of each input path to its digest.
+
+        Raises:
+            OSError: If any file cannot be read.
+        """
+        unique = list(dict.fromkeys(Path(p) for p in paths))
+        if len(unique) <= 1 or self.max_workers == 1:
+            return {p: self.checksum(p, use_cache=use_cache) for p in unique}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(unique)),
+            thread_name_prefix="file-hasher",
+        ) as executor:
+            digests = executor.map(partial(self.checksum, use_cache=use_cache), unique)
+            return dict(zip(unique, digests, strict=True))
+
+    def close(self) -> None:
+        """Release the cache connection, if any."""
+        if self.cache is not None:
+            self.cache.close()
@@ -1,27 +1,23 @@
 """Data coverage analyzer for symbol x date heatmap visualization.
 
-Scans adjusted and quarantine Parquet directories to build a coverage matrix
-showing data completeness across the ticker universe. Uses Polars direct reads
-for efficient per-file date extraction and NYSE trading calendar to distinguish
-missing data from market-closed dates.
+Builds a coverage matrix showing data completeness across the full ticker
+universe from the adjusted and quarantine datasets. The NYSE trading
+calendar distinguishes missing data from market-closed dates.
 
 Key design:
-    - Polars ``read_parquet(columns=["date"])`` for lightweight per-file scanning
-      (avoids O(symbols * date_dirs) DuckDB view registration overhead).
-    - Symbol derived from ``pq_file.stem`` (filename), not from Parquet column.
-    - NYSE (XNYS) calendar classifies each date as trading/non-trading.
-    - 200-symbol cap with truncation indicator for UI.
+    - Adjusted presence comes from one lazy, predicate-pushed scan of the
+      consolidated ``AdjustedStore`` when it exists, otherwise from a single
+      multi-file ``scan_parquet`` over the ``YYYY-MM-DD/{SYMBOL}.parquet``
+      partitions (quarantine always uses the partitions).
+    - Symbol derived from the partition filename, not from a Parquet column.
+    - Only observed (symbol, trading day) cells are materialized. The
+      (symbol x period) matrix is a group-by against a calendar frame; every
+      unobserved cell defaults to MISSING, or NO_EXPECTATION when its period
+      has no trading days.
+    - Gap detection is a run-length pass over trading-day indices.
     - 180-day hard cap for daily resolution (auto-upgrades to weekly).
-    - Per-file fault tolerance: corrupt files logged and skipped.
-
-TODO(perf): For production-scale datasets (500+ partitions, 200 symbols),
-    replace per-file ``pl.read_parquet`` with a single DuckDB glob query:
-    ``SELECT filename, date FROM read_parquet('data/adjusted/*/*.parquet',
-    filename=true)`` to scan all partitions in one pass. Extract symbol from
-    ``regexp_extract(filename, ...)``. This reduces O(partitions * symbols)
-    file opens to a single DuckDB scan. See also: centralize
-    ExchangeCalendarAdapter usage into a shared utility to prevent logic
-    drift between PITInspector and CoverageAnalyzer.
+    - Per-file fault tolerance: if the multi-file scan fails, files are read
+      one by one and corrupt files are logged and skipped.
 """
 
 from __future__ import annotations
@@ -30,23 +26,28 @@ import datetime
 import json
 import logging
 import re
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import polars as pl
 
+from libs.data.data_pipeline.adjusted_store import AdjustedStore
 from libs.data.data_quality.validation import is_valid_date_partition
 
 logger = logging.getLogger(__name__)
 
-MAX_SYMBOLS = 200
 MAX_DAILY_DAYS = 180
 
 # Symbol validation: alphanumeric, 1-10 chars (matches PIT inspector).
 _SYMBOL_PATTERN = re.compile(r"^[A-Za-z0-9]{1,10}$")
 
+# Partition files are named {SYMBOL}.parquet
+_FILE_SYMBOL_PATTERN = r"([^/\\]+)\.parquet$"
+
 
 # ============================================================================
 # Data Classes
@@ -62,6 +63,20 @@ class CoverageStatus(str, Enum):
     NO_EXPECTATION = "no_expectation"
 
 
+# Integer codes ordered by aggregation precedence, so a period's status is
+# the max over its days: MISSING > SUSPICIOUS > COMPLETE > NO_EXPECTATION.
+_CODE_NO_EXPECTATION = 0
+_CODE_COMPLETE = 1
+_CODE_SUSPICIOUS = 2
+_CODE_MISSING = 3
+_STATUS_BY_CODE = (
+    CoverageStatus.NO_EXPECTATION,
+    CoverageStatus.COMPLETE,
+    CoverageStatus.SUSPICIOUS,
+    CoverageStatus.MISSING,
+)
+
+
 @dataclass
 class CoverageGap:
     """A contiguous run of missing trading days for a symbol."""
@@ -86,7 +101,11 @@ class CoverageSummary:
 
 @dataclass
 class CoverageMatrix:
-    """Full coverage analysis result."""
+    """Full coverage analysis result.
+
+    ``truncated`` is kept for export compatibility; the full requested
+    universe is always analyzed, so it is False.
+    """
 
     symbols: list[str]
     dates: list[datetime.date]
@@ -124,6 +143,35 @@ def _coerce_date(raw: object) -> datetime.date | None:
     return None
 
 
+def _date_expr(dtype: pl.DataType) -> pl.Expr:
+    """Normalize a ``date`` column of any supported dtype to ``pl.Date``."""
+    if dtype == pl.Date:
+        return pl.col("date")
+    if isinstance(dtype, pl.Datetime):
+        return pl.col("date").dt.date()
+    if dtype == pl.String:
+        return pl.col("date").str.to_date(strict=False)
+    return pl.lit(None, dtype=pl.Date)
+
+
+def _empty_presence() -> pl.DataFrame:
+    return pl.DataFrame(schema={"symbol": pl.String, "date": pl.Date})
+
+
+def _partition_files(base_dir: Path, symbols: Collection[str] | None) -> list[Path]:
+    """List ``YYYY-MM-DD/{SYMBOL}.parquet`` files, optionally for some symbols."""
+    files: list[Path] = []
+    if not base_dir.exists():
+        return files
+    for date_dir in sorted(base_dir.iterdir()):
+        if not date_dir.is_dir() or not is_valid_date_partition(date_dir.name):
+            continue
+        for pq_file in sorted(date_dir.glob("*.parquet")):
+            if symbols is None or pq_file.stem in symbols:
+                files.append(pq_file)
+    return files
+
+
 # ============================================================================
 # CoverageAnalyzer
 # ============================================================================
@@ -138,35 +186,46 @@ class CoverageAnalyzer:
     def __init__(self, data_dir: Path = Path("data")) -> None:
         self._adjusted_dir = data_dir / "adjusted"
         self._quarantine_dir = data_dir / "quarantine"
+        self._store = AdjustedStore(self._adjusted_dir)
         self._cached_tickers: list[str] | None = None
 
     def get_available_tickers(self) -> list[str]:
-        """Scan adjusted and quarantine directories for all ticker symbols.
+        """Return all ticker symbols in the adjusted and quarantine datasets.
 
         Includes quarantine-only symbols so the default coverage heatmap
-        surfaces tickers most likely to have quality issues. Result is cached
-        for the lifetime of this analyzer instance to avoid redundant scans
-        when ``analyze()`` is called with ``symbols=None``.
+        surfaces tickers most likely to have quality issues. Adjusted symbols
+        come from the consolidated store when it exists. Result is cached for
+        the lifetime of this analyzer instance to avoid redundant scans when
+        ``analyze()`` is called with ``symbols=None``.
         """
         if self._cached_tickers is not None:
             return self._cached_tickers
         tickers: set[str] = set()
-        for base_dir in (self._adjusted_dir, self._quarantine_dir):
-            if not base_dir.exists():
-                continue
-            for date_dir in base_dir.iterdir():
-                if date_dir.is_dir() and is_valid_date_partition(date_dir.name):
-                    for pq in date_dir.glob("*.parquet"):
-                        tickers.add(pq.stem)
+        base_dirs = [self._quarantine_dir]
+        if self._store.exists:
+            lf = self._store.scan()
+            if lf is not None:
+                tickers.update(lf.select(pl.col("symbol").unique()).collect()["symbol"])
+        else:
+            base_dirs.append(self._adjusted_dir)
+        for base_dir in base_dirs:
+            tickers.update(pq.stem for pq in _partition_files(base_dir, None))
         self._cached_tickers = sorted(tickers)
         return self._cached_tickers
 
     def _discover_date_range(
         self,
     ) -> tuple[datetime.date | None, datetime.date | None]:
-        """Scan adjusted and quarantine partition directories for min/max dates."""
+        """Return min/max dates from the store manifest and partition directories."""
         dates: list[datetime.date] = []
-        for base_dir in (self._adjusted_dir, self._quarantine_dir):
+        base_dirs = [self._quarantine_dir]
+        if self._store.exists:
+            for entry in self._store.load_manifest()["partitions"].values():
+                dates.append(datetime.date.fromisoformat(entry["min_date"]))
+                dates.append(datetime.date.fromisoformat(entry["max_date"]))
+        else:
+            base_dirs.append(self._adjusted_dir)
+        for base_dir in base_dirs:
             if not base_dir.exists():
                 continue
             for d in base_dir.iterdir():
@@ -184,9 +243,9 @@ class CoverageAnalyzer:
         """Build a coverage matrix for the given parameters.
 
         Args:
-            symbols: Ticker symbols to include (None = all discovered, capped at 200).
-            start_date: Start of date range (None = earliest partition).
-            end_date: End of date range (None = latest partition).
+            symbols: Ticker symbols to include (None = all discovered).
+            start_date: Start of date range (None = earliest available date).
+            end_date: End of date range (None = latest available date).
             resolution: Time granularity for the matrix.
 
         Returns:
@@ -229,25 +288,14 @@ class CoverageAnalyzer:
         # Build target symbol set (validate + deduplicate to prevent path
         # traversal and inflated metrics from duplicate symbols)
         if symbols is None:
-            all_symbols = self.get_available_tickers()
+            target_symbols_list = self.get_available_tickers()
         else:
-            seen: set[str] = set()
-            all_symbols = []
-            for s in sorted(symbols):
-                if s not in seen and _SYMBOL_PATTERN.match(s):
-                    all_symbols.append(s)
-                    seen.add(s)
-        total_symbol_count = len(all_symbols)
-        target_symbols_list = all_symbols[:MAX_SYMBOLS]
+            target_symbols_list = sorted(
+                {s for s in symbols if _SYMBOL_PATTERN.match(s)}
+            )
         target_symbols = set(target_symbols_list)
-        truncated = total_symbol_count > MAX_SYMBOLS
 
         notices: list[str] = []
-        if truncated:
-            notices.append(
-                f"Showing first {MAX_SYMBOLS} of {total_symbol_count} symbols "
-                f"(alphabetical). Use the symbol filter to narrow results."
-            )
 
         # Determine effective resolution (auto-upgrade daily if range too long)
         effective_resolution = resolution
@@ -259,152 +307,63 @@ class CoverageAnalyzer:
                 f"view. Use a shorter range for daily granularity."
             )
 
-        # Build calendar date axis
-        trading_days_set: set[datetime.date] = set()
-        try:
-            # Lazy import: exchange_calendars is optional; fallback to weekdays below.
-            from libs.data.data_quality.types import ExchangeCalendarAdapter
-
-            cal = ExchangeCalendarAdapter("XNYS")
-            trading_days_list = cal.trading_days_between(
-                effective_start, effective_end
-            )
-            trading_days_set = set(trading_days_list)
-        except ImportError:
-            logger.info(
-                "exchange_calendars not installed, treating all weekdays as trading days",
-            )
-            d = effective_start
-            while d <= effective_end:
-                if d.weekday() < 5:
-                    trading_days_set.add(d)
-                d += datetime.timedelta(days=1)
-
-        all_dates = []
-        d = effective_start
-        while d <= effective_end:
-            all_dates.append(d)
-            d += datetime.timedelta(days=1)
+        trading_days = _trading_days(effective_start, effective_end)
+        calendar = _calendar_frame(
+            effective_start, effective_end, trading_days, effective_resolution
+        )
 
-        # Scan adjusted data
-        presence_set: set[tuple[str, datetime.date]] = set()
+        # Presence: one scan per dataset, restricted to range and universe
         skipped_files: list[str] = []
+        presence = self._scan_adjusted(
+            target_symbols, effective_start, effective_end, skipped_files
+        )
+        quarantine = _scan_partitions(
+            _partition_files(self._quarantine_dir, target_symbols),
+            effective_start,
+            effective_end,
+            skipped_files,
+            "coverage_scan_skip_quarantine_file",
+        )
 
-        if self._adjusted_dir.exists():
-            for date_dir in sorted(self._adjusted_dir.iterdir()):
-                if not date_dir.is_dir() or not is_valid_date_partition(
-                    date_dir.name
-                ):
-                    continue
-                # Targeted file checks: iterate over capped symbol set
-                # instead of globbing all parquet files (O(200) vs O(10k+))
-                for symbol in target_symbols:
-                    pq_file = date_dir / f"{symbol}.parquet"
-                    if not pq_file.exists():
-                        continue
-                    try:
-                        df = pl.read_parquet(pq_file, columns=["date"])
-                    except Exception:
-                        logger.warning(
-                            "coverage_scan_skip_file",
-                            extra={
-                                "file": str(pq_file),
-                                "symbol": symbol,
-                                "partition": date_dir.name,
-                            },
-                        )
-                        skipped_files.append(str(pq_file))
-                        continue
-                    for raw_date in df["date"].unique().to_list():
-                        market_date = _coerce_date(raw_date)
-                        if market_date is None:
-                            continue
-                        if effective_start <= market_date <= effective_end:
-                            presence_set.add((symbol, market_date))
-
-        # Scan quarantine data
-        quarantine_set: set[tuple[str, datetime.date]] = set()
-        if self._quarantine_dir.exists():
-            for date_dir in sorted(self._quarantine_dir.iterdir()):
-                if not date_dir.is_dir() or not is_valid_date_partition(
-                    date_dir.name
-                ):
-                    continue
-                for symbol in target_symbols:
-                    pq_file = date_dir / f"{symbol}.parquet"
-                    if not pq_file.exists():
-                        continue
-                    try:
-                        df = pl.read_parquet(pq_file, columns=["date"])
-                    except Exception:
-                        logger.warning(
-                            "coverage_scan_skip_quarantine_file",
-                            extra={
-                                "file": str(pq_file),
-                                "symbol": symbol,
-                                "partition": date_dir.name,
-                            },
-                        )
-                        skipped_files.append(str(pq_file))
-                        continue
-                    for raw_date in df["date"].unique().to_list():
-                        market_date = _coerce_date(raw_date)
-                        if market_date is None:
-                            continue
-                        if effective_start <= market_date <= effective_end:
-                            quarantine_set.add((symbol, market_date))
-
-        # Build daily matrix
-        daily_matrix: list[list[CoverageStatus]] = []
-        for symbol in target_symbols_list:
-            row: list[CoverageStatus] = []
-            for dt in all_dates:
-                if dt not in trading_days_set:
-                    row.append(CoverageStatus.NO_EXPECTATION)
-                elif (symbol, dt) in quarantine_set:
-                    row.append(CoverageStatus.SUSPICIOUS)
-                elif (symbol, dt) in presence_set:
-                    row.append(CoverageStatus.COMPLETE)
-                else:
-                    row.append(CoverageStatus.MISSING)
-            daily_matrix.append(row)
-
-        # Aggregate by resolution
-        if effective_resolution == "daily":
-            final_dates = all_dates
-            final_matrix = daily_matrix
-        elif effective_resolution == "weekly":
-            final_dates, final_matrix = _aggregate_weekly(
-                all_dates, daily_matrix
+        # Observed trading-day cells; quarantine outranks presence per day
+        cells = (
+            pl.concat(
+                [
+                    presence.with_columns(code=pl.lit(_CODE_COMPLETE, pl.Int8)),
+                    quarantine.with_columns(code=pl.lit(_CODE_SUSPICIOUS, pl.Int8)),
+                ]
             )
-        else:  # monthly
-            final_dates, final_matrix = _aggregate_monthly(
-                all_dates, daily_matrix
+            .group_by("symbol", "date")
+            .agg(pl.col("code").max())
+            .join(
+                calendar.filter(pl.col("trading_idx").is_not_null()),
+                on="date",
+                how="inner",
             )
+        )
+
+        periods = (
+            calendar.group_by("period", maintain_order=True)
+            .agg(pl.col("trading_idx").count().alias("n_trading"))
+            .with_row_index("col")
+        )
+        final_dates: list[datetime.date] = periods["period"].to_list()
+        final_matrix = _build_matrix(cells, periods, target_symbols_list)
 
         # Compute summary
-        total_expected = 0
-        total_present = 0
-        total_missing = 0
-        total_suspicious = 0
-        for row in daily_matrix:
-            for cell in row:
-                if cell == CoverageStatus.NO_EXPECTATION:
-                    continue
-                total_expected += 1
-                if cell == CoverageStatus.COMPLETE:
-                    total_present += 1
-                elif cell == CoverageStatus.MISSING:
-                    total_missing += 1
-                elif cell == CoverageStatus.SUSPICIOUS:
-                    total_suspicious += 1
+        total_expected = len(target_symbols_list) * len(trading_days)
+        total_present = cells.filter(pl.col("code") == _CODE_COMPLETE).height
+        total_suspicious = cells.filter(pl.col("code") == _CODE_SUSPICIOUS).height
+        total_missing = total_expected - total_present - total_suspicious
 
         coverage_pct = (
             (total_present / total_expected * 100.0) if total_expected > 0 else 0.0
         )
 
         # Identify gaps (contiguous missing trading days per symbol)
-        gaps = _find_gaps(target_symbols_list, all_dates, daily_matrix, trading_days_set)
+        gaps = _find_gaps(
+            cells.select("symbol", "trading_idx"), target_symbols_list, trading_days
+        )
 
         summary = CoverageSummary(
             total_expected=total_expected,
@@ -426,13 +385,40 @@ class CoverageAnalyzer:
             dates=final_dates,
             matrix=final_matrix,
             summary=summary,
-            truncated=truncated,
-            total_symbol_count=total_symbol_count,
+            truncated=False,
+            total_symbol_count=len(target_symbols_list),
             effective_resolution=effective_resolution,
             notices=notices,
             skipped_file_count=len(skipped_files),
         )
 
+    def _scan_adjusted(
+        self,
+        symbols: Collection[str],
+        start: datetime.date,
+        end: datetime.date,
+        skipped_files: list[str],
+    ) -> pl.DataFrame:
+        """Return distinct (symbol, date) rows present in the adjusted dataset."""
+        if not symbols:
+            return _empty_presence()
+        if self._store.exists:
+            lf = self._store.scan(sorted(symbols), start, end)
+            if lf is None:
+                return _empty_presence()
+            return (
+                lf.select("symbol", _date_expr(lf.collect_schema()["date"]))
+                .unique()
+                .collect()
+            )
+        return _scan_partitions(
+            _partition_files(self._adjusted_dir, symbols),
+            start,
+            end,
+            skipped_files,
+            "coverage_scan_skip_file",
+        )
+
     def export_coverage_report(
         self,
         matrix: CoverageMatrix,
@@ -483,119 +469,160 @@ class CoverageAnalyzer:
 
 
 # ============================================================================
-# Aggregation Helpers
+# Scanning
 # ============================================================================
 
 
-def _aggregate_status(statuses: list[CoverageStatus]) -> CoverageStatus:
-    """Aggregate daily statuses into a single status using precedence rules.
+def _scan_partitions(
+    files: list[Path],
+    start: datetime.date,
+    end: datetime.date,
+    skipped_files: list[str],
+    skip_event: str,
+) -> pl.DataFrame:
+    """Return distinct (symbol, date) rows from per-date partition files.
 
-    Precedence: MISSING > SUSPICIOUS > COMPLETE > NO_EXPECTATION.
+    All files are read in a single multi-file scan. If that fails (corrupt
+    file or schema drift between files), files are read individually so
+    only the unreadable ones are skipped.
     """
-    has_trading = False
-    has_missing = False
-    has_suspicious = False
-    has_complete = False
-
-    for s in statuses:
-        if s == CoverageStatus.MISSING:
-            has_missing = True
-            has_trading = True
-        elif s == CoverageStatus.SUSPICIOUS:
-            has_suspicious = True
-            has_trading = True
-        elif s == CoverageStatus.COMPLETE:
-            has_complete = True
-            has_trading = True
-
-    if not has_trading:
-        return CoverageStatus.NO_EXPECTATION
-    if has_missing:
-        return CoverageStatus.MISSING
-    if has_suspicious:
-        return CoverageStatus.SUSPICIOUS
-    if has_complete:
-        return CoverageStatus.COMPLETE
-    return CoverageStatus.NO_EXPECTATION
-
-
-def _aggregate_weekly(
-    all_dates: list[datetime.date],
-    daily_matrix: list[list[CoverageStatus]],
-) -> tuple[list[datetime.date], list[list[CoverageStatus]]]:
-    """Group daily data by ISO week (Monday-Sunday)."""
-    if not all_dates:
-        return [], [[] for _ in daily_matrix]
-
-    # Group date indices by ISO week
-    week_groups: list[tuple[datetime.date, list[int]]] = []
-    current_week_label: datetime.date | None = None
-    current_indices: list[int] = []
-
-    for idx, d in enumerate(all_dates):
-        # Monday of this ISO week
-        monday = d - datetime.timedelta(days=d.weekday())
-        if monday != current_week_label:
-            if current_week_label is not None:
-                week_groups.append((current_week_label, current_indices))
-            current_week_label = monday
-            current_indices = [idx]
-        else:
-            current_indices.append(idx)
+    if not files:
+        return _empty_presence()
+    try:
+        lf = pl.scan_parquet(files, include_file_paths="_file", extra_columns="ignore")
+        return (
+            lf.select(
+                pl.col("_file").str.extract(_FILE_SYMBOL_PATTERN, 1).alias("symbol"),
+                _date_expr(lf.collect_schema()["date"]),
+            )
+            .filter(pl.col("date").is_between(start, end))
+            .unique()
+            .collect()
+        )
+    except Exception:
+        logger.info(
+            "coverage_scan_fallback_per_file",
+            extra={"event": "coverage.scan_fallback", "files": len(files)},
+        )
 
-    if current_week_label is not None:
-        week_groups.append((current_week_label, current_indices))
+    symbols: list[str] = []
+    dates: list[datetime.date] = []
+    for pq_file in files:
+        try:
+            df = pl.read_parquet(pq_file, columns=["date"])
+        except Exception:
+            logger.warning(
+                skip_event,
+                extra={
+                    "file": str(pq_file),
+                    "symbol": pq_file.stem,
+                    "partition": pq_file.parent.name,
+                },
+            )
+            skipped_files.append(str(pq_file))
+            continue
+        for raw_date in df["date"].unique().to_list():
+            market_date = _coerce_date(raw_date)
+            if market_date is not None and start <= market_date <= end:
+                symbols.append(pq_file.stem)
+                dates.append(market_date)
+    return pl.DataFrame(
+        {"symbol": symbols, "date": dates},
+        schema={"symbol": pl.String, "date": pl.Date},
+    ).unique()
 
-    week_dates = [wl for wl, _ in week_groups]
-    week_matrix: list[list[CoverageStatus]] = []
-    for row in daily_matrix:
-        week_row = [
-            _aggregate_status([row[i] for i in indices])
-            for _, indices in week_groups
-        ]
-        week_matrix.append(week_row)
-
-    return week_dates, week_matrix
-
-
-def _aggregate_monthly(
-    all_dates: list[datetime.date],
-    daily_matrix: list[list[CoverageStatus]],
-) -> tuple[list[datetime.date], list[list[CoverageStatus]]]:
-    """Group daily data by calendar month."""
-    if not all_dates:
-        return [], [[] for _ in daily_matrix]
-
-    # Group date indices by (year, month)
-    month_groups: list[tuple[datetime.date, list[int]]] = []
-    current_month: tuple[int, int] | None = None
-    current_indices: list[int] = []
-
-    for idx, d in enumerate(all_dates):
-        ym = (d.year, d.month)
-        if ym != current_month:
-            if current_month is not None:
-                label = datetime.date(current_month[0], current_month[1], 1)
-                month_groups.append((label, current_indices))
-            current_month = ym
-            current_indices = [idx]
-        else:
-            current_indices.append(idx)
-
-    if current_month is not None:
-        label = datetime.date(current_month[0], current_month[1], 1)
-        month_groups.append((label, current_indices))
-
-    month_dates = [ml for ml, _ in month_groups]
-    month_matrix: list[list[CoverageStatus]] = []
-    for row in daily_matrix:
-        month_row = [
-            _aggregate_status([row[i] for i in indices])
-            for _, indices in month_groups
-        ]
-        month_matrix.append(month_row)
 
-    return month_dates, month_matrix
+# ============================================================================
+# Calendar and Aggregation Helpers
+# ============================================================================
+
+
+def _trading_days(start: datetime.date, end: datetime.date) -> list[datetime.date]:
+    """Return sorted XNYS trading days in [start, end] (weekdays as fallback)."""
+    try:
+        # Lazy import: exchange_calendars is optional; fallback to weekdays below.
+        from libs.data.data_quality.types import ExchangeCalendarAdapter
+
+        cal = ExchangeCalendarAdapter("XNYS")
+        return sorted(cal.trading_days_between(start, end))
+    except ImportError:
+        logger.info(
+            "exchange_calendars not installed, treating all weekdays as trading days",
+        )
+        days: list[datetime.date] = []
+        d = start
+        while d <= end:
+            if d.weekday() < 5:
+                days.append(d)
+            d += datetime.timedelta(days=1)
+        return days
+
+
+def _calendar_frame(
+    start: datetime.date,
+    end: datetime.date,
+    trading_days: list[datetime.date],
+    resolution: Literal["daily", "weekly", "monthly"],
+) -> pl.DataFrame:
+    """Calendar days in [start, end] with period label and trading-day index.
+
+    ``period`` is the day itself (daily), the Monday of its ISO week
+    (weekly), or the first of its month (monthly). ``trading_idx`` is the
+    day's position in ``trading_days`` and null on non-trading days.
+    """
+    days = pl.DataFrame({"date": pl.date_range(start, end, "1d", eager=True)})
+    trading = pl.DataFrame(
+        {"date": trading_days}, schema={"date": pl.Date}
+    ).with_row_index("trading_idx")
+    if resolution == "daily":
+        period = pl.col("date")
+    elif resolution == "weekly":
+        period = pl.col("date").dt.truncate("1w")
+    else:
+        period = pl.col("date").dt.truncate("1mo")
+    return days.join(trading, on="date", how="left").with_columns(
+        period.alias("period")
+    )
+
+
+def _build_matrix(
+    cells: pl.DataFrame,
+    periods: pl.DataFrame,
+    symbols: list[str],
+) -> list[list[CoverageStatus]]:
+    """Aggregate observed cells into the dense (symbol x period) status matrix.
+
+    A period is MISSING when fewer of its trading days were observed than it
+    has, otherwise the max code of its observed days. Cells without any
+    observation default to MISSING, or NO_EXPECTATION for periods without
+    trading days.
+    """
+    n_trading = periods["n_trading"].to_numpy()
+    default_row = np.where(n_trading > 0, _CODE_MISSING, _CODE_NO_EXPECTATION)
+    codes = np.tile(default_row.astype(np.int8), (len(symbols), 1))
+
+    observed = (
+        cells.group_by("symbol", "period")
+        .agg(pl.len().alias("n_observed"), pl.col("code").max())
+        .join(periods, on="period", how="inner")
+        .join(
+            pl.DataFrame({"symbol": symbols}, schema={"symbol": pl.String}).with_row_index(
+                "row"
+            ),
+            on="symbol",
+            how="inner",
+        )
+        .select(
+            "row",
+            "col",
+            pl.when(pl.col("n_observed") < pl.col("n_trading"))
+            .then(pl.lit(_CODE_MISSING, pl.Int8))
+            .otherwise(pl.col("code"))
+            .alias("code"),
+        )
+    )
+    codes[observed["row"].to_numpy(), observed["col"].to_numpy()] = observed["code"].to_numpy()
+    return [[_STATUS_BY_CODE[c] for c in row] for row in codes.tolist()]
 
 
 # ============================================================================
@@ -604,59 +631,66 @@ def _aggregate_monthly(
 
 
 def _find_gaps(
+    covered: pl.DataFrame,
     symbols: list[str],
-    all_dates: list[datetime.date],
-    daily_matrix: list[list[CoverageStatus]],
-    trading_days: set[datetime.date],
+    trading_days: list[datetime.date],
 ) -> list[CoverageGap]:
     """Find contiguous runs of missing trading days per symbol.
 
-    Non-trading days between missing trading days do NOT break a gap.
-    """
-    gaps: list[CoverageGap] = []
-
-    for sym_idx, symbol in enumerate(symbols):
-        gap_start: datetime.date | None = None
-        last_missing_trading: datetime.date | None = None
-        gap_count = 0
-
-        for dt_idx, dt in enumerate(all_dates):
-            if dt not in trading_days:
-                continue  # Skip non-trading days
-            status = daily_matrix[sym_idx][dt_idx]
-            if status == CoverageStatus.MISSING:
-                if gap_start is None:
-                    gap_start = dt
-                last_missing_trading = dt
-                gap_count += 1
-            else:
-                if gap_start is not None and gap_count > 0:
-                    gaps.append(
-                        CoverageGap(
-                            symbol=symbol,
-                            start_date=gap_start,
-                            end_date=last_missing_trading or gap_start,
-                            gap_days=gap_count,
-                        )
-                    )
-                gap_start = None
-                last_missing_trading = None
-                gap_count = 0
-
-        # Close any open gap at end
-        if gap_start is not None and gap_count > 0:
-            gaps.append(
-                CoverageGap(
-                    symbol=symbol,
-                    start_date=gap_start,
-                    end_date=last_missing_trading or gap_start,
-                    gap_days=gap_count,
-                )
-            )
+    Runs are measured in trading-day indices, so non-trading days between
+    missing trading days do NOT break a gap. Sentinel rows at index -1 and
+    ``len(trading_days)`` close leading/trailing runs (and cover symbols
+    with no data at all).
+
+    Args:
+        covered: ``symbol`` / ``trading_idx`` rows for observed trading days.
+        symbols: Symbols to report gaps for.
+        trading_days: Sorted trading days the indices refer to.
 
-    # Sort by gap_days descending
-    gaps.sort(key=lambda g: g.gap_days, reverse=True)
-    return gaps
+    Returns:
+        Gaps sorted by ``gap_days`` descending, then symbol and start date.
+    """
+    if not symbols or not trading_days:
+        return []
+    n_days = len(trading_days)
+    sentinels = pl.DataFrame(
+        {
+            "symbol": [s for s in symbols for _ in range(2)],
+            "idx": [-1, n_days] * len(symbols),
+        },
+        schema={"symbol": pl.String, "idx": pl.Int64},
+    )
+    runs = (
+        pl.concat(
+            [
+                covered.select(
+                    pl.col("symbol").cast(pl.String),
+                    pl.col("trading_idx").cast(pl.Int64).alias("idx"),
+                ),
+                sentinels,
+            ]
+        )
+        .unique()
+        .sort("symbol", "idx")
+        .with_columns(pl.col("idx").shift(1).over("symbol").alias("prev_idx"))
+        .with_columns((pl.col("idx") - pl.col("prev_idx") - 1).alias("gap_days"))
+        .filter(pl.col("gap_days") > 0)
+        .sort(
+            ["gap_days", "symbol", "prev_idx"],
+            descending=[True, False, False],
+        )
+    )
+    return [
+        CoverageGap(
+            symbol=symbol,
+            start_date=trading_days[prev_idx + 1],
+            end_date=trading_days[idx - 1],
+            gap_days=gap_days,
+        )
+        for symbol, idx, prev_idx, gap_days in runs.select(
+            "symbol", "idx", "prev_idx", "gap_days"
+        ).iter_rows()
+    ]
 
 
 __all__ = [
@@ -666,5 +700,4 @@ __all__ = [
     "CoverageStatus",
     "CoverageSummary",
     "MAX_DAILY_DAYS",
-    "MAX_SYMBOLS",
 ]
@@ -18,6 +18,8 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import polars as pl
 
+from libs.data.data_quality.checksums import FileHasher
+
 if TYPE_CHECKING:
     from libs.data.data_quality.types import TradingCalendar
 
@@ -98,6 +100,16 @@ class DataValidator:
     ROW_DROP_THRESHOLD = 0.10  # >10% row drop is anomalous
     NULL_SPIKE_THRESHOLD = 0.05  # >5% null increase is anomalous
 
+    def __init__(self, hasher: FileHasher | None = None) -> None:
+        """Initialize validator.
+
+        Args:
+            hasher: File hashing service for checksums. Defaults to an
+                uncached concurrent hasher; pass one with a cache_path to
+                skip re-hashing unchanged files.
+        """
+        self.hasher = hasher or FileHasher()
+
     def validate_row_count(
         self,
         df: pl.DataFrame,
@@ -355,20 +367,31 @@ class DataValidator:
 
         return errors
 
-    def compute_checksum(self, file_path: Path) -> str:
+    def compute_checksum(self, file_path: Path, *, use_cache: bool = True) -> str:
         """Compute SHA-256 checksum of single file.
 
         Args:
             file_path: Path to file.
+            use_cache: If False, bypass the hasher's checksum cache.
 
         Returns:
             Hex-encoded SHA-256 checksum.
         """
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return self.hasher.checksum(file_path, use_cache=use_cache)
+
+    def compute_checksums(
+        self, file_paths: list[Path], *, use_cache: bool = True
+    ) -> dict[Path, str]:
+        """Compute SHA-256 checksums of many files concurrently.
+
+        Args:
+            file_paths: List of file paths.
+            use_cache: If False, bypass the hasher's checksum cache.
+
+        Returns:
+            Mapping of file path to hex-encoded SHA-256 checksum.
+        """
+        return self.hasher.checksums(file_paths, use_cache=use_cache)
 
     def compute_aggregate_checksum(self, file_paths: list[Path]) -> str:
         """Compute aggregate SHA-256 checksum for multiple files.
@@ -388,11 +411,9 @@ class DataValidator:
         # Sort paths for determinism
         sorted_paths = sorted(file_paths, key=lambda p: str(p))
 
-        # Build hash manifest
-        lines = []
-        for path in sorted_paths:
-            file_hash = self.compute_checksum(path)
-            lines.append(f"{path}:{file_hash}")
+        # Build hash manifest (files hashed concurrently)
+        checksums = self.compute_checksums(sorted_paths)
+        lines = [f"{path}:{checksums[Path(path)]}" for path in sorted_paths]
 
         manifest = "\n".join(lines)
         return hashlib.sha256(manifest.encode()).hexdigest()
@@ -12,20 +12,27 @@ Key features:
 - Time-travel queries (query_as_of)
 - Backtest linkage for reproducibility
 - Hardlink/copy/CAS storage with automatic fallback
+- Copy-on-write (reflink) materialization where the filesystem supports it
+- Parallel CAS ingestion with streaming progress callbacks
 - Atomic snapshot creation with staging directory pattern
 """
 
 from __future__ import annotations
 
 import base64
+import errno
 import hashlib
 import json
 import logging
 import os
 import re
 import shutil
+import sqlite3
+import sys
 import tempfile
-from collections.abc import Iterator
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -49,6 +56,61 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): share extents copy-on-write
+_FICLONE = 0x40049409
+
+# errnos meaning "this filesystem/pair of files cannot reflink" (not an I/O error)
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EPERM}
+)
+
+
+def _reflink_file(src: Path, dest: Path) -> bool:
+    """Clone ``src`` to a new file ``dest`` sharing extents copy-on-write.
+
+    A reflink is a new inode: later writes to either file never affect the
+    other, so clones keep snapshot immutability while costing no data I/O
+    or extra disk space (btrfs, XFS with reflink=1, bcachefs, ...).
+
+    Args:
+        src: Source file.
+        dest: Destination path (must not exist).
+
+    Returns:
+        True if cloned, False if the platform or filesystem cannot reflink.
+
+    Raises:
+        OSError: On genuine I/O errors.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(src, "rb") as src_f, open(dest, "xb") as dest_f:
+            fcntl.ioctl(dest_f.fileno(), _FICLONE, src_f.fileno())
+    except OSError as e:
+        if e.errno == errno.EEXIST:
+            raise
+        dest.unlink(missing_ok=True)
+        if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+            return False
+        raise
+    shutil.copystat(str(src), str(dest))
+    return True
+
+
+def _same_file_identity(a: os.stat_result, b: os.stat_result) -> bool:
+    return (a.st_size, a.st_mtime_ns, a.st_ino, a.st_dev) == (
+        b.st_size,
+        b.st_mtime_ns,
+        b.st_ino,
+        b.st_dev,
+    )
+
 
 # =============================================================================
 # Data Models
@@ -111,6 +173,24 @@ class SnapshotManifest(BaseModel):
         return v
 
 
+class SnapshotProgress(BaseModel):
+    """Progress event emitted after each file is stored during create_snapshot."""
+
+    version_tag: str
+    dataset: str
+    file_path: str
+    storage_mode: Literal["hardlink", "copy", "cas"]
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+
+    model_config = {"frozen": True}
+
+
+SnapshotProgressCallback = Callable[[SnapshotProgress], None]
+
+
 class BacktestLinkage(BaseModel):
     """Durable backtest -> snapshot mapping."""
 
@@ -234,6 +314,11 @@ class DatasetVersionManager:
     # Lock timeouts
     SNAPSHOT_LOCK_TIMEOUT_SECONDS = 30.0
 
+    # A clone of a source whose (size, mtime, inode) is unchanged since it was
+    # hashed is trusted without re-reading it, unless the source was modified
+    # within this window (same-size rewrites inside mtime granularity)
+    CLONE_TRUST_MIN_AGE_SECONDS = 2.0
+
     # Version tag patterns
     DATE_TAG_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
     # Safe version tag pattern: alphanumeric, dots, hyphens, underscores
@@ -252,6 +337,8 @@ class DatasetVersionManager:
         backtests_dir: Path | None = None,
         locks_dir: Path | None = None,
         data_root: Path | None = None,
+        use_reflink: bool = True,
+        max_workers: int | None = None,
     ) -> None:
         """Initialize version manager.
 
@@ -264,9 +351,23 @@ class DatasetVersionManager:
             backtests_dir: Directory for backtest linkages.
             locks_dir: Directory for lock files.
             data_root: Root directory for data files (security boundary).
+            use_reflink: Materialize copies/CAS blobs as copy-on-write clones
+                when the filesystem supports it (falls back to byte copies).
+            max_workers: Threads for parallel CAS ingestion
+                (default: min(8, cpu_count)).
+
+        Raises:
+            ValueError: If max_workers is not positive.
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be positive")
         self.manifest_manager = manifest_manager
+        # Pass a DataValidator backed by the shared FileHasher cache to reuse
+        # the per-file checksums already computed by the sync managers.
         self.validator = validator or DataValidator()
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        # None = untested; set False after the first unsupported attempt
+        self._reflink_enabled: bool | None = None if use_reflink else False
 
         self.snapshots_dir = snapshots_dir or self.SNAPSHOTS_DIR
         self.cas_dir = cas_dir or self.CAS_DIR
@@ -349,16 +450,23 @@ class DatasetVersionManager:
         version_tag: str,
         datasets: list[str] | None = None,
         use_cas: bool = True,
+        progress_callback: SnapshotProgressCallback | None = None,
     ) -> SnapshotManifest:
         """Create immutable snapshot of current dataset states.
 
         Uses optimistic concurrency control: pins manifest versions at start,
         verifies they haven't changed at end.
 
+        Files are materialized as copy-on-write clones where supported. New
+        CAS blobs for a dataset are ingested in parallel before the (ordered)
+        index updates.
+
         Args:
             version_tag: Unique identifier for this snapshot.
             datasets: List of datasets to include (None = all available).
             use_cas: Whether to use content-addressable storage.
+            progress_callback: Called with a SnapshotProgress after each file
+                is stored (runs on the calling thread).
 
         Returns:
             SnapshotManifest for the created snapshot.
@@ -428,22 +536,47 @@ class DatasetVersionManager:
                 total_size = 0
                 all_files: list[FileStorageInfo] = []
 
-                # Process each dataset
+                # Validate every file up front so progress totals are known
+                dataset_paths: dict[str, list[Path]] = {}
+                source_stats: dict[Path, os.stat_result] = {}
                 for ds in datasets:
-                    sync_manifest = sync_manifests[ds]
-                    ds_files: list[FileStorageInfo] = []
-
-                    for file_path_str in sync_manifest.file_paths:
-                        file_path = Path(file_path_str)
+                    file_paths = [Path(p) for p in sync_manifests[ds].file_paths]
+                    for file_path in file_paths:
                         if not file_path.exists():
                             raise DataNotFoundError(f"File not found: {file_path}")
 
                         # Security: validate file path is within data root and not a symlink
                         self._validate_file_path(file_path)
+                        # Identity before hashing: lets unchanged clones skip re-hashing
+                        source_stats[file_path] = file_path.stat()
+                    dataset_paths[ds] = file_paths
 
-                        # Compute checksum
-                        checksum = self.validator.compute_checksum(file_path)
-                        file_size = file_path.stat().st_size
+                files_total = sum(len(paths) for paths in dataset_paths.values())
+                bytes_total = sum(
+                    source_stats[p].st_size for paths in dataset_paths.values() for p in paths
+                )
+                files_done = 0
+
+                # Process each dataset
+                for ds in datasets:
+                    sync_manifest = sync_manifests[ds]
+                    ds_files: list[FileStorageInfo] = []
+                    file_paths = dataset_paths[ds]
+
+                    # Hash the dataset's files concurrently
+                    checksums = self.validator.compute_checksums(file_paths)
+
+                    # Ingest new CAS blobs in parallel; index updates stay ordered
+                    prefetched_cas: set[str] = set()
+                    if cas_index is not None:
+                        prefetched_cas = self._prefetch_cas_blobs(
+                            file_paths, checksums, source_stats, cas_index
+                        )
+                        cas_new_files.extend(prefetched_cas)
+
+                    for file_path in file_paths:
+                        checksum = checksums[file_path]
+                        file_size = source_stats[file_path].st_size
                         total_size += file_size
 
                         # Determine storage mode and create file entry
@@ -457,9 +590,25 @@ class DatasetVersionManager:
                             cas_hashes_added=cas_hashes_added,
                             existing_cas_hashes=existing_cas_hashes,
                             cas_new_files=cas_new_files,
+                            source_stat=source_stats[file_path],
+                            prefetched_cas=prefetched_cas,
                         )
 
                         ds_files.append(storage_info)
+                        files_done += 1
+                        if progress_callback is not None:
+                            progress_callback(
+                                SnapshotProgress(
+                                    version_tag=version_tag,
+                                    dataset=ds,
+                                    file_path=str(file_path),
+                                    storage_mode=storage_info.storage_mode,
+                                    files_done=files_done,
+                                    files_total=files_total,
+                                    bytes_done=total_size,
+                                    bytes_total=bytes_total,
+                                )
+                            )
 
                     # Create dataset snapshot
                     ds_snapshot = DatasetSnapshot(
@@ -596,6 +745,8 @@ class DatasetVersionManager:
         cas_hashes_added: list[str],
         existing_cas_hashes: set[str],
         cas_new_files: list[str],
+        source_stat: os.stat_result | None = None,
+        prefetched_cas: set[str] | None = None,
     ) -> FileStorageInfo:
         """Store a file using appropriate storage mode with batched CAS.
 
@@ -615,6 +766,8 @@ class DatasetVersionManager:
             cas_hashes_added: List to track CAS hashes added (for cleanup).
             existing_cas_hashes: Set of CAS hashes that existed before this snapshot.
             cas_new_files: List to track NEW CAS files created (not in existing).
+            source_stat: Stat of the source taken before hashing (clone trust).
+            prefetched_cas: CAS blobs already written by _prefetch_cas_blobs.
         """
         # Generate unique filename within snapshot
         file_hash_prefix = checksum[:8]
@@ -635,18 +788,20 @@ class DatasetVersionManager:
                     cas_hashes_added,
                     existing_cas_hashes,
                     cas_new_files,
+                    source_stat=source_stat,
+                    prefetched_cas=prefetched_cas,
                 )
                 storage_mode = "cas"
                 target = cas_hash
             except OSError as e:
                 # CAS failed (disk full, permissions, etc) - fall back to copy
                 logger.warning("CAS storage failed, falling back to copy: %s", e)
-                self._copy_with_fsync(file_path, dest_path, checksum)
+                self._copy_with_fsync(file_path, dest_path, checksum, source_stat)
                 storage_mode = "copy"
                 target = str(dest_path)
         else:
-            # Copy creates an independent file (immutable snapshot)
-            self._copy_with_fsync(file_path, dest_path, checksum)
+            # Copy (or CoW clone) creates an independent file (immutable snapshot)
+            self._copy_with_fsync(file_path, dest_path, checksum, source_stat)
             storage_mode = "copy"
             target = str(dest_path)
             logger.debug("Copied file: %s -> %s", file_path, dest_path)
@@ -660,6 +815,58 @@ class DatasetVersionManager:
             checksum=checksum,
         )
 
+    def _prefetch_cas_blobs(
+        self,
+        file_paths: list[Path],
+        checksums: dict[Path, str],
+        source_stats: dict[Path, os.stat_result],
+        cas_index: CASIndex,
+    ) -> set[str]:
+        """Write CAS blobs missing from the index concurrently.
+
+        Only the physical blobs are written here; reference counting is left
+        to _store_in_cas_batched so index updates keep their order. Failed
+        blobs are left out of the result and retried (and, if still failing,
+        handled) by the sequential path.
+
+        Args:
+            file_paths: Dataset files in snapshot order.
+            checksums: Checksum per file.
+            source_stats: Stat per file taken before hashing.
+            cas_index: Current in-memory CAS index (read only).
+
+        Returns:
+            Checksums whose blobs were written.
+        """
+        pending: dict[str, Path] = {}
+        for file_path in file_paths:
+            checksum = checksums[file_path]
+            if checksum not in cas_index.files and checksum not in pending:
+                pending[checksum] = file_path
+        if len(pending) <= 1 or self.max_workers == 1:
+            return set()
+
+        def ingest(item: tuple[str, Path]) -> str | None:
+            checksum, file_path = item
+            try:
+                self._safe_copy_to_cas(
+                    file_path,
+                    self._get_cas_path(checksum, file_path),
+                    checksum,
+                    source_stats.get(file_path),
+                )
+            except (OSError, ValueError):
+                # Logged by _safe_copy_to_cas; the sequential path retries
+                return None
+            return checksum
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="snapshot-cas",
+        ) as executor:
+            results = list(executor.map(ingest, pending.items()))
+        return {checksum for checksum in results if checksum is not None}
+
     def _store_file(
         self,
         file_path: Path,
@@ -1276,22 +1483,37 @@ class DatasetVersionManager:
         for ds in snapshot.datasets.values():
             all_files.extend(ds.files)
 
+        # Get actual file paths based on storage mode
+        file_paths: list[Path] = []
         for file_info in all_files:
-            try:
-                # Get actual file path based on storage mode
-                if file_info.storage_mode == "cas":
-                    # Derive extension from original path
-                    original = Path(file_info.original_path)
-                    file_path = self._get_cas_path(file_info.target, original)
-                else:
-                    file_path = snapshot_files_dir / file_info.path
+            if file_info.storage_mode == "cas":
+                # Derive extension from original path
+                original = Path(file_info.original_path)
+                file_paths.append(self._get_cas_path(file_info.target, original))
+            else:
+                file_paths.append(snapshot_files_dir / file_info.path)
+
+        # Hash all files concurrently up front, bypassing the checksum cache:
+        # a cached digest keyed on size/mtime/inode would hide in-place
+        # tampering that preserves them. Read failures are re-raised and
+        # reported per file by the sequential checks below.
+        try:
+            checksums = self.validator.compute_checksums(
+                [p for p in file_paths if p.exists()], use_cache=False
+            )
+        except (OSError, sqlite3.Error):
+            checksums = {}
 
+        for file_info, file_path in zip(all_files, file_paths, strict=True):
+            try:
                 if not file_path.exists():
                     errors.append(f"Missing file: {file_info.path}")
                     continue
 
                 # Verify checksum
-                actual_checksum = self.validator.compute_checksum(file_path)
+                actual_checksum = checksums.get(file_path) or self.validator.compute_checksum(
+                    file_path, use_cache=False
+                )
                 if actual_checksum != file_info.checksum:
                     errors.append(
                         f"Checksum mismatch for {file_info.path}: "
@@ -1382,12 +1604,15 @@ class DatasetVersionManager:
         cas_hashes_added: list[str],
         existing_cas_hashes: set[str],
         cas_new_files: list[str],
+        source_stat: os.stat_result | None = None,
+        prefetched_cas: set[str] | None = None,
     ) -> str:
         """Store file in CAS with batched index updates.
 
         Mutates cas_index in place (caller must save at end).
         Tracks added hashes in cas_hashes_added for cleanup on failure.
         Tracks new files (not in existing) in cas_new_files.
+        Blobs listed in ``prefetched_cas`` were already written and verified.
 
         Returns:
             The CAS hash (same as checksum).
@@ -1401,8 +1626,9 @@ class DatasetVersionManager:
             entry.ref_count += 1
             entry.referencing_snapshots.append(version_tag)
         else:
-            # Copy file to CAS safely (temp+rename+checksum verify)
-            self._safe_copy_to_cas(file_path, cas_path, checksum)
+            if prefetched_cas is None or checksum not in prefetched_cas:
+                # Copy file to CAS safely (temp+rename+checksum verify)
+                self._safe_copy_to_cas(file_path, cas_path, checksum, source_stat)
 
             # Create entry
             entry = CASEntry(
@@ -1601,31 +1827,75 @@ class DatasetVersionManager:
         finally:
             os.close(fd)
 
+    def _clone_or_copy(self, src: Path, dest: Path) -> bool:
+        """Materialize ``dest`` as a reflink of ``src``, else a byte copy.
+
+        Both preserve metadata like shutil.copy2 and produce a new inode, so
+        the result is independent of later changes to ``src``.
+
+        Returns:
+            True if ``dest`` is a copy-on-write clone.
+        """
+        if self._reflink_enabled is not False:
+            if _reflink_file(src, dest):
+                self._reflink_enabled = True
+                return True
+            if self._reflink_enabled is None:
+                # First attempt failed: filesystem has no reflink support
+                self._reflink_enabled = False
+                logger.info(
+                    "Reflink not supported, using byte copies for snapshots",
+                    extra={"event": "versioning.reflink_unsupported", "path": str(dest.parent)},
+                )
+        shutil.copy2(str(src), str(dest))
+        return False
+
+    def _clone_is_trusted(self, src: Path, source_stat: os.stat_result | None) -> bool:
+        """True if a fresh clone of ``src`` provably has the hashed content.
+
+        Holds when the source's identity is unchanged since ``source_stat``
+        was taken (before hashing) and it was not modified too recently for
+        mtime to be a reliable change signal.
+        """
+        if source_stat is None:
+            return False
+        current = os.stat(src)
+        age_seconds = time.time() - current.st_mtime_ns / 1e9
+        return (
+            _same_file_identity(source_stat, current)
+            and age_seconds > self.CLONE_TRUST_MIN_AGE_SECONDS
+        )
+
     def _copy_with_fsync(
         self,
         src: Path,
         dest: Path,
         expected_checksum: str | None = None,
+        source_stat: os.stat_result | None = None,
     ) -> None:
         """Copy a file with fsync for durability and optional checksum verification.
 
-        Uses shutil.copy2 to preserve metadata, then fsyncs the
-        destination file and its parent directory.
+        Clones copy-on-write when supported (otherwise shutil.copy2), then
+        fsyncs the destination file and its parent directory.
 
         Args:
             src: Source file path.
             dest: Destination file path.
             expected_checksum: If provided, verify copied file matches this checksum.
+            source_stat: Stat of ``src`` taken before ``expected_checksum`` was
+                computed; lets an unchanged clone skip re-hashing.
 
         Raises:
             ValueError: If checksum verification fails.
         """
-        shutil.copy2(str(src), str(dest))
+        cloned = self._clone_or_copy(src, dest)
         self._fsync_file(dest)
         self._fsync_directory(dest.parent)
 
         # Verify checksum if provided (critical for immutability)
-        if expected_checksum is not None:
+        if expected_checksum is not None and not (
+            cloned and self._clone_is_trusted(src, source_stat)
+        ):
             actual_checksum = self.validator.compute_checksum(dest)
             if actual_checksum != expected_checksum:
                 # Clean up the bad copy
@@ -1640,12 +1910,13 @@ class DatasetVersionManager:
         src: Path,
         dest: Path,
         expected_checksum: str,
+        source_stat: os.stat_result | None = None,
     ) -> None:
         """Safely copy a file to CAS with temp+rename+checksum verification.
 
-        1. Copy to a temp file in the CAS directory
+        1. Clone (or copy) to a temp file in the CAS directory
         2. Fsync the temp file
-        3. Verify checksum matches expected
+        3. Verify checksum matches expected (skipped for trusted clones)
         4. Rename to final destination (atomic on POSIX)
         5. Fsync directory
 
@@ -1653,6 +1924,8 @@ class DatasetVersionManager:
             src: Source file path.
             dest: Destination path in CAS.
             expected_checksum: Expected SHA-256 checksum to verify.
+            source_stat: Stat of ``src`` taken before ``expected_checksum`` was
+                computed; lets an unchanged clone skip re-hashing.
 
         Raises:
             ValueError: If checksum doesn't match after copy.
@@ -1662,17 +1935,19 @@ class DatasetVersionManager:
         temp_path = dest.parent / f".tmp_{dest.name}_{os.getpid()}"
 
         try:
-            # Copy to temp
-            shutil.copy2(str(src), str(temp_path))
+            # Clone/copy to temp (clear any leftover from a crashed run first)
+            temp_path.unlink(missing_ok=True)
+            cloned = self._clone_or_copy(src, temp_path)
             self._fsync_file(temp_path)
 
             # Verify checksum
-            actual_checksum = self.validator.compute_checksum(temp_path)
-            if actual_checksum != expected_checksum:
-                raise ValueError(
-                    f"CAS checksum mismatch: expected {expected_checksum}, "
-                    f"got {actual_checksum}"
-                )
+            if not (cloned and self._clone_is_trusted(src, source_stat)):
+                actual_checksum = self.validator.compute_checksum(temp_path)
+                if actual_checksum != expected_checksum:
+                    raise ValueError(
+                        f"CAS checksum mismatch: expected {expected_checksum}, "
+                        f"got {actual_checksum}"
+                    )
 
             # Atomic rename
             temp_path.rename(dest)
@@ -8,6 +8,7 @@ Key Components:
     - FactorBuilder: Main computation engine
     - FactorDefinition: Protocol for custom factors
     - FactorAnalytics: IC analysis, decay curves, correlations
+    - ExposurePanelStore: Precomputed, month-partitioned exposure panel
     - Canonical Factors: momentum, value, quality, size, low-vol
 
 Example:
@@ -22,6 +23,11 @@ Example:
 """
 
 from libs.models.factors.cache import CacheCorruptionError, CacheError, DiskExpressionCache
+from libs.models.factors.exposure_store import (
+    ExposurePanelStore,
+    ExposureStoreError,
+    factor_definition_hash,
+)
 from libs.models.factors.factor_analytics import FactorAnalytics, ICAnalysis
 from libs.models.factors.factor_builder import FactorBuilder
 from libs.models.factors.factor_definitions import (
@@ -56,4 +62,8 @@ __all__ = [
     "DiskExpressionCache",
     "CacheError",
     "CacheCorruptionError",
+    # Exposure panel
+    "ExposurePanelStore",
+    "ExposureStoreError",
+    "factor_definition_hash",
 ]
@@ -0,0 +1,475 @@
+"""
+ExposurePanelStore: persistent, month-partitioned factor exposure panel.
+
+This module provides:
+- ExposurePanelStore: Parquet panel of precomputed factor exposures
+- Panel keys derived from dataset versions, config and factor definitions (PIT safety)
+- Incremental appends (only dates not yet in the panel are written)
+- Lazy range scans via ``pl.scan_parquet`` over the month partitions
+
+Layout:
+    {root_dir}/{panel_key}/_panel.json        # versions, config hash, dates
+    {root_dir}/{panel_key}/{YYYY-MM}.parquet  # exposures for that month
+
+Where panel_key is derived deterministically from the dataset version ids,
+the factor config hash, the registered factor names and a hash of their
+definitions (see factor_definition_hash):
+    {'crsp': 'v1.2.3', 'compustat': 'v1.0.1'} + config_hash -> 'panel_<sha256[:24]>'
+
+PIT Safety:
+- A new CRSP/Compustat manifest version or snapshot produces a new panel key,
+  so readers never mix exposures computed from different data versions.
+- Changing a factor's code or parameters also produces a new panel key.
+- Dates already present in a panel are immutable; appends only add dates.
+
+Unlike DiskExpressionCache (one file per factor/date), a panel holds every
+factor for every date of a month in one file, so backtests, covariance
+estimation, stress tests and web console views can read a whole date range
+in one scan instead of recomputing or opening thousands of files.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# Columns every exposure row must carry
+EXPOSURE_KEY_COLUMNS = ["date", "factor_name", "permno"]
+
+
+class ExposureStoreError(Exception):
+    """Raised when the exposure panel store is misused or inconsistent."""
+
+    pass
+
+
+def factor_definition_hash(definitions: Mapping[str, object]) -> str:
+    """Hash factor implementations so code or parameter changes get a new panel.
+
+    Args:
+        definitions: Registered factor definitions keyed by factor name.
+
+    Returns:
+        16-character hex digest over each definition's class, source and
+        instance attributes.
+    """
+    parts = []
+    for name in sorted(definitions):
+        definition = definitions[name]
+        cls = type(definition)
+        try:
+            source = inspect.getsource(cls)
+        except (OSError, TypeError):
+            source = ""
+        params = sorted((k, repr(v)) for k, v in getattr(definition, "__dict__", {}).items())
+        parts.append(f"{name}:{cls.__module__}.{cls.__qualname__}:{params}:{source}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+class ExposurePanelStore:
+    """Month-partitioned Parquet store of factor exposures.
+
+    Features:
+    - One Parquet file per calendar month per panel key
+    - Incremental appends that skip dates already stored
+    - Atomic writes (temp file + rename) for partitions and metadata
+    - Lazy, predicate-pushed range scans for readers
+    - Per-panel file lock (fcntl) so concurrent writers in any process
+      serialize their read-modify-write of a panel
+
+    Example:
+        store = ExposurePanelStore(Path("data/factors/exposure_panel"))
+        key = store.build_panel_key({"crsp": "v3", "compustat": "v2"}, "cfg123")
+
+        store.append(key, exposures_df, version_ids={...}, config_hash="cfg123")
+        panel = store.scan(key, date(2023, 1, 1), date(2023, 12, 31)).collect()
+    """
+
+    FILE_EXTENSION = ".parquet"
+    METADATA_FILENAME = "_panel.json"
+
+    def __init__(self, root_dir: Path) -> None:
+        """Initialize store.
+
+        Args:
+            root_dir: Root directory holding one subdirectory per panel key.
+        """
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    # =========================================================================
+    # Key Building
+    # =========================================================================
+
+    @staticmethod
+    def build_panel_key(
+        version_ids: dict[str, str],
+        config_hash: str,
+        factor_names: Iterable[str] = (),
+        definition_hash: str = "",
+    ) -> str:
+        """Build deterministic panel key from versions, config and factor set.
+
+        Args:
+            version_ids: Dataset version IDs (e.g. {'crsp': 'v1.2.3'}), including
+                a 'snapshot' entry when computed against a snapshot.
+            config_hash: Hash of the FactorConfig used for computation.
+            factor_names: Registered factor names stored in the panel.
+            definition_hash: Hash of the factor implementations
+                (see factor_definition_hash).
+
+        Returns:
+            Filesystem-safe key: 'panel_<sha256[:24]>'.
+        """
+        version_str = "|".join(f"{k}:{v}" for k, v in sorted(version_ids.items()))
+        factors_str = ",".join(sorted(factor_names))
+        digest = hashlib.sha256(
+            f"{version_str}#{config_hash}#{factors_str}#{definition_hash}".encode()
+        ).hexdigest()
+        return f"panel_{digest[:24]}"
+
+    def _panel_dir(self, panel_key: str) -> Path:
+        """Get directory for a panel key."""
+        return self.root_dir / panel_key
+
+    def _metadata_path(self, panel_key: str) -> Path:
+        """Get metadata file path for a panel key."""
+        return self._panel_dir(panel_key) / self.METADATA_FILENAME
+
+    def _partition_path(self, panel_key: str, year: int, month: int) -> Path:
+        """Get month partition path for a panel key."""
+        return self._panel_dir(panel_key) / f"{year:04d}-{month:02d}{self.FILE_EXTENSION}"
+
+    @contextmanager
+    def _panel_lock(self, panel_key: str) -> Iterator[None]:
+        """Hold the exclusive lock for a panel's read-modify-write.
+
+        Uses file locking (fcntl) for cross-process synchronization. The lock
+        file sits beside the panel directory so drop_panel can remove the
+        directory while holding it.
+        """
+        lock_file = open(self.root_dir / f".{panel_key}.lock", "w")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+
+    # =========================================================================
+    # Metadata
+    # =========================================================================
+
+    def load_metadata(self, panel_key: str) -> dict[str, Any] | None:
+        """Load panel metadata.
+
+        Args:
+            panel_key: Panel key.
+
+        Returns:
+            Metadata dict (version_ids, config_hash, dates) or None if the panel
+            does not exist.
+        """
+        path = self._metadata_path(panel_key)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                metadata: dict[str, Any] = json.load(f)
+            return metadata
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(
+                "Exposure panel metadata unreadable",
+                extra={"panel_key": panel_key, "path": str(path), "error": str(e)},
+                exc_info=True,
+            )
+            raise ExposureStoreError(f"Unreadable panel metadata: {path}") from e
+
+    def list_dates(self, panel_key: str) -> list[date]:
+        """List dates stored in a panel (sorted ascending).
+
+        Args:
+            panel_key: Panel key.
+
+        Returns:
+            Sorted list of stored dates (empty if panel does not exist).
+        """
+        metadata = self.load_metadata(panel_key)
+        if metadata is None:
+            return []
+        return sorted(date.fromisoformat(d) for d in metadata.get("dates", []))
+
+    def has_date(self, panel_key: str, as_of_date: date) -> bool:
+        """Check whether a date is stored in a panel."""
+        metadata = self.load_metadata(panel_key)
+        if metadata is None:
+            return False
+        return as_of_date.isoformat() in set(metadata.get("dates", []))
+
+    def missing_dates(self, panel_key: str, dates: Iterable[date]) -> list[date]:
+        """Return requested dates that are not yet stored (sorted ascending).
+
+        Args:
+            panel_key: Panel key.
+            dates: Candidate dates.
+
+        Returns:
+            Dates that still need to be computed.
+        """
+        stored = set(self.list_dates(panel_key))
+        return sorted({d for d in dates if d not in stored})
+
+    # =========================================================================
+    # Write Path
+    # =========================================================================
+
+    def append(
+        self,
+        panel_key: str,
+        exposures: pl.DataFrame,
+        version_ids: dict[str, str],
+        config_hash: str,
+    ) -> list[date]:
+        """Append exposures for dates not yet stored in the panel.
+
+        Only month partitions touched by new dates are rewritten. Dates that
+        already exist are skipped (stored exposures are immutable per key).
+
+        Args:
+            panel_key: Panel key (see build_panel_key).
+            exposures: Long exposures with at least date, factor_name, permno.
+            version_ids: Dataset version IDs recorded in the panel metadata.
+            config_hash: Config hash recorded in the panel metadata.
+
+        Returns:
+            Sorted list of newly appended dates.
+
+        Raises:
+            ExposureStoreError: If required columns are missing or the panel
+                already exists with different versions/config.
+        """
+        missing_cols = [c for c in EXPOSURE_KEY_COLUMNS if c not in exposures.columns]
+        if missing_cols:
+            raise ExposureStoreError(f"Exposures missing required columns: {missing_cols}")
+
+        with self._panel_lock(panel_key):
+            metadata = self.load_metadata(panel_key)
+            if metadata is not None and (
+                metadata.get("version_ids") != version_ids
+                or metadata.get("config_hash") != config_hash
+            ):
+                raise ExposureStoreError(
+                    f"Panel {panel_key} was built with different versions/config"
+                )
+
+            stored = set(metadata.get("dates", [])) if metadata else set()
+            stored_dates = sorted(date.fromisoformat(d) for d in stored)
+            new_rows = exposures.with_columns(pl.col("date").cast(pl.Date)).filter(
+                ~pl.col("date").is_in(stored_dates)
+            )
+            if new_rows.height == 0:
+                return []
+
+            new_dates = sorted(new_rows["date"].unique().to_list())
+            by_month = new_rows.with_columns(
+                pl.col("date").dt.year().alias("_year"),
+                pl.col("date").dt.month().alias("_month"),
+            ).partition_by(["_year", "_month"], as_dict=True, include_key=False)
+
+            for (year, month), month_rows in by_month.items():
+                path = self._partition_path(panel_key, int(year), int(month))
+                if path.exists():
+                    month_rows = pl.concat(
+                        [pl.read_parquet(path), month_rows], how="diagonal_relaxed"
+                    )
+                self._atomic_write_parquet(path, month_rows.sort(EXPOSURE_KEY_COLUMNS))
+
+            # Metadata is written last so readers never see dates whose
+            # partition has not been written yet
+            all_dates = sorted(stored | {d.isoformat() for d in new_dates})
+            self._atomic_write_json(
+                self._metadata_path(panel_key),
+                {
+                    "panel_key": panel_key,
+                    "version_ids": version_ids,
+                    "config_hash": config_hash,
+                    "dates": all_dates,
+                },
+            )
+
+        logger.info(
+            "Appended exposures to panel",
+            extra={
+                "panel_key": panel_key,
+                "n_dates": len(new_dates),
+                "rows": new_rows.height,
+                "first_date": str(new_dates[0]),
+                "last_date": str(new_dates[-1]),
+            },
+        )
+        return new_dates
+
+    # =========================================================================
+    # Read Path
+    # =========================================================================
+
+    def scan(
+        self,
+        panel_key: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        factor_names: list[str] | None = None,
+    ) -> pl.LazyFrame:
+        """Lazily scan exposures for a date range.
+
+        Only month partitions overlapping the range are opened; date and
+        factor filters are pushed down into the Parquet scan.
+
+        Args:
+            panel_key: Panel key.
+            start_date: Inclusive start (None = from first stored month).
+            end_date: Inclusive end (None = through last stored month).
+            factor_names: Optional factor subset.
+
+        Returns:
+            LazyFrame of exposures (empty if nothing matches).
+        """
+        paths = self._partition_paths_for_range(panel_key, start_date, end_date)
+        if not paths:
+            return pl.LazyFrame(
+                schema={"date": pl.Date, "factor_name": pl.Utf8, "permno": pl.Int64}
+            )
+
+        lf = pl.scan_parquet([str(p) for p in paths])
+        if start_date is not None:
+            lf = lf.filter(pl.col("date") >= start_date)
+        if end_date is not None:
+            lf = lf.filter(pl.col("date") <= end_date)
+        if factor_names is not None:
+            lf = lf.filter(pl.col("factor_name").is_in(factor_names))
+        return lf
+
+    def read_date(self, panel_key: str, as_of_date: date) -> pl.DataFrame | None:
+        """Read all exposures for a single date.
+
+        Args:
+            panel_key: Panel key.
+            as_of_date: Date to read.
+
+        Returns:
+            Exposures DataFrame, or None if the date is not stored.
+        """
+        if not self.has_date(panel_key, as_of_date):
+            return None
+        return self.scan(panel_key, as_of_date, as_of_date).collect()
+
+    def _partition_paths_for_range(
+        self, panel_key: str, start_date: date | None, end_date: date | None
+    ) -> list[Path]:
+        """Resolve existing month partitions overlapping a date range."""
+        panel_dir = self._panel_dir(panel_key)
+        if not panel_dir.exists():
+            return []
+
+        start_month = (start_date.year, start_date.month) if start_date else None
+        end_month = (end_date.year, end_date.month) if end_date else None
+
+        paths = []
+        for path in sorted(panel_dir.glob(f"*{self.FILE_EXTENSION}")):
+            if path.name.startswith(".tmp_"):
+                continue
+            try:
+                year_str, month_str = path.stem.split("-")
+                month_key = (int(year_str), int(month_str))
+            except ValueError:
+                logger.warning("Skipping unexpected file in exposure panel: %s", path)
+                continue
+            if start_month is not None and month_key < start_month:
+                continue
+            if end_month is not None and month_key > end_month:
+                continue
+            paths.append(path)
+        return paths
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def list_panels(self) -> list[str]:
+        """List panel keys present in the store."""
+        return sorted(
+            p.name for p in self.root_dir.iterdir() if (p / self.METADATA_FILENAME).exists()
+        )
+
+    def drop_panel(self, panel_key: str) -> bool:
+        """Delete a panel (e.g. superseded data version).
+
+        Args:
+            panel_key: Panel key.
+
+        Returns:
+            True if the panel existed and was removed.
+        """
+        panel_dir = self._panel_dir(panel_key)
+        with self._panel_lock(panel_key):
+            if not panel_dir.exists():
+                return False
+            shutil.rmtree(panel_dir)
+        logger.info("Dropped exposure panel", extra={"panel_key": panel_key})
+        return True
+
+    # =========================================================================
+    # Atomic Writes
+    # =========================================================================
+
+    def _atomic_write_parquet(self, path: Path, df: pl.DataFrame) -> None:
+        """Atomically write DataFrame to parquet (temp file + rename)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=".tmp_", suffix=self.FILE_EXTENSION
+        )
+        try:
+            os.close(fd)
+            df.write_parquet(temp_path, statistics=True)
+            os.replace(temp_path, path)
+        except (OSError, pl.exceptions.ComputeError, ValueError) as e:
+            logger.error(
+                "Exposure panel partition write failed",
+                extra={"path": str(path), "temp_path": temp_path, "error": str(e)},
+                exc_info=True,
+            )
+            try:
+                Path(temp_path).unlink(missing_ok=True)
+            except OSError as cleanup_err:
+                logger.debug("Failed to cleanup temp file: %s", cleanup_err)
+            raise
+
+    def _atomic_write_json(self, path: Path, payload: dict[str, Any]) -> None:
+        """Atomically write JSON metadata (temp file + rename)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f, indent=2, sort_keys=True)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                Path(temp_path).unlink(missing_ok=True)
+            except OSError as cleanup_err:
+                logger.debug("Failed to cleanup temp file: %s", cleanup_err)
+            raise
@@ -17,6 +17,13 @@ from typing import Any
 import numpy as np
 import polars as pl
 
+from libs.analytics.signal_analytics import (
+    FORWARD_RETURN_COL,
+    HORIZON_COL,
+    compute_forward_returns,
+    compute_signal_metrics,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,42 +70,49 @@ class FactorAnalytics:
         results: dict[str, dict[int, ICAnalysis]] = {}
 
         factor_names = factor_exposures["factor_name"].unique().to_list()
-
         for factor_name in factor_names:
             results[factor_name] = {}
 
-            # Filter to this factor
-            factor_df = factor_exposures.filter(pl.col("factor_name") == factor_name)
-
-            for horizon in horizons:
-                ret_col = f"ret_{horizon}d"
-                if ret_col not in forward_returns.columns:
-                    logger.warning(f"Return column {ret_col} not found, skipping horizon {horizon}")
-                    continue
-
-                # Join exposures with forward returns
-                merged = factor_df.join(
-                    forward_returns.select(["date", "permno", ret_col]),
-                    on=["date", "permno"],
-                    how="inner",
-                )
-
-                ic_by_date = (
-                    merged.drop_nulls(["zscore", ret_col])
-                    .group_by("date")
-                    .agg(
-                        pl.len().alias("n"),
-                        pl.corr("zscore", ret_col, method="spearman").alias("ic"),
-                    )
-                    .filter(pl.col("n") >= 10)
-                    .drop_nulls("ic")
+        available_horizons = []
+        for horizon in horizons:
+            ret_col = f"ret_{horizon}d"
+            if ret_col not in forward_returns.columns:
+                logger.warning(f"Return column {ret_col} not found, skipping horizon {horizon}")
+                continue
+            available_horizons.append(horizon)
+
+        if not available_horizons or not factor_names:
+            return results
+
+        # Stack horizons into one long frame so every (factor, horizon, date)
+        # IC comes out of a single grouped aggregation.
+        long_returns = pl.concat(
+            [
+                forward_returns.select(
+                    pl.col("date"),
+                    pl.col("permno"),
+                    pl.lit(horizon, dtype=pl.Int64).alias(HORIZON_COL),
+                    pl.col(f"ret_{horizon}d").cast(pl.Float64).alias(FORWARD_RETURN_COL),
                 )
+                for horizon in available_horizons
+            ]
+        )
+        daily = compute_signal_metrics(
+            factor_exposures,
+            long_returns,
+            by=["factor_name"],
+            signal_col="zscore",
+        ).filter((pl.col("n_obs") >= 10) & pl.col("rank_ic").is_not_null())
+        ic_by_group = daily.partition_by(["factor_name", HORIZON_COL], as_dict=True)
 
-                if ic_by_date.height == 0:
+        for factor_name in factor_names:
+            for horizon in available_horizons:
+                ic_by_date = ic_by_group.get((factor_name, horizon))
+                if ic_by_date is None or ic_by_date.height == 0:
                     logger.warning(f"No valid IC data for {factor_name} at horizon {horizon}")
                     continue
 
-                ic_values = ic_by_date["ic"].to_numpy()
+                ic_values = ic_by_date["rank_ic"].to_numpy()
                 ic_mean = float(np.nanmean(ic_values))
                 ic_std = float(np.nanstd(ic_values, ddof=1))
                 n_periods = len(ic_values)
@@ -141,51 +155,31 @@ class FactorAnalytics:
         Returns:
             DataFrame with columns: factor_name, horizon, ic_mean, ic_std
         """
-        results = []
+        horizons = list(range(1, max_horizon + 1, 5))  # Sample every 5 days
 
-        factor_names = factor_exposures["factor_name"].unique().to_list()
-
-        # Compute forward returns at each horizon
-        for horizon in range(1, max_horizon + 1, 5):  # Sample every 5 days
-            # Create forward return column
-            forward_returns = self._compute_forward_returns(returns, horizon)
-
-            for factor_name in factor_names:
-                factor_df = factor_exposures.filter(pl.col("factor_name") == factor_name)
-
-                merged = factor_df.join(
-                    forward_returns.select(["date", "permno", "forward_ret"]),
-                    on=["date", "permno"],
-                    how="inner",
-                )
-
-                if merged.height == 0:
-                    continue
+        # Forward returns for every sampled horizon in one windowed pass
+        forward_returns = compute_forward_returns(returns, horizons)
 
-                # Compute IC for each date using numpy
-                ic_values_list = []
-                for dt in merged["date"].unique().to_list():
-                    date_df = merged.filter(pl.col("date") == dt)
-                    if date_df.height < 10:
-                        continue
-                    ic = self._compute_rank_corr(
-                        date_df["zscore"].to_numpy(),
-                        date_df["forward_ret"].to_numpy(),
-                    )
-                    if not np.isnan(ic):
-                        ic_values_list.append(ic)
-
-                if len(ic_values_list) > 0:
-                    results.append(
-                        {
-                            "factor_name": factor_name,
-                            "horizon": horizon,
-                            "ic_mean": float(np.nanmean(ic_values_list)),
-                            "ic_std": float(np.nanstd(ic_values_list)),
-                        }
-                    )
+        daily = compute_signal_metrics(
+            factor_exposures,
+            forward_returns,
+            by=["factor_name"],
+            signal_col="zscore",
+            drop_non_finite=True,
+        )
 
-        return pl.DataFrame(results)
+        # Dates need >= 10 stocks; undefined ICs (constant inputs) count as 0.0,
+        # matching _compute_rank_corr.
+        return (
+            daily.filter(pl.col("n_obs") >= 10)
+            .with_columns(pl.col("rank_ic").fill_nan(0.0).fill_null(0.0))
+            .group_by(["factor_name", HORIZON_COL])
+            .agg(
+                pl.col("rank_ic").mean().alias("ic_mean"),
+                pl.col("rank_ic").std(ddof=0).alias("ic_std"),
+            )
+            .sort([HORIZON_COL, "factor_name"])
+        )
 
     def compute_turnover(
         self,
@@ -315,76 +309,3 @@ class FactorAnalytics:
 
         corr, _ = stats.spearmanr(x[mask], y[mask])
         return float(corr) if not np.isnan(corr) else 0.0
-
-    def _compute_forward_returns(self, returns: pl.DataFrame, horizon: int) -> pl.DataFrame:
-        """
-        Compute forward returns at specified horizon.
-
-        For each date, computes the cumulative return over the next `horizon` days.
-        This is PIT-correct: only uses data available after the signal date.
-
-        Args:
-            returns: DataFrame with date, permno, ret
-            horizon: Number of days forward
-
-        Returns:
-            DataFrame with forward_ret column
-        """
-        # Sort by permno and date
-        sorted_df = returns.sort(["permno", "date"])
-
-        # Compute rolling forward returns using lead operations
-        # Forward return = prod(1 + ret[t+1:t+horizon+1]) - 1
-        result = sorted_df.with_columns(
-            # Use rolling_map or shift+cumsum approach for forward returns
-            # For each row, we need the product of next `horizon` returns
-            pl.col("ret")
-            .map_batches(
-                lambda s: self._compute_horizon_returns(s, horizon),
-                return_dtype=pl.Float64,
-            )
-            .over("permno")
-            .alias("forward_ret")
-        )
-
-        # Drop rows where we don't have full forward window (null or NaN)
-        result = result.filter(
-            pl.col("forward_ret").is_not_null() & ~pl.col("forward_ret").is_nan()
-        )
-
-        return result
-
-    def _compute_horizon_returns(self, returns: pl.Series, horizon: int) -> pl.Series:
-        """
-        Compute forward cumulative returns for a single security.
-        Optimized to use vectorized operations via log-sum-exp approach.
-
-        Note: Returns are clamped at -0.9999 to avoid -inf from log(0) when
-        a security has a -100% return (total loss). This preserves the
-        "extremely bad return" signal while maintaining numerical stability.
-        """
-        # CRITICAL: Clamp returns at -0.9999 to prevent -inf from log(0)
-        # A -100% return (r=-1) would produce log(0) = -inf
-        # Clamping at -0.9999 gives log(0.0001) ≈ -9.2, still extremely negative
-        clamped_returns = returns.clip(lower_bound=-0.9999)
-
-        # Use rolling_sum on log(1+r) for forward cumulative returns.
-        # ret_{t, t+h} = exp( sum( log(1+r_{t+1})...log(1+r_{t+h}) ) ) - 1
-
-        # 1. log(1+r) - now safe from -inf due to clamping
-        log_ret = (clamped_returns + 1.0).log()
-
-        # 2. Forward rolling sum using reverse-roll-reverse approach
-        # Shift log returns to align t+1 at position t
-        next_log_rets = log_ret.shift(-1)
-
-        # Reverse, rolling sum, reverse back (backward rolling on reversed = forward)
-        # min_samples=horizon ensures we don't return partial sums
-        rev_next = next_log_rets.reverse()
-        rev_sum = rev_next.rolling_sum(window_size=horizon, min_samples=horizon)
-        fwd_sum = rev_sum.reverse()
-
-        # 3. Convert back to simple return
-        forward_rets = fwd_sum.exp() - 1.0
-
-        return forward_rets
@@ -9,7 +9,7 @@ All computations are point-in-time (PIT) correct with full reproducibility.
 
 import hashlib
 import logging
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
@@ -22,6 +22,7 @@ from libs.data.data_providers.compustat_local_provider import CompustatLocalProv
 from libs.data.data_providers.crsp_local_provider import CRSPLocalProvider
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 from libs.data.data_quality.versioning import DatasetVersionManager, SnapshotManifest
+from libs.models.factors.exposure_store import ExposurePanelStore, factor_definition_hash
 from libs.models.factors.factor_definitions import (
     CANONICAL_FACTORS,
     FactorConfig,
@@ -52,6 +53,7 @@ class FactorBuilder:
         manifest_manager: ManifestManager,
         version_manager: DatasetVersionManager | None = None,
         config: FactorConfig | None = None,
+        exposure_store: ExposurePanelStore | None = None,
     ):
         """
         Initialize FactorBuilder.
@@ -61,13 +63,18 @@ class FactorBuilder:
             compustat_provider: Provider for Compustat fundamental data
             manifest_manager: Manager for dataset versioning/manifests
             config: Optional configuration (uses defaults if None)
+            exposure_store: Optional precomputed exposure panel. When set,
+                compute_all_factors serves full-universe, current-version
+                requests from the panel and appends newly computed dates.
         """
         self.crsp = crsp_provider
         self.compustat = compustat_provider
         self.manifest = manifest_manager
         self.version_manager = version_manager
         self.config = config or FactorConfig()
+        self.exposure_store = exposure_store
         self._registry: dict[str, FactorDefinition] = {}
+        self._definition_hash: str | None = None
 
         # Register canonical factors on init
         self._register_canonical_factors()
@@ -85,6 +92,7 @@ class FactorBuilder:
             factor: Factor implementing FactorDefinition protocol
         """
         self._registry[factor.name] = factor
+        self._definition_hash = None
         logger.info(f"Registered factor: {factor.name} ({factor.category})")
 
     def list_factors(self) -> list[str]:
@@ -240,6 +248,10 @@ class FactorBuilder:
         """
         Compute all registered factors for given date.
 
+        When an exposure store is configured, full-universe requests against
+        the current manifest versions are read from the precomputed panel,
+        and dates computed here are appended to it for other consumers.
+
         Args:
             as_of_date: Point-in-time date for computation
             universe: Optional list of PERMNOs
@@ -248,6 +260,117 @@ class FactorBuilder:
         Returns:
             FactorResult with all factor exposures combined
         """
+        if self.exposure_store is None or universe is not None or snapshot_date is not None:
+            return self._compute_all_factors(as_of_date, universe, snapshot_date)
+
+        panel_key, version_ids, config_hash = self._exposure_panel_identity()
+        stored = self.exposure_store.read_date(panel_key, as_of_date)
+        if stored is not None:
+            logger.debug(
+                "Exposure panel hit",
+                extra={"panel_key": panel_key, "as_of_date": str(as_of_date)},
+            )
+            return FactorResult(
+                exposures=stored,
+                as_of_date=as_of_date,
+                dataset_version_ids=version_ids,
+                computation_timestamp=datetime.now(UTC),
+                reproducibility_hash=self._all_factors_hash(as_of_date, version_ids, universe),
+            )
+
+        result = self._compute_all_factors(as_of_date, universe, snapshot_date)
+        self.exposure_store.append(
+            panel_key, result.exposures, version_ids=version_ids, config_hash=config_hash
+        )
+        return result
+
+    def update_exposure_panel(self, dates: Iterable[date]) -> list[date]:
+        """
+        Incrementally extend the exposure panel with dates it does not hold.
+
+        Only missing dates are computed; they are appended in one batch so each
+        touched month partition is rewritten once.
+
+        Args:
+            dates: Candidate trading dates (e.g. all sessions through today)
+
+        Returns:
+            Sorted list of dates that were computed and appended
+
+        Raises:
+            ValueError: If no exposure store is configured
+        """
+        if self.exposure_store is None:
+            raise ValueError("update_exposure_panel requires an exposure_store")
+
+        panel_key, version_ids, config_hash = self._exposure_panel_identity()
+        missing = self.exposure_store.missing_dates(panel_key, dates)
+        if not missing:
+            return []
+
+        computed = [self._compute_all_factors(d).exposures for d in missing]
+        return self.exposure_store.append(
+            panel_key,
+            pl.concat(computed, how="diagonal_relaxed"),
+            version_ids=version_ids,
+            config_hash=config_hash,
+        )
+
+    def scan_exposures(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        factor_names: list[str] | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Lazily scan precomputed exposures for the current data versions.
+
+        Args:
+            start_date: Inclusive start date (None = earliest stored)
+            end_date: Inclusive end date (None = latest stored)
+            factor_names: Optional factor subset
+
+        Returns:
+            LazyFrame with permno, date, factor_name, raw_value, zscore, percentile
+
+        Raises:
+            ValueError: If no exposure store is configured
+        """
+        if self.exposure_store is None:
+            raise ValueError("scan_exposures requires an exposure_store")
+
+        panel_key, _, _ = self._exposure_panel_identity()
+        return self.exposure_store.scan(panel_key, start_date, end_date, factor_names)
+
+    def load_exposure_panel(self, dates: Iterable[date]) -> tuple[pl.DataFrame, dict[str, str]]:
+        """
+        Read exposures for many dates in one panel scan, computing missing ones.
+
+        Range consumers (e.g. factor covariance estimation) use this instead of
+        calling compute_all_factors once per date.
+
+        Args:
+            dates: Dates to load
+
+        Returns:
+            Tuple of (long exposures for the requested dates, dataset_version_ids)
+
+        Raises:
+            ValueError: If no exposure store is configured
+        """
+        wanted = sorted(set(dates))
+        self.update_exposure_panel(wanted)
+        _, version_ids, _ = self._exposure_panel_identity()
+        scan = self.scan_exposures(wanted[0], wanted[-1]) if wanted else self.scan_exposures()
+        return scan.filter(pl.col("date").is_in(wanted)).collect(), version_ids
+
+    def _compute_all_factors(
+        self,
+        as_of_date: date,
+        universe: list[int] | None = None,
+        snapshot_date: date | None = None,
+    ) -> FactorResult:
+        """Compute all registered factors from raw data (no panel lookup)."""
         all_exposures: list[pl.DataFrame] = []
         version_ids: dict[str, str] = {}
 
@@ -258,7 +381,21 @@ class FactorBuilder:
 
         combined = pl.concat(all_exposures)
 
-        # Compute comprehensive reproducibility hash (include config and universe)
+        return FactorResult(
+            exposures=combined,
+            as_of_date=as_of_date,
+            dataset_version_ids=version_ids,
+            computation_timestamp=datetime.now(UTC),
+            reproducibility_hash=self._all_factors_hash(as_of_date, version_ids, universe),
+        )
+
+    def _all_factors_hash(
+        self,
+        as_of_date: date,
+        version_ids: dict[str, str],
+        universe: list[int] | None,
+    ) -> str:
+        """Compute comprehensive reproducibility hash (include config and universe)."""
         universe_hash = hashlib.sha256(
             str(sorted(universe) if universe else []).encode()
         ).hexdigest()[:16]
@@ -266,18 +403,35 @@ class FactorBuilder:
             f"{self.config.winsorize_pct}:{self.config.neutralize_sector}:"
             f"{self.config.min_stocks_per_sector}:{self.config.lookback_days}".encode()
         ).hexdigest()[:16]
-        combined_hash = hashlib.sha256(
+        return hashlib.sha256(
             f"all_factors:{as_of_date}:{sorted(version_ids.items())}:"
             f"{config_hash}:{universe_hash}".encode()
         ).hexdigest()
 
-        return FactorResult(
-            exposures=combined,
-            as_of_date=as_of_date,
-            dataset_version_ids=version_ids,
-            computation_timestamp=datetime.now(UTC),
-            reproducibility_hash=combined_hash,
+    def _exposure_panel_identity(self) -> tuple[str, dict[str, str], str]:
+        """Resolve (panel_key, version_ids, config_hash) for current manifests."""
+        crsp_manifest = self.manifest.load_manifest("crsp_daily")
+        compustat_manifest = self.manifest.load_manifest("compustat_annual")
+        crsp_version = crsp_manifest.manifest_version if crsp_manifest else "unknown"
+        compustat_version = compustat_manifest.manifest_version if compustat_manifest else "unknown"
+        version_ids = {"crsp": f"v{crsp_version}", "compustat": f"v{compustat_version}"}
+
+        config_hash = hashlib.sha256(
+            f"{self.config.winsorize_pct}:{self.config.neutralize_sector}:"
+            f"{self.config.min_stocks_per_sector}:{self.config.lookback_days}:"
+            f"{self.config.report_date_column or ''}".encode()
+        ).hexdigest()[:16]
+
+        if self._definition_hash is None:
+            self._definition_hash = factor_definition_hash(self._registry)
+
+        panel_key = ExposurePanelStore.build_panel_key(
+            version_ids,
+            config_hash,
+            factor_names=self._registry,
+            definition_hash=self._definition_hash,
         )
+        return panel_key, version_ids, config_hash
 
     def compute_composite(
         self,
@@ -15,14 +15,16 @@ from __future__ import annotations
 
 import logging
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import polars as pl
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from libs.data.data_providers.taq_query_provider import TAQBarsRequest
 from libs.platform.analytics.microstructure import CompositeVersionInfo, SpreadDepthResult
 
 if TYPE_CHECKING:
@@ -452,6 +454,13 @@ class ExecutionWindowRecommendation:
     warnings: list[str] = field(default_factory=list)
 
 
+def _days_between(start: date | datetime, end: date | datetime) -> list[date]:
+    """Calendar days from start to end inclusive (empty if start > end)."""
+    first = start.date() if isinstance(start, datetime) else start
+    last = end.date() if isinstance(end, datetime) else end
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
 # =============================================================================
 # Core Analyzer Class
 # =============================================================================
@@ -491,6 +500,93 @@ class ExecutionQualityAnalyzer:
         """
         self.taq = taq_provider
         self.micro = microstructure_analyzer
+        # (symbol, day, as_of) -> that day's bars, filled by prefetch_minute_bars
+        self._bar_cache: dict[tuple[str, date, date | None], pl.DataFrame] = {}
+
+    def prefetch_minute_bars(
+        self,
+        fill_batches: Iterable[FillBatch],
+        as_of: date | None = None,
+    ) -> int:
+        """Load minute bars for many orders in one batched TAQ query.
+
+        Every benchmark (arrival, VWAP, TWAP, close) reads whole days of bars
+        between the decision/submission time and the last fill. This fetches
+        all of those symbol-days up front via
+        ``TAQLocalProvider.fetch_minute_bars_batch`` so that subsequent
+        ``analyze_execution`` calls with the same ``as_of`` are served from
+        memory. Replaces any previously prefetched bars.
+
+        Args:
+            fill_batches: Orders that will be analyzed.
+            as_of: PIT date that the later analyze_execution calls will use.
+
+        Returns:
+            Number of symbol-days cached.
+        """
+        days: set[tuple[str, date]] = set()
+        for batch in fill_batches:
+            times = [
+                batch.decision_time,
+                batch.submission_time,
+                *(f.timestamp for f in batch.valid_fills),
+            ]
+            symbol = batch.symbol.upper()
+            days.update((symbol, day) for day in _days_between(min(times), max(times)))
+
+        self._bar_cache = {}
+        if not days:
+            return 0
+
+        requests = [
+            TAQBarsRequest(f"{symbol}|{day.isoformat()}", symbol, day, day)
+            for symbol, day in sorted(days)
+        ]
+        bars = self.taq.fetch_minute_bars_batch(requests, as_of=as_of)
+        if not isinstance(bars, pl.DataFrame):
+            return 0
+
+        by_key = {
+            str(key[0]): frame.drop("request_key")
+            for key, frame in bars.partition_by("request_key", as_dict=True).items()
+        }
+        empty = bars.drop("request_key").clear()
+        for request in requests:
+            self._bar_cache[(request.symbol, request.start_date, as_of)] = by_key.get(
+                request.key, empty
+            )
+
+        logger.debug(
+            "Prefetched minute bars",
+            extra={"symbol_days": len(requests), "rows": bars.height},
+        )
+        return len(requests)
+
+    def clear_bar_cache(self) -> None:
+        """Drop bars loaded by prefetch_minute_bars."""
+        self._bar_cache = {}
+
+    def _fetch_bars(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        as_of: date | None,
+    ) -> pl.DataFrame:
+        """Minute bars for one symbol, from the prefetch cache when fully covered."""
+        symbol = symbol.upper()
+        cached = [
+            self._bar_cache.get((symbol, day, as_of)) for day in _days_between(start_date, end_date)
+        ]
+        if cached and all(frame is not None for frame in cached):
+            return pl.concat([frame for frame in cached if frame is not None])
+
+        return self.taq.fetch_minute_bars(
+            symbols=[symbol],
+            start_date=start_date,
+            end_date=end_date,
+            as_of=as_of,
+        )
 
     def _get_multi_version_id(
         self,
@@ -827,12 +923,7 @@ class ExecutionQualityAnalyzer:
 
         Returns (vwap, coverage_pct) where coverage_pct is % of window with data.
         """
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol.upper()],
-            start_date=start_time.date(),
-            end_date=end_time.date(),
-            as_of=as_of,
-        )
+        bars_df = self._fetch_bars(symbol, start_time.date(), end_time.date(), as_of)
 
         if bars_df.is_empty():
             return float("nan"), 0.0
@@ -898,12 +989,7 @@ class ExecutionQualityAnalyzer:
         as_of: date | None = None,
     ) -> float:
         """Compute TWAP (simple average of close prices)."""
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol.upper()],
-            start_date=start_time.date(),
-            end_date=end_time.date(),
-            as_of=as_of,
-        )
+        bars_df = self._fetch_bars(symbol, start_time.date(), end_time.date(), as_of)
 
         if bars_df.is_empty():
             return float("nan")
@@ -930,12 +1016,7 @@ class ExecutionQualityAnalyzer:
         Fallback: submission_time → with warning documented
         """
         # Try decision_time first
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol.upper()],
-            start_date=decision_time.date(),
-            end_date=decision_time.date(),
-            as_of=as_of,
-        )
+        bars_df = self._fetch_bars(symbol, decision_time.date(), decision_time.date(), as_of)
 
         if not bars_df.is_empty():
             # Get bar closest to decision_time
@@ -945,12 +1026,7 @@ class ExecutionQualityAnalyzer:
 
         # Fallback to submission_time
         warnings.append("Using submission_time for arrival price (decision_time bar unavailable)")
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol.upper()],
-            start_date=submission_time.date(),
-            end_date=submission_time.date(),
-            as_of=as_of,
-        )
+        bars_df = self._fetch_bars(symbol, submission_time.date(), submission_time.date(), as_of)
 
         if not bars_df.is_empty():
             bars_df = bars_df.filter(pl.col("ts") <= submission_time).sort("ts", descending=True)
@@ -968,12 +1044,7 @@ class ExecutionQualityAnalyzer:
         as_of: date | None,
     ) -> float | None:
         """Get close price for opportunity cost calculation."""
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol.upper()],
-            start_date=execution_date,
-            end_date=execution_date,
-            as_of=as_of,
-        )
+        bars_df = self._fetch_bars(symbol, execution_date, execution_date, as_of)
 
         if bars_df.is_empty():
             return None
@@ -14,6 +14,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import math
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from numbers import Real
@@ -21,7 +22,6 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import polars as pl
-from numpy.lib.stride_tricks import sliding_window_view
 from numpy.typing import NDArray
 from scipy.stats import norm  # type: ignore[import-untyped]
 
@@ -36,6 +36,18 @@ except Exception:  # pragma: no cover - fallback when numba not installed
     NUMBA_AVAILABLE = False
     njit = None
 
+from libs.data.data_providers.taq_derived import (
+    INTRADAY_SLOT_MINUTES,
+    ZERO_VOLUME_WARN_PCT,
+    bucketize_volume,
+    crossed_market_stats,
+    filter_quotes,
+    locked_market_stats,
+    rolling_sigma,
+    stale_quote_pct,
+    time_weighted_depth,
+    vpin_from_buckets,
+)
 from libs.data.data_quality.exceptions import DataNotFoundError
 
 if TYPE_CHECKING:
@@ -284,18 +296,46 @@ class MicrostructureAnalyzer:
                     e,
                 )
 
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol],
-            start_date=target_date,
-            end_date=target_date,
-            as_of=as_of,
-        )
+        prices: NDArray[np.floating[Any]] | None = None
+        n_bars = 0
+        if (
+            as_of is None
+            and sampling_freq_minutes % INTRADAY_SLOT_MINUTES == 0
+            and 60 % sampling_freq_minutes == 0
+        ):
+            # Sampled closes are kept per 5-minute slot in the derived layer
+            components = self._fetch_derived(
+                self.taq.fetch_intraday_components, [symbol], target_date, target_date
+            )
+            if components is not None:
+                n_bars = int(components["bar_count"].sum())
+                prices = (
+                    components.filter(
+                        (pl.col("slot_minute") % 60) % sampling_freq_minutes == 0,
+                        pl.col("sample_close").is_not_null(),
+                    )["sample_close"]
+                    .cast(pl.Float64)
+                    .to_numpy()
+                )
 
-        if bars_df.is_empty() or bars_df.height < 10:
+        if prices is None:
+            bars_df = self.taq.fetch_minute_bars(
+                symbols=[symbol],
+                start_date=target_date,
+                end_date=target_date,
+                as_of=as_of,
+            )
+            n_bars = bars_df.height
+            if not bars_df.is_empty() and n_bars >= 10:
+                if sampling_freq_minutes > 1:
+                    bars_df = bars_df.filter(pl.col("ts").dt.minute() % sampling_freq_minutes == 0)
+                prices = bars_df["close"].to_numpy()
+
+        if prices is None or n_bars < 10:
             version_id = self._get_version_id(self.DATASET_1MIN, as_of)
             logger.warning(
                 "Insufficient data for RV computation",
-                extra={"symbol": symbol, "date": str(target_date), "rows": bars_df.height},
+                extra={"symbol": symbol, "date": str(target_date), "rows": n_bars},
             )
             return RealizedVolatilityResult(
                 dataset_version_id=version_id,
@@ -307,13 +347,9 @@ class MicrostructureAnalyzer:
                 rv_daily=float("nan"),
                 rv_annualized=float("nan"),
                 sampling_freq_minutes=sampling_freq_minutes,
-                num_observations=bars_df.height,
+                num_observations=n_bars,
             )
 
-        if sampling_freq_minutes > 1:
-            bars_df = bars_df.filter(pl.col("ts").dt.minute() % sampling_freq_minutes == 0)
-
-        prices = bars_df["close"].to_numpy()
         log_returns = np.diff(np.log(prices))
 
         rv_daily = float(np.sqrt(np.sum(log_returns**2)))
@@ -380,6 +416,30 @@ class MicrostructureAnalyzer:
                 warnings=warnings,
             )
 
+        if as_of is None:
+            derived = self._fetch_derived(self.taq.fetch_vpin_buckets, target_date, symbol)
+            if (
+                derived is not None
+                and derived["volume_per_bucket"][0] == volume_per_bucket
+                and derived["sigma_lookback"][0] == sigma_lookback
+            ):
+                zero_vol_pct = float(derived["zero_volume_pct"][0])
+                if zero_vol_pct > ZERO_VOLUME_WARN_PCT:
+                    warnings.append(f">{zero_vol_pct*100:.1f}% zero-volume trades skipped")
+                if derived["has_sigma_zero"][0]:
+                    warnings.append("sigma=0 detected")
+                if derived["is_partial"].any():
+                    warnings.append("partial bucket at EOD")
+
+                return self._vpin_result(
+                    version_id=version_id,
+                    symbol=symbol,
+                    target_date=target_date,
+                    as_of=as_of,
+                    bucket_df=vpin_from_buckets(derived, window_buckets),
+                    warnings=warnings,
+                )
+
         # PIT-compliant tick loading: pass as_of for snapshot resolution
         ticks_df = self.taq.fetch_ticks(sample_date=target_date, symbols=[symbol], as_of=as_of)
 
@@ -408,7 +468,7 @@ class MicrostructureAnalyzer:
 
         if zero_vol_count > 0:
             zero_vol_pct = zero_vol_count / total_trades
-            if zero_vol_pct > 0.05:
+            if zero_vol_pct > ZERO_VOLUME_WARN_PCT:
                 warnings.append(f">{zero_vol_pct*100:.1f}% zero-volume trades skipped")
 
         # Now filter to positive volume trades
@@ -477,7 +537,25 @@ class MicrostructureAnalyzer:
                 warnings=warnings,
             )
 
-        bucket_df = pl.DataFrame(buckets)
+        return self._vpin_result(
+            version_id=version_id,
+            symbol=symbol,
+            target_date=target_date,
+            as_of=as_of,
+            bucket_df=pl.DataFrame(buckets),
+            warnings=warnings,
+        )
+
+    def _vpin_result(
+        self,
+        version_id: str,
+        symbol: str,
+        target_date: date,
+        as_of: date | None,
+        bucket_df: pl.DataFrame,
+        warnings: list[str],
+    ) -> VPINResult:
+        """Build a VPINResult from bucket-level VPIN rows."""
         valid_vpin = bucket_df.filter(~pl.col("vpin").is_nan())
 
         return VPINResult(
@@ -488,12 +566,27 @@ class MicrostructureAnalyzer:
             symbol=symbol,
             date=target_date,
             data=bucket_df,
-            num_buckets=len(buckets),
+            num_buckets=bucket_df.height,
             num_valid_vpin=valid_vpin.height,
             avg_vpin=_resolve_mean(valid_vpin) if valid_vpin.height > 0 else float("nan"),
             warnings=warnings,
         )
 
+    def _fetch_derived(self, fetch: Callable[..., Any], *args: Any) -> pl.DataFrame | None:
+        """Read derived TAQ components, or None to fall back to raw data.
+
+        Anything other than a non-empty DataFrame (missing partition, provider
+        without a derived layer, unreadable file) means "not derived".
+        """
+        try:
+            frame = fetch(*args)
+        except (DataNotFoundError, OSError, pl.exceptions.PolarsError) as e:
+            logger.debug("Derived TAQ components unavailable: %s", e)
+            return None
+        if not isinstance(frame, pl.DataFrame) or frame.is_empty():
+            return None
+        return frame
+
     def _compute_vpin_buckets(
         self,
         log_returns: np.ndarray[Any, np.dtype[np.floating[Any]]],
@@ -506,9 +599,9 @@ class MicrostructureAnalyzer:
     ) -> list[dict[str, Any]]:
         """Compute VPIN buckets using BVC method.
 
-        Optimized implementation using vectorized pre-computation of rolling
-        sigma and BVC probabilities to minimize per-iteration overhead.
-        The bucket filling loop remains sequential due to volume split logic.
+        Rolling sigma and BVC probabilities are computed in batch. Bucket
+        filling uses the numba loop when available, otherwise the closed-form
+        cumulative-volume bucketing from ``taq_derived``.
         """
         # Pre-compute rolling sigma using vectorized operations (PERFORMANCE CRITICAL)
         # This replaces O(n * sigma_lookback) with O(n) complexity
@@ -553,156 +646,33 @@ class MicrostructureAnalyzer:
             )
             buckets = _bucket_arrays_to_dicts(bucket_arrays, timestamps)
         else:
-            buckets, has_partial = self._compute_vpin_buckets_python(
-                v_buy_arr,
-                v_sell_arr,
-                sizes,
-                cumulative_volume,
-                sigma_zero_mask,
-                timestamps,
-                volume_per_bucket,
+            bucket_df = vpin_from_buckets(
+                bucketize_volume(
+                    v_buy_arr,
+                    v_sell_arr,
+                    sizes,
+                    sigma_zero_mask,
+                    pl.Series("timestamp", timestamps),
+                    volume_per_bucket,
+                    start=sigma_lookback,
+                ),
                 window_buckets,
-                sigma_lookback,
             )
+            buckets = bucket_df.to_dicts()
+            has_partial = bool(bucket_df["is_partial"].any())
 
         if has_partial and "partial bucket at EOD" not in warnings:
             warnings.append("partial bucket at EOD")
 
         return buckets
 
-    def _compute_vpin_buckets_python(
-        self,
-        v_buy_arr: np.ndarray[Any, np.dtype[np.floating[Any]]],
-        v_sell_arr: np.ndarray[Any, np.dtype[np.floating[Any]]],
-        sizes: np.ndarray[Any, np.dtype[np.floating[Any]]],
-        cumulative_volume: np.ndarray[Any, np.dtype[np.floating[Any]]],
-        sigma_zero_mask: np.ndarray[Any, np.dtype[np.bool_]],
-        timestamps: list[Any],
-        volume_per_bucket: int,
-        window_buckets: int,
-        sigma_lookback: int,
-    ) -> tuple[list[dict[str, Any]], bool]:
-        """Pure-Python fallback for VPIN bucketization (original implementation)."""
-
-        buckets: list[dict[str, Any]] = []
-        current_bucket_volume = 0.0
-        current_bucket_v_buy = 0.0
-        current_bucket_v_sell = 0.0
-        current_bucket_ts = None
-        sigma_zero_contaminated = False
-
-        v_buy_history: list[float] = []
-        v_sell_history: list[float] = []
-
-        for i in range(sigma_lookback, len(v_buy_arr)):
-            trade_size = float(sizes[i])
-            trade_ts = timestamps[i]
-            v_buy = float(v_buy_arr[i])
-            v_sell = float(v_sell_arr[i])
-
-            if sigma_zero_mask[i]:
-                sigma_zero_contaminated = True
-
-            remaining_volume = trade_size
-            remaining_v_buy = v_buy
-            remaining_v_sell = v_sell
-
-            while remaining_volume > 0:
-                remaining_capacity = volume_per_bucket - current_bucket_volume
-
-                if remaining_volume <= remaining_capacity:
-                    current_bucket_volume += remaining_volume
-                    current_bucket_v_buy += remaining_v_buy
-                    current_bucket_v_sell += remaining_v_sell
-                    current_bucket_ts = trade_ts
-                    remaining_volume = 0
-                else:
-                    if remaining_capacity > 0:
-                        split_ratio = remaining_capacity / remaining_volume
-                        current_bucket_volume += remaining_capacity
-                        current_bucket_v_buy += remaining_v_buy * split_ratio
-                        current_bucket_v_sell += remaining_v_sell * split_ratio
-                        current_bucket_ts = trade_ts
-
-                        remaining_volume -= remaining_capacity
-                        remaining_v_buy *= 1 - split_ratio
-                        remaining_v_sell *= 1 - split_ratio
-
-                    v_buy_history.append(current_bucket_v_buy)
-                    v_sell_history.append(current_bucket_v_sell)
-
-                    vpin_val = self._compute_vpin_value(
-                        v_buy_history,
-                        v_sell_history,
-                        window_buckets,
-                        sigma_zero_contaminated,
-                    )
-
-                    buckets.append(
-                        {
-                            "bucket_id": len(buckets),
-                            "vpin": vpin_val,
-                            "cumulative_volume": float(cumulative_volume[i]),
-                            "imbalance": abs(current_bucket_v_buy - current_bucket_v_sell),
-                            "timestamp": current_bucket_ts,
-                            "is_partial": False,
-                            "is_warmup": len(buckets) < window_buckets - 1,
-                        }
-                    )
-
-                    current_bucket_volume = 0.0
-                    current_bucket_v_buy = 0.0
-                    current_bucket_v_sell = 0.0
-                    sigma_zero_contaminated = False
-
-        has_partial = False
-        if current_bucket_volume > 0:
-            v_buy_history.append(current_bucket_v_buy)
-            v_sell_history.append(current_bucket_v_sell)
-
-            vpin_val = self._compute_vpin_value(
-                v_buy_history, v_sell_history, window_buckets, sigma_zero_contaminated
-            )
-
-            buckets.append(
-                {
-                    "bucket_id": len(buckets),
-                    "vpin": vpin_val,
-                    "cumulative_volume": float(cumulative_volume[-1]) if len(sizes) > 0 else 0.0,
-                    "imbalance": abs(current_bucket_v_buy - current_bucket_v_sell),
-                    "timestamp": current_bucket_ts,
-                    "is_partial": True,
-                    "is_warmup": len(buckets) < window_buckets - 1,
-                }
-            )
-            has_partial = True
-
-        return buckets, has_partial
-
     def _compute_rolling_sigma_vectorized(
         self,
         log_returns: np.ndarray[Any, np.dtype[np.floating[Any]]],
         lookback: int,
     ) -> np.ndarray[Any, np.dtype[np.floating[Any]]]:
-        """Compute rolling standard deviation using fully vectorized operations.
-
-        Uses cumulative sums for O(n) complexity instead of O(n * lookback).
-        This is approximately 100x faster than the naive loop approach for
-        typical tick data sizes (500k-1M rows).
-        """
-        n = len(log_returns)
-        sigma_arr = np.zeros(n, dtype=np.float64)
-
-        if n < lookback or lookback < 2:
-            return sigma_arr
-
-        # Two-pass approach using sliding windows to avoid catastrophic cancellation
-        windows = sliding_window_view(log_returns.astype(np.float64), lookback)
-        window_variances = windows.var(axis=1, ddof=1)
-
-        sigma_arr[lookback - 1 :] = np.sqrt(np.maximum(window_variances, 0.0))
-
-        return sigma_arr
+        """Compute rolling standard deviation using fully vectorized operations."""
+        return rolling_sigma(log_returns, lookback)
 
     def _compute_vpin_value(
         self,
@@ -764,14 +734,21 @@ class MicrostructureAnalyzer:
         symbol = symbol.upper()
         version_id = self._get_version_id(self.DATASET_1MIN, as_of)
 
-        bars_df = self.taq.fetch_minute_bars(
-            symbols=[symbol],
-            start_date=start_date,
-            end_date=end_date,
-            as_of=as_of,
-        )
+        components = None
+        if as_of is None and bucket_minutes % INTRADAY_SLOT_MINUTES == 0:
+            components = self._fetch_derived(
+                self.taq.fetch_intraday_components, [symbol], start_date, end_date
+            )
 
-        if bars_df.is_empty():
+        pattern_df: pl.DataFrame | None
+        if components is not None:
+            pattern_df = self._intraday_pattern_from_components(components, bucket_minutes)
+        else:
+            pattern_df = self._intraday_pattern_from_bars(
+                symbol, start_date, end_date, bucket_minutes, as_of
+            )
+
+        if pattern_df is None:
             return IntradayPatternResult(
                 dataset_version_id=version_id,
                 dataset_versions=None,
@@ -791,6 +768,55 @@ class MicrostructureAnalyzer:
                 ),
             )
 
+        pattern_df = pattern_df.with_columns(
+            [
+                pl.time(
+                    hour=pl.col("bucket_minute").cast(pl.Int32) // 60,
+                    minute=pl.col("bucket_minute").cast(pl.Int32) % 60,
+                ).alias("time_bucket"),
+            ]
+        )
+
+        pattern_df = pattern_df.select(
+            [
+                "time_bucket",
+                "avg_volatility",
+                "avg_spread",
+                "avg_volume",
+                "n_days",
+            ]
+        )
+
+        return IntradayPatternResult(
+            dataset_version_id=version_id,
+            dataset_versions=None,
+            computation_timestamp=datetime.now(UTC),
+            as_of_date=as_of,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            data=pattern_df,
+        )
+
+    def _intraday_pattern_from_bars(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        bucket_minutes: int,
+        as_of: date | None,
+    ) -> pl.DataFrame | None:
+        """Aggregate 1-minute bars into per-bucket averages (None if no bars)."""
+        bars_df = self.taq.fetch_minute_bars(
+            symbols=[symbol],
+            start_date=start_date,
+            end_date=end_date,
+            as_of=as_of,
+        )
+
+        if bars_df.is_empty():
+            return None
+
         bars_df = bars_df.with_columns(
             [
                 pl.col("ts").dt.time().alias("time_of_day"),
@@ -815,7 +841,7 @@ class MicrostructureAnalyzer:
             ]
         )
 
-        pattern_df = (
+        return (
             bars_df.group_by("bucket_minute")
             .agg(
                 [
@@ -828,34 +854,31 @@ class MicrostructureAnalyzer:
             .sort("bucket_minute")
         )
 
-        pattern_df = pattern_df.with_columns(
-            [
-                pl.time(
-                    hour=pl.col("bucket_minute").cast(pl.Int32) // 60,
-                    minute=pl.col("bucket_minute").cast(pl.Int32) % 60,
-                ).alias("time_bucket"),
-            ]
-        )
+    def _intraday_pattern_from_components(
+        self, components: pl.DataFrame, bucket_minutes: int
+    ) -> pl.DataFrame:
+        """Re-aggregate 5-minute slot sums/counts into per-bucket averages."""
 
-        pattern_df = pattern_df.select(
-            [
-                "time_bucket",
-                "avg_volatility",
-                "avg_spread",
-                "avg_volume",
-                "n_days",
-            ]
-        )
+        def _mean(stat: str) -> pl.Expr:
+            n = pl.col(f"{stat}_n").sum()
+            return pl.when(n > 0).then(pl.col(f"{stat}_sum").sum() / n)
 
-        return IntradayPatternResult(
-            dataset_version_id=version_id,
-            dataset_versions=None,
-            computation_timestamp=datetime.now(UTC),
-            as_of_date=as_of,
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            data=pattern_df,
+        return (
+            components.with_columns(
+                ((pl.col("slot_minute") // bucket_minutes) * bucket_minutes)
+                .cast(pl.Int32)
+                .alias("bucket_minute")
+            )
+            .group_by("bucket_minute")
+            .agg(
+                [
+                    _mean("intrabar_vol").alias("avg_volatility"),
+                    _mean("half_range").alias("avg_spread"),
+                    _mean("volume").alias("avg_volume"),
+                    pl.col("date").n_unique().alias("n_days"),
+                ]
+            )
+            .sort("bucket_minute")
         )
 
     def compute_spread_depth_stats(
@@ -908,38 +931,60 @@ class MicrostructureAnalyzer:
         crossed_pct = 0.0
         stale_quote_pct = 0.0
 
-        try:
-            # PIT-compliant tick loading: pass as_of for snapshot resolution
-            ticks_df = self.taq.fetch_ticks(sample_date=target_date, symbols=[symbol], as_of=as_of)
-
-            if not ticks_df.is_empty():
-                quotes_df = self._filter_quotes(ticks_df)
+        summary = None
+        if as_of is None:
+            summary = self._fetch_derived(self.taq.fetch_spread_depth_summary, target_date, symbol)
+            if (
+                summary is not None
+                and summary["stale_threshold_seconds"][0] != stale_threshold_seconds
+            ):
+                summary = None
+
+        if summary is not None:
+            row = summary.row(0, named=True)
+            if row["n_quotes"] > 0:
+                avg_bid_depth = row["avg_bid_depth"]
+                avg_ask_depth = row["avg_ask_depth"]
+                has_locked, locked_pct = row["has_locked"], row["locked_pct"]
+                has_crossed, crossed_pct = row["has_crossed"], row["crossed_pct"]
+                stale_quote_pct = row["stale_quote_pct"]
+            else:
+                depth_is_estimated = True
+        else:
+            try:
+                # PIT-compliant tick loading: pass as_of for snapshot resolution
+                ticks_df = self.taq.fetch_ticks(
+                    sample_date=target_date, symbols=[symbol], as_of=as_of
+                )
 
-                if not quotes_df.is_empty():
-                    avg_bid_depth, avg_ask_depth = self._compute_depth_from_ticks(quotes_df)
+                if not ticks_df.is_empty():
+                    quotes_df = self._filter_quotes(ticks_df)
 
-                    has_locked, locked_pct = self._detect_locked_markets(quotes_df)
-                    has_crossed, crossed_pct = self._detect_crossed_markets(quotes_df)
-                    stale_quote_pct = self._compute_stale_quote_pct(
-                        quotes_df, stale_threshold_seconds
-                    )
+                    if not quotes_df.is_empty():
+                        avg_bid_depth, avg_ask_depth = self._compute_depth_from_ticks(quotes_df)
 
-                    if stale_quote_pct > 0.50:
-                        logger.warning(
-                            "High stale quote percentage",
-                            extra={
-                                "symbol": symbol,
-                                "date": str(target_date),
-                                "stale_pct": stale_quote_pct,
-                            },
+                        has_locked, locked_pct = self._detect_locked_markets(quotes_df)
+                        has_crossed, crossed_pct = self._detect_crossed_markets(quotes_df)
+                        stale_quote_pct = self._compute_stale_quote_pct(
+                            quotes_df, stale_threshold_seconds
                         )
+                    else:
+                        depth_is_estimated = True
                 else:
                     depth_is_estimated = True
-            else:
+
+            except DataNotFoundError:
                 depth_is_estimated = True
 
-        except DataNotFoundError:
-            depth_is_estimated = True
+        if stale_quote_pct > 0.50:
+            logger.warning(
+                "High stale quote percentage",
+                extra={
+                    "symbol": symbol,
+                    "date": str(target_date),
+                    "stale_pct": stale_quote_pct,
+                },
+            )
 
         avg_total_depth = avg_bid_depth + avg_ask_depth
 
@@ -977,117 +1022,25 @@ class MicrostructureAnalyzer:
 
     def _filter_quotes(self, ticks_df: pl.DataFrame) -> pl.DataFrame:
         """Filter tick data to quote-only rows using hierarchical logic."""
-        if "record_type" in ticks_df.columns:
-            return ticks_df.filter(pl.col("record_type") == "quote")
-
-        return ticks_df.filter((pl.col("bid_size") > 0) & (pl.col("ask_size") > 0))
+        return filter_quotes(ticks_df)
 
     def _compute_depth_from_ticks(self, quotes_df: pl.DataFrame) -> tuple[float, float]:
         """Compute time-weighted L1 depth from quote data."""
-        quotes_df = quotes_df.filter(
-            (pl.col("bid") > 0) & (pl.col("ask") > 0) & (pl.col("bid") <= pl.col("ask"))
-        )
-
-        if quotes_df.is_empty():
-            return float("nan"), float("nan")
-
-        quotes_df = quotes_df.sort("ts")
-        quotes_df = quotes_df.with_columns(
-            [
-                pl.col("ts").shift(-1).alias("next_ts"),
-            ]
-        )
-
-        # Compute raw duration first (without fallback for last row)
-        quotes_df = quotes_df.with_columns(
-            [
-                (pl.col("next_ts") - pl.col("ts")).alias("raw_duration"),
-            ]
-        )
-
-        # Check if all raw durations are zero (or null for last row)
-        # If so, all quotes have the same timestamp - return NaN
-        non_null_durations = quotes_df.filter(pl.col("raw_duration").is_not_null())
-        if non_null_durations.height > 0:
-            all_zero = (non_null_durations["raw_duration"].dt.total_seconds() == 0).all()
-            if all_zero:
-                return float("nan"), float("nan")
-
-        # Apply 1-second fallback for last row
-        quotes_df = quotes_df.with_columns(
-            [
-                (
-                    pl.when(pl.col("next_ts").is_null())
-                    .then(pl.duration(seconds=1))
-                    .otherwise(pl.col("raw_duration"))
-                ).alias("duration"),
-            ]
-        )
-
-        quotes_df = quotes_df.with_columns(
-            [
-                pl.col("duration").dt.total_seconds().alias("duration_seconds"),
-            ]
-        )
-
-        quotes_df = quotes_df.filter(pl.col("duration_seconds") > 0)
-
-        if quotes_df.is_empty():
-            return float("nan"), float("nan")
-
-        total_duration = quotes_df["duration_seconds"].sum()
-        avg_bid = (quotes_df["bid_size"] * quotes_df["duration_seconds"]).sum() / total_duration
-        avg_ask = (quotes_df["ask_size"] * quotes_df["duration_seconds"]).sum() / total_duration
-
-        return float(avg_bid), float(avg_ask)
+        return time_weighted_depth(quotes_df)
 
     def _detect_locked_markets(self, quotes_df: pl.DataFrame) -> tuple[bool, float]:
         """Detect locked markets (bid == ask)."""
-        locked = quotes_df.filter(pl.col("bid") == pl.col("ask"))
-        locked_pct = locked.height / quotes_df.height if quotes_df.height > 0 else 0.0
-        return locked.height > 0, locked_pct
+        return locked_market_stats(quotes_df)
 
     def _detect_crossed_markets(self, quotes_df: pl.DataFrame) -> tuple[bool, float]:
         """Detect crossed markets (bid > ask)."""
-        crossed = quotes_df.filter(pl.col("bid") > pl.col("ask"))
-        crossed_pct = crossed.height / quotes_df.height if quotes_df.height > 0 else 0.0
-        return crossed.height > 0, crossed_pct
+        return crossed_market_stats(quotes_df)
 
     def _compute_stale_quote_pct(
         self, quotes_df: pl.DataFrame, threshold_seconds: int = 60
     ) -> float:
         """Compute percentage of stale quotes."""
-        if quotes_df.height < 2:
-            return 0.0
-
-        quotes_df = quotes_df.sort("ts")
-        quotes_df = quotes_df.with_columns(
-            [
-                pl.col("bid").shift(1).alias("prev_bid"),
-                pl.col("ask").shift(1).alias("prev_ask"),
-                pl.col("bid_size").shift(1).alias("prev_bid_size"),
-                pl.col("ask_size").shift(1).alias("prev_ask_size"),
-                pl.col("ts").shift(1).alias("prev_ts"),
-            ]
-        )
-
-        quotes_df = quotes_df.filter(pl.col("prev_ts").is_not_null())
-
-        quotes_df = quotes_df.with_columns(
-            [
-                ((pl.col("ts") - pl.col("prev_ts")).dt.total_seconds()).alias("time_diff"),
-            ]
-        )
-
-        stale = quotes_df.filter(
-            (pl.col("bid") == pl.col("prev_bid"))
-            & (pl.col("ask") == pl.col("prev_ask"))
-            & (pl.col("bid_size") == pl.col("prev_bid_size"))
-            & (pl.col("ask_size") == pl.col("prev_ask_size"))
-            & (pl.col("time_diff") > threshold_seconds)
-        )
-
-        return stale.height / quotes_df.height if quotes_df.height > 0 else 0.0
+        return stale_quote_pct(quotes_df, threshold_seconds)
 
 
 # =========================================================================
@@ -14,6 +14,14 @@ from typing import TYPE_CHECKING, Literal
 
 import polars as pl
 
+from libs.analytics.signal_analytics import (
+    FORWARD_RETURN_COL,
+    HORIZON_COL,
+    compute_forward_returns,
+    compute_signal_metrics,
+    summarize_signal_metrics,
+)
+
 if TYPE_CHECKING:
     pass
 
@@ -669,19 +677,8 @@ class AlphaMetricsAdapter:
         Returns:
             DecayCurveResult with decay curve and estimated half-life
         """
-        results = []
-
-        for horizon, returns in sorted(returns_by_horizon.items()):
-            ic_result = self.compute_ic(signal, returns, method="rank")
-            results.append(
-                {
-                    "horizon": horizon,
-                    "ic": ic_result.pearson_ic,
-                    "rank_ic": ic_result.rank_ic,
-                }
-            )
-
-        if not results:
+        horizons = sorted(returns_by_horizon)
+        if not horizons:
             return DecayCurveResult(
                 decay_curve=pl.DataFrame(
                     schema={"horizon": pl.Int64, "ic": pl.Float64, "rank_ic": pl.Float64}
@@ -689,13 +686,71 @@ class AlphaMetricsAdapter:
                 half_life=None,
             )
 
-        decay_df = pl.DataFrame(results)
+        # Stack all horizons into one long frame so IC for every horizon comes
+        # out of a single grouped aggregation instead of one pass per horizon.
+        forward_returns = pl.concat(
+            [
+                returns_by_horizon[horizon].select(
+                    pl.col("date"),
+                    pl.col("permno"),
+                    pl.lit(horizon, dtype=pl.Int64).alias(HORIZON_COL),
+                    pl.col("return").cast(pl.Float64).alias(FORWARD_RETURN_COL),
+                )
+                for horizon in horizons
+            ],
+            how="vertical_relaxed",
+        )
+        daily = compute_signal_metrics(signal, forward_returns)
+        summary = summarize_signal_metrics(daily, min_observations=MIN_OBSERVATIONS)
+
+        # Horizons without enough data keep a NaN row so the curve shape is stable
+        decay_df = (
+            pl.DataFrame({"horizon": horizons}, schema={"horizon": pl.Int64})
+            .join(
+                summary.select(
+                    "horizon",
+                    pl.col("ic_mean").alias("ic"),
+                    pl.col("rank_ic_mean").alias("rank_ic"),
+                ),
+                on="horizon",
+                how="left",
+            )
+            .with_columns(pl.col("ic", "rank_ic").fill_null(float("nan")))
+        )
 
         # Estimate half-life (simple linear interpolation)
         half_life = self._estimate_half_life(decay_df)
 
         return DecayCurveResult(decay_curve=decay_df, half_life=half_life)
 
+    def compute_decay_curve_from_panel(
+        self,
+        signal: pl.DataFrame,
+        daily_returns: pl.DataFrame,
+        horizons: list[int],
+    ) -> DecayCurveResult:
+        """Compute IC decay curve directly from a daily returns panel.
+
+        Forward returns for every horizon are derived in one windowed pass
+        (geometric compounding over the next ``h`` trading days, requiring no
+        missing days inside the window) instead of building a per-horizon,
+        per-date returns frame.
+
+        Args:
+            signal: DataFrame with [permno, date, signal]
+            daily_returns: DataFrame with [permno, date, ret] daily returns
+            horizons: Forward horizons in trading days
+
+        Returns:
+            DecayCurveResult with decay curve and estimated half-life
+        """
+        forward_returns = compute_forward_returns(daily_returns, horizons, require_contiguous=True)
+        returns_by_horizon = {
+            horizon: group.select("permno", "date", pl.col(FORWARD_RETURN_COL).alias("return"))
+            for (horizon,), group in forward_returns.partition_by(HORIZON_COL, as_dict=True).items()
+        }
+        return self.compute_decay_curve(signal, returns_by_horizon)
+
     def _estimate_half_life(self, decay_df: pl.DataFrame) -> float | None:
         """Estimate half-life from decay curve.
 
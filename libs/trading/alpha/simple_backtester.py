@@ -601,23 +601,12 @@ class SimpleBacktester:
             .sort("date")
         )
 
-        # Decay curve computation
-        returns_by_horizon: dict[int, pl.DataFrame] = {}
-        for h in decay_horizons:
-            try:
-                res_list = []
-                for d in unique_dates:
-                    try:
-                        hr = self._compute_forward_returns(prices, d, h)
-                        res_list.append(hr)
-                    except MissingForwardReturnError:
-                        pass
-                if res_list:
-                    returns_by_horizon[h] = pl.concat(res_list)
-            except Exception:
-                continue
-
-        decay_result = self._metrics.compute_decay_curve(daily_signals, returns_by_horizon)
+        # Decay curve computation (all horizons from one pass over the price panel)
+        decay_result = self._metrics.compute_decay_curve_from_panel(
+            daily_signals,
+            prices.select(pl.col("date").cast(pl.Date), pl.col("permno"), pl.col("ret")),
+            list(decay_horizons),
+        )
 
         # Autocorrelation
         mean_signal_ts = daily_signals.group_by("date").agg(pl.col("signal").mean().alias("signal"))
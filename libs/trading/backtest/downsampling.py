@@ -0,0 +1,163 @@
+"""Server-side downsampling of backtest chart series.
+
+Equity, drawdown and IC series for long backtests carry thousands of daily
+points, far more than a chart can draw at its rendered pixel width. Shipping
+every point to the browser costs serialization time and websocket bandwidth
+without changing what the user sees. These helpers reduce a series to
+roughly one point per horizontal pixel while keeping its visual shape.
+
+This module provides:
+- lttb: Largest-Triangle-Three-Buckets downsampling (smooth shape preservation)
+- min_max: Per-bucket min/max downsampling (preserves extremes, e.g. drawdown troughs)
+- downsample: Dispatch on method name with pixel-width based point budgets
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+MIN_CHART_WIDTH_PX = 50
+MAX_CHART_WIDTH_PX = 4000
+
+
+def clamp_width(width_px: int) -> int:
+    """Clamp a requested chart width to the supported pixel range."""
+    return max(MIN_CHART_WIDTH_PX, min(int(width_px), MAX_CHART_WIDTH_PX))
+
+
+def _finite_rows(df: pl.DataFrame, x: str, y: str) -> pl.DataFrame:
+    """Sort by ``x`` and drop rows whose ``y`` is null or non-finite."""
+    return df.sort(x).filter(pl.col(y).is_not_null() & pl.col(y).cast(pl.Float64).is_finite())
+
+
+def _xy(df: pl.DataFrame, x: str, y: str) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    xs = df.get_column(x).to_physical().cast(pl.Float64).to_numpy()
+    ys = df.get_column(y).cast(pl.Float64).to_numpy()
+    return xs, ys
+
+
+def _lttb_indices(
+    xs: NDArray[np.float64], ys: NDArray[np.float64], n_out: int
+) -> NDArray[np.int64]:
+    """Indices selected by LTTB; first and last points are always kept."""
+    n = len(xs)
+    if n_out >= n or n_out < 3:
+        return np.arange(n, dtype=np.int64)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    bucket_size = (n - 2) / (n_out - 2)
+    anchor = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        if end >= next_end:  # last bucket: the "next" bucket is the final point
+            avg_x, avg_y = xs[-1], ys[-1]
+        else:
+            avg_x, avg_y = xs[end:next_end].mean(), ys[end:next_end].mean()
+        ax, ay = xs[anchor], ys[anchor]
+        areas = np.abs((ax - avg_x) * (ys[start:end] - ay) - (ax - xs[start:end]) * (avg_y - ay))
+        anchor = start + int(np.argmax(areas))
+        selected[i + 1] = anchor
+    return selected
+
+
+def _min_max_indices(ys: NDArray[np.float64], n_buckets: int) -> NDArray[np.int64]:
+    """Indices of the min and max point of each bucket, plus both endpoints."""
+    n = len(ys)
+    if n_buckets * 2 >= n:
+        return np.arange(n, dtype=np.int64)
+
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.int64)
+    keep = {0, n - 1}
+    for start, end in zip(edges[:-1], edges[1:], strict=True):
+        if end <= start:
+            continue
+        bucket = ys[start:end]
+        keep.add(int(start + np.argmin(bucket)))
+        keep.add(int(start + np.argmax(bucket)))
+    return np.fromiter(sorted(keep), dtype=np.int64)
+
+
+def lttb(df: pl.DataFrame, x: str, y: str, n_out: int) -> pl.DataFrame:
+    """Downsample ``df`` to at most ``n_out`` rows with LTTB.
+
+    Args:
+        df: Series frame; ``x`` must be numeric or temporal.
+        x: Column used as the horizontal axis.
+        y: Column whose shape is preserved.
+        n_out: Maximum number of rows to return.
+
+    Returns:
+        Subset of the (sorted, finite) input rows with all columns kept.
+    """
+    clean = _finite_rows(df, x, y)
+    xs, ys = _xy(clean, x, y)
+    return clean[_lttb_indices(xs, ys, n_out)]
+
+
+def min_max(df: pl.DataFrame, x: str, y: str, n_out: int) -> pl.DataFrame:
+    """Downsample ``df`` to at most ``n_out`` rows keeping per-bucket extremes.
+
+    Args:
+        df: Series frame.
+        x: Column used as the horizontal axis (sort order).
+        y: Column whose extremes are kept.
+        n_out: Maximum number of rows to return (two per bucket).
+
+    Returns:
+        Subset of the (sorted, finite) input rows with all columns kept.
+    """
+    clean = _finite_rows(df, x, y)
+    _, ys = _xy(clean, x, y)
+    return clean[_min_max_indices(ys, max((n_out - 2) // 2, 1))]
+
+
+_METHODS: dict[str, Any] = {"lttb": lttb, "minmax": min_max}
+
+
+def downsample(
+    df: pl.DataFrame,
+    x: str,
+    y: str,
+    width_px: int,
+    method: DownsampleMethod = "lttb",
+) -> pl.DataFrame:
+    """Downsample a chart series to roughly one point per pixel of ``width_px``.
+
+    Args:
+        df: Series frame.
+        x: Horizontal axis column.
+        y: Value column.
+        width_px: Rendered chart width; clamped to the supported range.
+        method: ``"lttb"`` or ``"minmax"``.
+
+    Returns:
+        Downsampled frame.
+
+    Raises:
+        ValueError: If ``method`` is unknown.
+    """
+    if method not in _METHODS:
+        raise ValueError(f"Unknown downsample method: {method!r}")
+    result: pl.DataFrame = _METHODS[method](df, x, y, clamp_width(width_px))
+    return result
+
+
+__all__ = [
+    "MAX_CHART_WIDTH_PX",
+    "MIN_CHART_WIDTH_PX",
+    "DownsampleMethod",
+    "clamp_width",
+    "downsample",
+    "lttb",
+    "min_max",
+]
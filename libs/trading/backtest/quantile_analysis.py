@@ -16,12 +16,17 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import date
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import numpy as np
-import numpy.typing as npt
 import polars as pl
-from scipy.stats import rankdata, spearmanr  # type: ignore[import-untyped]
+
+from libs.analytics.signal_analytics import (
+    HORIZON_COL,
+    compute_signal_metrics,
+    quantile_count_col,
+    quantile_return_col,
+)
 
 if TYPE_CHECKING:
     import exchange_calendars as xcals  # type: ignore[import-not-found]
@@ -248,12 +253,10 @@ class QuantileAnalyzer:
             InsufficientDataError: If not enough data for analysis.
 
         Algorithm:
-        1. Pre-filter: Only include signal dates in trading calendar
-        2. For each trading date:
-           a. Skip if < min_observations
-           b. Compute Rank IC: Spearman(signal_value, forward_return)
-           c. Handle NaN IC: Drop dates with constant signals
-           d. Assign quantiles and record per-quantile returns
+        1. Compute per-date Rank IC and quantile returns for every date in one
+           grouped aggregation (shared signal analytics kernel)
+        2. Skip dates that are non-trading, have < min_observations, or have a
+           NaN IC (constant signals)
         3. Aggregate across dates
         """
         cfg = config or QuantileAnalysisConfig()
@@ -313,86 +316,43 @@ class QuantileAnalyzer:
         # Load trading dates
         self._load_trading_dates(min(signal_dates), max(signal_dates))
 
-        # Join signals with forward returns
-        joined = signals.join(
-            forward_returns,
-            on=["signal_date", "permno"],
-            how="inner",
-        )
-
-        if joined.height == 0:
+        # Guard: any overlap between signals and forward returns at all?
+        overlap = signals.join(forward_returns, on=["signal_date", "permno"], how="semi")
+        if overlap.height == 0:
             raise InsufficientDataError("No overlapping signal/return data")
 
-        # Filter out non-finite values
-        joined = joined.filter(
-            pl.col("signal_value").is_finite() & pl.col("forward_return").is_finite()
+        # Per-date Rank IC and quantile returns for all dates in one grouped
+        # aggregation (non-finite values dropped before ranking)
+        daily = compute_signal_metrics(
+            signals,
+            forward_returns.with_columns(
+                pl.lit(cfg.holding_period_days, dtype=pl.Int64).alias(HORIZON_COL)
+            ),
+            n_quantiles=cfg.n_quantiles,
+            date_col="signal_date",
+            id_col="permno",
+            signal_col="signal_value",
+            return_col="forward_return",
+            drop_non_finite=True,
         )
 
-        # Per-date analysis
-        per_date_ics: list[float] = []
-        per_date_quantile_returns: dict[int, list[float]] = {
-            q: [] for q in range(1, cfg.n_quantiles + 1)
-        }
-        n_dates_skipped = 0
-        total_obs_per_quantile: dict[int, int] = {q: 0 for q in range(1, cfg.n_quantiles + 1)}
-
-        valid_dates = []
-
-        # PERFORMANCE: Use partition_by for O(1) per-date access instead of O(N) filter
-        date_groups = joined.partition_by("signal_date", as_dict=True)
-
-        for signal_date in signal_dates:
-            # Check if trading day
-            if signal_date not in self._trading_dates:
-                n_dates_skipped += 1
-                logger.debug(
-                    "skipping_non_trading_date",
-                    extra={"date": str(signal_date)},
-                )
-                continue
-
-            # Get data for this date using O(1) dict lookup
-            # Note: partition_by returns tuple keys even for single column in Polars 1.x
-            date_data = date_groups.get((signal_date,))
-            if date_data is None:
-                n_dates_skipped += 1
-                continue
-
-            # Check minimum observations
-            if date_data.height < cfg.min_observations_per_date:
-                n_dates_skipped += 1
-                logger.debug(
-                    "skipping_low_obs_date",
-                    extra={"date": str(signal_date), "obs": date_data.height},
-                )
-                continue
-
-            # Extract arrays
-            signal_vals = date_data["signal_value"].to_numpy()
-            return_vals = date_data["forward_return"].to_numpy()
-
-            # Compute Rank IC
-            ic = self._compute_rank_ic(signal_vals, return_vals)
-            if ic is None or np.isnan(ic):
-                n_dates_skipped += 1
-                logger.debug(
-                    "skipping_nan_ic_date",
-                    extra={"date": str(signal_date)},
-                )
-                continue
-
-            per_date_ics.append(ic)
-            valid_dates.append(signal_date)
-
-            # Assign quantiles and record returns
-            quantiles = self._assign_quantiles(signal_vals, cfg.n_quantiles)
-
-            for q in range(1, cfg.n_quantiles + 1):
-                q_mask = quantiles == q
-                q_returns = return_vals[q_mask]
-                if len(q_returns) > 0:
-                    per_date_quantile_returns[q].append(float(np.mean(q_returns)))
-                    total_obs_per_quantile[q] += len(q_returns)
+        # Skip non-trading dates, dates with too few observations and dates
+        # with an undefined IC (constant signals or returns)
+        valid_daily = daily.filter(
+            pl.col("signal_date").is_in(sorted(self._trading_dates))
+            & (pl.col("n_obs") >= cfg.min_observations_per_date)
+            & pl.col("rank_ic").is_not_null()
+            & pl.col("rank_ic").is_not_nan()
+        ).sort("signal_date")
+        n_dates_skipped = len(signal_dates) - valid_daily.height
+        if n_dates_skipped > 0:
+            logger.debug(
+                "skipping_invalid_dates",
+                extra={"n_skipped": n_dates_skipped},
+            )
+
+        per_date_ics: list[float] = valid_daily["rank_ic"].to_list()
+        valid_dates: list[date] = valid_daily["signal_date"].to_list()
 
         # Check minimum dates
         if len(per_date_ics) < cfg.min_total_dates:
@@ -412,14 +372,13 @@ class QuantileAnalyzer:
             t_stat = 0.0
         positive_pct = float(np.mean(ic_array > 0) * 100)
 
-        # Aggregate quantile returns
+        # Aggregate quantile returns (mean of per-date bucket means)
         quantile_means: dict[int, float] = {}
+        total_obs_per_quantile: dict[int, int] = {}
         for q in range(1, cfg.n_quantiles + 1):
-            q_rets = per_date_quantile_returns[q]
-            if q_rets:
-                quantile_means[q] = float(np.mean(q_rets))
-            else:
-                quantile_means[q] = 0.0
+            q_mean = valid_daily[quantile_return_col(q)].drop_nulls().mean()
+            quantile_means[q] = float(q_mean) if isinstance(q_mean, int | float) else 0.0
+            total_obs_per_quantile[q] = int(valid_daily[quantile_count_col(q)].sum())
 
         # Long/Short spread
         long_short = quantile_means.get(cfg.n_quantiles, 0.0) - quantile_means.get(1, 0.0)
@@ -440,53 +399,6 @@ class QuantileAnalyzer:
             universe_name=universe_name,
         )
 
-    def _compute_rank_ic(
-        self,
-        signals: npt.NDArray[np.floating[Any]],
-        returns: npt.NDArray[np.floating[Any]],
-    ) -> float | None:
-        """Spearman correlation between raw signal values and returns.
-
-        This is the standard Rank IC used in factor research.
-
-        Args:
-            signals: Array of signal values.
-            returns: Array of forward returns.
-
-        Returns:
-            Spearman correlation coefficient, or None if invalid.
-        """
-        # Check for constant signals (would give NaN correlation)
-        if np.std(signals) == 0 or np.std(returns) == 0:
-            return None
-
-        result = spearmanr(signals, returns)
-        # Use statistic attr (scipy 1.10+) with fallback to correlation for compatibility
-        correlation = getattr(result, "statistic", getattr(result, "correlation", None))
-        return float(correlation) if correlation is not None else None
-
-    def _assign_quantiles(
-        self,
-        signals: npt.NDArray[np.floating[Any]],
-        n_quantiles: int,
-    ) -> npt.NDArray[np.intp]:
-        """Assign quantile labels using scipy.stats.rankdata.
-
-        Args:
-            signals: Array of signal values.
-            n_quantiles: Number of quantile buckets.
-
-        Returns:
-            Array of quantile labels (1 to n_quantiles).
-        """
-        ranks = rankdata(signals, method="average")
-        n = len(ranks)
-        # Quantiles: 1 = lowest, n_quantiles = highest
-        quantiles: npt.NDArray[np.intp] = np.ceil(ranks / n * n_quantiles).astype(np.intp)
-        # Clip to valid range
-        quantiles = np.clip(quantiles, 1, n_quantiles)
-        return quantiles
-
 
 def run_quantile_analysis(
     signals: pl.DataFrame,
@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 import math
 import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any, cast
@@ -14,6 +17,7 @@ from psycopg_pool import ConnectionPool
 
 from libs.trading.alpha.portfolio import TurnoverCalculator, TurnoverResult
 from libs.trading.alpha.research_platform import BacktestResult
+from libs.trading.backtest.downsampling import DownsampleMethod, downsample
 from libs.trading.backtest.models import BacktestJob, JobNotFound, ResultPathMissing
 from libs.trading.backtest.param_search import SearchResult
 from libs.trading.backtest.walk_forward import (
@@ -32,21 +36,60 @@ class BacktestResultStorage:
 
     DEFAULT_RETENTION_DAYS = 90
 
-    def __init__(self, pool: ConnectionPool, base_dir: Path | None = None):
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        base_dir: Path | None = None,
+        handle_cache: ResultHandleCache | None = None,
+    ):
         self.pool = pool
         # Configurable base directory for path safety checks (useful for testing)
         self.base_dir = base_dir or PARQUET_BASE_DIR
+        # Process-wide LRU by default so per-request storage instances share it
+        self.handle_cache = handle_cache if handle_cache is not None else _RESULT_HANDLE_CACHE
 
     # ------------------------------------------------------------------ public
     def get_result(self, job_id: str) -> BacktestResult:
         """
         Load a completed backtest result by job_id.
 
+        Served from the handle LRU when the result was viewed recently.
+
+        Raises:
+            JobNotFound: no row for job_id
+            ResultPathMissing: row exists but result_path is null/absent on disk
+            ValueError: corrupt/missing summary.json reproducibility metadata
+        """
+        return self.open_result(job_id).to_result()
+
+    def open_result(self, job_id: str) -> BacktestResultHandle:
+        """
+        Open a lazy handle on a completed backtest result.
+
+        Only summary.json is read; artifacts are decoded on demand. Handles
+        are cached per job_id in ``handle_cache``.
+
         Raises:
             JobNotFound: no row for job_id
             ResultPathMissing: row exists but result_path is null/absent on disk
             ValueError: corrupt/missing summary.json reproducibility metadata
         """
+        row, target_path = self._resolve_result_path(job_id)
+        handle = self.handle_cache.get(job_id, target_path)
+        if handle is not None:
+            return handle
+        # Use the resolved target_path to prevent symlink TOCTOU attacks
+        handle = BacktestResultHandle.open(target_path, job_row=row)
+        self.handle_cache.put(job_id, handle)
+        return handle
+
+    def _resolve_result_path(self, job_id: str) -> tuple[dict[str, Any], Path]:
+        """Fetch the job row and its validated, resolved result_path.
+
+        Raises:
+            JobNotFound: no row for job_id
+            ResultPathMissing: result_path null or outside the allowed directory
+        """
         sql = "SELECT * FROM backtest_jobs WHERE job_id = %s"
         with self.pool.connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute(sql, (job_id,))
@@ -71,8 +114,7 @@ class BacktestResultStorage:
         except (OSError, ValueError) as e:
             raise ResultPathMissing(f"job_id {job_id} invalid result_path: {e}") from e
 
-        # Use the resolved target_path to prevent symlink TOCTOU attacks
-        return self._load_result_from_path(target_path, job_row=row)
+        return row, target_path
 
     def list_jobs(
         self,
@@ -291,14 +333,8 @@ class BacktestResultStorage:
         try:
             df = pl.read_parquet(parquet_file)
             # Normalize return column to "return"
-            if return_col != "return" and return_col in df.columns:
-                df = df.select(
-                    pl.col("date"),
-                    pl.col(return_col).alias("return"),
-                )
-            elif "return" in df.columns:
-                df = df.select("date", "return")
-            else:
+            selected = _select_return_column(df, return_col)
+            if selected is None:
                 logger.warning(
                     "portfolio_returns_missing_column",
                     job_id=job_id,
@@ -306,7 +342,7 @@ class BacktestResultStorage:
                     columns=df.columns,
                 )
                 return None
-            return df.sort("date")
+            return selected.sort("date")
         except (pl.exceptions.PolarsError, FileNotFoundError, OSError) as exc:
             logger.warning(
                 "portfolio_returns_read_failed",
@@ -462,6 +498,8 @@ class BacktestResultStorage:
                 """
                 cur.execute(delete_by_ids_sql, (successfully_cleaned_job_ids,))
                 deleted = cur.rowcount
+                for job_id in successfully_cleaned_job_ids:
+                    self.handle_cache.evict(job_id)
             else:
                 deleted = 0
             conn.commit()
@@ -481,66 +519,184 @@ class BacktestResultStorage:
             ResultPathMissing: if path does not exist
             ValueError: if required reproducibility fields are missing
         """
+        return BacktestResultHandle.open(path, job_row=job_row).to_result()
+
+    def _job_to_dict(self, job: Any) -> dict[str, Any]:
+        """
+        Convert a DB row or BacktestJob dataclass to primitive dict for APIs.
+        """
+        # Support dataclass or raw dict_row
+        if isinstance(job, BacktestJob):
+            data = job.__dict__
+        else:
+            data = job
+
+        created_at = data.get("created_at")
+        created_at_iso = created_at.isoformat() if created_at is not None else None
+
+        return {
+            "job_id": data.get("job_id"),
+            "status": data.get("status"),
+            "alpha_name": data.get("alpha_name"),
+            "start_date": str(data.get("start_date")) if data.get("start_date") else None,
+            "end_date": str(data.get("end_date")) if data.get("end_date") else None,
+            "created_by": data.get("created_by"),
+            "created_at": created_at_iso,
+            "mean_ic": data.get("mean_ic"),
+            "icir": data.get("icir"),
+            "hit_rate": data.get("hit_rate"),
+            "coverage": data.get("coverage"),
+            "long_short_spread": data.get("long_short_spread"),
+            "average_turnover": data.get("average_turnover"),
+            "decay_half_life": data.get("decay_half_life"),
+        }
+
+
+@dataclass(frozen=True)
+class _ArtifactSpec:
+    """Parquet artifact of a result directory.
+
+    Required artifacts raise when missing; optional ones fall back to an
+    empty frame with ``empty_schema`` (or None when no schema is given).
+    """
+
+    filename: str
+    required: bool = False
+    empty_schema: dict[str, Any] | None = None
+
+
+RESULT_ARTIFACTS: dict[str, _ArtifactSpec] = {
+    "daily_signals": _ArtifactSpec("daily_signals.parquet", required=True),
+    "daily_weights": _ArtifactSpec("daily_weights.parquet", required=True),
+    "daily_ic": _ArtifactSpec("daily_ic.parquet", required=True),
+    "daily_portfolio_returns": _ArtifactSpec(
+        "daily_portfolio_returns.parquet",
+        empty_schema={"date": pl.Date, "return": pl.Float64},
+    ),
+    "daily_returns": _ArtifactSpec(
+        "daily_returns.parquet",
+        empty_schema={
+            "date": pl.Date,
+            "permno": pl.Int64,
+            "return": pl.Float64,
+            "symbol": pl.Utf8,
+        },
+    ),
+    "daily_prices": _ArtifactSpec(
+        "daily_prices.parquet",
+        empty_schema={
+            "date": pl.Date,
+            "permno": pl.Int64,
+            "price": pl.Float64,
+            "symbol": pl.Utf8,
+        },
+    ),
+    # Only written when a cost model was applied (T9.4)
+    "net_portfolio_returns": _ArtifactSpec("net_portfolio_returns.parquet"),
+}
+
+# Artifacts each result-page tab needs; "summary" needs none beyond summary.json
+TAB_ARTIFACTS: dict[str, tuple[str, ...]] = {
+    "summary": (),
+    "performance": ("net_portfolio_returns", "daily_portfolio_returns"),
+    "ic": ("daily_ic",),
+    "signals": ("daily_signals",),
+    "holdings": ("daily_weights",),
+    "prices": ("daily_prices", "daily_returns"),
+}
+
+RESULT_HANDLE_CACHE_SIZE = 8
+# Budget for artifacts decoded by cached handles (estimated in-memory size)
+RESULT_HANDLE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class BacktestResultOverview:
+    """Result-page header metrics, built without decoding any artifact.
+
+    Field names mirror ``BacktestResult`` so page renderers accept either.
+    """
+
+    backtest_id: str
+    alpha_name: str
+    start_date: date
+    end_date: date
+    snapshot_id: str
+    dataset_version_ids: dict[str, Any]
+    weight_method: str
+    n_days: int
+    n_symbols_avg: float
+    mean_ic: float | None
+    icir: float | None
+    hit_rate: float | None
+    coverage: float | None
+    average_turnover: float | None
+    cost_config: dict[str, Any] | None
+    cost_summary: dict[str, Any] | None
+    capacity_analysis: dict[str, Any] | None
+    has_net_returns: bool
+
+
+class BacktestResultHandle:
+    """Lazy view over a result directory.
+
+    Opening a handle reads only ``summary.json``. Parquet artifacts are
+    scanned on first use and kept for the lifetime of the handle, so a page
+    showing one tab never decodes signals/weights/prices it does not display.
+    Chart series are downsampled server-side to the requested pixel width.
+
+    Example:
+        handle = storage.open_result(job_id)
+        handle.load_tab("performance")
+        equity = handle.equity_curve(width_px=900)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        summary: dict[str, Any],
+        job_row: dict[str, Any] | None = None,
+        summary_stamp: tuple[int, int] | None = None,
+    ) -> None:
+        """Initialize the handle; prefer :meth:`open`.
+
+        Args:
+            path: Resolved result directory.
+            summary: Parsed ``summary.json``.
+            job_row: ``backtest_jobs`` row, if loaded via the DB.
+            summary_stamp: ``(mtime_ns, size)`` of summary.json when read.
+        """
+        self.path = path
+        self.summary = summary
+        self.job_row = job_row or {}
+        self._summary_stamp = summary_stamp
+        self._frames: dict[str, pl.DataFrame | None] = {}
+        self._result: BacktestResult | None = None
+        self._overview: BacktestResultOverview | None = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def open(cls, path: Path, job_row: dict[str, Any] | None = None) -> BacktestResultHandle:
+        """Open a result directory, reading only ``summary.json``.
+
+        Raises:
+            ResultPathMissing: if path does not exist
+            ValueError: if summary.json is missing/corrupt or lacks
+                reproducibility metadata
+        """
         if not path.exists():
             raise ResultPathMissing(f"result_path {path} missing on disk")
 
-        # Read Parquet files and summary.json with robust error handling
+        summary_path = path / "summary.json"
         try:
-            signals = pl.read_parquet(path / "daily_signals.parquet")
-            weights = pl.read_parquet(path / "daily_weights.parquet")
-            ic = pl.read_parquet(path / "daily_ic.parquet")
-            daily_portfolio_returns_path = path / "daily_portfolio_returns.parquet"
-            if daily_portfolio_returns_path.exists():
-                daily_portfolio_returns = pl.read_parquet(daily_portfolio_returns_path)
-            else:
-                daily_portfolio_returns = pl.DataFrame(
-                    schema={"date": pl.Date, "return": pl.Float64}
-                )
-            daily_returns_path = path / "daily_returns.parquet"
-            if daily_returns_path.exists():
-                daily_returns = pl.read_parquet(daily_returns_path)
-            else:
-                daily_returns = pl.DataFrame(
-                    schema={
-                        "date": pl.Date,
-                        "permno": pl.Int64,
-                        "return": pl.Float64,
-                        "symbol": pl.Utf8,
-                    }
-                )
-            daily_prices_path = path / "daily_prices.parquet"
-            if daily_prices_path.exists():
-                daily_prices = pl.read_parquet(daily_prices_path)
-            else:
-                daily_prices = pl.DataFrame(
-                    schema={
-                        "date": pl.Date,
-                        "permno": pl.Int64,
-                        "price": pl.Float64,
-                        "symbol": pl.Utf8,
-                    }
-                )
-
-            # Load net portfolio returns if cost model was applied (T9.4)
-            net_portfolio_returns_path = path / "net_portfolio_returns.parquet"
-            if net_portfolio_returns_path.exists():
-                net_portfolio_returns = pl.read_parquet(net_portfolio_returns_path)
-            else:
-                net_portfolio_returns = None
-
-            summary_path = path / "summary.json"
-            if not summary_path.exists():
-                raise ValueError(
-                    f"Missing summary.json in {path}; cannot reconstruct BacktestResult"
-                )
+            stat = summary_path.stat()
             summary = json.loads(summary_path.read_text())
         except FileNotFoundError as e:
-            raise ValueError(f"Missing backtest artifact in {path}: {e}") from e
+            raise ValueError(
+                f"Missing summary.json in {path}; cannot reconstruct BacktestResult"
+            ) from e
         except json.JSONDecodeError as e:
             raise ValueError(f"Corrupt summary.json in {path}: {e}") from e
-        except pl.exceptions.PolarsError as e:
-            # Catch polars-specific errors during file reading
-            raise ValueError(f"Failed to load Parquet artifact from {path}: {e}") from e
 
         snapshot_id = summary.get("snapshot_id")
         dataset_version_ids = summary.get("dataset_version_ids")
@@ -549,6 +705,244 @@ class BacktestResultStorage:
                 f"Missing reproducibility metadata in {summary_path}: "
                 f"snapshot_id={snapshot_id}, dataset_version_ids={dataset_version_ids}"
             )
+        return cls(path, summary, job_row=job_row, summary_stamp=(stat.st_mtime_ns, stat.st_size))
+
+    @property
+    def job_id(self) -> str:
+        """Job id from the DB row, falling back to the directory name."""
+        return str(self.job_row.get("job_id") or self.path.name)
+
+    @property
+    def loaded_artifacts(self) -> tuple[str, ...]:
+        """Names of artifacts already decoded into memory."""
+        return tuple(self._frames)
+
+    @property
+    def decoded_bytes(self) -> int:
+        """Estimated in-memory size of the decoded artifacts."""
+        # list() snapshots the values without taking the handle lock, which a
+        # concurrent decode may hold for a while
+        frames = list(self._frames.values())
+        return sum(int(df.estimated_size()) for df in frames if df is not None)
+
+    def is_current(self) -> bool:
+        """Whether summary.json is unchanged since the handle was opened."""
+        try:
+            stat = (self.path / "summary.json").stat()
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == self._summary_stamp
+
+    def scan(self, name: str) -> pl.LazyFrame | None:
+        """Lazily scan an artifact without decoding it.
+
+        Returns:
+            LazyFrame, or None if an optional artifact is not on disk.
+
+        Raises:
+            KeyError: unknown artifact name
+            ValueError: required artifact missing
+        """
+        spec = RESULT_ARTIFACTS[name]
+        artifact_path = self.path / spec.filename
+        if not artifact_path.exists():
+            if spec.required:
+                raise ValueError(f"Missing backtest artifact in {self.path}: {spec.filename}")
+            return None
+        return pl.scan_parquet(artifact_path)
+
+    def frame(self, name: str) -> pl.DataFrame | None:
+        """Decode an artifact once and keep it on the handle.
+
+        Missing optional artifacts resolve to an empty frame with the
+        expected schema (None for ``net_portfolio_returns``).
+
+        Raises:
+            KeyError: unknown artifact name
+            ValueError: required artifact missing or unreadable
+        """
+        with self._lock:
+            if name in self._frames:
+                return self._frames[name]
+            spec = RESULT_ARTIFACTS[name]
+            try:
+                lazy = self.scan(name)
+                df = lazy.collect() if lazy is not None else None
+            except FileNotFoundError as e:
+                raise ValueError(f"Missing backtest artifact in {self.path}: {e}") from e
+            except pl.exceptions.PolarsError as e:
+                raise ValueError(f"Failed to load Parquet artifact from {self.path}: {e}") from e
+            if df is None and spec.empty_schema is not None:
+                df = pl.DataFrame(schema=spec.empty_schema)
+            self._frames[name] = df
+            return df
+
+    def load_tab(self, tab: str) -> dict[str, pl.DataFrame | None]:
+        """Decode only the artifacts a result-page tab needs.
+
+        Raises:
+            KeyError: unknown tab (see ``TAB_ARTIFACTS``)
+        """
+        return {name: self.frame(name) for name in TAB_ARTIFACTS[tab]}
+
+    def portfolio_returns(self, basis: str = "net") -> pl.DataFrame | None:
+        """Portfolio return series as ``{date, return}`` sorted by date.
+
+        Returns:
+            DataFrame, or None when the basis is unavailable or empty.
+        """
+        if basis == "net":
+            df = self.frame("net_portfolio_returns")
+            return_col = "net_return"
+        else:
+            df = self.frame("daily_portfolio_returns")
+            return_col = "return"
+        if df is None or df.height == 0:
+            return None
+        selected = _select_return_column(df, return_col)
+        return selected.sort("date") if selected is not None else None
+
+    def equity_curve(
+        self, width_px: int, basis: str = "net", method: DownsampleMethod = "lttb"
+    ) -> pl.DataFrame | None:
+        """Cumulative return ``{date, cumulative_return}`` downsampled to ``width_px``."""
+        returns = self.portfolio_returns(basis)
+        if returns is None:
+            return None
+        equity = _equity(returns).select(
+            "date", (pl.col("equity") - 1.0).alias("cumulative_return")
+        )
+        return downsample(equity, "date", "cumulative_return", width_px, method)
+
+    def drawdown_curve(
+        self, width_px: int, basis: str = "net", method: DownsampleMethod = "minmax"
+    ) -> pl.DataFrame | None:
+        """Drawdown ``{date, drawdown}`` downsampled to ``width_px``.
+
+        Defaults to min/max downsampling so the deepest trough is never dropped.
+        """
+        returns = self.portfolio_returns(basis)
+        if returns is None:
+            return None
+        drawdown = _equity(returns).select(
+            "date", (pl.col("equity") / pl.col("equity").cum_max() - 1.0).alias("drawdown")
+        )
+        return downsample(drawdown, "date", "drawdown", width_px, method)
+
+    def ic_series(
+        self, width_px: int, column: str | None = None, method: DownsampleMethod = "lttb"
+    ) -> pl.DataFrame | None:
+        """Daily IC ``{date, <column>}`` downsampled to ``width_px``.
+
+        Args:
+            width_px: Rendered chart width.
+            column: IC column (default ``rank_ic`` when present, else ``ic``).
+            method: Downsampling method.
+        """
+        ic = self.frame("daily_ic")
+        if ic is None or ic.height == 0:
+            return None
+        column = column or ("rank_ic" if "rank_ic" in ic.columns else "ic")
+        return downsample(ic.select("date", column), "date", column, width_px, method)
+
+    def overview(self) -> BacktestResultOverview:
+        """Header metrics from summary.json, the job row and a signal-count scan.
+
+        Only the ``date`` column of ``daily_signals`` is scanned (for day and
+        symbol counts); no artifact is decoded onto the handle.
+
+        Raises:
+            ValueError: if ``daily_signals`` is missing/unreadable or the
+                backtest period cannot be determined
+        """
+        with self._lock:
+            if self._overview is None:
+                self._overview = self._build_overview()
+            return self._overview
+
+    def _build_overview(self) -> BacktestResultOverview:
+        summary = self.summary
+        job_row = self.job_row
+        try:
+            counts = (
+                cast(pl.LazyFrame, self.scan("daily_signals"))
+                .group_by("date")
+                .len()
+                .select(
+                    pl.len().alias("n_days"),
+                    pl.col("len").mean().alias("n_symbols_avg"),
+                    pl.col("date").min().alias("first_date"),
+                    pl.col("date").max().alias("last_date"),
+                )
+                .collect()
+                .row(0, named=True)
+            )
+        except FileNotFoundError as e:
+            raise ValueError(f"Missing backtest artifact in {self.path}: {e}") from e
+        except pl.exceptions.PolarsError as e:
+            raise ValueError(f"Failed to load Parquet artifact from {self.path}: {e}") from e
+
+        start_date = job_row.get("start_date") or counts["first_date"]
+        end_date = job_row.get("end_date") or counts["last_date"]
+        if start_date is None or end_date is None:
+            raise ValueError(
+                f"Cannot determine start_date/end_date for {self.path}: "
+                f"start_date={start_date}, end_date={end_date}"
+            )
+
+        def metric(key: str) -> float | None:
+            # summary.json is authoritative (None there is a sanitized NaN)
+            if key in summary:
+                return _restore_float(summary[key])
+            value = job_row.get(key)
+            return float(value) if value is not None else None
+
+        return BacktestResultOverview(
+            backtest_id=self.job_id,
+            alpha_name=job_row.get("alpha_name", "unknown"),
+            start_date=cast(date, start_date),
+            end_date=cast(date, end_date),
+            snapshot_id=summary["snapshot_id"],
+            dataset_version_ids=summary["dataset_version_ids"],
+            weight_method=job_row.get("weight_method", "zscore"),
+            n_days=counts["n_days"] or 0,
+            n_symbols_avg=counts["n_symbols_avg"] or 0.0,
+            mean_ic=metric("mean_ic"),
+            icir=metric("icir"),
+            hit_rate=metric("hit_rate"),
+            coverage=metric("coverage"),
+            average_turnover=metric("average_turnover"),
+            cost_config=summary.get("cost_config"),
+            cost_summary=summary.get("cost_summary"),
+            capacity_analysis=summary.get("capacity_analysis"),
+            has_net_returns=(
+                self.path / RESULT_ARTIFACTS["net_portfolio_returns"].filename
+            ).exists(),
+        )
+
+    def to_result(self) -> BacktestResult:
+        """Materialize the full BacktestResult (all artifacts), cached on the handle.
+
+        Raises:
+            ValueError: if a required artifact is missing/unreadable or the
+                backtest period cannot be determined
+        """
+        with self._lock:
+            if self._result is None:
+                self._result = self._build_result()
+            return self._result
+
+    def _build_result(self) -> BacktestResult:
+        signals = cast(pl.DataFrame, self.frame("daily_signals"))
+        weights = cast(pl.DataFrame, self.frame("daily_weights"))
+        ic = cast(pl.DataFrame, self.frame("daily_ic"))
+        daily_portfolio_returns = cast(pl.DataFrame, self.frame("daily_portfolio_returns"))
+        daily_returns = cast(pl.DataFrame, self.frame("daily_returns"))
+        daily_prices = cast(pl.DataFrame, self.frame("daily_prices"))
+        net_portfolio_returns = self.frame("net_portfolio_returns")
+        summary = self.summary
+        job_row = self.job_row
+        path = self.path
 
         # Restore NaN-sanitized metrics (None in JSON → NaN in domain).
         # Only recompute when the key is missing entirely (legacy summaries),
@@ -572,13 +966,13 @@ class BacktestResultStorage:
             hit_rate = 0.0
 
         # Metadata from DB row where available
-        alpha_name = (job_row or {}).get("alpha_name", "unknown")
-        backtest_id = (job_row or {}).get("job_id") or path.name
-        start_date = (job_row or {}).get("start_date")
-        end_date = (job_row or {}).get("end_date")
-        weight_method = (job_row or {}).get("weight_method", "zscore")
+        alpha_name = job_row.get("alpha_name", "unknown")
+        backtest_id = job_row.get("job_id") or path.name
+        start_date = job_row.get("start_date")
+        end_date = job_row.get("end_date")
+        weight_method = job_row.get("weight_method", "zscore")
 
-        coverage = (job_row or {}).get("coverage")
+        coverage = job_row.get("coverage")
         if coverage is None:
             coverage_df = (
                 signals.group_by("date")
@@ -592,12 +986,12 @@ class BacktestResultStorage:
             )
             coverage = coverage_df.select(pl.col("daily_cov").mean()).item() or 0.0
 
-        long_short_spread = (job_row or {}).get("long_short_spread")
+        long_short_spread = job_row.get("long_short_spread")
         if long_short_spread is None:
             # Use 0.0 instead of NaN to ensure JSON serialization compatibility
             long_short_spread = 0.0
 
-        decay_half_life = (job_row or {}).get("decay_half_life")
+        decay_half_life = job_row.get("decay_half_life")
 
         turnover_calc = TurnoverCalculator()
         turnover_result: TurnoverResult = turnover_calc.compute_turnover_result(weights)
@@ -633,8 +1027,8 @@ class BacktestResultStorage:
             backtest_id=str(backtest_id),
             start_date=cast(date, start_date),
             end_date=cast(date, end_date),
-            snapshot_id=snapshot_id,
-            dataset_version_ids=dataset_version_ids,
+            snapshot_id=summary["snapshot_id"],
+            dataset_version_ids=summary["dataset_version_ids"],
             daily_signals=signals,
             daily_ic=ic,
             mean_ic=mean_ic,
@@ -659,35 +1053,103 @@ class BacktestResultStorage:
             net_portfolio_returns=net_portfolio_returns,
         )
 
-    def _job_to_dict(self, job: Any) -> dict[str, Any]:
-        """
-        Convert a DB row or BacktestJob dataclass to primitive dict for APIs.
+
+class ResultHandleCache:
+    """Thread-safe LRU of recently opened result handles, keyed by job_id.
+
+    Re-opening a recently viewed result reuses its decoded artifacts. A hit
+    is only served while the handle still points at the job's current
+    result_path and its summary.json is unchanged.
+
+    Handles decode artifacts after they are cached, so the byte budget is
+    re-checked on every get/put: least recently used handles are dropped
+    until the decoded artifacts of the rest fit in ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = RESULT_HANDLE_CACHE_SIZE,
+        max_bytes: int = RESULT_HANDLE_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache bounded by handle count and decoded bytes."""
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._handles: OrderedDict[str, BacktestResultHandle] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def get(self, job_id: str, path: Path) -> BacktestResultHandle | None:
+        """Return the cached handle for ``job_id`` if still valid for ``path``."""
+        with self._lock:
+            handle = self._handles.get(job_id)
+            if handle is None:
+                return None
+            if handle.path != path or not handle.is_current():
+                del self._handles[job_id]
+                return None
+            self._handles.move_to_end(job_id)
+            self._enforce_budget(keep=job_id)
+            return handle
+
+    def put(self, job_id: str, handle: BacktestResultHandle) -> None:
+        """Insert ``handle``, evicting the least recently used beyond ``maxsize``."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._handles[job_id] = handle
+            self._handles.move_to_end(job_id)
+            self._enforce_budget()
+
+    def _enforce_budget(self, keep: str | None = None) -> None:
+        """Evict LRU handles beyond ``maxsize`` or ``max_bytes`` (lock held).
+
+        ``keep`` (the handle just served) survives the byte check so a hit
+        is not evicted by its own decoded artifacts; it is still dropped when
+        it alone exceeds the budget.
         """
-        # Support dataclass or raw dict_row
-        if isinstance(job, BacktestJob):
-            data = job.__dict__
-        else:
-            data = job
+        while len(self._handles) > self.maxsize:
+            self._handles.popitem(last=False)
+        sizes = {job_id: handle.decoded_bytes for job_id, handle in self._handles.items()}
+        total = sum(sizes.values())
+        for job_id, size in sizes.items():
+            if total <= self.max_bytes:
+                break
+            if job_id == keep and size <= self.max_bytes:
+                continue
+            del self._handles[job_id]
+            total -= size
 
-        created_at = data.get("created_at")
-        created_at_iso = created_at.isoformat() if created_at is not None else None
+    def evict(self, job_id: str) -> None:
+        """Drop ``job_id`` if cached."""
+        with self._lock:
+            self._handles.pop(job_id, None)
 
-        return {
-            "job_id": data.get("job_id"),
-            "status": data.get("status"),
-            "alpha_name": data.get("alpha_name"),
-            "start_date": str(data.get("start_date")) if data.get("start_date") else None,
-            "end_date": str(data.get("end_date")) if data.get("end_date") else None,
-            "created_by": data.get("created_by"),
-            "created_at": created_at_iso,
-            "mean_ic": data.get("mean_ic"),
-            "icir": data.get("icir"),
-            "hit_rate": data.get("hit_rate"),
-            "coverage": data.get("coverage"),
-            "long_short_spread": data.get("long_short_spread"),
-            "average_turnover": data.get("average_turnover"),
-            "decay_half_life": data.get("decay_half_life"),
-        }
+    def clear(self) -> None:
+        """Drop all handles."""
+        with self._lock:
+            self._handles.clear()
+
+
+# Shared across storage instances: pages construct a storage per request
+_RESULT_HANDLE_CACHE = ResultHandleCache()
+
+
+def _select_return_column(df: pl.DataFrame, return_col: str) -> pl.DataFrame | None:
+    """Normalize a portfolio return frame to ``{date, return}`` (None if absent)."""
+    if return_col != "return" and return_col in df.columns:
+        return df.select(pl.col("date"), pl.col(return_col).alias("return"))
+    if "return" in df.columns:
+        return df.select("date", "return")
+    return None
+
+
+def _equity(returns: pl.DataFrame) -> pl.DataFrame:
+    """Compounded equity (starting at 1.0) from finite ``{date, return}`` rows."""
+    return returns.filter(pl.col("return").is_finite()).with_columns(
+        (1.0 + pl.col("return")).cum_prod().alias("equity")
+    )
 
 
 def _sanitize_float(value: Any) -> Any:
@@ -804,8 +1266,13 @@ def serialize_param_search(result: SearchResult) -> dict[str, Any]:
 
 
 __all__ = [
+    "BacktestResultHandle",
+    "BacktestResultOverview",
     "BacktestResultStorage",
     "PARQUET_BASE_DIR",
+    "RESULT_ARTIFACTS",
+    "ResultHandleCache",
+    "TAB_ARTIFACTS",
     "serialize_walk_forward",
     "serialize_param_search",
 ]
@@ -0,0 +1,170 @@
+"""Warm backtest worker mode: preload snapshot datasets before forking jobs.
+
+RQ forks a fresh work-horse for every job. In warm mode the long-lived
+worker parent decodes the active CRSP / Alpaca SIP manifests into the
+process-wide SnapshotMemoryStore (Arrow IPC memory-mapped from tmpfs) once,
+and re-checks the manifests before each fork. Children inherit the mapped
+tables copy-on-write, so local providers in ``run_backtest`` skip Parquet
+decoding entirely and short jobs start without any data-loading cost.
+
+This module provides:
+- SnapshotPreloader: Loads/evicts preloaded datasets as manifests change
+- PreloadingWorker: RQ worker that refreshes the preload before each fork
+- parse_preload_datasets: Parse the ``BACKTEST_WORKER_PRELOAD`` setting
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import structlog
+from rq import Queue, Worker
+from rq.job import Job
+
+from libs.data.data_providers.alpaca_sip_local_provider import AlpacaSIPLocalProvider
+from libs.data.data_providers.crsp_local_provider import CRSPLocalProvider
+from libs.data.data_providers.snapshot_memory_store import SnapshotMemoryStore
+from libs.data.data_quality.manifest import ManifestManager, SyncManifest
+from libs.trading.backtest.worker import alpaca_sip_storage_path
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_PRELOAD_DATASETS = (CRSPLocalProvider.DATASET_NAME, AlpacaSIPLocalProvider.DATASET_NAME)
+_ENABLED_VALUES = frozenset({"1", "true", "yes", "on", "all"})
+_DISABLED_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+
+def parse_preload_datasets(value: str | None) -> tuple[str, ...]:
+    """Parse ``BACKTEST_WORKER_PRELOAD`` into dataset names.
+
+    Accepts a boolean flag (enables all supported datasets) or a
+    comma-separated list of dataset names.
+
+    Args:
+        value: Raw environment value (None or empty disables preloading).
+
+    Returns:
+        Dataset names to preload (empty when disabled).
+
+    Raises:
+        ValueError: If an unsupported dataset name is listed.
+    """
+    normalized = (value or "").strip().lower()
+    if normalized in _DISABLED_VALUES:
+        return ()
+    if normalized in _ENABLED_VALUES:
+        return DEFAULT_PRELOAD_DATASETS
+
+    datasets = tuple(dict.fromkeys(name.strip() for name in normalized.split(",") if name.strip()))
+    unknown = sorted(set(datasets) - set(DEFAULT_PRELOAD_DATASETS))
+    if unknown:
+        raise ValueError(
+            f"Unsupported preload datasets: {unknown}. Supported: {list(DEFAULT_PRELOAD_DATASETS)}"
+        )
+    return datasets
+
+
+class SnapshotPreloader:
+    """Keeps the store in sync with the active manifest of each dataset.
+
+    Paths are resolved through the same provider logic ``run_backtest``
+    uses, so the store serves exactly the partitions jobs would read.
+
+    Example:
+        preloader = SnapshotPreloader(data_root, DEFAULT_PRELOAD_DATASETS, store)
+        preloader.refresh()
+    """
+
+    def __init__(
+        self,
+        data_root: Path,
+        datasets: Iterable[str],
+        store: SnapshotMemoryStore,
+    ) -> None:
+        """Initialize the preloader.
+
+        Args:
+            data_root: Resolved data root (``DATA_ROOT``).
+            datasets: Dataset names from ``DEFAULT_PRELOAD_DATASETS``.
+            store: Store owned by this (parent) process.
+        """
+        self.data_root = data_root
+        self.datasets = tuple(datasets)
+        self.store = store
+        self._resolvers: dict[str, Callable[[ManifestManager, SyncManifest], list[Path]]] = {
+            CRSPLocalProvider.DATASET_NAME: self._crsp_paths,
+            AlpacaSIPLocalProvider.DATASET_NAME: self._alpaca_sip_paths,
+        }
+
+    def refresh(self) -> list[str]:
+        """Reload datasets whose manifest changed; evict those without one.
+
+        Failures are logged and the dataset evicted, so jobs fall back to
+        Parquet reads rather than failing.
+
+        Returns:
+            Names of datasets that were (re)loaded.
+        """
+        manifest_manager = ManifestManager(data_root=self.data_root)
+        reloaded: list[str] = []
+        for dataset in self.datasets:
+            try:
+                manifest = manifest_manager.load_manifest(dataset)
+                if manifest is None:
+                    self.store.evict(dataset)
+                    continue
+                paths = self._resolvers[dataset](manifest_manager, manifest)
+                if self.store.load(dataset, manifest, paths):
+                    reloaded.append(dataset)
+            except Exception as exc:
+                logger.warning("snapshot_preload_failed", dataset=dataset, error=str(exc))
+                self.store.evict(dataset)
+        if reloaded:
+            logger.info(
+                "snapshot_preload_refreshed",
+                datasets=reloaded,
+                loaded=self.store.datasets,
+                bytes=self.store.nbytes,
+            )
+        return reloaded
+
+    def _crsp_paths(self, manifest_manager: ManifestManager, manifest: SyncManifest) -> list[Path]:
+        provider = CRSPLocalProvider(
+            self.data_root / "wrds" / "crsp" / "daily",
+            manifest_manager,
+            data_root=self.data_root,
+        )
+        return provider.get_manifest_paths(manifest)
+
+    def _alpaca_sip_paths(
+        self, manifest_manager: ManifestManager, manifest: SyncManifest
+    ) -> list[Path]:
+        with AlpacaSIPLocalProvider(
+            storage_path=alpaca_sip_storage_path(self.data_root),
+            manifest_manager=manifest_manager,
+            data_root=self.data_root,
+            pinned_manifest=manifest,
+        ) as provider:
+            return provider.get_manifest_paths(manifest)
+
+
+class PreloadingWorker(Worker):
+    """RQ worker that refreshes the snapshot preload before forking each job."""
+
+    def __init__(self, *args: Any, preloader: SnapshotPreloader, **kwargs: Any) -> None:
+        """Initialize the worker.
+
+        Args:
+            *args: Positional arguments for ``rq.Worker``.
+            preloader: Preloader whose store the forked jobs inherit.
+            **kwargs: Keyword arguments for ``rq.Worker``.
+        """
+        super().__init__(*args, **kwargs)
+        self.preloader = preloader
+
+    def execute_job(self, job: Job, queue: Queue) -> None:
+        """Refresh the preload in the parent, then fork the work-horse."""
+        self.preloader.refresh()
+        super().execute_job(job, queue)
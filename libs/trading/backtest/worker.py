@@ -160,6 +160,15 @@ def _validate_hybrid_start_date(start_date: date) -> None:
         )
 
 
+def alpaca_sip_storage_path(data_root: Path) -> Path:
+    """Resolve the Alpaca SIP daily storage directory (env override or data_root default)."""
+    alpaca_env_path = (
+        os.getenv("ALPACA_SIP_DATA_DIR", "").strip()
+        or os.getenv("ALPACA_SIP_STORAGE_PATH", "").strip()
+    )
+    return Path(alpaca_env_path) if alpaca_env_path else data_root / "alpaca" / "sip" / "daily"
+
+
 def _load_alpaca_sip_manifest(manifest_manager: ManifestManager) -> SyncManifest:
     """Load the exact Alpaca SIP manifest to pin for one backtest."""
     manifest = manifest_manager.load_manifest(AlpacaSIPLocalProvider.DATASET_NAME)
@@ -865,15 +874,7 @@ def run_backtest(config: dict[str, Any], created_by: str) -> dict[str, Any]:
                     )
                     fetcher = UnifiedDataFetcher(fetcher_config, yfinance_provider=yf_provider)
                 elif job_config.provider == DataProvider.ALPACA_SIP:
-                    alpaca_env_path = (
-                        os.getenv("ALPACA_SIP_DATA_DIR", "").strip()
-                        or os.getenv("ALPACA_SIP_STORAGE_PATH", "").strip()
-                    )
-                    alpaca_storage = (
-                        Path(alpaca_env_path)
-                        if alpaca_env_path
-                        else data_root / "alpaca" / "sip" / "daily"
-                    )
+                    alpaca_storage = alpaca_sip_storage_path(data_root)
                     manifest_manager = ManifestManager(data_root=data_root)
                     alpaca_manifest = _load_alpaca_sip_manifest(manifest_manager)
                     simple_dataset_version_ids = _alpaca_sip_dataset_version_ids(alpaca_manifest)
@@ -896,15 +897,7 @@ def run_backtest(config: dict[str, Any], created_by: str) -> dict[str, Any]:
                         alpaca_sip_provider=alpaca_provider,
                     )
                 else:
-                    alpaca_env_path = (
-                        os.getenv("ALPACA_SIP_DATA_DIR", "").strip()
-                        or os.getenv("ALPACA_SIP_STORAGE_PATH", "").strip()
-                    )
-                    alpaca_storage = (
-                        Path(alpaca_env_path)
-                        if alpaca_env_path
-                        else data_root / "alpaca" / "sip" / "daily"
-                    )
+                    alpaca_storage = alpaca_sip_storage_path(data_root)
                     manifest_manager = ManifestManager(data_root=data_root)
                     alpaca_manifest = _load_alpaca_sip_manifest(manifest_manager)
                     simple_dataset_version_ids = _hybrid_sip_dataset_version_ids(
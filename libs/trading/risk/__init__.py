@@ -5,6 +5,7 @@ This module provides:
 - FactorCovarianceEstimator: Estimate factor covariance matrices
 - SpecificRiskEstimator: Estimate stock-level idiosyncratic risk
 - BarraRiskModel: Barra-style multi-factor risk model
+- CompiledRiskModel: Memory-mappable aligned-array risk model artifact
 - RiskDecomposer: Portfolio risk decomposition with MCTR/CCTR
 - PortfolioOptimizer: Mean-variance optimization with constraints
 - StressTester: Historical and hypothetical stress testing
@@ -18,6 +19,11 @@ from libs.trading.risk.barra_model import (
     BarraRiskModelConfig,
     InsufficientCoverageError,
 )
+from libs.trading.risk.compiled_model import (
+    CompiledRiskModel,
+    RiskArtifactError,
+    risk_artifacts_dir,
+)
 from libs.trading.risk.factor_covariance import (
     CANONICAL_FACTOR_ORDER,
     CovarianceConfig,
@@ -98,6 +104,10 @@ __all__ = [
     "BarraRiskModel",
     "BarraRiskModelConfig",
     "InsufficientCoverageError",
+    # Compiled Risk Model
+    "CompiledRiskModel",
+    "RiskArtifactError",
+    "risk_artifacts_dir",
     # Risk Decomposition
     "PortfolioRiskResult",
     "FactorContribution",
@@ -21,12 +21,14 @@ import logging
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import polars as pl
 from numpy.typing import NDArray
 
+from libs.trading.risk.compiled_model import CompiledRiskModel, risk_artifacts_dir
 from libs.trading.risk.factor_covariance import (
     CANONICAL_FACTOR_ORDER,
     CovarianceResult,
@@ -86,6 +88,7 @@ class BarraRiskModel:
     dataset_version_ids: dict[str, str]
     config: BarraRiskModelConfig = field(default_factory=BarraRiskModelConfig)
     model_version: str = "barra_v1.0"
+    _compiled: CompiledRiskModel | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_t22_results(
@@ -94,6 +97,7 @@ class BarraRiskModel:
         specific_risk_result: SpecificRiskResult,
         factor_loadings: pl.DataFrame,
         config: BarraRiskModelConfig | None = None,
+        artifacts_dir: Path | str | None = None,
     ) -> "BarraRiskModel":
         """
         Factory method to create from T2.2 outputs.
@@ -105,6 +109,8 @@ class BarraRiskModel:
                 Can be either long format (permno, factor_name, zscore) or
                 wide format (permno, momentum_12_1, book_to_market, ...)
             config: Optional configuration override
+            artifacts_dir: If given, publish the compiled model there (see
+                publish(); pass risk_artifacts_dir() for the web console)
 
         Returns:
             BarraRiskModel instance ready for portfolio risk computation
@@ -144,7 +150,7 @@ class BarraRiskModel:
             "factor_loadings": loadings_hash,
         }
 
-        return cls(
+        model = cls(
             factor_covariance=covariance_result.factor_covariance,
             factor_names=covariance_result.factor_names.copy(),
             factor_loadings=loadings_wide,
@@ -153,6 +159,96 @@ class BarraRiskModel:
             dataset_version_ids=version_ids,
             config=config,
         )
+        if artifacts_dir is not None:
+            model.publish(artifacts_dir)
+        return model
+
+    @classmethod
+    def from_compiled(
+        cls,
+        compiled: CompiledRiskModel,
+        config: BarraRiskModelConfig | None = None,
+    ) -> "BarraRiskModel":
+        """
+        Create model backed by a compiled (typically memory-mapped) artifact.
+
+        Risk queries use the artifact arrays directly; the Polars frames are
+        materialized only for validation and API compatibility.
+
+        Args:
+            compiled: CompiledRiskModel, e.g. from CompiledRiskModel.load()
+            config: Optional configuration override
+
+        Returns:
+            BarraRiskModel sharing the artifact's arrays
+        """
+        loadings_rows = compiled.has_loadings
+        specific_rows = compiled.has_specific
+        factor_loadings = pl.DataFrame(
+            {
+                "permno": compiled.permnos[loadings_rows],
+                **{
+                    name: compiled.factor_loadings[loadings_rows, k]
+                    for k, name in enumerate(compiled.factor_names)
+                },
+            }
+        )
+        specific_risks = pl.DataFrame(
+            {
+                "permno": compiled.permnos[specific_rows],
+                "specific_variance": compiled.specific_variances[specific_rows],
+            }
+        )
+
+        model = cls(
+            factor_covariance=compiled.factor_covariance,
+            factor_names=list(compiled.factor_names),
+            factor_loadings=factor_loadings,
+            specific_risks=specific_risks,
+            as_of_date=compiled.as_of_date,
+            dataset_version_ids=dict(compiled.dataset_version_ids),
+            config=config or BarraRiskModelConfig(),
+            model_version=compiled.model_version,
+        )
+        model._compiled = compiled
+        return model
+
+    def compile(self) -> CompiledRiskModel:
+        """
+        Get aligned array view of this model, compiling it on first use.
+
+        The model is treated as immutable after construction; the compiled
+        view is cached and shared by every risk query on this instance.
+
+        Returns:
+            CompiledRiskModel (save() it to share across processes)
+        """
+        if self._compiled is None:
+            self._compiled = CompiledRiskModel.compile(
+                factor_covariance=self.factor_covariance,
+                factor_names=self.factor_names,
+                factor_loadings=self.factor_loadings,
+                specific_risks=self.specific_risks,
+                as_of_date=self.as_of_date,
+                model_version=self.model_version,
+                dataset_version_ids=self.dataset_version_ids,
+            )
+        return self._compiled
+
+    def publish(self, artifacts_dir: Path | str | None = None) -> Path:
+        """
+        Compile and save this model for other processes to memory-map.
+
+        Args:
+            artifacts_dir: Artifact root (defaults to risk_artifacts_dir(),
+                which RiskService loads the latest model from)
+
+        Returns:
+            Path to the published artifact directory
+        """
+        return self.compile().save(
+            artifacts_dir if artifacts_dir is not None else risk_artifacts_dir()
+        )
 
     def check_coverage(self, portfolio: pl.DataFrame) -> tuple[float, list[int], pl.DataFrame]:
         """
@@ -167,16 +263,13 @@ class BarraRiskModel:
             - missing_permnos: List of permnos without risk data
             - covered_portfolio: Portfolio filtered to covered permnos
         """
-        portfolio_permnos = set(portfolio["permno"].to_list())
-        loadings_permnos = set(self.factor_loadings["permno"].to_list())
-        specific_permnos = set(self.specific_risks["permno"].to_list())
-
         # Permnos with both factor loadings and specific risk
-        covered_permnos = portfolio_permnos & loadings_permnos & specific_permnos
-        missing_permnos = list(portfolio_permnos - covered_permnos)
+        permnos = portfolio["permno"].to_numpy()
+        covered_mask = self.compile().lookup(permnos) >= 0
+        missing_permnos = list(set(permnos[~covered_mask].tolist()))
 
         # Filter portfolio to covered permnos
-        covered_portfolio = portfolio.filter(pl.col("permno").is_in(list(covered_permnos)))
+        covered_portfolio = portfolio.filter(pl.Series(covered_mask))
 
         # Compute coverage as sum of ABSOLUTE weights
         # This handles long/short and dollar-neutral portfolios correctly
@@ -485,21 +578,16 @@ class BarraRiskModel:
             - factor_matrix: N×K factor loadings matrix
             - specific_variances: N×1 specific variance vector
         """
-        # Join portfolio with factor loadings and specific risks
-        joined = (
-            portfolio.select(["permno", "weight"])
-            .join(self.factor_loadings, on="permno", how="inner")
-            .join(
-                self.specific_risks.select(["permno", "specific_variance"]),
-                on="permno",
-                how="inner",
-            )
-        )
+        # Look up compiled rows (no per-call joins)
+        compiled = self.compile()
+        rows = compiled.lookup(portfolio["permno"].to_numpy())
+        covered = rows >= 0
+        rows = rows[covered]
 
         # Extract arrays
-        weights = joined["weight"].to_numpy().astype(np.float64)
-        factor_matrix = joined.select(self.factor_names).to_numpy().astype(np.float64)
-        specific_variances = joined["specific_variance"].to_numpy().astype(np.float64)
+        weights = portfolio["weight"].to_numpy().astype(np.float64)[covered]
+        factor_matrix = compiled.factor_loadings[rows]
+        specific_variances = compiled.specific_variances[rows]
 
         # Ensure no negative specific variances (should be floored by T2.2)
         specific_variances = np.maximum(specific_variances, 1e-10)
@@ -0,0 +1,378 @@
+"""
+Compiled, memory-mappable risk model artifact.
+
+BarraRiskModel keeps factor loadings and specific risks as Polars frames,
+which every risk query used to re-join and convert to NumPy. This module
+compiles those frames once per model version into aligned float64 arrays
+with a sorted permno index, and persists them as ``.npy`` files that any
+number of processes can memory-map read-only.
+
+This module provides:
+- CompiledRiskModel: Aligned arrays + permno index for O(log N) lookups
+- RiskArtifactError: Raised for invalid or corrupt artifacts
+- risk_artifacts_dir: Where artifacts are published under the data root
+
+Artifact layout:
+    {root_dir}/{artifact_key}/metadata.json
+    {root_dir}/{artifact_key}/permnos.npy             # int64, sorted unique
+    {root_dir}/{artifact_key}/factor_loadings.npy     # float64 N×K (Fortran order)
+    {root_dir}/{artifact_key}/specific_variances.npy  # float64 N (raw, unfloored)
+    {root_dir}/{artifact_key}/has_loadings.npy        # bool N
+    {root_dir}/{artifact_key}/has_specific.npy        # bool N
+    {root_dir}/{artifact_key}/factor_covariance.npy   # float64 K×K
+
+Rows cover the union of permnos with loadings or specific risk; the
+``has_*`` masks record which inputs each row actually had, so consumers
+keep their existing coverage semantics.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+from numpy.typing import ArrayLike, NDArray
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 1
+
+# Compiled artifacts live under the data root (DATA_ROOT)
+RISK_ARTIFACTS_SUBDIR = Path("artifacts") / "risk"
+
+_ARRAY_FILES = (
+    "permnos",
+    "factor_loadings",
+    "specific_variances",
+    "has_loadings",
+    "has_specific",
+    "factor_covariance",
+)
+
+
+class RiskArtifactError(Exception):
+    """Raised when a compiled risk model artifact is invalid or corrupt."""
+
+    pass
+
+
+def risk_artifacts_dir(data_root: Path | str | None = None) -> Path:
+    """
+    Root directory compiled risk models are published to and loaded from.
+
+    Args:
+        data_root: Data root directory (defaults to ``DATA_ROOT``, else ``data``)
+
+    Returns:
+        Resolved ``{data_root}/artifacts/risk`` path
+    """
+    root = Path(data_root) if data_root is not None else Path(os.getenv("DATA_ROOT", "data"))
+    return (root / RISK_ARTIFACTS_SUBDIR).resolve()
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist directory entries (renames) where the platform supports it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@dataclass(frozen=True)
+class CompiledRiskModel:
+    """
+    Aligned NumPy view of a Barra risk model.
+
+    Arrays are read-only once loaded from disk (np.memmap with mode 'r'),
+    so a single page-cache copy is shared by every worker process.
+    """
+
+    permnos: NDArray[np.int64]  # N, sorted unique
+    factor_loadings: NDArray[np.float64]  # N×K in factor_names order
+    specific_variances: NDArray[np.float64]  # N, daily (NaN where missing)
+    has_loadings: NDArray[np.bool_]  # N
+    has_specific: NDArray[np.bool_]  # N
+    factor_covariance: NDArray[np.float64]  # K×K, daily
+    factor_names: list[str]
+    as_of_date: date
+    model_version: str
+    dataset_version_ids: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def compile(
+        cls,
+        factor_covariance: NDArray[np.floating[Any]],
+        factor_names: Sequence[str],
+        factor_loadings: pl.DataFrame,
+        specific_risks: pl.DataFrame,
+        as_of_date: date,
+        model_version: str,
+        dataset_version_ids: dict[str, str],
+    ) -> "CompiledRiskModel":
+        """
+        Align loadings and specific risks into a single permno-indexed layout.
+
+        Args:
+            factor_covariance: K×K factor covariance (daily)
+            factor_names: Factor names in covariance order
+            factor_loadings: Wide loadings (permno + one column per factor)
+            specific_risks: DataFrame with permno, specific_variance
+            as_of_date: Model as-of date
+            model_version: Model version string
+            dataset_version_ids: Provenance version IDs
+
+        Returns:
+            CompiledRiskModel with in-memory arrays
+
+        Raises:
+            RiskArtifactError: If factor columns are missing or permnos repeat
+        """
+        factor_names = list(factor_names)
+        missing = [f for f in factor_names if f not in factor_loadings.columns]
+        if missing:
+            raise RiskArtifactError(f"Factor loadings missing columns: {missing}")
+
+        loadings = factor_loadings.select(
+            pl.col("permno").cast(pl.Int64),
+            *[pl.col(f).cast(pl.Float64) for f in factor_names],
+        )
+        specific = specific_risks.select(
+            pl.col("permno").cast(pl.Int64),
+            pl.col("specific_variance").cast(pl.Float64),
+        )
+        for name, frame in (("factor_loadings", loadings), ("specific_risks", specific)):
+            if frame["permno"].is_duplicated().any():
+                raise RiskArtifactError(f"{name} contains duplicate permnos")
+
+        joined = (
+            loadings.with_columns(pl.lit(True).alias("_has_loadings"))
+            .join(
+                specific.with_columns(pl.lit(True).alias("_has_specific")),
+                on="permno",
+                how="full",
+                coalesce=True,
+            )
+            .sort("permno")
+        )
+
+        return cls(
+            permnos=joined["permno"].to_numpy().astype(np.int64),
+            factor_loadings=np.asfortranarray(
+                joined.select(factor_names).to_numpy().astype(np.float64)
+            ),
+            specific_variances=joined["specific_variance"]
+            .fill_null(np.nan)
+            .to_numpy()
+            .astype(np.float64),
+            has_loadings=joined["_has_loadings"].fill_null(False).to_numpy().astype(np.bool_),
+            has_specific=joined["_has_specific"].fill_null(False).to_numpy().astype(np.bool_),
+            factor_covariance=np.ascontiguousarray(factor_covariance, dtype=np.float64),
+            factor_names=factor_names,
+            as_of_date=as_of_date,
+            model_version=model_version,
+            dataset_version_ids=dict(dataset_version_ids),
+        )
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    @property
+    def artifact_key(self) -> str:
+        """Deterministic key for this model version (used as directory name)."""
+        version_str = "|".join(f"{k}:{v}" for k, v in sorted(self.dataset_version_ids.items()))
+        digest = hashlib.sha256(
+            f"{self.model_version}#{self.as_of_date.isoformat()}#{version_str}#"
+            f"{','.join(self.factor_names)}".encode()
+        ).hexdigest()
+        return f"risk_{digest[:24]}"
+
+    def lookup(
+        self,
+        permnos: ArrayLike,
+        require_loadings: bool = True,
+        require_specific: bool = True,
+    ) -> NDArray[np.int64]:
+        """
+        Map permnos to artifact rows.
+
+        Args:
+            permnos: Permnos to look up (any order, duplicates allowed)
+            require_loadings: Treat permnos without factor loadings as missing
+            require_specific: Treat permnos without specific risk as missing
+
+        Returns:
+            Row index per input permno, -1 where missing/not covered
+        """
+        query = np.asarray(permnos, dtype=np.int64)
+        if self.permnos.size == 0 or query.size == 0:
+            return np.full(query.shape, -1, dtype=np.int64)
+
+        idx = np.searchsorted(self.permnos, query)
+        idx_clipped = np.minimum(idx, self.permnos.size - 1)
+        found = self.permnos[idx_clipped] == query
+        if require_loadings:
+            found &= self.has_loadings[idx_clipped]
+        if require_specific:
+            found &= self.has_specific[idx_clipped]
+        return np.where(found, idx_clipped, -1).astype(np.int64)
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, root_dir: Path | str) -> Path:
+        """
+        Persist artifact under ``root_dir/artifact_key``.
+
+        Artifacts are immutable per key: if the directory already exists it
+        is returned unchanged. The directory is staged under a temp name and
+        renamed into place so readers never observe a partial artifact.
+
+        Args:
+            root_dir: Root directory for compiled artifacts
+
+        Returns:
+            Path to the artifact directory
+        """
+        root = Path(root_dir)
+        root.mkdir(parents=True, exist_ok=True)
+        target = root / self.artifact_key
+        if target.exists():
+            return target
+
+        staging = Path(tempfile.mkdtemp(dir=root, prefix=".tmp_"))
+        try:
+            for name in _ARRAY_FILES:
+                with open(staging / f"{name}.npy", "wb") as f:
+                    np.save(f, getattr(self, name), allow_pickle=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+            metadata = {
+                "format_version": ARTIFACT_FORMAT_VERSION,
+                "factor_names": self.factor_names,
+                "as_of_date": self.as_of_date.isoformat(),
+                "model_version": self.model_version,
+                "dataset_version_ids": self.dataset_version_ids,
+                "n_permnos": int(self.permnos.size),
+            }
+            with open(staging / "metadata.json", "w") as f:
+                json.dump(metadata, f, indent=2, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            _fsync_directory(staging)
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Another process published the same key first
+                if not target.exists():
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+            else:
+                _fsync_directory(root)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        logger.info(
+            "Saved compiled risk model",
+            extra={"path": str(target), "n_permnos": int(self.permnos.size)},
+        )
+        return target
+
+    @classmethod
+    def load(cls, path: Path | str, mmap: bool = True) -> "CompiledRiskModel":
+        """
+        Load artifact, memory-mapping arrays read-only by default.
+
+        Args:
+            path: Artifact directory (as returned by save)
+            mmap: Memory-map arrays (shared page cache) instead of reading them
+
+        Returns:
+            CompiledRiskModel backed by read-only arrays
+
+        Raises:
+            RiskArtifactError: If metadata/arrays are missing or inconsistent
+        """
+        artifact_dir = Path(path)
+        try:
+            with open(artifact_dir / "metadata.json") as f:
+                metadata = json.load(f)
+            arrays = {
+                name: np.load(
+                    artifact_dir / f"{name}.npy",
+                    mmap_mode="r" if mmap else None,
+                    allow_pickle=False,
+                )
+                for name in _ARRAY_FILES
+            }
+        except (OSError, ValueError) as e:
+            raise RiskArtifactError(f"Cannot load risk artifact {artifact_dir}: {e}") from e
+
+        if metadata.get("format_version") != ARTIFACT_FORMAT_VERSION:
+            raise RiskArtifactError(
+                f"Unsupported risk artifact format: {metadata.get('format_version')}"
+            )
+
+        n = arrays["permnos"].shape[0]
+        k = len(metadata["factor_names"])
+        if (
+            arrays["factor_loadings"].shape != (n, k)
+            or arrays["factor_covariance"].shape != (k, k)
+            or arrays["specific_variances"].shape != (n,)
+        ):
+            raise RiskArtifactError(f"Risk artifact {artifact_dir} has inconsistent shapes")
+
+        if not mmap:
+            for arr in arrays.values():
+                arr.setflags(write=False)
+
+        return cls(
+            factor_names=list(metadata["factor_names"]),
+            as_of_date=date.fromisoformat(metadata["as_of_date"]),
+            model_version=metadata["model_version"],
+            dataset_version_ids=dict(metadata["dataset_version_ids"]),
+            **arrays,
+        )
+
+    @staticmethod
+    def find_latest(root_dir: Path | str) -> Path | None:
+        """
+        Find the artifact with the most recent as_of_date under root_dir.
+
+        Args:
+            root_dir: Root directory passed to save()
+
+        Returns:
+            Artifact directory, or None if no readable artifact exists
+        """
+        root = Path(root_dir)
+        if not root.is_dir():
+            return None
+
+        latest: tuple[str, Path] | None = None
+        for artifact_dir in root.glob("risk_*"):
+            try:
+                with open(artifact_dir / "metadata.json") as f:
+                    as_of = json.load(f)["as_of_date"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if latest is None or as_of > latest[0]:
+                latest = (as_of, artifact_dir)
+        return latest[1] if latest else None
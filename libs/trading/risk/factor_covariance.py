@@ -272,6 +272,19 @@ class FactorCovarianceEstimator:
         # Track version IDs for reproducibility (Codex MEDIUM fix)
         all_version_ids: dict[str, str] = {"crsp_returns": crsp_version}
 
+        # With an exposure panel, every lagged date is computed (if missing)
+        # and read in one scan instead of recomputing exposures per day
+        panel_exposures: dict[date, pl.DataFrame] | None = None
+        panel_versions: dict[str, str] = {}
+        if self.factor_builder.exposure_store is not None:
+            all_days = sorted(crsp_data["date"].unique().to_list())
+            previous_day = dict(zip(all_days[1:], all_days[:-1], strict=False))
+            lag_days = {previous_day[t] for t in trading_days if t in previous_day}
+            panel, panel_versions = self.factor_builder.load_exposure_panel(lag_days)
+            panel_exposures = {
+                key[0]: frame for key, frame in panel.partition_by("date", as_dict=True).items()
+            }
+
         for t in trading_days:
             try:
                 # Get lagged exposures from t-1 (PIT correct)
@@ -284,11 +297,17 @@ class FactorCovarianceEstimator:
                 t_lag = max(prior_days)
 
                 # Get factor exposures at t-1
-                exposures_result = self.factor_builder.compute_all_factors(as_of_date=t_lag)
-                exposures = self._pivot_exposures(exposures_result.exposures)
+                if panel_exposures is not None:
+                    if t_lag not in panel_exposures:
+                        raise InsufficientDataError(f"No panel exposures for {t_lag}")
+                    exposures = self._pivot_exposures(panel_exposures[t_lag])
+                    day_versions = panel_versions.copy()
+                else:
+                    exposures_result = self.factor_builder.compute_all_factors(as_of_date=t_lag)
+                    exposures = self._pivot_exposures(exposures_result.exposures)
+                    day_versions = exposures_result.dataset_version_ids.copy()
                 # Track version IDs for full provenance (Codex HIGH fix)
                 # Include both factor versions AND CRSP returns version
-                day_versions = exposures_result.dataset_version_ids.copy()
                 day_versions["crsp_returns"] = crsp_version
                 all_version_ids.update(day_versions)
 
@@ -798,9 +798,9 @@ class PortfolioOptimizer:
             )
 
         # Filter to covered permnos (have both loadings and specific risk)
-        loadings_permnos = set(self.risk_model.factor_loadings["permno"].to_list())
-        specific_permnos = set(self.risk_model.specific_risks["permno"].to_list())
-        covered = [p for p in universe if p in loadings_permnos and p in specific_permnos]
+        compiled = self.risk_model.compile()
+        covered_mask = compiled.lookup(universe) >= 0
+        covered = [p for p, m in zip(universe, covered_mask.tolist(), strict=True) if m]
 
         coverage = len(covered) / len(universe)  # universe is non-empty here
         if coverage < self.config.min_coverage:
@@ -814,32 +814,22 @@ class PortfolioOptimizer:
 
         # Sort for consistent ordering
         covered = sorted(covered)
+        rows = compiled.lookup(covered)
 
         # Extract aligned factor loadings (N×K)
-        B = (
-            self.risk_model.factor_loadings.filter(pl.col("permno").is_in(covered))
-            .sort("permno")
-            .select(self.risk_model.factor_names)
-            .to_numpy()
-            .astype(np.float64)
-        )
+        B = np.ascontiguousarray(compiled.factor_loadings[rows])
 
         # Get factor covariance (K×K)
         F = self.risk_model.factor_covariance
 
         # Extract aligned specific variances (N×1 diagonal)
-        D_diag = (
-            self.risk_model.specific_risks.filter(pl.col("permno").is_in(covered))
-            .sort("permno")["specific_variance"]
-            .to_numpy()
-            .astype(np.float64)
-        )
+        D_diag = compiled.specific_variances[rows]
 
         # Ensure non-negative specific variances
         D_diag = np.maximum(D_diag, 1e-10)
 
         # Compute full covariance: Sigma = B @ F @ B.T + diag(D)
-        sigma = B @ F @ B.T + np.diag(D_diag)
+        sigma: NDArray[np.floating[Any]] = B @ F @ B.T + np.diag(D_diag)
 
         # Ensure PSD (regularize if needed)
         sigma = self._regularize_covariance(sigma)
@@ -543,18 +543,18 @@ class StressTester:
             Dict of factor_name -> portfolio exposure
         """
         # Get portfolio weights
-        portfolio_permnos = portfolio["permno"].to_list()
         portfolio_weights = portfolio["weight"].to_numpy().astype(np.float64)
 
-        # Get factor loadings for portfolio permnos
-        loadings_permnos = set(self.risk_model.factor_loadings["permno"].to_list())
+        # Look up factor loading rows for portfolio permnos
+        compiled = self.risk_model.compile()
+        rows = compiled.lookup(portfolio["permno"].to_numpy(), require_specific=False)
 
         # Filter to covered permnos
-        covered_mask = [p in loadings_permnos for p in portfolio_permnos]
-        covered_permnos = [p for p, m in zip(portfolio_permnos, covered_mask, strict=False) if m]
+        covered_mask = rows >= 0
+        covered_rows = rows[covered_mask]
         covered_weights = portfolio_weights[covered_mask]
 
-        if len(covered_permnos) == 0:
+        if covered_rows.size == 0:
             logger.warning("No portfolio positions have factor loadings")
             return {f: 0.0 for f in self.risk_model.factor_names}
 
@@ -588,23 +588,28 @@ class StressTester:
                 f"({covered_gross:.3f} of {gross_weight:.3f}) have factor loadings"
             )
 
-        # Get factor loadings matrix (N × K)
-        loadings_df = (
-            self.risk_model.factor_loadings.filter(pl.col("permno").is_in(covered_permnos))
-            .sort("permno")
-            .select(self.risk_model.factor_names)
-        )
+        # Compute exposures: f = w' @ B (for each factor), B is N × K
+        B = compiled.factor_loadings[covered_rows]
+        exposures_vec = covered_weights @ B
 
-        # Sort weights to match loadings order
-        permno_to_weight = dict(zip(covered_permnos, covered_weights.tolist(), strict=False))
-        sorted_permnos = sorted(covered_permnos)
-        aligned_weights = np.array([permno_to_weight[p] for p in sorted_permnos])
+        return dict(zip(self.risk_model.factor_names, exposures_vec.tolist(), strict=False))
 
-        # Compute exposures: f = w' @ B (for each factor)
-        B = loadings_df.to_numpy().astype(np.float64)
-        exposures_vec = aligned_weights @ B
+    def _portfolio_specific_variance(self, portfolio: pl.DataFrame) -> float | None:
+        """
+        Daily specific variance sum(w_i^2 * spec_var_i) over covered positions.
 
-        return dict(zip(self.risk_model.factor_names, exposures_vec.tolist(), strict=False))
+        Returns:
+            Portfolio specific variance, or None if no position has specific risk
+        """
+        compiled = self.risk_model.compile()
+        rows = compiled.lookup(portfolio["permno"].to_numpy(), require_loadings=False)
+        covered_mask = rows >= 0
+        if not covered_mask.any():
+            return None
+
+        weights = portfolio["weight"].to_numpy().astype(np.float64)[covered_mask]
+        specific_vars = compiled.specific_variances[rows[covered_mask]]
+        return float(np.sum(weights**2 * specific_vars))
 
     def _estimate_specific_stress(
         self,
@@ -618,44 +623,10 @@ class StressTester:
 
         specific_stress = -2 * sqrt(sum(w_i^2 * spec_var_i) * n_days)
         """
-        # Get portfolio positions
-        portfolio_permnos = portfolio["permno"].to_list()
-        portfolio_weights = portfolio["weight"].to_numpy().astype(np.float64)
-
-        # Get specific variances for covered positions
-        specific_permnos = set(self.risk_model.specific_risks["permno"].to_list())
-
-        # Filter to covered
-        covered_mask = [p in specific_permnos for p in portfolio_permnos]
-        covered_permnos = [p for p, m in zip(portfolio_permnos, covered_mask, strict=False) if m]
-        covered_weights = portfolio_weights[covered_mask]
-
-        if len(covered_permnos) == 0:
-            return 0.0
-
-        # Get specific variances aligned to portfolio order
-        specific_df = self.risk_model.specific_risks.filter(
-            pl.col("permno").is_in(covered_permnos)
-        ).sort("permno")
-
-        # Create lookup
-        permno_to_var: dict[int, float] = dict(
-            zip(
-                specific_df["permno"].to_list(),
-                specific_df["specific_variance"].to_list(),
-                strict=False,
-            )
-        )
-
-        sorted_permnos = sorted(covered_permnos)
-        specific_vars = np.array([permno_to_var[p] for p in sorted_permnos])
-
-        # Align weights
-        permno_to_weight = dict(zip(covered_permnos, covered_weights.tolist(), strict=False))
-        aligned_weights = np.array([permno_to_weight[p] for p in sorted_permnos])
-
         # Portfolio specific variance (daily)
-        port_specific_var = float(np.sum(aligned_weights**2 * specific_vars))
+        port_specific_var = self._portfolio_specific_variance(portfolio)
+        if port_specific_var is None:
+            return 0.0
 
         # Scale by period length
         if scenario.start_date and scenario.end_date:
@@ -679,44 +650,10 @@ class StressTester:
 
         specific_stress = -2 * sqrt(sum(w_i^2 * spec_var_i))
         """
-        # Get portfolio positions
-        portfolio_permnos = portfolio["permno"].to_list()
-        portfolio_weights = portfolio["weight"].to_numpy().astype(np.float64)
-
-        # Get specific variances for covered positions
-        specific_permnos = set(self.risk_model.specific_risks["permno"].to_list())
-
-        # Filter to covered
-        covered_mask = [p in specific_permnos for p in portfolio_permnos]
-        covered_permnos = [p for p, m in zip(portfolio_permnos, covered_mask, strict=False) if m]
-        covered_weights = portfolio_weights[covered_mask]
-
-        if len(covered_permnos) == 0:
-            return 0.0
-
-        # Get specific variances aligned to portfolio order
-        specific_df = self.risk_model.specific_risks.filter(
-            pl.col("permno").is_in(covered_permnos)
-        ).sort("permno")
-
-        # Create lookup
-        permno_to_var: dict[int, float] = dict(
-            zip(
-                specific_df["permno"].to_list(),
-                specific_df["specific_variance"].to_list(),
-                strict=False,
-            )
-        )
-
-        sorted_permnos = sorted(covered_permnos)
-        specific_vars = np.array([permno_to_var[p] for p in sorted_permnos])
-
-        # Align weights
-        permno_to_weight = dict(zip(covered_permnos, covered_weights.tolist(), strict=False))
-        aligned_weights = np.array([permno_to_weight[p] for p in sorted_permnos])
-
         # Portfolio specific variance (daily)
-        port_specific_var = float(np.sum(aligned_weights**2 * specific_vars))
+        port_specific_var = self._portfolio_specific_variance(portfolio)
+        if port_specific_var is None:
+            return 0.0
 
         # 2-sigma tail estimate (conservative downside)
         return float(-2.0 * np.sqrt(port_specific_var))
@@ -740,13 +677,6 @@ class StressTester:
         Returns:
             DataFrame with permno, pnl, contribution columns
         """
-        # Get portfolio positions
-        portfolio_permnos = portfolio["permno"].to_list()
-        portfolio_weights_list = portfolio["weight"].to_list()
-
-        # Get factor loadings for portfolio permnos
-        loadings_permnos = set(self.risk_model.factor_loadings["permno"].to_list())
-
         # Get factor shocks
         if scenario.scenario_type == "hypothetical":
             factor_shocks = scenario.factor_shocks or {}
@@ -767,39 +697,26 @@ class StressTester:
             for row in cumulative_factor_returns.iter_rows(named=True):
                 factor_shocks[row["factor_name"]] = row["cumulative_return"]
 
-        # Build position impacts
-        position_data: list[dict[str, float | int]] = []
-
-        for permno, weight in zip(portfolio_permnos, portfolio_weights_list, strict=False):
-            if permno not in loadings_permnos:
-                # No loadings, skip
-                continue
-
-            # Get factor loadings for this position
-            loadings_row = self.risk_model.factor_loadings.filter(pl.col("permno") == permno)
-
-            if loadings_row.height == 0:
-                continue
-
-            # Compute position P&L from factor shocks
-            position_pnl = 0.0
-            for factor_name in self.risk_model.factor_names:
-                loading = float(loadings_row[factor_name][0])
-                shock = factor_shocks.get(factor_name, 0.0)
-                position_pnl += weight * loading * shock
-
-            position_data.append(
-                {
-                    "permno": permno,
-                    "weight": weight,
-                    "pnl": position_pnl,
-                }
-            )
-
-        if not position_data:
+        # Build position impacts: pnl_i = w_i * (B_i · shocks)
+        compiled = self.risk_model.compile()
+        rows = compiled.lookup(portfolio["permno"].to_numpy(), require_specific=False)
+        covered_mask = rows >= 0
+        if not covered_mask.any():
             return None
 
-        df = pl.DataFrame(position_data)
+        shock_vec = np.array(
+            [factor_shocks.get(f, 0.0) for f in self.risk_model.factor_names], dtype=np.float64
+        )
+        weights = portfolio["weight"].to_numpy().astype(np.float64)[covered_mask]
+        position_pnl = weights * (compiled.factor_loadings[rows[covered_mask]] @ shock_vec)
+
+        df = pl.DataFrame(
+            {
+                "permno": portfolio["permno"].to_numpy()[covered_mask],
+                "weight": weights,
+                "pnl": position_pnl,
+            }
+        )
 
         # Add contribution column (% of total P&L)
         total_pnl = df["pnl"].sum()
@@ -1,16 +1,25 @@
-"""Strategy-scoped data access with server-side filtering and caching."""
+"""Strategy-scoped data access with server-side filtering and caching.
+
+Trade, order and P&L pages use keyset (seek) pagination: each page returns
+rows strictly after the previous page's last sort key, passed back as an
+opaque cursor token (see ``next_page_cursor``). Unlike ``OFFSET``, the cost
+of a page does not grow with its depth. Queries project only the columns
+the console grids and exports read.
+"""
 
 from __future__ import annotations
 
 import base64
+import binascii
 import hashlib
 import json
 import logging
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from decimal import Decimal
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from psycopg.rows import dict_row
@@ -28,6 +37,95 @@ STRATEGY_CACHE_DB_ENV = "REDIS_STRATEGY_CACHE_DB"
 DEFAULT_STRATEGY_CACHE_DB = 3
 STRATEGY_CACHE_KEY_ENV = "STRATEGY_CACHE_ENCRYPTION_KEY"
 BREAK_EVEN_EPSILON = Decimal("0.01")
+EXPORT_CURSOR_ITERSIZE = 1000
+
+# Columns read by the trade journal grid, dashboard activity feed and exports
+TRADE_COLUMNS = (
+    "trade_id",
+    "strategy_id",
+    "symbol",
+    "side",
+    "qty",
+    "price",
+    "executed_at",
+    "realized_pnl",
+)
+ORDER_COLUMNS = (
+    "client_order_id",
+    "strategy_id",
+    "symbol",
+    "side",
+    "qty",
+    "order_type",
+    "limit_price",
+    "status",
+    "filled_qty",
+    "filled_avg_price",
+    "created_at",
+)
+# Columns read by the comparison and risk services
+PNL_COLUMNS = ("trade_date", "strategy_id", "daily_pnl")
+
+CursorKind = Literal["trades", "orders", "pnl"]
+
+
+@dataclass(frozen=True)
+class _Keyset:
+    """Descending (sort column, unique tiebreaker) seek key for one query."""
+
+    kind: CursorKind
+    sort_column: str
+    tie_column: str
+    parse_sort_value: Callable[[str], Any]
+
+    @property
+    def order_by(self) -> str:
+        return f"{self.sort_column} DESC, {self.tie_column} DESC"
+
+    @property
+    def seek_clause(self) -> str:
+        return f"({self.sort_column}, {self.tie_column}) < (%s, %s)"
+
+    def encode(self, row: dict[str, Any]) -> str:
+        sort_value = row[self.sort_column]
+        if isinstance(sort_value, (date, datetime)):  # noqa: UP038
+            sort_value = sort_value.isoformat()
+        payload = json.dumps([self.kind, str(sort_value), str(row[self.tie_column])])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode(self, token: str) -> tuple[Any, str]:
+        try:
+            kind, sort_value, tie_value = json.loads(base64.urlsafe_b64decode(token.encode()))
+            if kind != self.kind:
+                raise ValueError(f"cursor is for '{kind}'")
+            return self.parse_sort_value(sort_value), str(tie_value)
+        except (ValueError, TypeError, binascii.Error) as e:
+            raise ValueError(f"Invalid {self.kind} pagination cursor") from e
+
+
+_KEYSETS: dict[CursorKind, _Keyset] = {
+    "trades": _Keyset("trades", "executed_at", "trade_id", datetime.fromisoformat),
+    "orders": _Keyset("orders", "created_at", "client_order_id", datetime.fromisoformat),
+    "pnl": _Keyset("pnl", "trade_date", "strategy_id", date.fromisoformat),
+}
+
+
+def next_page_cursor(
+    kind: CursorKind, rows: Sequence[dict[str, Any]], limit: int
+) -> str | None:
+    """Return the cursor for the page after ``rows``, or None on the last page.
+
+    Args:
+        kind: Query the rows came from (``trades``, ``orders`` or ``pnl``).
+        rows: Page returned by the matching ``get_*`` method.
+        limit: Page size the page was requested with.
+
+    Returns:
+        Opaque token to pass as ``cursor=`` for the next page.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    return _KEYSETS[kind].encode(rows[-1])
 
 
 def _get_cache_encryption_key() -> bytes | None:
@@ -340,6 +438,28 @@ class StrategyScopedDataAccess:
             clauses.append("executed_at < %s")
             params.append(_date_to_utc_datetime(date_to))
 
+    @staticmethod
+    def _add_seek_filter(
+        kind: CursorKind,
+        clauses: list[str],
+        params: list[Any],
+        offset: int,
+        cursor: str | None,
+    ) -> str:
+        """Append the keyset predicate for ``cursor`` and return the ORDER BY list.
+
+        Raises:
+            ValueError: If the cursor is malformed, belongs to another query,
+                or is combined with a non-zero offset.
+        """
+        keyset = _KEYSETS[kind]
+        if cursor is not None:
+            if offset:
+                raise ValueError("cursor and offset are mutually exclusive")
+            clauses.append(keyset.seek_clause)
+            params.extend(keyset.decode(cursor))
+        return keyset.order_by
+
     async def get_positions(
         self, limit: int = DEFAULT_LIMIT, offset: int = 0, use_cache: bool = True, **filters: Any
     ) -> list[dict[str, Any]]:
@@ -370,17 +490,27 @@ class StrategyScopedDataAccess:
         return data
 
     async def get_orders(
-        self, limit: int = DEFAULT_LIMIT, offset: int = 0, **filters: Any
+        self,
+        limit: int = DEFAULT_LIMIT,
+        offset: int = 0,
+        cursor: str | None = None,
+        **filters: Any,
     ) -> list[dict[str, Any]]:
+        """Return a page of orders, newest first.
+
+        Pass ``next_page_cursor("orders", rows, limit)`` as ``cursor`` to seek
+        to the next page; ``offset`` is kept for existing callers.
+        """
         limit = self._limit(limit)
         strat_clause, strat_params = self._strategy_clause()
         allowed_filters = {"symbol": "symbol", "side": "side", "status": "status"}
         clauses, params = self._build_filter_clauses(filters, allowed_filters)
+        order_by = self._add_seek_filter("orders", clauses, params, offset, cursor)
         query = f"""
-            SELECT * FROM orders
+            SELECT {", ".join(ORDER_COLUMNS)} FROM orders
             WHERE {strat_clause}
             {(' AND ' + ' AND '.join(clauses)) if clauses else ''}
-            ORDER BY created_at DESC
+            ORDER BY {order_by}
             LIMIT %s OFFSET %s
         """
         exec_params = [*strat_params, *params, limit, offset]
@@ -394,19 +524,27 @@ class StrategyScopedDataAccess:
         date_to: Any,
         limit: int = DEFAULT_LIMIT,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
+        """Return daily P&L rows in the date range, newest first.
+
+        Pages seek on ``(trade_date, strategy_id)``; see ``get_orders``.
+        """
         limit = self._limit(limit)
         strat_clause, strat_params = self._strategy_clause()
+        clauses = ["trade_date BETWEEN %s AND %s"]
+        params: list[Any] = [date_from, date_to]
+        order_by = self._add_seek_filter("pnl", clauses, params, offset, cursor)
         query = f"""
-            SELECT * FROM pnl_daily
+            SELECT {", ".join(PNL_COLUMNS)} FROM pnl_daily
             WHERE {strat_clause}
-              AND trade_date BETWEEN %s AND %s
-            ORDER BY trade_date DESC
+              AND {' AND '.join(clauses)}
+            ORDER BY {order_by}
             LIMIT %s OFFSET %s
         """
-        params = (*strat_params, date_from, date_to, limit, offset)
+        exec_params = (*strat_params, *params, limit, offset)
         async with acquire_connection(self.db_pool) as conn:
-            rows = await self._execute_fetchall(conn, query, params)
+            rows = await self._execute_fetchall(conn, query, exec_params)
         return [dict(row) for row in rows]
 
     async def get_trades(
@@ -415,21 +553,27 @@ class StrategyScopedDataAccess:
         offset: int = 0,
         date_from: date | None = None,
         date_to: date | None = None,
+        cursor: str | None = None,
         **filters: Any,
     ) -> list[dict[str, Any]]:
+        """Return a page of non-superseded trades, newest first.
+
+        Pages seek on ``(executed_at, trade_id)``; see ``get_orders``.
+        """
         limit = self._limit(limit)
         strat_clause, strat_params = self._strategy_clause()
         allowed_filters = {"symbol": "symbol", "side": "side"}
         clauses, params = self._build_filter_clauses(filters, allowed_filters)
 
         self._add_date_filters(clauses, params, date_from, date_to)
+        order_by = self._add_seek_filter("trades", clauses, params, offset, cursor)
 
         query = f"""
-            SELECT * FROM trades
+            SELECT {", ".join(TRADE_COLUMNS)} FROM trades
             WHERE {strat_clause}
               AND COALESCE(superseded, FALSE) = FALSE
             {(' AND ' + ' AND '.join(clauses)) if clauses else ''}
-            ORDER BY executed_at DESC
+            ORDER BY {order_by}
             LIMIT %s OFFSET %s
         """
         exec_params = [*strat_params, *params, limit, offset]
@@ -501,6 +645,11 @@ class StrategyScopedDataAccess:
         date_to: date | None = None,
         **filters: Any,
     ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream all matching trades through a named server-side cursor.
+
+        Rows are fetched ``EXPORT_CURSOR_ITERSIZE`` at a time, so memory
+        stays flat regardless of export size.
+        """
         strat_clause, strat_params = self._strategy_clause()
         allowed_filters = {"symbol": "symbol", "side": "side"}
         clauses, params = self._build_filter_clauses(filters, allowed_filters)
@@ -508,18 +657,21 @@ class StrategyScopedDataAccess:
         self._add_date_filters(clauses, params, date_from, date_to)
 
         query = f"""
-            SELECT * FROM trades
+            SELECT {", ".join(TRADE_COLUMNS)} FROM trades
             WHERE {strat_clause}
               AND COALESCE(superseded, FALSE) = FALSE
             {(' AND ' + ' AND '.join(clauses)) if clauses else ''}
-            ORDER BY executed_at DESC
+            ORDER BY {_KEYSETS["trades"].order_by}
         """
         exec_params = [*strat_params, *params]
         async with acquire_connection(self.db_pool) as conn:
+            # Named (server-side) cursors only live inside a transaction
             async with conn.transaction():
-                cursor = await conn.execute(query, tuple(exec_params))
-                async for row in cursor:
-                    yield dict(row)
+                async with conn.cursor(name="trades_export", row_factory=dict_row) as cursor:
+                    cursor.itersize = EXPORT_CURSOR_ITERSIZE
+                    await cursor.execute(query, tuple(exec_params))
+                    async for row in cursor:
+                        yield dict(row)
 
     # P6T10: Attribution and Quantile Analysis
     async def get_portfolio_returns(
@@ -589,4 +741,4 @@ def get_scoped_data_access(
     return StrategyScopedDataAccess(db_pool, redis_client, user)
 
 
-__all__ = ["StrategyScopedDataAccess", "get_scoped_data_access"]
+__all__ = ["StrategyScopedDataAccess", "get_scoped_data_access", "next_page_cursor"]
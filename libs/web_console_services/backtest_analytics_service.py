@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import date
+from functools import partial
 from typing import TYPE_CHECKING, Literal
 
 import polars as pl
@@ -32,11 +33,16 @@ if TYPE_CHECKING:
     from libs.data.data_providers.universe import ForwardReturnsProvider
     from libs.trading.alpha.research_platform import BacktestResult
     from libs.trading.backtest.quantile_analysis import QuantileAnalysisConfig, QuantileResult
-    from libs.trading.backtest.result_storage import BacktestResultStorage
+    from libs.trading.backtest.result_storage import (
+        BacktestResultOverview,
+        BacktestResultStorage,
+    )
     from libs.web_console_data.strategy_scoped_queries import StrategyScopedDataAccess
 
 logger = logging.getLogger(__name__)
 
+ChartName = Literal["equity", "drawdown", "ic"]
+
 
 class BacktestAnalyticsService:
     """Service wrapper for backtest analytics with ownership enforcement.
@@ -162,7 +168,8 @@ class BacktestAnalyticsService:
             job_id: The backtest job identifier.
 
         Returns:
-            BacktestResult with all artifacts loaded.
+            BacktestResult with all artifacts loaded (reused from the
+            storage's result-handle LRU when recently viewed).
 
         Raises:
             PermissionError: If user doesn't own the job.
@@ -176,6 +183,102 @@ class BacktestAnalyticsService:
         result: BacktestResult = await run_in_threadpool(self._storage.get_result, job_id)
         return result
 
+    async def get_result_overview(self, job_id: str) -> BacktestResultOverview:
+        """Load result-page header metrics without decoding artifacts.
+
+        Args:
+            job_id: The backtest job identifier.
+
+        Returns:
+            BacktestResultOverview from summary.json, the job row and a
+            date-only scan of the signals artifact.
+
+        Raises:
+            PermissionError: If user doesn't own the job.
+            JobNotFound: If job doesn't exist.
+            ResultPathMissing: If result path is invalid.
+        """
+        await self.verify_job_ownership(job_id)
+
+        handle = await run_in_threadpool(self._storage.open_result, job_id)
+        overview: BacktestResultOverview = await run_in_threadpool(handle.overview)
+        return overview
+
+    async def get_result_tab(self, job_id: str, tab: str) -> dict[str, pl.DataFrame | None]:
+        """Load only the artifacts one result-page tab needs, with ownership check.
+
+        Artifacts come from the storage's LRU of result handles, so
+        switching back to a recently viewed job does not re-read Parquet.
+
+        Args:
+            job_id: The backtest job identifier.
+            tab: Tab name from ``TAB_ARTIFACTS`` (e.g. ``"performance"``).
+
+        Returns:
+            Mapping of artifact name to DataFrame (None if not written).
+
+        Raises:
+            PermissionError: If user doesn't own the job.
+            JobNotFound: If job doesn't exist.
+            ResultPathMissing: If result path is invalid.
+            KeyError: If ``tab`` is unknown.
+        """
+        await self.verify_job_ownership(job_id)
+
+        handle = await run_in_threadpool(self._storage.open_result, job_id)
+        frames: dict[str, pl.DataFrame | None] = await run_in_threadpool(handle.load_tab, tab)
+        return frames
+
+    async def get_chart_series(
+        self,
+        job_id: str,
+        chart: ChartName,
+        width_px: int,
+        basis: Literal["net", "gross"] = "net",
+    ) -> pl.DataFrame | None:
+        """Load a chart series downsampled server-side to the chart's pixel width.
+
+        Equity and IC use LTTB; drawdown uses min/max buckets so the
+        deepest trough survives downsampling.
+
+        Args:
+            job_id: The backtest job identifier.
+            chart: ``"equity"``, ``"drawdown"`` or ``"ic"``.
+            width_px: Rendered chart width in pixels.
+            basis: Return basis for equity/drawdown.
+
+        Returns:
+            ``{date, cumulative_return}``, ``{date, drawdown}`` or
+            ``{date, rank_ic|ic}``; None if the job or series is unavailable.
+
+        Raises:
+            PermissionError: If user doesn't own the job.
+            ValueError: If ``chart`` is unknown.
+        """
+        await self.verify_job_ownership(job_id)
+
+        from libs.trading.backtest.models import JobNotFound, ResultPathMissing
+
+        try:
+            handle = await run_in_threadpool(self._storage.open_result, job_id)
+        except (JobNotFound, ResultPathMissing) as e:
+            logger.warning(
+                "get_chart_series_unavailable",
+                extra={"job_id": job_id, "chart": chart, "error": str(e)},
+            )
+            return None
+
+        if chart == "equity":
+            loader = partial(handle.equity_curve, width_px, basis)
+        elif chart == "drawdown":
+            loader = partial(handle.drawdown_curve, width_px, basis)
+        elif chart == "ic":
+            loader = partial(handle.ic_series, width_px)
+        else:
+            raise ValueError(f"Unknown chart: {chart!r}")
+        series: pl.DataFrame | None = await run_in_threadpool(loader)
+        return series
+
     async def run_quantile_analysis(
         self,
         job_id: str,
@@ -356,4 +459,4 @@ class BacktestAnalyticsService:
         return (net_df, gross_df)
 
 
-__all__ = ["BacktestAnalyticsService"]
+__all__ = ["BacktestAnalyticsService", "ChartName"]
@@ -5,6 +5,9 @@ This service fetches P&L data for a set of strategies and produces:
 - Equity curve data
 - Correlation matrix
 - Combined portfolio simulation utilities
+
+With a DailyReturnsCube attached, P&L is served from the materialized cube
+and metrics/correlations come from its incrementally maintained statistics.
 """
 
 from __future__ import annotations
@@ -16,13 +19,21 @@ from typing import Any, cast
 import pandas as pd
 
 from libs.web_console_data.strategy_scoped_queries import StrategyScopedDataAccess
+from libs.web_console_services.returns_cube import DailyReturnsCube
 
 
 class ComparisonService:
     """Business logic for the strategy comparison tool."""
 
-    def __init__(self, scoped_access: Any):
+    def __init__(self, scoped_access: Any, cube: DailyReturnsCube | None = None):
+        """Initialize the service.
+
+        Args:
+            scoped_access: StrategyScopedDataAccess of the current user.
+            cube: Shared returns cube; when None, every call refetches P&L.
+        """
         self._scoped_access = scoped_access
+        self._cube = cube
 
     async def get_comparison_data(
         self,
@@ -41,6 +52,11 @@ class ComparisonService:
         if authorized_count == 0:
             raise PermissionError("No authorized strategies available")
 
+        if self._cube is not None:
+            return await self._get_cube_comparison_data(
+                self._cube, strategy_ids, date_from, date_to
+            )
+
         # Calculate sufficient limit to avoid data truncation:
         # get_pnl_summary queries ALL authorized strategies, so we must size the limit
         # based on authorized count (not selected count) to ensure full date coverage.
@@ -81,6 +97,47 @@ class ComparisonService:
             "truncation_warning": truncation_warning,
         }
 
+    async def _get_cube_comparison_data(
+        self,
+        cube: DailyReturnsCube,
+        strategy_ids: list[str],
+        date_from: date,
+        date_to: date,
+    ) -> dict[str, Any]:
+        """Serve comparison artifacts from the returns cube.
+
+        Only windows the cube cannot serve are fetched (paged, so no
+        truncation). Equity curves, metrics and the correlation matrix are
+        cached on the selection's statistics and shared between callers;
+        treat them as read-only.
+        """
+        authorized = set(self._scoped_access.authorized_strategies)
+        # Unauthorized ids never had rows in the scoped query; keep that contract
+        selected = [sid for sid in dict.fromkeys(strategy_ids) if sid in authorized]
+        if not selected:
+            return self._empty_payload(strategy_ids)
+
+        await cube.refresh(self._scoped_access, selected, date_from, date_to)
+        stats = cube.selection(selected, date_from, date_to)
+        pnl_frame = stats.pnl_frame
+        if pnl_frame.empty:
+            return self._empty_payload(strategy_ids)
+
+        if stats.payload is None:
+            stats.payload = {
+                "equity_curves": self._build_equity_curves(pnl_frame),
+                "metrics": stats.metrics(),
+                "correlation_matrix": stats.correlation_matrix(),
+            }
+        default_weights = {sid: round(1 / len(strategy_ids), 4) for sid in strategy_ids}
+        return {
+            "pnl_frame": pnl_frame,
+            **stats.payload,
+            "combined_portfolio": self.compute_combined_portfolio(default_weights, pnl_frame),
+            "default_weights": default_weights,
+            "truncation_warning": None,
+        }
+
     @staticmethod
     def _to_pnl_frame(pnl_rows: list[dict[str, Any]], strategy_ids: list[str]) -> pd.DataFrame:
         """Convert raw P&L rows to a pivoted DataFrame indexed by trade_date."""
@@ -22,6 +22,8 @@ from libs.data.data_pipeline.read_time_adjustment import (
     READ_TIME_ADJUSTMENT_MODE_UNAVAILABLE,
     READ_TIME_INVALID_SPLIT_ACTIONS_SKIPPED_REASON,
     READ_TIME_NO_SPLIT_ACTIONS_REASON,
+    SplitFactorTable,
+    build_split_factor_table,
     derive_split_adjusted_prices,
 )
 from libs.platform.web_console_auth.helpers import get_user_id
@@ -89,6 +91,11 @@ _SHARED_TABLE_AVAILABILITY_CACHE: _TableAvailabilityCache | None = None
 _SHARED_TABLE_AVAILABILITY_LOCK = asyncio.Lock()
 _SHARED_ALPACA_SUMMARY_CACHE: _AlpacaSummaryCache | None = None
 _SHARED_ALPACA_SUMMARY_LOCK = asyncio.Lock()
+# Split factors for the last corp-action snapshot previewed. Manifest-pinned
+# snapshot files are immutable, so the resolved path tuple identifies them.
+_SplitFactorCacheKey = tuple[tuple[str, ...], date | None]
+_SHARED_SPLIT_FACTOR_CACHE: tuple[_SplitFactorCacheKey, SplitFactorTable] | None = None
+_SHARED_SPLIT_FACTOR_LOCK = asyncio.Lock()
 
 
 class _DatasetAdjustmentMetadata(TypedDict, total=False):
@@ -806,12 +813,11 @@ class DataExplorerService:
             warmup_prices=warmup_prices,
         )
 
-        corp_actions = await self._load_corporate_actions_for_prices(
+        split_factors = await self._load_split_factor_table(
             dataset=dataset,
-            prices=adjustment_prices,
             table_paths=trusted_table_paths,
         )
-        adjustment_result = derive_split_adjusted_prices(adjustment_prices, corp_actions)
+        adjustment_result = derive_split_adjusted_prices(adjustment_prices, split_factors)
         frame = adjustment_result.frame
         if preview_start_date is not None and not warmup_prices.is_empty():
             frame = _drop_split_adjusted_warmup_rows(frame, preview_start_date)
@@ -915,57 +921,46 @@ class DataExplorerService:
             return warmup.drop("__rta_warmup_rank")
         return warmup
 
-    async def _load_corporate_actions_for_prices(
+    async def _load_split_factor_table(
         self,
         *,
         dataset: str,
-        prices: pl.DataFrame,
         table_paths: dict[str, TablePathSpec],
-    ) -> pl.DataFrame:
-        corp_query_parameters: list[Any] | None = None
-        if prices.is_empty():
-            corp_query = "SELECT * FROM alpaca_sip_corp_actions LIMIT 0"
-        else:
-            date_bounds = _price_date_bounds(prices)
-            symbols = normalized_symbols_from_frame(prices)
-            if date_bounds is None or not symbols:
-                corp_query = "SELECT * FROM alpaca_sip_corp_actions LIMIT 0"
-            else:
-                start_date, _price_end_date = date_bounds
-                query_end_date = _trusted_manifest_end_date(
-                    table_paths.get("alpaca_sip_corp_actions")
-                )
-                symbol_placeholders = ", ".join("?" for _symbol in symbols)
-                corp_query_parameters = [*symbols, start_date, start_date]
-                upper_bound_clause = ""
-                if query_end_date is not None:
-                    corp_query_parameters.extend([query_end_date, query_end_date])
-                    upper_bound_clause = (
-                        "AND ("
-                        "(process_date IS NOT NULL AND process_date <= CAST(? AS DATE)) "
-                        "OR (process_date IS NULL AND ex_date <= CAST(? AS DATE))"
-                        ") "
-                    )
-                corp_query = (
-                    "SELECT * FROM alpaca_sip_corp_actions "
-                    f"WHERE symbol IN ({symbol_placeholders}) "
-                    "AND ("
-                    "(ex_date IS NOT NULL AND ex_date >= CAST(? AS DATE)) "
-                    "OR (ex_date IS NULL AND process_date >= CAST(? AS DATE))"
-                    ") "
-                    f"{upper_bound_clause}"
-                    "ORDER BY symbol, ex_date NULLS LAST, process_date NULLS LAST"
+    ) -> SplitFactorTable:
+        """Return split factors for the trusted corp-action snapshot, built once per snapshot."""
+        global _SHARED_SPLIT_FACTOR_CACHE
+
+        corp_path_spec = table_paths["alpaca_sip_corp_actions"]
+        cache_key = _split_factor_cache_key(corp_path_spec)
+        async with _SHARED_SPLIT_FACTOR_LOCK:
+            cache = _SHARED_SPLIT_FACTOR_CACHE
+            if cache_key is not None and cache is not None and cache[0] == cache_key:
+                return cache[1]
+
+            corp_query_parameters: list[Any] | None = None
+            corp_query = "SELECT * FROM alpaca_sip_corp_actions"
+            query_end_date = _trusted_manifest_end_date(corp_path_spec)
+            if query_end_date is not None:
+                corp_query_parameters = [query_end_date, query_end_date]
+                corp_query += (
+                    " WHERE "
+                    "(process_date IS NOT NULL AND process_date <= CAST(? AS DATE)) "
+                    "OR (process_date IS NULL AND ex_date <= CAST(? AS DATE))"
                 )
-        return cast(
-            pl.DataFrame,
-            await self._execute_sql_frame(
-                dataset=dataset,
-                sql=corp_query,
-                table_paths={"alpaca_sip_corp_actions": table_paths["alpaca_sip_corp_actions"]},
-                timeout_seconds=_PREVIEW_TIMEOUT_SECONDS,
-                parameters=corp_query_parameters,
-            ),
-        )
+            corp_actions = cast(
+                pl.DataFrame,
+                await self._execute_sql_frame(
+                    dataset=dataset,
+                    sql=corp_query,
+                    table_paths={"alpaca_sip_corp_actions": corp_path_spec},
+                    timeout_seconds=_PREVIEW_TIMEOUT_SECONDS,
+                    parameters=corp_query_parameters,
+                ),
+            )
+            split_factors = build_split_factor_table(corp_actions)
+            if cache_key is not None:
+                _SHARED_SPLIT_FACTOR_CACHE = (cache_key, split_factors)
+            return split_factors
 
     def _require_permission(self, user: Any, permission: Permission) -> None:
         if not has_permission(user, permission):
@@ -1347,15 +1342,12 @@ def _trusted_table_paths_for_dataset(
     return trusted_paths
 
 
-def _price_date_bounds(prices: pl.DataFrame) -> tuple[date, date] | None:
-    if "date" not in prices.columns or prices.is_empty():
-        return None
-    dates = prices.select(pl.col("date").cast(pl.Date))
-    min_date = dates.select(pl.col("date").min()).item()
-    max_date = dates.select(pl.col("date").max()).item()
-    if not isinstance(min_date, date) or not isinstance(max_date, date):
+def _split_factor_cache_key(path_spec: TablePathSpec) -> _SplitFactorCacheKey | None:
+    raw_path_spec = getattr(path_spec, "path_spec", path_spec)
+    if not isinstance(raw_path_spec, tuple) or not raw_path_spec:
+        # Globs can match new files without any identity change; never cache them.
         return None
-    return min_date, max_date
+    return raw_path_spec, _trusted_manifest_end_date(path_spec)
 
 
 def _trusted_manifest_end_date(path_spec: TablePathSpec | None) -> date | None:
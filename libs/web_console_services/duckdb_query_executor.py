@@ -0,0 +1,258 @@
+"""Pooled DuckDB connections and Arrow result cache for SQL-backed explorers.
+
+Opening a hardened DuckDB connection costs an extension lockdown, a handful of
+``LOAD`` statements and one ``CREATE VIEW`` per table over (possibly thousands
+of) parquet paths. Connections here are keyed by a view-set version, a digest
+of the dataset and every table's physical path spec, so a connection whose
+views were registered for one manifest version is reused until the manifest
+or glob directory changes, at which point the new version gets fresh
+connections and the old ones age out of the LRU.
+
+Successful results are cached as Arrow tables keyed by the normalized SQL,
+bound parameters, the caller's table scope and the view-set version, so a
+repeated exploratory query is answered without touching DuckDB and a data
+refresh naturally invalidates stale entries.
+
+This module provides:
+- view_set_version: digest of the physical paths behind a dataset's views
+- query_cache_key: result cache key for a scoped query
+- DuckDBConnectionPool: bounded idle pool of long-lived connections per view set
+- QueryResultCache: LRU + TTL cache of Arrow-encoded query results
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Generic, Protocol, TypeVar
+
+import polars as pl
+import pyarrow as pa  # type: ignore[import-untyped]
+import sqlglot
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection(Protocol):
+    """Subset of the DuckDB connection API the pool relies on."""
+
+    def close(self) -> None: ...
+
+
+_ConnT = TypeVar("_ConnT", bound=PooledConnection)
+
+
+def _path_spec_version(path_spec: str | tuple[str, ...]) -> Any:
+    """Return a cheap version marker for one table's physical path spec.
+
+    Manifest-backed path lists are already versioned by their contents. Glob
+    specs are versioned by the directory mtime, which changes whenever a file
+    is added, removed or atomically replaced.
+    """
+    if not isinstance(path_spec, str):
+        return list(path_spec)
+    try:
+        mtime_ns = os.stat(os.path.dirname(path_spec)).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    return [path_spec, mtime_ns]
+
+
+def view_set_version(
+    dataset: str,
+    table_paths: Iterable[tuple[str, str | tuple[str, ...]]],
+) -> str:
+    """Digest the dataset and per-table path specs that back its views."""
+    payload = json.dumps(
+        [dataset, [[table, _path_spec_version(spec)] for table, spec in sorted(table_paths)]],
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _normalize_sql(sql: str) -> str:
+    """Canonicalize whitespace and keyword casing while keeping literals."""
+    try:
+        return sqlglot.parse_one(sql, read="duckdb").sql(dialect="duckdb")
+    except Exception:
+        return " ".join(sql.split())
+
+
+def query_cache_key(
+    sql: str,
+    parameters: Sequence[Any] | None,
+    *,
+    scope: Iterable[str],
+    view_version: str,
+) -> str:
+    """Build the result cache key for a query.
+
+    Args:
+        sql: Query text; normalized so formatting differences share an entry.
+        parameters: Bound query parameters, if any.
+        scope: Tables the caller is allowed to query (user scope).
+        view_version: Result of ``view_set_version`` for the query's views.
+    """
+    payload = json.dumps(
+        [_normalize_sql(sql), list(parameters or ()), sorted(scope), view_version],
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class DuckDBConnectionPool(Generic[_ConnT]):
+    """Keep idle connections per view-set version for reuse across queries.
+
+    Connections are checked out exclusively, so a pooled connection is never
+    shared between concurrent queries. Idle connections are bounded in total
+    and evicted least-recently-used view set first; evicted or unhealthy
+    connections are closed.
+    """
+
+    def __init__(self, *, max_idle: int) -> None:
+        self._max_idle = max_idle
+        self._idle: OrderedDict[str, deque[_ConnT]] = OrderedDict()
+        self._idle_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle connections currently held."""
+        return self._idle_count
+
+    def checkout(
+        self,
+        key: str,
+        factory: Callable[[], _ConnT],
+    ) -> _ConnT:
+        """Return an idle connection for ``key`` or open one with ``factory``."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._idle_count -= 1
+                conn = idle.pop()
+                if not idle:
+                    del self._idle[key]
+                return conn
+        return factory()
+
+    def checkin(self, key: str, conn: _ConnT, *, reusable: bool = True) -> None:
+        """Return a connection to the pool, closing it when not reusable."""
+        evicted: list[_ConnT] = []
+        with self._lock:
+            if reusable and self._max_idle > 0:
+                self._idle.setdefault(key, deque()).append(conn)
+                self._idle.move_to_end(key)
+                self._idle_count += 1
+                while self._idle_count > self._max_idle:
+                    oldest_key, oldest = next(iter(self._idle.items()))
+                    evicted.append(oldest.popleft())
+                    self._idle_count -= 1
+                    if not oldest:
+                        del self._idle[oldest_key]
+            else:
+                evicted.append(conn)
+        for stale in evicted:
+            _close_quietly(stale)
+
+    def clear(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+            self._idle_count = 0
+        for conn in idle:
+            _close_quietly(conn)
+
+
+def _close_quietly(conn: PooledConnection) -> None:
+    try:
+        conn.close()
+    except Exception:
+        logger.warning("duckdb_pool_close_failed", exc_info=True)
+
+
+class QueryResultCache:
+    """Thread-safe LRU cache of Arrow-encoded query results with a TTL.
+
+    Entries are bounded by count and by total Arrow buffer size; results
+    larger than the byte budget are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, pa.Table]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        """Arrow buffer bytes currently held."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        """Return the cached result for ``key``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, table = entry
+            if self._clock() - stored_at >= self._ttl_seconds:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+        return pl.DataFrame(table)
+
+    def put(self, key: str, frame: pl.DataFrame) -> None:
+        """Store a result, evicting least-recently-used entries over budget."""
+        if self._max_entries <= 0 or self._ttl_seconds <= 0:
+            return
+        table = frame.to_arrow()
+        size = table.nbytes
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (self._clock(), table)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: str) -> None:
+        _stored_at, table = self._entries.pop(key)
+        self._bytes -= table.nbytes
+
+
+__all__ = [
+    "DuckDBConnectionPool",
+    "QueryResultCache",
+    "query_cache_key",
+    "view_set_version",
+]
@@ -0,0 +1,474 @@
+"""Materialized daily P&L cube for the strategy comparison tool.
+
+``ComparisonService.get_comparison_data`` used to refetch every P&L row in the
+requested range and rebuild equity curves, metrics and the correlation matrix
+on each interaction of the compare page. The cube keeps each strategy's daily
+P&L in memory together with the date window it is known to be complete for,
+and fetches only the windows that are missing or whose tail may still receive
+new P&L. Restatements older than the tail are picked up by re-fetching a
+strategy's whole window once its coverage is older than a TTL. For every (selection, date range) it keeps running statistics: sums,
+cross-products, equity and drawdown state. Newly landed days are folded into
+those statistics rather than recomputed, so once the cube is warm, comparing
+20 strategies over 5 years is a lookup.
+
+Strategy P&L does not depend on the viewer, so the cube is process-wide.
+Callers must restrict requests to the strategies the current user is
+authorized for.
+
+This module provides:
+- DailyReturnsCube: Per-strategy daily P&L with incremental refresh
+- SelectionStats: Running metrics/correlation state for one selection and range
+- get_returns_cube: Process-wide cube used by the compare page
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from libs.web_console_data.strategy_scoped_queries import (
+    StrategyScopedDataAccess,
+    next_page_cursor,
+)
+
+# Trailing window of covered days that is re-fetched once the tail is stale,
+# so late or restated P&L rows replace what the cube holds
+CUBE_RESTATEMENT_DAYS = 3
+CUBE_TAIL_REFRESH_SECONDS = 60.0
+# Coverage older than this is dropped and its window re-fetched in full, so
+# backfills and restatements outside the trailing window eventually land
+CUBE_COVERAGE_TTL_SECONDS = 900.0
+CUBE_SELECTION_CACHE_SIZE = 32
+_CHANGE_LOG_SIZE = 64
+_ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class _Coverage:
+    start: date
+    end: date
+    refreshed_at: float  # monotonic time the window ending at ``end`` was fetched
+    verified_at: float  # monotonic time the oldest-fetched part of the window was fetched
+
+
+class _StrategySeries:
+    """Daily P&L of one strategy with a version log of changed dates."""
+
+    def __init__(self) -> None:
+        self.values = pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+        self.version = 0
+        self.coverage: _Coverage | None = None
+        self._changes: deque[tuple[int, date]] = deque(maxlen=_CHANGE_LOG_SIZE)
+
+    def replace_range(self, start: date, end: date, points: dict[pd.Timestamp, float]) -> None:
+        """Replace all values in ``[start, end]``; bumps the version only on change."""
+        index = self.values.index
+        in_range = (index >= pd.Timestamp(start)) & (index <= pd.Timestamp(end))
+        old = self.values[in_range].to_dict()
+        if old == points:
+            return
+        changed = [ts for ts in set(old) | set(points) if old.get(ts) != points.get(ts)]
+        new = pd.Series(points, dtype=float)
+        kept = self.values[~in_range]
+        self.values = (pd.concat([kept, new]) if len(kept) else new).sort_index()
+        self.version += 1
+        self._changes.append((self.version, min(changed).date()))
+
+    def changed_since(self, version: int) -> date | None:
+        """Earliest date changed after ``version`` (``date.min`` if unknown)."""
+        if version == self.version:
+            return None
+        if not self._changes or self._changes[0][0] > version + 1:
+            return date.min
+        return min(changed for v, changed in self._changes if v > version)
+
+    def extend_coverage(self, start: date, end: date, now: float) -> None:
+        """Record that ``[start, end]`` was fetched completely."""
+        cov = self.coverage
+        if cov is None or start > cov.end + _ONE_DAY or end < cov.start - _ONE_DAY:
+            # Disjoint windows: keep the wider one (coverage must stay contiguous)
+            if cov is None or (end - start) >= (cov.end - cov.start):
+                self.coverage = _Coverage(start, end, now, now)
+            return
+        refreshed_at = now if end >= cov.end else cov.refreshed_at
+        verified_at = now if start <= cov.start and end >= cov.end else cov.verified_at
+        self.coverage = _Coverage(
+            min(cov.start, start), max(cov.end, end), refreshed_at, verified_at
+        )
+
+
+class SelectionStats:
+    """Running comparison statistics for one strategy selection and date range.
+
+    Sums and cross-products are kept about the first row (shifted) so the
+    variance/covariance stay numerically stable for large dollar P&L.
+    """
+
+    def __init__(self, strategy_ids: Sequence[str], date_from: date, date_to: date) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            strategy_ids: Selected strategies (order kept for display).
+            date_from: Range start (inclusive).
+            date_to: Range end (inclusive).
+        """
+        self.strategy_ids = tuple(strategy_ids)
+        self.date_from = date_from
+        self.date_to = date_to
+        self.versions: dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all folded rows."""
+        self.columns: tuple[str, ...] = ()
+        self.pnl_frame = pd.DataFrame()
+        self.n = 0
+        self.payload: dict[str, Any] | None = None
+        self._shift = np.zeros(0)
+        self._sums = np.zeros(0)
+        self._cross = np.zeros((0, 0))
+        self._equity = np.zeros(0)
+        self._peak = np.zeros(0)
+        self._max_dd = np.zeros(0)
+
+    @property
+    def last_date(self) -> date | None:
+        """Last trade date folded into the statistics."""
+        if self.pnl_frame.empty:
+            return None
+        last: date = pd.Timestamp(self.pnl_frame.index[-1]).date()
+        return last
+
+    def extend(self, block: pd.DataFrame) -> None:
+        """Fold rows dated after ``last_date`` into the statistics.
+
+        Args:
+            block: Pivoted P&L (trade_date index, strategy columns) whose
+                columns are a subset of ``columns`` (or the first block).
+        """
+        if block.empty:
+            return
+        if self.n == 0:
+            self.columns = tuple(block.columns)
+            k = len(self.columns)
+            self._shift = block.iloc[0].to_numpy(dtype=float)
+            self._sums = np.zeros(k)
+            self._cross = np.zeros((k, k))
+            self._equity = np.zeros(k)
+            self._peak = np.zeros(k)  # zero baseline, as in ComparisonService._max_drawdown
+            self._max_dd = np.zeros(k)
+        else:
+            block = block.reindex(columns=list(self.columns), fill_value=0.0)
+
+        values = block.to_numpy(dtype=float)
+        centered = values - self._shift
+        self._sums += centered.sum(axis=0)
+        self._cross += centered.T @ centered
+        self.n += len(values)
+
+        equity = self._equity + np.cumsum(values, axis=0)
+        peaks = np.maximum(self._peak, np.maximum.accumulate(equity, axis=0))
+        self._max_dd = np.minimum(self._max_dd, (equity - peaks).min(axis=0))
+        self._equity = equity[-1]
+        self._peak = peaks[-1]
+
+        self.pnl_frame = block if self.pnl_frame.empty else pd.concat([self.pnl_frame, block])
+        self.payload = None
+
+    def _covariance(self) -> np.ndarray:
+        n = self.n
+        return (self._cross - np.outer(self._sums, self._sums) / n) / (n - 1)
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Per-strategy metrics matching ``ComparisonService._compute_metrics``."""
+        if self.n == 0:
+            return {}
+        totals = self._sums + self.n * self._shift
+        variances = np.diag(self._covariance()) if self.n >= 2 else np.zeros(len(self.columns))
+        annualizer = math.sqrt(252)
+        metrics: dict[str, dict[str, float]] = {}
+        for i, strategy_id in enumerate(self.columns):
+            volatility = math.sqrt(max(float(variances[i]), 0.0))
+            mean = float(totals[i]) / self.n
+            metrics[strategy_id] = {
+                "total_return": float(totals[i]),
+                "volatility": volatility,
+                "sharpe": float((mean / volatility) * annualizer) if volatility else 0.0,
+                "max_drawdown": float(self._max_dd[i]),
+            }
+        return metrics
+
+    def correlation_matrix(self) -> pd.DataFrame:
+        """Pearson correlation matrix (empty for fewer than two strategies)."""
+        k = len(self.columns)
+        if self.n == 0 or k < 2:
+            return pd.DataFrame()
+        if self.n < 2:
+            corr = np.full((k, k), np.nan)
+        else:
+            cov = self._covariance()
+            std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr = np.clip(cov / np.outer(std, std), -1.0, 1.0)
+            flat = std == 0
+            corr[flat, :] = np.nan
+            corr[:, flat] = np.nan
+            np.fill_diagonal(corr, np.where(flat, np.nan, 1.0))
+        index = pd.Index(self.columns, name="strategy_id")
+        return pd.DataFrame(corr, index=index, columns=index.copy())
+
+
+class DailyReturnsCube:
+    """Process-wide per-strategy daily P&L with incremental refresh.
+
+    Example:
+        cube = get_returns_cube()
+        await cube.refresh(scoped_access, ["s1", "s2"], date_from, date_to)
+        stats = cube.selection(["s1", "s2"], date_from, date_to)
+    """
+
+    def __init__(
+        self,
+        selection_cache_size: int = CUBE_SELECTION_CACHE_SIZE,
+        tail_refresh_seconds: float = CUBE_TAIL_REFRESH_SECONDS,
+        coverage_ttl_seconds: float = CUBE_COVERAGE_TTL_SECONDS,
+    ) -> None:
+        """Initialize an empty cube.
+
+        Args:
+            selection_cache_size: Max (selection, range) statistics kept (LRU).
+            tail_refresh_seconds: How long the newest covered days are trusted
+                before being re-fetched.
+            coverage_ttl_seconds: How long any covered day is trusted before
+                the strategy's coverage is dropped and re-fetched.
+        """
+        self.selection_cache_size = selection_cache_size
+        self.tail_refresh_seconds = tail_refresh_seconds
+        self.coverage_ttl_seconds = coverage_ttl_seconds
+        self._series: dict[str, _StrategySeries] = {}
+        self._selections: OrderedDict[tuple[Any, ...], SelectionStats] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def refresh(
+        self,
+        scoped_access: Any,
+        strategy_ids: Sequence[str],
+        date_from: date,
+        date_to: date,
+    ) -> int:
+        """Fetch the windows of ``[date_from, date_to]`` the cube cannot serve.
+
+        The scoped query returns every authorized strategy, so each fetched
+        window becomes complete for all of them, not just the selection.
+
+        Args:
+            scoped_access: StrategyScopedDataAccess of the current user.
+            strategy_ids: Selected (authorized) strategies.
+            date_from: Range start (inclusive).
+            date_to: Range end (inclusive).
+
+        Returns:
+            Number of P&L rows fetched.
+        """
+        fetched = 0
+        authorized = list(scoped_access.authorized_strategies)
+        for start, end in self._missing_windows(strategy_ids, date_from, date_to):
+            rows = await _fetch_pnl_rows(scoped_access, start, end)
+            self._apply(authorized, start, end, rows)
+            fetched += len(rows)
+        return fetched
+
+    def selection(
+        self, strategy_ids: Sequence[str], date_from: date, date_to: date
+    ) -> SelectionStats:
+        """Return up-to-date statistics for a selection, updating them incrementally.
+
+        Rows dated after the statistics' last folded day are appended; a
+        change on or before that day (restatement) triggers a rebuild.
+        """
+        key = (tuple(strategy_ids), date_from, date_to)
+        with self._lock:
+            stats = self._selections.get(key)
+            if stats is None:
+                stats = SelectionStats(strategy_ids, date_from, date_to)
+                self._rebuild(stats)
+                self._selections[key] = stats
+                while len(self._selections) > self.selection_cache_size:
+                    self._selections.popitem(last=False)
+            else:
+                self._selections.move_to_end(key)
+                self._update(stats)
+            return stats
+
+    def invalidate(self, strategy_ids: Iterable[str] | None = None) -> None:
+        """Forget cached P&L (all strategies when ``strategy_ids`` is None)."""
+        with self._lock:
+            if strategy_ids is None:
+                self._series.clear()
+                self._selections.clear()
+                return
+            for strategy_id in strategy_ids:
+                self._series.pop(strategy_id, None)
+            for key in [k for k in self._selections if set(k[0]) & set(strategy_ids)]:
+                del self._selections[key]
+
+    # ----------------------------------------------------------------- helpers
+    def _missing_windows(
+        self, strategy_ids: Sequence[str], date_from: date, date_to: date
+    ) -> list[tuple[date, date]]:
+        """Date windows to fetch so every selected strategy covers the range."""
+        date_to = min(date_to, date.today())  # later days cannot have P&L yet
+        if date_to < date_from:
+            return []
+        now = time.monotonic()
+        with self._lock:
+            for sid in strategy_ids:
+                series = self._series.get(sid)
+                if series is None or series.coverage is None:
+                    continue
+                if now - series.coverage.verified_at >= self.coverage_ttl_seconds:
+                    # Expired: values are kept until the re-fetch replaces them
+                    series.coverage = None
+            covs = [
+                self._series[sid].coverage if sid in self._series else None for sid in strategy_ids
+            ]
+        if any(cov is None for cov in covs):
+            return [(date_from, date_to)]
+        known = [cov for cov in covs if cov is not None]
+        lo = max(cov.start for cov in known)
+        hi = min(cov.end for cov in known)
+        if lo > hi or lo > date_to or hi < date_from:
+            return [(date_from, date_to)]
+
+        windows: list[tuple[date, date]] = []
+        if date_from < lo:
+            windows.append((date_from, lo - _ONE_DAY))
+        tail_start: date | None = hi + _ONE_DAY if date_to > hi else None
+        stale = any(now - cov.refreshed_at >= self.tail_refresh_seconds for cov in known)
+        restate_from = hi - timedelta(days=CUBE_RESTATEMENT_DAYS)
+        if stale and date_to >= restate_from:
+            tail_start = max(date_from, restate_from)
+        if tail_start is not None:
+            windows.append((tail_start, date_to))
+        return windows
+
+    def _apply(
+        self,
+        authorized: Sequence[str],
+        start: date,
+        end: date,
+        rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """Replace ``[start, end]`` for all authorized strategies with ``rows``."""
+        points: dict[str, dict[pd.Timestamp, float]] = {}
+        for row in rows:
+            strategy_id = row.get("strategy_id")
+            trade_date = row.get("trade_date")
+            if not isinstance(strategy_id, str) or trade_date is None:
+                continue
+            pnl = row.get("daily_pnl")
+            value = 0.0 if pnl is None else float(pnl)
+            if math.isnan(value):
+                value = 0.0
+            day = pd.Timestamp(trade_date)
+            series_points = points.setdefault(strategy_id, {})
+            series_points[day] = series_points.get(day, 0.0) + value
+
+        now = time.monotonic()
+        covered_to = min(end, date.today())
+        with self._lock:
+            for strategy_id in set(authorized) | set(points):
+                series = self._series.setdefault(strategy_id, _StrategySeries())
+                series.replace_range(start, end, points.get(strategy_id, {}))
+                series.extend_coverage(start, covered_to, now)
+
+    def _frame(self, strategy_ids: Sequence[str], start: date, end: date) -> pd.DataFrame:
+        """Pivot of the selection's P&L in ``[start, end]`` (dates any strategy traded)."""
+        lo, hi = pd.Timestamp(start), pd.Timestamp(end)
+        columns = {
+            sid: self._series[sid].values.loc[lo:hi]
+            for sid in strategy_ids
+            if sid in self._series and len(self._series[sid].values.loc[lo:hi])
+        }
+        if not columns:
+            return pd.DataFrame()
+        frame = pd.DataFrame(columns).sort_index().fillna(0.0)
+        frame.index.name = "trade_date"
+        frame.columns.name = "strategy_id"
+        return frame
+
+    def _current_versions(self, strategy_ids: Sequence[str]) -> dict[str, int]:
+        return {
+            sid: self._series[sid].version if sid in self._series else 0 for sid in strategy_ids
+        }
+
+    def _rebuild(self, stats: SelectionStats) -> None:
+        stats.reset()
+        stats.extend(self._frame(stats.strategy_ids, stats.date_from, stats.date_to))
+        stats.versions = self._current_versions(stats.strategy_ids)
+
+    def _update(self, stats: SelectionStats) -> None:
+        changes = [
+            self._series[sid].changed_since(stats.versions.get(sid, 0))
+            for sid in stats.strategy_ids
+            if sid in self._series
+        ]
+        earliest = min((d for d in changes if d is not None), default=None)
+        if earliest is None:
+            return
+        last = stats.last_date
+        if last is None or earliest <= last:
+            self._rebuild(stats)
+            return
+        block = self._frame(stats.strategy_ids, last + _ONE_DAY, stats.date_to)
+        if set(block.columns) - set(stats.columns):
+            self._rebuild(stats)  # a strategy's first day in range: column set changes
+            return
+        stats.extend(block)
+        stats.versions = self._current_versions(stats.strategy_ids)
+
+
+async def _fetch_pnl_rows(scoped_access: Any, start: date, end: date) -> list[dict[str, Any]]:
+    """Fetch every P&L row in ``[start, end]``, paging with the keyset cursor."""
+    limit = StrategyScopedDataAccess.MAX_LIMIT
+    rows: list[dict[str, Any]] = []
+    cursor: str | None = None
+    while True:
+        page = await scoped_access.get_pnl_summary(start, end, limit=limit, cursor=cursor)
+        rows.extend(page)
+        cursor = next_page_cursor("pnl", page, limit)
+        if cursor is None:
+            return rows
+
+
+_CUBE: DailyReturnsCube | None = None
+_CUBE_LOCK = threading.Lock()
+
+
+def get_returns_cube() -> DailyReturnsCube:
+    """Return the process-wide cube, creating it on first use."""
+    global _CUBE
+    with _CUBE_LOCK:
+        if _CUBE is None:
+            _CUBE = DailyReturnsCube()
+        return _CUBE
+
+
+__all__ = [
+    "CUBE_COVERAGE_TTL_SECONDS",
+    "CUBE_RESTATEMENT_DAYS",
+    "CUBE_SELECTION_CACHE_SIZE",
+    "CUBE_TAIL_REFRESH_SECONDS",
+    "DailyReturnsCube",
+    "SelectionStats",
+    "get_returns_cube",
+]
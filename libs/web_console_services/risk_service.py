@@ -14,9 +14,11 @@ Data Sources:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import date, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from libs.trading.risk.factor_covariance import CANONICAL_FACTOR_ORDER
@@ -37,6 +39,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Process-wide: artifact dir -> BarraRiskModel backed by memory-mapped arrays
+_risk_model_cache: dict[Path, Any] = {}
+
 
 @dataclass
 class RiskDashboardData:
@@ -78,16 +83,18 @@ class RiskService:
     from async_helpers.py when calling from sync Streamlit code.
     """
 
-    # Pre-computed risk model artifacts paths (relative to data/)
-    RISK_ARTIFACTS_PATH = "artifacts/risk"
-
-    def __init__(self, scoped_access: StrategyScopedDataAccess):
+    def __init__(
+        self, scoped_access: StrategyScopedDataAccess, data_root: Path | None = None
+    ) -> None:
         """Initialize risk service with scoped data access.
 
         Args:
             scoped_access: StrategyScopedDataAccess instance with user context
+            data_root: Data root holding published risk artifacts
+                (defaults to ``DATA_ROOT``)
         """
         self._scoped_access = scoped_access
+        self._data_root = data_root
 
     async def get_risk_dashboard_data(self) -> RiskDashboardData:
         """Fetch all risk data for dashboard.
@@ -266,20 +273,32 @@ class RiskService:
         - Factor loadings for all stocks
         - Specific risk estimates
 
-        These are computed by the risk pipeline (T2.2/T2.3) and stored
-        in data/analytics/.
+        These are computed by the risk pipeline (T2.2/T2.3) and published
+        as a CompiledRiskModel under {data_root}/artifacts/risk/.
 
         Returns:
             BarraRiskModel instance or None if not available
         """
-        # In production, this would load from parquet files:
-        # - data/analytics/factor_covariance.parquet
-        # - data/analytics/factor_loadings.parquet
-        # - data/analytics/specific_risk.parquet
-        #
-        # For MVP, return None to indicate model not available.
-        # The dashboard will show appropriate messaging.
-        return None
+        # Compiled artifacts are memory-mapped read-only, so every worker
+        # shares one page-cache copy and requests skip re-alignment.
+        # Returns None (dashboard shows placeholder messaging) until the
+        # risk pipeline has published an artifact.
+        from libs.trading.risk.barra_model import BarraRiskModel
+        from libs.trading.risk.compiled_model import CompiledRiskModel, risk_artifacts_dir
+
+        artifact_dir = await asyncio.to_thread(
+            CompiledRiskModel.find_latest, risk_artifacts_dir(self._data_root)
+        )
+        if artifact_dir is None:
+            return None
+
+        cached = _risk_model_cache.get(artifact_dir)
+        if cached is None:
+            compiled = await asyncio.to_thread(CompiledRiskModel.load, artifact_dir)
+            cached = BarraRiskModel.from_compiled(compiled)
+            _risk_model_cache.clear()  # only the latest version is kept
+            _risk_model_cache[artifact_dir] = cached
+        return cached
 
     async def _run_stress_tests(
         self, weights: dict[str, float]
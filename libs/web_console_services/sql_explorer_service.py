@@ -1,4 +1,9 @@
-"""SQL Explorer service with defense-in-depth query controls."""
+"""SQL Explorer service with defense-in-depth query controls.
+
+Scoped queries run on pooled, long-lived DuckDB connections whose views are
+registered once per view-set version, and successful results are served from
+an Arrow result cache (see ``duckdb_query_executor``).
+"""
 
 from __future__ import annotations
 
@@ -33,6 +38,12 @@ from libs.platform.web_console_auth.permissions import (
     has_permission,
 )
 from libs.platform.web_console_auth.rate_limiter import RateLimiter
+from libs.web_console_services.duckdb_query_executor import (
+    DuckDBConnectionPool,
+    QueryResultCache,
+    query_cache_key,
+    view_set_version,
+)
 from libs.web_console_services.sql_validator import DATASET_TABLES, SQLValidator
 
 logger = logging.getLogger(__name__)
@@ -46,6 +57,10 @@ _MAX_CONCURRENT_QUERIES = 3
 _QUERY_RATE_LIMIT = 10
 _EXPORT_RATE_LIMIT = 5
 _MAX_CELLS = 1_000_000
+_MAX_IDLE_QUERY_CONNECTIONS = 2 * _MAX_CONCURRENT_QUERIES
+_RESULT_CACHE_MAX_ENTRIES = 128
+_RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_RESULT_CACHE_TTL_SECONDS = 300.0
 _MAX_ALPACA_SIP_MANIFEST_PATH_CACHE_ENTRIES = 64
 _ALPACA_SIP_MANIFEST_FAILURE_CACHE_TTL_SECONDS = 5.0
 _DUCKDB_LOCKDOWN_MIN_VERSION = (1, 4, 0)
@@ -256,6 +271,14 @@ _active_queries = 0
 _active_queries_lock = asyncio.Lock()
 _sandbox_probe_result: tuple[float, bool, tuple[str, ...]] | None = None
 _sandbox_probe_lock = threading.Lock()
+_query_connection_pool: DuckDBConnectionPool[duckdb.DuckDBPyConnection] = DuckDBConnectionPool(
+    max_idle=_MAX_IDLE_QUERY_CONNECTIONS
+)
+_query_result_cache = QueryResultCache(
+    max_entries=_RESULT_CACHE_MAX_ENTRIES,
+    max_bytes=_RESULT_CACHE_MAX_BYTES,
+    ttl_seconds=_RESULT_CACHE_TTL_SECONDS,
+)
 
 
 class SensitiveTableAccessError(ValueError):
@@ -593,6 +616,66 @@ def _resolve_alpaca_sip_corp_actions_paths(data_root: str) -> _TablePathSpec:
     )
 
 
+def _resolve_wrds_sync_paths(
+    data_root: str,
+    dataset: str,
+    storage_subdir: str | None = None,
+) -> _RawTablePathSpec:
+    """Return a WRDS sync manifest's base and delta partitions, else the base glob.
+
+    Incremental syncs register delta partitions under ``deltas/`` (and
+    compaction writes versioned bases) through the manifest, so the base glob
+    is only correct before the first manifest-tracked sync.
+
+    Args:
+        data_root: Resolved ``data/`` directory.
+        dataset: Sync dataset name (also the manifest name).
+        storage_subdir: Storage directory under ``wrds/`` when it differs
+            from the dataset name (e.g. ``crsp/daily``); manifest paths may
+            live under either directory.
+    """
+    data_root_path = _Path(data_root)
+    wrds_root = data_root_path / "wrds"
+    storage_root = (wrds_root / (storage_subdir or dataset)).resolve()
+    allowed_roots = {storage_root, (wrds_root / dataset).resolve()}
+    fallback_path_spec = f"{storage_root}/*.parquet"
+    manifest_path = data_root_path / "manifests" / f"{dataset}.json"
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return fallback_path_spec
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning(
+            "sql_explorer_wrds_manifest_unreadable",
+            extra={"manifest_path": str(manifest_path), "error": str(exc)},
+        )
+        return fallback_path_spec
+
+    file_paths = manifest.get("file_paths") if isinstance(manifest, dict) else None
+    resolved_paths: list[str] = []
+    if isinstance(file_paths, list):
+        for raw_path in file_paths:
+            if not isinstance(raw_path, str):
+                break
+            path = _Path(raw_path)
+            # Sync manifests record paths relative to the project root
+            resolved = (path if path.is_absolute() else data_root_path.parent / path).resolve()
+            if resolved.suffix != ".parquet" or not any(
+                resolved.is_relative_to(root) for root in allowed_roots
+            ):
+                break
+            resolved_paths.append(str(resolved))
+        else:
+            if resolved_paths:
+                return tuple(sorted(resolved_paths))
+
+    logger.warning(
+        "sql_explorer_wrds_manifest_invalid_file_paths",
+        extra={"manifest_path": str(manifest_path)},
+    )
+    return fallback_path_spec
+
+
 def _duckdb_read_parquet_arg(path_spec: _TablePathSpec) -> str:
     """Build a safe DuckDB read_parquet argument from validated path specs."""
     raw_path_spec = _raw_path_spec(path_spec)
@@ -648,10 +731,10 @@ def _resolve_table_paths() -> dict[str, _TablePathSpec]:
 
     data_root = str((_PROJECT_ROOT / "data").resolve())
     return {
-        "crsp_daily": f"{data_root}/wrds/crsp/daily/*.parquet",
-        "crsp_monthly": f"{data_root}/wrds/crsp/monthly/*.parquet",
-        "compustat_annual": f"{data_root}/wrds/compustat_annual/*.parquet",
-        "compustat_quarterly": f"{data_root}/wrds/compustat_quarterly/*.parquet",
+        "crsp_daily": _resolve_wrds_sync_paths(data_root, "crsp_daily", "crsp/daily"),
+        "crsp_monthly": _resolve_wrds_sync_paths(data_root, "crsp_monthly", "crsp/monthly"),
+        "compustat_annual": _resolve_wrds_sync_paths(data_root, "compustat_annual"),
+        "compustat_quarterly": _resolve_wrds_sync_paths(data_root, "compustat_quarterly"),
         "ff_factors_daily": f"{data_root}/fama_french/factors/factors_*_daily.parquet",
         "ff_factors_monthly": f"{data_root}/fama_french/factors/factors_*_monthly.parquet",
         "taq_trades": f"{data_root}/taq/aggregates/1min_bars/*.parquet",
@@ -955,7 +1038,11 @@ async def _execute_query_callable_with_timeout(
     timeout_seconds: int,
     interrupt: Callable[[], None],
 ) -> pl.DataFrame:
-    """Execute query work with bounded concurrency and cooperative timeout cleanup."""
+    """Execute query work with bounded concurrency and cooperative timeout cleanup.
+
+    Cancelling the awaiting task interrupts the running query the same way a
+    timeout does, so abandoned queries stop consuming a DuckDB worker.
+    """
 
     global _active_queries
 
@@ -983,7 +1070,7 @@ async def _execute_query_callable_with_timeout(
         task = asyncio.create_task(asyncio.to_thread(run_query))
         try:
             return await asyncio.wait_for(asyncio.shield(task), timeout=clamped_timeout)
-        except TimeoutError as exc:
+        except (TimeoutError, asyncio.CancelledError) as exc:
             if not task.done():
                 try:
                     interrupt()
@@ -991,6 +1078,8 @@ async def _execute_query_callable_with_timeout(
                     logger.warning("duckdb_interrupt_failed", extra={"timeout": clamped_timeout})
                 asyncio.create_task(_release_slot_after_cleanup(task))
                 acquired_slot = False
+            if isinstance(exc, asyncio.CancelledError):
+                raise
             raise TimeoutError("SQL query timed out") from exc
     finally:
         if acquired_slot:
@@ -1014,8 +1103,35 @@ async def _execute_query_with_timeout(
     )
 
 
+def _scoped_view_version(
+    dataset: str,
+    available_tables: set[str],
+    table_paths: dict[str, TablePathSpec] | None,
+) -> str:
+    """Enforce execution checks and version the views a scoped query would use."""
+    ensure_sql_explorer_execution_allowed()
+    resolved_table_paths = _resolve_table_paths() if table_paths is None else table_paths
+    view_paths = []
+    for table_name in DATASET_TABLES.get(dataset, ()):
+        path_spec = resolved_table_paths.get(table_name)
+        if table_name in available_tables and path_spec is not None:
+            view_paths.append((table_name, _raw_path_spec(path_spec)))
+    return view_set_version(dataset, view_paths)
+
+
+def _clear_query_executor_state() -> None:
+    """Drop cached results and close idle pooled connections."""
+    _query_result_cache.clear()
+    _query_connection_pool.clear()
+
+
 class _ScopedQueryRunner:
-    """Own a scoped DuckDB connection inside the worker thread that executes it."""
+    """Run a scoped query on a pooled DuckDB connection inside the worker thread.
+
+    Connections are checked back into the pool for their view-set version
+    unless the query was interrupted or DuckDB reported the database as
+    unusable, in which case the connection is closed in the worker thread.
+    """
 
     def __init__(
         self,
@@ -1023,37 +1139,48 @@ class _ScopedQueryRunner:
         dataset: str,
         available_tables: set[str],
         table_paths: dict[str, TablePathSpec] | None,
+        view_version: str,
         sql: str,
         parameters: Sequence[Any] | None,
     ) -> None:
         self._dataset = dataset
         self._available_tables = available_tables
         self._table_paths = table_paths
+        self._view_version = view_version
         self._sql = sql
         self._parameters = parameters
         self._conn: duckdb.DuckDBPyConnection | None = None
         self._conn_lock = threading.Lock()
         self._interrupt_requested = threading.Event()
 
-    def run(self) -> pl.DataFrame:
-        conn = create_scoped_query_connection(
+    def _open_connection(self) -> duckdb.DuckDBPyConnection:
+        return create_scoped_query_connection(
             self._dataset,
             available_tables=self._available_tables,
             table_paths=self._table_paths,
         )
+
+    def run(self) -> pl.DataFrame:
+        conn = _query_connection_pool.checkout(self._view_version, self._open_connection)
         with self._conn_lock:
             self._conn = conn
+        reusable = True
         try:
             if self._interrupt_requested.is_set():
                 conn.interrupt()
             return _query_frame_from_connection(conn, self._sql, self._parameters)
+        except (duckdb.FatalException, duckdb.InternalException):
+            reusable = False
+            raise
         finally:
-            try:
-                conn.close()
-            finally:
-                with self._conn_lock:
-                    if self._conn is conn:
-                        self._conn = None
+            with self._conn_lock:
+                if self._conn is conn:
+                    self._conn = None
+            _query_connection_pool.checkin(
+                self._view_version,
+                conn,
+                reusable=reusable and not self._interrupt_requested.is_set(),
+            )
 
     def interrupt(self) -> None:
         self._interrupt_requested.set()
@@ -1072,20 +1199,37 @@ async def execute_scoped_query_frame_with_timeout(
     table_paths: dict[str, TablePathSpec] | None = None,
     parameters: Sequence[Any] | None = None,
 ) -> pl.DataFrame:
-    """Execute a scoped DuckDB query while owning close in the query worker thread."""
+    """Execute a scoped DuckDB query on a pooled connection, serving repeats from cache.
+
+    Cache hits skip the concurrency slot entirely; the cache key covers the
+    normalized SQL, parameters, the caller's table scope and the view-set
+    version, so a data refresh yields a new key.
+    """
+
+    view_version = await asyncio.to_thread(
+        _scoped_view_version, dataset, available_tables, table_paths
+    )
+    cache_key = query_cache_key(sql, parameters, scope=available_tables, view_version=view_version)
+    cached = _query_result_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("sql_query_result_cache_hit", extra={"dataset": dataset})
+        return cached
 
     runner = _ScopedQueryRunner(
         dataset=dataset,
         available_tables=available_tables,
         table_paths=table_paths,
+        view_version=view_version,
         sql=sql,
         parameters=parameters,
     )
-    return await _execute_query_callable_with_timeout(
+    frame = await _execute_query_callable_with_timeout(
         runner.run,
         timeout_seconds,
         runner.interrupt,
     )
+    _query_result_cache.put(cache_key, frame)
+    return frame
 
 
 async def execute_scoped_query_with_timeout(
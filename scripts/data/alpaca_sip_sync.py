@@ -81,6 +81,8 @@ def _manager(
     throttle_seconds: float,
     feed: str,
     adjustment: str,
+    max_concurrency: int = 1,
+    requests_per_minute: int | None = None,
 ) -> AlpacaSIPSyncManager:
     _load_dotenv()
     return AlpacaSIPSyncManager.from_env(
@@ -91,6 +93,8 @@ def _manager(
         request_interval_seconds=throttle_seconds,
         feed=feed,
         adjustment=adjustment,
+        max_concurrent_requests=max_concurrency,
+        requests_per_minute=requests_per_minute,
     )
 
 
@@ -102,6 +106,8 @@ def _run_full_sync(args: argparse.Namespace) -> int:
         throttle_seconds=args.throttle_seconds,
         feed=args.feed,
         adjustment=args.adjustment,
+        max_concurrency=args.max_concurrency,
+        requests_per_minute=args.requests_per_minute,
     )
     manifest = manager.full_sync(
         symbol_list,
@@ -235,6 +241,18 @@ def _build_parser() -> argparse.ArgumentParser:
     full_sync.add_argument("--storage-path", type=Path, default=STORAGE_PATH)
     full_sync.add_argument("--chunk-size", type=int, default=200)
     full_sync.add_argument("--throttle-seconds", type=float, default=0.0)
+    full_sync.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help="Symbol chunks fetched concurrently.",
+    )
+    full_sync.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=None,
+        help="Optional request-rate budget shared by all concurrent fetches.",
+    )
     full_sync.add_argument("--feed", default="sip")
     full_sync.add_argument(
         "--adjustment",
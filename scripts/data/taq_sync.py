@@ -36,6 +36,7 @@ from libs.data.data_providers.taq_storage import (  # noqa: E402
     register_taq_schemas,
 )
 from libs.data.data_providers.wrds_client import WRDSClient  # noqa: E402
+from libs.data.data_quality.checksums import FileHasher  # noqa: E402
 from libs.data.data_quality.manifest import ManifestManager  # noqa: E402
 from libs.data.data_quality.schema import SchemaRegistry  # noqa: E402
 from libs.data.data_quality.validation import DataValidator  # noqa: E402
@@ -122,13 +123,16 @@ def create_taq_manager(
     snapshot_path = Path("data/snapshots/taq")
     lock_dir = Path("data/locks")
 
-    # Create managers
+    # Create managers (checksums cached so verification skips unchanged files)
     manifest_manager = ManifestManager(storage_path=manifest_path)
+    validator = DataValidator(
+        hasher=FileHasher(cache_path=Path("data/cache/file_checksums.sqlite"))
+    )
     version_manager = DatasetVersionManager(
         manifest_manager=manifest_manager,
+        validator=validator,
         snapshots_dir=snapshot_path,
     )
-    validator = DataValidator()
     schema_registry = SchemaRegistry()
 
     # Register TAQ schemas
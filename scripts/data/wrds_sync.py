@@ -7,6 +7,7 @@ Usage:
     python scripts/wrds_sync.py incremental --dataset crsp_daily
     python scripts/wrds_sync.py incremental --all
     python scripts/wrds_sync.py status
+    python scripts/wrds_sync.py compact --all
     python scripts/wrds_sync.py verify --dataset crsp_daily
     python scripts/wrds_sync.py lock-status
     python scripts/wrds_sync.py force-unlock --dataset crsp_daily
@@ -27,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from libs.data.data_providers.locking import LockAcquisitionError
 from libs.data.data_providers.sync_manager import SyncManager
 from libs.data.data_providers.wrds_client import WRDSClient, WRDSConfig
+from libs.data.data_quality.checksums import FileHasher
 from libs.data.data_quality.manifest import ManifestManager
 from libs.data.data_quality.schema import SchemaRegistry
 from libs.data.data_quality.validation import DataValidator
@@ -69,6 +71,7 @@ WRDS_DIR = DATA_ROOT / "wrds"
 LOCK_DIR = DATA_ROOT / "locks"
 MANIFEST_DIR = DATA_ROOT / "manifests"
 SCHEMA_DIR = DATA_ROOT / "schemas"
+CHECKSUM_CACHE = DATA_ROOT / "cache" / "file_checksums.sqlite"
 
 # Known datasets
 DATASETS = ["crsp_daily", "compustat_annual", "compustat_quarterly", "fama_french"]
@@ -84,7 +87,7 @@ def get_sync_manager() -> tuple[SyncManager, WRDSClient]:
         storage_path=MANIFEST_DIR,
         lock_dir=LOCK_DIR,
     )
-    validator = DataValidator()
+    validator = DataValidator(hasher=FileHasher(cache_path=CHECKSUM_CACHE))
     schema_registry = SchemaRegistry(
         storage_path=SCHEMA_DIR,
         lock_dir=LOCK_DIR,
@@ -183,6 +186,50 @@ def status() -> None:
             typer.echo(f"\n{ds}: Not synced")
 
 
+@app.command()
+def compact(
+    dataset: str = typer.Option(None, "--dataset", "-d", help="Dataset to compact"),
+    all_datasets: bool = typer.Option(False, "--all", help="Compact all datasets"),
+) -> None:
+    """Fold incremental delta partitions into yearly base partitions (no download)."""
+    if not dataset and not all_datasets:
+        typer.echo("Error: Specify --dataset or --all", err=True)
+        raise typer.Exit(1)
+
+    datasets = DATASETS if all_datasets else [dataset]
+
+    manifest_manager = ManifestManager(storage_path=MANIFEST_DIR, lock_dir=LOCK_DIR)
+    validator = DataValidator(hasher=FileHasher(cache_path=CHECKSUM_CACHE))
+    schema_registry = SchemaRegistry(storage_path=SCHEMA_DIR, lock_dir=LOCK_DIR)
+
+    # Create minimal manager for compaction
+    manager = SyncManager(
+        wrds_client=None,  # type: ignore  # Not needed for compaction
+        storage_path=WRDS_DIR,
+        lock_dir=LOCK_DIR,
+        manifest_manager=manifest_manager,
+        validator=validator,
+        schema_registry=schema_registry,
+    )
+
+    try:
+        for ds in datasets:
+            typer.echo(f"Compacting {ds}...")
+            try:
+                manifest = manager.compact_deltas(ds)
+                typer.echo(
+                    f"  ✓ {ds}: {manifest.row_count} rows in {len(manifest.file_paths)} files"
+                )
+            except ValueError as e:
+                typer.echo(f"  ✗ {ds}: {e}", err=True)
+    except LockAcquisitionError as err:
+        typer.echo("✗ Error: Could not acquire lock.", err=True)
+        raise typer.Exit(2) from err
+    except Exception as err:
+        typer.echo(f"✗ Error: {err}", err=True)
+        raise typer.Exit(1) from err
+
+
 @app.command()
 def verify(
     dataset: str = typer.Option(..., "--dataset", "-d", help="Dataset to verify"),
@@ -191,7 +238,7 @@ def verify(
     typer.echo(f"Verifying {dataset}...")
 
     manifest_manager = ManifestManager(storage_path=MANIFEST_DIR)
-    validator = DataValidator()
+    validator = DataValidator(hasher=FileHasher(cache_path=CHECKSUM_CACHE))
     schema_registry = SchemaRegistry(storage_path=SCHEMA_DIR)
 
     # Create minimal manager for verification
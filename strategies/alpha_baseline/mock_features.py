@@ -8,13 +8,15 @@ For production, use the full Alpha158 features from features.py with proper
 Qlib data format.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import polars as pl
 
+from libs.data.data_pipeline.adjusted_store import AdjustedStore
+
 
 def get_mock_alpha158_features(
     symbols: list[str],
@@ -41,6 +43,9 @@ def get_mock_alpha158_features(
         - This is a MOCK implementation for testing only
         - Features are simple technical indicators, not true Alpha158
         - For production, use get_alpha158_features() with proper Qlib setup
+        - Reads the lookback window for all symbols in one scan of the
+          consolidated AdjustedStore; symbols not in the store fall back to
+          the per-date partition files
     """
     # Convert date strings to date objects
     start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -50,43 +55,26 @@ def get_mock_alpha158_features(
     lookback_start = start_dt - timedelta(days=60)
 
     all_data = []
-    for symbol in symbols:
-        # Find Parquet file for this symbol
-        parquet_files = list(data_dir.rglob(f"*/{symbol}.parquet"))
-
-        if not parquet_files:
-            raise FileNotFoundError(f"No data found for symbol: {symbol}")
-
-        # Try each file until we find one with data in the target date range
-        df = None
-        for parquet_file in sorted(parquet_files, reverse=True):
-            candidate_df = pl.read_parquet(parquet_file)
-
-            # Filter to lookback period
-            filtered_df = candidate_df.filter(
-                (pl.col("date") >= pl.lit(lookback_start)) & (pl.col("date") <= pl.lit(end_dt))
-            )
-
-            # If this file has data in our date range, use it
-            if len(filtered_df) > 0:
-                df = filtered_df
-                break
-
-        if df is None or len(df) == 0:
-            raise FileNotFoundError(
-                f"No data found for symbol {symbol} in date range {lookback_start} to {end_dt}"
-            )
+    missing_symbols = list(symbols)
 
-        # Sort by date
-        df = df.sort("date")
+    store = AdjustedStore(data_dir)
+    if store.exists:
+        window = store.scan(symbols, lookback_start, end_dt)
+        if window is not None:
+            store_df = window.collect()
+            if not store_df.is_empty():
+                all_data.append(store_df)
+                found = set(store_df["symbol"].unique().to_list())
+                missing_symbols = [s for s in symbols if s not in found]
 
-        all_data.append(df)
+    for symbol in missing_symbols:
+        all_data.append(_load_symbol_from_partitions(symbol, data_dir, lookback_start, end_dt))
 
     if not all_data:
         raise ValueError("No data loaded for any symbols")
 
     # Concatenate all symbols
-    combined = pl.concat(all_data)
+    combined = pl.concat(all_data, how="diagonal_relaxed").sort(["symbol", "date"])
 
     # Convert to Pandas for easier manipulation
     pandas_df: pd.DataFrame = combined.to_pandas()
@@ -131,6 +119,40 @@ def get_mock_alpha158_features(
     return all_features
 
 
+def _load_symbol_from_partitions(
+    symbol: str, data_dir: Path, lookback_start: date, end_dt: date
+) -> pl.DataFrame:
+    """Load one symbol's window from the per-date ``*/{symbol}.parquet`` files."""
+    # Find Parquet file for this symbol
+    parquet_files = list(data_dir.glob(f"*/{symbol}.parquet"))
+
+    if not parquet_files:
+        raise FileNotFoundError(f"No data found for symbol: {symbol}")
+
+    # Try each file until we find one with data in the target date range
+    df = None
+    for parquet_file in sorted(parquet_files, reverse=True):
+        candidate_df = pl.read_parquet(parquet_file)
+
+        # Filter to lookback period
+        filtered_df = candidate_df.filter(
+            (pl.col("date") >= pl.lit(lookback_start)) & (pl.col("date") <= pl.lit(end_dt))
+        )
+
+        # If this file has data in our date range, use it
+        if len(filtered_df) > 0:
+            df = filtered_df
+            break
+
+    if df is None or len(df) == 0:
+        raise FileNotFoundError(
+            f"No data found for symbol {symbol} in date range {lookback_start} to {end_dt}"
+        )
+
+    # Sort by date
+    return df.sort("date")
+
+
 def compute_simple_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute simple technical features from OHLCV data.
@@ -380,3 +380,53 @@ class TestMainEntrypoint:
 
         # Verify worker.work() called with scheduler disabled
         mock_worker.work.assert_called_once_with(with_scheduler=False)
+
+    @patch("apps.backtest_worker.entrypoint.SnapshotMemoryStore")
+    @patch("apps.backtest_worker.entrypoint.SnapshotPreloader")
+    @patch("apps.backtest_worker.entrypoint.PreloadingWorker")
+    @patch("apps.backtest_worker.entrypoint.Worker")
+    @patch("apps.backtest_worker.entrypoint.Redis")
+    def test_main_warm_mode_preloads_before_work(
+        self,
+        mock_redis_class,
+        mock_worker_class,
+        mock_preloading_worker_class,
+        mock_preloader_class,
+        mock_store_class,
+        monkeypatch,
+    ):
+        """Test BACKTEST_WORKER_PRELOAD preloads snapshots and closes the store on exit."""
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+        monkeypatch.setenv("BACKTEST_WORKER_PRELOAD", "alpaca_sip_daily")
+
+        mock_redis_client = MagicMock()
+        mock_redis_class.from_url.return_value = mock_redis_client
+        mock_preloader = mock_preloader_class.return_value
+        mock_worker = mock_preloading_worker_class.return_value
+
+        main()
+
+        assert mock_preloader_class.call_args.args[1] == ("alpaca_sip_daily",)
+        mock_preloader.refresh.assert_called_once()
+        mock_worker_class.assert_not_called()
+        mock_preloading_worker_class.assert_called_once_with(
+            ["backtest_high", "backtest_normal", "backtest_low"],
+            connection=mock_redis_client,
+            preloader=mock_preloader,
+        )
+        mock_worker.work.assert_called_once_with(with_scheduler=False)
+        mock_store_class.return_value.close.assert_called_once()
+
+    @patch("apps.backtest_worker.entrypoint.Redis")
+    def test_main_exits_on_invalid_preload_setting(self, mock_redis_class, monkeypatch):
+        """Test an unknown preload dataset fails startup."""
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+        monkeypatch.setenv("BACKTEST_WORKER_PRELOAD", "not_a_dataset")
+        mock_redis_class.from_url.return_value = MagicMock()
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
@@ -1,18 +1,22 @@
-"""Tests for Excel export in apps/execution_gateway/routes/export.py.
+"""Tests for grid export in apps/execution_gateway/routes/export.py.
 
-Verifies that _generate_excel_content returns real grid data (not placeholders)
-and that all cell values are sanitised against formula injection.
+Verifies that streamed exports return real grid data (not placeholders),
+that all cell values are sanitised against formula injection, and that
+the download stream finalises the single-use audit record.
 """
 
 from __future__ import annotations
 
+import asyncio
 import io
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
 
 import pytest
+from fastapi import HTTPException
 
 from apps.execution_gateway.app_factory import create_mock_context
 from apps.execution_gateway.routes import export as export_module
@@ -382,22 +386,26 @@ class TestBuildOrderClause:
 
 
 # ---------------------------------------------------------------------------
-# Integration tests for _generate_excel_content
+# Integration tests for the streamed export engine
 # ---------------------------------------------------------------------------
 
 
-def _make_cursor_mock(rows: list[tuple[Any, ...]], col_names: list[str]) -> MagicMock:
-    """Create a mock cursor that returns the given rows as dicts.
+def _make_cursor_mock(
+    rows: list[tuple[Any, ...]], col_names: list[str], batch_size: int | None = None
+) -> MagicMock:
+    """Create a mock server-side cursor that returns the given rows as dicts.
 
-    The production code uses ``psycopg.rows.dict_row`` row factory, so
-    ``fetchall()`` returns a list of dicts keyed by column name.  This
-    helper converts the provided tuples into dicts for compatibility.
+    The production code uses ``psycopg.rows.dict_row`` row factory and
+    reads batches with ``fetchmany()``, so each batch is a list of dicts
+    keyed by column name.  This helper converts the provided tuples into
+    dicts and splits them into ``batch_size`` batches (one by default).
     """
     cursor = MagicMock()
     cursor.description = [(name,) for name in col_names]
-    cursor.fetchall.return_value = [
-        dict(zip(col_names, row, strict=True)) for row in rows
-    ]
+    dict_rows = [dict(zip(col_names, row, strict=True)) for row in rows]
+    size = batch_size or max(len(dict_rows), 1)
+    batches = [dict_rows[i : i + size] for i in range(0, len(dict_rows), size)]
+    cursor.fetchmany.side_effect = [*batches, []]
     cursor.__enter__ = MagicMock(return_value=cursor)
     cursor.__exit__ = MagicMock(return_value=False)
     return cursor
@@ -421,6 +429,16 @@ def _make_ctx_with_rows(
     return ctx
 
 
+def _export_file(
+    ctx: MagicMock, export_format: str = "xlsx", **plan_kwargs: Any
+) -> tuple[bytes, int]:
+    """Run the streamed export to completion; return (file bytes, row count)."""
+    plan = export_module._plan_grid_export(export_format=export_format, **plan_kwargs)
+    progress = export_module._ExportProgress()
+    content = b"".join(export_module._iter_export_chunks(ctx, plan, progress))
+    return content, progress.row_count
+
+
 @pytest.mark.asyncio()
 class TestGenerateExcelContent:
     async def test_positions_returns_real_data(self) -> None:
@@ -431,8 +449,8 @@ class TestGenerateExcelContent:
         col_names = ["symbol", "qty", "avg_entry_price", "current_price", "unrealized_pl", "realized_pl", "updated_at"]
         ctx = _make_ctx_with_rows(rows, col_names)
 
-        content, row_count = await export_module._generate_excel_content(
-            ctx=ctx,
+        content, row_count = _export_file(
+            ctx,
             grid_name="positions",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -465,8 +483,8 @@ class TestGenerateExcelContent:
         col_names = ["client_order_id", "strategy_id", "symbol", "side", "qty", "order_type", "limit_price", "stop_price", "time_in_force", "status", "filled_qty", "filled_avg_price", "created_at", "filled_at"]
         ctx = _make_ctx_with_rows(rows, col_names)
 
-        content, row_count = await export_module._generate_excel_content(
-            ctx=ctx,
+        content, row_count = _export_file(
+            ctx,
             grid_name="orders",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -484,10 +502,8 @@ class TestGenerateExcelContent:
         assert ws.cell(1, 2).value == "side"
 
     async def test_unsupported_grid_raises(self) -> None:
-        ctx = create_mock_context()
         with pytest.raises(NotImplementedError, match="not implemented"):
-            await export_module._generate_excel_content(
-                ctx=ctx,
+            export_module._plan_grid_export(
                 grid_name="unknown_grid",
                 strategy_ids=["alpha"],
                 filter_params=None,
@@ -498,8 +514,8 @@ class TestGenerateExcelContent:
     async def test_empty_result_returns_zero_row_count(self) -> None:
         ctx = _make_ctx_with_rows([], ["symbol", "qty", "avg_entry_price", "current_price", "unrealized_pl", "realized_pl", "updated_at"])
 
-        content, row_count = await export_module._generate_excel_content(
-            ctx=ctx,
+        content, row_count = _export_file(
+            ctx,
             grid_name="positions",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -515,8 +531,8 @@ class TestGenerateExcelContent:
         col_names = ["symbol", "qty", "avg_entry_price", "current_price", "unrealized_pl", "realized_pl", "updated_at"]
         ctx = _make_ctx_with_rows(rows, col_names)
 
-        content, _ = await export_module._generate_excel_content(
-            ctx=ctx,
+        content, _ = _export_file(
+            ctx,
             grid_name="positions",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -550,8 +566,8 @@ class TestGenerateExcelContent:
         ]
         ctx = _make_ctx_with_rows(rows, col_names)
 
-        content, _ = await export_module._generate_excel_content(
-            ctx=ctx,
+        content, _ = _export_file(
+            ctx,
             grid_name="positions",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -594,8 +610,8 @@ class TestGenerateExcelContent:
         ]
         ctx = _make_ctx_with_rows(rows, col_names)
 
-        content, _ = await export_module._generate_excel_content(
-            ctx=ctx,
+        content, _ = _export_file(
+            ctx,
             grid_name="positions",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -624,8 +640,8 @@ class TestGenerateExcelContent:
         ctx = create_mock_context()
         ctx.db.transaction.return_value = conn
 
-        _content, row_count = await export_module._generate_excel_content(
-            ctx=ctx,
+        _content, row_count = _export_file(
+            ctx,
             grid_name="orders",
             strategy_ids=["alpha"],
             filter_params={"symbol": {"filterType": "text", "type": "equals", "filter": "AAPL"}},
@@ -655,8 +671,8 @@ class TestGenerateExcelContent:
         ctx = create_mock_context()
         ctx.db.transaction.return_value = conn
 
-        _content, _row_count = await export_module._generate_excel_content(
-            ctx=ctx,
+        _content, _row_count = _export_file(
+            ctx,
             grid_name="orders",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -678,8 +694,8 @@ class TestGenerateExcelContent:
         col_names = ["id", "timestamp", "user_id", "action", "details", "reason"]
         ctx = _make_ctx_with_rows(rows, col_names)
 
-        _, row_count = await export_module._generate_excel_content(
-            ctx=ctx,
+        _, row_count = _export_file(
+            ctx,
             grid_name="audit",
             strategy_ids=["alpha"],
             filter_params=None,
@@ -688,3 +704,247 @@ class TestGenerateExcelContent:
         )
 
         assert row_count == 3
+
+
+_FILL_COLUMNS = ["trade_id", "client_order_id", "strategy_id", "symbol", "side", "qty", "price", "executed_at"]
+
+
+def _fill_rows(count: int) -> list[tuple[Any, ...]]:
+    return [
+        (f"t-{i}", f"ord-{i}", "alpha", "AAPL", "buy", Decimal("1"), Decimal("150"), datetime(2026, 1, 1, tzinfo=UTC))
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio()
+class TestStreamedExport:
+    async def test_rows_read_in_batches_from_named_cursor(self) -> None:
+        cursor = _make_cursor_mock(_fill_rows(3), _FILL_COLUMNS, batch_size=1)
+        conn = _make_conn_mock(cursor)
+        ctx = create_mock_context()
+        ctx.db.transaction.return_value = conn
+
+        content, row_count = _export_file(
+            ctx,
+            grid_name="fills",
+            strategy_ids=["alpha"],
+            filter_params=None,
+            visible_columns=None,
+            sort_model=None,
+        )
+
+        assert row_count == 3
+        assert cursor.fetchmany.call_count == 4
+        assert conn.cursor.call_args.kwargs["name"] == "fills_export"
+        assert cursor.itersize == export_module._EXPORT_BATCH_SIZE
+
+        from openpyxl import load_workbook
+
+        ws = load_workbook(io.BytesIO(content)).active
+        assert [row[0] for row in ws.iter_rows(values_only=True)] == [
+            "trade_id", "t-0", "t-1", "t-2",
+        ]
+
+    @pytest.mark.parametrize(
+        ("export_format", "expected_limit"),
+        [("xlsx", export_module.XLSX_MAX_DATA_ROWS), ("csv", 5_000_000), ("parquet", 5_000_000)],
+    )
+    async def test_row_limit_follows_format(self, export_format: str, expected_limit: int) -> None:
+        plan = export_module._plan_grid_export(
+            grid_name="audit",
+            strategy_ids=["alpha"],
+            filter_params=None,
+            visible_columns=None,
+            sort_model=None,
+            export_format=export_format,
+        )
+
+        assert plan.params[-1] == expected_limit
+
+    async def test_csv_export_sanitised(self) -> None:
+        rows = [("t-1", "ord-1", "alpha", "=HYPERLINK(x)", "buy", Decimal("2"), Decimal("1.5"), datetime(2026, 1, 1, 9, 30, tzinfo=UTC))]
+        ctx = _make_ctx_with_rows(rows, _FILL_COLUMNS)
+
+        content, row_count = _export_file(
+            ctx,
+            export_format="csv",
+            grid_name="fills",
+            strategy_ids=["alpha"],
+            filter_params=None,
+            visible_columns=["symbol", "qty", "executed_at"],
+            sort_model=None,
+        )
+
+        assert row_count == 1
+        assert content.decode().splitlines() == [
+            "symbol,qty,executed_at",
+            "'=HYPERLINK(x),2,2026-01-01T09:30:00",
+        ]
+
+    async def test_parquet_export_preserves_types(self) -> None:
+        import pyarrow.parquet as pq
+
+        ctx = _make_ctx_with_rows(_fill_rows(2), _FILL_COLUMNS)
+
+        content, row_count = _export_file(
+            ctx,
+            export_format="parquet",
+            grid_name="fills",
+            strategy_ids=["alpha"],
+            filter_params=None,
+            visible_columns=["trade_id", "qty", "executed_at"],
+            sort_model=None,
+        )
+
+        table = pq.read_table(io.BytesIO(content))
+        assert row_count == 2
+        assert table.column_names == ["trade_id", "qty", "executed_at"]
+        assert table.column("qty").to_pylist() == [1.0, 1.0]
+        assert table.column("executed_at").to_pylist()[0] == datetime(2026, 1, 1)
+
+
+def _start_stream(
+    ctx: MagicMock, chunks: list[bytes], rows_per_chunk: int = 1
+) -> tuple[Any, list[str]]:
+    progress = export_module._ExportProgress()
+    events: list[str] = []
+
+    def produce() -> Any:
+        try:
+            for chunk in chunks:
+                progress.row_count += rows_per_chunk
+                yield chunk
+        finally:
+            events.append("closed")
+
+    plan = export_module._plan_grid_export(
+        grid_name="fills",
+        strategy_ids=["alpha"],
+        filter_params=None,
+        visible_columns=None,
+        sort_model=None,
+    )
+    pump = export_module._ExportChunkPump(produce())
+    first = pump.next_chunk()
+    stream = export_module._stream_export(
+        ctx, UUID(int=1), "user-1", plan, pump, first, progress,
+    )
+    return stream, events
+
+
+@pytest.mark.asyncio()
+class TestStreamExport:
+    async def test_audit_completed_after_last_chunk(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        complete = AsyncMock()
+        fail = AsyncMock()
+        monkeypatch.setattr(export_module, "_complete_and_expire_export_audit", complete)
+        monkeypatch.setattr(export_module, "_fail_export_audit", fail)
+        ctx = create_mock_context()
+        stream, events = _start_stream(ctx, [b"a", b"b", b"c"])
+
+        received = [chunk async for chunk in stream]
+
+        assert received == [b"a", b"b", b"c"]
+        complete.assert_awaited_once_with(ctx=ctx, audit_id=UUID(int=1), actual_row_count=3)
+        fail.assert_not_awaited()
+        assert events == ["closed"]
+
+    async def test_interrupted_download_fails_audit_and_closes_cursor(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        complete = AsyncMock()
+        fail = AsyncMock()
+        monkeypatch.setattr(export_module, "_complete_and_expire_export_audit", complete)
+        monkeypatch.setattr(export_module, "_fail_export_audit", fail)
+        ctx = create_mock_context()
+        stream, events = _start_stream(ctx, [b"a", b"b", b"c"])
+
+        assert await stream.__anext__() == b"a"
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+
+        complete.assert_not_awaited()
+        fail.assert_awaited_once()
+        assert "interrupted" in fail.await_args.args[2]
+        assert events == ["closed"]
+
+    async def test_error_mid_stream_fails_audit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fail = AsyncMock()
+        monkeypatch.setattr(export_module, "_complete_and_expire_export_audit", AsyncMock())
+        monkeypatch.setattr(export_module, "_fail_export_audit", fail)
+        ctx = create_mock_context()
+        pump = MagicMock()
+        pump.next_chunk.side_effect = RuntimeError("connection lost")
+        plan = export_module._plan_grid_export(
+            grid_name="fills",
+            strategy_ids=["alpha"],
+            filter_params=None,
+            visible_columns=None,
+            sort_model=None,
+        )
+        stream = export_module._stream_export(
+            ctx, UUID(int=1), "user-1", plan, pump, b"head", export_module._ExportProgress(),
+        )
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            _ = [chunk async for chunk in stream]
+
+        fail.assert_awaited_once_with(ctx, UUID(int=1), "RuntimeError: connection lost")
+
+    async def test_stalled_client_expires_export(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fail = AsyncMock()
+        monkeypatch.setattr(export_module, "_complete_and_expire_export_audit", AsyncMock())
+        monkeypatch.setattr(export_module, "_fail_export_audit", fail)
+        monkeypatch.setattr(export_module, "_EXPORT_IDLE_TIMEOUT_SECONDS", 0.01)
+        ctx = create_mock_context()
+        stream, events = _start_stream(ctx, [b"a", b"b", b"c"])
+
+        assert await stream.__anext__() == b"a"
+        await asyncio.sleep(0.1)
+
+        # Cursor released while the client is stalled, before it resumes
+        assert events == ["closed"]
+        with pytest.raises(TimeoutError, match="idle"):
+            await stream.__anext__()
+        fail.assert_awaited_once()
+        assert fail.await_args.args[2].startswith("TimeoutError: Export idle")
+
+
+def test_chunk_pump_releases_slot_once() -> None:
+    releases: list[int] = []
+    pump = export_module._ExportChunkPump(
+        (chunk for chunk in [b"a"]), release=lambda: releases.append(1)
+    )
+
+    assert pump.next_chunk() == b"a"
+    assert pump.next_chunk() is None
+    pump.close()
+
+    assert releases == [1]
+
+
+@pytest.mark.asyncio()
+async def test_download_rejected_when_export_slots_busy(monkeypatch: pytest.MonkeyPatch) -> None:
+    busy_slots = MagicMock()
+    busy_slots.acquire.return_value = False
+    monkeypatch.setattr(export_module, "_EXPORT_SLOTS", busy_slots)
+    claim = AsyncMock(return_value=True)
+    monkeypatch.setattr(export_module, "_claim_export_audit", claim)
+    monkeypatch.setattr(
+        export_module,
+        "_get_export_audit",
+        AsyncMock(return_value={"user_id": "user-1", "export_type": "excel", "status": "pending"}),
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await export_module.download_excel_export(
+            UUID(int=1),
+            export_format="csv",
+            ctx=create_mock_context(),
+            user={"user_id": "user-1"},
+            _auth_context=MagicMock(),
+        )
+
+    assert exc_info.value.status_code == 503
+    claim.assert_not_awaited()
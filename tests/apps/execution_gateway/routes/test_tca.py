@@ -1021,6 +1021,25 @@ class TestTAQEnabledPath:
         assert not any("simplified" in w.lower() for w in warnings)
 
 
+    def test_analyze_trades_prefetches_bars_once(self) -> None:
+        """Bars for all eligible orders are prefetched before per-order analysis."""
+        trades = create_sample_trades() + create_sample_trades(client_order_id="order-2")
+
+        with patch("apps.execution_gateway.routes.tca._get_taq_provider", return_value=MagicMock()):
+            with patch("apps.execution_gateway.routes.tca.ExecutionQualityAnalyzer") as MockAnalyzer:
+                mock_analyzer = MockAnalyzer.return_value
+                mock_analyzer.prefetch_minute_bars.side_effect = RuntimeError("scan failed")
+                mock_analyzer.analyze_execution.side_effect = ValueError("no data")
+
+                orders, _warnings = tca._analyze_trades_for_tca(trades, ["alpha_baseline"])
+
+        mock_analyzer.prefetch_minute_bars.assert_called_once()
+        (batches,) = mock_analyzer.prefetch_minute_bars.call_args.args
+        assert len(batches) == 2
+        # Prefetch failure is not fatal: orders still fall back to simple TCA
+        assert mock_analyzer.analyze_execution.call_count == 2
+        assert len(orders) == 2
+
 class TestResultToOrderDetailNanConversion:
     """Regression: _result_to_order_detail converts NaN fee_cost_bps to None."""
 
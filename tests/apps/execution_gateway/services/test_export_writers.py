@@ -0,0 +1,123 @@
+"""Tests for apps/execution_gateway/services/export_writers.py."""
+
+from __future__ import annotations
+
+import io
+from datetime import date, datetime
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+import pytest
+from openpyxl import load_workbook
+
+from apps.execution_gateway.services import export_writers
+from apps.execution_gateway.services.export_writers import (
+    CsvStreamWriter,
+    ParquetStreamWriter,
+    XlsxStreamWriter,
+    open_export_writer,
+)
+
+COLUMNS = ["symbol", "qty", "executed_at", "trade_date", "is_short"]
+ROWS = [
+    ["A&B <x>", Decimal("1.5"), datetime(2026, 1, 2, 9, 30), date(2026, 1, 2), True],
+    [None, 3, None, None, False],
+]
+
+
+class TestXlsxStreamWriter:
+    def test_round_trip_preserves_native_types(self) -> None:
+        writer = XlsxStreamWriter("Fills", COLUMNS)
+        content = writer.write_rows(ROWS) + writer.close()
+
+        ws = load_workbook(io.BytesIO(content)).active
+        values = list(ws.iter_rows(values_only=True))
+        assert ws.title == "Fills"
+        assert values[0] == tuple(COLUMNS)
+        assert values[1] == (
+            "A&B <x>",
+            1.5,
+            datetime(2026, 1, 2, 9, 30),
+            datetime(2026, 1, 2),
+            True,
+        )
+        assert values[2] == (None, 3, None, None, False)
+
+    def test_bytes_emitted_incrementally(self) -> None:
+        writer = XlsxStreamWriter("Fills", COLUMNS)
+        chunks = [writer.write_rows(ROWS * 500) for _ in range(5)]
+        tail = writer.close()
+
+        assert chunks[0]
+        ws = load_workbook(io.BytesIO(b"".join(chunks) + tail), read_only=True).active
+        assert sum(1 for _ in ws.iter_rows()) == 1 + 5000
+
+    def test_aware_datetime_converted_to_utc_and_illegal_chars_dropped(self) -> None:
+        aware = datetime.fromisoformat("2026-01-02T10:30:00+01:00")
+        writer = XlsxStreamWriter("Audit", ["when", "note"])
+        content = writer.write_rows([[aware, "bad\x00\x1fchars"]]) + writer.close()
+
+        ws = load_workbook(io.BytesIO(content)).active
+        assert ws.cell(2, 1).value == datetime(2026, 1, 2, 9, 30)
+        assert ws.cell(2, 2).value == "badchars"
+
+    def test_sheet_title_sanitised(self) -> None:
+        writer = XlsxStreamWriter("a/b:c" + "x" * 40, ["c"])
+        ws = load_workbook(io.BytesIO(writer.close())).active
+
+        assert ws.title == ("a_b_c" + "x" * 40)[:31]
+
+    def test_row_limit_enforced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(export_writers, "XLSX_MAX_DATA_ROWS", 2)
+        writer = XlsxStreamWriter("Fills", COLUMNS)
+        writer.write_rows(ROWS)
+
+        with pytest.raises(ValueError, match="exceeds 2 rows"):
+            writer.write_rows(ROWS[:1])
+
+
+class TestCsvStreamWriter:
+    def test_header_and_rows(self) -> None:
+        writer = CsvStreamWriter(COLUMNS)
+        content = writer.write_rows(ROWS) + writer.close()
+
+        assert content.decode().split("\r\n") == [
+            "symbol,qty,executed_at,trade_date,is_short",
+            "A&B <x>,1.5,2026-01-02T09:30:00,2026-01-02,True",
+            ",3,,,False",
+            "",
+        ]
+
+    def test_empty_export_is_header_only(self) -> None:
+        assert CsvStreamWriter(COLUMNS).close() == b"symbol,qty,executed_at,trade_date,is_short\r\n"
+
+
+class TestParquetStreamWriter:
+    def test_types_inferred_from_first_batch(self) -> None:
+        writer = ParquetStreamWriter(COLUMNS)
+        content = writer.write_rows(ROWS) + writer.write_rows(ROWS) + writer.close()
+
+        table = pq.read_table(io.BytesIO(content))
+        assert table.num_rows == 4
+        assert str(table.schema.field("qty").type) == "double"
+        assert str(table.schema.field("trade_date").type) == "date32[day]"
+        assert table.column("qty").to_pylist() == [1.5, 3.0, 1.5, 3.0]
+        assert pq.ParquetFile(io.BytesIO(content)).num_row_groups == 2
+
+    def test_all_null_column_written_as_string(self) -> None:
+        writer = ParquetStreamWriter(["a", "b"])
+        content = writer.write_rows([[None, 1]]) + writer.write_rows([[5, 2]]) + writer.close()
+
+        table = pq.read_table(io.BytesIO(content))
+        assert table.column("a").to_pylist() == [None, "5"]
+
+    def test_empty_export_has_schema(self) -> None:
+        table = pq.read_table(io.BytesIO(ParquetStreamWriter(["a"]).close()))
+
+        assert table.column_names == ["a"]
+        assert table.num_rows == 0
+
+
+def test_open_export_writer_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported export format"):
+        open_export_writer("xml", "fills", COLUMNS)  # type: ignore[arg-type]
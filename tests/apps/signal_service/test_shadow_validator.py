@@ -12,10 +12,12 @@ Test Coverage:
 - Empty/insufficient data handling
 """
 
+from datetime import date
 from unittest.mock import Mock
 
 import numpy as np
 import pandas as pd
+import polars as pl
 import pytest
 
 from apps.signal_service.shadow_validator import (
@@ -25,6 +27,7 @@ from apps.signal_service.shadow_validator import (
     _mean_abs_diff_ratio,
     _safe_correlation,
 )
+from libs.data.data_pipeline.adjusted_store import AdjustedStore
 
 # ============================================================================
 # Test Helpers and Fixtures
@@ -520,6 +523,22 @@ def test_list_data_dates_ignores_invalid_names(temp_dir):
     assert str(dates[1]) == "2024-01-02"
 
 
+def test_list_data_dates_prefers_consolidated_store(temp_dir):
+    """Test _list_data_dates reads trading dates from the adjusted store manifest."""
+    _setup_data_dir(temp_dir, dates=["2024-02-01"])
+    AdjustedStore(temp_dir).upsert(
+        pl.DataFrame(
+            {
+                "symbol": ["AAPL", "AAPL"],
+                "date": [date(2024, 1, 2), date(2024, 1, 3)],
+                "close": [1.0, 2.0],
+            }
+        )
+    )
+
+    assert _list_data_dates(temp_dir) == [date(2024, 1, 2), date(2024, 1, 3)]
+
+
 # ============================================================================
 # Correlation Calculation Tests
 # ============================================================================
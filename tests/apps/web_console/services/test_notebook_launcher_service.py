@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,6 +13,12 @@ from libs.web_console_services.notebook_launcher_service import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _notebook_log_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Write launcher logs under tmp_path instead of artifacts/notebook_logs."""
+    monkeypatch.setenv("NOTEBOOK_LOG_DIR", str(tmp_path / "notebook_logs"))
+
+
 def test_list_templates_returns_entries() -> None:
     service = NotebookLauncherService(user={"role": "researcher"})
 
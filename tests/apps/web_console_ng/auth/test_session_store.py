@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -1077,3 +1079,145 @@ async def test_rotate_session_invalid_token_returns_none(
     assert result is None
     # Session should have been invalidated (deleted from Redis).
     assert await redis_client.get(f"{session_store.session_prefix}{session_id}") is None
+
+
+# =============================================================================
+# Test validated-session cache and cross-pod invalidation
+# =============================================================================
+
+
+async def _warm_store(store: ServerSessionStore, cookie_value: str) -> None:
+    """Validate once and wait until the invalidation listener is subscribed."""
+    assert await store.validate_session(cookie_value, "10.0.0.1", "ua") is not None
+    for _ in range(100):
+        if store._invalidation_listener_ready:
+            break
+        await asyncio.sleep(0.01)
+    assert store._invalidation_listener_ready
+    assert await store.validate_session(cookie_value, "10.0.0.1", "ua") is not None
+
+
+async def _stop_listener(*stores: ServerSessionStore) -> None:
+    for store in stores:
+        if store._invalidation_listener is not None:
+            store._invalidation_listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await store._invalidation_listener
+
+
+async def _wait_for_eviction(store: ServerSessionStore) -> None:
+    for _ in range(100):
+        if not store._validated_sessions:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("cached session was not evicted")
+
+
+@pytest.mark.asyncio()
+async def test_validate_session_cache_hit_skips_redis(
+    session_store: ServerSessionStore,
+) -> None:
+    cookie_value, _ = await session_store.create_session(
+        {"user_id": "user-1"}, {"user_agent": "ua"}, "10.0.0.1"
+    )
+    await _warm_store(session_store, cookie_value)
+
+    with patch.object(session_store.redis, "get", AsyncMock()) as redis_get:
+        first = await session_store.validate_session(cookie_value, "10.0.0.1", "ua")
+        assert first is not None
+        first["user"]["role"] = "admin"
+        second = await session_store.validate_session(cookie_value, "10.0.0.1", "ua")
+
+    redis_get.assert_not_called()
+    assert second is not None
+    assert "role" not in second["user"]
+    await _stop_listener(session_store)
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_validations_are_coalesced(session_store: ServerSessionStore) -> None:
+    cookie_value, _ = await session_store.create_session(
+        {"user_id": "user-1"}, {"user_agent": "ua"}, "10.0.0.1"
+    )
+    session_store.validation_cache_ttl = 0
+
+    original_get = session_store.redis.get
+    get_calls: list[str] = []
+
+    async def counting_get(key: str) -> bytes | None:
+        get_calls.append(key)
+        await asyncio.sleep(0.01)
+        return await original_get(key)
+
+    with patch.object(session_store.redis, "get", counting_get):
+        results = await asyncio.gather(
+            *(session_store.validate_session(cookie_value, "10.0.0.1", "ua") for _ in range(5))
+        )
+
+    assert all(result is not None for result in results)
+    assert len(get_calls) == 1
+    assert session_store._inflight_validations == {}
+
+
+@pytest.mark.asyncio()
+async def test_invalidation_on_other_pod_evicts_cached_session(redis_client: FakeRedis) -> None:
+    store = _make_store(redis_client)
+    other_pod = _make_store(redis_client)
+    other_pod.fernet = store.fernet
+    cookie_value, _ = await store.create_session(
+        {"user_id": "user-1"}, {"user_agent": "ua"}, "10.0.0.1"
+    )
+    await _warm_store(store, cookie_value)
+    assert store._validated_sessions
+
+    await other_pod.invalidate_session(extract_session_id(cookie_value))
+    await _wait_for_eviction(store)
+
+    assert await store.validate_session(cookie_value, "10.0.0.1", "ua") is None
+    await _stop_listener(store, other_pod)
+
+
+@pytest.mark.asyncio()
+async def test_force_logout_and_role_change_evict_cached_sessions(
+    session_store: ServerSessionStore,
+) -> None:
+    cookie_value, _ = await session_store.create_session(
+        {"user_id": "user-1", "role": "viewer"}, {"user_agent": "ua"}, "10.0.0.1"
+    )
+    await _warm_store(session_store, cookie_value)
+
+    assert await session_store.update_session_role(extract_session_id(cookie_value), "admin")
+    refreshed = await session_store.validate_session(cookie_value, "10.0.0.1", "ua")
+    assert refreshed is not None
+    assert refreshed["user"]["role"] == "admin"
+
+    await session_store.invalidate_redis_sessions_for_user("user-1")
+    assert await session_store.validate_session(cookie_value, "10.0.0.1", "ua") is None
+    await _stop_listener(session_store)
+
+
+@pytest.mark.asyncio()
+async def test_cache_bypassed_while_listener_down(session_store: ServerSessionStore) -> None:
+    cookie_value, _ = await session_store.create_session(
+        {"user_id": "user-1"}, {"user_agent": "ua"}, "10.0.0.1"
+    )
+    await _warm_store(session_store, cookie_value)
+    await _stop_listener(session_store)
+
+    assert session_store._invalidation_listener_ready is False
+    assert session_store._validated_sessions == {}
+    # Revoked directly in Redis while no invalidation could be received
+    await session_store.redis.delete(
+        f"{session_store.session_prefix}{extract_session_id(cookie_value)}"
+    )
+    assert session_store._cached_session(cookie_value, "10.0.0.1", "ua") is None
+    assert await session_store.validate_session(cookie_value, "10.0.0.1", "ua") is None
+    await _stop_listener(session_store)
+
+
+def test_invalid_invalidation_message_clears_cache(session_store: ServerSessionStore) -> None:
+    session_store._validated_sessions["cookie"] = MagicMock(session_id="s", user_id="u")
+
+    session_store._apply_invalidation_message(b"not json")
+
+    assert session_store._validated_sessions == {}
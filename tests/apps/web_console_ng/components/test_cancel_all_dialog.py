@@ -308,6 +308,29 @@ class TestCancelAllDialogExecution:
         assert failed == 0
         assert mock_client.cancel_order.call_count == 2
 
+    @pytest.mark.asyncio()
+    async def test_execute_cancel_all_holds_one_safety_slot(self) -> None:
+        """The whole batch runs in a single safety admission slot."""
+        orders = [create_mock_order(client_order_id=f"o{i}") for i in range(8)]
+        mock_client = MagicMock()
+        mock_client.cancel_order = AsyncMock(return_value=None)
+        slots = MagicMock()
+        slots.return_value.__aenter__ = AsyncMock(return_value=None)
+        slots.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        dialog = CancelAllDialog(
+            orders=orders,
+            trading_client=mock_client,
+            user_id="user1",
+            user_role="trader",
+        )
+
+        with patch("apps.web_console_ng.components.cancel_all_dialog.admission_slot", slots):
+            success, failed = await dialog._execute_cancel_all(orders)
+
+        assert (success, failed) == (8, 0)
+        slots.assert_called_once_with("safety")
+
     @pytest.mark.asyncio()
     async def test_execute_cancel_all_partial_failure(self) -> None:
         """Some cancels fail."""
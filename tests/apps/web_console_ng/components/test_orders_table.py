@@ -138,6 +138,22 @@ async def test_update_orders_table_add_update_remove(dummy_ui) -> None:
     }
 
 
+@pytest.mark.asyncio()
+async def test_update_orders_table_sends_only_changed_orders(dummy_ui) -> None:
+    grid = orders_module.create_orders_table()
+    orders = [{"client_order_id": f"id-{i}", "symbol": "AAPL", "status": "new"} for i in range(50)]
+
+    current_ids = await orders_module.update_orders_table(grid, orders)
+    changed = [dict(o) for o in orders]
+    changed[7]["status"] = "partially_filled"
+
+    await orders_module.update_orders_table(grid, changed, current_ids)
+
+    method, payload = grid.calls[-1]
+    assert method == "applyTransactionAsync"
+    assert payload == {"add": [], "update": [changed[7]], "remove": []}
+
+
 @pytest.mark.asyncio()
 async def test_update_orders_table_missing_client_order_id_fallback(dummy_ui) -> None:
     grid = orders_module.create_orders_table()
@@ -1076,3 +1076,22 @@ async def test_confirm_double_click_prevention(
 
     # close_position should only be called once (double-click prevention)
     assert mock_client.close_position.await_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_update_positions_grid_skips_unchanged_rows(dummy_ui: None) -> None:
+    grid = grid_module.create_positions_grid()
+    positions = [{"symbol": "AAPL", "qty": 10}, {"symbol": "MSFT", "qty": 5}]
+
+    symbols = await grid_module.update_positions_grid(grid, positions)
+    calls_after_load = len(grid.calls)
+
+    symbols = await grid_module.update_positions_grid(grid, positions, symbols)
+    assert len(grid.calls) == calls_after_load
+
+    await grid_module.update_positions_grid(
+        grid, [{"symbol": "AAPL", "qty": 10}, {"symbol": "MSFT", "qty": 6}], symbols
+    )
+    method, payload = grid.calls[-1]
+    assert method == "applyTransactionAsync"
+    assert payload == {"add": [], "update": [{"symbol": "MSFT", "qty": 6}], "remove": []}
@@ -378,3 +378,232 @@ async def test_try_acquire_semaphore_false(monkeypatch: pytest.MonkeyPatch) -> N
 
     middleware = AdmissionControlMiddleware(lambda *_: None)
     assert await middleware._try_acquire_semaphore() is False
+
+
+def _budgets(**overrides: Any) -> admission.RouteBudgets:
+    heavy = {"max_concurrent": 1, "queue_timeout_seconds": 0.01, "per_user_limit": 1}
+    heavy.update(overrides)
+    return admission.RouteBudgets(
+        [
+            admission.RouteClass("heavy", priority=2, **heavy),
+            admission.RouteClass(
+                "safety", priority=0, max_concurrent=1, queue_timeout_seconds=0.01
+            ),
+            admission.RouteClass(
+                "interactive", priority=1, max_concurrent=1, queue_timeout_seconds=0.01
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_route_budget_heavy_never_borrows_safety_lane() -> None:
+    budgets = _budgets()
+
+    async with budgets.slot("heavy", "alice"):
+        with pytest.raises(admission.AdmissionRejectedError) as exc_info:
+            async with budgets.slot("heavy", "bob"):
+                pass
+        # Safety lane is untouched by heavy work
+        async with budgets.slot("safety"):
+            pass
+
+    assert exc_info.value.reason == "queue_timeout"
+    assert exc_info.value.status_code == 503
+
+
+@pytest.mark.asyncio()
+async def test_route_budget_higher_priority_borrows_idle_lower_slot() -> None:
+    budgets = _budgets(per_user_limit=None)
+
+    async with budgets.slot("safety"), budgets.slot("safety"), budgets.slot("safety"):
+        # All three lanes are now held by safety work
+        with pytest.raises(admission.AdmissionRejectedError):
+            async with budgets.slot("heavy"):
+                pass
+
+    async with budgets.slot("heavy"):
+        pass
+
+
+@pytest.mark.asyncio()
+async def test_route_budget_per_user_limit_and_release() -> None:
+    budgets = _budgets(max_concurrent=2)
+
+    async with budgets.slot("heavy", "alice"):
+        with pytest.raises(admission.AdmissionRejectedError) as exc_info:
+            async with budgets.slot("heavy", "alice"):
+                pass
+        async with budgets.slot("heavy", "bob"):
+            pass
+
+    assert exc_info.value.status_code == 429
+    assert budgets._user_slots == {}
+    async with budgets.slot("heavy", "alice"):
+        pass
+
+
+@pytest.mark.asyncio()
+async def test_route_budget_queued_request_admitted_when_slot_frees() -> None:
+    budgets = _budgets(queue_timeout_seconds=1.0, per_user_limit=None)
+    order: list[str] = []
+
+    async def hold() -> None:
+        async with budgets.slot("heavy"):
+            order.append("first")
+            await asyncio.sleep(0.02)
+
+    async def queued() -> None:
+        await asyncio.sleep(0)
+        async with budgets.slot("heavy"):
+            order.append("second")
+
+    # Interactive and safety lanes are busy so the second request must queue
+    async with budgets.slot("interactive"), budgets.slot("safety"):
+        await asyncio.gather(hold(), queued())
+
+    assert order == ["first", "second"]
+
+
+@pytest.mark.asyncio()
+async def test_route_budget_safety_admitted_over_budget_never_rejected() -> None:
+    budgets = admission.RouteBudgets(
+        [
+            admission.RouteClass(
+                "safety",
+                priority=0,
+                max_concurrent=1,
+                queue_timeout_seconds=0.0,
+                admit_over_budget=True,
+            ),
+            admission.RouteClass("heavy", priority=2, max_concurrent=1, queue_timeout_seconds=0.01),
+        ]
+    )
+
+    async with budgets.slot("safety"), budgets.slot("safety"):
+        # Both lanes are held; a third safety action is still admitted at once
+        async with budgets.slot("safety"):
+            pass
+        with pytest.raises(admission.AdmissionRejectedError):
+            async with budgets.slot("heavy"):
+                pass
+
+    # Over-budget admissions release nothing, so both lanes are free again
+    async with budgets.slot("heavy"), budgets.slot("safety"):
+        pass
+
+
+def test_default_safety_class_is_never_rejected() -> None:
+    safety = next(rc for rc in admission.DEFAULT_ROUTE_CLASSES if rc.name == "safety")
+    assert safety.admit_over_budget is True
+
+
+def test_classify_http_path() -> None:
+    assert admission.classify_http_path("/data/sql-explorer") == admission.ROUTE_CLASS_HEAVY
+    assert admission.classify_http_path("/research/universes") == admission.ROUTE_CLASS_HEAVY
+    assert admission.classify_http_path("/api/workspace/x") == admission.ROUTE_CLASS_INTERACTIVE
+    assert admission.classify_http_path("/") is None
+    assert admission.classify_http_path("/_nicegui/static/x.js") is None
+
+
+@pytest.mark.asyncio()
+async def test_http_heavy_route_rejected_when_budget_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    budgets = _budgets(per_user_limit=None)
+    monkeypatch.setattr(admission, "_route_budgets", budgets)
+    called: list[str] = []
+
+    async def app(scope, receive, send):
+        called.append(scope["path"])
+
+    middleware = AdmissionControlMiddleware(app)
+    scope = {
+        "type": "http",
+        "path": "/sql-explorer",
+        "headers": [],
+        "client": ("10.0.0.5", 1234),
+    }
+
+    async with budgets.slot("heavy"), budgets.slot("interactive"), budgets.slot("safety"):
+        messages, send = _make_send_collector()
+        await middleware(scope, _noop_receive, send)
+
+    assert called == []
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 503
+    assert (b"retry-after", b"5") in messages[0]["headers"]
+
+    messages, send = _make_send_collector()
+    await middleware(scope, _noop_receive, send)
+    assert called == ["/sql-explorer"]
+
+
+@pytest.mark.asyncio()
+async def test_http_user_key_uses_validated_user_or_client_ip(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session_store = AsyncMock()
+    session_store.validate_session = AsyncMock(
+        side_effect=lambda cookie, *_: {"user": {"user_id": "u1"}} if cookie == "good" else None
+    )
+    monkeypatch.setattr(admission, "get_session_store", lambda: session_store)
+    budgets = _budgets(max_concurrent=4)
+    monkeypatch.setattr(admission, "_route_budgets", budgets)
+    seen: list[dict[tuple[str, str], int]] = []
+
+    async def app(scope, receive, send):
+        seen.append(dict(budgets._user_slots))
+
+    middleware = AdmissionControlMiddleware(app)
+
+    def http_scope(cookie: str) -> dict[str, Any]:
+        return {
+            "type": "http",
+            "path": "/sql-explorer",
+            "headers": [(b"cookie", f"{admission.SESSION_COOKIE_NAME}={cookie}".encode())],
+            "client": ("10.0.0.5", 1234),
+        }
+
+    _, send = _make_send_collector()
+    await middleware(http_scope("good"), _noop_receive, send)
+    await middleware(http_scope("forged-1"), _noop_receive, send)
+
+    assert seen == [{("heavy", "u1"): 1}, {("heavy", "ip:10.0.0.5"): 1}]
+
+    # Rotating forged cookies does not mint a fresh per-user budget
+    async with budgets.slot("heavy", "ip:10.0.0.5"):
+        messages, send = _make_send_collector()
+        await middleware(http_scope("forged-2"), _noop_receive, send)
+    assert messages[0]["status"] == 429
+
+
+@pytest.mark.asyncio()
+async def test_http_route_without_user_limit_skips_session_validation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session_store = AsyncMock()
+    session_store.validate_session = AsyncMock(return_value={"user": {"user_id": "u1"}})
+    monkeypatch.setattr(admission, "get_session_store", lambda: session_store)
+    budgets = _budgets()
+    monkeypatch.setattr(admission, "_route_budgets", budgets)
+    called: list[str] = []
+
+    async def app(scope, receive, send):
+        called.append(scope["path"])
+
+    middleware = AdmissionControlMiddleware(app)
+    scope = {
+        "type": "http",
+        "path": "/api/positions",
+        "headers": [(b"cookie", f"{admission.SESSION_COOKIE_NAME}=good".encode())],
+        "client": ("10.0.0.5", 1234),
+    }
+
+    _, send = _make_send_collector()
+    await middleware(scope, _noop_receive, send)
+
+    assert called == ["/api/positions"]
+    session_store.validate_session.assert_not_awaited()
+    assert budgets.has_user_limit("heavy") is True
+    assert budgets.has_user_limit("interactive") is False
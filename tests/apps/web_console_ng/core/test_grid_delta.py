@@ -0,0 +1,179 @@
+"""Tests for server-side grid row diffing and frame coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+from typing import Any
+
+import pytest
+
+from apps.web_console_ng.core import grid_delta
+from apps.web_console_ng.core.grid_delta import GridRowSync, RowDelta, get_row_sync
+
+
+class DummyGrid:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def run_grid_method(self, method: str, *args: Any, timeout: float = 1) -> None:
+        self.calls.append((method, args))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry() -> None:
+    grid_delta._grid_to_row_sync.clear()
+
+
+def _sync(grid: DummyGrid, clock: FakeClock | None = None) -> GridRowSync:
+    return GridRowSync(
+        grid,  # type: ignore[arg-type]
+        "id",
+        frame_interval_seconds=0.05,
+        clock=clock or FakeClock(),
+    )
+
+
+def test_push_sends_only_changed_rows() -> None:
+    grid = DummyGrid()
+    sync = _sync(grid)
+    sync.reset([{"id": "a", "v": 1}, {"id": "b", "v": 2}, {"id": "c", "v": 3}])
+
+    delta = sync.push([{"id": "a", "v": 1}, {"id": "b", "v": 5}, {"id": "d", "v": 4}])
+
+    assert delta.size == 3
+    assert grid.calls == [
+        (
+            "applyTransactionAsync",
+            (
+                {
+                    "add": [{"id": "d", "v": 4}],
+                    "update": [{"id": "b", "v": 5}],
+                    "remove": [{"id": "c"}],
+                },
+            ),
+        )
+    ]
+
+
+def test_unchanged_refresh_sends_nothing() -> None:
+    grid = DummyGrid()
+    sync = _sync(grid)
+    rows = [{"id": "a", "v": 1}]
+    sync.reset(rows)
+
+    assert sync.push([{"id": "a", "v": 1}]).size == 0
+    assert grid.calls == []
+
+
+def test_snapshot_is_not_affected_by_caller_mutation() -> None:
+    grid = DummyGrid()
+    sync = _sync(grid)
+    row = {"id": "a", "v": 1}
+    sync.reset([row])
+    row["v"] = 2
+
+    assert sync.push([row]).update == {"a": {"id": "a", "v": 2}}
+
+
+def test_known_ids_seed_missing_snapshot() -> None:
+    grid = DummyGrid()
+    sync = _sync(grid)
+
+    delta = sync.push([{"id": "a", "v": 1}, {"id": "b", "v": 1}], known_ids={"a", "z"})
+
+    assert list(delta.add) == ["b"]
+    assert list(delta.update) == ["a"]
+    assert list(delta.remove) == ["z"]
+
+
+def test_rows_without_id_are_skipped() -> None:
+    grid = DummyGrid()
+    sync = _sync(grid)
+    sync.reset([{"id": "a"}, {"v": 1}])
+
+    assert sync.push([{"id": "a"}, {"id": None, "v": 2}]).size == 0
+
+
+@pytest.mark.asyncio()
+async def test_deltas_within_a_frame_are_coalesced() -> None:
+    grid = DummyGrid()
+    clock = FakeClock()
+    sync = _sync(grid, clock)
+    sync.reset([{"id": "a", "v": 0}, {"id": "b", "v": 0}])
+
+    sync.push([{"id": "a", "v": 1}, {"id": "b", "v": 0}])
+    assert len(grid.calls) == 1
+
+    sync.push([{"id": "a", "v": 2}, {"id": "b", "v": 1}])
+    sync.push([{"id": "a", "v": 3}, {"id": "b", "v": 1}, {"id": "c", "v": 1}])
+    assert len(grid.calls) == 1
+
+    await asyncio.sleep(0.08)
+
+    assert grid.calls[1] == (
+        "applyTransactionAsync",
+        (
+            {
+                "add": [{"id": "c", "v": 1}],
+                "update": [{"id": "a", "v": 3}, {"id": "b", "v": 1}],
+                "remove": [],
+            },
+        ),
+    )
+
+
+@pytest.mark.asyncio()
+async def test_reset_discards_pending_delta() -> None:
+    grid = DummyGrid()
+    sync = _sync(grid)
+    sync.reset([{"id": "a", "v": 0}])
+    sync.push([{"id": "a", "v": 1}])
+    sync.push([{"id": "a", "v": 2}])
+
+    sync.reset([{"id": "a", "v": 9}])
+    await asyncio.sleep(0.08)
+
+    assert len(grid.calls) == 1
+
+
+def test_merge_cancels_opposing_operations() -> None:
+    pending = RowDelta("id", add={"new": {"id": "new"}}, remove={"gone": {"id": "gone"}})
+    pending.update["kept"] = {"id": "kept", "v": 1}
+
+    pending.merge(
+        RowDelta(
+            "id",
+            add={"gone": {"id": "gone", "v": 2}},
+            update={"new": {"id": "new", "v": 3}},
+            remove={"kept": {"id": "kept"}},
+        )
+    )
+    assert pending.to_transaction() == {
+        "add": [{"id": "new", "v": 3}],
+        "update": [{"id": "gone", "v": 2}],
+        "remove": [{"id": "kept"}],
+    }
+
+    pending.merge(RowDelta("id", remove={"new": {"id": "new"}}))
+    assert pending.add == {}
+
+
+def test_get_row_sync_is_per_grid_and_weak() -> None:
+    first, second = DummyGrid(), DummyGrid()
+
+    sync = get_row_sync(first, "id")  # type: ignore[arg-type]
+    assert get_row_sync(first, "id") is sync  # type: ignore[arg-type]
+    assert get_row_sync(second, "id") is not sync  # type: ignore[arg-type]
+
+    del first
+    gc.collect()
+    assert len(grid_delta._grid_to_row_sync) == 1
@@ -1,107 +1,96 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import AsyncMock
 
 import pytest
 from redis.exceptions import RedisError
 
+from apps.web_console_ng.core import sparkline_service as sparkline_module
 from apps.web_console_ng.core.sparkline_service import SparklineDataService
 
 
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    def setrange(self, key: str, offset: int, value: bytes) -> None:
+        self._ops.append(("setrange", (key, offset, value)))
+
+    def expire(self, key: str, ttl: int) -> None:
+        self._ops.append(("expire", (key, ttl)))
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._redis, name)(*args) for name, args in self._ops]
+
+
 class FakeRedis:
     def __init__(self) -> None:
-        self.data: dict[str, dict[str, float]] = {}
+        self.data: dict[str, bytearray] = {}
         self.expirations: dict[str, int] = {}
+        self.mget_calls = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
 
-    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
-        bucket = self.data.setdefault(key, {})
-        for member, score in mapping.items():
-            bucket[member] = float(score)
-
-    async def zrange(self, key: str, start: int, end: int) -> list[str]:
-        bucket = self.data.get(key, {})
-        items = sorted(bucket.items(), key=lambda item: item[1])
-        members = [member for member, _ in items]
-        length = len(members)
-        if length == 0:
-            return []
-
-        def normalize(idx: int) -> int:
-            return idx if idx >= 0 else length + idx
-
-        start_idx = normalize(start)
-        end_idx = normalize(end)
-        if start_idx < 0:
-            start_idx = 0
-        if end_idx < 0:
-            end_idx = 0
-        if start_idx >= length:
-            return []
-        end_idx = min(end_idx, length - 1)
-        if start_idx > end_idx:
-            return []
-        return members[start_idx : end_idx + 1]
-
-    async def zremrangebyrank(self, key: str, start: int, end: int) -> None:
-        members = await self.zrange(key, 0, -1)
-        length = len(members)
-        if length == 0:
-            return
-
-        def normalize(idx: int) -> int:
-            return idx if idx >= 0 else length + idx
-
-        start_idx = normalize(start)
-        end_idx = normalize(end)
-        if start_idx < 0:
-            start_idx = 0
-        if end_idx < 0:
-            end_idx = 0
-        if start_idx >= length:
-            return
-        end_idx = min(end_idx, length - 1)
-        if start_idx > end_idx:
-            return
-
-        to_remove = set(members[start_idx : end_idx + 1])
-        bucket = self.data.get(key, {})
-        for member in to_remove:
-            bucket.pop(member, None)
-
-    async def zcard(self, key: str) -> int:
-        return len(self.data.get(key, {}))
+    async def setrange(self, key: str, offset: int, value: bytes) -> int:
+        buf = self.data.setdefault(key, bytearray())
+        if len(buf) < offset + len(value):
+            buf.extend(b"\x00" * (offset + len(value) - len(buf)))
+        buf[offset : offset + len(value)] = value
+        return len(buf)
 
     async def expire(self, key: str, ttl: int) -> None:
         self.expirations[key] = ttl
 
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.mget_calls += 1
+        return [bytes(self.data[key]) if key in self.data else None for key in keys]
+
 
 class ErrorRedis(FakeRedis):
-    async def zrange(self, key: str, start: int, end: int) -> list[str]:
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
         raise RedisError("down")
 
-    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+    async def setrange(self, key: str, offset: int, value: bytes) -> int:
         raise RedisError("down")
 
 
+@pytest.fixture(autouse=True)
+def _clear_shared_sample_cache() -> None:
+    sparkline_module._LAST_SAMPLED.clear()
+
+
+@pytest.mark.asyncio()
+async def test_record_price_rate_limit() -> None:
+    fake = FakeRedis()
+    service = SparklineDataService(fake, time_fn=lambda: 120, sample_interval_seconds=60)
+    await service.record_price("AAPL", 100.0)
+    await service.record_price("AAPL", 101.0)
+
+    assert await service.get_price_history(["AAPL"]) == {"AAPL": [100.0]}
+
+
 @pytest.mark.asyncio()
-async def test_record_point_rate_limit() -> None:
+async def test_ring_keeps_latest_points_in_fixed_size() -> None:
     fake = FakeRedis()
-    t = 120
+    t = 0
 
     def time_fn() -> int:
         return t
 
-    service = SparklineDataService(fake, time_fn=time_fn, sample_interval_seconds=60)
-    await service.record_point("user1", "AAPL", 1.0)
-    await service.record_point("user1", "AAPL", 2.0)
+    service = SparklineDataService(fake, time_fn=time_fn, max_points=3, sample_interval_seconds=60)
+
+    for i in range(5):
+        t = i * 60
+        await service.record_price("AAPL", float(100 + i))
 
-    data = await service.get_sparkline_data("user1", "AAPL")
-    assert data == [1.0]
+    assert await service.get_price_history(["AAPL"]) == {"AAPL": [102.0, 103.0, 104.0]}
+    assert len(fake.data["sparkline:mark:AAPL"]) == 3 * 16
 
 
 @pytest.mark.asyncio()
-async def test_record_point_trims_oldest() -> None:
+async def test_points_older_than_window_are_dropped() -> None:
     fake = FakeRedis()
     t = 0
 
@@ -109,81 +98,117 @@ async def test_record_point_trims_oldest() -> None:
         return t
 
     service = SparklineDataService(fake, time_fn=time_fn, max_points=3, sample_interval_seconds=60)
+    await service.record_price("AAPL", 100.0)
+    t = 60
+    await service.record_price("AAPL", 101.0)
+    t = 180
 
-    for i in range(5):
-        t = i * 60
-        await service.record_point("user1", "AAPL", float(i))
-
-    data = await service.get_sparkline_data("user1", "AAPL")
-    assert data == [2.0, 3.0, 4.0]
+    assert await service.get_price_history(["AAPL"]) == {"AAPL": [101.0]}
 
 
 @pytest.mark.asyncio()
-async def test_parse_members_handles_bad_values() -> None:
-    members: list[Any] = ["10:1.2", "11:bad", "12:3.4"]
-    assert SparklineDataService._parse_members(members) == [1.2, 3.4]
+async def test_symbol_written_once_per_bucket_across_dashboards() -> None:
+    fake = FakeRedis()
+    first = SparklineDataService(fake, time_fn=lambda: 0)
+    second = SparklineDataService(fake, time_fn=lambda: 0)
+
+    await first.record_positions([{"symbol": "AAPL", "current_price": 100.0}])
+    await second.record_positions([{"symbol": "AAPL", "current_price": 101.0}])
+
+    assert list(fake.data) == ["sparkline:mark:AAPL"]
+    assert await second.get_price_history(["AAPL"]) == {"AAPL": [100.0]}
 
 
 @pytest.mark.asyncio()
-async def test_record_positions_skips_invalids() -> None:
+async def test_record_positions_skips_invalids_and_derives_price() -> None:
     fake = FakeRedis()
     service = SparklineDataService(fake, time_fn=lambda: 0)
     positions = [
-        {"symbol": "AAPL", "unrealized_pl": 1.2},
-        {"symbol": "", "unrealized_pl": 2.0},
-        {"symbol": "MSFT", "unrealized_pl": None},
-        {"symbol": "NVDA", "unrealized_pl": "bad"},
+        {"symbol": "AAPL", "current_price": 150.0},
+        {"symbol": "", "current_price": 2.0},
+        {"symbol": "MSFT", "unrealized_pl": 1.0},
+        {"symbol": "NVDA", "current_price": "bad"},
+        {"symbol": "TSLA", "qty": -2, "avg_entry_price": 200.0, "unrealized_pl": 10.0},
     ]
-    await service.record_positions("user1", positions)
-    data = await service.get_sparkline_data("user1", "AAPL")
-    assert data == [1.2]
+    await service.record_positions(positions)
+
+    history = await service.get_price_history(["AAPL", "MSFT", "NVDA", "TSLA"])
+    assert history == {"AAPL": [150.0], "MSFT": [], "NVDA": [], "TSLA": [195.0]}
 
 
 @pytest.mark.asyncio()
-async def test_record_point_skips_nan_inf() -> None:
+async def test_record_price_skips_nan_inf_and_non_positive() -> None:
     fake = FakeRedis()
     service = SparklineDataService(fake, time_fn=lambda: 0)
-    await service.record_point("user1", "AAPL", float("nan"))
-    await service.record_point("user1", "AAPL", float("inf"))
-    assert await service.get_sparkline_data("user1", "AAPL") == []
+    for value in (float("nan"), float("inf"), 0.0, -1.0):
+        await service.record_price("AAPL", value)
+
+    assert fake.data == {}
 
 
 @pytest.mark.asyncio()
-async def test_record_point_handles_redis_error() -> None:
-    service = SparklineDataService(ErrorRedis(), time_fn=lambda: 0)
-    await service.record_point("user1", "AAPL", 1.0)
+async def test_sparkline_map_scales_shared_marks_per_position() -> None:
+    fake = FakeRedis()
+    t = 0
 
+    def time_fn() -> int:
+        return t
 
-@pytest.mark.asyncio()
-async def test_get_sparkline_data_handles_redis_error() -> None:
-    service = SparklineDataService(ErrorRedis(), time_fn=lambda: 0)
-    data = await service.get_sparkline_data("user1", "AAPL")
-    assert data == []
+    service = SparklineDataService(fake, time_fn=time_fn)
+    for i, price in enumerate([100.0, 102.0, 101.0]):
+        t = i * 60
+        await service.record_positions(
+            [{"symbol": "AAPL", "current_price": price}, {"symbol": "MSFT", "current_price": 50.0}]
+        )
+
+    long_view = await service.get_sparkline_map(
+        [
+            {"symbol": "AAPL", "qty": 10, "avg_entry_price": 100.0},
+            {"symbol": "MSFT", "qty": 1, "avg_entry_price": 40.0},
+        ]
+    )
+    short_view = await service.get_sparkline_map(
+        [{"symbol": "AAPL", "qty": -5, "avg_entry_price": 103.0}]
+    )
+
+    assert long_view == {"AAPL": [0.0, 20.0, 10.0], "MSFT": [10.0, 10.0, 10.0]}
+    assert short_view == {"AAPL": [15.0, 5.0, 10.0]}
+    assert fake.mget_calls == 2
 
 
 @pytest.mark.asyncio()
-async def test_get_sparkline_map_handles_exceptions(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_sparkline_map_without_position_basis_is_empty() -> None:
     fake = FakeRedis()
     service = SparklineDataService(fake, time_fn=lambda: 0)
-    monkeypatch.setattr(service, "get_sparkline_data", AsyncMock(side_effect=RuntimeError("x")))
-    result = await service.get_sparkline_map("user1", ["AAPL"])
-    assert result == {"AAPL": []}
+    await service.record_price("AAPL", 100.0)
+
+    assert await service.get_sparkline_map([{"symbol": "AAPL"}, {"symbol": ""}]) == {"AAPL": []}
+
+
+@pytest.mark.asyncio()
+async def test_record_price_handles_redis_error() -> None:
+    service = SparklineDataService(ErrorRedis(), time_fn=lambda: 0)
+    await service.record_price("AAPL", 1.0)
+
+
+@pytest.mark.asyncio()
+async def test_get_price_history_handles_redis_error() -> None:
+    service = SparklineDataService(ErrorRedis(), time_fn=lambda: 0)
+
+    assert await service.get_price_history(["AAPL", "MSFT"]) == {"AAPL": [], "MSFT": []}
+
 
+def test_unpack_ring_ignores_empty_and_partial_slots() -> None:
+    slot = sparkline_module._SLOT
+    raw = slot.pack(120, 2.0) + b"\x00" * slot.size + slot.pack(60, 1.0) + b"\x01\x02"
 
-def test_parse_members_handles_bytes_and_nan() -> None:
-    members: list[Any] = [b"10:1.2", b"11:nan", b"12:3.4"]
-    assert SparklineDataService._parse_members(members) == [1.2, 3.4]
+    assert SparklineDataService._unpack_ring(raw, 0) == [1.0, 2.0]
+    assert SparklineDataService._unpack_ring(None, 0) == []
 
 
 def test_prune_rate_limit_cache() -> None:
     fake = FakeRedis()
-    service = SparklineDataService(fake, time_fn=lambda: 0, max_cache_entries=4)
-    service._last_sampled = {
-        ("u1", "A"): 0,
-        ("u1", "B"): 0,
-        ("u1", "C"): 0,
-        ("u1", "D"): 0,
-        ("u1", "E"): 0,
-    }
+    service = SparklineDataService(fake, time_fn=lambda: 0, max_cache_entries=4, last_sampled={})
+    service._last_sampled.update({"A": 0, "B": 0, "C": 0, "D": 0, "E": 0})
     service._maybe_prune_rate_limit_cache(100)
     assert len(service._last_sampled) <= service._max_cache_entries
@@ -18,10 +18,12 @@ from __future__ import annotations
 import asyncio
 import inspect
 import json
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
 from types import SimpleNamespace
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import polars as pl
 import pytest
@@ -2021,6 +2023,130 @@ async def test_render_backtest_result_with_metrics(
     assert any("IEX-vs-SIP Monitor: status=passed" in label.text for label in dummy_ui.labels)
 
 
+@pytest.mark.asyncio()
+async def test_render_lazy_backtest_result_loads_only_active_tab(
+    dummy_ui: DummyUI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Lazy result view fetches downsampled charts first and artifacts on demand."""
+    overview = SimpleNamespace(
+        backtest_id="b1",
+        alpha_name="alpha1",
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 2, 1),
+        n_days=31,
+        n_symbols_avg=100.0,
+        mean_ic=0.05,
+        icir=1.5,
+        hit_rate=0.55,
+        coverage=0.95,
+        average_turnover=0.25,
+        dataset_version_ids={},
+        cost_config=None,
+        cost_summary=None,
+        capacity_analysis=None,
+        has_net_returns=False,
+    )
+    series = pl.DataFrame({"date": [date(2025, 1, 2)], "cumulative_return": [0.01]})
+    service = MagicMock()
+    service.get_chart_series = AsyncMock(return_value=series)
+    service.get_result_tab = AsyncMock(
+        return_value={"daily_portfolio_returns": pl.DataFrame({"date": [], "return": []})}
+    )
+    monkeypatch.setattr(backtest_module, "_chart_width_px", AsyncMock(return_value=640))
+    monkeypatch.setattr(backtest_module, "has_permission", lambda user, perm: True)
+    created_tabs: list[DummyElement] = []
+    make_tabs = dummy_ui.tabs
+
+    def tabs() -> DummyElement:
+        created_tabs.append(make_tabs())
+        return created_tabs[-1]
+
+    monkeypatch.setattr(dummy_ui, "tabs", tabs)
+
+    await backtest_module._render_lazy_backtest_result(service, "b1", overview, {"user_id": "u1"})
+
+    assert [call.args for call in service.get_chart_series.await_args_list] == [
+        ("b1", "equity", 640, "gross"),
+        ("b1", "drawdown", 640, "gross"),
+    ]
+    service.get_result_tab.assert_not_called()
+    assert any("Avg Turnover" in label.text for label in dummy_ui.labels)
+
+    await _call(
+        created_tabs[0]._on_value_change,
+        SimpleNamespace(value=backtest_module.RESULT_TAB_SIGNALS),
+    )
+
+    assert [call.args[1] for call in service.get_result_tab.await_args_list] == [
+        "signals",
+        "holdings",
+        "prices",
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_render_lazy_backtest_result_busy_tab_can_retry(
+    dummy_ui: DummyUI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A tab rejected by the heavy budget is loaded again on the next view."""
+    overview = SimpleNamespace(
+        backtest_id="b1",
+        alpha_name="alpha1",
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 2, 1),
+        n_days=31,
+        n_symbols_avg=100.0,
+        mean_ic=0.05,
+        icir=1.5,
+        hit_rate=0.55,
+        coverage=0.95,
+        average_turnover=0.25,
+        dataset_version_ids={},
+        cost_config=None,
+        cost_summary=None,
+        capacity_analysis=None,
+        has_net_returns=False,
+    )
+    series = pl.DataFrame({"date": [date(2025, 1, 2)], "cumulative_return": [0.01]})
+    service = MagicMock()
+    service.get_chart_series = AsyncMock(return_value=series)
+    user_keys: list[str | None] = []
+    busy = [True]
+
+    @asynccontextmanager
+    async def slot(route_class: str, user_key: str | None = None) -> AsyncIterator[None]:
+        user_keys.append(user_key)
+        if busy[0]:
+            raise backtest_module.AdmissionRejectedError(route_class, "queue_timeout", 503)
+        yield
+
+    monkeypatch.setattr(backtest_module, "admission_slot", slot)
+    monkeypatch.setattr(backtest_module, "_chart_width_px", AsyncMock(return_value=640))
+    monkeypatch.setattr(backtest_module, "has_permission", lambda user, perm: True)
+    created_tabs: list[DummyElement] = []
+    make_tabs = dummy_ui.tabs
+
+    def tabs() -> DummyElement:
+        created_tabs.append(make_tabs())
+        return created_tabs[-1]
+
+    monkeypatch.setattr(dummy_ui, "tabs", tabs)
+
+    await backtest_module._render_lazy_backtest_result(service, "b1", overview, {"user_id": "u1"})
+
+    service.get_chart_series.assert_not_called()
+    assert any("busy" in n["text"] for n in dummy_ui.notifications)
+
+    busy[0] = False
+    await _call(
+        created_tabs[0]._on_value_change,
+        SimpleNamespace(value=backtest_module.RESULT_TAB_PERFORMANCE),
+    )
+
+    assert service.get_chart_series.await_count == 2
+    assert user_keys == ["u1", "u1"]
+
+
 @pytest.mark.asyncio()
 async def test_render_comparison_table_with_results(
     dummy_ui: DummyUI, monkeypatch: pytest.MonkeyPatch
@@ -46,8 +46,16 @@ async def test_fetch_comparison_data_calls_service(monkeypatch: pytest.MonkeyPat
             calls.append((strategy_ids, date_from, date_to))
             return {"metrics": {}}
 
+    cube = object()
+    cubes: list[object] = []
+
+    def _service(_scoped, cube=None):
+        cubes.append(cube)
+        return DummyService()
+
     dummy_scoped_module = SimpleNamespace(StrategyScopedDataAccess=lambda **_kwargs: object())
-    dummy_service_module = SimpleNamespace(ComparisonService=lambda _scoped: DummyService())
+    dummy_service_module = SimpleNamespace(ComparisonService=_service)
+    dummy_cube_module = SimpleNamespace(get_returns_cube=lambda: cube)
 
     monkeypatch.setitem(
         sys.modules, "libs.web_console_data.strategy_scoped_queries", dummy_scoped_module
@@ -55,6 +63,7 @@ async def test_fetch_comparison_data_calls_service(monkeypatch: pytest.MonkeyPat
     monkeypatch.setitem(
         sys.modules, "libs.web_console_services.comparison_service", dummy_service_module
     )
+    monkeypatch.setitem(sys.modules, "libs.web_console_services.returns_cube", dummy_cube_module)
 
     user = {"user_id": "u1"}
     strategies = ["s1", "s2"]
@@ -66,6 +75,7 @@ async def test_fetch_comparison_data_calls_service(monkeypatch: pytest.MonkeyPat
 
     assert data == {"metrics": {}}
     assert calls == [(strategies, start, end)]
+    assert cubes == [cube]
 
 
 def test_render_metrics_table_creates_rows(dummy_ui: DummyUI) -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date, datetime
 from types import SimpleNamespace
 from typing import Any
@@ -7,6 +9,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from apps.web_console_ng.core.admission import AdmissionRejectedError
 from apps.web_console_ng.pages import journal as journal_module
 
 
@@ -213,6 +216,39 @@ async def test_do_export_csv_success_calls_download(
     assert any("Exported 3 trades" in msg for msg, _ in dummy_ui.notifications)
 
 
+@pytest.mark.asyncio()
+async def test_do_export_rejected_when_heavy_budget_full(
+    dummy_ui: DummyUI, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    export_csv = AsyncMock(return_value=(b"csv-bytes", 3))
+    user_keys: list[str | None] = []
+
+    @asynccontextmanager
+    async def busy_slot(route_class: str, user_key: str | None = None) -> AsyncIterator[None]:
+        user_keys.append(user_key)
+        raise AdmissionRejectedError(route_class, "user_limit", 429)
+        yield
+
+    monkeypatch.setattr(journal_module, "_export_csv", export_csv)
+    monkeypatch.setattr(journal_module, "admission_slot", busy_slot)
+    monkeypatch.setattr(journal_module, "get_authorized_strategies", lambda user: ["s1"])
+
+    await journal_module._do_export(
+        data_access=SimpleNamespace(),
+        user={"user_id": "u1"},
+        export_type="csv",
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 2),
+        symbol_filter=None,
+        side_filter=None,
+    )
+
+    assert user_keys == ["u1"]
+    export_csv.assert_not_awaited()
+    assert not dummy_ui.downloads
+    assert any("busy" in msg for msg, _ in dummy_ui.notifications)
+
+
 @pytest.mark.asyncio()
 async def test_render_export_section_wires_buttons(
     dummy_ui: DummyUI, monkeypatch: pytest.MonkeyPatch
@@ -0,0 +1,248 @@
+"""Tests for libs/analytics/signal_analytics.py (fused IC/decay/quantile kernel)."""
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+from scipy.stats import spearmanr  # type: ignore[import-untyped]
+
+from libs.analytics.signal_analytics import (
+    analyze_signal,
+    compute_forward_returns,
+    compute_signal_metrics,
+    quantile_count_col,
+    quantile_return_col,
+    summarize_signal_metrics,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _make_panel(n_dates: int, n_ids: int, seed: int = 0) -> pl.DataFrame:
+    """Build a {date, permno, ret} panel of random daily returns."""
+    rng = np.random.default_rng(seed)
+    start = date(2024, 1, 1)
+    rows = [
+        (start + timedelta(days=d), p, float(rng.normal(0.0, 0.02)))
+        for p in range(n_ids)
+        for d in range(n_dates)
+    ]
+    return pl.DataFrame(rows, schema=["date", "permno", "ret"], orient="row")
+
+
+# ===================================================================
+# compute_forward_returns
+# ===================================================================
+class TestComputeForwardReturns:
+    def test_compounds_next_h_returns(self) -> None:
+        """Forward return at t compounds returns t+1..t+h (PIT-correct)."""
+        start = date(2024, 1, 1)
+        returns = pl.DataFrame(
+            {
+                "date": [start + timedelta(days=i) for i in range(4)],
+                "permno": [1] * 4,
+                "ret": [0.5, 0.1, 0.2, -0.1],
+            }
+        )
+
+        result = compute_forward_returns(returns, [1, 2])
+        fwd = {
+            (row["horizon"], row["date"]): row["forward_return"]
+            for row in result.iter_rows(named=True)
+        }
+
+        assert fwd[(1, start)] == pytest.approx(0.1)
+        assert fwd[(2, start)] == pytest.approx(1.1 * 1.2 - 1)
+        assert fwd[(2, start + timedelta(days=1))] == pytest.approx(1.2 * 0.9 - 1)
+        # Incomplete windows produce no row
+        assert (2, start + timedelta(days=2)) not in fwd
+        assert (1, start + timedelta(days=3)) not in fwd
+
+    def test_window_with_null_is_dropped(self) -> None:
+        """A null return invalidates every window that contains it."""
+        start = date(2024, 1, 1)
+        returns = pl.DataFrame(
+            {
+                "date": [start + timedelta(days=i) for i in range(5)],
+                "permno": [1] * 5,
+                "ret": [0.01, 0.02, None, 0.03, 0.04],
+            }
+        )
+
+        result = compute_forward_returns(returns, [2])
+
+        assert result["date"].to_list() == [start + timedelta(days=2)]
+
+    def test_require_contiguous_rejects_gaps(self) -> None:
+        """With require_contiguous, a missing day inside the window drops it."""
+        start = date(2024, 1, 1)
+        dates = [start + timedelta(days=i) for i in range(4)]
+        returns = pl.DataFrame(
+            {
+                # permno 2 is missing day 2
+                "date": dates + [dates[0], dates[1], dates[3]],
+                "permno": [1] * 4 + [2] * 3,
+                "ret": [0.01] * 7,
+            }
+        )
+
+        loose = compute_forward_returns(returns, [1])
+        strict = compute_forward_returns(returns, [1], require_contiguous=True)
+
+        loose_p2 = loose.filter(pl.col("permno") == 2)["date"].to_list()
+        strict_p2 = strict.filter(pl.col("permno") == 2)["date"].to_list()
+        assert loose_p2 == [dates[0], dates[1]]
+        assert strict_p2 == [dates[0]]
+
+    def test_require_contiguous_ignores_input_row_order(self) -> None:
+        """Shuffled input gives the same windows once the calendar is joined."""
+        panel = _make_panel(n_dates=12, n_ids=4).filter(
+            ~((pl.col("permno") == 1) & (pl.col("date") == date(2024, 1, 5)))
+        )
+
+        expected = compute_forward_returns(panel, [1, 3], require_contiguous=True)
+        shuffled = compute_forward_returns(
+            panel.sample(fraction=1.0, shuffle=True, seed=7), [1, 3], require_contiguous=True
+        )
+
+        keys = ["date", "permno", "horizon"]
+        assert shuffled.sort(keys).equals(expected.sort(keys))
+
+    def test_matches_rolling_product(self) -> None:
+        """Cumulative-log evaluation matches a direct product over the window."""
+        panel = _make_panel(n_dates=15, n_ids=3)
+        result = compute_forward_returns(panel, [1, 5, 10])
+
+        for (permno,), group in panel.sort("date").partition_by("permno", as_dict=True).items():
+            rets = group["ret"].to_list()
+            dates = group["date"].to_list()
+            for h in (1, 5, 10):
+                for t in range(len(rets) - h):
+                    expected = math.prod(1 + r for r in rets[t + 1 : t + h + 1]) - 1
+                    actual = result.filter(
+                        (pl.col("permno") == permno)
+                        & (pl.col("date") == dates[t])
+                        & (pl.col("horizon") == h)
+                    )["forward_return"].item()
+                    assert actual == pytest.approx(expected, abs=1e-12)
+
+    def test_invalid_horizon_raises(self) -> None:
+        with pytest.raises(ValueError, match="horizons must be > 0"):
+            compute_forward_returns(_make_panel(5, 2), [0, 1])
+
+    def test_empty_input(self) -> None:
+        empty = pl.DataFrame(schema={"date": pl.Date, "permno": pl.Int64, "ret": pl.Float64})
+        result = compute_forward_returns(empty, [1, 5])
+        assert result.height == 0
+        assert result.columns == ["date", "permno", "horizon", "forward_return"]
+
+
+# ===================================================================
+# compute_signal_metrics
+# ===================================================================
+class TestComputeSignalMetrics:
+    def _one_date(self, signal: list[float], returns: list[float]) -> pl.DataFrame:
+        d = date(2024, 1, 2)
+        n = len(signal)
+        signals = pl.DataFrame({"date": [d] * n, "permno": list(range(n)), "signal": signal})
+        forward = pl.DataFrame(
+            {
+                "date": [d] * n,
+                "permno": list(range(n)),
+                "horizon": [1] * n,
+                "forward_return": returns,
+            }
+        )
+        return compute_signal_metrics(signals, forward, n_quantiles=2)
+
+    def test_rank_ic_matches_spearman(self) -> None:
+        rng = np.random.default_rng(3)
+        signal = rng.normal(size=40).tolist()
+        returns = rng.normal(size=40).tolist()
+
+        row = self._one_date(signal, returns).row(0, named=True)
+
+        assert row["n_obs"] == 40
+        assert row["rank_ic"] == pytest.approx(spearmanr(signal, returns).statistic)
+        assert row["pearson_ic"] == pytest.approx(np.corrcoef(signal, returns)[0, 1])
+
+    def test_quantiles_and_spread(self) -> None:
+        row = self._one_date([1.0, 2.0, 3.0, 4.0], [0.01, 0.02, 0.03, 0.04]).row(0, named=True)
+
+        assert row[quantile_return_col(1)] == pytest.approx(0.015)
+        assert row[quantile_return_col(2)] == pytest.approx(0.035)
+        assert row[quantile_count_col(1)] == 2
+        assert row[quantile_count_col(2)] == 2
+        assert row["long_short_spread"] == pytest.approx(0.02)
+        assert row["hit_rate"] == pytest.approx(1.0)
+
+    def test_hit_rate_excludes_zeros(self) -> None:
+        row = self._one_date([1.0, -1.0, 0.0, 2.0], [0.01, 0.01, 0.05, -0.02]).row(0, named=True)
+        # Non-zero pairs: (1, .01) hit, (-1, .01) miss, (2, -.02) miss
+        assert row["hit_rate"] == pytest.approx(1 / 3)
+
+    def test_constant_signal_gives_nan_ic(self) -> None:
+        row = self._one_date([1.0] * 5, [0.01, 0.02, 0.03, 0.04, 0.05]).row(0, named=True)
+        assert math.isnan(row["rank_ic"])
+
+    def test_groups_by_extra_columns(self) -> None:
+        panel = _make_panel(n_dates=12, n_ids=20)
+        rng = np.random.default_rng(7)
+        signals = pl.concat(
+            [
+                panel.select("date", "permno").with_columns(
+                    pl.lit(name).alias("factor_name"),
+                    pl.Series("zscore", rng.normal(size=panel.height)),
+                )
+                for name in ("a", "b")
+            ]
+        )
+        forward = compute_forward_returns(panel, [1, 5])
+
+        daily = compute_signal_metrics(signals, forward, by=["factor_name"], signal_col="zscore")
+
+        assert set(daily["factor_name"].unique()) == {"a", "b"}
+        assert set(daily["horizon"].unique()) == {1, 5}
+        assert daily.select(pl.struct("factor_name", "date", "horizon").is_unique().all()).item()
+
+    def test_invalid_quantiles_raises(self) -> None:
+        with pytest.raises(ValueError, match="n_quantiles must be >= 2"):
+            compute_signal_metrics(pl.DataFrame(), pl.DataFrame(), n_quantiles=1)
+
+
+# ===================================================================
+# summarize_signal_metrics / analyze_signal
+# ===================================================================
+class TestSummarizeAndAnalyze:
+    def test_perfect_signal_decay_summary(self) -> None:
+        """A signal equal to the next-day return has rank IC 1 at horizon 1."""
+        panel = _make_panel(n_dates=30, n_ids=40, seed=5)
+        signals = (
+            panel.sort(["permno", "date"])
+            .with_columns(pl.col("ret").shift(-1).over("permno").alias("signal"))
+            .drop_nulls("signal")
+            .select("date", "permno", "signal")
+        )
+
+        result = analyze_signal(signals, panel, [1, 10], min_observations=30)
+        summary = {row["horizon"]: row for row in result.summary.iter_rows(named=True)}
+
+        assert summary[1]["rank_ic_mean"] == pytest.approx(1.0)
+        assert summary[1]["rank_ic_positive_pct"] == pytest.approx(100.0)
+        assert summary[1]["hit_rate"] == pytest.approx(1.0)
+        assert abs(summary[10]["rank_ic_mean"]) < summary[1]["rank_ic_mean"]
+        assert result.summary["horizon"].to_list() == [1, 10]
+
+    def test_min_observations_filters_dates(self) -> None:
+        panel = _make_panel(n_dates=10, n_ids=5)
+        signals = panel.select("date", "permno", pl.col("ret").alias("signal"))
+        daily = compute_signal_metrics(signals, compute_forward_returns(panel, [1]))
+
+        summary = summarize_signal_metrics(daily, min_observations=6)
+
+        assert summary.height == 0
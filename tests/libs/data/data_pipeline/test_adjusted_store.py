@@ -0,0 +1,93 @@
+"""Tests for the consolidated adjusted data store."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from libs.data.data_pipeline.adjusted_store import AdjustedStore
+
+
+def _rows(symbols: list[str], dates: list[date], close: float) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "symbol": [s for s in symbols for _ in dates],
+            "date": [d for _ in symbols for d in dates],
+            "close": [close] * (len(symbols) * len(dates)),
+            "volume": [1_000] * (len(symbols) * len(dates)),
+        }
+    )
+
+
+class TestUpsert:
+    def test_upsert_partitions_by_year_sorted(self, tmp_path: Path) -> None:
+        store = AdjustedStore(tmp_path)
+        assert not store.exists
+
+        store.upsert(_rows(["MSFT", "AAPL"], [date(2023, 12, 29), date(2024, 1, 2)], 1.0))
+
+        manifest = store.load_manifest()
+        assert sorted(manifest["partitions"]) == ["2023", "2024"]
+        assert manifest["partitions"]["2024"]["row_count"] == 2
+        assert store.available_dates() == [date(2023, 12, 29), date(2024, 1, 2)]
+
+        part = pl.read_parquet(store.partitions_dir / "2024.parquet")
+        assert part["symbol"].to_list() == ["AAPL", "MSFT"]
+        assert (
+            pq.ParquetFile(store.partitions_dir / "2024.parquet")
+            .metadata.row_group(0)
+            .column(0)
+            .is_stats_set
+        )
+
+    def test_later_upsert_replaces_same_key(self, tmp_path: Path) -> None:
+        store = AdjustedStore(tmp_path)
+        store.upsert(_rows(["AAPL"], [date(2024, 1, 2), date(2024, 1, 3)], 1.0))
+        store.upsert(_rows(["AAPL"], [date(2024, 1, 3), date(2024, 1, 4)], 2.0))
+
+        df = store.scan().collect()  # type: ignore[union-attr]
+        assert df["date"].to_list() == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+        assert df["close"].to_list() == [1.0, 2.0, 2.0]
+
+    def test_missing_key_columns_raise(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="key columns"):
+            AdjustedStore(tmp_path).upsert(pl.DataFrame({"symbol": ["AAPL"]}))
+
+
+class TestScan:
+    def test_scan_filters_symbols_and_dates(self, tmp_path: Path) -> None:
+        store = AdjustedStore(tmp_path)
+        store.upsert(_rows(["AAPL", "MSFT", "NVDA"], [date(2023, 6, 1), date(2024, 6, 3)], 1.0))
+
+        lf = store.scan(["AAPL", "NVDA"], date(2024, 1, 1), date(2024, 12, 31))
+        assert lf is not None
+        df = lf.collect()
+
+        assert df["symbol"].to_list() == ["AAPL", "NVDA"]
+        assert df["date"].unique().to_list() == [date(2024, 6, 3)]
+
+    def test_scan_outside_partitions_returns_none(self, tmp_path: Path) -> None:
+        store = AdjustedStore(tmp_path)
+        store.upsert(_rows(["AAPL"], [date(2024, 6, 3)], 1.0))
+
+        assert store.scan(start_date=date(2025, 1, 1)) is None
+
+
+class TestRebuild:
+    def test_rebuild_from_partitions_latest_run_wins(self, tmp_path: Path) -> None:
+        for run_date, close in (("2024-01-03", 1.0), ("2024-01-04", 2.0)):
+            run_dir = tmp_path / run_date
+            run_dir.mkdir()
+            _rows(["AAPL"], [date(2024, 1, 3)], close).write_parquet(run_dir / "AAPL.parquet")
+        (tmp_path / "not-a-date").mkdir()
+
+        store = AdjustedStore(tmp_path)
+        assert store.rebuild_from_partitions() == 1
+
+        df = store.scan().collect()  # type: ignore[union-attr]
+        assert df["close"].to_list() == [2.0]
+        assert store.available_dates() == [date(2024, 1, 3)]
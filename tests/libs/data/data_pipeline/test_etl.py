@@ -127,3 +127,16 @@ def test_load_adjusted_data_symbol_filter_returns_empty(tmp_path: Path) -> None:
     df = etl.load_adjusted_data(symbols=["MSFT"], data_dir=tmp_path / "adjusted")
 
     assert df.is_empty()
+
+
+def test_save_results_upserts_consolidated_store(tmp_path: Path) -> None:
+    good = _raw_data(datetime.now(UTC)).drop("timestamp")
+
+    etl._save_results(good, pl.DataFrame(), tmp_path, date(2024, 1, 10))
+
+    assert (tmp_path / "adjusted" / "2024-01-10" / "AAPL.parquet").exists()
+    store = etl.AdjustedStore(tmp_path / "adjusted")
+    assert store.available_dates() == [date(2024, 1, 10)]
+
+    # Store copies are not double-counted by the per-date loader
+    assert etl.load_adjusted_data(data_dir=tmp_path / "adjusted").height == 2
@@ -190,6 +190,95 @@ class TestFullETLPipeline:
         assert 2024 in years
 
 
+class TestStreamingETL:
+    """Tests for batched (streaming) full ETL runs."""
+
+    def test_streaming_matches_single_fetch(
+        self, etl: HistoricalETL, mock_fetcher: MagicMock
+    ) -> None:
+        """Batched runs produce the same sorted partitions as one fetch per year."""
+        symbols = ["MSFT", "AAPL", "NVDA", "GOOG"]
+        mock_fetcher.get_daily_prices.side_effect = lambda symbols, start_date, end_date: (
+            pl.DataFrame(
+                {
+                    "date": [start_date, end_date] * len(symbols),
+                    "symbol": [s for s in symbols for _ in range(2)],
+                    "close": [100.0] * 2 * len(symbols),
+                    "volume": [1000000.0] * 2 * len(symbols),
+                }
+            )
+        )
+        etl.run_full_etl(symbols, date(2023, 12, 1), date(2024, 1, 31))
+        expected = {
+            year: pl.read_parquet(etl.storage_path / "daily" / f"{year}.parquet")
+            for year in (2023, 2024)
+        }
+        mock_fetcher.get_daily_prices.reset_mock()
+
+        result = etl.run_full_etl(
+            symbols, date(2023, 12, 1), date(2024, 1, 31), batch_size=2, max_workers=2
+        )
+
+        # 4 symbols -> 2 batches per year
+        assert mock_fetcher.get_daily_prices.call_count == 4
+        assert result.total_rows == 16
+        for year, df in expected.items():
+            streamed = pl.read_parquet(etl.storage_path / "daily" / f"{year}.parquet")
+            assert streamed.equals(df)
+        assert not any((etl.storage_path / "_staging").glob("*/*.parquet"))
+        progress = etl._load_etl_progress()
+        assert progress is not None
+        assert progress.batch_size == 2
+        assert progress.year_batches_completed == {}
+
+    def test_resume_skips_staged_batches(self, etl: HistoricalETL, mock_fetcher: MagicMock) -> None:
+        """An interrupted streaming run resumes at the first unstaged batch."""
+        generate = mock_fetcher.get_daily_prices.side_effect
+
+        def failing(symbols: list[str], start_date: date, end_date: date) -> pl.DataFrame:
+            if "NVDA" in symbols:
+                raise RuntimeError("provider timeout")
+            return generate(symbols, start_date, end_date)
+
+        mock_fetcher.get_daily_prices.side_effect = failing
+        with pytest.raises(RuntimeError, match="provider timeout"):
+            etl.run_full_etl(
+                ["AAPL", "MSFT", "NVDA"],
+                date(2024, 1, 1),
+                date(2024, 1, 31),
+                batch_size=1,
+                max_workers=1,
+            )
+        progress = etl._load_etl_progress()
+        assert progress is not None
+        assert progress.status == "running"
+        assert progress.year_batches_completed == {2024: 2}
+
+        mock_fetcher.get_daily_prices.side_effect = generate
+        mock_fetcher.get_daily_prices.reset_mock()
+        etl.run_full_etl(
+            ["AAPL", "MSFT", "NVDA"],
+            date(2024, 1, 1),
+            date(2024, 1, 31),
+            batch_size=1,
+            max_workers=1,
+        )
+
+        fetched = [c.kwargs["symbols"] for c in mock_fetcher.get_daily_prices.call_args_list]
+        assert fetched == [["NVDA"]]
+        df = pl.read_parquet(etl.storage_path / "daily" / "2024.parquet")
+        assert sorted(df["symbol"].unique().to_list()) == ["AAPL", "MSFT", "NVDA"]
+        assert df.select(HistoricalETL.PRIMARY_KEYS).equals(
+            df.select(HistoricalETL.PRIMARY_KEYS).sort(HistoricalETL.PRIMARY_KEYS)
+        )
+
+    def test_invalid_batch_arguments_raise(self, etl: HistoricalETL) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            etl.run_full_etl(["AAPL"], date(2024, 1, 1), date(2024, 1, 31), batch_size=0)
+        with pytest.raises(ValueError, match="max_workers"):
+            etl.run_full_etl(["AAPL"], date(2024, 1, 1), date(2024, 1, 31), max_workers=0)
+
+
 class TestIncrementalETL:
     """Tests for incremental ETL updates."""
 
@@ -13,6 +13,8 @@ from libs.data.data_pipeline.read_time_adjustment import (
     READ_TIME_ADJUSTMENT_MODE_SPLIT_ADJUSTED,
     READ_TIME_INVALID_SPLIT_ACTIONS_SKIPPED_REASON,
     READ_TIME_NO_SPLIT_ACTIONS_REASON,
+    SplitFactorTable,
+    build_split_factor_table,
     derive_split_adjusted_prices,
 )
 
@@ -193,3 +195,54 @@ def test_normalized_symbols_from_frame_uses_polars_native_normalization() -> Non
     frame = pl.DataFrame({"symbol": [" aapl", "MSFT", "AAPL ", None, ""]})
 
     assert normalized_symbols_from_frame(frame) == ["AAPL", "MSFT"]
+
+
+def test_split_factor_table_matches_raw_action_path() -> None:
+    actions = pl.concat(
+        [
+            _corp_actions(),
+            pl.DataFrame(
+                {
+                    "symbol": ["AAPL", "MSFT"],
+                    "ca_type": ["reverse_split", "stock_split"],
+                    "ex_date": [date(2020, 9, 1), date(2020, 8, 31)],
+                    "process_date": [date(2020, 9, 1), date(2020, 8, 31)],
+                    "old_rate": [2.0, 1.0],
+                    "new_rate": [1.0, 3.0],
+                }
+            ),
+        ]
+    )
+    table = build_split_factor_table(actions)
+
+    from_actions = derive_split_adjusted_prices(_prices(), actions)
+    from_table = derive_split_adjusted_prices(_prices(), table)
+
+    assert table.factors["cumulative_factor"].to_list() == [2.0, 0.5, 3.0]
+    assert from_table.frame.equals(from_actions.frame)
+    assert from_table.frame["split_adjustment_factor"].to_list() == [2.0, 0.5, 1.0]
+    # Table counts are scoped to the priced symbols, like a filtered action query
+    assert from_actions.split_action_count == 3
+    assert from_table.split_action_count == 2
+    assert from_table.reason_codes == from_actions.reason_codes
+
+
+def test_split_factor_table_round_trips_with_scoped_skip_counts() -> None:
+    actions = pl.DataFrame(
+        {
+            "symbol": ["AAPL", "AAPL", "AAPL"],
+            "ca_type": ["stock_split", "stock_split", "stock_split"],
+            "ex_date": [date(2020, 8, 31), date(2020, 9, 1), date(2020, 1, 2)],
+            "process_date": [date(2020, 8, 30), date(2020, 9, 1), date(2020, 1, 2)],
+            "old_rate": [1.0, 0.0, 0.0],
+            "new_rate": [4.0, 2.0, 2.0],
+        }
+    )
+    table = SplitFactorTable.from_frame(build_split_factor_table(actions).to_frame())
+
+    result = derive_split_adjusted_prices(_prices(), table)
+
+    assert table.skipped_action_count == 2
+    assert result.skipped_action_count == 1
+    assert result.frame["adj_close"].to_list() == [125.0, 125.0, 130.0]
+    assert READ_TIME_INVALID_SPLIT_ACTIONS_SKIPPED_REASON in result.reason_codes
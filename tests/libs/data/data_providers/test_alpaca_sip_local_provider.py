@@ -7,7 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import polars as pl
 import pytest
@@ -24,6 +24,10 @@ from libs.data.data_providers.protocols import (
     DataProviderError,
     ProviderNotSupportedError,
 )
+from libs.data.data_providers.snapshot_memory_store import (
+    SnapshotMemoryStore,
+    set_snapshot_store,
+)
 from libs.data.data_quality.exceptions import DataNotFoundError
 from libs.data.data_quality.manifest import ManifestManager
 
@@ -221,6 +225,35 @@ class TestAlpacaSIPLocalProvider:
         assert df["symbol"].to_list() == ["AAPL", "AAPL"]
         assert df["date"].to_list() == [date(2023, 1, 3), date(2023, 1, 4)]
 
+    def test_get_daily_prices_reads_preloaded_snapshot(
+        self, mock_alpaca_sip_data: tuple[Path, ManifestManager, list[Path]], tmp_path: Path
+    ) -> None:
+        data_root, manifest_manager, file_paths = mock_alpaca_sip_data
+        manifest = manifest_manager.load_manifest("alpaca_sip_daily")
+        assert manifest is not None
+        store = SnapshotMemoryStore(root=tmp_path / "shm")
+        store.load("alpaca_sip_daily", manifest, file_paths)
+        for path in file_paths:
+            path.unlink()
+
+        provider = AlpacaSIPLocalProvider(
+            storage_path=data_root / "alpaca" / "sip" / "daily",
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+            pinned_manifest=manifest,
+        )
+        set_snapshot_store(store)
+        try:
+            df = provider.get_daily_prices(
+                start_date=date(2023, 1, 3), end_date=date(2024, 1, 2), symbols=["AAPL"]
+            )
+        finally:
+            set_snapshot_store(None)
+            store.close()
+            provider.close()
+
+        assert df["close"].to_list() == [100.0, 101.0, 150.5]
+
     def test_get_daily_prices_column_projection(
         self, mock_alpaca_sip_data: tuple[Path, ManifestManager, list[Path]]
     ) -> None:
@@ -285,6 +318,24 @@ class TestAlpacaSIPLocalProvider:
 
         assert df.height == 2
 
+    def test_get_manifest_paths_defaults_to_manifest_range(
+        self, mock_alpaca_sip_data: tuple[Path, ManifestManager, list[Path]]
+    ) -> None:
+        data_root, manifest_manager, file_paths = mock_alpaca_sip_data
+        manifest = manifest_manager.load_manifest("alpaca_sip_daily")
+        assert manifest is not None
+
+        provider = AlpacaSIPLocalProvider(
+            storage_path=data_root / "alpaca" / "sip" / "daily",
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+        )
+
+        assert provider.get_manifest_paths(manifest) == [p.resolve() for p in file_paths]
+        assert provider.get_manifest_paths(manifest, date(2024, 1, 1), date(2024, 6, 30)) == [
+            file_paths[1].resolve()
+        ]
+
     def test_pinned_manifest_used_even_when_current_manifest_changes(
         self, mock_alpaca_sip_data: tuple[Path, ManifestManager, list[Path]]
     ) -> None:
@@ -582,6 +633,83 @@ class TestAlpacaSIPLocalProvider:
         ]
         assert date(2020, 10, 6) not in unbounded["ex_date"].to_list()
 
+    def test_split_factor_table_is_persisted_and_reused_per_manifest_version(
+        self, mock_alpaca_sip_data: tuple[Path, ManifestManager, list[Path]]
+    ) -> None:
+        data_root, manifest_manager, _ = mock_alpaca_sip_data
+        corp_dir = data_root / "alpaca" / "sip" / "corp_actions"
+        corp_dir.mkdir(parents=True)
+        corp_path = corp_dir / "actions.parquet"
+        pl.DataFrame(
+            {
+                "symbol": ["AAPL", "AAPL", "MSFT"],
+                "ca_type": ["stock_split", "stock_split", "stock_split"],
+                "process_date": [date(2020, 8, 30), date(2020, 9, 14), date(2020, 9, 1)],
+                "ex_date": [date(2020, 8, 31), date(2020, 9, 15), date(2020, 9, 2)],
+                "old_rate": [1.0, 1.0, 1.0],
+                "new_rate": [4.0, 2.0, 3.0],
+            }
+        ).write_parquet(corp_path)
+        manifest_path = data_root / "manifests" / "alpaca_sip_corp_actions.json"
+
+        def write_manifest(version: int, checksum: str) -> None:
+            manifest_path.write_text(
+                json.dumps(
+                    {
+                        "dataset": "alpaca_sip_corp_actions",
+                        "sync_timestamp": datetime.now(UTC).isoformat(),
+                        "start_date": "2020-08-01",
+                        "end_date": "2020-09-30",
+                        "row_count": 3,
+                        "checksum": checksum,
+                        "checksum_algorithm": "sha256",
+                        "schema_version": "v1.0.0",
+                        "wrds_query_hash": "alpaca-sip-local-test",
+                        "file_paths": [str(corp_path)],
+                        "validation_status": "passed",
+                        "manifest_version": version,
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+        write_manifest(1, "abc123")
+        provider = AlpacaSIPLocalProvider(
+            storage_path=data_root / "alpaca" / "sip" / "daily",
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+        )
+
+        table = provider.get_split_factor_table(
+            start_date=date(2020, 8, 3), coverage_end_date=date(2020, 9, 1)
+        )
+
+        assert table.factors.filter(pl.col("symbol") == "AAPL")["cumulative_factor"].to_list() == [
+            8.0,
+            2.0,
+        ]
+        assert (corp_dir / "_split_factors" / "v1-abc123.parquet").exists()
+        with patch.object(provider, "_execute_corp_actions_query") as query:
+            assert provider.get_split_factor_table(start_date=date(2020, 8, 3)) is table
+            reopened = AlpacaSIPLocalProvider(
+                storage_path=data_root / "alpaca" / "sip" / "daily",
+                manifest_manager=manifest_manager,
+                data_root=data_root,
+            )
+            reloaded = reopened.get_split_factor_table(start_date=date(2020, 8, 3))
+            query.assert_not_called()
+        assert reloaded.factors.equals(table.factors)
+
+        write_manifest(2, "def456")
+        rebuilt = provider.get_split_factor_table(start_date=date(2020, 8, 3))
+        assert rebuilt is not table
+        assert (corp_dir / "_split_factors" / "v2-def456.parquet").exists()
+
+        with pytest.raises(DataNotFoundError, match="before requested price end"):
+            provider.get_split_factor_table(
+                start_date=date(2020, 8, 3), coverage_end_date=date(2020, 10, 1)
+            )
+
     def test_invalid_column_raises(
         self, mock_alpaca_sip_data: tuple[Path, ManifestManager, list[Path]]
     ) -> None:
@@ -779,7 +907,7 @@ class TestAlpacaSIPDataProviderAdapter:
                 "ret": [None, None],
             }
         )
-        provider.get_corporate_actions.side_effect = DataNotFoundError("no companion manifest")
+        provider.get_split_factor_table.side_effect = DataNotFoundError("no companion manifest")
         adapter = AlpacaSIPDataProviderAdapter(provider)
 
         df = adapter.get_daily_prices(["AAPL"], date(2023, 1, 3), date(2023, 1, 4))
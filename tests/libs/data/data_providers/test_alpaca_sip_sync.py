@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import datetime
+import threading
+import time
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
@@ -10,6 +12,7 @@ from typing import Any
 import polars as pl
 import pytest
 
+from libs.data.data_providers import alpaca_sip_sync
 from libs.data.data_providers.alpaca_sip_sync import AlpacaSIPSyncManager
 from libs.data.data_quality.exceptions import DiskSpaceError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
@@ -67,6 +70,48 @@ class RaisingAlpacaClient:
         raise RuntimeError("alpaca unavailable")
 
 
+class PerSymbolAlpacaClient:
+    """Thread-safe fake returning two paginated daily bars per requested symbol."""
+
+    def __init__(self, delay_seconds: float = 0.0, fail_symbol: str | None = None) -> None:
+        self.delay_seconds = delay_seconds
+        self.fail_symbol = fail_symbol
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.request_count = 0
+
+    def get_stock_bars(self, request_params: Any) -> Any:
+        with self.lock:
+            self.in_flight += 1
+            self.request_count += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay_seconds)
+            symbols = str(request_params["symbols"]).split(",")
+            if self.fail_symbol in symbols:
+                raise RuntimeError("alpaca unavailable")
+            second_page = request_params.get("page_token") == "page-2"
+            day = 4 if second_page else 3
+            bars = {
+                symbol: [
+                    {
+                        "t": f"2024-01-0{day}T00:00:00Z",
+                        "o": 10.0,
+                        "h": 11.0,
+                        "l": 9.0,
+                        "c": 10.0 + day + len(symbol),
+                        "v": 100.0,
+                    }
+                ]
+                for symbol in symbols
+            }
+            return {"bars": bars, "next_page_token": None if second_page else "page-2"}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
 @pytest.fixture()
 def sync_paths(tmp_path: Path) -> dict[str, Path]:
     data_root = tmp_path / "data"
@@ -671,3 +716,116 @@ def test_verify_integrity_rejects_manifest_path_outside_storage_path(
     errors = manager.verify_integrity()
 
     assert any("outside storage_path" in error for error in errors)
+
+
+def test_concurrent_fetch_matches_sequential_fetch(
+    sync_paths: dict[str, Path],
+    manifest_manager: ManifestManager,
+) -> None:
+    symbols = ["MSFT", "AAPL", "NVDA", "AMZN", "GOOG"]
+    frames: list[pl.DataFrame] = []
+    clients: list[PerSymbolAlpacaClient] = []
+    for concurrency in (1, 4):
+        client = PerSymbolAlpacaClient(delay_seconds=0.02)
+        manager = AlpacaSIPSyncManager(
+            client=client,
+            storage_path=sync_paths["storage"],
+            manifest_manager=manifest_manager,
+            data_root=sync_paths["data_root"],
+            request_chunk_size=1,
+            max_concurrent_requests=concurrency,
+        )
+        frames.append(manager._fetch_year_frame(symbols, 2024))
+        clients.append(client)
+
+    assert frames[0].equals(frames[1])
+    assert frames[1].height == 10
+    assert frames[1]["symbol"].to_list()[:5] == sorted(symbols)
+    assert clients[0].max_in_flight == 1
+    assert clients[1].max_in_flight > 1
+    assert clients[1].request_count == 10
+
+
+def test_concurrent_fetch_propagates_chunk_failure(
+    sync_paths: dict[str, Path],
+    manifest_manager: ManifestManager,
+) -> None:
+    manager = AlpacaSIPSyncManager(
+        client=PerSymbolAlpacaClient(fail_symbol="NVDA"),
+        storage_path=sync_paths["storage"],
+        manifest_manager=manifest_manager,
+        data_root=sync_paths["data_root"],
+        request_chunk_size=1,
+        max_concurrent_requests=2,
+    )
+
+    with pytest.raises(RuntimeError, match="alpaca unavailable"):
+        manager.sync_year_partition(["AAPL", "MSFT", "NVDA"], 2024)
+    assert not (sync_paths["storage"] / "2024.parquet").exists()
+
+
+def test_rate_limiter_meters_every_page_request(
+    sync_paths: dict[str, Path],
+    manifest_manager: ManifestManager,
+) -> None:
+    client = PerSymbolAlpacaClient()
+    manager = AlpacaSIPSyncManager(
+        client=client,
+        storage_path=sync_paths["storage"],
+        manifest_manager=manifest_manager,
+        data_root=sync_paths["data_root"],
+        request_chunk_size=2,
+        max_concurrent_requests=2,
+        requests_per_minute=600_000,
+    )
+    acquired: list[int] = []
+    limiter = manager._rate_limiter
+    assert limiter is not None
+    original_acquire = limiter.acquire
+
+    def acquire() -> None:
+        acquired.append(1)
+        original_acquire()
+
+    limiter.acquire = acquire  # type: ignore[method-assign]
+
+    manager._fetch_year_frame(["AAPL", "MSFT", "NVDA"], 2024)
+
+    assert len(acquired) == client.request_count == 4
+
+
+def test_token_bucket_waits_for_refill(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(alpaca_sip_sync.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(alpaca_sip_sync.time, "sleep", fake_sleep)
+    bucket = alpaca_sip_sync._TokenBucket(requests_per_minute=120, burst=2)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    # Burst of 2 is free; each later request waits 0.5s at 2 requests/second
+    assert sleeps == pytest.approx([0.5, 0.5])
+
+
+def test_manager_rejects_invalid_concurrency_settings(
+    sync_paths: dict[str, Path],
+    manifest_manager: ManifestManager,
+) -> None:
+    for kwargs, message in (
+        ({"max_concurrent_requests": 0}, "max_concurrent_requests"),
+        ({"requests_per_minute": 0}, "requests_per_minute"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            AlpacaSIPSyncManager(
+                client=FakeAlpacaClient([]),
+                storage_path=sync_paths["storage"],
+                manifest_manager=manifest_manager,
+                data_root=sync_paths["data_root"],
+                **kwargs,  # type: ignore[arg-type]
+            )
@@ -15,6 +15,7 @@ from __future__ import annotations
 import json
 from datetime import UTC, date, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -784,6 +785,30 @@ class TestMetadataCache:
             assert provider._annual_metadata is None
             assert provider._quarterly_metadata is None
 
+    def test_catalog_paths_validated_only_on_manifest_change(
+        self,
+        mock_compustat_data: tuple[Path, ManifestManager, list[Path], list[Path]],
+    ) -> None:
+        """Catalog views for an unchanged manifest skip path validation."""
+        data_root, manifest_manager, _, _ = mock_compustat_data
+        storage_path = data_root / "wrds"
+
+        with CompustatLocalProvider(
+            storage_path=storage_path,
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+        ) as provider:
+            manifest = provider._get_manifest(provider.DATASET_ANNUAL)
+            with patch.object(
+                provider,
+                "_get_validated_paths_from_manifest",
+                wraps=provider._get_validated_paths_from_manifest,
+            ) as validate_paths:
+                provider._catalog_connection(manifest, provider.DATASET_ANNUAL)
+                provider._catalog_connection(manifest, provider.DATASET_ANNUAL)
+
+        validate_paths.assert_called_once_with(manifest)
+
 
 # =============================================================================
 # Test Case 16: Partition pruning
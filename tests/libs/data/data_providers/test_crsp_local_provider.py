@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from datetime import UTC, date, datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import polars as pl
 import pytest
@@ -460,6 +460,52 @@ class TestCRSPLocalProviderPartitionPruning:
         years = {p.stem for p in paths}
         assert years == {"2021", "2022"}
 
+    def test_partition_pruning_includes_delta_partitions(
+        self, mock_crsp_data: tuple[Path, ManifestManager, list[Path]]
+    ) -> None:
+        """Delta partitions registered in the manifest are pruned by year."""
+        data_root, manifest_manager, _ = mock_crsp_data
+        storage_path = data_root / "wrds" / "crsp" / "daily"
+        delta_2022 = storage_path / "deltas" / "2022-delta-20230103T060000.parquet"
+        delta_2021 = storage_path / "deltas" / "2021-delta-20220103T060000.parquet"
+
+        with CRSPLocalProvider(
+            storage_path=storage_path,
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+        ) as provider:
+            manifest = provider._get_manifest()
+            manifest = manifest.model_copy(
+                update={"file_paths": [*manifest.file_paths, str(delta_2021), str(delta_2022)]}
+            )
+            paths = provider._get_partition_paths_from_manifest(
+                manifest, date(2022, 1, 1), date(2022, 12, 31)
+            )
+
+        assert {p.name for p in paths} == {"2022.parquet", delta_2022.name}
+
+    def test_get_manifest_paths_returns_all_years_within_data_root(
+        self, mock_crsp_data: tuple[Path, ManifestManager, list[Path]], tmp_path: Path
+    ) -> None:
+        """All manifest partitions (bases and deltas) are returned, escapes skipped."""
+        data_root, manifest_manager, file_paths = mock_crsp_data
+        storage_path = data_root / "wrds" / "crsp" / "daily"
+        delta = storage_path / "deltas" / "2022-delta-20230103T060000.parquet"
+        outside = tmp_path / "elsewhere" / "2020.parquet"
+
+        with CRSPLocalProvider(
+            storage_path=storage_path,
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+        ) as provider:
+            manifest = provider._get_manifest()
+            manifest = manifest.model_copy(
+                update={"file_paths": [*manifest.file_paths, str(delta), str(outside)]}
+            )
+            paths = provider.get_manifest_paths(manifest)
+
+        assert paths == [*file_paths, delta]
+
 
 class TestCRSPLocalProviderTickerMapping:
     """Tests for ticker/PERMNO mapping."""
@@ -935,6 +981,48 @@ class TestCRSPLocalProviderConnectionManagement:
         # After context exit, thread-local connection should be cleared
         assert getattr(provider._thread_local, "conn", None) is None
 
+    def test_catalog_views_rebuilt_only_on_manifest_change(
+        self, mock_crsp_data: tuple[Path, ManifestManager, list[Path]]
+    ) -> None:
+        """Catalog views persist across queries and follow manifest updates."""
+        data_root, manifest_manager, file_paths = mock_crsp_data
+        storage_path = data_root / "wrds" / "crsp" / "daily"
+
+        with CRSPLocalProvider(
+            storage_path=storage_path,
+            manifest_manager=manifest_manager,
+            data_root=data_root,
+        ) as provider:
+            provider.get_daily_prices(
+                start_date=date(2020, 1, 1),
+                end_date=date(2022, 12, 31),
+                as_of_date=date(2021, 1, 1),
+            )
+            catalog = provider._thread_local.catalog
+            manifest = provider._get_manifest()
+            assert catalog.is_current(provider.DATASET_NAME, manifest)
+
+            # Unchanged manifest: paths are not re-resolved or re-validated
+            with patch.object(
+                provider,
+                "_get_validated_paths_from_manifest",
+                wraps=provider._get_validated_paths_from_manifest,
+            ) as validate_paths:
+                provider.get_security_timeline(10001)
+                validate_paths.assert_not_called()
+
+            # New manifest version drops the 2021/2022 partitions
+            manifest_file = data_root / "manifests" / "crsp_daily.json"
+            manifest_data = json.loads(manifest_file.read_text())
+            manifest_data.update(
+                manifest_version=2, checksum="def456", file_paths=[str(file_paths[0])]
+            )
+            manifest_file.write_text(json.dumps(manifest_data))
+
+            timeline = provider.get_security_timeline(10001)
+            assert timeline["date"].max() == date(2020, 6, 15)
+            assert provider._thread_local.catalog is catalog
+
 
 class TestCRSPLocalProviderSecurityTimeline:
     """Tests for security timeline."""
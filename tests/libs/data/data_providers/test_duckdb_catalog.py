@@ -0,0 +1,92 @@
+"""Tests for the manifest-versioned DuckDB catalog."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import duckdb
+import polars as pl
+import pytest
+
+from libs.data.data_providers.duckdb_catalog import ManifestCatalog
+from libs.data.data_quality.manifest import SyncManifest
+
+
+def _manifest(paths: list[Path], version: int = 1, checksum: str = "abc") -> SyncManifest:
+    return SyncManifest(
+        dataset="test_daily",
+        sync_timestamp=datetime.now(UTC),
+        start_date=date(2023, 1, 1),
+        end_date=date(2024, 12, 31),
+        row_count=0,
+        checksum=checksum,
+        schema_version="v1.0.0",
+        wrds_query_hash="q",
+        file_paths=[str(p) for p in paths],
+        validation_status="passed",
+        manifest_version=version,
+    )
+
+
+@pytest.fixture()
+def partitions(tmp_path: Path) -> list[Path]:
+    paths = [
+        tmp_path / "2023.parquet",
+        tmp_path / "2024.parquet",
+        tmp_path / "2024-delta-20250102T000000.parquet",
+    ]
+    for i, path in enumerate(paths):
+        year = int(path.name[:4])
+        pl.DataFrame({"date": [date(year, 6, i + 1)], "permno": [i]}).write_parquet(path)
+    return paths
+
+
+class TestManifestCatalog:
+    def test_year_views_include_deltas(self, partitions: list[Path]) -> None:
+        conn = duckdb.connect(":memory:")
+        catalog = ManifestCatalog(conn)
+        assert catalog.sync_views("test_daily", _manifest(partitions), partitions)
+
+        count = conn.execute(
+            f"SELECT COUNT(*) FROM {catalog.relation('test_daily', [2024, 2025])}"
+        ).fetchone()
+        assert count == (2,)
+        total = conn.execute(f"SELECT COUNT(*) FROM {catalog.relation('test_daily')}").fetchone()
+        assert total == (3,)
+
+        with pytest.raises(KeyError, match="No partitions"):
+            catalog.relation("test_daily", [2019])
+
+    def test_views_rebuilt_only_when_manifest_identity_changes(
+        self, partitions: list[Path]
+    ) -> None:
+        catalog = ManifestCatalog(duckdb.connect(":memory:"))
+        assert not catalog.is_current("test_daily", _manifest(partitions))
+        catalog.sync_views("test_daily", _manifest(partitions), partitions)
+
+        assert catalog.is_current("test_daily", _manifest(partitions))
+        assert not catalog.sync_views("test_daily", _manifest(partitions), partitions)
+        assert not catalog.is_current("test_daily", _manifest(partitions, checksum="older"))
+        # Rollbacks can lower the version; a different checksum still rebuilds
+        assert catalog.sync_views(
+            "test_daily", _manifest(partitions[:1], checksum="older"), partitions[:1]
+        )
+        with pytest.raises(KeyError):
+            catalog.relation("test_daily", [2024])
+
+        assert catalog.has_data("test_daily")
+        # Every manifest path rejected by validation
+        catalog.sync_views("test_daily", _manifest(partitions, checksum="outside"), [])
+        assert not catalog.has_data("test_daily")
+
+    def test_sync_table_reregisters_new_frame(self) -> None:
+        conn = duckdb.connect(":memory:")
+        catalog = ManifestCatalog(conn)
+        first = pl.DataFrame({"permno": [1, 2]})
+        catalog.sync_table("meta", first)
+        catalog.sync_table("meta", first)
+        assert conn.execute("SELECT COUNT(*) FROM meta").fetchone() == (2,)
+
+        catalog.sync_table("meta", pl.DataFrame({"permno": [3]}))
+        assert conn.execute("SELECT COUNT(*) FROM meta").fetchone() == (1,)
@@ -273,7 +273,7 @@ class TestAlpacaSIPSchemaNormalization:
                 "ret": [None, None, None],
             }
         )
-        provider.get_corporate_actions.side_effect = DataNotFoundError("no companion manifest")
+        provider.get_split_factor_table.side_effect = DataNotFoundError("no companion manifest")
         adapter = AlpacaSIPDataProviderAdapter(provider)
 
         df = adapter.get_daily_prices(["AAPL"], date(2024, 1, 2), date(2024, 1, 4))
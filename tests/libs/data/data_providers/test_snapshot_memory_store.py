@@ -0,0 +1,188 @@
+"""Tests for the preloaded snapshot memory store."""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import polars as pl
+import pytest
+
+from libs.data.data_providers.duckdb_catalog import ManifestCatalog
+from libs.data.data_providers.snapshot_memory_store import (
+    SnapshotMemoryStore,
+    get_snapshot_store,
+    preloaded_table,
+    set_snapshot_store,
+)
+from libs.data.data_quality.manifest import SyncManifest
+
+
+def _manifest(paths: list[Path], version: int = 1, checksum: str = "abc") -> SyncManifest:
+    return SyncManifest(
+        dataset="test_daily",
+        sync_timestamp=datetime.now(UTC),
+        start_date=date(2023, 1, 1),
+        end_date=date(2024, 12, 31),
+        row_count=0,
+        checksum=checksum,
+        schema_version="v1.0.0",
+        wrds_query_hash="q",
+        file_paths=[str(p) for p in paths],
+        validation_status="passed",
+        manifest_version=version,
+    )
+
+
+@pytest.fixture()
+def partitions(tmp_path: Path) -> list[Path]:
+    paths = [tmp_path / "2023.parquet", tmp_path / "2024.parquet"]
+    for i, path in enumerate(paths):
+        year = int(path.stem)
+        pl.DataFrame(
+            {"date": [date(year, 6, 1)] * (i + 1), "permno": list(range(i + 1))}
+        ).write_parquet(path)
+    return paths
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> Iterator[SnapshotMemoryStore]:
+    store = SnapshotMemoryStore(root=tmp_path / "shm")
+    set_snapshot_store(store)
+    yield store
+    set_snapshot_store(None)
+    store.close()
+
+
+def _count_in_child(result: Any, paths: list[Path]) -> None:
+    table = preloaded_table("test_daily", _manifest(paths), paths)
+    result.put(None if table is None else table.num_rows)
+
+
+class TestSnapshotMemoryStore:
+    def test_load_maps_partitions_once_per_manifest(
+        self, store: SnapshotMemoryStore, partitions: list[Path]
+    ) -> None:
+        manifest = _manifest(partitions)
+
+        assert store.load("test_daily", manifest, partitions)
+        assert not store.load("test_daily", manifest, partitions)
+
+        tables = store.tables("test_daily", manifest, partitions)
+        assert tables is not None
+        assert [t.num_rows for t in tables] == [1, 2]
+        assert len(list(store.root.glob("*.arrow"))) == 2
+        assert store.datasets == {"test_daily": (1, "abc")}
+
+    def test_manifest_change_evicts_previous_files(
+        self, store: SnapshotMemoryStore, partitions: list[Path]
+    ) -> None:
+        store.load("test_daily", _manifest(partitions), partitions)
+        old_files = set(store.root.glob("*.arrow"))
+
+        newer = _manifest(partitions[1:], version=2, checksum="def")
+        assert store.load("test_daily", newer, partitions[1:])
+
+        assert old_files.isdisjoint(store.root.glob("*.arrow"))
+        # Callers still pinned to the old manifest fall back to Parquet
+        assert store.tables("test_daily", _manifest(partitions), partitions) is None
+        assert store.tables("test_daily", newer, partitions[1:]) is not None
+
+    def test_unloaded_path_is_not_served(
+        self, store: SnapshotMemoryStore, partitions: list[Path]
+    ) -> None:
+        manifest = _manifest(partitions)
+        store.load("test_daily", manifest, partitions[:1])
+
+        assert store.tables("test_daily", manifest, partitions) is None
+        assert preloaded_table("test_daily", manifest, partitions) is None
+        assert preloaded_table("other", manifest, partitions[:1]) is None
+
+    def test_preloaded_table_concatenates_and_matches_relative_paths(
+        self,
+        store: SnapshotMemoryStore,
+        partitions: list[Path],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        manifest = _manifest(partitions)
+        store.load("test_daily", manifest, partitions)
+        monkeypatch.chdir(tmp_path)
+
+        table = preloaded_table("test_daily", manifest, [Path(p.name) for p in partitions])
+
+        assert table is not None
+        assert table.num_rows == 3
+
+    def test_only_owner_can_modify(
+        self, store: SnapshotMemoryStore, partitions: list[Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store.load("test_daily", _manifest(partitions), partitions)
+        monkeypatch.setattr(store, "_owner_pid", -1)
+
+        with pytest.raises(RuntimeError, match="owning process"):
+            store.evict("test_daily")
+        store.close()  # no-op outside the owner
+        assert store.root.exists()
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+    )
+    def test_forked_child_reads_inherited_tables(
+        self, store: SnapshotMemoryStore, partitions: list[Path]
+    ) -> None:
+        store.load("test_daily", _manifest(partitions), partitions)
+        ctx = multiprocessing.get_context("fork")
+        result = ctx.Queue()
+
+        child = ctx.Process(target=_count_in_child, args=(result, partitions))
+        child.start()
+        child.join(timeout=30)
+
+        assert child.exitcode == 0
+        assert result.get(timeout=5) == 3
+
+    def test_close_removes_store_directory(
+        self, store: SnapshotMemoryStore, partitions: list[Path]
+    ) -> None:
+        store.load("test_daily", _manifest(partitions), partitions)
+        store.close()
+
+        assert not store.root.exists()
+        assert store.datasets == {}
+
+
+class TestCatalogIntegration:
+    def test_views_scan_preloaded_tables(
+        self, store: SnapshotMemoryStore, partitions: list[Path]
+    ) -> None:
+        manifest = _manifest(partitions)
+        store.load("test_daily", manifest, partitions)
+        # Deleting the Parquet files proves the views read the mapped tables
+        for path in partitions:
+            path.unlink()
+
+        conn = duckdb.connect(":memory:")
+        catalog = ManifestCatalog(conn)
+        catalog.sync_views("test_daily", manifest, partitions)
+
+        assert conn.execute(
+            f"SELECT COUNT(*) FROM {catalog.relation('test_daily')}"
+        ).fetchone() == (3,)
+        assert conn.execute(
+            f"SELECT COUNT(*) FROM {catalog.relation('test_daily', [2024])}"
+        ).fetchone() == (2,)
+
+    def test_views_fall_back_to_parquet_without_store(self, partitions: list[Path]) -> None:
+        assert get_snapshot_store() is None
+        conn = duckdb.connect(":memory:")
+        catalog = ManifestCatalog(conn)
+        catalog.sync_views("test_daily", _manifest(partitions), partitions)
+
+        assert conn.execute(
+            f"SELECT COUNT(*) FROM {catalog.relation('test_daily')}"
+        ).fetchone() == (3,)
@@ -10,6 +10,12 @@ import polars as pl
 import pytest
 
 from libs.data.data_providers.locking import atomic_lock
+from libs.data.data_providers.sync_file_utils import (
+    base_partition_name,
+    delta_partition_name,
+    is_delta_partition,
+    partition_year,
+)
 from libs.data.data_providers.sync_manager import SyncManager, SyncProgress
 from libs.data.data_quality.exceptions import DiskSpaceError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
@@ -24,6 +30,7 @@ def test_dirs(tmp_path: Path) -> dict[str, Path]:
         "storage": tmp_path / "wrds",
         "locks": tmp_path / "locks",
         "manifests": tmp_path / "manifests",
+        "backups": tmp_path / "backups",
         "schemas": tmp_path / "schemas",
         "progress": tmp_path / "sync_progress",
         "quarantine": tmp_path / "quarantine",
@@ -57,6 +64,7 @@ def sync_manager(
     manifest_manager = ManifestManager(
         storage_path=test_dirs["manifests"],
         lock_dir=test_dirs["locks"],
+        backup_dir=test_dirs["backups"],
     )
     validator = DataValidator()
     schema_registry = SchemaRegistry(
@@ -363,19 +371,296 @@ class TestIncrementalSync:
             # Call incremental sync
             result_manifest = sync_manager.incremental_sync("crsp_daily")
 
-        # Verify the file was updated with merged data
-        result_df = pl.read_parquet(initial_file)
-
-        # Should have merged data: 3 initial + 1 new = 4 rows
-        assert result_df.height == 4
+        # Base partition is untouched; new rows land in a registered delta
+        assert pl.read_parquet(initial_file).height == 3
         assert result_manifest.row_count == 4
+        assert len(result_manifest.file_paths) == 2
+        delta_path = Path(result_manifest.file_paths[1])
+        assert delta_path.parent == storage_dir / SyncManager.DELTA_DIR
+        assert delta_path.name.startswith("2024-delta-20240615T120000000000-")
 
-        # Verify today's date is present in the merged data
-        dates = result_df["date"].to_list()
+        # Union of manifest files holds both existing and new dates
+        dates = pl.read_parquet(result_manifest.file_paths)["date"].to_list()
         assert today.isoformat() in dates
         assert yesterday.isoformat() in dates
 
 
+class TestDeltaPartitions:
+    """Tests for incremental delta partitions and compaction."""
+
+    YEAR = 2024
+
+    @pytest.fixture()
+    def base_file(self, sync_manager: SyncManager, test_dirs: dict[str, Path]) -> Path:
+        """Write a 2024 base partition and a manifest ending 2024-06-14."""
+        sync_manager.schema_registry.register_schema(
+            "crsp_daily",
+            {"date": "String", "permno": "Int64", "ret": "Float64"},
+        )
+        storage_dir = test_dirs["storage"] / "crsp_daily"
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        base_file = storage_dir / f"{self.YEAR}.parquet"
+        pl.DataFrame(
+            {
+                "date": ["2024-06-13", "2024-06-13", "2024-06-14"],
+                "permno": [10001, 10002, 10001],
+                "ret": [0.01, 0.02, 0.03],
+            }
+        ).write_parquet(base_file)
+
+        manifest = SyncManifest(
+            dataset="crsp_daily",
+            sync_timestamp=datetime.datetime.now(datetime.UTC),
+            start_date=datetime.date(self.YEAR, 1, 1),
+            end_date=datetime.date(self.YEAR, 6, 14),
+            row_count=3,
+            checksum=sync_manager._compute_combined_checksum([str(base_file)]),
+            schema_version="v1.0.0",
+            wrds_query_hash="hash123",
+            file_paths=[str(base_file)],
+            validation_status="passed",
+        )
+        with atomic_lock(test_dirs["locks"], "crsp_daily") as token:
+            sync_manager.manifest_manager.save_manifest(manifest, token)
+        return base_file
+
+    def _run_incremental(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        today: datetime.date,
+        new_data: pl.DataFrame,
+    ) -> SyncManifest:
+        mock_wrds_client.execute_query.return_value = new_data
+        with patch("libs.data.data_providers.sync_manager.datetime") as mock_datetime:
+            mock_datetime.date.today.return_value = today
+            mock_datetime.datetime.now.return_value = datetime.datetime(
+                today.year, today.month, today.day, 6, 0, 0, tzinfo=datetime.UTC
+            )
+            mock_datetime.timedelta = datetime.timedelta
+            mock_datetime.UTC = datetime.UTC
+            return sync_manager.incremental_sync("crsp_daily")
+
+    def test_compaction_matches_in_place_merge(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        base_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Compacting deltas yields the same base as merging each sync in place."""
+        day1 = pl.DataFrame(
+            {"date": ["2024-06-17", "2024-06-17"], "permno": [10002, 10001], "ret": [0.1, 0.2]}
+        )
+        day2 = pl.DataFrame({"date": ["2024-06-18"], "permno": [10001], "ret": [0.3]})
+
+        # Reference: the pre-delta in-place merge of both syncs
+        reference = tmp_path / "reference.parquet"
+        pl.read_parquet(base_file).write_parquet(reference)
+        for new_rows in (day1, day2):
+            merged = (
+                pl.concat([pl.read_parquet(reference), new_rows])
+                .unique(subset=["date", "permno"], keep="last")
+                .sort(["date", "permno"])
+            )
+            merged.write_parquet(reference)
+
+        self._run_incremental(sync_manager, mock_wrds_client, datetime.date(2024, 6, 17), day1)
+        synced = self._run_incremental(
+            sync_manager, mock_wrds_client, datetime.date(2024, 6, 18), day2
+        )
+        deltas = [Path(p) for p in synced.file_paths[1:]]
+        assert len(deltas) == 2
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+        compacted = sync_manager.compact_deltas("crsp_daily")
+
+        assert len(compacted.file_paths) == 1
+        new_base = Path(compacted.file_paths[0])
+        assert new_base.parent == base_file.parent
+        assert new_base.name.startswith("2024-base-")
+        assert compacted.row_count == 6
+        assert compacted.end_date == datetime.date(2024, 6, 18)
+        assert not base_file.exists()
+        assert not any(p.exists() for p in deltas)
+        assert pl.read_parquet(new_base).equals(pl.read_parquet(reference))
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+        # Nothing left to fold: manifest is returned unchanged
+        assert sync_manager.compact_deltas("crsp_daily").checksum == compacted.checksum
+
+    def test_correction_folds_into_base(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        base_file: Path,
+    ) -> None:
+        """Rows replacing existing keys rewrite the base along with pending deltas."""
+        self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 17),
+            pl.DataFrame({"date": ["2024-06-17"], "permno": [10001], "ret": [0.2]}),
+        )
+        result = self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 18),
+            pl.DataFrame(
+                {"date": ["2024-06-17", "2024-06-18"], "permno": [10001, 10001], "ret": [0.25, 0.3]}
+            ),
+        )
+
+        assert len(result.file_paths) == 1
+        assert Path(result.file_paths[0]).name.startswith("2024-base-")
+        assert not base_file.exists()
+        assert result.row_count == 5
+        base = pl.read_parquet(result.file_paths[0])
+        assert base.filter(pl.col("date") == "2024-06-17")["ret"].to_list() == [0.25]
+        assert list((base_file.parent / SyncManager.DELTA_DIR).glob("*.parquet")) == []
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+    def test_failed_compaction_keeps_previous_manifest_consistent(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        base_file: Path,
+    ) -> None:
+        """A failure before the manifest save leaves the old base, deltas and manifest."""
+        synced = self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 17),
+            pl.DataFrame({"date": ["2024-06-17"], "permno": [10001], "ret": [0.2]}),
+        )
+        storage_dir = base_file.parent
+
+        with (
+            patch.object(
+                sync_manager.manifest_manager, "save_manifest", side_effect=OSError("disk")
+            ),
+            pytest.raises(OSError, match="disk"),
+        ):
+            sync_manager.compact_deltas("crsp_daily")
+
+        current = sync_manager.manifest_manager.load_manifest("crsp_daily")
+        assert current is not None
+        assert current.file_paths == synced.file_paths
+        assert current.checksum == synced.checksum
+        assert all(Path(p).exists() for p in synced.file_paths)
+        assert list(storage_dir.glob("2024-base-*.parquet")) == []
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+        # The surviving deltas still compact cleanly afterwards
+        compacted = sync_manager.compact_deltas("crsp_daily")
+        assert compacted.row_count == 4
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+    def test_full_sync_removes_unreferenced_partitions(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        base_file: Path,
+    ) -> None:
+        """A full sync deletes versioned bases and deltas its manifest replaced."""
+        self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 17),
+            pl.DataFrame({"date": ["2024-06-14"], "permno": [10001], "ret": [0.04]}),
+        )
+        synced = self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 18),
+            pl.DataFrame({"date": ["2024-06-18"], "permno": [10001], "ret": [0.3]}),
+        )
+        old_paths = [Path(p) for p in synced.file_paths]
+        assert old_paths[0].name.startswith("2024-base-")
+        assert len(old_paths) == 2
+        storage_dir = base_file.parent
+
+        mock_wrds_client.execute_query.return_value = pl.DataFrame(
+            {"date": ["2024-01-02"], "permno": [10001], "ret": [0.01]}
+        )
+        result = sync_manager.full_sync("crsp_daily", start_year=2024, end_year=2024)
+
+        assert result.file_paths == [str(base_file)]
+        assert not any(p.exists() for p in old_paths)
+        assert list(storage_dir.glob("2024-base-*.parquet")) == []
+        assert list((storage_dir / SyncManager.DELTA_DIR).glob("*.parquet")) == []
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+    def test_in_place_fallback_drops_stale_year_entries(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        base_file: Path,
+    ) -> None:
+        """Merging in place replaces a missing versioned base and its deltas."""
+        self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 17),
+            pl.DataFrame({"date": ["2024-06-14"], "permno": [10001], "ret": [0.04]}),
+        )
+        synced = self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 18),
+            pl.DataFrame({"date": ["2024-06-18"], "permno": [10001], "ret": [0.3]}),
+        )
+        versioned_base, delta = (Path(p) for p in synced.file_paths)
+        versioned_base.unlink()
+
+        result = self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 19),
+            pl.DataFrame({"date": ["2024-06-19"], "permno": [10001], "ret": [0.5]}),
+        )
+
+        assert result.file_paths == [str(base_file)]
+        assert not delta.exists()
+        assert sync_manager.verify_integrity("crsp_daily") == []
+
+    def test_partition_names_are_unique_within_a_second(self) -> None:
+        """Delta and base names carry sub-second time and a random token."""
+        created_at = datetime.datetime(2024, 6, 17, 6, 0, 0, 123456, tzinfo=datetime.UTC)
+        deltas = {delta_partition_name(self.YEAR, created_at) for _ in range(50)}
+        bases = {base_partition_name(self.YEAR, created_at) for _ in range(50)}
+
+        assert len(deltas) == 50
+        assert len(bases) == 50
+        for name in (*deltas, *bases):
+            assert partition_year(Path(name)) == self.YEAR
+        assert all(is_delta_partition(Path(name)) for name in deltas)
+        assert not any(is_delta_partition(Path(name)) for name in bases)
+        # Legacy second-resolution deltas sort before newer ones
+        legacy = Path("2024-delta-20240617T060000.parquet")
+        assert is_delta_partition(legacy)
+        assert legacy.name < min(deltas)
+
+    def test_empty_fetch_keeps_manifest_files(
+        self,
+        sync_manager: SyncManager,
+        mock_wrds_client: MagicMock,
+        base_file: Path,
+    ) -> None:
+        """No new rows writes no delta and leaves the base untouched."""
+        before = base_file.stat().st_mtime_ns
+        result = self._run_incremental(
+            sync_manager,
+            mock_wrds_client,
+            datetime.date(2024, 6, 17),
+            pl.DataFrame(schema={"date": pl.String, "permno": pl.Int64, "ret": pl.Float64}),
+        )
+
+        assert result.file_paths == [str(base_file)]
+        assert result.row_count == 3
+        assert base_file.stat().st_mtime_ns == before
+
+
 class TestVerifyOnly:
     """Tests for verify-only mode."""
 
@@ -0,0 +1,414 @@
+"""Tests for derived TAQ components and their use by MicrostructureAnalyzer."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from libs.data.data_providers.taq_derived import (
+    bucketize_volume,
+    build_intraday_components,
+    build_spread_depth_summary,
+    build_vpin_buckets,
+    bvc_volumes,
+    vpin_from_buckets,
+)
+from libs.data.data_providers.taq_query_provider import TAQLocalProvider
+from libs.data.data_providers.taq_storage import TAQStorageManager
+from libs.data.data_quality.manifest import ManifestManager, SyncManifest
+from libs.data.data_quality.schema import SchemaRegistry
+from libs.data.data_quality.validation import DataValidator
+from libs.data.data_quality.versioning import DatasetVersionManager
+from libs.platform.analytics.microstructure import MicrostructureAnalyzer
+
+TRADE_DATE = date(2024, 1, 15)
+
+
+def _reference_buckets(
+    v_buy: np.ndarray,
+    v_sell: np.ndarray,
+    sizes: np.ndarray,
+    sigma_zero: np.ndarray,
+    timestamps: list[Any],
+    volume_per_bucket: int,
+    window_buckets: int,
+    sigma_lookback: int,
+) -> list[dict[str, Any]]:
+    """Sequential bucket-filling loop the vectorized bucketing must reproduce."""
+    cumulative_volume = np.cumsum(sizes)
+    buckets: list[dict[str, Any]] = []
+    vol = buy = sell = 0.0
+    ts = None
+    contaminated = False
+    buys: list[float] = []
+    sells: list[float] = []
+
+    def _vpin() -> float:
+        if contaminated or len(buys) < window_buckets:
+            return float("nan")
+        wb, ws = sum(buys[-window_buckets:]), sum(sells[-window_buckets:])
+        return abs(wb - ws) / (wb + ws) if wb + ws > 0 else float("nan")
+
+    for i in range(sigma_lookback, len(sizes)):
+        contaminated |= bool(sigma_zero[i])
+        rem, rem_b, rem_s = float(sizes[i]), float(v_buy[i]), float(v_sell[i])
+        while rem > 0:
+            cap = volume_per_bucket - vol
+            if rem <= cap:
+                vol, buy, sell, ts, rem = vol + rem, buy + rem_b, sell + rem_s, timestamps[i], 0
+            else:
+                if cap > 0:
+                    ratio = cap / rem
+                    vol, buy, sell, ts = (
+                        vol + cap,
+                        buy + rem_b * ratio,
+                        sell + rem_s * ratio,
+                        timestamps[i],
+                    )
+                    rem, rem_b, rem_s = rem - cap, rem_b * (1 - ratio), rem_s * (1 - ratio)
+                buys.append(buy)
+                sells.append(sell)
+                buckets.append(
+                    {
+                        "vpin": _vpin(),
+                        "cumulative_volume": float(cumulative_volume[i]),
+                        "imbalance": abs(buy - sell),
+                        "timestamp": ts,
+                        "is_partial": False,
+                    }
+                )
+                vol = buy = sell = 0.0
+                contaminated = False
+
+    if vol > 0:
+        buys.append(buy)
+        sells.append(sell)
+        buckets.append(
+            {
+                "vpin": _vpin(),
+                "cumulative_volume": float(cumulative_volume[-1]),
+                "imbalance": abs(buy - sell),
+                "timestamp": ts,
+                "is_partial": True,
+            }
+        )
+    return buckets
+
+
+def _ticks(n: int, seed: int = 0, flat_every: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    prices = 100.0 + np.cumsum(rng.normal(0, 0.02, n))
+    if flat_every:
+        # Runs of unchanged prices produce sigma=0 windows
+        for start in range(0, n, flat_every):
+            prices[start : start + 25] = prices[start]
+    sizes = rng.choice([0, 100, 200, 500, 1_000, 2_500], size=n, p=[0.05, 0.3, 0.3, 0.2, 0.1, 0.05])
+    start_ts = datetime(2024, 1, 15, 9, 30)
+    quote_sizes = rng.integers(1, 5, n) * 100
+    return pl.DataFrame(
+        {
+            "ts": [start_ts + timedelta(seconds=int(s)) for s in np.cumsum(rng.integers(1, 90, n))],
+            "symbol": ["AAPL"] * n,
+            "bid": prices - 0.01,
+            "ask": prices + 0.01,
+            "bid_size": quote_sizes,
+            "ask_size": quote_sizes[::-1].copy(),
+            "trade_px": prices,
+            "trade_size": sizes,
+            "cond": [""] * n,
+        }
+    )
+
+
+def _bars(days: list[date], symbol: str = "AAPL", seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    frames = []
+    for day in days:
+        ts = [
+            datetime(day.year, day.month, day.day, 9, 30) + timedelta(minutes=m) for m in range(390)
+        ]
+        close = 100.0 + np.cumsum(rng.normal(0, 0.05, len(ts)))
+        frames.append(
+            pl.DataFrame(
+                {
+                    "ts": ts,
+                    "symbol": [symbol] * len(ts),
+                    "open": close - 0.02,
+                    "high": close + rng.uniform(0.01, 0.2, len(ts)),
+                    "low": close - rng.uniform(0.01, 0.2, len(ts)),
+                    "close": close,
+                    "volume": rng.integers(100, 10_000, len(ts)),
+                    "vwap": close,
+                    "date": [day] * len(ts),
+                }
+            )
+        )
+    return pl.concat(frames)
+
+
+class TestBucketizeVolume:
+    """The vectorized bucketing matches the sequential loop."""
+
+    @pytest.mark.parametrize(
+        ("seed", "volume_per_bucket", "window_buckets", "flat_every"),
+        [(0, 5_000, 10, 0), (1, 1_000, 5, 0), (2, 3_000, 4, 400), (3, 100, 50, 0)],
+    )
+    def test_matches_sequential_loop(
+        self, seed: int, volume_per_bucket: int, window_buckets: int, flat_every: int
+    ) -> None:
+        ticks = _ticks(2_000, seed=seed, flat_every=flat_every).filter(pl.col("trade_size") > 0)
+        sigma_lookback = 20
+        prices = ticks["trade_px"].to_numpy()
+        sizes = ticks["trade_size"].to_numpy()[1:]
+        timestamps = ticks["ts"][1:]
+        log_returns = np.log(prices[1:] / prices[:-1])
+        v_buy, v_sell, sigma_zero = bvc_volumes(log_returns, sizes, sigma_lookback)
+
+        expected = _reference_buckets(
+            v_buy,
+            v_sell,
+            sizes,
+            sigma_zero,
+            timestamps.to_list(),
+            volume_per_bucket,
+            window_buckets,
+            sigma_lookback,
+        )
+        actual = vpin_from_buckets(
+            bucketize_volume(
+                v_buy, v_sell, sizes, sigma_zero, timestamps, volume_per_bucket, sigma_lookback
+            ),
+            window_buckets,
+        )
+
+        assert actual.height == len(expected)
+        exp = pl.DataFrame(expected)
+        for col in ("cumulative_volume", "imbalance", "vpin"):
+            np.testing.assert_allclose(
+                actual[col].to_numpy(), exp[col].to_numpy(), rtol=1e-9, atol=1e-6, equal_nan=True
+            )
+        assert actual["timestamp"].to_list() == exp["timestamp"].to_list()
+        assert actual["is_partial"].to_list() == exp["is_partial"].to_list()
+        if flat_every:
+            assert actual["vpin"].is_nan().sum() > window_buckets - 1
+
+    def test_exact_fill_closes_on_next_trade(self) -> None:
+        """A bucket filled exactly stays open until the next trade (loop semantics)."""
+        sizes = np.array([50.0, 50.0, 30.0])
+        ts = pl.Series([datetime(2024, 1, 15, 9, 30, s) for s in range(3)])
+        zero = np.array([False, False, True])
+        buckets = bucketize_volume(sizes / 2, sizes / 2, sizes, zero, ts, 100)
+
+        assert buckets["cumulative_volume"].to_list() == [130.0, 130.0]
+        assert buckets["timestamp"][0] == datetime(2024, 1, 15, 9, 30, 1)
+        # The closing trade's sigma=0 flag lands in the bucket it closes
+        assert buckets["sigma_zero"].to_list() == [True, False]
+        assert buckets["is_partial"].to_list() == [False, True]
+
+    def test_build_vpin_buckets_records_parameters(self) -> None:
+        buckets = build_vpin_buckets(_ticks(500), volume_per_bucket=2_000, sigma_lookback=10)
+
+        assert buckets["volume_per_bucket"].unique().to_list() == [2_000]
+        assert buckets["sigma_lookback"].unique().to_list() == [10]
+        assert 0 < buckets["zero_volume_pct"][0] < 1
+        assert build_vpin_buckets(_ticks(5)).is_empty()
+
+
+class TestSummaries:
+    """Spread/depth and intraday summaries."""
+
+    def test_spread_depth_empty_ticks(self) -> None:
+        summary = build_spread_depth_summary(_ticks(10).head(0))
+
+        assert summary["n_quotes"][0] == 0
+        assert np.isnan(summary["avg_bid_depth"][0])
+
+    def test_intraday_components_slots(self) -> None:
+        components = build_intraday_components(_bars([TRADE_DATE]))
+
+        assert components.height == 78
+        assert components["bar_count"].sum() == 390
+        assert components["slot_minute"][0] == 9 * 60 + 30
+        assert components["sample_close"].null_count() == 0
+
+
+# =========================================================================
+# Storage -> provider -> analyzer
+# =========================================================================
+
+
+def _write_manifest(manager: ManifestManager, dataset: str, paths: list[Path]) -> None:
+    manifest = SyncManifest(
+        dataset=dataset,
+        sync_timestamp=datetime.now(UTC),
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 2, 29),
+        row_count=1,
+        checksum=f"{dataset}_v1",
+        schema_version="v1.0.0",
+        wrds_query_hash="hash",
+        file_paths=[str(p) for p in paths],
+        validation_status="passed",
+    )
+    path = manager.storage_path / f"{dataset}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(manifest.model_dump_json(indent=2))
+
+
+@pytest.fixture()
+def derived_env(tmp_path: Path) -> tuple[TAQStorageManager, TAQLocalProvider]:
+    data_root = tmp_path / "data"
+    storage_path = data_root / "taq"
+    lock_dir = data_root / "locks"
+    manifest_manager = ManifestManager(
+        storage_path=data_root / "manifests" / "taq",
+        lock_dir=lock_dir,
+        data_root=data_root,
+        backup_dir=data_root / "manifests" / "backups",
+    )
+    storage = TAQStorageManager(
+        wrds_client=MagicMock(),
+        storage_path=storage_path,
+        lock_dir=lock_dir,
+        manifest_manager=manifest_manager,
+        version_manager=DatasetVersionManager(
+            manifest_manager=manifest_manager,
+            validator=None,
+            snapshots_dir=data_root / "snapshots",
+            cas_dir=data_root / "cas",
+            diffs_dir=data_root / "diffs",
+            locks_dir=lock_dir,
+            data_root=data_root,
+        ),
+        validator=DataValidator(),
+        schema_registry=SchemaRegistry(
+            storage_path=data_root / "schemas", lock_dir=lock_dir / "schema"
+        ),
+    )
+
+    bars_path = storage_path / "aggregates" / "1min_bars" / "202401.parquet"
+    _bars([date(2024, 1, 15), date(2024, 1, 16)]).write_parquet(bars_path)
+    _write_manifest(manifest_manager, "taq_1min_bars", [bars_path])
+
+    ticks_path = storage_path / "samples" / "2024-01-15" / "AAPL.parquet"
+    ticks_path.parent.mkdir(parents=True)
+    _ticks(3_000, seed=7, flat_every=900).write_parquet(ticks_path)
+    _write_manifest(manifest_manager, "taq_samples_20240115", [ticks_path])
+
+    spread_path = storage_path / "aggregates" / "spread_stats" / "202401.parquet"
+    pl.DataFrame(
+        {
+            "date": [TRADE_DATE],
+            "symbol": ["AAPL"],
+            "qwap_spread": [0.0002],
+            "ewas": [0.0001],
+            "quotes": [3_000],
+            "trades": [2_800],
+        }
+    ).write_parquet(spread_path)
+    _write_manifest(manifest_manager, "taq_spread_stats", [spread_path])
+
+    provider = TAQLocalProvider(
+        storage_path=storage_path, manifest_manager=manifest_manager, data_root=data_root
+    )
+    return storage, provider
+
+
+def _raw_only(provider: TAQLocalProvider) -> MicrostructureAnalyzer:
+    """Analyzer whose provider reports no derived components."""
+    raw = MagicMock(wraps=provider)
+    raw.manifest_manager = provider.manifest_manager
+    raw.version_manager = None
+    raw.fetch_vpin_buckets.return_value = pl.DataFrame()
+    raw.fetch_spread_depth_summary.return_value = pl.DataFrame()
+    raw.fetch_intraday_components.return_value = None
+    return MicrostructureAnalyzer(raw)
+
+
+class TestDerivedAnalyzerPaths:
+    """Analyzer results from derived partitions match the raw-data paths."""
+
+    def test_rebuild_writes_partitions(self, derived_env) -> None:
+        storage, provider = derived_env
+        assert storage.rebuild_derived(date(2024, 1, 1), date(2024, 1, 31)) == 2
+
+        assert not provider.fetch_vpin_buckets(TRADE_DATE, "aapl").is_empty()
+        assert provider.fetch_spread_depth_summary(TRADE_DATE, "AAPL").height == 1
+        assert provider.fetch_vpin_buckets(TRADE_DATE, "MSFT").is_empty()
+        components = provider.fetch_intraday_components(["AAPL"], TRADE_DATE, TRADE_DATE)
+        assert components is not None
+        assert components["date"].unique().to_list() == [TRADE_DATE]
+
+    def test_intraday_components_missing_partition(self, derived_env) -> None:
+        _storage, provider = derived_env
+        assert provider.fetch_intraday_components(["AAPL"], TRADE_DATE, TRADE_DATE) is None
+
+    def test_vpin_matches_raw(self, derived_env) -> None:
+        storage, provider = derived_env
+        storage.rebuild_derived(TRADE_DATE, TRADE_DATE)
+        analyzer = MicrostructureAnalyzer(provider)
+
+        derived = analyzer.compute_vpin("AAPL", TRADE_DATE, window_buckets=8)
+        raw = _raw_only(provider).compute_vpin("AAPL", TRADE_DATE, window_buckets=8)
+
+        assert derived.num_buckets > 8
+        assert derived.warnings == raw.warnings
+        assert "sigma=0 detected" in derived.warnings
+        assert_frame_equal(derived.data, raw.data, check_dtypes=False)
+        # Different bucket parameters cannot be served from the stored partition
+        other = analyzer.compute_vpin("AAPL", TRADE_DATE, volume_per_bucket=5_000)
+        assert other.data["cumulative_volume"][0] != derived.data["cumulative_volume"][0]
+
+    def test_intraday_pattern_and_rv_match_raw(self, derived_env) -> None:
+        storage, provider = derived_env
+        storage.rebuild_derived(TRADE_DATE, TRADE_DATE)
+        analyzer = MicrostructureAnalyzer(provider)
+        raw = _raw_only(provider)
+
+        pattern = analyzer.analyze_intraday_pattern("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+        raw_pattern = raw.analyze_intraday_pattern("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+        assert_frame_equal(pattern.data, raw_pattern.data, check_exact=False)
+        assert pattern.data["n_days"][0] == 2
+
+        for freq in (5, 15, 30):
+            rv = analyzer.compute_realized_volatility("AAPL", TRADE_DATE, freq)
+            raw_rv = raw.compute_realized_volatility("AAPL", TRADE_DATE, freq)
+            assert rv.rv_daily == pytest.approx(raw_rv.rv_daily, rel=1e-12)
+            assert rv.num_observations == raw_rv.num_observations
+
+    def test_spread_depth_matches_raw(self, derived_env) -> None:
+        storage, provider = derived_env
+        storage.rebuild_derived(TRADE_DATE, TRADE_DATE)
+
+        derived = MicrostructureAnalyzer(provider).compute_spread_depth_stats("AAPL", TRADE_DATE)
+        raw = _raw_only(provider).compute_spread_depth_stats("AAPL", TRADE_DATE)
+
+        assert derived.avg_bid_depth == pytest.approx(raw.avg_bid_depth)
+        assert derived.avg_ask_depth == pytest.approx(raw.avg_ask_depth)
+        assert derived.stale_quote_pct == pytest.approx(raw.stale_quote_pct)
+        assert derived.depth_is_estimated is raw.depth_is_estimated is False
+
+    def test_pit_queries_bypass_derived(self, derived_env) -> None:
+        storage, provider = derived_env
+        storage.rebuild_derived(TRADE_DATE, TRADE_DATE)
+        spy = MagicMock(wraps=provider)
+        spy.version_manager = None
+
+        with pytest.raises(ValueError, match="version_manager"):
+            MicrostructureAnalyzer(spy).compute_vpin("AAPL", TRADE_DATE, as_of=TRADE_DATE)
+        spy.fetch_vpin_buckets.assert_not_called()
+
+    def test_cleanup_removes_old_derived_dates(self, derived_env) -> None:
+        storage, _provider = derived_env
+        storage.rebuild_derived(TRADE_DATE, TRADE_DATE)
+
+        storage.cleanup(retention_days=0)
+
+        assert not (storage.storage_path / "derived" / "vpin_buckets" / "2024-01-15").exists()
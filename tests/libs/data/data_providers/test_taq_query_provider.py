@@ -11,7 +11,7 @@ from unittest.mock import MagicMock
 import polars as pl
 import pytest
 
-from libs.data.data_providers.taq_query_provider import TAQLocalProvider
+from libs.data.data_providers.taq_query_provider import TAQBarsRequest, TAQLocalProvider
 from libs.data.data_quality.exceptions import DataNotFoundError
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 from libs.data.data_quality.validation import DataValidator
@@ -64,6 +64,7 @@ def taq_env(tmp_path: Path) -> dict[str, Any]:
         storage_path=manifest_dir,
         lock_dir=lock_dir,
         data_root=data_root,
+        backup_dir=data_root / "manifests" / "backups",
     )
     version_manager = DatasetVersionManager(
         manifest_manager=manifest_manager,
@@ -394,6 +395,74 @@ def test_duckdb_and_polars_engine_parity(taq_env: dict[str, Any]) -> None:
     assert df_duck.to_dicts() == df_polars.to_dicts()
 
 
+@pytest.mark.parametrize("provider_key", ["provider", "polars_provider"])
+def test_fetch_minute_bars_batch_matches_single_queries(
+    taq_env: dict[str, Any], provider_key: str
+) -> None:
+    """Batched results are the per-request results tagged with request_key."""
+
+    provider: TAQLocalProvider = taq_env[provider_key]
+    requests = [
+        TAQBarsRequest("a-jan", "aapl", date(2024, 1, 1), date(2024, 1, 31)),
+        TAQBarsRequest("a-all", "AAPL", date(2024, 1, 2), date(2024, 2, 1)),
+        TAQBarsRequest("m-feb", "MSFT", date(2024, 2, 1), date(2024, 2, 29)),
+        TAQBarsRequest("inverted", "MSFT", date(2024, 1, 3), date(2024, 1, 2)),
+    ]
+
+    batch = provider.fetch_minute_bars_batch(requests)
+
+    assert batch.columns[0] == "request_key"
+    assert set(batch["request_key"].unique()) == {"a-jan", "a-all"}
+    for request in requests:
+        expected = provider.fetch_minute_bars(
+            symbols=[request.symbol],
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+        actual = batch.filter(pl.col("request_key") == request.key).drop("request_key")
+        assert actual.to_dicts() == expected.to_dicts()
+
+
+def test_fetch_minute_bars_batch_prunes_partitions_per_request(
+    monkeypatch: pytest.MonkeyPatch, taq_env: dict[str, Any]
+) -> None:
+    """Only the months touched by some request are scanned."""
+
+    provider: TAQLocalProvider = taq_env["provider"]
+    seen: list[list[Path]] = []
+    original = provider._execute_duckdb_batch
+
+    def _spy(paths: list[Path], reqs: pl.DataFrame) -> pl.DataFrame:
+        seen.append(paths)
+        return original(paths, reqs)
+
+    monkeypatch.setattr(provider, "_execute_duckdb_batch", _spy)
+
+    provider.fetch_minute_bars_batch(
+        [
+            TAQBarsRequest("a", "AAPL", date(2024, 1, 2), date(2024, 1, 2)),
+            TAQBarsRequest("m", "MSFT", date(2024, 1, 2), date(2024, 1, 2)),
+        ]
+    )
+
+    assert [p.name for p in seen[0]] == ["202401.parquet"]
+
+
+def test_fetch_minute_bars_batch_empty_results(taq_env: dict[str, Any]) -> None:
+    """No matches keep the keyed schema; an empty request list is rejected."""
+
+    provider: TAQLocalProvider = taq_env["provider"]
+
+    df = provider.fetch_minute_bars_batch(
+        [TAQBarsRequest("x", "ZZZZ", date(2024, 1, 2), date(2024, 1, 2))]
+    )
+    assert df.is_empty()
+    assert df.columns == ["request_key", *provider._empty_result("taq_1min_bars").columns]
+
+    with pytest.raises(ValueError, match="requests cannot be empty"):
+        provider.fetch_minute_bars_batch([])
+
+
 def test_thread_local_connection_isolated_per_thread(taq_env: dict[str, Any]) -> None:
     """Each thread gets its own DuckDB connection, main thread is reused."""
 
@@ -439,6 +508,7 @@ def test_storage_path_outside_data_root_raises(tmp_path: Path) -> None:
         storage_path=manifest_dir,
         lock_dir=data_root / "locks",
         data_root=data_root,
+        backup_dir=data_root / "manifests" / "backups",
     )
 
     with pytest.raises(ValueError, match="must be within data_root"):
@@ -1079,6 +1149,7 @@ def test_months_between_spans_year_boundary() -> None:
             storage_path=manifest_dir,
             lock_dir=data_root / "locks",
             data_root=data_root,
+            backup_dir=data_root / "manifests" / "backups",
         )
         provider = TAQLocalProvider(
             storage_path=storage_path,
@@ -1105,6 +1176,7 @@ def test_extract_month_key_non_standard_filename() -> None:
             storage_path=manifest_dir,
             lock_dir=data_root / "locks",
             data_root=data_root,
+            backup_dir=data_root / "manifests" / "backups",
         )
         provider = TAQLocalProvider(
             storage_path=storage_path,
@@ -1144,6 +1216,7 @@ def test_empty_result_unknown_dataset() -> None:
             storage_path=manifest_dir,
             lock_dir=data_root / "locks",
             data_root=data_root,
+            backup_dir=data_root / "manifests" / "backups",
         )
         provider = TAQLocalProvider(
             storage_path=storage_path,
@@ -45,6 +45,7 @@ def storage_manager(tmp_path: Path) -> TAQStorageManager:
         storage_path=data_root / "manifests",
         lock_dir=lock_dir,
         data_root=data_root,
+        backup_dir=data_root / "manifests" / "backups",
     )
     version_manager = DatasetVersionManager(
         manifest_manager=manifest_manager,
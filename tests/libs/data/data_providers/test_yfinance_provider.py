@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import json
 import sys
+import threading
 import time
 import types
 from datetime import date
@@ -2143,6 +2144,142 @@ class TestRateLimiting:
             assert "Download failed after retries" in caplog.text
 
 
+class TestConcurrentDownloads:
+    """Tests for concurrent, batched downloads and single-manifest publishing."""
+
+    @staticmethod
+    def _history() -> Any:
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "Date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+                "Open": [100.0, 101.0],
+                "High": [101.0, 102.0],
+                "Low": [99.0, 100.0],
+                "Close": [100.5, 101.5],
+                "Volume": [1000000, 1100000],
+                "Adj Close": [100.5, 101.5],
+            }
+        ).set_index("Date")
+
+    def test_invalid_worker_or_batch_settings_rejected(self, tmp_path: Path) -> None:
+        """Test max_workers and batch_size must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            YFinanceProvider(storage_path=tmp_path / "yf", max_workers=0)
+        with pytest.raises(ValueError, match="batch_size"):
+            YFinanceProvider(storage_path=tmp_path / "yf", batch_size=0)
+
+    def test_fetch_and_cache_publishes_manifest_once(self, provider: YFinanceProvider) -> None:
+        """Test all symbols are published with a single manifest write."""
+        provider.REQUEST_DELAY_SECONDS = 0.0
+        provider.JITTER_MAX_SECONDS = 0.0
+        symbols = ["SPY", "QQQ", "IWM", "DIA"]
+
+        with (
+            patch("yfinance.Ticker") as mock_ticker_cls,
+            patch.object(
+                provider, "_atomic_write_manifest", wraps=provider._atomic_write_manifest
+            ) as write_manifest,
+        ):
+            mock_ticker_cls.return_value.history.return_value = self._history()
+            result = provider.fetch_and_cache(
+                symbols=symbols,
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 1, 5),
+                run_drift_check=False,
+            )
+
+        assert write_manifest.call_count == 1
+        assert list(result["files"]) == [f"{s}.parquet" for s in symbols]
+        manifest = provider.get_manifest()
+        assert manifest is not None
+        for symbol in symbols:
+            cache_path = provider._safe_cache_path(symbol)
+            assert manifest["files"][f"{symbol}.parquet"]["checksum"] == (
+                provider._compute_checksum(cache_path)
+            )
+        assert not list(provider._daily_dir.glob("*.tmp"))
+
+    def test_throttle_spaces_requests_across_workers(self, tmp_path: Path) -> None:
+        """Test concurrent workers still start requests at the configured rate."""
+        provider = YFinanceProvider(storage_path=tmp_path / "yf", max_workers=4)
+        provider.REQUEST_DELAY_SECONDS = 0.05
+        provider.JITTER_MAX_SECONDS = 0.0
+        call_times: list[float] = []
+
+        def mock_ticker_factory(symbol: str) -> MagicMock:
+            call_times.append(time.monotonic())
+            ticker = MagicMock()
+            ticker.history.return_value = self._history()
+            return ticker
+
+        with patch("yfinance.Ticker", side_effect=mock_ticker_factory):
+            results = provider._fetch_symbols(
+                ["SPY", "QQQ", "IWM", "DIA"], date(2024, 1, 1), date(2024, 1, 5)
+            )
+
+        assert [df["symbol"][0] for df in results] == ["SPY", "QQQ", "IWM", "DIA"]
+        gaps = [b - a for a, b in zip(sorted(call_times), sorted(call_times)[1:], strict=False)]
+        assert min(gaps) >= 0.045
+
+    def test_batch_download_falls_back_per_symbol(self, tmp_path: Path) -> None:
+        """Test one multi-ticker request, with missing symbols fetched individually."""
+        import pandas as pd
+
+        provider = YFinanceProvider(storage_path=tmp_path / "yf", batch_size=3)
+        provider.REQUEST_DELAY_SECONDS = 0.0
+        provider.JITTER_MAX_SECONDS = 0.0
+        batch_frame = pd.concat({"SPY": self._history(), "QQQ": self._history()}, axis=1)
+
+        with (
+            patch("yfinance.download", create=True, return_value=batch_frame) as download,
+            patch("yfinance.Ticker") as mock_ticker_cls,
+        ):
+            mock_ticker_cls.return_value.history.return_value = self._history()
+            results = provider._fetch_symbols(
+                ["SPY", "QQQ", "IWM"], date(2024, 1, 1), date(2024, 1, 5)
+            )
+
+        download.assert_called_once()
+        assert download.call_args.kwargs["tickers"] == ["SPY", "QQQ", "IWM"]
+        mock_ticker_cls.assert_called_once_with("IWM")
+        assert [df["symbol"][0] for df in results] == ["SPY", "QQQ", "IWM"]
+        assert results[0].columns == list(YFINANCE_SCHEMA)
+
+    def test_batch_downloads_never_overlap_across_workers(self, tmp_path: Path) -> None:
+        """Test multi-ticker downloads are serialized when several workers run batches."""
+        import pandas as pd
+
+        provider = YFinanceProvider(storage_path=tmp_path / "yf", max_workers=2, batch_size=2)
+        provider.REQUEST_DELAY_SECONDS = 0.0
+        provider.JITTER_MAX_SECONDS = 0.0
+        state = {"active": 0, "max_active": 0}
+        state_lock = threading.Lock()
+
+        def fake_download(tickers: list[str], **kwargs: Any) -> Any:
+            with state_lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            time.sleep(0.05)
+            with state_lock:
+                state["active"] -= 1
+            return pd.concat({symbol: self._history() for symbol in tickers}, axis=1)
+
+        with (
+            patch("yfinance.download", create=True, side_effect=fake_download) as download,
+            patch("yfinance.Ticker") as mock_ticker_cls,
+        ):
+            results = provider._fetch_symbols(
+                ["SPY", "QQQ", "IWM", "DIA"], date(2024, 1, 1), date(2024, 1, 5)
+            )
+
+        assert download.call_count == 2
+        assert state["max_active"] == 1
+        mock_ticker_cls.assert_not_called()
+        assert [df["symbol"][0] for df in results] == ["SPY", "QQQ", "IWM", "DIA"]
+
+
 # =============================================================================
 # Download Tests
 # =============================================================================
@@ -0,0 +1,120 @@
+"""Tests for libs.data.data_quality.checksums module."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from libs.data.data_quality.checksums import FileHasher, sha256_file
+from libs.data.data_quality.validation import DataValidator
+
+
+def _write(path: Path, content: bytes, age_seconds: float = 60.0) -> Path:
+    """Write a file and backdate its mtime past the racy-cache window."""
+    path.write_bytes(content)
+    past = time.time() - age_seconds
+    os.utime(path, (past, past))
+    return path
+
+
+@pytest.fixture()
+def files(tmp_path: Path) -> list[Path]:
+    return [_write(tmp_path / f"part_{i}.parquet", os.urandom(3000 + i)) for i in range(6)]
+
+
+class TestSha256File:
+    def test_matches_hashlib_across_buffer_boundaries(self, files: list[Path]) -> None:
+        for path in files:
+            expected = hashlib.sha256(path.read_bytes()).hexdigest()
+            assert sha256_file(path, buffer_size=1024) == expected
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "empty", b"")
+        assert sha256_file(path) == hashlib.sha256(b"").hexdigest()
+
+
+class TestFileHasher:
+    def test_concurrent_checksums_match_sequential(self, files: list[Path]) -> None:
+        hasher = FileHasher(max_workers=4)
+        digests = hasher.checksums([*files, files[0]])
+
+        assert list(digests) == files
+        assert digests == {p: sha256_file(p) for p in files}
+
+    def test_invalid_arguments_raise(self) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            FileHasher(max_workers=0)
+        with pytest.raises(ValueError, match="buffer_size"):
+            FileHasher(buffer_size=0)
+
+    def test_missing_file_raises(self, tmp_path: Path, files: list[Path]) -> None:
+        with pytest.raises(FileNotFoundError):
+            FileHasher(max_workers=2).checksums([*files, tmp_path / "missing"])
+
+    def test_cache_persists_across_instances(self, tmp_path: Path, files: list[Path]) -> None:
+        cache_path = tmp_path / "cache" / "checksums.sqlite"
+        first = FileHasher(cache_path=cache_path, max_workers=2)
+        expected = first.checksums(files)
+        first.close()
+
+        second = FileHasher(cache_path=cache_path, max_workers=2)
+        with patch("libs.data.data_quality.checksums.sha256_file") as mock_hash:
+            assert second.checksums(files) == expected
+        mock_hash.assert_not_called()
+        second.close()
+
+    def test_cache_invalidated_when_file_changes(self, tmp_path: Path) -> None:
+        hasher = FileHasher(cache_path=tmp_path / "checksums.sqlite")
+        path = _write(tmp_path / "2024.parquet", b"original", age_seconds=120)
+        original = hasher.checksum(path)
+
+        # Same size, new mtime
+        _write(path, b"modified", age_seconds=60)
+        assert hasher.checksum(path) == hashlib.sha256(b"modified").hexdigest()
+
+        # Atomic replace: new inode even if size and mtime match
+        replacement = _write(tmp_path / "2024.parquet.tmp", b"original", age_seconds=60)
+        replacement.replace(path)
+        assert hasher.checksum(path) == original
+
+    def test_use_cache_false_rereads_in_place_rewrite(self, tmp_path: Path) -> None:
+        hasher = FileHasher(cache_path=tmp_path / "checksums.sqlite", max_workers=2)
+        path = _write(tmp_path / "2024.parquet", b"original", age_seconds=120)
+        other = _write(tmp_path / "2023.parquet", b"other", age_seconds=120)
+        hasher.checksums([path, other])
+
+        # Rewrite in place and restore size, mtime and inode
+        stat = path.stat()
+        with open(path, "r+b") as f:
+            f.write(b"tampered")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        expected = hashlib.sha256(b"tampered").hexdigest()
+        assert hasher.checksum(path) != expected
+        assert hasher.checksum(path, use_cache=False) == expected
+        assert hasher.checksums([path, other], use_cache=False)[path] == expected
+
+    def test_recently_modified_file_not_cached(self, tmp_path: Path) -> None:
+        hasher = FileHasher(cache_path=tmp_path / "checksums.sqlite")
+        path = tmp_path / "fresh.parquet"
+        path.write_bytes(b"fresh")
+
+        hasher.checksum(path)
+        assert hasher.cache is not None
+        assert hasher.cache.get(path, path.stat()) is None
+
+
+class TestDataValidatorHasher:
+    def test_aggregate_checksum_uses_hasher(self, tmp_path: Path, files: list[Path]) -> None:
+        uncached = DataValidator().compute_aggregate_checksum(files)
+        validator = DataValidator(hasher=FileHasher(cache_path=tmp_path / "c.sqlite"))
+
+        assert validator.compute_aggregate_checksum(list(reversed(files))) == uncached
+        with patch("libs.data.data_quality.checksums.sha256_file") as mock_hash:
+            assert validator.compute_aggregate_checksum(files) == uncached
+        mock_hash.assert_not_called()
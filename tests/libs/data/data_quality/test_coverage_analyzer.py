@@ -8,8 +8,9 @@ Tests cover:
 - Resolution aggregation: daily, weekly, monthly
 - Gap detection: contiguous missing trading days
 - Export formats: CSV and JSON
-- Edge cases: empty data, zero expected cells, symbol cap
+- Edge cases: empty data, zero expected cells, full universe (no cap)
 - Per-file fault tolerance: corrupt files skipped
+- Consolidated AdjustedStore as the adjusted presence source
 """
 
 from __future__ import annotations
@@ -21,14 +22,11 @@ from pathlib import Path
 import polars as pl
 import pytest
 
+from libs.data.data_pipeline.adjusted_store import AdjustedStore
 from libs.data.data_quality.coverage_analyzer import (
-    MAX_SYMBOLS,
     CoverageAnalyzer,
     CoverageMatrix,
     CoverageStatus,
-    _aggregate_monthly,
-    _aggregate_status,
-    _aggregate_weekly,
     _coerce_date,
     _find_gaps,
 )
@@ -119,36 +117,60 @@ class TestGetAvailableTickers:
 
 
 # ============================================================================
-# _aggregate_status
+# Period status precedence
 # ============================================================================
 
 
-class TestAggregateStatus:
-    def test_missing_wins(self) -> None:
-        statuses = [
-            CoverageStatus.COMPLETE,
-            CoverageStatus.MISSING,
-            CoverageStatus.SUSPICIOUS,
-        ]
-        assert _aggregate_status(statuses) == CoverageStatus.MISSING
+def _weekly_status(
+    analyzer: CoverageAnalyzer,
+    symbol: str,
+    start: datetime.date,
+    end: datetime.date,
+) -> CoverageStatus:
+    result = analyzer.analyze(
+        symbols=[symbol], start_date=start, end_date=end, resolution="weekly"
+    )
+    assert len(result.dates) == 1
+    return result.matrix[0][0]
 
-    def test_suspicious_over_complete(self) -> None:
-        statuses = [CoverageStatus.COMPLETE, CoverageStatus.SUSPICIOUS]
-        assert _aggregate_status(statuses) == CoverageStatus.SUSPICIOUS
 
-    def test_all_complete(self) -> None:
-        statuses = [CoverageStatus.COMPLETE, CoverageStatus.COMPLETE]
-        assert _aggregate_status(statuses) == CoverageStatus.COMPLETE
+class TestPeriodStatus:
+    def test_missing_wins(self, data_dir: Path) -> None:
+        """Jan 9 missing, Jan 10 suspicious, Jan 11 complete -> MISSING."""
+        _create_parquet(
+            data_dir / "adjusted" / "2024-01-15" / "GOOG.parquet",
+            ["2024-01-11"],
+            [99.0],
+        )
+        a = CoverageAnalyzer(data_dir=data_dir)
+        status = _weekly_status(
+            a, "GOOG", datetime.date(2024, 1, 9), datetime.date(2024, 1, 11)
+        )
+        assert status == CoverageStatus.MISSING
 
-    def test_all_no_expectation(self) -> None:
-        statuses = [
-            CoverageStatus.NO_EXPECTATION,
-            CoverageStatus.NO_EXPECTATION,
-        ]
-        assert _aggregate_status(statuses) == CoverageStatus.NO_EXPECTATION
+    def test_suspicious_over_complete(self, data_dir: Path) -> None:
+        _create_parquet(
+            data_dir / "adjusted" / "2024-01-15" / "GOOG.parquet",
+            ["2024-01-10", "2024-01-11", "2024-01-12"],
+            [99.0, 99.0, 99.0],
+        )
+        a = CoverageAnalyzer(data_dir=data_dir)
+        status = _weekly_status(
+            a, "GOOG", datetime.date(2024, 1, 10), datetime.date(2024, 1, 12)
+        )
+        assert status == CoverageStatus.SUSPICIOUS
+
+    def test_all_complete(self, analyzer: CoverageAnalyzer) -> None:
+        status = _weekly_status(
+            analyzer, "AAPL", datetime.date(2024, 1, 10), datetime.date(2024, 1, 12)
+        )
+        assert status == CoverageStatus.COMPLETE
 
-    def test_empty(self) -> None:
-        assert _aggregate_status([]) == CoverageStatus.NO_EXPECTATION
+    def test_all_no_expectation(self, analyzer: CoverageAnalyzer) -> None:
+        status = _weekly_status(
+            analyzer, "AAPL", datetime.date(2024, 1, 13), datetime.date(2024, 1, 14)
+        )
+        assert status == CoverageStatus.NO_EXPECTATION
 
 
 # ============================================================================
@@ -299,31 +321,36 @@ class TestEdgeCases:
 
 
 # ============================================================================
-# analyze: symbol cap
+# analyze: full universe
 # ============================================================================
 
 
-class TestSymbolCap:
-    def test_cap_at_200(self, tmp_path: Path) -> None:
-        """More than 200 symbols should be truncated."""
+class TestFullUniverse:
+    def test_no_symbol_cap(self, tmp_path: Path) -> None:
+        """Every discovered symbol is analyzed; nothing is truncated."""
         adjusted = tmp_path / "adjusted" / "2024-01-15"
         adjusted.mkdir(parents=True)
         for i in range(210):
             name = f"SYM{i:04d}"
             _create_parquet(
                 adjusted / f"{name}.parquet",
-                ["2024-01-15"],
+                ["2024-01-16"] if i % 2 == 0 else ["2024-01-17"],
                 [100.0],
             )
         a = CoverageAnalyzer(data_dir=tmp_path)
         result = a.analyze(
-            start_date=datetime.date(2024, 1, 15),
-            end_date=datetime.date(2024, 1, 15),
+            start_date=datetime.date(2024, 1, 16),
+            end_date=datetime.date(2024, 1, 17),
+            resolution="daily",
         )
-        assert len(result.symbols) == MAX_SYMBOLS
-        assert result.truncated is True
+        assert len(result.symbols) == 210
+        assert result.truncated is False
         assert result.total_symbol_count == 210
-        assert any("200" in n for n in result.notices)
+        assert result.summary.total_expected == 420
+        assert result.summary.total_present == 210
+        assert len(result.summary.gaps) == 210
+        assert result.matrix[0] == [CoverageStatus.COMPLETE, CoverageStatus.MISSING]
+        assert result.matrix[1] == [CoverageStatus.MISSING, CoverageStatus.COMPLETE]
 
     def test_no_truncation_under_200(self, analyzer: CoverageAnalyzer) -> None:
         result = analyzer.analyze(
@@ -509,50 +536,50 @@ class TestGapDetection:
 
     def test_weekends_dont_break_gaps(self) -> None:
         """Non-trading days between missing trading days = one contiguous gap."""
-        # Friday missing, Saturday/Sunday no_expectation, Monday missing = 1 gap of 2
-        dates = [
+        # Friday missing, Saturday/Sunday non-trading, Monday missing = 1 gap of 2
+        trading_days = [
             datetime.date(2024, 1, 12),  # Fri
-            datetime.date(2024, 1, 13),  # Sat
-            datetime.date(2024, 1, 14),  # Sun
             datetime.date(2024, 1, 15),  # Mon
         ]
-        trading_set = {dates[0], dates[3]}  # Fri and Mon are trading days
-        matrix = [
-            [
-                CoverageStatus.MISSING,        # Fri
-                CoverageStatus.NO_EXPECTATION,  # Sat
-                CoverageStatus.NO_EXPECTATION,  # Sun
-                CoverageStatus.MISSING,         # Mon
-            ]
-        ]
-        gaps = _find_gaps(["SYM"], dates, matrix, trading_set)
+        covered = pl.DataFrame(schema={"symbol": pl.String, "trading_idx": pl.UInt32})
+        gaps = _find_gaps(covered, ["SYM"], trading_days)
         assert len(gaps) == 1
         assert gaps[0].gap_days == 2
+        assert gaps[0].start_date == datetime.date(2024, 1, 12)
+        assert gaps[0].end_date == datetime.date(2024, 1, 15)
 
     def test_gap_end_date_is_trading_day(self) -> None:
         """Gap end_date must be a trading day, not a weekend preceding closure."""
-        # Missing Fri, Sat+Sun no_expectation, then Mon is COMPLETE (gap closes)
-        dates = [
+        # Missing Fri, Sat+Sun non-trading, then Mon is covered (gap closes)
+        trading_days = [
             datetime.date(2024, 1, 12),  # Fri — missing
-            datetime.date(2024, 1, 13),  # Sat
-            datetime.date(2024, 1, 14),  # Sun
             datetime.date(2024, 1, 15),  # Mon — complete (closes gap)
         ]
-        trading_set = {dates[0], dates[3]}
-        matrix = [
-            [
-                CoverageStatus.MISSING,
-                CoverageStatus.NO_EXPECTATION,
-                CoverageStatus.NO_EXPECTATION,
-                CoverageStatus.COMPLETE,
-            ]
-        ]
-        gaps = _find_gaps(["SYM"], dates, matrix, trading_set)
+        covered = pl.DataFrame(
+            {"symbol": ["SYM"], "trading_idx": [1]},
+            schema={"symbol": pl.String, "trading_idx": pl.UInt32},
+        )
+        gaps = _find_gaps(covered, ["SYM"], trading_days)
         assert len(gaps) == 1
         # end_date must be Friday (the last missing trading day), not Sunday
         assert gaps[0].end_date == datetime.date(2024, 1, 12)
         assert gaps[0].end_date.weekday() == 4  # Friday
 
+    def test_run_lengths_per_symbol(self) -> None:
+        """Interior, leading, and trailing runs are found independently per symbol."""
+        trading_days = [datetime.date(2024, 1, d) for d in (8, 9, 10, 11, 12)]
+        covered = pl.DataFrame(
+            {"symbol": ["AAA", "AAA", "BBB"], "trading_idx": [0, 4, 2]},
+            schema={"symbol": pl.String, "trading_idx": pl.UInt32},
+        )
+        gaps = _find_gaps(covered, ["AAA", "BBB", "CCC"], trading_days)
+        assert [(g.symbol, g.start_date.day, g.end_date.day, g.gap_days) for g in gaps] == [
+            ("CCC", 8, 12, 5),
+            ("AAA", 9, 11, 3),
+            ("BBB", 8, 9, 2),
+            ("BBB", 11, 12, 2),
+        ]
+
 
 # ============================================================================
 # Fault tolerance
@@ -614,48 +641,72 @@ class TestExport:
 
 
 # ============================================================================
-# Weekly aggregation
+# Weekly / monthly aggregation
 # ============================================================================
 
 
 class TestWeeklyAggregation:
-    def test_week_with_no_trading_days(self) -> None:
+    def test_week_with_no_trading_days(self, analyzer: CoverageAnalyzer) -> None:
         """A week entirely of NO_EXPECTATION stays NO_EXPECTATION."""
-        dates = [
-            datetime.date(2024, 1, 13),  # Sat
-            datetime.date(2024, 1, 14),  # Sun
-        ]
-        matrix = [[CoverageStatus.NO_EXPECTATION, CoverageStatus.NO_EXPECTATION]]
-        week_dates, week_matrix = _aggregate_weekly(dates, matrix)
-        assert len(week_dates) == 1
-        assert week_matrix[0][0] == CoverageStatus.NO_EXPECTATION
+        result = analyzer.analyze(
+            symbols=["AAPL"],
+            start_date=datetime.date(2024, 1, 13),  # Sat
+            end_date=datetime.date(2024, 1, 14),  # Sun
+            resolution="weekly",
+        )
+        assert result.dates == [datetime.date(2024, 1, 8)]
+        assert result.matrix[0][0] == CoverageStatus.NO_EXPECTATION
 
-    def test_empty_dates(self) -> None:
-        week_dates, week_matrix = _aggregate_weekly([], [[]])
-        assert week_dates == []
+
+class TestMonthlyAggregation:
+    def test_cross_month_boundary(self, analyzer: CoverageAnalyzer) -> None:
+        """Dates spanning Jan and Feb produce 2 monthly buckets."""
+        result = analyzer.analyze(
+            symbols=["AAPL"],
+            start_date=datetime.date(2024, 1, 31),
+            end_date=datetime.date(2024, 2, 1),
+            resolution="monthly",
+        )
+        assert result.dates == [datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)]
+        assert result.matrix[0] == [CoverageStatus.MISSING, CoverageStatus.MISSING]
 
 
 # ============================================================================
-# Monthly aggregation
+# Consolidated store
 # ============================================================================
 
 
-class TestMonthlyAggregation:
-    def test_cross_month_boundary(self) -> None:
-        """Dates spanning Jan and Feb produce 2 monthly buckets."""
-        dates = [
-            datetime.date(2024, 1, 31),
-            datetime.date(2024, 2, 1),
-        ]
-        matrix = [[CoverageStatus.COMPLETE, CoverageStatus.MISSING]]
-        month_dates, month_matrix = _aggregate_monthly(dates, matrix)
-        assert len(month_dates) == 2
-        assert month_dates[0] == datetime.date(2024, 1, 1)
-        assert month_dates[1] == datetime.date(2024, 2, 1)
-
-    def test_empty_dates(self) -> None:
-        month_dates, month_matrix = _aggregate_monthly([], [[]])
-        assert month_dates == []
+class TestAdjustedStoreSource:
+    def test_store_used_for_presence(self, tmp_path: Path) -> None:
+        """With a consolidated store, presence and tickers come from it."""
+        AdjustedStore(tmp_path / "adjusted").upsert(
+            pl.DataFrame(
+                {
+                    "symbol": ["AAPL", "AAPL", "MSFT"],
+                    "date": [
+                        datetime.date(2024, 1, 10),
+                        datetime.date(2024, 1, 11),
+                        datetime.date(2024, 1, 10),
+                    ],
+                    "close": [1.0, 1.0, 1.0],
+                }
+            )
+        )
+        _create_parquet(
+            tmp_path / "quarantine" / "2024-01-12" / "GOOG.parquet",
+            ["2024-01-11"],
+            [100.0],
+        )
+        a = CoverageAnalyzer(data_dir=tmp_path)
+        assert a.get_available_tickers() == ["AAPL", "GOOG", "MSFT"]
+
+        result = a.analyze(resolution="daily")
+        assert result.dates[0] == datetime.date(2024, 1, 10)
+        assert result.dates[-1] == datetime.date(2024, 1, 12)
+        assert result.matrix[0][:2] == [CoverageStatus.COMPLETE, CoverageStatus.COMPLETE]
+        assert result.matrix[1][1] == CoverageStatus.SUSPICIOUS
+        assert result.summary.total_present == 3
+        assert result.summary.total_suspicious == 1
 
 
 # ============================================================================
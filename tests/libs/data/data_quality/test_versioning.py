@@ -34,14 +34,18 @@ Coverage areas:
 
 from __future__ import annotations
 
+import errno
 import json
 import os
+import shutil
+import time
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from libs.data.data_quality.checksums import FileHasher
 from libs.data.data_quality.exceptions import (
     DataNotFoundError,
     DatasetNotInSnapshotError,
@@ -51,11 +55,13 @@ from libs.data.data_quality.exceptions import (
 )
 from libs.data.data_quality.manifest import ManifestManager, SyncManifest
 from libs.data.data_quality.types import LockToken
+from libs.data.data_quality.validation import DataValidator
 from libs.data.data_quality.versioning import (
     BacktestLinkage,
     DatasetVersionManager,
     FileStorageInfo,
     SnapshotManifest,
+    SnapshotProgress,
 )
 
 
@@ -764,6 +770,115 @@ class TestStorageCAS(TestVersioningFixtures):
             assert file_info.storage_mode == "cas"
 
 
+class TestSnapshotMaterialization(TestVersioningFixtures):
+    """Tests for reflink clones, parallel CAS ingestion and progress events."""
+
+    def _create_multi_file_dataset(
+        self, manager: ManifestManager, temp_dirs: dict[str, Path], count: int = 3
+    ) -> list[Path]:
+        """Create a dataset with several backdated files."""
+        past = time.time() - 60
+        files = []
+        for i in range(count):
+            path = self._create_test_parquet(temp_dirs["data"] / f"{2020 + i}.parquet", f"y{i}")
+            os.utime(path, (past, past))
+            files.append(path)
+
+        lock_path = temp_dirs["locks"] / "crsp_daily.lock"
+        now = datetime.now(UTC)
+        token = LockToken(
+            pid=os.getpid(),
+            hostname="test-host",
+            writer_id="test-writer",
+            acquired_at=now,
+            expires_at=now + timedelta(hours=4),
+            lock_path=lock_path,
+        )
+        with open(lock_path, "w") as f:
+            json.dump(token.to_dict(), f)
+        manifest = SyncManifest(
+            dataset="crsp_daily",
+            sync_timestamp=now,
+            start_date=date(2020, 1, 1),
+            end_date=date(2022, 12, 31),
+            row_count=count,
+            checksum="abc123" * 10,
+            schema_version="v1.0.0",
+            wrds_query_hash="def456" * 10,
+            file_paths=[str(p) for p in files],
+            validation_status="passed",
+        )
+        manager.save_manifest(manifest, token)
+        return files
+
+    def test_parallel_cas_ingestion_and_progress(
+        self,
+        version_manager: DatasetVersionManager,
+        manifest_manager: ManifestManager,
+        temp_dirs: dict[str, Path],
+    ) -> None:
+        """New CAS blobs are ingested concurrently and progress is streamed."""
+        files = self._create_multi_file_dataset(manifest_manager, temp_dirs)
+        version_manager.max_workers = 4
+        events: list[SnapshotProgress] = []
+
+        snapshot = version_manager.create_snapshot("parallel-v1", progress_callback=events.append)
+
+        assert [e.files_done for e in events] == [1, 2, 3]
+        assert {e.files_total for e in events} == {3}
+        assert events[-1].bytes_done == events[-1].bytes_total == snapshot.total_size_bytes
+        assert [e.file_path for e in events] == [str(p) for p in files]
+
+        cas_index = version_manager._load_cas_index()
+        assert len(cas_index.files) == 3
+        assert all(entry.ref_count == 1 for entry in cas_index.files.values())
+        assert version_manager.verify_snapshot_integrity("parallel-v1") == []
+
+    def test_trusted_clone_skips_rehash(
+        self,
+        version_manager: DatasetVersionManager,
+        manifest_manager: ManifestManager,
+        temp_dirs: dict[str, Path],
+    ) -> None:
+        """Reflinked copies of unchanged sources are not re-read for verification."""
+        self._create_multi_file_dataset(manifest_manager, temp_dirs)
+
+        def fake_reflink(src: Path, dest: Path) -> bool:
+            shutil.copy2(src, dest)
+            return True
+
+        with (
+            patch("libs.data.data_quality.versioning._reflink_file", side_effect=fake_reflink),
+            patch.object(
+                version_manager.validator,
+                "compute_checksum",
+                side_effect=AssertionError("clone re-hashed"),
+            ),
+        ):
+            snapshot = version_manager.create_snapshot("clone-v1", use_cas=False)
+
+        assert all(f.storage_mode == "copy" for f in snapshot.datasets["crsp_daily"].files)
+        assert version_manager.verify_snapshot_integrity("clone-v1") == []
+
+    def test_unsupported_reflink_falls_back_to_copy(
+        self,
+        version_manager: DatasetVersionManager,
+        manifest_manager: ManifestManager,
+        temp_dirs: dict[str, Path],
+    ) -> None:
+        """Filesystems without FICLONE fall back to verified byte copies."""
+        self._create_manifest_with_data(manifest_manager, "crsp_daily", temp_dirs)
+
+        with patch(
+            "libs.data.data_quality.versioning.fcntl.ioctl",
+            side_effect=OSError(errno.EOPNOTSUPP, "Operation not supported"),
+        ):
+            version_manager.create_snapshot("fallback-v1")
+
+        assert version_manager._reflink_enabled is False
+        assert version_manager.verify_snapshot_integrity("fallback-v1") == []
+
+
 # =============================================================================
 # Checksums & Integrity Tests (3 tests)
 # =============================================================================
@@ -815,6 +930,66 @@ class TestChecksumsIntegrity(TestVersioningFixtures):
         assert len(errors) > 0
         assert any("checksum" in e.lower() or "mismatch" in e.lower() for e in errors)
 
+    def test_verify_snapshot_integrity_bypasses_checksum_cache(
+        self,
+        manifest_manager: ManifestManager,
+        temp_dirs: dict[str, Path],
+        tmp_path: Path,
+    ) -> None:
+        """In-place tampering that keeps size/mtime/inode is still detected."""
+        version_manager = DatasetVersionManager(
+            manifest_manager=manifest_manager,
+            snapshots_dir=temp_dirs["snapshots"],
+            cas_dir=temp_dirs["cas"],
+            diffs_dir=temp_dirs["diffs"],
+            backtests_dir=temp_dirs["backtests"],
+            locks_dir=temp_dirs["locks"],
+            data_root=tmp_path,
+            validator=DataValidator(hasher=FileHasher(cache_path=tmp_path / "checksums.sqlite")),
+        )
+        self._create_manifest_with_data(manifest_manager, "crsp_daily", temp_dirs)
+        with patch("os.link", side_effect=OSError("Cross-device link")):
+            version_manager.create_snapshot("cached-v1", use_cas=False)
+
+        snapshot_file = next(
+            f for f in (temp_dirs["snapshots"] / "cached-v1" / "files").rglob("*") if f.is_file()
+        )
+        past_ns = time.time_ns() - 60_000_000_000
+        os.utime(snapshot_file, ns=(past_ns, past_ns))
+        # Prime the cache with the genuine digest, then flip one byte in place
+        version_manager.validator.compute_checksum(snapshot_file)
+        with open(snapshot_file, "r+b") as f:
+            first = f.read(1)
+            f.seek(0)
+            f.write(bytes([first[0] ^ 0xFF]))
+        os.utime(snapshot_file, ns=(past_ns, past_ns))
+
+        errors = version_manager.verify_snapshot_integrity("cached-v1")
+
+        assert any("Checksum mismatch" in e for e in errors)
+
+    def test_verify_snapshot_integrity_propagates_unexpected_errors(
+        self,
+        version_manager: DatasetVersionManager,
+        manifest_manager: ManifestManager,
+        temp_dirs: dict[str, Path],
+    ) -> None:
+        """Only I/O and cache errors fall back to per-file hashing."""
+        self._create_manifest_with_data(manifest_manager, "crsp_daily", temp_dirs)
+        version_manager.create_snapshot("errors-v1")
+
+        with patch.object(
+            version_manager.validator, "compute_checksums", side_effect=OSError("EIO")
+        ):
+            assert version_manager.verify_snapshot_integrity("errors-v1") == []
+        with (
+            patch.object(
+                version_manager.validator, "compute_checksums", side_effect=TypeError("bug")
+            ),
+            pytest.raises(TypeError, match="bug"),
+        ):
+            version_manager.verify_snapshot_integrity("errors-v1")
+
     def test_aggregate_checksum_hash_chain(
         self,
         version_manager: DatasetVersionManager,
@@ -0,0 +1,255 @@
+"""Tests for ExposurePanelStore and its FactorBuilder integration."""
+
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from libs.models.factors.exposure_store import (
+    ExposurePanelStore,
+    ExposureStoreError,
+    factor_definition_hash,
+)
+
+VERSION_IDS = {"crsp": "v1.0.0", "compustat": "v1.0.0"}
+
+
+@pytest.fixture()
+def store_dir() -> Path:
+    """Create temporary store directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture()
+def store(store_dir: Path) -> ExposurePanelStore:
+    """Create store instance."""
+    return ExposurePanelStore(store_dir)
+
+
+def _exposures(
+    dates: list[date], factors: tuple[str, ...] = ("momentum_12_1", "size")
+) -> pl.DataFrame:
+    rows = [
+        {
+            "permno": permno,
+            "date": d,
+            "factor_name": factor,
+            "raw_value": float(permno) + d.day,
+            "zscore": 0.1 * permno,
+            "percentile": 0.5,
+        }
+        for d in dates
+        for factor in factors
+        for permno in (10001, 10002, 10003)
+    ]
+    return pl.DataFrame(rows)
+
+
+class TestExposurePanelStore:
+    """Tests for ExposurePanelStore."""
+
+    def test_panel_key_deterministic(self) -> None:
+        """Key ignores dict/factor ordering but changes with versions."""
+        key_1 = ExposurePanelStore.build_panel_key(VERSION_IDS, "abc", ["size", "value"])
+        key_2 = ExposurePanelStore.build_panel_key(
+            {"compustat": "v1.0.0", "crsp": "v1.0.0"}, "abc", ["value", "size"]
+        )
+        key_3 = ExposurePanelStore.build_panel_key(
+            {"crsp": "v1.0.1", "compustat": "v1.0.0"}, "abc", ["size", "value"]
+        )
+
+        assert key_1 == key_2
+        assert key_1 != key_3
+        assert key_1.startswith("panel_")
+
+    def test_panel_key_changes_with_factor_definitions(self) -> None:
+        """A different implementation under the same factor name gets a new key."""
+        from libs.models.factors.factor_definitions import MomentumFactor
+
+        class PatchedMomentum(MomentumFactor):
+            pass
+
+        original = factor_definition_hash({"momentum_12_1": MomentumFactor()})
+        patched = factor_definition_hash({"momentum_12_1": PatchedMomentum()})
+
+        assert original == factor_definition_hash({"momentum_12_1": MomentumFactor()})
+        assert original != patched
+        assert ExposurePanelStore.build_panel_key(
+            VERSION_IDS, "abc", ["momentum_12_1"], original
+        ) != ExposurePanelStore.build_panel_key(VERSION_IDS, "abc", ["momentum_12_1"], patched)
+
+    def test_append_is_incremental(self, store: ExposurePanelStore) -> None:
+        """Already-stored dates are skipped on re-append."""
+        key = ExposurePanelStore.build_panel_key(VERSION_IDS, "abc")
+        first = store.append(key, _exposures([date(2024, 1, 2)]), VERSION_IDS, "abc")
+        second = store.append(
+            key, _exposures([date(2024, 1, 2), date(2024, 2, 1)]), VERSION_IDS, "abc"
+        )
+
+        assert first == [date(2024, 1, 2)]
+        assert second == [date(2024, 2, 1)]
+        assert store.list_dates(key) == [date(2024, 1, 2), date(2024, 2, 1)]
+        assert store.missing_dates(key, [date(2024, 1, 2), date(2024, 1, 3)]) == [date(2024, 1, 3)]
+        # One partition per month
+        assert sorted(p.name for p in (store.root_dir / key).glob("*.parquet")) == [
+            "2024-01.parquet",
+            "2024-02.parquet",
+        ]
+        # No duplicated rows for the re-appended date
+        assert store.read_date(key, date(2024, 1, 2)).height == 6
+
+    def test_scan_filters_range_and_factors(self, store: ExposurePanelStore) -> None:
+        """Scan returns only requested dates and factors."""
+        key = ExposurePanelStore.build_panel_key(VERSION_IDS, "abc")
+        dates = [date(2024, 1, 2), date(2024, 1, 31), date(2024, 2, 1), date(2024, 3, 4)]
+        store.append(key, _exposures(dates), VERSION_IDS, "abc")
+
+        result = store.scan(
+            key, start_date=date(2024, 1, 31), end_date=date(2024, 2, 29), factor_names=["size"]
+        ).collect()
+
+        assert sorted(result["date"].unique().to_list()) == [date(2024, 1, 31), date(2024, 2, 1)]
+        assert result["factor_name"].unique().to_list() == ["size"]
+
+    def test_scan_unknown_panel_is_empty(self, store: ExposurePanelStore) -> None:
+        """Scanning an unknown panel yields an empty frame."""
+        assert store.scan("panel_missing").collect().height == 0
+        assert store.read_date("panel_missing", date(2024, 1, 2)) is None
+
+    def test_append_version_mismatch_raises(self, store: ExposurePanelStore) -> None:
+        """Appending under an existing key with different versions fails."""
+        key = ExposurePanelStore.build_panel_key(VERSION_IDS, "abc")
+        store.append(key, _exposures([date(2024, 1, 2)]), VERSION_IDS, "abc")
+
+        with pytest.raises(ExposureStoreError, match="different versions"):
+            store.append(key, _exposures([date(2024, 1, 3)]), {"crsp": "v2"}, "abc")
+
+    def test_append_missing_columns_raises(self, store: ExposurePanelStore) -> None:
+        """Exposures without key columns are rejected."""
+        with pytest.raises(ExposureStoreError, match="missing required columns"):
+            store.append("panel_x", pl.DataFrame({"permno": [1]}), VERSION_IDS, "abc")
+
+    def test_concurrent_appends_from_separate_stores(self, store_dir: Path) -> None:
+        """Writers sharing only the directory (like separate processes) keep every date."""
+        key = ExposurePanelStore.build_panel_key(VERSION_IDS, "abc")
+        days = [date(2024, 1, d) for d in range(2, 14)]
+        barrier = threading.Barrier(len(days))
+
+        def append(day: date) -> None:
+            writer = ExposurePanelStore(store_dir)
+            barrier.wait()
+            writer.append(key, _exposures([day]), VERSION_IDS, "abc")
+
+        threads = [threading.Thread(target=append, args=(d,)) for d in days]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        reader = ExposurePanelStore(store_dir)
+        assert reader.list_dates(key) == days
+        assert reader.scan(key).collect()["date"].n_unique() == len(days)
+
+    def test_drop_panel(self, store: ExposurePanelStore) -> None:
+        """Dropped panels are no longer listed."""
+        key = ExposurePanelStore.build_panel_key(VERSION_IDS, "abc")
+        store.append(key, _exposures([date(2024, 1, 2)]), VERSION_IDS, "abc")
+
+        assert store.list_panels() == [key]
+        assert store.drop_panel(key) is True
+        assert store.list_panels() == []
+
+
+class TestFactorBuilderExposurePanel:
+    """Tests for FactorBuilder reading/writing through the exposure panel."""
+
+    @pytest.fixture()
+    def panel_builder(
+        self, mock_crsp_provider, mock_compustat_provider, mock_manifest_manager, store
+    ):
+        from libs.models.factors import FactorBuilder
+
+        return FactorBuilder(
+            crsp_provider=mock_crsp_provider,
+            compustat_provider=mock_compustat_provider,
+            manifest_manager=mock_manifest_manager,
+            exposure_store=store,
+        )
+
+    def test_compute_all_factors_populates_and_reads_panel(self, panel_builder, store) -> None:
+        """First call computes and stores; second call is served from the panel."""
+        as_of = date(2023, 6, 30)
+        computed = panel_builder.compute_all_factors(as_of)
+
+        panel_key = store.list_panels()[0]
+        assert store.list_dates(panel_key) == [as_of]
+
+        panel_builder._compute_all_factors = None  # any recompute would fail
+        cached = panel_builder.compute_all_factors(as_of)
+
+        key_cols = ["factor_name", "permno"]
+        assert cached.exposures.sort(key_cols).equals(
+            computed.exposures.select(cached.exposures.columns).sort(key_cols)
+        )
+        assert cached.dataset_version_ids == computed.dataset_version_ids
+        assert cached.reproducibility_hash == computed.reproducibility_hash
+
+    def test_universe_requests_bypass_panel(self, panel_builder, store) -> None:
+        """Subset-universe requests are neither read from nor written to the panel."""
+        panel_builder.compute_all_factors(date(2023, 6, 30), universe=[10001, 10002])
+
+        assert store.list_panels() == []
+
+    def test_update_exposure_panel_only_computes_missing(self, panel_builder) -> None:
+        """Incremental update appends only dates not already stored."""
+        first = panel_builder.update_exposure_panel([date(2023, 6, 29), date(2023, 6, 30)])
+        second = panel_builder.update_exposure_panel(
+            [date(2023, 6, 29), date(2023, 6, 30), date(2023, 7, 3)]
+        )
+
+        assert first == [date(2023, 6, 29), date(2023, 6, 30)]
+        assert second == [date(2023, 7, 3)]
+
+        scanned = panel_builder.scan_exposures(
+            date(2023, 6, 30), date(2023, 7, 31), factor_names=["log_market_cap"]
+        ).collect()
+        assert sorted(scanned["date"].unique().to_list()) == [date(2023, 6, 30), date(2023, 7, 3)]
+        assert scanned["factor_name"].unique().to_list() == ["log_market_cap"]
+
+    def test_load_exposure_panel_reads_requested_dates(self, panel_builder) -> None:
+        """Missing dates are computed, then all requested dates come from one scan."""
+        panel_builder.update_exposure_panel([date(2023, 6, 29)])
+
+        exposures, version_ids = panel_builder.load_exposure_panel(
+            [date(2023, 6, 29), date(2023, 7, 3)]
+        )
+
+        assert sorted(exposures["date"].unique().to_list()) == [
+            date(2023, 6, 29),
+            date(2023, 7, 3),
+        ]
+        assert version_ids == {"crsp": "v1.0.0", "compustat": "v1.0.0"}
+
+    def test_registering_factor_starts_new_panel(self, panel_builder, store) -> None:
+        """Re-registering a factor name with a new definition changes the panel key."""
+        from libs.models.factors.factor_definitions import MomentumFactor
+
+        class PatchedMomentum(MomentumFactor):
+            pass
+
+        panel_builder.update_exposure_panel([date(2023, 6, 30)])
+        panel_builder.register_factor(PatchedMomentum())
+        panel_builder.update_exposure_panel([date(2023, 6, 30)])
+
+        assert len(store.list_panels()) == 2
+
+    def test_panel_methods_require_store(self, factor_builder) -> None:
+        """Panel helpers raise when no store is configured."""
+        with pytest.raises(ValueError, match="exposure_store"):
+            factor_builder.update_exposure_panel([date(2023, 6, 30)])
+        with pytest.raises(ValueError, match="exposure_store"):
+            factor_builder.scan_exposures()
@@ -322,92 +322,6 @@ class TestSpearmanCorrelation:
         assert corr == 0.0
 
 
-class TestForwardReturns:
-    """Tests for forward return computation."""
-
-    def test_compute_forward_returns(
-        self,
-        factor_analytics: FactorAnalytics,
-        sample_returns: pl.DataFrame,
-    ):
-        """_compute_forward_returns creates forward_ret column."""
-        result = factor_analytics._compute_forward_returns(sample_returns, horizon=5)
-
-        assert "forward_ret" in result.columns
-        # Forward returns should exist for most rows (except last 5 days)
-        assert result.height > 0
-
-    def test_forward_returns_pit_correctness(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """Forward returns only use FUTURE data (no look-ahead)."""
-        # Create simple test data with known returns
-        returns_data = pl.DataFrame(
-            {
-                "date": [date(2023, 1, i) for i in range(1, 11)],
-                "permno": [100] * 10,
-                "ret": [0.01, 0.02, 0.03, 0.04, 0.05, -0.01, -0.02, -0.03, -0.04, -0.05],
-            }
-        )
-
-        result = factor_analytics._compute_forward_returns(returns_data, horizon=3)
-
-        # For day 1 (index 0), forward return should be product of days 2,3,4
-        # (1 + 0.02) * (1 + 0.03) * (1 + 0.04) - 1 = 0.0926...
-        if result.height > 0:
-            first_forward = result.filter(pl.col("date") == date(2023, 1, 1))
-            if first_forward.height > 0:
-                expected = (1.02 * 1.03 * 1.04) - 1
-                actual = first_forward["forward_ret"][0]
-                assert abs(actual - expected) < 0.001
-
-    def test_forward_returns_excludes_incomplete_windows(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """Last rows without full forward window are excluded."""
-        returns_data = pl.DataFrame(
-            {
-                "date": [date(2023, 1, i) for i in range(1, 6)],
-                "permno": [100] * 5,
-                "ret": [0.01, 0.02, 0.03, 0.04, 0.05],
-            }
-        )
-
-        result = factor_analytics._compute_forward_returns(returns_data, horizon=3)
-
-        # With 5 days and horizon 3, only first 2 rows should have valid forward returns
-        # (day 1 uses days 2,3,4; day 2 uses days 3,4,5)
-        assert result.height <= 2
-
-    def test_compute_horizon_returns_handles_nan(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """Horizon returns handle NaN in return series."""
-        returns = pl.Series([0.01, np.nan, 0.03, 0.04, 0.05])
-
-        result = factor_analytics._compute_horizon_returns(returns, horizon=2)
-
-        # First element should be NaN because day 2 is NaN
-        assert np.isnan(result[0])
-
-    def test_compute_horizon_returns_extreme_negative(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """Horizon returns handle extreme negative returns (clamping test)."""
-        # Test the -0.9999 clamping for extreme losses
-        returns = pl.Series([-0.99, -0.50, 0.10, 0.05])
-
-        result = factor_analytics._compute_horizon_returns(returns, horizon=2)
-
-        # Should clamp at -0.9999 to avoid -inf from log(0)
-        # Result should be finite (not -inf or NaN where valid)
-        assert result.is_finite().sum() >= 0
-
-
 class TestComputeICEdgeCases:
     """Tests for edge cases in compute_ic."""
 
@@ -799,65 +713,3 @@ class TestRankCorrEdgeCases:
 
         # Spearman correlation is undefined for constant values, should handle gracefully
         assert not np.isnan(corr)  # Should not crash, returns valid value or 0
-
-
-class TestForwardReturnsAdditional:
-    """Additional tests for forward returns computation."""
-
-    def test_forward_returns_with_nulls_in_middle(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """_compute_forward_returns handles nulls in the middle of data."""
-        returns_with_nulls = pl.DataFrame(
-            {
-                "date": [date(2023, 1, i) for i in range(1, 11)],
-                "permno": [100] * 10,
-                "ret": [0.01, 0.02, None, 0.04, 0.05, 0.01, None, 0.02, 0.03, 0.04],
-            }
-        )
-
-        result = factor_analytics._compute_forward_returns(returns_with_nulls, horizon=3)
-
-        # Should filter out rows where forward returns can't be computed
-        assert isinstance(result, pl.DataFrame)
-        assert "forward_ret" in result.columns
-
-    def test_forward_returns_multiple_securities(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """_compute_forward_returns handles multiple securities correctly."""
-        multi_sec_returns = pl.DataFrame(
-            {
-                "date": [date(2023, 1, i) for i in range(1, 6)] * 2,
-                "permno": [100] * 5 + [200] * 5,
-                "ret": [0.01, 0.02, 0.03, 0.04, 0.05] * 2,
-            }
-        )
-
-        result = factor_analytics._compute_forward_returns(multi_sec_returns, horizon=2)
-
-        # Should compute separately for each permno
-        permnos = result["permno"].unique().to_list()
-        assert len(permnos) >= 1
-
-    def test_forward_returns_zero_returns(
-        self,
-        factor_analytics: FactorAnalytics,
-    ):
-        """_compute_forward_returns handles zero returns."""
-        zero_returns = pl.DataFrame(
-            {
-                "date": [date(2023, 1, i) for i in range(1, 6)],
-                "permno": [100] * 5,
-                "ret": [0.0, 0.0, 0.0, 0.0, 0.0],
-            }
-        )
-
-        result = factor_analytics._compute_forward_returns(zero_returns, horizon=2)
-
-        # Should compute successfully (forward returns should be ~0)
-        if result.height > 0:
-            forward_rets = result["forward_ret"].to_numpy()
-            assert np.all(np.abs(forward_rets) < 0.001)
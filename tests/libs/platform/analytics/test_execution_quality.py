@@ -2466,6 +2466,83 @@ class TestIntegration:
         assert not math.isnan(result.total_cost_bps)
 
 
+class TestMinuteBarPrefetch:
+    """Batched minute-bar prefetch for multi-order TCA."""
+
+    @staticmethod
+    def _keyed(bars: pl.DataFrame, key: str) -> pl.DataFrame:
+        return bars.select(pl.lit(key).alias("request_key"), pl.all())
+
+    def test_prefetched_analysis_matches_direct(
+        self,
+        analyzer: ExecutionQualityAnalyzer,
+        mock_taq_provider: MagicMock,
+        sample_fill_batch: FillBatch,
+    ) -> None:
+        """Analysis served from the prefetch cache equals per-call fetching."""
+        bars = _create_minute_bars("AAPL", date(2024, 12, 8), n_bars=390, start_hour=9)
+        mock_taq_provider.fetch_minute_bars.return_value = bars
+        mock_taq_provider.manifest_manager.load_manifest.return_value = MagicMock(checksum="v1")
+        direct = analyzer.analyze_execution(sample_fill_batch)
+
+        mock_taq_provider.fetch_minute_bars.reset_mock()
+        mock_taq_provider.fetch_minute_bars_batch.return_value = self._keyed(
+            bars, "AAPL|2024-12-08"
+        )
+        assert analyzer.prefetch_minute_bars([sample_fill_batch]) == 1
+        cached = analyzer.analyze_execution(sample_fill_batch)
+
+        (requests,) = mock_taq_provider.fetch_minute_bars_batch.call_args.args
+        assert [(r.symbol, r.start_date, r.end_date) for r in requests] == [
+            ("AAPL", date(2024, 12, 8), date(2024, 12, 8))
+        ]
+        mock_taq_provider.fetch_minute_bars.assert_not_called()
+        for attr in ("arrival_price", "vwap_benchmark", "twap_benchmark", "total_cost_bps"):
+            assert getattr(cached, attr) == getattr(direct, attr)
+        assert cached.warnings == direct.warnings
+
+    def test_symbol_days_without_data_are_cached_empty(
+        self,
+        analyzer: ExecutionQualityAnalyzer,
+        mock_taq_provider: MagicMock,
+        sample_fill_batch: FillBatch,
+    ) -> None:
+        """Days with no bars are served as empty frames, not re-queried."""
+        bars = _create_minute_bars("AAPL", date(2024, 12, 8), n_bars=1)
+        mock_taq_provider.fetch_minute_bars_batch.return_value = self._keyed(
+            bars, "MSFT|2024-12-08"
+        ).clear()
+        analyzer.prefetch_minute_bars([sample_fill_batch])
+
+        result = analyzer._fetch_bars("aapl", date(2024, 12, 8), date(2024, 12, 8), None)
+
+        assert result.is_empty()
+        assert result.columns == bars.columns
+        mock_taq_provider.fetch_minute_bars.assert_not_called()
+
+    def test_uncached_window_or_as_of_falls_back(
+        self,
+        analyzer: ExecutionQualityAnalyzer,
+        mock_taq_provider: MagicMock,
+        sample_fill_batch: FillBatch,
+    ) -> None:
+        """Windows not fully covered by the prefetch hit the provider."""
+        bars = _create_minute_bars("AAPL", date(2024, 12, 8), n_bars=5)
+        mock_taq_provider.fetch_minute_bars_batch.return_value = self._keyed(
+            bars, "AAPL|2024-12-08"
+        )
+        mock_taq_provider.fetch_minute_bars.return_value = bars
+        analyzer.prefetch_minute_bars([sample_fill_batch])
+
+        analyzer._fetch_bars("AAPL", date(2024, 12, 8), date(2024, 12, 9), None)
+        analyzer._fetch_bars("AAPL", date(2024, 12, 8), date(2024, 12, 8), date(2024, 12, 31))
+        assert mock_taq_provider.fetch_minute_bars.call_count == 2
+
+        analyzer.clear_bar_cache()
+        analyzer._fetch_bars("AAPL", date(2024, 12, 8), date(2024, 12, 8), None)
+        assert mock_taq_provider.fetch_minute_bars.call_count == 3
+
+
 # =============================================================================
 # Edge Cases
 # =============================================================================
@@ -0,0 +1,86 @@
+"""Tests for server-side chart downsampling."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from libs.trading.backtest.downsampling import (
+    MAX_CHART_WIDTH_PX,
+    MIN_CHART_WIDTH_PX,
+    clamp_width,
+    downsample,
+    lttb,
+    min_max,
+)
+
+
+def _series(n: int) -> pl.DataFrame:
+    start = date(2020, 1, 1)
+    rng = np.random.default_rng(7)
+    return pl.DataFrame(
+        {
+            "date": [start + timedelta(days=i) for i in range(n)],
+            "value": np.cumsum(rng.normal(size=n)),
+        }
+    )
+
+
+class TestLTTB:
+    def test_reduces_to_budget_and_keeps_endpoints(self) -> None:
+        df = _series(5000)
+
+        out = lttb(df, "date", "value", 300)
+
+        assert out.height == 300
+        assert out["date"][0] == df["date"][0]
+        assert out["date"][-1] == df["date"][-1]
+        assert out["date"].is_sorted()
+
+    def test_keeps_isolated_spike(self) -> None:
+        df = _series(2000).with_columns(
+            pl.when(pl.int_range(pl.len()) == 1234)
+            .then(pl.lit(1000.0))
+            .otherwise(pl.col("value"))
+            .alias("value")
+        )
+
+        out = lttb(df, "date", "value", 100)
+
+        assert out["value"].max() == 1000.0
+
+    def test_short_series_returned_unchanged(self) -> None:
+        df = _series(10)
+
+        assert lttb(df, "date", "value", 100).equals(df)
+
+    def test_drops_non_finite_values(self) -> None:
+        df = pl.DataFrame({"x": [1, 2, 3, 4], "value": [1.0, float("nan"), None, float("inf")]})
+
+        assert lttb(df, "x", "value", 100)["x"].to_list() == [1]
+
+
+class TestMinMax:
+    def test_preserves_global_extremes(self) -> None:
+        df = _series(5000)
+
+        out = min_max(df, "date", "value", 200)
+
+        assert out.height <= 200
+        assert out["value"].min() == df["value"].min()
+        assert out["value"].max() == df["value"].max()
+        assert out["date"].is_sorted()
+
+
+class TestDownsample:
+    def test_width_is_clamped(self) -> None:
+        assert clamp_width(1) == MIN_CHART_WIDTH_PX
+        assert clamp_width(10**6) == MAX_CHART_WIDTH_PX
+        assert downsample(_series(1000), "date", "value", 1).height == MIN_CHART_WIDTH_PX
+
+    def test_unknown_method_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown downsample method"):
+            downsample(_series(10), "date", "value", 100, method="median")  # type: ignore[arg-type]
@@ -5,8 +5,6 @@ P6T10: Track 10 - Quantile & Attribution Analytics
 Coverage targets:
 - QuantileAnalysisConfig validation (skip_days, n_quantiles, holding_period)
 - QuantileAnalyzer.analyze happy path and edge cases
-- Rank IC computation (_compute_rank_ic)
-- Quantile assignment (_assign_quantiles)
 - Signal date normalization
 - run_quantile_analysis convenience function
 """
@@ -647,87 +645,6 @@ class TestQuantileAnalyzer:
         assert result.period_start <= result.period_end
 
 
-@pytest.mark.unit()
-class TestRankICComputation:
-    """Tests for _compute_rank_ic method."""
-
-    def test_rank_ic_perfect_positive(self, trading_calendar: MockCalendar):
-        """Perfect positive correlation should give IC = 1."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        signals = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
-        returns = np.array([0.1, 0.2, 0.3, 0.4, 0.5])
-
-        ic = analyzer._compute_rank_ic(signals, returns)
-        assert ic is not None
-        assert abs(ic - 1.0) < 1e-6
-
-    def test_rank_ic_perfect_negative(self, trading_calendar: MockCalendar):
-        """Perfect negative correlation should give IC = -1."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        signals = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
-        returns = np.array([0.5, 0.4, 0.3, 0.2, 0.1])
-
-        ic = analyzer._compute_rank_ic(signals, returns)
-        assert ic is not None
-        assert abs(ic - (-1.0)) < 1e-6
-
-    def test_rank_ic_constant_signal_returns_none(self, trading_calendar: MockCalendar):
-        """Constant signal values should return None."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        signals = np.array([1.0, 1.0, 1.0, 1.0, 1.0])
-        returns = np.array([0.1, 0.2, 0.3, 0.4, 0.5])
-
-        ic = analyzer._compute_rank_ic(signals, returns)
-        assert ic is None
-
-    def test_rank_ic_constant_returns_returns_none(self, trading_calendar: MockCalendar):
-        """Constant return values should return None."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        signals = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
-        returns = np.array([0.1, 0.1, 0.1, 0.1, 0.1])
-
-        ic = analyzer._compute_rank_ic(signals, returns)
-        assert ic is None
-
-
-@pytest.mark.unit()
-class TestQuantileAssignment:
-    """Tests for _assign_quantiles method."""
-
-    def test_assign_quantiles_five_buckets(self, trading_calendar: MockCalendar):
-        """Five quantile buckets should be 1-5."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        signals = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
-
-        quantiles = analyzer._assign_quantiles(signals, 5)
-
-        assert set(quantiles) == {1, 2, 3, 4, 5}
-        assert quantiles[0] == 1  # Lowest signal -> Q1
-        assert quantiles[4] == 5  # Highest signal -> Q5
-
-    def test_assign_quantiles_two_buckets(self, trading_calendar: MockCalendar):
-        """Two quantile buckets for long/short."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        signals = np.array([1.0, 2.0, 3.0, 4.0])
-
-        quantiles = analyzer._assign_quantiles(signals, 2)
-
-        assert set(quantiles).issubset({1, 2})
-        assert quantiles[0] == 1  # Low
-        assert quantiles[3] == 2  # High
-
-    def test_assign_quantiles_ties_handled(self, trading_calendar: MockCalendar):
-        """Tied signal values should use average rank."""
-        analyzer = QuantileAnalyzer(trading_calendar)
-        # All same value
-        signals = np.array([1.0, 1.0, 1.0, 1.0])
-
-        quantiles = analyzer._assign_quantiles(signals, 2)
-
-        # All should be in same bucket due to average rank
-        assert len(set(quantiles)) <= 2
-
-
 # ------------------------------------------------------------------ run_quantile_analysis Tests
 
 
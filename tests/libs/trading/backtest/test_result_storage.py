@@ -22,7 +22,11 @@ import polars as pl
 
 from libs.trading.alpha.research_platform import BacktestResult
 from libs.trading.backtest.models import BacktestJob, JobNotFound, ResultPathMissing
-from libs.trading.backtest.result_storage import BacktestResultStorage
+from libs.trading.backtest.result_storage import (
+    BacktestResultHandle,
+    BacktestResultStorage,
+    ResultHandleCache,
+)
 
 
 class DummyCursor:
@@ -1339,3 +1343,230 @@ def test_deserialize_param_search_restores_nan_from_none(tmp_path):
     assert loaded.all_results[1]["score"] == 0.045
     assert loaded.param_names == ["window"]
     assert loaded.metric_name == "mean_ic"
+
+
+# ------------------------------------------------------------------ Lazy result handle Tests
+
+
+def _job_row(result_dir: Path, job_id: str = "job_lazy") -> dict:
+    return {
+        "job_id": job_id,
+        "result_path": str(result_dir),
+        "alpha_name": "alpha_lazy",
+        "start_date": date(2024, 1, 1),
+        "end_date": date(2024, 1, 2),
+        "weight_method": "zscore",
+        "coverage": 1.0,
+    }
+
+
+def _storage_for(row: dict, base_dir: Path, cache: ResultHandleCache) -> BacktestResultStorage:
+    # One row per open_result call
+    cursor = DummyCursor(rows=[row] * 10)
+    return BacktestResultStorage(
+        DummyPool(DummyConnection(cursor)), base_dir=base_dir, handle_cache=cache
+    )
+
+
+def _write_returns(result_dir: Path) -> None:
+    pl.DataFrame(
+        {
+            "date": [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)],
+            "return": [0.10, -0.20, 0.05],
+        }
+    ).write_parquet(result_dir / "daily_portfolio_returns.parquet")
+    pl.DataFrame(
+        {"date": [date(2024, 1, 1), date(2024, 1, 2)], "net_return": [0.01, 0.02]}
+    ).write_parquet(result_dir / "net_portfolio_returns.parquet")
+
+
+@pytest.mark.unit()
+def test_open_result_reads_only_summary_until_tab_requested(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    storage = _storage_for(_job_row(result_dir), tmp_path, ResultHandleCache())
+
+    handle = storage.open_result("job_lazy")
+
+    assert handle.summary["snapshot_id"] == "snap-123"
+    assert handle.loaded_artifacts == ()
+
+    frames = handle.load_tab("ic")
+
+    assert set(frames) == {"daily_ic"}
+    assert handle.loaded_artifacts == ("daily_ic",)
+
+
+@pytest.mark.unit()
+def test_handle_optional_artifacts_default_to_empty(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    handle = BacktestResultHandle.open(result_dir)
+
+    prices = handle.frame("daily_prices")
+
+    assert prices is not None
+    assert prices.height == 0
+    assert handle.frame("net_portfolio_returns") is None
+    assert handle.equity_curve(width_px=500) is None
+
+
+@pytest.mark.unit()
+def test_handle_equity_and_drawdown_curves(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    _write_returns(result_dir)
+    handle = BacktestResultHandle.open(result_dir)
+
+    equity = handle.equity_curve(width_px=500, basis="gross")
+    drawdown = handle.drawdown_curve(width_px=500, basis="gross")
+    net = handle.equity_curve(width_px=500)
+
+    assert equity is not None
+    assert drawdown is not None
+    assert net is not None
+    assert equity["cumulative_return"].to_list() == pytest.approx([0.10, -0.12, -0.076])
+    assert drawdown["drawdown"].to_list() == pytest.approx([0.0, -0.20, -0.16])
+    assert net["cumulative_return"].to_list() == pytest.approx([0.01, 0.0302])
+
+
+@pytest.mark.unit()
+def test_handle_ic_series_prefers_rank_ic(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    handle = BacktestResultHandle.open(result_dir)
+
+    ic = handle.ic_series(width_px=500)
+
+    assert ic is not None
+    assert ic.columns == ["date", "rank_ic"]
+    assert "daily_signals" not in handle.loaded_artifacts
+
+
+@pytest.mark.unit()
+def test_handle_missing_required_artifact_raises(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    (result_dir / "daily_weights.parquet").unlink()
+    handle = BacktestResultHandle.open(result_dir)
+
+    # Tabs that do not need the missing artifact still load
+    assert handle.load_tab("ic")["daily_ic"] is not None
+    with pytest.raises(ValueError, match="Missing backtest artifact"):
+        handle.to_result()
+
+
+@pytest.mark.unit()
+def test_open_result_reuses_cached_handle(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    cache = ResultHandleCache()
+    storage = _storage_for(_job_row(result_dir), tmp_path, cache)
+
+    first = storage.get_result("job_lazy")
+    second = storage.get_result("job_lazy")
+
+    assert second is first
+    assert len(cache) == 1
+
+
+@pytest.mark.unit()
+def test_open_result_reloads_when_summary_changes(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    storage = _storage_for(_job_row(result_dir), tmp_path, ResultHandleCache())
+    first = storage.open_result("job_lazy")
+
+    summary = json.loads((result_dir / "summary.json").read_text())
+    summary["snapshot_id"] = "snap-rerun-0001"
+    (result_dir / "summary.json").write_text(json.dumps(summary))
+    second = storage.open_result("job_lazy")
+
+    assert second is not first
+    assert second.summary["snapshot_id"] == "snap-rerun-0001"
+
+
+@pytest.mark.unit()
+def test_result_handle_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultHandleCache(maxsize=2)
+    handles = {}
+    for job_id in ("a", "b", "c"):
+        result_dir = tmp_path / job_id
+        _write_parquet_result(result_dir)
+        handles[job_id] = BacktestResultHandle.open(result_dir)
+
+    cache.put("a", handles["a"])
+    cache.put("b", handles["b"])
+    assert cache.get("a", tmp_path / "a") is handles["a"]  # refresh "a"
+    cache.put("c", handles["c"])
+
+    assert cache.get("b", tmp_path / "b") is None
+    assert cache.get("a", tmp_path / "a") is handles["a"]
+    assert cache.get("a", tmp_path / "other") is None  # result_path changed
+
+
+@pytest.mark.unit()
+def test_result_handle_cache_bounded_by_decoded_bytes(tmp_path):
+    handles = {}
+    for job_id in ("a", "b"):
+        result_dir = tmp_path / job_id
+        _write_parquet_result(result_dir)
+        handles[job_id] = BacktestResultHandle.open(result_dir)
+    handles["a"].load_tab("signals")
+    handles["b"].load_tab("signals")
+    one_handle = handles["a"].decoded_bytes
+    assert one_handle > 0
+    cache = ResultHandleCache(maxsize=8, max_bytes=one_handle)
+
+    cache.put("a", handles["a"])
+    cache.put("b", handles["b"])
+
+    # Only the most recent handle fits; a served hit is not evicted by itself
+    assert cache.get("a", tmp_path / "a") is None
+    assert cache.get("b", tmp_path / "b") is handles["b"]
+    assert len(cache) == 1
+
+    # A handle that grows past the budget on its own is served once, then dropped
+    handles["b"].load_tab("holdings")
+    assert cache.get("b", tmp_path / "b") is handles["b"]
+    assert len(cache) == 0
+
+
+@pytest.mark.unit()
+def test_handle_overview_decodes_no_artifacts(tmp_path):
+    result_dir = tmp_path / "job_lazy"
+    _write_parquet_result(result_dir)
+    _write_returns(result_dir)
+    row = _job_row(result_dir) | {"average_turnover": 0.3}
+    storage = _storage_for(row, tmp_path, ResultHandleCache())
+    handle = storage.open_result("job_lazy")
+    full = handle.to_result()
+
+    fresh = BacktestResultHandle.open(result_dir, job_row=row)
+    overview = fresh.overview()
+
+    assert fresh.loaded_artifacts == ()
+    assert overview.backtest_id == "job_lazy"
+    assert overview.alpha_name == full.alpha_name
+    assert overview.n_days == full.n_days
+    assert overview.n_symbols_avg == pytest.approx(full.n_symbols_avg)
+    assert overview.mean_ic == pytest.approx(full.mean_ic)
+    assert overview.coverage == 1.0
+    assert overview.average_turnover == 0.3
+    assert overview.has_net_returns is True
+
+
+@pytest.mark.unit()
+def test_cleanup_old_results_evicts_cached_handles(tmp_path):
+    result_dir = tmp_path / "job_old"
+    _write_parquet_result(result_dir)
+    cache = ResultHandleCache()
+    cache.put("job_old", BacktestResultHandle.open(result_dir))
+    cursor = DummyCursor(rows=[{"job_id": "job_old", "result_path": str(result_dir)}])
+    storage = BacktestResultStorage(
+        DummyPool(DummyConnection(cursor)), base_dir=tmp_path, handle_cache=cache
+    )
+
+    storage.cleanup_old_results(retention_days=0)
+
+    assert len(cache) == 0
@@ -0,0 +1,136 @@
+"""Tests for the warm (snapshot-preloading) backtest worker mode."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+import pytest
+
+from libs.data.data_providers.snapshot_memory_store import SnapshotMemoryStore
+from libs.data.data_quality.manifest import ManifestManager
+from libs.trading.backtest.warm_worker import (
+    DEFAULT_PRELOAD_DATASETS,
+    PreloadingWorker,
+    SnapshotPreloader,
+    parse_preload_datasets,
+)
+
+
+def _write_manifest(manifest_dir: Path, paths: list[Path], version: int, checksum: str) -> None:
+    payload = {
+        "dataset": "alpaca_sip_daily",
+        "sync_timestamp": datetime.now(UTC).isoformat(),
+        "start_date": "2023-01-03",
+        "end_date": "2024-01-02",
+        "row_count": len(paths),
+        "checksum": checksum,
+        "checksum_algorithm": "sha256",
+        "schema_version": "v1.0.0",
+        "wrds_query_hash": "warm-worker-test",
+        "file_paths": [str(p) for p in paths],
+        "validation_status": "passed",
+        "manifest_version": version,
+    }
+    (manifest_dir / "alpaca_sip_daily.json").write_text(json.dumps(payload))
+
+
+@pytest.fixture()
+def sip_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[tuple[Path, ManifestManager, list[Path]]]:
+    data_root = tmp_path / "data"
+    sip_dir = data_root / "alpaca" / "sip" / "daily"
+    sip_dir.mkdir(parents=True)
+    manifest_dir = data_root / "manifests"
+    manifest_dir.mkdir()
+    (data_root / "locks").mkdir()
+    monkeypatch.delenv("ALPACA_SIP_DATA_DIR", raising=False)
+    monkeypatch.delenv("ALPACA_SIP_STORAGE_PATH", raising=False)
+
+    paths = []
+    for year in (2023, 2024):
+        path = sip_dir / f"{year}.parquet"
+        pl.DataFrame({"date": [date(year, 1, 3)], "symbol": ["AAPL"]}).write_parquet(path)
+        paths.append(path)
+    _write_manifest(manifest_dir, paths, version=1, checksum="abc")
+
+    manager = ManifestManager(
+        storage_path=manifest_dir, lock_dir=data_root / "locks", data_root=data_root
+    )
+    with patch("libs.trading.backtest.warm_worker.ManifestManager", return_value=manager):
+        yield data_root, manager, paths
+
+
+class TestParsePreloadDatasets:
+    @pytest.mark.parametrize("value", [None, "", "0", "false", "off"])
+    def test_disabled_values(self, value: str | None) -> None:
+        assert parse_preload_datasets(value) == ()
+
+    @pytest.mark.parametrize("value", ["1", "true", "ALL"])
+    def test_enabled_values_select_all_datasets(self, value: str) -> None:
+        assert parse_preload_datasets(value) == DEFAULT_PRELOAD_DATASETS
+
+    def test_explicit_list_deduplicated(self) -> None:
+        assert parse_preload_datasets(" alpaca_sip_daily, alpaca_sip_daily ") == (
+            "alpaca_sip_daily",
+        )
+
+    def test_unknown_dataset_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported preload datasets"):
+            parse_preload_datasets("crsp_daily,taq_ticks")
+
+
+class TestSnapshotPreloader:
+    def test_refresh_reloads_only_on_manifest_change(
+        self, sip_snapshot: tuple[Path, ManifestManager, list[Path]], tmp_path: Path
+    ) -> None:
+        data_root, manager, paths = sip_snapshot
+        store = SnapshotMemoryStore(root=tmp_path / "shm")
+        preloader = SnapshotPreloader(data_root, ["alpaca_sip_daily"], store)
+
+        assert preloader.refresh() == ["alpaca_sip_daily"]
+        assert preloader.refresh() == []
+        assert store.datasets == {"alpaca_sip_daily": (1, "abc")}
+
+        _write_manifest(manager.storage_path, paths[:1], version=2, checksum="def")
+        assert preloader.refresh() == ["alpaca_sip_daily"]
+        assert store.datasets == {"alpaca_sip_daily": (2, "def")}
+        assert len(list(store.root.glob("*.arrow"))) == 1
+        store.close()
+
+    def test_missing_manifest_or_load_failure_evicts(
+        self, sip_snapshot: tuple[Path, ManifestManager, list[Path]], tmp_path: Path
+    ) -> None:
+        data_root, manager, paths = sip_snapshot
+        store = SnapshotMemoryStore(root=tmp_path / "shm")
+        preloader = SnapshotPreloader(data_root, ["alpaca_sip_daily", "crsp_daily"], store)
+        preloader.refresh()
+        assert set(store.datasets) == {"alpaca_sip_daily"}
+
+        paths[0].unlink()
+        _write_manifest(manager.storage_path, paths, version=2, checksum="def")
+        assert preloader.refresh() == []
+        assert store.datasets == {}
+        store.close()
+
+
+class TestPreloadingWorker:
+    def test_execute_job_refreshes_before_fork(self) -> None:
+        preloader = MagicMock()
+        calls: list[str] = []
+        preloader.refresh.side_effect = lambda: calls.append("refresh")
+
+        with patch(
+            "libs.trading.backtest.warm_worker.Worker.execute_job",
+            side_effect=lambda job, queue: calls.append("fork"),
+        ):
+            worker = PreloadingWorker.__new__(PreloadingWorker)
+            worker.preloader = preloader
+            worker.execute_job(MagicMock(), MagicMock())
+
+        assert calls == ["refresh", "fork"]
@@ -421,6 +421,8 @@ def test_run_backtest_handles_cancel(monkeypatch, tmp_path):
 
 @pytest.mark.unit()
 def test_save_parquet_artifacts_validates_daily_ic(monkeypatch, tmp_path):
+    # _save_parquet_artifacts writes under cwd-relative data/backtest_results
+    monkeypatch.chdir(tmp_path)
     dtype_map = {
         "date": "Date",
         "permno": "Int64",
@@ -618,6 +620,8 @@ def test_run_backtest_auto_resolution_failure_sets_status(monkeypatch):
 
 @pytest.mark.unit()
 def test_save_parquet_artifacts_success(monkeypatch, tmp_path):
+    # _save_parquet_artifacts writes under cwd-relative data/backtest_results
+    monkeypatch.chdir(tmp_path)
     class DummyDF:
         columns = ["date", "permno", "signal", "weight", "ic", "rank_ic"]
 
@@ -2637,6 +2641,7 @@ class TestArtifactWriting:
     @pytest.mark.unit()
     def test_save_parquet_artifacts_with_daily_returns_and_prices(self, tmp_path, monkeypatch):
         """Test parquet writing for daily_returns/daily_prices with symbol columns."""
+        monkeypatch.chdir(tmp_path)
         import sys
 
         class DummyDF:
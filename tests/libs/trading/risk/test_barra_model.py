@@ -12,6 +12,7 @@ from libs.trading.risk import (
     CANONICAL_FACTOR_ORDER,
     BarraRiskModel,
     BarraRiskModelConfig,
+    CompiledRiskModel,
     InsufficientCoverageError,
     SpecificRiskResult,
 )
@@ -55,6 +56,25 @@ class TestBarraRiskModelInit:
         assert model.factor_names == CANONICAL_FACTOR_ORDER
         assert "factor_loadings" in model.dataset_version_ids
 
+    def test_from_t22_results_publishes_artifact(self, sample_covariance_result, tmp_path):
+        """Building with artifacts_dir publishes the compiled model."""
+        specific_result = SpecificRiskResult(
+            specific_risks=create_mock_specific_risks(),
+            as_of_date=date(2023, 6, 30),
+            dataset_version_ids={"crsp_specific_risk": "test123"},
+        )
+
+        model = BarraRiskModel.from_t22_results(
+            covariance_result=sample_covariance_result,
+            specific_risk_result=specific_result,
+            factor_loadings=create_mock_factor_exposures(),
+            artifacts_dir=tmp_path,
+        )
+
+        latest = CompiledRiskModel.find_latest(tmp_path)
+        assert latest is not None
+        assert CompiledRiskModel.load(latest).artifact_key == model.compile().artifact_key
+
     def test_from_t22_results_with_wide_loadings(self, sample_covariance_result):
         """Creates model from wide format factor loadings."""
         specific_risks = create_mock_specific_risks()
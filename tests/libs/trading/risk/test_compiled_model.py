@@ -0,0 +1,200 @@
+"""
+Tests for CompiledRiskModel (memory-mappable risk model artifact).
+"""
+
+from datetime import date
+
+import numpy as np
+import polars as pl
+import pytest
+
+from libs.trading.risk import (
+    CANONICAL_FACTOR_ORDER,
+    BarraRiskModel,
+    CompiledRiskModel,
+    RiskArtifactError,
+    StressScenario,
+    StressTester,
+    risk_artifacts_dir,
+)
+from tests.libs.trading.risk.conftest import (
+    create_mock_covariance_matrix,
+    create_mock_portfolio,
+    create_mock_specific_risks,
+)
+
+
+@pytest.fixture()
+def risk_model(mock_factor_loadings_wide) -> BarraRiskModel:
+    """Model where loadings and specific risks only partially overlap."""
+    return BarraRiskModel(
+        factor_covariance=create_mock_covariance_matrix(),
+        factor_names=CANONICAL_FACTOR_ORDER.copy(),
+        # Loadings: 10001-10100, specific risk: 10001-10090 plus 20001-20005
+        factor_loadings=mock_factor_loadings_wide,
+        specific_risks=pl.concat(
+            [
+                create_mock_specific_risks(n_stocks=90),
+                create_mock_specific_risks(n_stocks=5).with_columns(
+                    (pl.col("permno") + 10000).alias("permno")
+                ),
+            ]
+        ),
+        as_of_date=date(2023, 6, 30),
+        dataset_version_ids={"crsp": "v1.0.0"},
+    )
+
+
+class TestCompile:
+    """Tests for compiling a model into aligned arrays."""
+
+    def test_union_index_and_masks(self, risk_model):
+        """Rows cover the union of permnos with per-input coverage masks."""
+        compiled = risk_model.compile()
+
+        assert compiled.permnos.size == 105
+        assert np.all(np.diff(compiled.permnos) > 0)
+        assert compiled.factor_loadings.shape == (105, len(CANONICAL_FACTOR_ORDER))
+        assert int(compiled.has_loadings.sum()) == 100
+        assert int(compiled.has_specific.sum()) == 95
+
+        rows = compiled.lookup([10001, 10095, 20001, 99999])
+        assert rows[0] >= 0
+        assert rows[1] == -1  # loadings only
+        assert rows[2] == -1  # specific only
+        assert rows[3] == -1  # unknown
+        assert compiled.lookup([10095], require_specific=False)[0] >= 0
+        assert compiled.lookup([20001], require_loadings=False)[0] >= 0
+
+    def test_loadings_aligned_to_permno(self, risk_model, mock_factor_loadings_wide):
+        """Looked-up rows match the source frame values."""
+        compiled = risk_model.compile()
+        row = compiled.lookup([10042])[0]
+        expected = mock_factor_loadings_wide.filter(pl.col("permno") == 10042).select(
+            CANONICAL_FACTOR_ORDER
+        )
+
+        np.testing.assert_array_equal(compiled.factor_loadings[row], expected.to_numpy()[0])
+
+    def test_compile_is_cached(self, risk_model):
+        """The compiled view is built once per model instance."""
+        assert risk_model.compile() is risk_model.compile()
+
+    def test_duplicate_permnos_raise(self, risk_model):
+        """Duplicate permnos cannot be indexed unambiguously."""
+        with pytest.raises(RiskArtifactError, match="duplicate permnos"):
+            CompiledRiskModel.compile(
+                factor_covariance=risk_model.factor_covariance,
+                factor_names=risk_model.factor_names,
+                factor_loadings=pl.concat([risk_model.factor_loadings] * 2),
+                specific_risks=risk_model.specific_risks,
+                as_of_date=risk_model.as_of_date,
+                model_version=risk_model.model_version,
+                dataset_version_ids={},
+            )
+
+
+class TestPersistence:
+    """Tests for save/load of compiled artifacts."""
+
+    def test_roundtrip_is_memory_mapped_and_read_only(self, risk_model, tmp_path):
+        """Loaded arrays are read-only memmaps with identical contents."""
+        compiled = risk_model.compile()
+        path = compiled.save(tmp_path)
+        loaded = CompiledRiskModel.load(path)
+
+        assert isinstance(loaded.factor_loadings, np.memmap)
+        assert not loaded.factor_loadings.flags.writeable
+        np.testing.assert_array_equal(loaded.factor_loadings, compiled.factor_loadings)
+        np.testing.assert_array_equal(loaded.permnos, compiled.permnos)
+        assert loaded.factor_names == compiled.factor_names
+        assert loaded.as_of_date == compiled.as_of_date
+        assert loaded.artifact_key == compiled.artifact_key
+
+    def test_save_is_idempotent(self, risk_model, tmp_path):
+        """Saving the same model version twice reuses the existing artifact."""
+        compiled = risk_model.compile()
+        first = compiled.save(tmp_path)
+        second = compiled.save(tmp_path)
+
+        assert first == second
+        assert [p.name for p in tmp_path.iterdir()] == [first.name]
+
+    def test_find_latest(self, risk_model, tmp_path):
+        """find_latest picks the most recent as_of_date."""
+        assert CompiledRiskModel.find_latest(tmp_path) is None
+
+        older = risk_model.compile().save(tmp_path)
+        newer_model = BarraRiskModel(
+            factor_covariance=risk_model.factor_covariance,
+            factor_names=risk_model.factor_names,
+            factor_loadings=risk_model.factor_loadings,
+            specific_risks=risk_model.specific_risks,
+            as_of_date=date(2023, 7, 31),
+            dataset_version_ids={"crsp": "v1.0.1"},
+        )
+        newer = newer_model.compile().save(tmp_path)
+
+        assert older != newer
+        assert CompiledRiskModel.find_latest(tmp_path) == newer
+
+    def test_publish_defaults_to_data_root(self, risk_model, tmp_path, monkeypatch):
+        """publish() saves under DATA_ROOT/artifacts/risk, where loaders look."""
+        monkeypatch.setenv("DATA_ROOT", str(tmp_path))
+
+        path = risk_model.publish()
+
+        assert risk_artifacts_dir() == (tmp_path / "artifacts" / "risk").resolve()
+        assert path.parent == risk_artifacts_dir()
+        assert CompiledRiskModel.find_latest(risk_artifacts_dir(tmp_path)) == path
+        assert not list(risk_artifacts_dir().glob(".tmp_*"))
+
+    def test_load_missing_raises(self, tmp_path):
+        """Missing artifacts raise RiskArtifactError."""
+        with pytest.raises(RiskArtifactError, match="Cannot load"):
+            CompiledRiskModel.load(tmp_path / "risk_missing")
+
+
+class TestFromCompiled:
+    """Risk queries on a memory-mapped model match the in-memory model."""
+
+    def test_portfolio_risk_matches(self, risk_model, tmp_path):
+        portfolio = create_mock_portfolio(n_stocks=80)
+        loaded = BarraRiskModel.from_compiled(
+            CompiledRiskModel.load(risk_model.compile().save(tmp_path))
+        )
+
+        expected = risk_model.compute_portfolio_risk(portfolio)
+        actual = loaded.compute_portfolio_risk(portfolio)
+
+        assert loaded.validate() == []
+        assert actual.total_risk == pytest.approx(expected.total_risk, rel=1e-12)
+        assert actual.factor_risk == pytest.approx(expected.factor_risk, rel=1e-12)
+        assert actual.specific_risk == pytest.approx(expected.specific_risk, rel=1e-12)
+        assert actual.coverage_ratio == pytest.approx(expected.coverage_ratio)
+
+    def test_stress_test_matches(self, risk_model, tmp_path):
+        portfolio = create_mock_portfolio(n_stocks=100)
+        scenario = StressScenario(
+            name="TEST",
+            scenario_type="hypothetical",
+            description="test",
+            factor_shocks={"momentum_12_1": -0.1, "log_market_cap": 0.05},
+        )
+        loaded = BarraRiskModel.from_compiled(
+            CompiledRiskModel.load(risk_model.compile().save(tmp_path))
+        )
+
+        expected = StressTester(risk_model).run_stress_test(
+            portfolio, scenario, include_specific_risk=True
+        )
+        actual = StressTester(loaded).run_stress_test(
+            portfolio, scenario, include_specific_risk=True
+        )
+
+        assert actual.total_pnl == pytest.approx(expected.total_pnl, rel=1e-12)
+        assert actual.specific_risk_estimate == pytest.approx(
+            expected.specific_risk_estimate, rel=1e-12
+        )
+        assert actual.position_impacts is not None
+        assert actual.position_impacts.height == 100
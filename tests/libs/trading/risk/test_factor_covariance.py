@@ -435,6 +435,41 @@ class TestPITCorrectness:
         assert "compustat" in sample_covariance_result.dataset_version_ids
 
 
+class TestEstimateFactorReturnsExposurePanel:
+    """Tests for estimate_factor_returns() reading from an exposure panel."""
+
+    def test_panel_backed_returns_match_direct_computation(self, mock_factor_builder, tmp_path):
+        """Panel-backed estimation computes each lagged date once, with the same result."""
+        from unittest.mock import patch
+
+        from libs.models.factors import ExposurePanelStore, FactorBuilder
+
+        panel_builder = FactorBuilder(
+            crsp_provider=mock_factor_builder.crsp,
+            compustat_provider=mock_factor_builder.compustat,
+            manifest_manager=mock_factor_builder.manifest,
+            exposure_store=ExposurePanelStore(tmp_path),
+        )
+        start, end = date(2023, 6, 26), date(2023, 6, 30)
+
+        direct = FactorCovarianceEstimator(mock_factor_builder).estimate_factor_returns(start, end)
+        with patch.object(
+            panel_builder, "compute_all_factors", side_effect=AssertionError("per-day read")
+        ):
+            panel = FactorCovarianceEstimator(panel_builder).estimate_factor_returns(start, end)
+
+        assert panel[0].equals(direct[0])
+        assert panel[1] == direct[1]
+        assert panel[2] == direct[2]
+        store = panel_builder.exposure_store
+        assert store.list_dates(store.list_panels()[0]) == [
+            date(2023, 6, 26),
+            date(2023, 6, 27),
+            date(2023, 6, 28),
+            date(2023, 6, 29),
+        ]
+
+
 class TestEstimateFactorReturnsErrorHandling:
     """Tests for error handling in estimate_factor_returns()."""
 
@@ -23,12 +23,15 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from libs.web_console_data.strategy_scoped_queries import (
+    EXPORT_CURSOR_ITERSIZE,
     STRATEGY_CACHE_KEY_ENV,
+    TRADE_COLUMNS,
     StrategyScopedDataAccess,
     _build_cache_client,
     _date_to_utc_datetime,
     _get_cache_encryption_key,
     get_scoped_data_access,
+    next_page_cursor,
 )
 
 # ============================================================================
@@ -1087,6 +1090,103 @@ class TestGetTrades:
         assert "side" in query
 
 
+class TestKeysetPagination:
+    """Tests for cursor-based (seek) pagination of trades, orders and P&L."""
+
+    @staticmethod
+    def _access(mock_user: dict[str, Any], rows: list[dict[str, Any]]) -> StrategyScopedDataAccess:
+        with (
+            patch(
+                "libs.web_console_data.strategy_scoped_queries.get_authorized_strategies",
+                return_value=["strategy-alpha"],
+            ),
+            patch(
+                "libs.web_console_data.strategy_scoped_queries._get_cache_encryption_key",
+                return_value=None,
+            ),
+        ):
+            access = StrategyScopedDataAccess(AsyncMock(), None, mock_user)
+        access._execute_fetchall = AsyncMock(return_value=rows)  # type: ignore[method-assign]
+        return access
+
+    @pytest.fixture()
+    def mock_acquire(self) -> Any:
+        with patch("libs.web_console_data.strategy_scoped_queries.acquire_connection") as acquire:
+            acquire.return_value = AsyncMock()
+            acquire.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+            acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+            yield acquire
+
+    def test_next_page_cursor_none_on_short_page(self) -> None:
+        rows = [{"executed_at": datetime(2025, 1, 15, tzinfo=UTC), "trade_id": "t1"}]
+        assert next_page_cursor("trades", rows, limit=2) is None
+        assert next_page_cursor("trades", [], limit=1) is None
+        assert next_page_cursor("trades", rows, limit=1) is not None
+
+    @pytest.mark.asyncio()
+    async def test_get_trades_seeks_after_cursor(
+        self, mock_acquire: Any, mock_user: dict[str, Any]
+    ) -> None:
+        last_seen = datetime(2025, 1, 15, 10, 0, tzinfo=UTC)
+        cursor = next_page_cursor(
+            "trades", [{"executed_at": last_seen, "trade_id": "t-9"}], limit=1
+        )
+        access = self._access(mock_user, [])
+
+        await access.get_trades(limit=50, cursor=cursor, symbol="AAPL")
+
+        _, query, params = access._execute_fetchall.call_args[0]
+        assert f"SELECT {', '.join(TRADE_COLUMNS)} FROM trades" in query
+        assert "(executed_at, trade_id) < (%s, %s)" in query
+        assert "ORDER BY executed_at DESC, trade_id DESC" in query
+        assert params[-4:] == (last_seen, "t-9", 50, 0)
+
+    @pytest.mark.asyncio()
+    async def test_get_pnl_summary_and_orders_seek_on_their_keys(
+        self, mock_acquire: Any, mock_user: dict[str, Any]
+    ) -> None:
+        access = self._access(mock_user, [])
+        pnl_cursor = next_page_cursor(
+            "pnl", [{"trade_date": date(2025, 1, 14), "strategy_id": "alpha"}], limit=1
+        )
+        await access.get_pnl_summary(
+            date(2025, 1, 1), date(2025, 1, 31), limit=10, cursor=pnl_cursor
+        )
+        _, query, params = access._execute_fetchall.call_args[0]
+        assert "SELECT trade_date, strategy_id, daily_pnl FROM pnl_daily" in query
+        assert "(trade_date, strategy_id) < (%s, %s)" in query
+        assert params[-4:] == (date(2025, 1, 14), "alpha", 10, 0)
+
+        orders_cursor = next_page_cursor(
+            "orders",
+            [{"created_at": datetime(2025, 1, 2, tzinfo=UTC), "client_order_id": "c1"}],
+            limit=1,
+        )
+        await access.get_orders(limit=10, cursor=orders_cursor)
+        _, query, _ = access._execute_fetchall.call_args[0]
+        assert "(created_at, client_order_id) < (%s, %s)" in query
+        assert "SELECT *" not in query
+
+    @pytest.mark.asyncio()
+    async def test_invalid_cursor_rejected(
+        self, mock_acquire: Any, mock_user: dict[str, Any]
+    ) -> None:
+        access = self._access(mock_user, [])
+        orders_cursor = next_page_cursor(
+            "orders",
+            [{"created_at": datetime(2025, 1, 2, tzinfo=UTC), "client_order_id": "c1"}],
+            limit=1,
+        )
+
+        with pytest.raises(ValueError, match="Invalid trades pagination cursor"):
+            await access.get_trades(cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid trades pagination cursor"):
+            await access.get_trades(cursor=orders_cursor)
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            await access.get_orders(offset=100, cursor=orders_cursor)
+        access._execute_fetchall.assert_not_called()
+
+
 class TestGetTradeStats:
     """Tests for get_trade_stats() query method."""
 
@@ -1215,16 +1315,18 @@ class TestStreamTradesForExport:
         mock_get_strategies.return_value = sample_strategies
         mock_get_key.return_value = None
 
-        # Mock cursor as async iterable
+        # Mock named server-side cursor as async iterable
         async def mock_cursor_iter():
             yield {"symbol": "AAPL", "realized_pnl": "100.00"}
             yield {"symbol": "MSFT", "realized_pnl": "200.00"}
 
         mock_cursor = AsyncMock()
         mock_cursor.__aiter__ = lambda self: mock_cursor_iter()
+        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
+        mock_cursor.__aexit__ = AsyncMock(return_value=None)
 
         mock_conn = AsyncMock()
-        mock_conn.execute = AsyncMock(return_value=mock_cursor)
+        mock_conn.cursor = Mock(return_value=mock_cursor)
         mock_conn.transaction = Mock()
         mock_conn.transaction.return_value = AsyncMock()
         mock_conn.transaction.return_value.__aenter__ = AsyncMock()
@@ -1244,6 +1346,12 @@ class TestStreamTradesForExport:
         assert len(trades) == 2
         assert trades[0]["symbol"] == "AAPL"
         assert trades[1]["symbol"] == "MSFT"
+        # Server-side cursor: named, batched, projected columns only
+        assert mock_conn.cursor.call_args.kwargs["name"] == "trades_export"
+        assert mock_cursor.itersize == EXPORT_CURSOR_ITERSIZE
+        query = mock_cursor.execute.call_args[0][0]
+        assert "SELECT *" not in query
+        assert "ORDER BY executed_at DESC, trade_id DESC" in query
 
 
 class TestGetPortfolioReturns:
@@ -338,6 +338,105 @@ class TestGetBacktestResult:
             await service.get_backtest_result("job-123")
 
 
+# ------------------------------------------------------------------ Result Handle Tests
+
+
+@pytest.mark.unit()
+@pytest.mark.asyncio()
+class TestResultHandleAccess:
+    """Tests for get_result_tab and get_chart_series."""
+
+    async def test_get_result_overview_uses_handle(
+        self,
+        service: BacktestAnalyticsService,
+        mock_data_access: MagicMock,
+        mock_storage: MagicMock,
+    ):
+        """Should verify ownership and return the handle's overview."""
+        handle = mock_storage.open_result.return_value
+
+        overview = await service.get_result_overview("job-123")
+
+        mock_data_access.verify_job_ownership.assert_called_once_with("job-123")
+        handle.overview.assert_called_once_with()
+        handle.load_tab.assert_not_called()
+        assert overview is handle.overview.return_value
+
+    async def test_get_result_tab_loads_tab_artifacts(
+        self,
+        service: BacktestAnalyticsService,
+        mock_data_access: MagicMock,
+        mock_storage: MagicMock,
+    ):
+        """Should open a handle and load only the requested tab."""
+        handle = mock_storage.open_result.return_value
+        handle.load_tab.return_value = {"daily_ic": pl.DataFrame({"ic": [0.1]})}
+
+        frames = await service.get_result_tab("job-123", "ic")
+
+        mock_data_access.verify_job_ownership.assert_called_once_with("job-123")
+        handle.load_tab.assert_called_once_with("ic")
+        assert list(frames) == ["daily_ic"]
+
+    @pytest.mark.parametrize(
+        ("chart", "method", "args"),
+        [
+            ("equity", "equity_curve", (640, "gross")),
+            ("drawdown", "drawdown_curve", (640, "gross")),
+            ("ic", "ic_series", (640,)),
+        ],
+    )
+    async def test_get_chart_series_dispatches(
+        self,
+        service: BacktestAnalyticsService,
+        mock_storage: MagicMock,
+        chart: str,
+        method: str,
+        args: tuple[object, ...],
+    ):
+        """Should call the matching handle method with width and basis."""
+        handle = mock_storage.open_result.return_value
+        expected = pl.DataFrame({"date": [date(2024, 1, 2)], "value": [0.1]})
+        getattr(handle, method).return_value = expected
+
+        result = await service.get_chart_series("job-123", chart, 640, basis="gross")
+
+        getattr(handle, method).assert_called_once_with(*args)
+        assert result is expected
+
+    async def test_get_chart_series_unavailable_returns_none(
+        self,
+        service: BacktestAnalyticsService,
+        mock_storage: MagicMock,
+    ):
+        """Storage errors should map to None like other series accessors."""
+        mock_storage.open_result.side_effect = ResultPathMissing("missing")
+
+        assert await service.get_chart_series("job-123", "equity", 640) is None
+
+    async def test_get_chart_series_verifies_ownership_first(
+        self,
+        service: BacktestAnalyticsService,
+        mock_data_access: MagicMock,
+        mock_storage: MagicMock,
+    ):
+        """Ownership failure should not touch storage."""
+        mock_data_access.verify_job_ownership.side_effect = PermissionError("Forbidden")
+
+        with pytest.raises(PermissionError):
+            await service.get_chart_series("job-123", "ic", 640)
+
+        mock_storage.open_result.assert_not_called()
+
+    async def test_get_chart_series_unknown_chart_raises(
+        self,
+        service: BacktestAnalyticsService,
+    ):
+        """Unknown chart names should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown chart"):
+            await service.get_chart_series("job-123", "turnover", 640)  # type: ignore[arg-type]
+
+
 # ------------------------------------------------------------------ run_quantile_analysis Tests
 
 
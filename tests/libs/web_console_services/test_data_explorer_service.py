@@ -158,12 +158,14 @@ def service(
 def no_sql_explorer_sandbox_probe() -> Generator[None, None, None]:
     data_explorer_module._SHARED_TABLE_AVAILABILITY_CACHE = None
     data_explorer_module._SHARED_ALPACA_SUMMARY_CACHE = None
+    data_explorer_module._SHARED_SPLIT_FACTOR_CACHE = None
     with patch(
         "libs.web_console_services.data_explorer_service.ensure_sql_explorer_execution_allowed"
     ):
         yield
     data_explorer_module._SHARED_TABLE_AVAILABILITY_CACHE = None
     data_explorer_module._SHARED_ALPACA_SUMMARY_CACHE = None
+    data_explorer_module._SHARED_SPLIT_FACTOR_CACHE = None
 
 
 @pytest.mark.asyncio()
@@ -2141,48 +2143,53 @@ async def test_get_dataset_preview_applies_future_split_to_older_price_chunk(
 
 
 @pytest.mark.asyncio()
-async def test_load_corporate_actions_for_prices_uses_bound_parameters(
+async def test_load_split_factor_table_binds_manifest_end_and_caches_per_snapshot(
     rate_limiter: AsyncMock,
 ) -> None:
     service = DataExplorerService(rate_limiter=rate_limiter)
-    captured: dict[str, Any] = {}
+    calls: list[dict[str, Any]] = []
 
     async def capture_execute_sql_frame(**kwargs: Any) -> pl.DataFrame:
-        captured.update(kwargs)
-        return pl.DataFrame()
+        calls.append(kwargs)
+        return pl.DataFrame(
+            {
+                "symbol": ["AAPL"],
+                "ca_type": ["stock_split"],
+                "ex_date": [date(2020, 8, 31)],
+                "process_date": [date(2020, 8, 30)],
+                "old_rate": [1.0],
+                "new_rate": [4.0],
+            }
+        )
 
     service._execute_sql_frame = capture_execute_sql_frame  # type: ignore[method-assign]
-    prices = pl.DataFrame(
-        {
-            "symbol": ["BRK'B", "AAPL", "AAPL"],
-            "date": [date(2020, 1, 2), date(2020, 1, 3), date(2020, 1, 4)],
-        }
+    corp_path_spec = sql_module.ResolvedTablePathSpec(
+        path_spec=("actions.parquet",),
+        manifest_backed=True,
+        manifest_end_date=date(2020, 8, 31),
     )
 
-    await service._load_corporate_actions_for_prices(
+    first = await service._load_split_factor_table(
         dataset="alpaca_sip",
-        prices=prices,
-        table_paths={
-            "alpaca_sip_corp_actions": sql_module.ResolvedTablePathSpec(
-                path_spec=("actions.parquet",),
-                manifest_backed=True,
-                manifest_end_date=date(2020, 8, 31),
-            )
-        },
+        table_paths={"alpaca_sip_corp_actions": corp_path_spec},
+    )
+    second = await service._load_split_factor_table(
+        dataset="alpaca_sip",
+        table_paths={"alpaca_sip_corp_actions": corp_path_spec},
     )
 
-    assert captured["parameters"] == [
-        "AAPL",
-        "BRK'B",
-        date(2020, 1, 2),
-        date(2020, 1, 2),
-        date(2020, 8, 31),
-        date(2020, 8, 31),
-    ]
-    assert "BRK'B" not in captured["sql"]
-    assert "process_date <= CAST(? AS DATE)" in captured["sql"]
-    assert "coalesce" not in captured["sql"].lower()
-    assert captured["sql"].count("?") == 6
+    assert second is first
+    assert first.factors["cumulative_factor"].to_list() == [4.0]
+    assert len(calls) == 1
+    assert calls[0]["parameters"] == [date(2020, 8, 31), date(2020, 8, 31)]
+    assert "process_date <= CAST(? AS DATE)" in calls[0]["sql"]
+    assert calls[0]["sql"].count("?") == 2
+
+    await service._load_split_factor_table(
+        dataset="alpaca_sip",
+        table_paths={"alpaca_sip_corp_actions": "corp_actions/snapshots/*/*.parquet"},
+    )
+    assert len(calls) == 2
 
 
 @pytest.mark.asyncio()
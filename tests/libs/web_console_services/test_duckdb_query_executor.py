@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import polars as pl
+
+from libs.web_console_services.duckdb_query_executor import (
+    DuckDBConnectionPool,
+    QueryResultCache,
+    query_cache_key,
+    view_set_version,
+)
+
+
+class _Conn:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pool_reuses_connection_per_view_version() -> None:
+    pool: DuckDBConnectionPool[_Conn] = DuckDBConnectionPool(max_idle=2)
+    opened: list[_Conn] = []
+
+    def factory() -> _Conn:
+        opened.append(_Conn(f"c{len(opened)}"))
+        return opened[-1]
+
+    first = pool.checkout("v1", factory)
+    pool.checkin("v1", first)
+
+    assert pool.checkout("v1", factory) is first
+    assert pool.checkout("v2", factory) is not first
+    assert len(opened) == 2
+
+
+def test_pool_closes_unusable_and_evicts_least_recent_view_set() -> None:
+    pool: DuckDBConnectionPool[_Conn] = DuckDBConnectionPool(max_idle=2)
+    old, newer, newest, broken = _Conn("old"), _Conn("newer"), _Conn("newest"), _Conn("broken")
+
+    pool.checkin("v1", old)
+    pool.checkin("v2", newer)
+    pool.checkin("v3", newest)
+    pool.checkin("v3", broken, reusable=False)
+
+    assert old.closed is True
+    assert broken.closed is True
+    assert newer.closed is False
+    assert newest.closed is False
+    assert pool.idle_count == 2
+
+    pool.clear()
+    assert newer.closed is True
+    assert newest.closed is True
+    assert pool.idle_count == 0
+
+
+def test_result_cache_round_trips_and_expires() -> None:
+    clock = _Clock()
+    cache = QueryResultCache(max_entries=4, max_bytes=1 << 20, ttl_seconds=10, clock=clock)
+    frame = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    cache.put("k", frame)
+    cached = cache.get("k")
+    assert cached is not None
+    assert cached.equals(frame)
+
+    clock.now = 10
+    assert cache.get("k") is None
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_result_cache_evicts_lru_by_count_and_bytes() -> None:
+    small = pl.DataFrame({"a": [1]})
+    cache = QueryResultCache(max_entries=2, max_bytes=1 << 20, ttl_seconds=60)
+    cache.put("a", small)
+    cache.put("b", small)
+    assert cache.get("a") is not None
+    cache.put("c", small)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    big = pl.DataFrame({"a": list(range(1000))})
+    tiny = QueryResultCache(max_entries=8, max_bytes=100, ttl_seconds=60)
+    tiny.put("big", big)
+    assert tiny.get("big") is None
+
+
+def test_query_cache_key_normalizes_sql_but_keeps_literals() -> None:
+    scope = {"crsp_daily"}
+
+    base = query_cache_key(
+        "SELECT * FROM crsp_daily WHERE x = 1", None, scope=scope, view_version="v"
+    )
+    assert base == query_cache_key(
+        "select *\n  from crsp_daily where x = 1", None, scope=scope, view_version="v"
+    )
+    assert base != query_cache_key(
+        "SELECT * FROM crsp_daily WHERE x = 2", None, scope=scope, view_version="v"
+    )
+    assert base != query_cache_key(
+        "SELECT * FROM crsp_daily WHERE x = 1", None, scope=scope, view_version="v2"
+    )
+    assert base != query_cache_key(
+        "SELECT * FROM crsp_daily WHERE x = 1",
+        None,
+        scope={"crsp_daily", "crsp_monthly"},
+        view_version="v",
+    )
+    assert query_cache_key("SELECT ?", [1], scope=scope, view_version="v") != query_cache_key(
+        "SELECT ?", [2], scope=scope, view_version="v"
+    )
+
+
+def test_view_set_version_tracks_manifest_paths_and_glob_directory(tmp_path: Path) -> None:
+    glob_spec = f"{tmp_path}/*.parquet"
+    manifest = ("/data/a.parquet", "/data/b.parquet")
+
+    version = view_set_version("crsp", [("daily", glob_spec), ("monthly", manifest)])
+    assert version == view_set_version("crsp", [("monthly", manifest), ("daily", glob_spec)])
+    assert version != view_set_version(
+        "crsp", [("daily", glob_spec), ("monthly", (*manifest, "/data/c.parquet"))]
+    )
+
+    (tmp_path / "new.parquet").write_bytes(b"")
+    os.utime(tmp_path, ns=(0, 1))
+    assert version != view_set_version("crsp", [("daily", glob_spec), ("monthly", manifest)])
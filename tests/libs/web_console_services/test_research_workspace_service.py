@@ -23,6 +23,12 @@ from libs.web_console_services.research_workspace_service import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the cwd-relative ``data/models`` registry out of the repository."""
+    monkeypatch.chdir(tmp_path)
+
+
 def test_derive_lifecycle_label_failed_precedence() -> None:
     assert (
         derive_lifecycle_label(
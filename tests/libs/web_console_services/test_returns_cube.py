@@ -0,0 +1,199 @@
+"""Unit tests for libs.web_console_services.returns_cube."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from libs.web_console_data.strategy_scoped_queries import StrategyScopedDataAccess
+from libs.web_console_services.comparison_service import ComparisonService
+from libs.web_console_services.returns_cube import CUBE_RESTATEMENT_DAYS, DailyReturnsCube
+
+START = date(2025, 1, 1)
+
+
+class FakeScopedAccess:
+    """Serves P&L rows from memory, newest first, like get_pnl_summary."""
+
+    def __init__(self, rows: list[dict[str, Any]], authorized: list[str]) -> None:
+        self.rows = rows
+        self.authorized_strategies = authorized
+        self.calls: list[tuple[date, date, str | None]] = []
+
+    async def get_pnl_summary(self, date_from, date_to, limit=100, offset=0, cursor=None):
+        self.calls.append((date_from, date_to, cursor))
+        selected = [
+            r
+            for r in self.rows
+            if date_from <= r["trade_date"] <= date_to
+            and r["strategy_id"] in self.authorized_strategies
+        ]
+        selected.sort(key=lambda r: (r["trade_date"], r["strategy_id"]), reverse=True)
+        skip = int(cursor) if cursor else 0
+        return selected[skip : skip + limit]
+
+
+def _rows(strategies: list[str], days: int, seed: int = 3) -> list[dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(days):
+        for sid in strategies:
+            # Leave gaps so pivots must fill missing strategy-days with zero
+            if (i + len(sid)) % 7 == 0:
+                continue
+            pnl = float(rng.normal(100, 1000))
+            rows.append(
+                {"strategy_id": sid, "trade_date": START + timedelta(days=i), "daily_pnl": pnl}
+            )
+    return rows
+
+
+def _assert_matches_legacy(cached: dict[str, Any], legacy: dict[str, Any]) -> None:
+    pd.testing.assert_frame_equal(cached["pnl_frame"], legacy["pnl_frame"], check_freq=False)
+    assert cached["metrics"].keys() == legacy["metrics"].keys()
+    for sid, values in legacy["metrics"].items():
+        assert cached["metrics"][sid] == pytest.approx(values, rel=1e-9, abs=1e-9)
+    pd.testing.assert_frame_equal(
+        cached["correlation_matrix"], legacy["correlation_matrix"], rtol=1e-9
+    )
+    assert cached["equity_curves"] == legacy["equity_curves"]
+    assert cached["combined_portfolio"]["total_return"] == pytest.approx(
+        legacy["combined_portfolio"]["total_return"]
+    )
+
+
+async def _compare(
+    access: FakeScopedAccess, cube: DailyReturnsCube, strategies: list[str], end: date
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    cached = await ComparisonService(access, cube=cube).get_comparison_data(strategies, START, end)
+    legacy = await ComparisonService(access).get_comparison_data(strategies, START, end)
+    return cached, legacy
+
+
+@pytest.mark.asyncio()
+async def test_cube_matches_legacy_computation() -> None:
+    strategies = ["s1", "s22", "s333"]
+    access = FakeScopedAccess(_rows(strategies, 60), strategies)
+
+    cached, legacy = await _compare(access, DailyReturnsCube(), strategies, START + timedelta(59))
+
+    _assert_matches_legacy(cached, legacy)
+    assert cached["truncation_warning"] is None
+
+
+@pytest.mark.asyncio()
+async def test_warm_cube_serves_repeat_and_sub_range_without_fetching() -> None:
+    strategies = ["s1", "s22"]
+    access = FakeScopedAccess(_rows(strategies, 30), strategies)
+    cube = DailyReturnsCube()
+    service = ComparisonService(access, cube=cube)
+
+    first = await service.get_comparison_data(strategies, START, START + timedelta(29))
+    access.calls.clear()
+    second = await service.get_comparison_data(strategies, START, START + timedelta(29))
+    await service.get_comparison_data(["s1"], START + timedelta(5), START + timedelta(10))
+
+    assert access.calls == []
+    assert second["metrics"] is first["metrics"]
+
+
+@pytest.mark.asyncio()
+async def test_new_pnl_is_folded_in_incrementally() -> None:
+    strategies = ["s1", "s22"]
+    rows = _rows(strategies, 40)
+    end = START + timedelta(39)
+    access = FakeScopedAccess([r for r in rows if r["trade_date"] < end], strategies)
+    cube = DailyReturnsCube(tail_refresh_seconds=0)
+    await ComparisonService(access, cube=cube).get_comparison_data(strategies, START, end)
+    stats = cube.selection(strategies, START, end)
+    n_before = stats.n
+
+    access.rows = rows  # the last day's P&L lands
+    access.calls.clear()
+    cached, legacy = await _compare(access, cube, strategies, end)
+
+    # Only the trailing restatement window was re-fetched, and the stats were extended
+    assert access.calls[0][0] == end - timedelta(days=CUBE_RESTATEMENT_DAYS)
+    assert cube.selection(strategies, START, end) is stats
+    assert stats.n == n_before + 1
+    _assert_matches_legacy(cached, legacy)
+
+
+@pytest.mark.asyncio()
+async def test_restated_pnl_rebuilds_statistics() -> None:
+    strategies = ["s1", "s22"]
+    rows = _rows(strategies, 20)
+    end = START + timedelta(19)
+    access = FakeScopedAccess(rows, strategies)
+    cube = DailyReturnsCube(tail_refresh_seconds=0)
+    await ComparisonService(access, cube=cube).get_comparison_data(strategies, START, end)
+
+    restated = next(r for r in reversed(rows) if r["trade_date"] == end - timedelta(days=1))
+    restated["daily_pnl"] += 5000.0
+    cached, legacy = await _compare(access, cube, strategies, end)
+
+    _assert_matches_legacy(cached, legacy)
+
+
+@pytest.mark.asyncio()
+async def test_expired_coverage_refetches_restatements_outside_the_tail() -> None:
+    strategies = ["s1", "s22"]
+    rows = _rows(strategies, 30)
+    end = START + timedelta(29)
+    access = FakeScopedAccess(rows, strategies)
+    cube = DailyReturnsCube(tail_refresh_seconds=0)
+    await ComparisonService(access, cube=cube).get_comparison_data(strategies, START, end)
+
+    # Backfilled P&L well before the trailing restatement window
+    restated = next(r for r in rows if r["trade_date"] == START + timedelta(days=2))
+    restated["daily_pnl"] += 5000.0
+    stale = cube.selection(strategies, START, end).metrics()
+    access.calls.clear()
+    await cube.refresh(access, strategies, START, end)
+    assert access.calls[0][0] == end - timedelta(days=CUBE_RESTATEMENT_DAYS)
+    assert cube.selection(strategies, START, end).metrics() == stale
+
+    cube.coverage_ttl_seconds = 0
+    access.calls.clear()
+    cached, legacy = await _compare(access, cube, strategies, end)
+
+    assert access.calls[0][0] == START
+    _assert_matches_legacy(cached, legacy)
+
+
+@pytest.mark.asyncio()
+async def test_unauthorized_strategies_are_never_served() -> None:
+    rows = _rows(["s1", "s22", "secret"], 10)
+    cube = DailyReturnsCube()
+    await ComparisonService(
+        FakeScopedAccess(rows, ["s1", "s22", "secret"]), cube=cube
+    ).get_comparison_data(["s1", "secret"], START, START + timedelta(9))
+
+    data = await ComparisonService(
+        FakeScopedAccess(rows, ["s1", "s22"]), cube=cube
+    ).get_comparison_data(["s1", "secret"], START, START + timedelta(9))
+
+    assert set(data["metrics"]) == {"s1"}
+    assert list(data["pnl_frame"].columns) == ["s1"]
+
+
+@pytest.mark.asyncio()
+async def test_refresh_pages_through_all_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    strategies = ["s1", "s22"]
+    access = FakeScopedAccess(_rows(strategies, 10), strategies)
+    monkeypatch.setattr(StrategyScopedDataAccess, "MAX_LIMIT", 4)
+    monkeypatch.setattr(
+        "libs.web_console_services.returns_cube.next_page_cursor",
+        lambda _kind, page, limit: None if len(page) < limit else str(len(access.calls) * limit),
+    )
+    cube = DailyReturnsCube()
+
+    fetched = await cube.refresh(access, strategies, START, START + timedelta(9))
+
+    assert fetched == len(access.rows)
+    # Full pages of 4, then the short (possibly empty) last page
+    assert len(access.calls) == len(access.rows) // 4 + 1
@@ -8,7 +8,7 @@ Tests cover:
 - _compute_total_value() with various position scenarios
 - _build_weights() with normal/zero total values
 - _compute_risk_metrics() success, model unavailable, import errors, computation errors
-- _load_risk_model() (always returns None in MVP)
+- _load_risk_model() (None without artifacts, compiled artifact when published)
 - _run_stress_tests() with model available/unavailable, import errors, computation errors
 - _generate_placeholder_stress_tests() structure validation
 - _get_var_history() with P&L data, empty data, DB errors, permission errors
@@ -410,6 +410,37 @@ class TestLoadRiskModel:
         # In MVP, always returns None
         assert result is None
 
+    @pytest.mark.asyncio()
+    async def test_load_risk_model_from_compiled_artifact(self, tmp_path, monkeypatch):
+        """Published compiled artifact is memory-mapped once and reused across requests."""
+        import numpy as np
+        import polars as pl
+
+        from libs.trading.risk import CANONICAL_FACTOR_ORDER, BarraRiskModel
+        from libs.web_console_services import risk_service
+
+        permnos = [10001, 10002, 10003]
+        model = BarraRiskModel(
+            factor_covariance=np.eye(len(CANONICAL_FACTOR_ORDER)) * 1e-4,
+            factor_names=CANONICAL_FACTOR_ORDER.copy(),
+            factor_loadings=pl.DataFrame(
+                {"permno": permnos, **{f: [0.1, 0.2, 0.3] for f in CANONICAL_FACTOR_ORDER}}
+            ),
+            specific_risks=pl.DataFrame({"permno": permnos, "specific_variance": [1e-4] * 3}),
+            as_of_date=date(2024, 1, 31),
+            dataset_version_ids={"crsp": "v1"},
+        )
+        model.publish(tmp_path / "artifacts" / "risk")
+        monkeypatch.setattr(risk_service, "_risk_model_cache", {})
+
+        service = RiskService(Mock(), data_root=tmp_path)
+        first = await service._load_risk_model()
+        second = await service._load_risk_model()
+
+        assert isinstance(first, BarraRiskModel)
+        assert first is second
+        assert first.as_of_date == date(2024, 1, 31)
+
 
 class TestRunStressTests:
     """Tests for _run_stress_tests() method."""
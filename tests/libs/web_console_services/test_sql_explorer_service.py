@@ -88,6 +88,7 @@ def _env_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(module, "_AUDIT_LOG_RAW_SQL", False)
     monkeypatch.setenv("SQL_EXPLORER_DEV_MODE", "true")
     monkeypatch.setenv("SQL_EXPLORER_SANDBOX_SKIP", "true")
+    module._clear_query_executor_state()
 
 
 @pytest.fixture()
@@ -373,6 +374,69 @@ def test_resolve_table_paths_uses_alpaca_manifest_paths(
     assert paths["alpaca_sip_corp_actions"].manifest_end_date == date(2026, 2, 15)
 
 
+def test_resolve_table_paths_includes_compustat_delta_partitions(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    storage_root = data_root / "wrds" / "compustat_annual"
+    base = storage_root / "2024.parquet"
+    delta = storage_root / "deltas" / "2024-delta-20240617T060000000000-0a1b2c3d.parquet"
+    delta.parent.mkdir(parents=True)
+    base.write_bytes(b"PAR1")
+    delta.write_bytes(b"PAR1")
+    manifest_dir = data_root / "manifests"
+    manifest_dir.mkdir(parents=True)
+    (manifest_dir / "compustat_annual.json").write_text(
+        json.dumps(
+            {
+                "file_paths": [
+                    "data/wrds/compustat_annual/2024.parquet",
+                    str(delta),
+                ],
+                "validation_status": "passed",
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(module, "_PROJECT_ROOT", project_root)
+
+    paths = module._resolve_table_paths()
+
+    assert paths["compustat_annual"] == (str(base), str(delta))
+    # No manifest yet: fall back to the base partition glob
+    assert paths["compustat_quarterly"] == f"{data_root / 'wrds' / 'compustat_quarterly'}/*.parquet"
+
+
+def test_resolve_table_paths_pins_crsp_to_sync_manifest(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    storage_root = data_root / "wrds" / "crsp" / "daily"
+    base = storage_root / "2024-base-20240617T060000000000-0a1b2c3d.parquet"
+    delta = storage_root / "deltas" / "2024-delta-20240618T060000000000-1a2b3c4d.parquet"
+    orphan = storage_root / "2024.parquet"
+    delta.parent.mkdir(parents=True)
+    for path in (base, delta, orphan):
+        path.write_bytes(b"PAR1")
+    manifest_dir = data_root / "manifests"
+    manifest_dir.mkdir(parents=True)
+    (manifest_dir / "crsp_daily.json").write_text(
+        json.dumps({"file_paths": [str(base), str(delta)], "validation_status": "passed"}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(module, "_PROJECT_ROOT", project_root)
+
+    paths = module._resolve_table_paths()
+
+    # Deltas are included and the orphaned pre-compaction base is not
+    assert paths["crsp_daily"] == (str(base), str(delta))
+    assert paths["crsp_monthly"] == f"{data_root / 'wrds' / 'crsp' / 'monthly'}/*.parquet"
+
+
 def test_resolve_table_paths_uses_nested_relative_manifest_paths(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -873,6 +937,59 @@ async def test_execute_query_concurrency_cap(monkeypatch: pytest.MonkeyPatch) ->
     assert concurrency_errors
 
 
+@pytest.mark.asyncio()
+async def test_scoped_query_reuses_pooled_connection_and_caches_result(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    opened: list[_DummyConn] = []
+
+    def open_conn(dataset: str, available_tables: set[str]) -> _DummyConn:
+        del dataset, available_tables
+        opened.append(_DummyConn())
+        return opened[-1]
+
+    monkeypatch.setattr(module, "_create_query_connection", open_conn)
+
+    first = await module.execute_scoped_query_frame_with_timeout(
+        "crsp", "SELECT * FROM crsp_daily WHERE permno = 1", available_tables={"crsp_daily"}
+    )
+    repeat = await module.execute_scoped_query_frame_with_timeout(
+        "crsp", "select *  from crsp_daily where permno = 1", available_tables={"crsp_daily"}
+    )
+    other = await module.execute_scoped_query_frame_with_timeout(
+        "crsp", "SELECT * FROM crsp_daily WHERE permno = 2", available_tables={"crsp_daily"}
+    )
+
+    assert repeat.equals(first)
+    assert other.equals(first)
+    assert len(opened) == 1
+    assert opened[0].closed is False
+    assert len(module._query_result_cache) == 2
+
+
+@pytest.mark.asyncio()
+async def test_cancelled_scoped_query_interrupts_and_discards_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    conn = _DummyConn(sleep_s=0.2)
+    monkeypatch.setattr(module, "_create_query_connection", lambda dataset, available_tables: conn)
+
+    task = asyncio.create_task(
+        module.execute_scoped_query_frame_with_timeout(
+            "crsp", "SELECT * FROM crsp_daily", available_tables={"crsp_daily"}
+        )
+    )
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert conn.interrupt_called is True
+    await asyncio.wait_for(_wait_until(lambda: conn.closed), timeout=1.0)
+    await asyncio.wait_for(_wait_until(lambda: module._active_queries == 0), timeout=1.0)
+    assert len(module._query_result_cache) == 0
+
+
 @pytest.mark.asyncio()
 async def test_execute_query_audit_statuses(
     operator_user: dict[str, str], monkeypatch: pytest.MonkeyPatch
@@ -961,7 +1078,8 @@ async def test_execute_query_audit_statuses(
         original_execute_frame,
     )
 
-    # error
+    # error (drop the pooled connection and cached result from the success case)
+    module._clear_query_executor_state()
     monkeypatch.setattr(
         module,
         "_create_query_connection",